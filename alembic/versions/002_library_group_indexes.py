@@ -0,0 +1,41 @@
+"""Indexes for grouped library views.
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-18
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "002"
+down_revision: Union[str, None] = "001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "idx_library_items_author_book_language",
+        "library_items",
+        ["author", "book_title", "language", "updated_at"],
+    )
+    op.create_index(
+        "idx_library_items_genre_author_book",
+        "library_items",
+        ["genre", "author", "book_title", "updated_at"],
+    )
+    op.create_index(
+        "idx_library_items_language_author_book",
+        "library_items",
+        ["language", "author", "book_title", "updated_at"],
+    )
+    op.create_index("idx_library_items_updated_id", "library_items", ["updated_at", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("idx_library_items_updated_id", table_name="library_items")
+    op.drop_index("idx_library_items_language_author_book", table_name="library_items")
+    op.drop_index("idx_library_items_genre_author_book", table_name="library_items")
+    op.drop_index("idx_library_items_author_book_language", table_name="library_items")
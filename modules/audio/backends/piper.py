@@ -21,10 +21,6 @@ PLATFORM NOTES:
 
 from __future__ import annotations
 
-import io
-import os
-import tempfile
-import wave
 from functools import lru_cache
 from pathlib import Path
 from threading import Lock
@@ -38,6 +34,7 @@ from modules import logging_manager as log_mgr
 from modules.core.storage_config import get_piper_models_path
 
 from .base import BaseTTSBackend, TTSBackendError
+from .piper_pool import PcmAudio, get_piper_pool
 
 logger = log_mgr.logger
 
@@ -267,6 +264,38 @@ def _speed_to_length_scale(speed: int, lang_code: str = "en") -> float:
     return max(0.5, min(2.0, length_scale))
 
 
+def _synthesize_pcm(piper_voice: Any, text: str, length_scale: float) -> PcmAudio:
+    """Run Piper inference and return the raw 16-bit mono PCM samples.
+
+    Raises:
+        TTSBackendError: If synthesis fails or produces no audio.
+    """
+    # Generate audio using piper-tts 1.4+ API
+    try:
+        from piper.config import SynthesisConfig
+
+        syn_config = SynthesisConfig(
+            length_scale=length_scale,
+        )
+
+        # Collect audio chunks from the generator
+        audio_chunks = []
+        for chunk in piper_voice.synthesize(text, syn_config=syn_config):
+            audio_chunks.append(chunk.audio_int16_bytes)
+
+        if not audio_chunks:
+            raise TTSBackendError("Piper synthesis returned no audio")
+
+        return PcmAudio(
+            pcm=b"".join(audio_chunks),
+            sample_rate=int(piper_voice.config.sample_rate),
+        )
+    except TTSBackendError:
+        raise
+    except Exception as exc:
+        raise TTSBackendError(f"Piper synthesis failed: {exc}") from exc
+
+
 class PiperTTSBackend(BaseTTSBackend):
     """Backend using Piper TTS for local neural speech synthesis.
 
@@ -322,55 +351,23 @@ class PiperTTSBackend(BaseTTSBackend):
                 f"Check config/piper_voices.yaml for supported languages."
             )
 
-        # Load voice model
-        try:
-            piper_voice = _get_voice_model(voice_name)
-        except TTSBackendError:
-            raise
-        except Exception as exc:
-            raise TTSBackendError(f"Failed to load Piper voice: {exc}") from exc
-
         # Calculate length scale from speed (with language-specific adjustment)
         length_scale = _speed_to_length_scale(speed, lang_code)
 
-        # Generate audio using piper-tts 1.4+ API
-        try:
-            from piper.config import SynthesisConfig
-
-            syn_config = SynthesisConfig(
-                length_scale=length_scale,
-            )
-
-            # Collect audio chunks from the generator
-            audio_chunks = []
-            for chunk in piper_voice.synthesize(text, syn_config=syn_config):
-                audio_chunks.append(chunk.audio_int16_bytes)
-
-            if not audio_chunks:
-                raise TTSBackendError("Piper synthesis returned no audio")
-
-            # Combine all chunks into a single WAV
-            combined_audio = b"".join(audio_chunks)
-
-            # Get sample rate from voice config
-            sample_rate = piper_voice.config.sample_rate
-
-            # Create WAV file in memory
-            audio_bytes = io.BytesIO()
-            with wave.open(audio_bytes, "wb") as wav_file:
-                wav_file.setnchannels(1)  # Mono
-                wav_file.setsampwidth(2)  # 16-bit
-                wav_file.setframerate(sample_rate)
-                wav_file.writeframes(combined_audio)
-            audio_bytes.seek(0)
-
-            # Convert to AudioSegment
-            audio = AudioSegment.from_wav(audio_bytes)
-
-        except TTSBackendError:
-            raise
-        except Exception as exc:
-            raise TTSBackendError(f"Piper synthesis failed: {exc}") from exc
+        pool = get_piper_pool()
+        if pool is not None:
+            pcm_audio = pool.synthesize(voice_name, text, length_scale)
+        else:
+            # Load voice model
+            try:
+                piper_voice = _get_voice_model(voice_name)
+            except TTSBackendError:
+                raise
+            except Exception as exc:
+                raise TTSBackendError(f"Failed to load Piper voice: {exc}") from exc
+            pcm_audio = _synthesize_pcm(piper_voice, text, length_scale)
+
+        audio = pcm_audio.to_segment()
 
         # Export if output path specified
         if output_path:
@@ -433,6 +430,19 @@ class PiperTTSBackend(BaseTTSBackend):
         return sorted(voices)
 
 
+def warm_voice(voice_name: str) -> None:
+    """Load ``voice_name`` so the next synthesis with it skips the model load.
+
+    With a worker pool the voice is loaded by running a short synthesis,
+    which leaves the chosen worker warm for that voice.
+    """
+    pool = get_piper_pool()
+    if pool is not None:
+        pool.synthesize(voice_name, "Ready.", 1.0)
+        return
+    _get_voice_model(voice_name)
+
+
 def clear_voice_cache() -> None:
     """Clear the cached voice models to free memory."""
     with _voice_cache_lock:
@@ -446,4 +456,5 @@ __all__ = [
     "get_speed_multiplier",
     "get_voice_for_language",
     "load_piper_voice_config",
+    "warm_voice",
 ]
@@ -0,0 +1,402 @@
+"""Warm Piper synthesis worker processes.
+
+ONNX inference releases the GIL, but phonemisation, chunk assembly and the
+WAV/``AudioSegment`` conversion around it do not, so audio worker threads in
+one process contend with each other.  :class:`PiperWorkerPool` runs ``N``
+worker processes, each keeping the voices it has loaded in memory, and
+returns raw 16-bit PCM plus sample metadata over a pipe.
+
+Requests are routed with voice affinity: an idle worker that already holds
+the requested voice is preferred; when all of those are busy the request
+spills over to the idle worker with the fewest loaded voices, which then
+becomes warm for that voice as well.
+"""
+
+from __future__ import annotations
+
+import atexit
+import multiprocessing
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+from pydub import AudioSegment
+
+from modules import logging_manager as log_mgr
+
+from ..config import get_tts_backend_config
+from .base import TTSBackendError
+
+logger = log_mgr.logger
+
+PIPER_WORKERS_ENV = "EBOOK_PIPER_WORKERS"
+PIPER_PRELOAD_VOICES_ENV = "EBOOK_PIPER_PRELOAD_VOICES"
+DEFAULT_AUTO_WORKERS = 4
+# Covers process start-up plus loading every preloaded voice.
+DEFAULT_READY_TIMEOUT_SECONDS = 120.0
+_SHUTDOWN_TIMEOUT_SECONDS = 5.0
+
+
+@dataclass(frozen=True)
+class PcmAudio:
+    """Raw PCM samples returned by a synthesis call."""
+
+    pcm: bytes
+    sample_rate: int
+    sample_width: int = 2
+    channels: int = 1
+
+    def to_segment(self) -> AudioSegment:
+        return AudioSegment(
+            data=self.pcm,
+            sample_width=self.sample_width,
+            frame_rate=self.sample_rate,
+            channels=self.channels,
+        )
+
+
+VoiceLoader = Callable[[str], Any]
+VoiceSynthesizer = Callable[[str, str, float], PcmAudio]
+
+
+def _default_loader(voice_name: str) -> Any:
+    from .piper import _get_voice_model
+
+    return _get_voice_model(voice_name)
+
+
+def _default_synthesizer(voice_name: str, text: str, length_scale: float) -> PcmAudio:
+    from .piper import _get_voice_model, _synthesize_pcm
+
+    return _synthesize_pcm(_get_voice_model(voice_name), text, length_scale)
+
+
+def _worker_main(
+    conn: Any,
+    preload_voices: Sequence[str],
+    loader: VoiceLoader,
+    synthesizer: VoiceSynthesizer,
+) -> None:
+    """Serve ``(voice, text, length_scale)`` requests until the pipe closes."""
+
+    loaded: List[str] = []
+    for voice_name in preload_voices:
+        try:
+            loader(voice_name)
+        except Exception as exc:  # pragma: no cover - depends on installed voices
+            logger.warning("Piper worker could not preload voice %s: %s", voice_name, exc)
+            continue
+        loaded.append(voice_name)
+    conn.send(("ready", loaded))
+
+    while True:
+        try:
+            message = conn.recv()
+        except (EOFError, OSError):
+            break
+        if message is None:
+            break
+        voice_name, text, length_scale = message
+        try:
+            audio = synthesizer(voice_name, text, length_scale)
+        except Exception as exc:
+            conn.send(("error", str(exc)))
+            continue
+        conn.send(("ok", audio.sample_rate, audio.sample_width, audio.channels))
+        conn.send_bytes(audio.pcm)
+
+
+@dataclass
+class _PiperWorker:
+    index: int
+    process: Any
+    conn: Any
+    voices: Set[str] = field(default_factory=set)
+    busy: bool = False
+    ready: bool = False
+    completed: int = 0
+    busy_seconds: float = 0.0
+
+
+class PiperWorkerPool:
+    """Dispatch Piper synthesis requests to warm worker processes."""
+
+    def __init__(
+        self,
+        workers: int,
+        *,
+        preload_voices: Sequence[str] = (),
+        loader: VoiceLoader = _default_loader,
+        synthesizer: VoiceSynthesizer = _default_synthesizer,
+        start_method: Optional[str] = None,
+        ready_timeout: float = DEFAULT_READY_TIMEOUT_SECONDS,
+    ) -> None:
+        if workers < 1:
+            raise ValueError("PiperWorkerPool requires at least one worker")
+        self._size = int(workers)
+        self._ready_timeout = float(ready_timeout)
+        self._preload = tuple(preload_voices)
+        self._loader = loader
+        self._synthesizer = synthesizer
+        self._context = multiprocessing.get_context(start_method or _default_start_method())
+        self._condition = threading.Condition()
+        self._workers: List[_PiperWorker] = []
+        self._closed = False
+        self._restarts = 0
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def start(self) -> "PiperWorkerPool":
+        with self._condition:
+            if self._workers:
+                return self
+            self._workers = [self._spawn(index) for index in range(self._size)]
+        return self
+
+    def _spawn(self, index: int) -> _PiperWorker:
+        parent_conn, child_conn = self._context.Pipe(duplex=True)
+        process = self._context.Process(
+            target=_worker_main,
+            args=(child_conn, self._preload, self._loader, self._synthesizer),
+            name=f"PiperWorker-{index}",
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        return _PiperWorker(index=index, process=process, conn=parent_conn)
+
+    def _checkout(self, voice_name: str) -> _PiperWorker:
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise TTSBackendError("Piper worker pool is shut down")
+                idle = [worker for worker in self._workers if not worker.busy]
+                if idle:
+                    warm = [worker for worker in idle if voice_name in worker.voices]
+                    worker = min(
+                        warm or idle,
+                        key=lambda candidate: (len(candidate.voices), candidate.completed),
+                    )
+                    worker.busy = True
+                    return worker
+                self._condition.wait()
+
+    def _release(self, worker: _PiperWorker) -> None:
+        with self._condition:
+            worker.busy = False
+            self._condition.notify()
+
+    def _replace(self, worker: _PiperWorker) -> _PiperWorker:
+        """Restart a worker whose process died or stopped responding.
+
+        Returns the worker now holding the slot, still checked out.
+        """
+
+        try:
+            worker.conn.close()
+        except OSError:
+            pass
+        if worker.process.is_alive():
+            worker.process.terminate()
+        worker.process.join(timeout=_SHUTDOWN_TIMEOUT_SECONDS)
+        with self._condition:
+            self._restarts += 1
+            if self._closed:
+                return worker
+            replacement = self._spawn(worker.index)
+            self._workers[self._workers.index(worker)] = replacement
+            replacement.busy = True
+            return replacement
+
+    def synthesize(
+        self,
+        voice_name: str,
+        text: str,
+        length_scale: float,
+        *,
+        timeout: Optional[float] = None,
+    ) -> PcmAudio:
+        """Synthesize ``text`` on a worker and return its PCM samples.
+
+        The worker is always returned to the pool; one whose pipe may be out
+        of step after a failure is replaced first.
+        """
+
+        if not self._workers:
+            self.start()
+        worker = self._checkout(voice_name)
+        started = time.perf_counter()
+        in_step = False
+        try:
+            if not worker.ready:
+                if not worker.conn.poll(self._ready_timeout):
+                    raise TimeoutError(
+                        f"Piper worker {worker.index} not ready after {self._ready_timeout}s"
+                    )
+                status, preloaded = worker.conn.recv()
+                if status != "ready":
+                    raise OSError(f"unexpected handshake {status!r}")
+                worker.voices.update(preloaded)
+                worker.ready = True
+            worker.conn.send((voice_name, text, float(length_scale)))
+            if timeout is not None and not worker.conn.poll(timeout):
+                raise TimeoutError(f"Piper worker {worker.index} timed out after {timeout}s")
+            header = worker.conn.recv()
+            if header[0] == "error":
+                in_step = True
+                raise TTSBackendError(f"Piper synthesis failed: {header[1]}")
+            _status, sample_rate, sample_width, channels = header
+            pcm = worker.conn.recv_bytes()
+            in_step = True
+            worker.voices.add(voice_name)
+            worker.completed += 1
+            worker.busy_seconds += time.perf_counter() - started
+        except (EOFError, OSError, TimeoutError) as exc:
+            raise TTSBackendError(f"Piper worker {worker.index} failed: {exc}") from exc
+        finally:
+            try:
+                if not in_step:
+                    worker = self._replace(worker)
+            finally:
+                self._release(worker)
+        return PcmAudio(
+            pcm=pcm,
+            sample_rate=int(sample_rate),
+            sample_width=int(sample_width),
+            channels=int(channels),
+        )
+
+    def close(self) -> None:
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            workers = list(self._workers)
+            self._condition.notify_all()
+        for worker in workers:
+            try:
+                worker.conn.send(None)
+            except OSError:
+                pass
+        for worker in workers:
+            worker.process.join(timeout=_SHUTDOWN_TIMEOUT_SECONDS)
+            if worker.process.is_alive():
+                worker.process.terminate()
+            try:
+                worker.conn.close()
+            except OSError:
+                pass
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._condition:
+            return {
+                "size": self._size,
+                "closed": self._closed,
+                "restarts": self._restarts,
+                "workers": [
+                    {
+                        "index": worker.index,
+                        "pid": worker.process.pid,
+                        "busy": worker.busy,
+                        "voices": sorted(worker.voices),
+                        "completed": worker.completed,
+                        "busy_seconds": round(worker.busy_seconds, 6),
+                    }
+                    for worker in self._workers
+                ],
+            }
+
+
+def _default_start_method() -> str:
+    # Audio workers are threads of a larger process; never fork it.
+    methods = multiprocessing.get_all_start_methods()
+    return "forkserver" if "forkserver" in methods else "spawn"
+
+
+def resolve_piper_worker_count(value: Any = None) -> int:
+    """Return the configured worker count; ``0`` keeps synthesis in-process.
+
+    ``EBOOK_PIPER_WORKERS`` wins over ``tts.backends.piper.workers`` in the
+    media config.  ``"auto"`` uses up to :data:`DEFAULT_AUTO_WORKERS` cores.
+    """
+
+    if value is None:
+        value = os.environ.get(PIPER_WORKERS_ENV)
+    if value is None or (isinstance(value, str) and not value.strip()):
+        value = get_tts_backend_config("piper").get("workers", 0)
+    if isinstance(value, str):
+        normalized = value.strip().lower()
+        if normalized == "auto":
+            cpus = os.cpu_count() or 1
+            return min(DEFAULT_AUTO_WORKERS, cpus) if cpus > 1 else 0
+        try:
+            value = int(normalized)
+        except ValueError:
+            logger.warning("Ignoring invalid Piper worker count %r", value)
+            return 0
+    try:
+        return max(0, int(value))
+    except (TypeError, ValueError):
+        return 0
+
+
+def resolve_preload_voices() -> Tuple[str, ...]:
+    raw = os.environ.get(PIPER_PRELOAD_VOICES_ENV)
+    if raw is not None:
+        return tuple(voice.strip() for voice in raw.split(",") if voice.strip())
+    configured = get_tts_backend_config("piper").get("preload_voices", [])
+    if isinstance(configured, str):
+        configured = [configured]
+    return tuple(str(voice).strip() for voice in configured or [] if str(voice).strip())
+
+
+_POOL: Optional[PiperWorkerPool] = None
+_POOL_RESOLVED = False
+_POOL_LOCK = threading.Lock()
+
+
+def get_piper_pool() -> Optional[PiperWorkerPool]:
+    """Return the shared worker pool, or ``None`` when it is disabled."""
+
+    global _POOL, _POOL_RESOLVED
+    if _POOL_RESOLVED:
+        return _POOL
+    with _POOL_LOCK:
+        if not _POOL_RESOLVED:
+            workers = resolve_piper_worker_count()
+            if workers > 0:
+                _POOL = PiperWorkerPool(workers, preload_voices=resolve_preload_voices()).start()
+                logger.info("Started %d Piper synthesis worker process(es)", workers)
+            _POOL_RESOLVED = True
+    return _POOL
+
+
+def shutdown_piper_pool() -> None:
+    """Stop the shared pool; the next :func:`get_piper_pool` re-reads config."""
+
+    global _POOL, _POOL_RESOLVED
+    with _POOL_LOCK:
+        pool = _POOL
+        _POOL = None
+        _POOL_RESOLVED = False
+    if pool is not None:
+        pool.close()
+
+
+atexit.register(shutdown_piper_pool)
+
+
+__all__ = [
+    "PIPER_PRELOAD_VOICES_ENV",
+    "PIPER_WORKERS_ENV",
+    "PcmAudio",
+    "PiperWorkerPool",
+    "get_piper_pool",
+    "resolve_piper_worker_count",
+    "resolve_preload_voices",
+    "shutdown_piper_pool",
+]
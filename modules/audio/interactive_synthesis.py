@@ -0,0 +1,531 @@
+"""Low-latency synthesis for interactive playback requests.
+
+Players ask for short clips (tap-to-hear words, sentence previews) and many
+devices tend to ask for the same clip at the same time.
+:class:`InteractiveSynthesisService` sits in front of the synthesis engines:
+
+* identical in-flight requests share one synthesis (single-flight);
+* finished clips are kept in a bounded in-memory LRU and a bounded on-disk
+  cache of encoded audio, so repeats never reach an engine; clips a producer
+  marks with :data:`FALLBACK_INFO_KEY` came from another engine than the key
+  names and are served once but never cached;
+* callers get the audio as soon as a first chunk of encoded bytes exists,
+  while the engine is still writing the rest;
+* the Piper voices used most recently are remembered across restarts and
+  loaded in the background so the first request after start-up is warm.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from modules import logging_manager as log_mgr
+
+logger = log_mgr.get_logger().getChild("audio.interactive")
+
+INTERACTIVE_AUDIO_CACHE_DIR_ENV = "EBOOK_INTERACTIVE_AUDIO_CACHE_DIR"
+INTERACTIVE_AUDIO_MEMORY_MB_ENV = "EBOOK_INTERACTIVE_AUDIO_MEMORY_MB"
+INTERACTIVE_AUDIO_DISK_MB_ENV = "EBOOK_INTERACTIVE_AUDIO_DISK_MB"
+# Producers set this info entry when another engine stood in for the keyed one.
+FALLBACK_INFO_KEY = "X-Synthesis-Fallback-From"
+
+DEFAULT_MEMORY_CACHE_BYTES = 32 * 1024 * 1024
+DEFAULT_DISK_CACHE_BYTES = 512 * 1024 * 1024
+DEFAULT_MAX_MEMORY_ENTRY_BYTES = 1024 * 1024
+# Clips shorter than this are returned whole, with a Content-Length.
+DEFAULT_FIRST_CHUNK_BYTES = 16 * 1024
+DEFAULT_WARM_VOICE_LIMIT = 4
+DEFAULT_MAX_WORKERS = 4
+
+_CHUNK_SIZE = 16 * 1024
+_POLL_SECONDS = 0.01
+_AUDIO_SUFFIX = ".mp3"
+_INFO_SUFFIX = ".json"
+_RECENT_VOICES_FILENAME = "recent_voices.json"
+_PARTIAL_DIRNAME = "partial"
+
+SynthesisProducer = Callable[[Path, Dict[str, str]], None]
+"""Writes encoded audio to the given path; may record engine details in the dict."""
+
+VoiceWarmer = Callable[[str], None]
+
+
+@dataclass(frozen=True)
+class SynthesisKey:
+    """Everything that determines the synthesized audio."""
+
+    engine: str
+    voice: str
+    language: str
+    speed: int
+    text: str
+
+    def digest(self) -> str:
+        payload = json.dumps(
+            [self.engine, self.voice, self.language, int(self.speed), self.text],
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class SynthesisResult:
+    """Audio for one request, either complete or still being produced.
+
+    ``source`` is ``memory`` or ``disk`` for cache hits, ``synthesized`` for
+    the request that ran the engine and ``shared`` for requests that joined
+    an identical synthesis already in flight.
+    """
+
+    source: str
+    info: Dict[str, str]
+    data: Optional[bytes] = None
+    chunks: Optional[Iterator[bytes]] = None
+
+    @property
+    def streaming(self) -> bool:
+        return self.data is None
+
+
+@dataclass
+class _Flight:
+    path: Path
+    info: Dict[str, str] = field(default_factory=dict)
+    done: threading.Event = field(default_factory=threading.Event)
+    data: Optional[bytes] = None
+    error: Optional[BaseException] = None
+
+
+def _env_megabytes(name: str, default: int) -> int:
+    raw = os.environ.get(name, "").strip()
+    if not raw:
+        return default
+    try:
+        return max(0, int(float(raw) * 1024 * 1024))
+    except ValueError:
+        logger.warning("Ignoring invalid %s=%r", name, raw)
+        return default
+
+
+def default_cache_dir() -> Path:
+    """Return the on-disk cache directory (``EBOOK_INTERACTIVE_AUDIO_CACHE_DIR`` wins)."""
+
+    override = os.environ.get(INTERACTIVE_AUDIO_CACHE_DIR_ENV, "").strip()
+    if override:
+        return Path(override).expanduser()
+    return Path(tempfile.gettempdir()) / "ebook-tools" / "interactive-audio"
+
+
+class InteractiveSynthesisService:
+    """Single-flight, cached and streamed synthesis of short clips."""
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        *,
+        memory_cache_bytes: int = DEFAULT_MEMORY_CACHE_BYTES,
+        disk_cache_bytes: int = DEFAULT_DISK_CACHE_BYTES,
+        max_memory_entry_bytes: int = DEFAULT_MAX_MEMORY_ENTRY_BYTES,
+        first_chunk_bytes: int = DEFAULT_FIRST_CHUNK_BYTES,
+        warm_voice: Optional[VoiceWarmer] = None,
+        warm_voice_limit: int = DEFAULT_WARM_VOICE_LIMIT,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ) -> None:
+        self._cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self._memory_limit = max(0, int(memory_cache_bytes))
+        self._disk_limit = max(0, int(disk_cache_bytes))
+        self._max_memory_entry = max(0, int(max_memory_entry_bytes))
+        self._first_chunk_bytes = max(1, int(first_chunk_bytes))
+        self._warm_voice = warm_voice
+        self._warm_voice_limit = max(0, int(warm_voice_limit))
+
+        self._lock = threading.Lock()
+        self._flights: Dict[str, _Flight] = {}
+        self._memory: "OrderedDict[str, Tuple[bytes, Dict[str, str]]]" = OrderedDict()
+        self._memory_bytes = 0
+        self._disk_usage: Optional[int] = None
+        self._recent_voices: "OrderedDict[str, None]" = OrderedDict()
+        self._warmed: set[str] = set()
+        self._counters: Dict[str, int] = {
+            "memory": 0,
+            "disk": 0,
+            "synthesized": 0,
+            "shared": 0,
+            "errors": 0,
+            "disk_evictions": 0,
+        }
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, int(max_workers)),
+            thread_name_prefix="InteractiveSynthesis",
+        )
+        if self._cache_dir is not None:
+            self._load_recent_voices()
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    def synthesize(self, key: SynthesisKey, producer: SynthesisProducer) -> SynthesisResult:
+        """Return audio for ``key``, running ``producer`` only when nobody else is.
+
+        Blocks until the clip is complete or its first chunk has been
+        written, whichever comes first. Errors raised by ``producer`` before
+        that point are re-raised here, unchanged, to every waiting caller.
+        """
+
+        digest = key.digest()
+        cached = self._memory_get(digest)
+        if cached is not None:
+            self._count("memory")
+            return SynthesisResult(source="memory", info=dict(cached[1]), data=cached[0])
+        cached = self._disk_get(digest)
+        if cached is not None:
+            self._count("disk")
+            self._memory_put(digest, *cached)
+            return SynthesisResult(source="disk", info=dict(cached[1]), data=cached[0])
+
+        with self._lock:
+            flight = self._flights.get(digest)
+            leader = flight is None
+            if flight is None:
+                flight = _Flight(path=self._partial_path(digest))
+                self._flights[digest] = flight
+        if leader:
+            if key.engine == "piper":
+                self._remember_voice(key.voice)
+            self._executor.submit(self._run, digest, flight, producer)
+        source = "synthesized" if leader else "shared"
+        self._count(source)
+
+        while not flight.done.wait(_POLL_SECONDS):
+            if _file_size(flight.path) >= self._first_chunk_bytes:
+                return SynthesisResult(
+                    source=source,
+                    info=dict(flight.info),
+                    chunks=self._tail(flight),
+                )
+        if flight.error is not None:
+            raise flight.error
+        assert flight.data is not None
+        return SynthesisResult(source=source, info=dict(flight.info), data=flight.data)
+
+    def warm_recent_voices(self) -> None:
+        """Load the recently used Piper voices in the background."""
+
+        if self._warm_voice is None:
+            return
+        with self._lock:
+            voices = [voice for voice in self._recent_voices if voice not in self._warmed]
+        for voice in voices:
+            self._executor.submit(self._warm, voice)
+
+    def recent_voices(self) -> List[str]:
+        """Return recently used Piper voices, most recent first."""
+
+        with self._lock:
+            return list(reversed(self._recent_voices))
+
+    def stats(self) -> Dict[str, int]:
+        """Return request counters and cache sizes."""
+
+        with self._lock:
+            return {
+                **self._counters,
+                "memory_entries": len(self._memory),
+                "memory_bytes": self._memory_bytes,
+                "disk_bytes": self._disk_usage or 0,
+                "in_flight": len(self._flights),
+            }
+
+    def clear_memory(self) -> None:
+        """Drop the in-memory cache (the disk cache is kept)."""
+
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+
+    def close(self) -> None:
+        """Stop background work; in-flight syntheses finish first."""
+
+        self._executor.shutdown(wait=True)
+
+    # ------------------------------------------------------------------
+    # Synthesis
+    # ------------------------------------------------------------------
+    def _run(self, digest: str, flight: _Flight, producer: SynthesisProducer) -> None:
+        try:
+            flight.path.parent.mkdir(parents=True, exist_ok=True)
+            producer(flight.path, flight.info)
+            data = flight.path.read_bytes()
+            if not data:
+                raise RuntimeError("Synthesis produced no audio")
+        except BaseException as exc:
+            flight.error = exc
+            self._count("errors")
+        else:
+            flight.data = data
+            if not flight.info.get(FALLBACK_INFO_KEY):
+                self._memory_put(digest, data, flight.info)
+                self._disk_put(digest, data, flight.info)
+        finally:
+            with self._lock:
+                self._flights.pop(digest, None)
+            flight.done.set()
+            _remove_quietly(flight.path)
+
+    def _tail(self, flight: _Flight) -> Iterator[bytes]:
+        """Yield the clip from its partial file while the producer writes it."""
+
+        offset = 0
+        handle = None
+        try:
+            try:
+                handle = flight.path.open("rb")
+            except FileNotFoundError:
+                handle = None
+            while handle is not None:
+                chunk = handle.read(_CHUNK_SIZE)
+                if chunk:
+                    offset += len(chunk)
+                    yield chunk
+                    continue
+                if flight.done.wait(_POLL_SECONDS):
+                    break
+        finally:
+            if handle is not None:
+                handle.close()
+        flight.done.wait()
+        if flight.error is not None:
+            raise RuntimeError("Interactive synthesis failed mid-stream") from flight.error
+        assert flight.data is not None
+        for start in range(offset, len(flight.data), _CHUNK_SIZE):
+            yield flight.data[start : start + _CHUNK_SIZE]
+
+    def _partial_path(self, digest: str) -> Path:
+        root = self._cache_dir if self._cache_dir is not None else Path(tempfile.gettempdir())
+        return root / _PARTIAL_DIRNAME / f"{digest}.{os.getpid()}.{time.monotonic_ns()}{_AUDIO_SUFFIX}"
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._counters[name] += 1
+
+    # ------------------------------------------------------------------
+    # Memory cache
+    # ------------------------------------------------------------------
+    def _memory_get(self, digest: str) -> Optional[Tuple[bytes, Dict[str, str]]]:
+        with self._lock:
+            entry = self._memory.get(digest)
+            if entry is not None:
+                self._memory.move_to_end(digest)
+            return entry
+
+    def _memory_put(self, digest: str, data: bytes, info: Dict[str, str]) -> None:
+        size = len(data)
+        if size > self._max_memory_entry or size > self._memory_limit:
+            return
+        with self._lock:
+            previous = self._memory.pop(digest, None)
+            if previous is not None:
+                self._memory_bytes -= len(previous[0])
+            self._memory[digest] = (data, dict(info))
+            self._memory_bytes += size
+            while self._memory_bytes > self._memory_limit and self._memory:
+                _evicted, (evicted_data, _info) = self._memory.popitem(last=False)
+                self._memory_bytes -= len(evicted_data)
+
+    # ------------------------------------------------------------------
+    # Disk cache
+    # ------------------------------------------------------------------
+    def _entry_paths(self, digest: str) -> Tuple[Path, Path]:
+        assert self._cache_dir is not None
+        directory = self._cache_dir / digest[:2]
+        return directory / f"{digest}{_AUDIO_SUFFIX}", directory / f"{digest}{_INFO_SUFFIX}"
+
+    def _disk_get(self, digest: str) -> Optional[Tuple[bytes, Dict[str, str]]]:
+        if self._cache_dir is None or self._disk_limit <= 0:
+            return None
+        audio_path, info_path = self._entry_paths(digest)
+        try:
+            data = audio_path.read_bytes()
+            info = json.loads(info_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not data or not isinstance(info, dict):
+            return None
+        try:
+            os.utime(audio_path)
+        except OSError:
+            pass
+        return data, {str(name): str(value) for name, value in info.items()}
+
+    def _disk_put(self, digest: str, data: bytes, info: Dict[str, str]) -> None:
+        if self._cache_dir is None or self._disk_limit <= 0 or len(data) > self._disk_limit:
+            return
+        audio_path, info_path = self._entry_paths(digest)
+        try:
+            audio_path.parent.mkdir(parents=True, exist_ok=True)
+            _atomic_write(info_path, json.dumps(info, ensure_ascii=False).encode("utf-8"))
+            existed = audio_path.exists()
+            _atomic_write(audio_path, data)
+        except OSError as exc:
+            logger.warning("Could not cache interactive audio: %s", exc)
+            return
+        with self._lock:
+            if self._disk_usage is None:
+                self._disk_usage = self._scan_disk_usage()
+            elif not existed:
+                self._disk_usage += len(data)
+            over_limit = self._disk_usage > self._disk_limit
+        if over_limit:
+            self._evict_disk()
+
+    def _scan_disk_usage(self) -> int:
+        assert self._cache_dir is not None
+        total = 0
+        for path in self._cache_dir.glob(f"??/*{_AUDIO_SUFFIX}"):
+            total += _file_size(path)
+        return total
+
+    def _evict_disk(self) -> None:
+        """Delete least recently used clips until the cache is at 90% of its limit."""
+
+        assert self._cache_dir is not None
+        entries = []
+        for path in self._cache_dir.glob(f"??/*{_AUDIO_SUFFIX}"):
+            try:
+                stat_result = path.stat()
+            except OSError:
+                continue
+            entries.append((stat_result.st_mtime, stat_result.st_size, path))
+        entries.sort()
+        usage = sum(size for _mtime, size, _path in entries)
+        target = int(self._disk_limit * 0.9)
+        evicted = 0
+        for _mtime, size, path in entries:
+            if usage <= target:
+                break
+            _remove_quietly(path)
+            _remove_quietly(path.with_suffix(_INFO_SUFFIX))
+            usage -= size
+            evicted += 1
+        with self._lock:
+            self._disk_usage = usage
+            self._counters["disk_evictions"] += evicted
+
+    # ------------------------------------------------------------------
+    # Warm voices
+    # ------------------------------------------------------------------
+    def _remember_voice(self, voice: str) -> None:
+        if self._warm_voice_limit <= 0 or not voice:
+            return
+        with self._lock:
+            changed = next(reversed(self._recent_voices), None) != voice
+            self._recent_voices.pop(voice, None)
+            self._recent_voices[voice] = None
+            while len(self._recent_voices) > self._warm_voice_limit:
+                self._recent_voices.popitem(last=False)
+            voices = list(self._recent_voices)
+        if changed:
+            self._save_recent_voices(voices)
+
+    def _warm(self, voice: str) -> None:
+        assert self._warm_voice is not None
+        started = time.perf_counter()
+        try:
+            self._warm_voice(voice)
+        except Exception as exc:
+            logger.debug("Could not warm voice %s: %s", voice, exc)
+            return
+        with self._lock:
+            self._warmed.add(voice)
+        logger.debug("Warmed voice %s in %.2fs", voice, time.perf_counter() - started)
+
+    def _load_recent_voices(self) -> None:
+        assert self._cache_dir is not None
+        try:
+            voices = json.loads((self._cache_dir / _RECENT_VOICES_FILENAME).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if not isinstance(voices, list):
+            return
+        for voice in voices[-self._warm_voice_limit :] if self._warm_voice_limit else []:
+            if isinstance(voice, str) and voice:
+                self._recent_voices[voice] = None
+
+    def _save_recent_voices(self, voices: List[str]) -> None:
+        if self._cache_dir is None:
+            return
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            _atomic_write(
+                self._cache_dir / _RECENT_VOICES_FILENAME,
+                json.dumps(voices).encode("utf-8"),
+            )
+        except OSError as exc:
+            logger.debug("Could not record recent voices: %s", exc)
+
+
+def _file_size(path: Path) -> int:
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
+
+
+def _remove_quietly(path: Path) -> None:
+    try:
+        path.unlink()
+    except FileNotFoundError:
+        pass
+    except OSError as exc:
+        logger.debug("Could not remove %s: %s", path, exc)
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        _remove_quietly(Path(tmp_name))
+        raise
+
+
+def create_interactive_synthesis_service(
+    *,
+    warm_voice: Optional[VoiceWarmer] = None,
+) -> InteractiveSynthesisService:
+    """Build the service from the ``EBOOK_INTERACTIVE_AUDIO_*`` environment."""
+
+    service = InteractiveSynthesisService(
+        default_cache_dir(),
+        memory_cache_bytes=_env_megabytes(INTERACTIVE_AUDIO_MEMORY_MB_ENV, DEFAULT_MEMORY_CACHE_BYTES),
+        disk_cache_bytes=_env_megabytes(INTERACTIVE_AUDIO_DISK_MB_ENV, DEFAULT_DISK_CACHE_BYTES),
+        warm_voice=warm_voice,
+    )
+    service.warm_recent_voices()
+    return service
+
+
+__all__ = [
+    "FALLBACK_INFO_KEY",
+    "INTERACTIVE_AUDIO_CACHE_DIR_ENV",
+    "INTERACTIVE_AUDIO_DISK_MB_ENV",
+    "INTERACTIVE_AUDIO_MEMORY_MB_ENV",
+    "InteractiveSynthesisService",
+    "SynthesisKey",
+    "SynthesisProducer",
+    "SynthesisResult",
+    "create_interactive_synthesis_service",
+    "default_cache_dir",
+]
@@ -0,0 +1,416 @@
+"""Per-job summary index of the chunk metadata files.
+
+Every finalized chunk is written to ``metadata/chunk_*.json`` and never
+changes afterwards, yet the media, timing and search routes kept opening
+those files to recover a handful of facts: the sentence range, the audio and
+timing tracks, the highlighting policy and where the timing came from.
+``metadata/chunks_index.json`` records those facts once per chunk file, next to
+``job.json``, together with the file's size, ``st_mtime_ns`` and SHA-256.
+
+Readers trust an entry only while the chunk file still has the recorded size
+and modification time, so a stale or missing index costs one ``stat`` per
+chunk and a fall back to reading the chunk file, never a wrong answer.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+from modules import logging_manager as log_mgr
+
+logger = log_mgr.get_logger().getChild("chunk_index")
+
+CHUNK_INDEX_FILENAME = "chunks_index.json"
+CHUNK_INDEX_VERSION = 1
+
+_CHUNK_FILE_PATTERN = "chunk_*.json"
+_INDEX_CACHE_SIZE = 128
+_index_cache: "OrderedDict[Path, Tuple[Tuple[int, int], Dict[str, Any]]]" = OrderedDict()
+_index_cache_lock = threading.Lock()
+
+PolicySummary = Tuple[Optional[str], Optional[str]]
+
+
+def _iter_sentence_payloads(payload: Any) -> Iterator[Mapping[str, Any]]:
+    """Yield flattened sentence entries from chunk payloads."""
+
+    if isinstance(payload, Mapping):
+        sentences = payload.get("sentences")
+        if isinstance(sentences, Sequence) and not isinstance(sentences, (str, bytes)):
+            for entry in sentences:
+                yield from _iter_sentence_payloads(entry)
+            return
+        yield payload
+        return
+    if isinstance(payload, Sequence) and not isinstance(payload, (str, bytes)):
+        for entry in payload:
+            yield from _iter_sentence_payloads(entry)
+
+
+def _extract_highlighting_policy(entry: Mapping[str, Any]) -> Optional[str]:
+    """Return the highlighting policy encoded on a sentence entry."""
+
+    summary = entry.get("highlighting_summary")
+    if isinstance(summary, Mapping):
+        policy = summary.get("policy")
+        if isinstance(policy, str) and policy.strip():
+            return policy.strip()
+    candidate = entry.get("highlighting_policy")
+    if isinstance(candidate, str) and candidate.strip():
+        return candidate.strip()
+    return None
+
+
+def _iter_track_policies(payload: Mapping[str, Any]) -> Iterator[str]:
+    top_level = payload.get("highlighting_policy")
+    if isinstance(top_level, str) and top_level.strip():
+        yield top_level.strip()
+    tracks = payload.get("timingTracks")
+    if not isinstance(tracks, Mapping):
+        return
+    for entries in tracks.values():
+        if not isinstance(entries, list):
+            continue
+        for entry in entries:
+            if not isinstance(entry, Mapping):
+                continue
+            policy = entry.get("policy")
+            if isinstance(policy, str) and policy.strip():
+                yield policy.strip()
+
+
+def is_estimated_policy(policy: Optional[str]) -> bool:
+    """Return whether ``policy`` names estimated (not aligned) timing."""
+
+    if not isinstance(policy, str):
+        return False
+    return policy.strip().lower().startswith("estimated")
+
+
+def chunk_policy_summary(payload: Any) -> PolicySummary:
+    """Return ``(policy, estimated_policy)`` declared by one chunk payload.
+
+    Policies are visited in the order the timing route always used: the
+    chunk-level policy, then timing-track tokens, then sentence entries.
+    ``estimated_policy`` is the first estimated one; ``policy`` is the first
+    other one seen before it.
+    """
+
+    candidates: List[Iterable[str]] = []
+    if isinstance(payload, Mapping):
+        candidates.append(_iter_track_policies(payload))
+    candidates.append(
+        policy
+        for policy in (
+            _extract_highlighting_policy(entry)
+            for entry in _iter_sentence_payloads(payload)
+            if isinstance(entry, Mapping)
+        )
+        if policy
+    )
+    fallback: Optional[str] = None
+    for policies in candidates:
+        for policy in policies:
+            if is_estimated_policy(policy):
+                return fallback, policy
+            if fallback is None:
+                fallback = policy
+    return fallback, None
+
+
+def combine_policy_summaries(
+    summaries: Iterable[PolicySummary],
+    default_policy: Optional[str],
+) -> Tuple[Optional[str], bool]:
+    """Resolve the job policy and whether estimated timings exist.
+
+    The first estimated policy across ``summaries`` wins; otherwise the
+    default policy or the first policy declared by any chunk is returned.
+    """
+
+    normalized_default = None
+    if isinstance(default_policy, str) and default_policy.strip():
+        normalized_default = default_policy.strip()
+    fallback_policy = normalized_default
+    for policy, estimated_policy in summaries:
+        if estimated_policy:
+            return estimated_policy, True
+        if fallback_policy is None and policy:
+            fallback_policy = policy
+    return fallback_policy, is_estimated_policy(fallback_policy)
+
+
+def _timing_source(payload: Mapping[str, Any]) -> Optional[str]:
+    for entry in _iter_sentence_payloads(payload):
+        if not isinstance(entry, Mapping):
+            continue
+        summary = entry.get("highlighting_summary")
+        if isinstance(summary, Mapping):
+            source = summary.get("source")
+            if isinstance(source, str) and source.strip():
+                return source.strip()
+    tracks = payload.get("timingTracks")
+    if isinstance(tracks, Mapping):
+        for entries in tracks.values():
+            if not isinstance(entries, list):
+                continue
+            for entry in entries:
+                if isinstance(entry, Mapping):
+                    source = entry.get("source")
+                    if isinstance(source, str) and source.strip():
+                        return source.strip()
+    return None
+
+
+def _timing_track_summary(entries: Any) -> Dict[str, Any]:
+    summary: Dict[str, Any] = {"tokens": 0}
+    if not isinstance(entries, list):
+        return summary
+    summary["tokens"] = len(entries)
+    ends: List[float] = []
+    for entry in entries:
+        if not isinstance(entry, Mapping):
+            continue
+        try:
+            ends.append(float(entry.get("end")))  # type: ignore[arg-type]
+        except (TypeError, ValueError):
+            continue
+    if ends:
+        summary["duration"] = round(max(ends), 6)
+    return summary
+
+
+def summarize_chunk_payload(payload: Any) -> Dict[str, Any]:
+    """Return the index fields derived from one parsed chunk payload."""
+
+    entry: Dict[str, Any] = {"valid": isinstance(payload, Mapping)}
+    policy, estimated_policy = chunk_policy_summary(payload)
+    entry["highlighting_policy"] = policy
+    entry["estimated_policy"] = estimated_policy
+    if not isinstance(payload, Mapping):
+        return entry
+
+    for key in ("chunk_id", "range_fragment", "start_sentence", "end_sentence"):
+        entry[key] = copy.deepcopy(payload.get(key))
+    sentence_count = payload.get("sentence_count")
+    if isinstance(sentence_count, int):
+        entry["sentence_count"] = sentence_count
+    audio_tracks = payload.get("audioTracks")
+    if isinstance(audio_tracks, Mapping):
+        entry["audioTracks"] = copy.deepcopy(dict(audio_tracks))
+        durations: Dict[str, float] = {}
+        for key, value in audio_tracks.items():
+            if not isinstance(value, Mapping):
+                continue
+            try:
+                durations[str(key)] = round(float(value.get("duration")), 6)  # type: ignore[arg-type]
+            except (TypeError, ValueError):
+                continue
+        entry["durations"] = durations
+    timing_tracks = payload.get("timingTracks")
+    if isinstance(timing_tracks, Mapping):
+        entry["timingTracks"] = {
+            str(key): _timing_track_summary(value) for key, value in timing_tracks.items()
+        }
+    timing_version = payload.get("timingVersion")
+    if isinstance(timing_version, str) and timing_version.strip():
+        entry["timingVersion"] = timing_version.strip()
+    entry["timing_source"] = _timing_source(payload)
+    return entry
+
+
+def summarize_chunk_file(chunk_path: Path) -> Optional[Dict[str, Any]]:
+    """Read ``chunk_path`` once and return its index entry.
+
+    Returns ``None`` when the file cannot be read.  A file that is not valid
+    JSON still gets an entry (with ``valid`` false) so readers can tell it
+    has not changed since it was indexed.
+    """
+
+    try:
+        with chunk_path.open("rb") as handle:
+            stat_result = os.fstat(handle.fileno())
+            raw = handle.read()
+    except OSError:
+        return None
+    try:
+        payload: Any = json.loads(raw.decode("utf-8"))
+    except (UnicodeDecodeError, json.JSONDecodeError):
+        payload = None
+    entry = summarize_chunk_payload(payload)
+    entry["size"] = stat_result.st_size
+    entry["mtime_ns"] = stat_result.st_mtime_ns
+    entry["sha256"] = hashlib.sha256(raw).hexdigest()
+    return entry
+
+
+def entry_is_current(entry: Mapping[str, Any], stat_result: Optional[os.stat_result]) -> bool:
+    """Return whether ``entry`` still describes a file with ``stat_result``."""
+
+    return (
+        stat_result is not None
+        and entry.get("size") == stat_result.st_size
+        and entry.get("mtime_ns") == stat_result.st_mtime_ns
+    )
+
+
+def _stat(path: Path) -> Optional[os.stat_result]:
+    try:
+        return path.stat()
+    except OSError:
+        return None
+
+
+def build_chunk_index(
+    metadata_root: Path,
+    *,
+    previous: Optional[Mapping[str, Any]] = None,
+    refresh: Iterable[str] = (),
+) -> Dict[str, Any]:
+    """Return a chunk index for every ``chunk_*.json`` in ``metadata_root``.
+
+    Entries of ``previous`` are reused for files whose size and modification
+    time are unchanged, unless the file name is listed in ``refresh``.
+    """
+
+    reusable: Mapping[str, Any] = {}
+    if isinstance(previous, Mapping) and isinstance(previous.get("chunks"), Mapping):
+        reusable = previous["chunks"]
+    forced = set(refresh)
+    chunks: Dict[str, Any] = {}
+    for chunk_path in sorted(metadata_root.glob(_CHUNK_FILE_PATTERN)):
+        name = chunk_path.name
+        cached = reusable.get(name)
+        if (
+            name not in forced
+            and isinstance(cached, Mapping)
+            and entry_is_current(cached, _stat(chunk_path))
+        ):
+            chunks[name] = copy.deepcopy(dict(cached))
+            continue
+        entry = summarize_chunk_file(chunk_path)
+        if entry is not None:
+            chunks[name] = entry
+    return {"version": CHUNK_INDEX_VERSION, "chunks": chunks}
+
+
+def write_chunk_index(metadata_root: Path, index: Mapping[str, Any]) -> Path:
+    """Atomically write ``index`` to ``metadata_root/chunks_index.json``."""
+
+    destination = metadata_root / CHUNK_INDEX_FILENAME
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    serialized = json.dumps(index, ensure_ascii=False, separators=(",", ":"))
+    tmp_handle = tempfile.NamedTemporaryFile(
+        "w", encoding="utf-8", dir=destination.parent, delete=False
+    )
+    try:
+        with tmp_handle as handle:
+            handle.write(serialized)
+            handle.flush()
+        Path(tmp_handle.name).replace(destination)
+    except Exception:
+        Path(tmp_handle.name).unlink(missing_ok=True)
+        raise
+    return destination
+
+
+def refresh_chunk_index(metadata_root: Path, *, refresh: Iterable[str] = ()) -> Dict[str, Any]:
+    """Update the chunk index of ``metadata_root`` and return it.
+
+    Unchanged chunk files keep their existing entries; new, rewritten or
+    ``refresh``-listed files are read once, and deleted ones are dropped.
+    Nothing is written for a directory without chunks or an index.
+    """
+
+    previous = load_chunk_index(metadata_root)
+    index = build_chunk_index(metadata_root, previous=previous, refresh=refresh)
+    if index["chunks"] or (metadata_root / CHUNK_INDEX_FILENAME).exists():
+        write_chunk_index(metadata_root, index)
+    return index
+
+
+def load_chunk_index(metadata_root: Path) -> Optional[Dict[str, Any]]:
+    """Return the chunk index of ``metadata_root`` or ``None`` when absent.
+
+    Parsed indexes are cached per directory until the index file changes.
+    The returned mapping is shared; callers must not modify it.
+    """
+
+    index_path = metadata_root / CHUNK_INDEX_FILENAME
+    stat_result = _stat(index_path)
+    if stat_result is None:
+        return None
+    signature = (stat_result.st_mtime_ns, stat_result.st_size)
+    with _index_cache_lock:
+        cached = _index_cache.get(index_path)
+        if cached is not None and cached[0] == signature:
+            _index_cache.move_to_end(index_path)
+            return cached[1]
+    try:
+        with index_path.open("r", encoding="utf-8") as handle:
+            index = json.load(handle)
+    except (OSError, json.JSONDecodeError):
+        logger.debug("Ignoring unreadable chunk index %s", index_path, exc_info=True)
+        return None
+    if (
+        not isinstance(index, dict)
+        or index.get("version") != CHUNK_INDEX_VERSION
+        or not isinstance(index.get("chunks"), dict)
+    ):
+        return None
+    with _index_cache_lock:
+        _index_cache[index_path] = (signature, index)
+        _index_cache.move_to_end(index_path)
+        while len(_index_cache) > _INDEX_CACHE_SIZE:
+            _index_cache.popitem(last=False)
+    return index
+
+
+def current_index_entries(
+    index: Optional[Mapping[str, Any]],
+    chunk_stats: Sequence[Tuple[str, Optional[os.stat_result]]],
+) -> Optional[List[Mapping[str, Any]]]:
+    """Return index entries for ``chunk_stats`` when all of them are current.
+
+    ``chunk_stats`` lists ``(file name, stat result)`` for the chunk files on
+    disk.  ``None`` is returned if the index misses a file, lists a file that
+    no longer exists or describes an older version of one.
+    """
+
+    if index is None:
+        return None
+    chunks = index.get("chunks")
+    if not isinstance(chunks, Mapping) or len(chunks) != len(chunk_stats):
+        return None
+    entries: List[Mapping[str, Any]] = []
+    for name, stat_result in chunk_stats:
+        entry = chunks.get(name)
+        if not isinstance(entry, Mapping) or not entry_is_current(entry, stat_result):
+            return None
+        entries.append(entry)
+    return entries
+
+
+__all__ = [
+    "CHUNK_INDEX_FILENAME",
+    "CHUNK_INDEX_VERSION",
+    "build_chunk_index",
+    "chunk_policy_summary",
+    "combine_policy_summaries",
+    "current_index_entries",
+    "entry_is_current",
+    "is_estimated_policy",
+    "load_chunk_index",
+    "refresh_chunk_index",
+    "summarize_chunk_file",
+    "summarize_chunk_payload",
+    "write_chunk_index",
+]
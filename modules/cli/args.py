@@ -233,6 +233,43 @@ def build_cli_parser() -> argparse.ArgumentParser:
     library_fetch_isbn_parser.add_argument("job_id", help="Library job identifier to update.")
     library_fetch_isbn_parser.add_argument("isbn", help="ISBN code to fetch metadata for.")
 
+    worker_parser = subparsers.add_parser(
+        "worker",
+        help="Claim and execute queued pipeline jobs from a shared job queue.",
+        allow_abbrev=False,
+    )
+    worker_parser.add_argument(
+        "--queue-url",
+        dest="queue_url",
+        help="Job queue URL (redis://… or sqlite:///…; defaults to JOB_QUEUE_URL).",
+    )
+    worker_parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="Number of jobs this process executes at the same time.",
+    )
+    worker_parser.add_argument(
+        "--lease-seconds",
+        dest="lease_seconds",
+        type=float,
+        default=30.0,
+        help="Lease duration; a job is reclaimed if its worker stops renewing it.",
+    )
+    worker_parser.add_argument(
+        "--max-attempts",
+        dest="max_attempts",
+        type=int,
+        default=3,
+        help="Fail a job after it has been claimed this many times without finishing.",
+    )
+    worker_parser.add_argument(
+        "--worker-id",
+        dest="worker_id",
+        help="Identifier recorded on claimed leases (defaults to host:pid).",
+    )
+    worker_parser.set_defaults(command="worker")
+
     return parser
 
 
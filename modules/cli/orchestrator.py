@@ -21,6 +21,7 @@ from ..services.pipeline_service import PipelineResponse
 from .args import parse_cli_args, parse_legacy_args
 from .library_commands import execute_library_command
 from .user_commands import SessionRequirementError, ensure_active_session, execute_user_command
+from .worker_commands import execute_worker_command
 from .pipeline_runner import run_pipeline_from_args
 from .progress import CLIProgressLogger
 
@@ -193,6 +194,9 @@ def run_cli(argv: Optional[Sequence[str]] = None, *, report_interval: float = 5.
     if command == "library":
         return execute_library_command(args)
 
+    if command == "worker":
+        return execute_worker_command(args)
+
     if command in {"run", "interactive"}:
         user_store_override = getattr(args, "user_store", None)
         session_file_override = getattr(args, "session_file", None)
@@ -0,0 +1,95 @@
+"""Distributed job worker command for the ebook-tools CLI."""
+
+from __future__ import annotations
+
+import signal
+import threading
+from typing import List
+
+from .. import logging_manager as log_mgr
+from ..services.job_manager import DistributedJobWorker, PipelineJobManager, build_job_queue
+from ..services.job_manager.distributed_worker import default_worker_id
+from ..services.job_manager.job_queue import resolve_job_queue
+
+LOGGER = log_mgr.get_logger().getChild("cli.worker")
+
+
+def execute_worker_command(args) -> int:
+    """Run ``ebook-tools worker`` until interrupted."""
+
+    queue_url = getattr(args, "queue_url", None)
+    try:
+        queue = build_job_queue(queue_url) if queue_url else resolve_job_queue()
+    except Exception as exc:
+        log_mgr.console_error(f"Unable to open job queue: {exc}", logger_obj=LOGGER)
+        return 1
+    if queue is None:
+        log_mgr.console_error(
+            "No job queue configured. Pass --queue-url or set JOB_QUEUE_URL.",
+            logger_obj=LOGGER,
+        )
+        return 1
+
+    concurrency = max(1, int(getattr(args, "concurrency", 1) or 1))
+    manager = PipelineJobManager(
+        max_workers=concurrency,
+        job_queue=queue,
+        enable_backpressure=False,
+    )
+    base_id = getattr(args, "worker_id", None) or default_worker_id()
+    workers = [
+        DistributedJobWorker(
+            manager,
+            queue,
+            worker_id=base_id if concurrency == 1 else f"{base_id}/{index}",
+            lease_seconds=args.lease_seconds,
+            max_attempts=args.max_attempts,
+        )
+        for index in range(concurrency)
+    ]
+
+    stop_event = threading.Event()
+
+    def _request_shutdown(signum, _frame) -> None:
+        log_mgr.console_info(
+            "Received signal %s; finishing running jobs before exiting.",
+            signum,
+            logger_obj=LOGGER,
+        )
+        stop_event.set()
+
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        try:
+            signal.signal(signum, _request_shutdown)
+        except ValueError:  # pragma: no cover - not in the main thread
+            pass
+
+    log_mgr.console_info(
+        "Job worker %s started with %s slot(s).",
+        base_id,
+        concurrency,
+        logger_obj=LOGGER,
+    )
+    threads: List[threading.Thread] = [
+        threading.Thread(
+            target=worker.run_forever,
+            args=(stop_event,),
+            name=f"job-worker-{index}",
+            daemon=True,
+        )
+        for index, worker in enumerate(workers)
+    ]
+    for thread in threads:
+        thread.start()
+    try:
+        while any(thread.is_alive() for thread in threads):
+            for thread in threads:
+                thread.join(timeout=0.5)
+    finally:
+        stop_event.set()
+        manager.shutdown()
+        queue.close()
+    return 0
+
+
+__all__ = ["execute_worker_command"]
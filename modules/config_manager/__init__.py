@@ -186,6 +186,16 @@ def get_translation_llm_timeout_seconds() -> float:
     return value
 
 
+def get_translation_llm_batch_streaming() -> bool:
+    """Return whether LLM batch translations are streamed item by item."""
+
+    settings = get_settings()
+    candidate = getattr(settings, "translation_llm_batch_streaming", None)
+    if candidate is None:
+        return True
+    return bool(candidate)
+
+
 def get_tts_fallback_voice() -> str:
     """Return the configured fallback voice for TTS failures."""
 
@@ -230,6 +240,7 @@ __all__ = [
     "get_lmstudio_macbook_url",
     "get_ollama_url",
     "get_translation_fallback_model",
+    "get_translation_llm_batch_streaming",
     "get_translation_llm_timeout_seconds",
     "get_tts_fallback_voice",
     "get_library_root",
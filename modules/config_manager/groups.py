@@ -273,6 +273,13 @@ CONFIG_KEY_METADATA: Dict[str, Dict[str, Any]] = {
         "max": 600,
         "requires_restart": False,
     },
+    "translation_llm_batch_streaming": {
+        "display_name": "Stream Batch Translations",
+        "description": "Stream LLM batch responses so finished sentences reach audio generation before the batch completes",
+        "group": ConfigGroup.TRANSLATION,
+        "type": "boolean",
+        "requires_restart": False,
+    },
     # Highlighting group
     "word_highlighting": {
         "display_name": "Word Highlighting",
@@ -577,6 +584,7 @@ class TranslationConfig(BaseModel):
     translation_llm_timeout_seconds: float = Field(
         default=DEFAULT_TRANSLATION_LLM_TIMEOUT_SECONDS, ge=10, le=600
     )
+    translation_llm_batch_streaming: bool = True
 
 
 class HighlightingConfig(BaseModel):
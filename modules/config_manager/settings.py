@@ -75,6 +75,7 @@ class EbookToolsSettings(BaseModel):
     say_path: Optional[str] = None
     translation_fallback_model: str = DEFAULT_TRANSLATION_FALLBACK_MODEL
     translation_llm_timeout_seconds: float = DEFAULT_TRANSLATION_LLM_TIMEOUT_SECONDS
+    translation_llm_batch_streaming: bool = True
     tts_fallback_voice: str = DEFAULT_TTS_FALLBACK_VOICE
     audio_api_base_url: Optional[str] = None
     audio_api_timeout_seconds: float = 60.0
@@ -294,6 +295,10 @@ class EnvironmentOverrides(BaseSettings):
             "EBOOK_LLM_TIMEOUT_SECONDS",
         ),
     )
+    translation_llm_batch_streaming: Optional[bool] = Field(
+        default=None,
+        validation_alias=AliasChoices("EBOOK_TRANSLATION_LLM_BATCH_STREAMING"),
+    )
     tts_fallback_voice: Optional[str] = Field(
         default=None,
         validation_alias=AliasChoices(
@@ -16,7 +16,9 @@ from ..epub_parser import (
     sentence_splitter_version_for_mode,
     split_text_into_sentences,
 )
+from . import ingestion_cache
 from .config import PipelineConfig
+from .ingestion_cache import IngestionCacheEntry, IngestionSettings
 
 
 def get_runtime_output_dir(pipeline_config: PipelineConfig) -> Path:
@@ -184,8 +186,14 @@ def get_refined_sentences(
     *,
     force_refresh: bool = False,
     metadata: Optional[dict] = None,
+    language: Optional[str] = None,
 ) -> Tuple[Sequence[str], bool]:
-    """Return the refined sentence list and whether it was regenerated."""
+    """Return the refined sentence list and whether it was regenerated.
+
+    ``force_refresh`` only bypasses the path-keyed runtime artifact; the
+    content-addressed ingestion cache is keyed by the EPUB bytes and splitter
+    settings, so a hit there is always current.
+    """
 
     if not input_file:
         return [], False
@@ -224,38 +232,127 @@ def get_refined_sentences(
         if cached_settings == expected_settings:
             return cached.get("refined_list", []), False
 
-    refined: Sequence[str]
+    entry = _ingest_epub(input_file, pipeline_config, language=language)
+    refined = entry.refined_sentences
+    save_refined_list(refined, input_file, pipeline_config, metadata=metadata)
+    return refined, True
+
+
+def _ingest_epub(
+    input_file: str,
+    pipeline_config: PipelineConfig,
+    *,
+    language: Optional[str] = None,
+) -> IngestionCacheEntry:
+    """Return refined sentences (and content index) for ``input_file``.
+
+    Results come from the content-addressed cache when possible; on a miss
+    the EPUB is parsed once, its sections are split (in parallel for large
+    books) and the entry is stored for later jobs.
+    """
+
+    logger = logging.getLogger(__name__)
+    settings = IngestionSettings.from_pipeline_config(pipeline_config, language=language)
+    cache = ingestion_cache.resolve_cache(pipeline_config)
+    digest: Optional[str] = None
+    if cache is not None:
+        try:
+            digest = ingestion_cache.epub_content_hash(input_file)
+        except OSError:
+            logger.debug("Unable to hash %s for the ingestion cache.", input_file, exc_info=True)
+        else:
+            entry = cache.load(digest, settings)
+            if entry is not None:
+                logger.debug("Ingestion cache hit for %s (%s).", input_file, digest[:12])
+                return entry
+
+    started = time.perf_counter()
     try:
         sections = extract_sections_from_epub(
             input_file, books_dir=pipeline_config.resolved_books_dir()
         )
     except Exception:
         sections = []
-    if sections:
-        refined_list: list[str] = []
-        for section in sections:
-            text = section.get("text") if isinstance(section, dict) else None
-            if not isinstance(text, str) or not text.strip():
-                continue
-            refined_list.extend(
-                split_text_into_sentences(
-                    text,
-                    max_words=pipeline_config.max_words,
-                    extend_split_with_comma_semicolon=pipeline_config.split_on_comma_semicolon,
-                    splitter_mode=splitter_mode,
-                )
-            )
-        refined = refined_list
+    indexed_sections = _indexed_section_texts(sections)
+    if indexed_sections:
+        section_sentences = _split_section_texts(
+            [text for _index, _section, text in indexed_sections], pipeline_config
+        )
+        refined_list = [
+            sentence for sentences in section_sentences for sentence in sentences
+        ]
+        content_index = _content_index_from_sections(
+            [
+                (index, section, text, sentences)
+                for (index, section, text), sentences in zip(indexed_sections, section_sentences)
+            ],
+            refined_list,
+        )
+        entry = IngestionCacheEntry(refined_sentences=refined_list, content_index=content_index)
     else:
         text = extract_text_from_epub(input_file)
         refined = split_text_into_sentences(
             text,
             max_words=pipeline_config.max_words,
             extend_split_with_comma_semicolon=pipeline_config.split_on_comma_semicolon,
-            splitter_mode=splitter_mode,
+            splitter_mode=settings.sentence_splitter_mode,
         )
-    save_refined_list(refined, input_file, pipeline_config, metadata=metadata)
-    return refined, True
+        entry = IngestionCacheEntry(refined_sentences=list(refined))
+    logger.debug(
+        "Split %s into %d sentences in %.3fs.",
+        input_file,
+        len(entry.refined_sentences),
+        time.perf_counter() - started,
+    )
+
+    if cache is not None and digest is not None:
+        try:
+            cache.store(digest, settings, entry)
+        except OSError:
+            logger.warning("Unable to write ingestion cache entry for %s.", input_file, exc_info=True)
+    return entry
+
+
+def _indexed_section_texts(
+    sections: Sequence[dict[str, object]],
+) -> list[tuple[int, dict[str, object], str]]:
+    """Return ``(position, section, text)`` for sections with usable text."""
+
+    indexed: list[tuple[int, dict[str, object], str]] = []
+    for index, section in enumerate(sections, start=1):
+        text = section.get("text") if isinstance(section, dict) else None
+        if not isinstance(text, str) or not text.strip():
+            continue
+        indexed.append((index, section, text))
+    return indexed
+
+
+def _split_section_texts(
+    texts: Sequence[str], pipeline_config: PipelineConfig
+) -> list[list[str]]:
+    """Split each section text, using a process pool for large books."""
+
+    splitter_mode = _sentence_splitter_mode(pipeline_config)
+    if ingestion_cache.should_split_in_parallel(texts):
+        settings = IngestionSettings.from_pipeline_config(pipeline_config)
+        try:
+            return ingestion_cache.split_texts_parallel(texts, settings)
+        except Exception:
+            logging.getLogger(__name__).warning(
+                "Parallel sentence splitting failed; continuing serially.",
+                exc_info=True,
+            )
+    return [
+        list(
+            split_text_into_sentences(
+                text,
+                max_words=pipeline_config.max_words,
+                extend_split_with_comma_semicolon=pipeline_config.split_on_comma_semicolon,
+                splitter_mode=splitter_mode,
+            )
+        )
+        for text in texts
+    ]
 
 
 def save_content_index(
@@ -338,6 +435,7 @@ def get_content_index(
     *,
     force_refresh: bool = False,
     metadata: Optional[dict] = None,
+    language: Optional[str] = None,
 ) -> Optional[dict]:
     """Return chapter-aware content metadata, reusing cached output when valid."""
 
@@ -346,7 +444,11 @@ def get_content_index(
         if cached is not None:
             return cached
 
-    content_index = build_content_index(input_file, pipeline_config, refined_sentences)
+    content_index = _cached_content_index(
+        input_file, pipeline_config, refined_sentences, language=language
+    )
+    if content_index is None:
+        content_index = build_content_index(input_file, pipeline_config, refined_sentences)
     save_content_index(
         content_index,
         input_file,
@@ -357,6 +459,34 @@ def get_content_index(
     return content_index
 
 
+def _cached_content_index(
+    input_file: Optional[str],
+    pipeline_config: PipelineConfig,
+    refined_sentences: Sequence[str],
+    *,
+    language: Optional[str] = None,
+) -> Optional[dict]:
+    """Return the content index stored alongside ``refined_sentences``, if any."""
+
+    if not input_file:
+        return None
+    cache = ingestion_cache.resolve_cache(pipeline_config)
+    if cache is None:
+        return None
+    resolved_input = resolve_file_path(input_file, pipeline_config.resolved_books_dir())
+    if not resolved_input or not resolved_input.exists():
+        return None
+    try:
+        digest = ingestion_cache.epub_content_hash(resolved_input)
+    except OSError:
+        return None
+    settings = IngestionSettings.from_pipeline_config(pipeline_config, language=language)
+    entry = cache.load(digest, settings)
+    if entry is None:
+        return None
+    return entry.content_index_for(refined_sentences)
+
+
 def build_content_index(
     input_file: Optional[str],
     pipeline_config: PipelineConfig,
@@ -387,6 +517,25 @@ def build_content_index(
     if not sections:
         return None
 
+    indexed_sections = _indexed_section_texts(sections)
+    section_sentences = _split_section_texts(
+        [text for _index, _section, text in indexed_sections], pipeline_config
+    )
+    return _content_index_from_sections(
+        [
+            (index, section, text, sentences)
+            for (index, section, text), sentences in zip(indexed_sections, section_sentences)
+        ],
+        refined_sentences,
+    )
+
+
+def _content_index_from_sections(
+    split_sections: Sequence[tuple[int, dict[str, object], str, Sequence[str]]],
+    refined_sentences: Sequence[str],
+) -> dict:
+    """Assemble the content index from already split ``split_sections``."""
+
     refined_list = list(refined_sentences or [])
     total_sentences = len(refined_list)
     cursor = 0
@@ -395,16 +544,8 @@ def build_content_index(
     section_span_issues = 0
     chapters: list[dict[str, object]] = []
 
-    for index, section in enumerate(sections, start=1):
-        text = section.get("text") if isinstance(section, dict) else None
-        if not isinstance(text, str) or not text.strip():
-            continue
-        sentences = split_text_into_sentences(
-            text,
-            max_words=pipeline_config.max_words,
-            extend_split_with_comma_semicolon=pipeline_config.split_on_comma_semicolon,
-            splitter_mode=_sentence_splitter_mode(pipeline_config),
-        )
+    for index, section, text, section_sentences in split_sections:
+        sentences = list(section_sentences)
         if not sentences:
             continue
 
@@ -0,0 +1,328 @@
+"""Content-addressed cache and parallel splitting for EPUB ingestion.
+
+Sentence splitting and refinement depend only on the EPUB bytes and the
+splitter settings, so results are stored under a key derived from the EPUB's
+SHA-256 digest plus those settings.  Re-runs and new jobs on the same book
+reuse the stored refined sentences and content index instead of re-parsing
+the EPUB, regardless of which job directory or path the book was opened from.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from ..epub_parser import (
+    normalize_sentence_splitter_mode,
+    sentence_splitter_version_for_mode,
+    split_text_into_sentences,
+)
+
+LOGGER = logging.getLogger(__name__)
+
+INGESTION_CACHE_ENV = "EBOOK_INGESTION_CACHE"
+INGESTION_CACHE_DIR_ENV = "EBOOK_INGESTION_CACHE_DIR"
+INGESTION_WORKERS_ENV = "EBOOK_INGESTION_WORKERS"
+
+CACHE_FORMAT_VERSION = 1
+DEFAULT_CACHE_DIRNAME = "ingestion_cache"
+DEFAULT_MAX_WORKERS = 8
+# Below these sizes process start-up costs more than it saves.
+PARALLEL_MIN_SECTIONS = 2
+PARALLEL_MIN_CHARACTERS = 200_000
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+_DIGEST_MEMO: Dict[Tuple[str, int, int], str] = {}
+_DIGEST_MEMO_LOCK = threading.Lock()
+_DIGEST_MEMO_LIMIT = 256
+
+
+def cache_enabled() -> bool:
+    """Return ``False`` when the content-addressed cache is disabled via env."""
+
+    raw = os.environ.get(INGESTION_CACHE_ENV, "").strip().lower()
+    return raw not in {"0", "false", "no", "off"}
+
+
+def resolve_worker_count(max_workers: Optional[int] = None) -> int:
+    """Return the number of splitter processes to use for one ingestion."""
+
+    if max_workers is None:
+        raw = os.environ.get(INGESTION_WORKERS_ENV, "").strip()
+        try:
+            max_workers = int(raw) if raw else None
+        except ValueError:
+            LOGGER.warning("Ignoring invalid %s=%r", INGESTION_WORKERS_ENV, raw)
+            max_workers = None
+    if max_workers is None:
+        max_workers = min(DEFAULT_MAX_WORKERS, os.cpu_count() or 1)
+    return max(1, int(max_workers))
+
+
+def epub_content_hash(path: Path | str) -> str:
+    """Return the SHA-256 hex digest of ``path``.
+
+    Digests are memoised per ``(path, size, mtime_ns)`` so the refined list
+    and content index lookups for one job hash the EPUB only once.
+    """
+
+    resolved = Path(path)
+    stat_result = resolved.stat()
+    memo_key = (str(resolved), stat_result.st_size, stat_result.st_mtime_ns)
+    with _DIGEST_MEMO_LOCK:
+        cached = _DIGEST_MEMO.get(memo_key)
+    if cached is not None:
+        return cached
+
+    digest = hashlib.sha256()
+    with open(resolved, "rb") as handle:
+        for chunk in iter(lambda: handle.read(_HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    value = digest.hexdigest()
+    with _DIGEST_MEMO_LOCK:
+        if len(_DIGEST_MEMO) >= _DIGEST_MEMO_LIMIT:
+            _DIGEST_MEMO.clear()
+        _DIGEST_MEMO[memo_key] = value
+    return value
+
+
+def sentences_hash(sentences: Sequence[str]) -> str:
+    payload = json.dumps(list(sentences), ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class IngestionSettings:
+    """Every input besides the EPUB bytes that affects the split output."""
+
+    max_words: int
+    split_on_comma_semicolon: bool
+    sentence_splitter_mode: str
+    sentence_splitter_version: str
+    language: Optional[str] = None
+
+    @classmethod
+    def from_pipeline_config(
+        cls, pipeline_config: Any, *, language: Optional[str] = None
+    ) -> "IngestionSettings":
+        mode = normalize_sentence_splitter_mode(
+            getattr(pipeline_config, "sentence_splitter_mode", "regex")
+        )
+        normalized_language = (language or "").strip().lower() or None
+        return cls(
+            max_words=int(pipeline_config.max_words),
+            split_on_comma_semicolon=bool(pipeline_config.split_on_comma_semicolon),
+            sentence_splitter_mode=mode,
+            sentence_splitter_version=sentence_splitter_version_for_mode(mode),
+            language=normalized_language,
+        )
+
+    def cache_key(self, epub_digest: str) -> str:
+        parts = [
+            f"v{CACHE_FORMAT_VERSION}",
+            epub_digest,
+            str(self.max_words),
+            "1" if self.split_on_comma_semicolon else "0",
+            self.sentence_splitter_mode,
+            self.sentence_splitter_version,
+            self.language or "",
+        ]
+        return hashlib.sha256("|".join(parts).encode("utf-8")).hexdigest()
+
+
+@dataclass
+class IngestionCacheEntry:
+    """Refined sentences and content index stored for one cache key."""
+
+    refined_sentences: List[str]
+    content_index: Optional[Dict[str, Any]] = None
+    refined_sentences_hash: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        if self.refined_sentences_hash is None:
+            self.refined_sentences_hash = sentences_hash(self.refined_sentences)
+
+    def content_index_for(self, refined_sentences: Sequence[str]) -> Optional[Dict[str, Any]]:
+        """Return the cached content index when it was built for ``refined_sentences``."""
+
+        if self.content_index is None:
+            return None
+        if sentences_hash(refined_sentences) != self.refined_sentences_hash:
+            return None
+        return self.content_index
+
+
+class IngestionCache:
+    """Store :class:`IngestionCacheEntry` payloads as JSON files under ``root``."""
+
+    def __init__(self, root: Path) -> None:
+        self._root = Path(root)
+
+    @property
+    def root(self) -> Path:
+        return self._root
+
+    def _entry_path(self, key: str) -> Path:
+        return self._root / key[:2] / f"{key}.json"
+
+    def load(self, epub_digest: str, settings: IngestionSettings) -> Optional[IngestionCacheEntry]:
+        path = self._entry_path(settings.cache_key(epub_digest))
+        try:
+            with open(path, "r", encoding="utf-8") as handle:
+                payload = json.load(handle)
+        except FileNotFoundError:
+            return None
+        except (OSError, json.JSONDecodeError):
+            LOGGER.debug("Ignoring unreadable ingestion cache entry %s", path, exc_info=True)
+            return None
+
+        if payload.get("version") != CACHE_FORMAT_VERSION:
+            return None
+        if payload.get("epub_sha256") != epub_digest:
+            return None
+        refined = payload.get("refined_sentences")
+        if not isinstance(refined, list):
+            return None
+        content_index = payload.get("content_index")
+        return IngestionCacheEntry(
+            refined_sentences=[str(sentence) for sentence in refined],
+            content_index=content_index if isinstance(content_index, dict) else None,
+            refined_sentences_hash=payload.get("refined_sentences_hash"),
+        )
+
+    def store(
+        self,
+        epub_digest: str,
+        settings: IngestionSettings,
+        entry: IngestionCacheEntry,
+    ) -> Path:
+        path = self._entry_path(settings.cache_key(epub_digest))
+        payload = {
+            "version": CACHE_FORMAT_VERSION,
+            "generated_at": time.time(),
+            "epub_sha256": epub_digest,
+            "settings": asdict(settings),
+            "refined_sentences_hash": entry.refined_sentences_hash,
+            "refined_sentences": list(entry.refined_sentences),
+            "content_index": entry.content_index,
+        }
+        _atomic_write_json(path, payload)
+        return path
+
+
+def resolve_cache(pipeline_config: Any) -> Optional[IngestionCache]:
+    """Return the ingestion cache for ``pipeline_config`` or ``None`` when disabled.
+
+    ``EBOOK_INGESTION_CACHE_DIR`` points every worker at one shared store;
+    otherwise entries live next to the other runtime artifacts.
+    """
+
+    if not cache_enabled():
+        return None
+    override = os.environ.get(INGESTION_CACHE_DIR_ENV, "").strip()
+    if override:
+        return IngestionCache(Path(override).expanduser())
+    return IngestionCache(pipeline_config.ensure_runtime_dir() / DEFAULT_CACHE_DIRNAME)
+
+
+def _atomic_write_json(path: Path, payload: Dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump(payload, handle, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_name, path)
+    except Exception:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
+def should_split_in_parallel(texts: Sequence[str], max_workers: Optional[int] = None) -> bool:
+    """Return ``True`` when ``texts`` is large enough to justify a process pool."""
+
+    if len(texts) < PARALLEL_MIN_SECTIONS:
+        return False
+    if resolve_worker_count(max_workers) < 2:
+        return False
+    return sum(len(text) for text in texts) >= PARALLEL_MIN_CHARACTERS
+
+
+def _split_worker(payload: Tuple[str, int, bool, str]) -> List[str]:
+    text, max_words, split_on_comma_semicolon, splitter_mode = payload
+    return split_text_into_sentences(
+        text,
+        max_words=max_words,
+        extend_split_with_comma_semicolon=split_on_comma_semicolon,
+        splitter_mode=splitter_mode,
+    )
+
+
+def _pool_context() -> multiprocessing.context.BaseContext:
+    # Never fork: the API process is multi-threaded and a forked child can
+    # inherit locks held by other threads.
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+
+def split_texts_parallel(
+    texts: Sequence[str],
+    settings: IngestionSettings,
+    *,
+    max_workers: Optional[int] = None,
+) -> List[List[str]]:
+    """Split every text in ``texts`` on a process pool, preserving order.
+
+    Sections are submitted longest first so one long chapter does not end up
+    as the tail of the schedule.
+    """
+
+    workers = min(resolve_worker_count(max_workers), len(texts))
+    order = sorted(range(len(texts)), key=lambda index: len(texts[index]), reverse=True)
+    results: List[Optional[List[str]]] = [None] * len(texts)
+    with ProcessPoolExecutor(max_workers=workers, mp_context=_pool_context()) as pool:
+        futures = {
+            index: pool.submit(
+                _split_worker,
+                (
+                    texts[index],
+                    settings.max_words,
+                    settings.split_on_comma_semicolon,
+                    settings.sentence_splitter_mode,
+                ),
+            )
+            for index in order
+        }
+        for index, future in futures.items():
+            results[index] = future.result()
+    return [result or [] for result in results]
+
+
+__all__ = [
+    "CACHE_FORMAT_VERSION",
+    "INGESTION_CACHE_DIR_ENV",
+    "INGESTION_CACHE_ENV",
+    "INGESTION_WORKERS_ENV",
+    "IngestionCache",
+    "IngestionCacheEntry",
+    "IngestionSettings",
+    "cache_enabled",
+    "epub_content_hash",
+    "resolve_cache",
+    "resolve_worker_count",
+    "sentences_hash",
+    "should_split_in_parallel",
+    "split_texts_parallel",
+]
@@ -0,0 +1,419 @@
+"""Durable per-sentence checkpoints for resumable rendering runs.
+
+Every sentence that finishes translation, transliteration and TTS is appended
+to a small journal next to the batch exports.  When a paused or crashed job is
+started again from its block boundary, the render pipeline replays the
+checkpointed sentences instead of sending them through the LLM/TTS backends
+and only resumes real work at the first sentence without a checkpoint.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+import wave
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence
+
+from pydub import AudioSegment
+
+from modules.logging_manager import logger
+
+CHECKPOINT_DIRNAME = ".checkpoints"
+JOURNAL_FILENAME = "sentences.jsonl"
+CHECKPOINTS_ENV_VAR = "EBOOK_SENTENCE_CHECKPOINTS"
+_JOURNAL_VERSION = 1
+_DISABLED_VALUES = {"0", "false", "no", "off"}
+
+
+def resolve_checkpoints_enabled(value: Optional[str] = None) -> bool:
+    """Return whether sentence checkpoints should be written for render runs."""
+
+    raw = os.environ.get(CHECKPOINTS_ENV_VAR) if value is None else value
+    if raw is None:
+        return True
+    return str(raw).strip().lower() not in _DISABLED_VALUES
+
+
+def build_checkpoint_fingerprint(settings: Mapping[str, Any]) -> str:
+    """Hash the render settings that change per-sentence artifacts."""
+
+    encoded = json.dumps(settings, sort_keys=True, default=str, ensure_ascii=False)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()[:16]
+
+
+def compute_block_start(sentence_number: int, block_size: int) -> int:
+    """Return the first sentence of the resume block holding ``sentence_number``."""
+
+    if sentence_number <= 0:
+        return 1
+    size = max(1, block_size)
+    return ((sentence_number - 1) // size) * size + 1
+
+
+def _source_hash(sentence: str) -> str:
+    return hashlib.sha1(str(sentence or "").encode("utf-8")).hexdigest()
+
+
+@dataclass(slots=True)
+class SentenceCheckpoint:
+    """Completed artifacts for a single rendered sentence."""
+
+    sentence_number: int
+    source_hash: str
+    target_language: str
+    translation: str
+    transliteration: str
+    audio_files: Dict[str, str] = field(default_factory=dict)
+    voice_metadata: Dict[str, Dict[str, str]] = field(default_factory=dict)
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def word_tokens(self) -> List[Dict[str, Any]]:
+        tokens = self.metadata.get("word_tokens")
+        return list(tokens) if isinstance(tokens, list) else []
+
+    @property
+    def image_path(self) -> Optional[str]:
+        value = self.metadata.get("imagePath")
+        return str(value) if value else None
+
+    def to_record(self) -> Dict[str, Any]:
+        return {
+            "sentence_number": self.sentence_number,
+            "source_hash": self.source_hash,
+            "target_language": self.target_language,
+            "translation": self.translation,
+            "transliteration": self.transliteration,
+            "audio_files": dict(self.audio_files),
+            "voice_metadata": self.voice_metadata,
+            "metadata": self.metadata,
+        }
+
+    @classmethod
+    def from_record(cls, record: Mapping[str, Any]) -> "SentenceCheckpoint":
+        return cls(
+            sentence_number=int(record["sentence_number"]),
+            source_hash=str(record.get("source_hash") or ""),
+            target_language=str(record.get("target_language") or ""),
+            translation=str(record.get("translation") or ""),
+            transliteration=str(record.get("transliteration") or ""),
+            audio_files={
+                str(key): str(value)
+                for key, value in (record.get("audio_files") or {}).items()
+            },
+            voice_metadata=dict(record.get("voice_metadata") or {}),
+            metadata=dict(record.get("metadata") or {}),
+        )
+
+
+def _write_wav(path: Path, segment: AudioSegment) -> None:
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    with wave.open(str(tmp_path), "wb") as handle:
+        handle.setnchannels(segment.channels)
+        handle.setsampwidth(segment.sample_width)
+        handle.setframerate(segment.frame_rate)
+        handle.writeframes(segment.raw_data)
+    with open(tmp_path, "rb+") as handle:
+        os.fsync(handle.fileno())
+    os.replace(tmp_path, path)
+
+
+def _read_wav(path: Path) -> AudioSegment:
+    with wave.open(str(path), "rb") as handle:
+        return AudioSegment(
+            data=handle.readframes(handle.getnframes()),
+            sample_width=handle.getsampwidth(),
+            frame_rate=handle.getframerate(),
+            channels=handle.getnchannels(),
+        )
+
+
+def _json_safe(payload: Mapping[str, Any]) -> Dict[str, Any]:
+    return json.loads(json.dumps(dict(payload), default=str, ensure_ascii=False))
+
+
+class SentenceCheckpointStore:
+    """Append-only, fsync'd journal of completed sentences for one output folder.
+
+    The journal starts with a header carrying the settings fingerprint; a
+    store opened with a different fingerprint discards the old journal so
+    replayed sentences always match the current request.  Audio is kept as
+    uncompressed WAV files so replay does not need ffmpeg.
+    """
+
+    def __init__(self, root: Path | str, *, fingerprint: str) -> None:
+        self._root = Path(root)
+        self._fingerprint = fingerprint
+        self._journal_path = self._root / JOURNAL_FILENAME
+        self._audio_dir = self._root / "audio"
+        self._lock = threading.Lock()
+        self._records: Dict[int, SentenceCheckpoint] = {}
+        self._images: Dict[int, str] = {}
+        self._handle = None
+        self._disabled = False
+        self._load()
+
+    @classmethod
+    def for_output(cls, base_dir: Path | str, *, fingerprint: str) -> "SentenceCheckpointStore":
+        return cls(Path(base_dir) / CHECKPOINT_DIRNAME, fingerprint=fingerprint)
+
+    @property
+    def root(self) -> Path:
+        return self._root
+
+    @property
+    def enabled(self) -> bool:
+        return not self._disabled
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._records)
+
+    # ------------------------------------------------------------------
+    # Loading
+    def _load(self) -> None:
+        try:
+            raw = self._journal_path.read_bytes()
+            if raw and not raw.endswith(b"\n"):
+                # Cut a torn trailing line from a crash mid-append so the next
+                # record starts on its own line instead of extending it.
+                raw = raw[: raw.rfind(b"\n") + 1]
+                os.truncate(self._journal_path, len(raw))
+        except FileNotFoundError:
+            return
+        except OSError:
+            logger.debug("Unable to read checkpoint journal %s", self._journal_path, exc_info=True)
+            return
+        lines = raw.decode("utf-8", errors="replace").splitlines()
+        header: Optional[Mapping[str, Any]] = None
+        for line in lines:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if not isinstance(record, Mapping):
+                continue
+            if header is None:
+                header = record
+                if (
+                    record.get("version") != _JOURNAL_VERSION
+                    or record.get("fingerprint") != self._fingerprint
+                ):
+                    logger.info(
+                        "Discarding sentence checkpoints in %s; render settings changed.",
+                        self._root,
+                    )
+                    self._reset_files()
+                    return
+                continue
+            try:
+                if record.get("kind") == "image":
+                    self._images[int(record["sentence_number"])] = str(record["path"])
+                    continue
+                checkpoint = SentenceCheckpoint.from_record(record)
+            except (KeyError, TypeError, ValueError):
+                continue
+            self._records[checkpoint.sentence_number] = checkpoint
+
+    def _reset_files(self) -> None:
+        self._records.clear()
+        self._images.clear()
+        shutil.rmtree(self._root, ignore_errors=True)
+
+    # ------------------------------------------------------------------
+    # Queries
+    def get(self, sentence_number: int, sentence: str) -> Optional[SentenceCheckpoint]:
+        """Return the checkpoint for ``sentence_number`` if it matches ``sentence``."""
+
+        with self._lock:
+            checkpoint = self._records.get(int(sentence_number))
+        if checkpoint is None or checkpoint.source_hash != _source_hash(sentence):
+            return None
+        for relative in checkpoint.audio_files.values():
+            if not (self._root / relative).is_file():
+                return None
+        return checkpoint
+
+    def replayable_prefix(
+        self, start_sentence: int, sentences: Sequence[str]
+    ) -> List[SentenceCheckpoint]:
+        """Return contiguous checkpoints from ``start_sentence`` onwards."""
+
+        replayable: List[SentenceCheckpoint] = []
+        for offset, sentence in enumerate(sentences):
+            checkpoint = self.get(start_sentence + offset, sentence)
+            if checkpoint is None:
+                break
+            replayable.append(checkpoint)
+        return replayable
+
+    def load_audio(self, checkpoint: SentenceCheckpoint) -> Dict[str, AudioSegment]:
+        """Load the WAV tracks referenced by ``checkpoint``."""
+
+        return {
+            track: _read_wav(self._root / relative)
+            for track, relative in checkpoint.audio_files.items()
+        }
+
+    def image_paths(self) -> Dict[int, str]:
+        with self._lock:
+            return dict(self._images)
+
+    # ------------------------------------------------------------------
+    # Recording
+    def record(
+        self,
+        *,
+        sentence_number: int,
+        sentence: str,
+        target_language: str,
+        translation: str,
+        transliteration: str,
+        audio_tracks: Optional[Mapping[str, Optional[AudioSegment]]] = None,
+        voice_metadata: Optional[Mapping[str, Mapping[str, str]]] = None,
+        metadata: Optional[Mapping[str, Any]] = None,
+    ) -> None:
+        """Durably record the artifacts of a completed sentence."""
+
+        if self._disabled:
+            return
+        number = int(sentence_number)
+        try:
+            audio_files: Dict[str, str] = {}
+            for track, segment in (audio_tracks or {}).items():
+                if segment is None:
+                    continue
+                self._audio_dir.mkdir(parents=True, exist_ok=True)
+                relative = f"audio/sentence_{number:05d}_{track}.wav"
+                _write_wav(self._root / relative, segment)
+                audio_files[track] = relative
+            checkpoint = SentenceCheckpoint(
+                sentence_number=number,
+                source_hash=_source_hash(sentence),
+                target_language=target_language or "",
+                translation=translation or "",
+                transliteration=transliteration or "",
+                audio_files=audio_files,
+                voice_metadata=_json_safe(voice_metadata or {}),
+                metadata=_json_safe(metadata or {}),
+            )
+            with self._lock:
+                self._append(checkpoint.to_record())
+                self._records[number] = checkpoint
+        except (OSError, TypeError, ValueError, wave.Error):
+            self._disable("record sentence %s" % number)
+
+    def record_image(self, sentence_number: int, relative_path: str) -> None:
+        """Record that the image for ``sentence_number`` has been written."""
+
+        if self._disabled:
+            return
+        record = {"kind": "image", "sentence_number": int(sentence_number), "path": relative_path}
+        try:
+            with self._lock:
+                self._append(record)
+                self._images[int(sentence_number)] = relative_path
+        except OSError:
+            self._disable("record image %s" % sentence_number)
+
+    def _append(self, record: Mapping[str, Any]) -> None:
+        if self._handle is None:
+            self._root.mkdir(parents=True, exist_ok=True)
+            new_file = not self._journal_path.exists() or self._journal_path.stat().st_size == 0
+            self._handle = open(self._journal_path, "a", encoding="utf-8")
+            if new_file:
+                self._write_line({"version": _JOURNAL_VERSION, "fingerprint": self._fingerprint})
+        self._write_line(record)
+
+    def _write_line(self, record: Mapping[str, Any]) -> None:
+        handle = self._handle
+        handle.write(json.dumps(record, ensure_ascii=False) + "\n")
+        handle.flush()
+        os.fsync(handle.fileno())
+
+    def _disable(self, action: str) -> None:
+        self._disabled = True
+        logger.warning(
+            "Sentence checkpoints disabled for %s after failing to %s.",
+            self._root,
+            action,
+            exc_info=True,
+        )
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    def prune_before(self, sentence_number: int) -> None:
+        """Drop checkpoints for sentences earlier than ``sentence_number``."""
+
+        if self._disabled:
+            return
+        with self._lock:
+            stale = [number for number in self._records if number < sentence_number]
+            stale_images = [number for number in self._images if number < sentence_number]
+            if not stale and not stale_images:
+                return
+            removed = [self._records.pop(number) for number in stale]
+            for number in stale_images:
+                self._images.pop(number, None)
+            try:
+                self._rewrite_journal()
+            except OSError:
+                self._disable("compact the journal")
+                return
+        for checkpoint in removed:
+            for relative in checkpoint.audio_files.values():
+                try:
+                    (self._root / relative).unlink()
+                except OSError:
+                    pass
+
+    def _rewrite_journal(self) -> None:
+        self._close_handle()
+        tmp_path = self._journal_path.with_name(f".{JOURNAL_FILENAME}.tmp")
+        lines: Iterable[Mapping[str, Any]] = [
+            {"version": _JOURNAL_VERSION, "fingerprint": self._fingerprint},
+            *(self._records[number].to_record() for number in sorted(self._records)),
+            *(
+                {"kind": "image", "sentence_number": number, "path": path}
+                for number, path in sorted(self._images.items())
+            ),
+        ]
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            for record in lines:
+                handle.write(json.dumps(record, ensure_ascii=False) + "\n")
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(tmp_path, self._journal_path)
+
+    def _close_handle(self) -> None:
+        if self._handle is not None:
+            try:
+                self._handle.close()
+            finally:
+                self._handle = None
+
+    def close(self) -> None:
+        with self._lock:
+            self._close_handle()
+
+    def clear(self) -> None:
+        """Remove every checkpoint once the run has completed."""
+
+        with self._lock:
+            self._close_handle()
+            self._reset_files()
+
+
+__all__ = [
+    "CHECKPOINTS_ENV_VAR",
+    "SentenceCheckpoint",
+    "SentenceCheckpointStore",
+    "build_checkpoint_fingerprint",
+    "compute_block_start",
+    "resolve_checkpoints_enabled",
+]
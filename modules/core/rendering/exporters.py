@@ -22,6 +22,11 @@ from modules.core.rendering.timeline import (
     scale_timing_to_audio_duration,
     validate_export_timing_tracks,
 )
+from modules.core.rendering.timing_columns import (
+    TimingColumnStore,
+    resolve_timing_columns_root,
+)
+from modules.logging_manager import logger
 from modules.render.context import RenderBatchContext
 from modules.render.output_writer import DeferredBatchWriter
 from modules.audio.highlight import _get_audio_metadata
@@ -1014,6 +1019,20 @@ class BatchExporter:
                 track_durations,
             )
 
+        if any(timing_tracks.values()):
+            # Columnar copy of the tracks for sentence-range timing queries.
+            try:
+                TimingColumnStore(resolve_timing_columns_root(self._context.base_dir)).write_chunk(
+                    chunk_id,
+                    request.start_sentence,
+                    request.end_sentence,
+                    timing_tracks,
+                )
+            except (OSError, ValueError):
+                logger.debug(
+                    "Unable to write timing columns for chunk %s", chunk_id, exc_info=True
+                )
+
         return BatchExportResult(
             chunk_id=chunk_id,
             start_sentence=request.start_sentence,
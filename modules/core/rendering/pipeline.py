@@ -24,6 +24,12 @@ from modules.core.translation import ThreadWorkerPool
 from modules.transliteration import TransliterationService, get_transliterator
 
 from .blocks import build_written_and_sentence_blocks
+from .checkpoints import (
+    SentenceCheckpointStore,
+    build_checkpoint_fingerprint,
+    compute_block_start,
+    resolve_checkpoints_enabled,
+)
 from modules.language_constants import LANGUAGE_CODES
 from .exporters import BatchExportRequest, BatchExportResult, BatchExporter, build_exporter
 from .pipeline_processing import _ImageGenerationState, process_pipeline, process_sequential
@@ -56,6 +62,8 @@ class PipelineState:
     media_batch_size: int = 0
     media_batch_first_size: Optional[int] = None
     media_batch_ids: Set[str] = field(default_factory=set)
+    checkpoint_store: Optional[SentenceCheckpointStore] = None
+    checkpoint_block_size: int = 1
 
 
 class RenderPipeline:
@@ -193,6 +201,18 @@ class RenderPipeline:
             start_sentence=start_sentence,
             target_languages=target_languages,
         )
+        state.checkpoint_store = self._open_checkpoint_store(
+            base_dir,
+            input_language=input_language,
+            target_languages=target_languages,
+            generate_audio=generate_audio,
+            audio_mode=audio_mode,
+            include_transliteration=include_transliteration,
+            translation_provider=translation_provider,
+            transliteration_mode=transliteration_mode,
+            transliteration_model=transliteration_model,
+        )
+        state.checkpoint_block_size = max(1, int(sentences_per_file or 1))
 
         translation_client = self._ensure_translation_client()
         normalized_transliteration_mode = self._normalize_transliteration_mode(
@@ -306,6 +326,12 @@ class RenderPipeline:
                 logger_obj=logger,
             )
 
+        if state.checkpoint_store is not None:
+            if state.processed >= total_refined and not self._should_stop():
+                state.checkpoint_store.clear()
+            else:
+                state.checkpoint_store.close()
+
         console_info("EPUB processing complete!", logger_obj=logger)
         console_info(
             "Total sentences processed: %s",
@@ -323,10 +349,16 @@ class RenderPipeline:
     # ------------------------------------------------------------------
     # Internal helpers
     def _register_export_result(
-        self, state: PipelineState, result: Optional[BatchExportResult]
+        self,
+        state: PipelineState,
+        result: Optional[BatchExportResult],
+        *,
+        prune_checkpoints: bool = True,
     ) -> None:
         if result is None:
             return
+        if prune_checkpoints:
+            self._prune_checkpoints(state, result.end_sentence)
         if self._progress is not None:
             self._record_media_batch_progress(state, result)
             self._progress.record_generated_chunk(
@@ -410,8 +442,15 @@ class RenderPipeline:
         self,
         state: PipelineState,
         future: concurrent.futures.Future[Optional[BatchExportResult]],
+        *,
+        prune_checkpoints: bool = True,
     ) -> None:
-        """Register export results as soon as the background task finishes."""
+        """Register export results as soon as the background task finishes.
+
+        Chunks exported ahead of the in-order cursor pass
+        ``prune_checkpoints=False``: earlier sentences still need their
+        checkpoints until their own chunks are written.
+        """
 
         exception = future.exception()
         if exception is not None:
@@ -419,7 +458,9 @@ class RenderPipeline:
 
         result = future.result()
         try:
-            self._register_export_result(state, result)
+            self._register_export_result(
+                state, result, prune_checkpoints=prune_checkpoints
+            )
         except Exception:  # pragma: no cover - defensive logging
             chunk_label = getattr(result, "chunk_id", "unknown") if result else "unknown"
             logger.error("Failed to record generated chunk %s", chunk_label, exc_info=True)
@@ -445,6 +486,94 @@ class RenderPipeline:
             state.current_original_segments = []
         return state
 
+    def _open_checkpoint_store(
+        self,
+        base_dir: str,
+        *,
+        input_language: str,
+        target_languages: Sequence[str],
+        generate_audio: bool,
+        audio_mode: str,
+        include_transliteration: bool,
+        translation_provider: Optional[str],
+        transliteration_mode: Optional[str],
+        transliteration_model: Optional[str],
+    ) -> Optional[SentenceCheckpointStore]:
+        if not resolve_checkpoints_enabled():
+            return None
+        fingerprint = build_checkpoint_fingerprint(
+            {
+                "input_language": input_language,
+                "target_languages": list(target_languages),
+                "generate_audio": bool(generate_audio),
+                "audio_mode": audio_mode,
+                "include_transliteration": bool(include_transliteration),
+                "translation_provider": translation_provider,
+                "transliteration_mode": transliteration_mode,
+                "transliteration_model": transliteration_model,
+                "model": self._config.ollama_model,
+                "llm_source": self._config.llm_source,
+                "selected_voice": self._config.selected_voice,
+                "voice_overrides": dict(self._config.voice_overrides or {}),
+                "tts_backend": self._config.tts_backend,
+                "tempo": self._config.tempo,
+                "macos_reading_speed": self._config.macos_reading_speed,
+            }
+        )
+        store = SentenceCheckpointStore.for_output(base_dir, fingerprint=fingerprint)
+        if len(store):
+            console_info(
+                "Loaded %s sentence checkpoint(s) from %s",
+                len(store),
+                store.root,
+                logger_obj=logger,
+            )
+        return store
+
+    def _record_checkpoint(
+        self,
+        state: PipelineState,
+        *,
+        sentence_number: int,
+        sentence: str,
+        target_language: str,
+        translation: str,
+        transliteration: str,
+        audio_segment: Optional[AudioSegment],
+        original_audio_segment: Optional[AudioSegment],
+        voice_metadata: Optional[Mapping[str, Mapping[str, str]]],
+        metadata: Optional[Mapping[str, Any]],
+    ) -> None:
+        store = state.checkpoint_store
+        if store is None:
+            return
+        store.record(
+            sentence_number=sentence_number,
+            sentence=sentence,
+            target_language=target_language,
+            translation=translation,
+            transliteration=transliteration,
+            audio_tracks={
+                "translation": audio_segment,
+                "orig": original_audio_segment,
+            },
+            voice_metadata=voice_metadata,
+            metadata=metadata,
+        )
+
+    def _prune_checkpoints(self, state: PipelineState, end_sentence: int) -> None:
+        """Drop checkpoints a resume can no longer start before.
+
+        Resumes restart at the block containing the last finished sentence, so
+        only sentences before the block holding the exported chunk's last
+        sentence are safe to forget.
+        """
+
+        store = state.checkpoint_store
+        if store is None:
+            return
+        store.prune_before(compute_block_start(int(end_sentence), state.checkpoint_block_size))
+
     def _ensure_translation_client(self):
         translation_client = getattr(self._config, "translation_client", None)
         if translation_client is None:
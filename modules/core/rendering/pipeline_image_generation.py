@@ -69,6 +69,7 @@ class ImageGenerationTask:
     image_path: Path
     previous_seed_future: Optional[concurrent.futures.Future]
     previous_key_sentence_number: int
+    reuse_existing: bool = False
 
 
 def generate_sentence_images(
@@ -235,7 +236,9 @@ def generate_sentence_images(
             return mean < 8.0 or mean > 247.0
 
         last_raw_bytes: Optional[bytes] = None
-        for attempt in range(max_image_retries + 1):
+        # A checkpointed image from an interrupted run only needs re-registering.
+        attempts = 0 if task.reuse_existing and task.image_path.is_file() else max_image_retries + 1
+        for attempt in range(attempts):
             seed_value = int(seed + attempt * 9973) if attempt else int(seed)
 
             def _txt2img() -> bytes:
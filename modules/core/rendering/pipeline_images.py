@@ -31,6 +31,7 @@ from .pipeline_image_prompt_plan import (
 from .pipeline_image_state import (
     _ImageGenerationState,
     _SentenceImageResult,
+    _job_relative_path,
     _resolve_job_root,
     _resolve_media_root,
 )
@@ -736,9 +737,12 @@ class ImagePipelineCoordinator:
                 continue
 
             updated_chunks: dict[str, _SentenceImageResult] = {}
+            checkpoint_store = getattr(self._state, "checkpoint_store", None)
             for item in results:
                 if self._image_state.apply(item):
                     updated_chunks[item.chunk_id] = item
+                if checkpoint_store is not None and item.relative_path:
+                    checkpoint_store.record_image(item.sentence_number, item.relative_path)
 
             if self._progress is None:
                 continue
@@ -816,6 +820,14 @@ class ImagePipelineCoordinator:
             images_dir = self._media_root / "images" / range_fragment
             image_path = images_dir / f"sentence_{batch_start_sentence_number:05d}.png"
 
+        checkpoint_store = getattr(self._state, "checkpoint_store", None)
+        reuse_existing = bool(
+            checkpoint_store is not None
+            and checkpoint_store.image_paths().get(image_key_sentence_number)
+            == _job_relative_path(image_path, base_dir=self._base_dir_path)
+            and image_path.is_file()
+        )
+
         previous_seed_future = None
         previous_key_sentence_number = batch_start_sentence_number - (
             self._image_prompt_batch_size if self._image_prompt_batch_size > 1 else 1
@@ -845,6 +857,7 @@ class ImagePipelineCoordinator:
             image_path=image_path,
             previous_seed_future=previous_seed_future,
             previous_key_sentence_number=previous_key_sentence_number,
+            reuse_existing=reuse_existing,
         )
 
         future = self._image_executor.submit(
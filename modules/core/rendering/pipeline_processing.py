@@ -7,12 +7,14 @@ import math
 import queue
 import threading
 import time
+from dataclasses import dataclass
 from functools import partial
-from typing import Any, Dict, Mapping, Optional, Sequence, List, TYPE_CHECKING
+from typing import Any, Dict, Iterable, Mapping, Optional, Sequence, List, Tuple, TYPE_CHECKING
 
 from pydub import AudioSegment
 
 from modules import audio_video_generator as av_gen
+from modules import pipeline_trace
 from modules.render.backends import PollyAudioSynthesizer
 from modules.epub_parser import remove_quotes
 from modules import text_normalization as text_norm
@@ -26,11 +28,13 @@ from modules.core.translation import (
     translate_batch,
     transliterate_sentence,
 )
+from modules.render_priority import RenderPriority
 from modules.transliteration import TransliterationService
 from modules.retry_annotations import is_failure_annotation
 from modules.text import align_token_counts
 
 from .blocks import build_written_and_sentence_blocks
+from .checkpoints import SentenceCheckpoint
 from modules.language_constants import LANGUAGE_CODES, NON_LATIN_LANGUAGES
 from .exporters import BatchExportRequest, BatchExportResult, BatchExporter
 from .pipeline_image_state import _ImageGenerationState
@@ -42,6 +46,96 @@ if TYPE_CHECKING:  # pragma: no cover - typing only
     from .pipeline import PipelineState, RenderPipeline
 
 
+def _export_with_trace(
+    exporter: Any,
+    request: BatchExportRequest,
+    progress_tracker: Optional["ProgressTracker"],
+) -> Any:
+    with pipeline_trace.trace_span(
+        progress_tracker,
+        "export",
+        sentence_number=request.end_sentence,
+        attributes={
+            "start_sentence": request.start_sentence,
+            "end_sentence": request.end_sentence,
+        },
+    ):
+        return exporter.export(request)
+
+
+@dataclass(slots=True)
+class _PreparedSentence:
+    """Rendered pieces of one sentence, ready to be committed in order."""
+
+    item: Any
+    transliteration: str
+    audio_segment: Optional[AudioSegment]
+    original_audio_segment: Optional[AudioSegment]
+    written_block: str
+    sentence_block: str
+    metadata: Dict[str, Any]
+    checkpoint_metadata: Optional[Dict[str, Any]]
+    sentence_for_prompt: str
+
+
+def _resolve_render_priority(
+    progress_tracker: Optional["ProgressTracker"],
+) -> Optional[RenderPriority]:
+    priority = getattr(progress_tracker, "render_priority", None)
+    return priority if isinstance(priority, RenderPriority) else None
+
+
+def _chunk_bounds(
+    sentence_number: int,
+    *,
+    start_sentence: int,
+    sentences_per_file: int,
+    first_flush_size: Optional[int],
+) -> Tuple[int, int]:
+    """Return the first and last sentence of the chunk holding ``sentence_number``.
+
+    Mirrors the flush rule in :func:`process_pipeline`: an optional short
+    first chunk of ``first_flush_size`` sentences, then ``sentences_per_file``.
+    """
+
+    per_file = max(1, int(sentences_per_file))
+    offset = max(0, int(sentence_number) - start_sentence)
+    first_size = per_file
+    if first_flush_size and 0 < first_flush_size < per_file:
+        first_size = int(first_flush_size)
+    if offset < first_size:
+        return start_sentence, start_sentence + first_size - 1
+    chunk_start = start_sentence + first_size + ((offset - first_size) // per_file) * per_file
+    return chunk_start, chunk_start + per_file - 1
+
+
+def _chunk_voice_metadata(
+    entries: Iterable[Optional[Mapping[str, Mapping[str, str]]]],
+) -> Dict[str, Dict[str, List[str]]]:
+    """Collect per-role voices for a chunk the way the in-order flush does."""
+
+    voices: Dict[str, Dict[str, set]] = {}
+    for metadata in entries:
+        if not metadata:
+            continue
+        for role, languages in metadata.items():
+            if not isinstance(languages, Mapping):
+                continue
+            for language, voice in languages.items():
+                normalized_voice = (voice or "").strip()
+                if not normalized_voice:
+                    continue
+                normalized_language = (language or "Unknown").strip() or "Unknown"
+                voices.setdefault(role, {}).setdefault(normalized_language, set()).add(
+                    normalized_voice
+                )
+    return {
+        role: {language: sorted(names) for language, names in languages.items() if names}
+        for role, languages in voices.items()
+        if languages
+    }
+
+
 def _resolve_first_flush_size(
     sentences_per_file: int, translation_batch_size: Optional[int]
 ) -> Optional[int]:
@@ -114,6 +208,72 @@ def _initialize_media_batch_progress(
 
 
 
+def _resolve_replay(
+    self,
+    state: "PipelineState",
+    start_sentence: int,
+    sentences: Sequence[str],
+) -> List[Tuple[SentenceCheckpoint, Dict[str, AudioSegment]]]:
+    """Return checkpointed sentences (with their audio) to replay from ``start_sentence``."""
+
+    store = state.checkpoint_store
+    if store is None:
+        return []
+    replay: List[Tuple[SentenceCheckpoint, Dict[str, AudioSegment]]] = []
+    for checkpoint in store.replayable_prefix(start_sentence, sentences):
+        try:
+            tracks = store.load_audio(checkpoint)
+        except Exception:
+            logger.warning(
+                "Unable to load checkpointed audio for sentence %s; resuming work there.",
+                checkpoint.sentence_number,
+                exc_info=True,
+            )
+            break
+        replay.append((checkpoint, tracks))
+    if replay:
+        console_info(
+            "Replaying %s checkpointed sentence(s) from #%s; resuming work at #%s",
+            len(replay),
+            start_sentence,
+            start_sentence + len(replay),
+            logger_obj=logger,
+        )
+        if self._progress is not None:
+            self._progress.publish_progress(
+                {
+                    "stage": "checkpoint_replay",
+                    "replayed_sentences": len(replay),
+                    "resume_sentence": start_sentence + len(replay),
+                }
+            )
+    return replay
+
+
+def _checkpoint_media_result(
+    index: int,
+    checkpoint: SentenceCheckpoint,
+    tracks: Mapping[str, AudioSegment],
+    *,
+    sentence: str,
+    factory,
+) -> Any:
+    """Rebuild a media worker result from a sentence checkpoint."""
+
+    return factory(
+        index=index,
+        sentence_number=checkpoint.sentence_number,
+        sentence=sentence,
+        target_language=checkpoint.target_language,
+        translation=checkpoint.translation,
+        transliteration=checkpoint.transliteration,
+        audio_segment=tracks.get("translation"),
+        audio_tracks=dict(tracks),
+        voice_metadata=dict(checkpoint.voice_metadata),
+        metadata=dict(checkpoint.metadata),
+    )
+
+
 def process_sequential(
     self,
     *,
@@ -142,6 +302,7 @@ def process_sequential(
 ) -> None:
     batch_size = worker_count
     processed = 0
+    replay = _resolve_replay(self, state, start_sentence, sentences)
     first_flush_size = _resolve_first_flush_size(
         sentences_per_file, translation_batch_size
     )
@@ -159,7 +320,13 @@ def process_sequential(
                 logger_obj=logger,
             )
             break
-        batch_sentences = sentences[processed : processed + batch_size]
+        replaying = processed < len(replay)
+        batch_end = (
+            min(processed + batch_size, len(replay))
+            if replaying
+            else processed + batch_size
+        )
+        batch_sentences = sentences[processed:batch_end]
         batch_sentence_numbers = [
             start_sentence + processed + idx for idx in range(len(batch_sentences))
         ]
@@ -171,28 +338,34 @@ def process_sequential(
             if target_languages
             else ["" for _ in batch_sentence_numbers]
         )
-        translations = translate_batch(
-            batch_sentences,
-            input_language,
-            batch_targets,
-            include_transliteration=include_transliteration,
-            transliteration_mode=transliteration_mode,
-            transliteration_client=transliteration_client,
-            transliterator=self._transliterator,
-            translation_provider=translation_provider,
-            llm_batch_size=translation_batch_size,
-            client=translation_client,
-            worker_pool=worker_pool,
-            max_workers=worker_count,
-            progress_tracker=self._progress,
-            sentence_numbers=batch_sentence_numbers,
-        )
+        if replaying:
+            translations = [
+                checkpoint.translation for checkpoint, _ in replay[processed:batch_end]
+            ]
+        else:
+            translations = translate_batch(
+                batch_sentences,
+                input_language,
+                batch_targets,
+                include_transliteration=include_transliteration,
+                transliteration_mode=transliteration_mode,
+                transliteration_client=transliteration_client,
+                transliterator=self._transliterator,
+                translation_provider=translation_provider,
+                llm_batch_size=translation_batch_size,
+                client=translation_client,
+                worker_pool=worker_pool,
+                max_workers=worker_count,
+                progress_tracker=self._progress,
+                sentence_numbers=batch_sentence_numbers,
+            )
 
         for sentence_number, sentence, current_target, translation_result in zip(
             batch_sentence_numbers, batch_sentences, batch_targets, translations
         ):
             if self._should_stop():
                 break
+            checkpoint, replayed_tracks = replay[processed] if replaying else (None, {})
             fluent_candidate = text_norm.collapse_whitespace(
                 remove_quotes(translation_result or "")
             )
@@ -213,7 +386,9 @@ def process_sequential(
                 and not translation_failed
             )
             transliteration_result = inline_transliteration
-            if should_transliterate:
+            if checkpoint is not None:
+                transliteration_result = checkpoint.transliteration
+            elif should_transliterate:
                 candidate = text_norm.collapse_whitespace(
                     remove_quotes(inline_transliteration or "").strip()
                 )
@@ -231,7 +406,7 @@ def process_sequential(
                 if candidate:
                     transliteration_result = candidate
             # Apply token alignment for CJK languages
-            if fluent and transliteration_result:
+            if fluent and transliteration_result and checkpoint is None:
                 _, aligned_translit, _ = align_token_counts(
                     fluent, transliteration_result, current_target
                 )
@@ -239,7 +414,12 @@ def process_sequential(
             audio_segment: Optional[AudioSegment] = None
             original_audio_segment: Optional[AudioSegment] = None
             voice_metadata: Optional[Mapping[str, Mapping[str, str]]] = None
-            if generate_audio:
+            if checkpoint is not None:
+                if generate_audio:
+                    audio_segment = replayed_tracks.get("translation")
+                    original_audio_segment = replayed_tracks.get("orig")
+                voice_metadata = checkpoint.voice_metadata
+            elif generate_audio:
                 audio_result = self._maybe_generate_audio(
                     sentence_number=sentence_number,
                     sentence=sentence,
@@ -285,6 +465,19 @@ def process_sequential(
                 first_flush_size=first_flush_size,
                 first_batch_start=start_sentence,
             )
+            if checkpoint is None:
+                self._record_checkpoint(
+                    state,
+                    sentence_number=sentence_number,
+                    sentence=sentence,
+                    target_language=current_target,
+                    translation=translation_result or "",
+                    transliteration=transliteration_result,
+                    audio_segment=audio_segment,
+                    original_audio_segment=original_audio_segment,
+                    voice_metadata=voice_metadata,
+                    metadata=(state.all_sentence_metadata or [{}])[-1],
+                )
             processed += 1
 
 
@@ -321,7 +514,8 @@ def process_pipeline(
     media_orchestrator_cls,
 ) -> None:
     pipeline_stop_event = self._stop_event or threading.Event()
-    translation_queue = create_translation_queue(self._config.queue_size)
+    render_priority = _resolve_render_priority(self._progress)
+    translation_queue = create_translation_queue(self._config.queue_size, render_priority)
     finalize_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
     audio_synthesizer = PollyAudioSynthesizer(
         base_url=self._config.audio_api_base_url,
@@ -372,6 +566,15 @@ def process_pipeline(
     first_flush_size = _resolve_first_flush_size(
         sentences_per_file, translation_batch_size
     )
+    final_sentence = start_sentence + total_refined - 1
+    chunk_bounds = partial(
+        _chunk_bounds,
+        start_sentence=start_sentence,
+        sentences_per_file=sentences_per_file,
+        first_flush_size=first_flush_size,
+    )
+    if render_priority is not None:
+        render_priority.set_region_resolver(lambda number: chunk_bounds(number)[0])
     _initialize_media_batch_progress(
         state=state,
         total_refined=total_refined,
@@ -385,11 +588,13 @@ def process_pipeline(
         total_refined,
         start_sentence=start_sentence,
     )
+    replay = _resolve_replay(self, state, start_sentence, sentences)
+    resume_offset = len(replay)
     translation_thread = start_translation_pipeline(
-        sentences,
+        sentences[resume_offset:],
         input_language,
-        target_sequence,
-        start_sentence=start_sentence,
+        target_sequence[resume_offset:],
+        start_sentence=start_sentence + resume_offset,
         output_queue=translation_queue,
         consumer_count=len(media_threads) or 1,
         stop_event=pipeline_stop_event,
@@ -403,89 +608,274 @@ def process_pipeline(
         transliteration_client=transliteration_client,
         include_transliteration=include_transliteration,
         llm_batch_size=translation_batch_size,
+        render_priority=render_priority,
     )
 
-    buffered_results = {}
+    buffered_results = {
+        index: _checkpoint_media_result(
+            index,
+            checkpoint,
+            tracks,
+            sentence=sentences[index],
+            factory=av_gen.MediaPipelineResult,
+        )
+        for index, (checkpoint, tracks) in enumerate(replay)
+    }
     next_index = 0
     export_futures: List[concurrent.futures.Future] = []
+    # Chunks exported ahead of the in-order cursor because the playhead is
+    # there: chunk start sentence -> end sentence, plus their prepared items.
+    early_chunks: Dict[int, int] = {}
+    early_futures: set = set()
+    prepared_results: Dict[int, _PreparedSentence] = {}
     cancelled = False
+
+    def _prepare(item: Any, replayed: bool) -> _PreparedSentence:
+        fluent_candidate = text_norm.collapse_whitespace(
+            remove_quotes(item.translation or "")
+        )
+        translation_failed = is_failure_annotation(fluent_candidate)
+        fluent, inline_transliteration = split_translation_and_transliteration(
+            fluent_candidate
+        )
+        fluent = text_norm.collapse_whitespace(fluent.strip())
+        inline_transliteration = text_norm.collapse_whitespace(
+            remove_quotes(inline_transliteration or "").strip()
+        )
+        if inline_transliteration and not text_norm.is_latin_heavy(inline_transliteration):
+            inline_transliteration = ""
+        should_transliterate = (
+            include_transliteration
+            and item.target_language in NON_LATIN_LANGUAGES
+            and not translation_failed
+        )
+        transliteration_result = inline_transliteration
+        if replayed:
+            transliteration_result = item.transliteration
+        elif should_transliterate:
+            candidate = text_norm.collapse_whitespace(
+                remove_quotes(
+                    (item.transliteration or inline_transliteration or "")
+                ).strip()
+            )
+            if candidate and not text_norm.is_latin_heavy(candidate):
+                candidate = ""
+            if not candidate:
+                with pipeline_trace.trace_span(
+                    self._progress,
+                    "transliterate",
+                    sentence_number=item.sentence_number,
+                ):
+                    candidate = transliterate_sentence(
+                        fluent,
+                        item.target_language,
+                        client=transliteration_client,
+                        transliterator=self._transliterator,
+                        transliteration_mode=transliteration_mode,
+                    )
+                candidate = text_norm.collapse_whitespace(
+                    remove_quotes(candidate or "").strip()
+                )
+            if candidate:
+                transliteration_result = candidate
+        # Apply token alignment for CJK languages
+        if fluent and transliteration_result and not replayed:
+            _, aligned_translit, _ = align_token_counts(
+                fluent, transliteration_result, item.target_language
+            )
+            transliteration_result = aligned_translit
+        audio_segment = None
+        original_audio_segment: Optional[AudioSegment] = None
+        if generate_audio:
+            raw_tracks = getattr(item, "audio_tracks", None)
+            if isinstance(raw_tracks, Mapping):
+                translation_track = raw_tracks.get("translation") or raw_tracks.get("trans")
+                original_track = raw_tracks.get("orig") or raw_tracks.get("original")
+                if isinstance(translation_track, AudioSegment):
+                    audio_segment = translation_track
+                if isinstance(original_track, AudioSegment):
+                    original_audio_segment = original_track
+            else:
+                audio_segment = item.audio_segment
+        written_block, sentence_block = build_written_and_sentence_blocks(
+            sentence_number=item.sentence_number,
+            sentence=item.sentence,
+            fluent=fluent,
+            transliteration=transliteration_result,
+            current_target=item.target_language,
+            written_mode=written_mode,
+            total_sentences=total_fully,
+            include_transliteration=(
+                should_transliterate and bool(transliteration_result)
+            ),
+        )
+
+        raw_metadata = getattr(item, "metadata", None)
+        metadata_payload: Dict[str, Any]
+        if isinstance(raw_metadata, Mapping):
+            metadata_payload = dict(raw_metadata)
+        else:
+            metadata_payload = {}
+        checkpoint_metadata = None if replayed else dict(metadata_payload)
+        metadata_payload.setdefault("sentence_number", item.sentence_number)
+        metadata_payload.setdefault("id", str(item.sentence_number))
+        metadata_payload.setdefault("t0", 0.0)
+
+        duration_val = None
+        if "t1" in metadata_payload:
+            try:
+                duration_val = float(metadata_payload["t1"])
+            except (TypeError, ValueError):
+                duration_val = None
+        if duration_val is None and audio_segment is not None:
+            try:
+                duration_val = float(audio_segment.duration_seconds)
+            except Exception:
+                duration_val = None
+        if duration_val is None:
+            tokens = metadata_payload.get("word_tokens")
+            if isinstance(tokens, Sequence) and tokens:
+                last_token = tokens[-1]
+                try:
+                    duration_val = float(last_token.get("end", 0.0))
+                except (TypeError, ValueError, AttributeError):
+                    duration_val = None
+        metadata_payload["t1"] = round(max(duration_val or 0.0, 0.0), 6)
+
+        if audio_segment is not None and metadata_payload.get("word_tokens"):
+            try:
+                setattr(audio_segment, "word_tokens", metadata_payload["word_tokens"])
+            except Exception:
+                pass
+
+        image_pipeline.decorate_metadata(
+            metadata_payload,
+            sentence_number=int(item.sentence_number),
+        )
+        sentence_for_prompt = (
+            fluent
+            if (isinstance(fluent, str) and fluent.strip() and not translation_failed)
+            else item.sentence
+        )
+        return _PreparedSentence(
+            item=item,
+            transliteration=transliteration_result,
+            audio_segment=audio_segment,
+            original_audio_segment=original_audio_segment,
+            written_block=written_block,
+            sentence_block=sentence_block,
+            metadata=metadata_payload,
+            checkpoint_metadata=checkpoint_metadata,
+            sentence_for_prompt=str(sentence_for_prompt or "").strip(),
+        )
+
+    def _submit_export(request: BatchExportRequest, *, early: bool) -> None:
+        future = finalize_executor.submit(
+            _export_with_trace, exporter, request, self._progress
+        )
+        export_futures.append(future)
+        if early:
+            early_futures.add(future)
+        future.add_done_callback(
+            partial(
+                self._handle_export_future_completion,
+                state,
+                prune_checkpoints=not early,
+            )
+        )
+
+    def _export_prioritized_chunk(index: int) -> None:
+        """Export the chunk holding ``index`` early when it is complete and watched."""
+
+        chunk_start, chunk_end = chunk_bounds(start_sentence + index)
+        first_index = chunk_start - start_sentence
+        if (
+            chunk_end > final_sentence
+            or chunk_start in early_chunks
+            or first_index <= next_index
+            or not render_priority.prioritizes(chunk_end)
+        ):
+            return
+        indices = range(first_index, chunk_end - start_sentence + 1)
+        if any(position not in buffered_results for position in indices):
+            return
+        prepared = [_prepare(buffered_results[position], False) for position in indices]
+        prepared_results.update(zip(indices, prepared))
+        early_chunks[chunk_start] = chunk_end
+        translation_segments = [
+            entry.audio_segment for entry in prepared if entry.audio_segment is not None
+        ]
+        original_segments = [
+            entry.original_audio_segment
+            for entry in prepared
+            if entry.original_audio_segment is not None
+        ]
+        audio_tracks: Dict[str, List[AudioSegment]] = {}
+        if original_segments:
+            audio_tracks["orig"] = original_segments
+        if translation_segments:
+            audio_tracks["translation"] = translation_segments
+        _submit_export(
+            BatchExportRequest(
+                start_sentence=chunk_start,
+                end_sentence=chunk_end,
+                written_blocks=[entry.written_block for entry in prepared],
+                target_language=prepared[-1].item.target_language or state.last_target_language,
+                output_html=output_html,
+                output_pdf=output_pdf,
+                generate_audio=generate_audio,
+                audio_segments=list(translation_segments),
+                sentence_blocks=[entry.sentence_block for entry in prepared],
+                audio_tracks=audio_tracks,
+                voice_metadata=_chunk_voice_metadata(
+                    getattr(entry.item, "voice_metadata", None) for entry in prepared
+                ),
+                sentence_metadata=[entry.metadata for entry in prepared],
+            ),
+            early=True,
+        )
+
     try:
         while state.processed < total_refined:
             image_pipeline.tick()
             if pipeline_stop_event.is_set() and not buffered_results:
                 cancelled = state.processed < total_refined
                 break
-            try:
-                media_item = media_queue.get(timeout=0.1)
-            except queue.Empty:
-                if pipeline_stop_event.is_set():
-                    cancelled = state.processed < total_refined
-                    break
-                continue
-            if media_item is None:
-                continue
-            buffered_results[media_item.index] = media_item
-            while next_index in buffered_results:
-                item = buffered_results.pop(next_index)
-                fluent_candidate = text_norm.collapse_whitespace(
-                    remove_quotes(item.translation or "")
+            if next_index not in buffered_results:
+                try:
+                    media_item = media_queue.get(timeout=0.1)
+                except queue.Empty:
+                    if pipeline_stop_event.is_set():
+                        cancelled = state.processed < total_refined
+                        break
+                    continue
+                if media_item is None:
+                    continue
+                pipeline_trace.mark_dequeued(
+                    self._progress,
+                    "media",
+                    media_item.sentence_number,
+                    sentence_number=media_item.sentence_number,
                 )
-                translation_failed = is_failure_annotation(fluent_candidate)
-                fluent, inline_transliteration = split_translation_and_transliteration(
-                    fluent_candidate
-                )
-                fluent = text_norm.collapse_whitespace(fluent.strip())
-                inline_transliteration = text_norm.collapse_whitespace(
-                    remove_quotes(inline_transliteration or "").strip()
+                pipeline_trace.mark_enqueued(
+                    self._progress, "reorder", media_item.sentence_number
                 )
-                if inline_transliteration and not text_norm.is_latin_heavy(inline_transliteration):
-                    inline_transliteration = ""
-                should_transliterate = (
-                    include_transliteration
-                    and item.target_language in NON_LATIN_LANGUAGES
-                    and not translation_failed
+                buffered_results[media_item.index + resume_offset] = media_item
+                if render_priority is not None and not pipeline_stop_event.is_set():
+                    _export_prioritized_chunk(media_item.index + resume_offset)
+            while next_index in buffered_results:
+                replayed = next_index < resume_offset
+                item = buffered_results.pop(next_index)
+                pipeline_trace.mark_dequeued(
+                    self._progress,
+                    "reorder",
+                    item.sentence_number,
+                    sentence_number=item.sentence_number,
                 )
-                transliteration_result = inline_transliteration
-                if should_transliterate:
-                    candidate = text_norm.collapse_whitespace(
-                        remove_quotes(
-                            (item.transliteration or inline_transliteration or "")
-                        ).strip()
-                    )
-                    if candidate and not text_norm.is_latin_heavy(candidate):
-                        candidate = ""
-                    if not candidate:
-                        candidate = transliterate_sentence(
-                            fluent,
-                            item.target_language,
-                            client=transliteration_client,
-                            transliterator=self._transliterator,
-                            transliteration_mode=transliteration_mode,
-                        )
-                        candidate = text_norm.collapse_whitespace(
-                            remove_quotes(candidate or "").strip()
-                        )
-                    if candidate:
-                        transliteration_result = candidate
-                # Apply token alignment for CJK languages
-                if fluent and transliteration_result:
-                    _, aligned_translit, _ = align_token_counts(
-                        fluent, transliteration_result, item.target_language
-                    )
-                    transliteration_result = aligned_translit
-                audio_segment = None
-                original_audio_segment: Optional[AudioSegment] = None
+                prepared = prepared_results.pop(next_index, None) or _prepare(item, replayed)
+                audio_segment = prepared.audio_segment
+                original_audio_segment = prepared.original_audio_segment
                 if generate_audio:
-                    raw_tracks = getattr(item, "audio_tracks", None)
-                    if isinstance(raw_tracks, Mapping):
-                        translation_track = raw_tracks.get("translation") or raw_tracks.get("trans")
-                        original_track = raw_tracks.get("orig") or raw_tracks.get("original")
-                        if isinstance(translation_track, AudioSegment):
-                            audio_segment = translation_track
-                        if isinstance(original_track, AudioSegment):
-                            original_audio_segment = original_track
-                    else:
-                        audio_segment = item.audio_segment
                     if audio_segment is not None:
                         if state.current_audio_segments is not None:
                             state.current_audio_segments.append(audio_segment)
@@ -497,77 +887,32 @@ def process_pipeline(
                         if state.all_original_segments is not None:
                             state.all_original_segments.append(original_audio_segment)
                 self._update_voice_metadata(state, getattr(item, "voice_metadata", None))
-                written_block, sentence_block = build_written_and_sentence_blocks(
-                    sentence_number=item.sentence_number,
-                    sentence=item.sentence,
-                    fluent=fluent,
-                    transliteration=transliteration_result,
-                    current_target=item.target_language,
-                    written_mode=written_mode,
-                    total_sentences=total_fully,
-                    include_transliteration=(
-                        should_transliterate and bool(transliteration_result)
-                    ),
-                )
-                state.written_blocks.append(written_block)
-                state.sentence_blocks.append(sentence_block)
-
-                raw_metadata = getattr(item, "metadata", None)
-                metadata_payload: Dict[str, Any]
-                if isinstance(raw_metadata, Mapping):
-                    metadata_payload = dict(raw_metadata)
-                else:
-                    metadata_payload = {}
-                metadata_payload.setdefault("sentence_number", item.sentence_number)
-                metadata_payload.setdefault("id", str(item.sentence_number))
-                metadata_payload.setdefault("t0", 0.0)
-
-                duration_val = None
-                if "t1" in metadata_payload:
-                    try:
-                        duration_val = float(metadata_payload["t1"])
-                    except (TypeError, ValueError):
-                        duration_val = None
-                if duration_val is None and audio_segment is not None:
-                    try:
-                        duration_val = float(audio_segment.duration_seconds)
-                    except Exception:
-                        duration_val = None
-                if duration_val is None:
-                    tokens = metadata_payload.get("word_tokens")
-                    if isinstance(tokens, Sequence) and tokens:
-                        last_token = tokens[-1]
-                        try:
-                            duration_val = float(last_token.get("end", 0.0))
-                        except (TypeError, ValueError, AttributeError):
-                            duration_val = None
-                metadata_payload["t1"] = round(max(duration_val or 0.0, 0.0), 6)
-
-                if audio_segment is not None and metadata_payload.get("word_tokens"):
-                    try:
-                        setattr(audio_segment, "word_tokens", metadata_payload["word_tokens"])
-                    except Exception:
-                        pass
+                state.written_blocks.append(prepared.written_block)
+                state.sentence_blocks.append(prepared.sentence_block)
+
+                metadata_payload = prepared.metadata
+                if prepared.checkpoint_metadata is not None:
+                    self._record_checkpoint(
+                        state,
+                        sentence_number=int(item.sentence_number),
+                        sentence=item.sentence,
+                        target_language=item.target_language,
+                        translation=item.translation or "",
+                        transliteration=prepared.transliteration,
+                        audio_segment=audio_segment,
+                        original_audio_segment=original_audio_segment,
+                        voice_metadata=getattr(item, "voice_metadata", None),
+                        metadata=prepared.checkpoint_metadata,
+                    )
 
                 sentence_number = int(item.sentence_number)
-                image_pipeline.decorate_metadata(
-                    metadata_payload,
-                    sentence_number=sentence_number,
-                )
-
                 state.current_sentence_metadata.append(metadata_payload)
                 if state.all_sentence_metadata is not None:
                     state.all_sentence_metadata.append(metadata_payload)
 
-                sentence_for_prompt = (
-                    fluent
-                    if (isinstance(fluent, str) and fluent.strip() and not translation_failed)
-                    else item.sentence
-                )
-
                 image_pipeline.handle_sentence(
                     sentence_number=sentence_number,
-                    sentence_for_prompt=str(sentence_for_prompt or "").strip(),
+                    sentence_for_prompt=prepared.sentence_for_prompt,
                     sentence_text=str(item.sentence or "").strip(),
                 )
 
@@ -584,30 +929,33 @@ def process_pipeline(
                 ):
                     should_flush = True
                 if should_flush:
-                    audio_tracks: Dict[str, List[AudioSegment]] = {}
-                    if state.current_original_segments:
-                        audio_tracks["orig"] = list(state.current_original_segments)
-                    if state.current_audio_segments:
-                        audio_tracks["translation"] = list(state.current_audio_segments)
-                    request = BatchExportRequest(
-                        start_sentence=state.current_batch_start,
-                        end_sentence=item.sentence_number,
-                        written_blocks=list(state.written_blocks),
-                        target_language=item.target_language or state.last_target_language,
-                        output_html=output_html,
-                        output_pdf=output_pdf,
-                        generate_audio=generate_audio,
-                        audio_segments=list(state.current_audio_segments or []),
-                        sentence_blocks=list(state.sentence_blocks),
-                        audio_tracks=audio_tracks,
-                        voice_metadata=self._drain_current_voice_metadata(state),
-                        sentence_metadata=list(state.current_sentence_metadata),
-                    )
-                    future = finalize_executor.submit(exporter.export, request)
-                    export_futures.append(future)
-                    future.add_done_callback(
-                        partial(self._handle_export_future_completion, state)
-                    )
+                    early_end = early_chunks.pop(state.current_batch_start, None)
+                    if early_end is not None:
+                        # Exported ahead of the playhead already; its sentences
+                        # are checkpointed now, so resumes may skip them.
+                        self._drain_current_voice_metadata(state)
+                        self._prune_checkpoints(state, early_end)
+                    else:
+                        audio_tracks: Dict[str, List[AudioSegment]] = {}
+                        if state.current_original_segments:
+                            audio_tracks["orig"] = list(state.current_original_segments)
+                        if state.current_audio_segments:
+                            audio_tracks["translation"] = list(state.current_audio_segments)
+                        request = BatchExportRequest(
+                            start_sentence=state.current_batch_start,
+                            end_sentence=item.sentence_number,
+                            written_blocks=list(state.written_blocks),
+                            target_language=item.target_language or state.last_target_language,
+                            output_html=output_html,
+                            output_pdf=output_pdf,
+                            generate_audio=generate_audio,
+                            audio_segments=list(state.current_audio_segments or []),
+                            sentence_blocks=list(state.sentence_blocks),
+                            audio_tracks=audio_tracks,
+                            voice_metadata=self._drain_current_voice_metadata(state),
+                            sentence_metadata=list(state.current_sentence_metadata),
+                        )
+                        _submit_export(request, early=False)
                     state.written_blocks.clear()
                     state.sentence_blocks.clear()
                     if state.current_audio_segments is not None:
@@ -651,5 +999,11 @@ def process_pipeline(
                 logger.error("Failed to finalize batch export: %s", exc)
             else:
                 if not getattr(future, "_pipeline_result_recorded", False):
-                    self._register_export_result(state, export_result)
+                    self._register_export_result(
+                        state,
+                        export_result,
+                        prune_checkpoints=future not in early_futures,
+                    )
+        if render_priority is not None:
+            render_priority.set_region_resolver(None)
         image_pipeline.shutdown(cancelled=cancelled)
@@ -9,6 +9,7 @@ from dataclasses import dataclass
 from statistics import fmean
 from typing import Any, Mapping, Sequence, List, Optional
 
+from modules.core.rendering import timeline_engine
 from modules.text import split_highlight_tokens
 
 
@@ -84,6 +85,11 @@ def smooth_token_boundaries(
         factor = 0.35
     factor = max(0.0, min(1.0, factor))
 
+    if timeline_engine.vectorize(len(tokens)):
+        vectorized = _smooth_token_boundaries_vectorized(tokens, factor)
+        if vectorized is not None:
+            return vectorized
+
     smoothed: list[dict[str, float | str]] = []
     for index, token in enumerate(tokens):
         if not isinstance(token, Mapping):
@@ -145,6 +151,27 @@ def smooth_token_boundaries(
     return smoothed
 
 
+def _smooth_token_boundaries_vectorized(
+    tokens: Sequence[Mapping[str, Any]], factor: float
+) -> list[dict[str, float | str]] | None:
+    columns = timeline_engine.token_columns(tokens)
+    if columns is None:
+        return None
+    starts, ends, _ = columns
+    smoothed = timeline_engine.smooth_boundaries(starts, ends, factor)
+    if smoothed is None:
+        return None
+    start_values, end_values = smoothed
+    return [
+        {
+            "text": token.get("text") if token.get("text") is not None else "",
+            "start": start,
+            "end": end,
+        }
+        for token, start, end in zip(tokens, start_values.tolist(), end_values.tolist())
+    ]
+
+
 def build_word_events(meta: Mapping[str, Any] | None) -> list[dict[str, float | str]]:
     """
     Build token timeline events from ``meta["word_tokens"]``.
@@ -512,6 +539,17 @@ def _clamp_track_tokens(
     if total_duration <= 0 or not tokens:
         return []
 
+    if timeline_engine.vectorize(len(tokens)):
+        columns = timeline_engine.token_columns(tokens)
+        if columns is not None:
+            keep, starts, ends = timeline_engine.clamp_track(
+                columns[0], columns[1], total_duration, _TIMING_PRECISION
+            )
+            return [
+                {**token, "start": start, "end": end}
+                for token, start, end in zip(tokens[:keep], starts.tolist(), ends.tolist())
+            ]
+
     clamped: list[dict[str, Any]] = []
     cursor = 0.0
     for token in tokens:
@@ -658,12 +696,12 @@ def build_dual_track_timings(
     mix_track = _clamp_track_tokens(mix_tokens, max(mix_duration, 0.0))
     translation_track = _clamp_track_tokens(translation_tokens, max(translation_duration, 0.0))
 
+    mix_by_sentence = _group_by_sentence(mix_track)
+    translation_by_sentence = _group_by_sentence(translation_track)
     for spec in sentences:
         sentence_idx = spec.sentence_idx
-        mix_subset = [token for token in mix_track if token.get("sentenceIdx") == sentence_idx]
-        translation_subset = [
-            token for token in translation_track if token.get("sentenceIdx") == sentence_idx
-        ]
+        mix_subset = mix_by_sentence.get(sentence_idx, [])
+        translation_subset = translation_by_sentence.get(sentence_idx, [])
         mix_metrics = validate_timing_monotonic(
             mix_subset,
             start_gate=spec.mix_start_gate,
@@ -691,6 +729,163 @@ def build_dual_track_timings(
     }
 
 
+def _group_by_sentence(tokens: Sequence[dict[str, Any]]) -> dict[Any, list[dict[str, Any]]]:
+    """Bucket ``tokens`` by ``sentenceIdx`` in one pass, preserving order."""
+
+    grouped: dict[Any, list[dict[str, Any]]] = {}
+    for token in tokens:
+        grouped.setdefault(token.get("sentenceIdx"), []).append(token)
+    return grouped
+
+
+def _clamped_pause_ms(value: Any) -> int:
+    try:
+        pause_ms = int(round(float(value)))
+    except (TypeError, ValueError):
+        pause_ms = 0
+    return pause_ms if pause_ms > 0 else 0
+
+
+def _prepare_separate_spec(spec: SentenceTimingSpec) -> tuple[int, int, int, int]:
+    """Normalise policy labels on ``spec`` and return its clamped pauses.
+
+    Returns ``(pause_before_ms, pause_after_ms, original_pause_before_ms,
+    original_pause_after_ms)``.
+    """
+
+    translation_policy = spec.policy.strip() if isinstance(spec.policy, str) else None
+    translation_source = spec.source.strip() if isinstance(spec.source, str) else None
+    original_policy = (
+        spec.original_policy.strip() if isinstance(spec.original_policy, str) else None
+    )
+    original_source = (
+        spec.original_source.strip() if isinstance(spec.original_source, str) else None
+    )
+    if translation_policy:
+        spec.policy = translation_policy
+    if translation_source:
+        spec.source = translation_source
+    if original_policy:
+        spec.original_policy = original_policy
+    if original_source:
+        spec.original_source = original_source
+    return (
+        _clamped_pause_ms(spec.pause_before_ms),
+        _clamped_pause_ms(spec.pause_after_ms),
+        _clamped_pause_ms(spec.original_pause_before_ms),
+        _clamped_pause_ms(spec.original_pause_after_ms),
+    )
+
+
+def _separate_fallback_tokens(
+    spec: SentenceTimingSpec,
+    *,
+    original: bool,
+    target: float,
+    pause_before_ms: int,
+    pause_after_ms: int,
+) -> list[dict[str, Any]]:
+    """Return char-weighted tokens for a track without word timings and record the policy."""
+
+    if original:
+        fallback_words = _resolve_word_list(spec.original_words, spec.original_text)
+    else:
+        fallback_words = _resolve_word_list(spec.translation_words, spec.translation_text)
+    tokens = _char_weighted_tokens(
+        fallback_words,
+        target,
+        pause_before_ms=pause_before_ms,
+        pause_after_ms=pause_after_ms,
+    )
+    if original:
+        policy = spec.original_policy.strip() if isinstance(spec.original_policy, str) else None
+        source = spec.original_source.strip() if isinstance(spec.original_source, str) else None
+        spec.original_policy = policy or "char_weighted"
+        spec.original_source = source or "char_weighted_refined"
+    else:
+        spec.policy = "char_weighted"
+        spec.source = "char_weighted_refined"
+    return tokens
+
+
+def _build_separate_tracks_vectorized(
+    sentences: Sequence[SentenceTimingSpec],
+    *,
+    output_indices: Sequence[int],
+    original_offsets: Sequence[float],
+    translation_offsets: Sequence[float],
+    original_duration: float,
+    translation_duration: float,
+) -> dict[str, list[dict[str, Any]]] | None:
+    """Chunk-wide array form of :func:`build_separate_track_timings`.
+
+    Sentence sources are collected once, fitted and clamped as arrays, and
+    only the surviving tokens are turned into dicts.  Returns ``None`` when a
+    source boundary cannot be modelled exactly by the engine.
+    """
+
+    segments: dict[str, list[tuple[list[tuple[float, float]], bool]]] = {
+        "translation": [],
+        "original": [],
+    }
+    targets: dict[str, list[float]] = {"translation": [], "original": []}
+    for spec in sentences:
+        pauses = _prepare_separate_spec(spec)
+        for track, word_tokens, duration, pause_pair in (
+            ("translation", spec.word_tokens, spec.translation_duration, pauses[:2]),
+            ("original", spec.original_word_tokens, spec.original_duration, pauses[2:]),
+        ):
+            target = max(duration, 0.0)
+            rows = timeline_engine.timing_rows(word_tokens or [])
+            if rows is None:
+                return None
+            fit = True
+            if not rows and target > 0:
+                rows = timeline_engine.fixed_rows(
+                    _separate_fallback_tokens(
+                        spec,
+                        original=track == "original",
+                        target=target,
+                        pause_before_ms=pause_pair[0],
+                        pause_after_ms=pause_pair[1],
+                    )
+                )
+                if rows is None:
+                    return None
+                fit = False
+            segments[track].append((rows, fit))
+            targets[track].append(target)
+
+    result: dict[str, list[dict[str, Any]]] = {}
+    for track, lane, offsets, duration in (
+        ("original", "orig", original_offsets, original_duration),
+        ("translation", "trans", translation_offsets, translation_duration),
+    ):
+        placed = timeline_engine.layout_track(
+            segments[track],
+            offsets,
+            targets[track],
+            max(duration, 0.0),
+            _TIMING_PRECISION,
+        )
+        result[track] = [
+            {
+                "lane": lane,
+                "sentenceIdx": output_indices[segment],
+                "wordIdx": word_idx,
+                "start": start,
+                "end": end,
+            }
+            for segment, word_idx, start, end in zip(
+                placed["sentence"].tolist(),
+                placed["word"].tolist(),
+                placed["start"].tolist(),
+                placed["end"].tolist(),
+            )
+        ]
+    return result
+
+
 def build_separate_track_timings(
     sentences: Sequence[SentenceTimingSpec],
     *,
@@ -736,84 +931,64 @@ def build_separate_track_timings(
         original_cursor += original_span
         translation_cursor += translation_span
 
+    token_estimate = sum(
+        len(spec.word_tokens or ()) + len(spec.original_word_tokens or ()) for spec in sentences
+    )
+    if timeline_engine.vectorize(token_estimate):
+        vectorized = _build_separate_tracks_vectorized(
+            sentences,
+            output_indices=[
+                global_to_local.get(spec.sentence_idx, spec.sentence_idx)
+                if use_local_indices
+                else spec.sentence_idx
+                for spec in sentences
+            ],
+            original_offsets=[
+                sentence_original_offsets.get(spec.sentence_idx, 0.0) for spec in sentences
+            ],
+            translation_offsets=[
+                sentence_translation_offsets.get(spec.sentence_idx, 0.0) for spec in sentences
+            ],
+            original_duration=original_duration,
+            translation_duration=translation_duration,
+        )
+        if vectorized is not None:
+            return vectorized
+
     for spec in sentences:
         translation_target = max(spec.translation_duration, 0.0)
         original_target = max(spec.original_duration, 0.0)
 
-        translation_policy = spec.policy.strip() if isinstance(spec.policy, str) else None
-        translation_source = spec.source.strip() if isinstance(spec.source, str) else None
-        original_policy = (
-            spec.original_policy.strip() if isinstance(spec.original_policy, str) else None
-        )
-        original_source = (
-            spec.original_source.strip() if isinstance(spec.original_source, str) else None
-        )
-        if translation_policy:
-            spec.policy = translation_policy
-        if translation_source:
-            spec.source = translation_source
-        if original_policy:
-            spec.original_policy = original_policy
-        if original_source:
-            spec.original_source = original_source
-
-        try:
-            pause_before_ms = int(round(float(spec.pause_before_ms)))
-        except (TypeError, ValueError):
-            pause_before_ms = 0
-        if pause_before_ms < 0:
-            pause_before_ms = 0
-        try:
-            pause_after_ms = int(round(float(spec.pause_after_ms)))
-        except (TypeError, ValueError):
-            pause_after_ms = 0
-        if pause_after_ms < 0:
-            pause_after_ms = 0
-
-        try:
-            original_pause_before_ms = int(round(float(spec.original_pause_before_ms)))
-        except (TypeError, ValueError):
-            original_pause_before_ms = 0
-        if original_pause_before_ms < 0:
-            original_pause_before_ms = 0
-        try:
-            original_pause_after_ms = int(round(float(spec.original_pause_after_ms)))
-        except (TypeError, ValueError):
-            original_pause_after_ms = 0
-        if original_pause_after_ms < 0:
-            original_pause_after_ms = 0
+        (
+            pause_before_ms,
+            pause_after_ms,
+            original_pause_before_ms,
+            original_pause_after_ms,
+        ) = _prepare_separate_spec(spec)
 
         translation_source_tokens = _fit_tokens_to_duration(
             spec.word_tokens or [], translation_target
         )
         if not translation_source_tokens and translation_target > 0:
-            fallback_words = _resolve_word_list(spec.translation_words, spec.translation_text)
-            translation_source_tokens = _char_weighted_tokens(
-                fallback_words,
-                translation_target,
+            translation_source_tokens = _separate_fallback_tokens(
+                spec,
+                original=False,
+                target=translation_target,
                 pause_before_ms=pause_before_ms,
                 pause_after_ms=pause_after_ms,
             )
-            translation_policy = "char_weighted"
-            translation_source = "char_weighted_refined"
-            spec.policy = translation_policy
-            spec.source = translation_source
 
         original_source_tokens = _fit_tokens_to_duration(
             spec.original_word_tokens or [], original_target
         )
         if not original_source_tokens and original_target > 0:
-            fallback_words = _resolve_word_list(spec.original_words, spec.original_text)
-            original_source_tokens = _char_weighted_tokens(
-                fallback_words,
-                original_target,
+            original_source_tokens = _separate_fallback_tokens(
+                spec,
+                original=True,
+                target=original_target,
                 pause_before_ms=original_pause_before_ms,
                 pause_after_ms=original_pause_after_ms,
             )
-            original_policy = original_policy or "char_weighted"
-            original_source = original_source or "char_weighted_refined"
-            spec.original_policy = original_policy
-            spec.original_source = original_source
 
         translation_start_gate = sentence_translation_offsets.get(spec.sentence_idx, 0.0)
         translation_end_gate = translation_start_gate + translation_target
@@ -1013,7 +1188,25 @@ def validate_chunk_timing_alignment(
     sorted_tokens = sorted(tokens, key=lambda t: float(t.get("start", 0)))
     first_start = float(sorted_tokens[0].get("start", 0))
     last_end = float(sorted_tokens[-1].get("end", 0))
+    return _alignment_summary(
+        len(tokens),
+        expected_duration,
+        first_start,
+        last_end,
+        start_tolerance_ms=start_tolerance_ms,
+        end_tolerance_ms=end_tolerance_ms,
+    )
+
 
+def _alignment_summary(
+    token_count: int,
+    expected_duration: float,
+    first_start: float,
+    last_end: float,
+    *,
+    start_tolerance_ms: float,
+    end_tolerance_ms: float,
+) -> dict[str, Any]:
     start_drift_ms = abs(first_start) * 1000
     end_drift_ms = abs(last_end - expected_duration) * 1000
 
@@ -1021,7 +1214,7 @@ def validate_chunk_timing_alignment(
 
     return {
         "valid": valid,
-        "token_count": len(tokens),
+        "token_count": token_count,
         "expected_duration": round(expected_duration, 6),
         "actual_start": round(first_start, 6),
         "actual_end": round(last_end, 6),
@@ -1078,7 +1271,18 @@ def _validate_track_sentence_gates(
         gate["token_count"] = int(gate["token_count"]) + 1
 
     gates = sorted(gates_by_sentence.values(), key=lambda gate: int(gate["sentenceIdx"]))
-    previous_gate: dict[str, Any] | None = None
+    return _summarize_sentence_gates(gates, issues, overlap_tolerance_ms=overlap_tolerance_ms)
+
+
+def _summarize_sentence_gates(
+    gates: Sequence[Mapping[str, Any]],
+    issues: list[dict[str, Any]],
+    *,
+    overlap_tolerance_ms: float,
+) -> dict[str, Any]:
+    """Check ordered sentence gates for negative spans and overlaps."""
+
+    previous_gate: Mapping[str, Any] | None = None
     tolerance_seconds = overlap_tolerance_ms / 1000.0
     for gate in gates:
         start = float(gate["start"])
@@ -1124,6 +1328,93 @@ def _validate_track_sentence_gates(
     }
 
 
+def _validate_track_vectorized(
+    tokens: Sequence[Mapping[str, Any]],
+    expected_duration: float,
+    *,
+    start_tolerance_ms: float,
+    end_tolerance_ms: float,
+    overlap_tolerance_ms: float,
+) -> dict[str, Any] | None:
+    """Array form of one track's checks in :func:`validate_export_timing_tracks`."""
+
+    columns = timeline_engine.token_columns(tokens, sentence_key="sentenceIdx")
+    if columns is None:
+        return None
+    starts, ends, sentences = columns
+
+    issues: list[dict[str, Any]] = []
+    max_end = expected_duration + (end_tolerance_ms / 1000.0) if expected_duration > 0 else None
+    for index, negative_start, negative_span, out_of_bounds in timeline_engine.boundary_flags(
+        starts, ends, min_start=-start_tolerance_ms / 1000.0, max_end=max_end
+    ):
+        start = float(starts[index])
+        end = float(ends[index])
+        if negative_start:
+            issues.append({"kind": "negative_start", "index": index, "start": round(start, 6)})
+        if negative_span:
+            issues.append(
+                {"kind": "negative_span", "index": index, "start": round(start, 6), "end": round(end, 6)}
+            )
+        if out_of_bounds:
+            issues.append(
+                {
+                    "kind": "end_out_of_bounds",
+                    "index": index,
+                    "end": round(end, 6),
+                    "expected_duration": round(expected_duration, 6),
+                }
+            )
+
+    order, overlaps = timeline_engine.overlap_scan(starts, ends, overlap_tolerance_ms)
+    for previous_index, index, overlap_ms in overlaps:
+        issues.append(
+            {
+                "kind": "token_overlap",
+                "previous_index": previous_index,
+                "index": index,
+                "overlap_ms": round(overlap_ms, 3),
+            }
+        )
+
+    alignment = _alignment_summary(
+        len(tokens),
+        expected_duration,
+        float(starts[order[0]]),
+        float(ends[order[-1]]),
+        start_tolerance_ms=start_tolerance_ms,
+        end_tolerance_ms=end_tolerance_ms,
+    )
+    if not alignment.get("valid"):
+        issues.append(
+            {
+                "kind": "duration_alignment",
+                "start_drift_ms": alignment.get("start_drift_ms"),
+                "end_drift_ms": alignment.get("end_drift_ms"),
+            }
+        )
+
+    keys, gate_starts, gate_ends, gate_counts = timeline_engine.sentence_spans(sentences, starts, ends)
+    gates = [
+        {"sentenceIdx": sentence_idx, "start": start, "end": end, "token_count": count}
+        for sentence_idx, start, end, count in zip(
+            keys.tolist(), gate_starts.tolist(), gate_ends.tolist(), gate_counts.tolist()
+        )
+    ]
+    sentence_gates = _summarize_sentence_gates(gates, [], overlap_tolerance_ms=overlap_tolerance_ms)
+    if not sentence_gates.get("valid"):
+        issues.append({"kind": "sentence_gates"})
+
+    return {
+        "valid": not issues,
+        "token_count": len(tokens),
+        "expected_duration": round(expected_duration, 6),
+        "issues": issues,
+        "alignment": alignment,
+        "sentence_gates": sentence_gates,
+    }
+
+
 def validate_export_timing_tracks(
     timing_tracks: Mapping[str, Sequence[Mapping[str, Any]]],
     track_durations: Mapping[str, Any],
@@ -1175,6 +1466,20 @@ def validate_export_timing_tracks(
             all_valid = False
             continue
 
+        if timeline_engine.vectorize(len(tokens)):
+            summary = _validate_track_vectorized(
+                tokens,
+                expected_duration,
+                start_tolerance_ms=start_tolerance_ms,
+                end_tolerance_ms=end_tolerance_ms,
+                overlap_tolerance_ms=overlap_tolerance_ms,
+            )
+            if summary is not None:
+                if not summary["valid"]:
+                    all_valid = False
+                track_summaries[track_key] = summary
+                continue
+
         sortable_tokens: list[tuple[int, float, float, Mapping[str, Any]]] = []
         for index, token in enumerate(tokens):
             try:
@@ -1277,6 +1582,9 @@ def compute_cumulative_offsets(
     Given durations [1.0, 2.0, 1.5], returns offsets [0.0, 1.0, 3.0].
     """
 
+    if timeline_engine.vectorize(len(durations)):
+        return timeline_engine.cumulative_offsets(durations)
+
     offsets: list[float] = [0.0]
     cumulative = 0.0
     for dur in durations[:-1]:
@@ -0,0 +1,453 @@
+"""Vectorised kernels behind :mod:`modules.core.rendering.timeline`.
+
+Tokens are handled as float64 columns (or :data:`TOKEN_DTYPE` structured
+arrays) instead of lists of dicts; the timeline helpers convert back to the
+existing dict schema only when they hand results to callers.  Every kernel
+reproduces the loop it replaces bit for bit: running sums use sequential
+``cumsum`` (never pairwise reductions) and decimal rounding matches Python's
+:func:`round`, with near-ties delegated to it.
+
+Set ``EBOOK_TIMELINE_ENGINE`` to ``python`` to force the original loops or to
+``numpy`` to vectorise regardless of size; ``auto`` (the default) vectorises
+inputs of at least :data:`MIN_VECTOR_TOKENS` tokens when numpy is installed.
+Kernels return ``None`` for input they do not model exactly (non-finite or
+out-of-range boundaries, negative zero, missing keys) so callers fall back to
+the reference loops, which own the error handling.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+from typing import Any, List, Mapping, Optional, Sequence, Tuple
+
+try:  # pragma: no cover - optional dependency
+    import numpy as np
+except Exception:  # pragma: no cover - environment fallback
+    np = None  # type: ignore[assignment]
+
+TIMELINE_ENGINE_ENV_VAR = "EBOOK_TIMELINE_ENGINE"
+MIN_VECTOR_TOKENS = 48
+_MODES = {"auto", "numpy", "python"}
+# Boundaries beyond this many seconds are left to the reference loops.
+_MAX_SECONDS = 1e9
+
+TOKEN_DTYPE = (
+    np.dtype(
+        [
+            ("sentence", np.int64),
+            ("word", np.int64),
+            ("start", np.float64),
+            ("end", np.float64),
+        ]
+    )
+    if np is not None
+    else None
+)
+
+Rows = List[Tuple[float, float]]
+
+
+def engine_mode() -> str:
+    """Return the configured engine mode (``auto``, ``numpy`` or ``python``)."""
+
+    raw = os.environ.get(TIMELINE_ENGINE_ENV_VAR)
+    if raw is None:
+        return "auto"
+    mode = raw.strip().lower()
+    return mode if mode in _MODES else "auto"
+
+
+def vectorize(token_count: int) -> bool:
+    """Return whether ``token_count`` tokens should go through the numpy kernels."""
+
+    if np is None:
+        return False
+    mode = engine_mode()
+    if mode == "python":
+        return False
+    return mode == "numpy" or token_count >= MIN_VECTOR_TOKENS
+
+
+def _representable(value: float) -> bool:
+    if not math.isfinite(value) or abs(value) >= _MAX_SECONDS:
+        return False
+    return not (value == 0.0 and math.copysign(1.0, value) < 0)
+
+
+# ---------------------------------------------------------------------------
+# Rounding
+
+
+def round6(values: "np.ndarray") -> "np.ndarray":
+    """Vectorised ``round(value, 6)`` returning Python's correctly rounded result.
+
+    ``rint(x * 1e6) / 1e6`` agrees with :func:`round` except when ``x * 1e6``
+    lies within floating-point error of a half-integer; those entries (and
+    non-finite or very large values) are rounded by Python instead.
+    """
+
+    scaled = values * 1e6
+    result = np.rint(scaled) / 1e6
+    distance = np.abs(scaled - np.floor(scaled) - 0.5)
+    suspect = ~(np.abs(values) < 1e15)
+    suspect |= distance <= np.abs(scaled) * 4e-16 + 1e-9
+    if suspect.any():
+        for index in np.flatnonzero(suspect):
+            result[index] = round(float(values[index]), 6)
+    return result
+
+
+def round_to_precision(values: "np.ndarray", precision: float) -> "np.ndarray":
+    """Vectorised ``timeline._round_to_precision``."""
+
+    cleaned = np.where(np.isfinite(values), values, 0.0)
+    cleaned = np.where(cleaned < 0, 0.0, cleaned)
+    increments = np.rint(cleaned / precision)
+    # ``round()`` returns an int there, so the product is never negative zero.
+    return round6(increments * precision) + 0.0
+
+
+# ---------------------------------------------------------------------------
+# Token conversion
+
+
+def token_columns(
+    tokens: Sequence[Any],
+    *,
+    sentence_key: Optional[str] = None,
+) -> Optional[Tuple["np.ndarray", "np.ndarray", Optional["np.ndarray"]]]:
+    """Return ``(start, end, sentence)`` columns, or ``None`` for irregular input.
+
+    Every token must be a mapping with representable ``start`` and ``end``
+    values (and an integer-convertible ``sentence_key`` when requested).
+    """
+
+    count = len(tokens)
+    starts = np.empty(count, dtype=np.float64)
+    ends = np.empty(count, dtype=np.float64)
+    sentences = np.empty(count, dtype=np.int64) if sentence_key else None
+    for index, token in enumerate(tokens):
+        if not isinstance(token, Mapping):
+            return None
+        start = token.get("start")
+        end = token.get("end")
+        if start is None or end is None:
+            return None
+        try:
+            start_val = float(start)
+            end_val = float(end)
+        except (TypeError, ValueError):
+            return None
+        if not (_representable(start_val) and _representable(end_val)):
+            return None
+        starts[index] = start_val
+        ends[index] = end_val
+        if sentences is not None:
+            raw_sentence = token.get(sentence_key)
+            if raw_sentence is None:
+                return None
+            try:
+                sentences[index] = int(raw_sentence)
+            except (TypeError, ValueError, OverflowError):
+                return None
+    return starts, ends, sentences
+
+
+def timing_rows(tokens: Sequence[Mapping[str, Any]] | None) -> Optional[Rows]:
+    """Return the ``(start, end)`` pairs ``_sanitize_word_tokens`` would keep.
+
+    Tokens are skipped exactly as the sanitiser skips them; ``None`` means a
+    kept boundary is not representable and the caller should fall back.
+    """
+
+    if not isinstance(tokens, Sequence):
+        return []
+    rows: Rows = []
+    for token in tokens:
+        if not isinstance(token, Mapping):
+            continue
+        try:
+            start = float(token.get("start", 0.0))
+            end = float(token.get("end", start))
+        except (TypeError, ValueError):
+            continue
+        if not (_representable(start) and _representable(end)):
+            return None
+        rows.append((start, end))
+    return rows
+
+
+def fixed_rows(tokens: Sequence[Mapping[str, Any]]) -> Optional[Rows]:
+    """Return ``(start, end)`` pairs of already-fitted tokens (e.g. char-weighted)."""
+
+    columns = token_columns(tokens)
+    if columns is None:
+        return None
+    starts, ends, _ = columns
+    return list(zip(starts.tolist(), ends.tolist()))
+
+
+# ---------------------------------------------------------------------------
+# Kernels
+
+
+def smooth_boundaries(
+    starts: "np.ndarray",
+    ends: "np.ndarray",
+    factor: float,
+) -> Optional[Tuple["np.ndarray", "np.ndarray"]]:
+    """Neighbour blend plus monotonic clamp of ``smooth_token_boundaries``."""
+
+    t0 = starts.copy()
+    t1 = np.where(ends < starts, starts, ends)
+    if len(starts) > 2 and factor > 0:
+        inner_t0 = t0[1:-1].copy()
+        inner_t1 = t1[1:-1].copy()
+        # fmean of two floats is their correctly rounded sum halved.
+        t0[1:-1] = (inner_t0 + (ends[:-2] * factor + inner_t0 * (1 - factor))) / 2
+        t1[1:-1] = (inner_t1 + (starts[2:] * factor + inner_t1 * (1 - factor))) / 2
+    start_out = round6(t0)
+    end_out = round6(np.where(t1 > t0, t1, t0))
+    # Every end is at least its start, so each end becomes the running
+    # maximum and each start is lifted to the previous running maximum.
+    running_end = np.maximum.accumulate(end_out)
+    if len(start_out) > 1:
+        start_out[1:] = np.where(
+            start_out[1:] < running_end[:-1], running_end[:-1], start_out[1:]
+        )
+    if _has_negative_zero(start_out) or _has_negative_zero(running_end):
+        return None
+    return start_out, running_end
+
+
+def _has_negative_zero(values: "np.ndarray") -> bool:
+    return bool(np.any((values == 0) & np.signbit(values)))
+
+
+def fit_segments(
+    segments: Sequence[Rows],
+    targets: Sequence[float],
+    precision: float,
+) -> Tuple["np.ndarray", "np.ndarray"]:
+    """Run ``timeline._fit_tokens_to_duration`` over many sentences at once.
+
+    Segments are laid out as rows of a zero-padded matrix so per-sentence
+    totals and cursors come from ``cumsum(axis=1)``, which adds left to right
+    exactly like the loop; trailing padding adds ``0.0`` and changes nothing.
+    Returns flat ``(start, end)`` columns in segment order.
+    """
+
+    counts = np.array([len(rows) for rows in segments], dtype=np.int64)
+    total = int(counts.sum())
+    if total == 0:
+        return np.empty(0, dtype=np.float64), np.empty(0, dtype=np.float64)
+    flat = np.array([row for rows in segments for row in rows], dtype=np.float64)
+    row_ids = np.repeat(np.arange(len(segments)), counts)
+    col_ids = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+    width = int(counts.max())
+
+    raw_starts = flat[:, 0]
+    raw_ends = np.where(flat[:, 1] < raw_starts, raw_starts, flat[:, 1])
+    spans = np.where(raw_ends > 0.0, raw_ends, 0.0) - np.where(raw_starts > 0.0, raw_starts, 0.0)
+    lengths = np.zeros((len(segments), width), dtype=np.float64)
+    lengths[row_ids, col_ids] = np.where(spans > 0.0, spans, 0.0)
+
+    target_col = np.asarray(targets, dtype=np.float64)
+    totals = np.cumsum(lengths, axis=1)[:, -1]
+    totals = np.where(totals <= 0, np.where(target_col > 0.0, target_col, 0.0), totals)
+    scale = np.ones(len(segments), dtype=np.float64)
+    scalable = (target_col > 0) & (totals > 0)
+    scale[scalable] = target_col[scalable] / totals[scalable]
+    effective = lengths * scale[:, None]
+    effective = np.where(effective > 0.0, effective, 0.0)
+    cursor = np.cumsum(effective, axis=1)
+    token_starts = np.zeros_like(cursor)
+    token_starts[:, 1:] = cursor[:, :-1]
+
+    starts = round_to_precision(token_starts[row_ids, col_ids], precision)
+    ends = round_to_precision(
+        np.where(cursor > token_starts, cursor, token_starts)[row_ids, col_ids],
+        precision,
+    )
+    closing = (counts > 0) & (target_col > 0)
+    if closing.any():
+        last_slots = np.cumsum(counts)[closing] - 1
+        ends[last_slots] = round_to_precision(target_col[closing], precision)
+    return starts, ends
+
+
+def clamp_track(
+    starts: "np.ndarray",
+    ends: "np.ndarray",
+    total_duration: float,
+    precision: float,
+) -> Tuple[int, "np.ndarray", "np.ndarray"]:
+    """Array form of ``timeline._clamp_track_tokens``.
+
+    Returns how many leading tokens survive plus their clamped boundaries.
+    """
+
+    start_col = np.where(starts > 0.0, starts, 0.0)
+    end_col = np.where(ends > 0.0, ends, 0.0)
+    # cursor_i = min(max(end_i, start_i, cursor_{i-1}), total)
+    reach = np.maximum.accumulate(np.where(end_col > start_col, end_col, start_col))
+    cursor = np.minimum(reach, total_duration)
+    previous = np.zeros_like(cursor)
+    previous[1:] = cursor[:-1]
+    clamped_starts = np.where(start_col < previous, previous, start_col)
+    keep = len(clamped_starts)
+    past_end = np.flatnonzero(clamped_starts >= total_duration)
+    if len(past_end):
+        keep = int(past_end[0])
+    exhausted = np.flatnonzero(cursor[:keep] >= total_duration)
+    if len(exhausted):
+        keep = int(exhausted[0]) + 1
+    start_out = round_to_precision(clamped_starts[:keep], precision)
+    end_out = round_to_precision(cursor[:keep], precision)
+    if keep:
+        start_out[0] = 0.0
+        last_end = min(float(end_out[-1]), total_duration)
+        end_out[-1] = round_to_precision(np.array([last_end]), precision)[0]
+    return keep, start_out, end_out
+
+
+def layout_track(
+    segments: Sequence[Tuple[Rows, bool]],
+    offsets: Sequence[float],
+    targets: Sequence[float],
+    total_duration: float,
+    precision: float,
+) -> "np.ndarray":
+    """Place per-sentence tokens on a chunk track and clamp it.
+
+    ``segments`` holds one ``(rows, fit)`` pair per sentence: raw word-token
+    rows that still need fitting to the sentence's target, or already fitted
+    rows (``fit`` false).  Returns a :data:`TOKEN_DTYPE` array whose
+    ``sentence`` field is the segment position and ``word`` the index within it.
+    """
+
+    fit_starts, fit_ends = fit_segments(
+        [rows if fit else [] for rows, fit in segments], targets, precision
+    )
+    local_starts: List["np.ndarray"] = []
+    local_ends: List["np.ndarray"] = []
+    counts: List[int] = []
+    fit_cursor = 0
+    for rows, fit in segments:
+        if fit:
+            local_starts.append(fit_starts[fit_cursor:fit_cursor + len(rows)])
+            local_ends.append(fit_ends[fit_cursor:fit_cursor + len(rows)])
+            fit_cursor += len(rows)
+        else:
+            block = np.array(rows, dtype=np.float64).reshape(-1, 2)
+            local_starts.append(block[:, 0])
+            local_ends.append(block[:, 1])
+        counts.append(len(rows))
+
+    count_col = np.array(counts, dtype=np.int64)
+    token_total = int(count_col.sum())
+    if total_duration <= 0 or token_total == 0:
+        return np.zeros(0, dtype=TOKEN_DTYPE)
+    segment_ids = np.repeat(np.arange(len(segments)), count_col)
+    word_ids = np.arange(token_total) - np.repeat(np.cumsum(count_col) - count_col, count_col)
+    gate = np.asarray(offsets, dtype=np.float64)[segment_ids]
+    starts = round_to_precision(gate + np.concatenate(local_starts), precision)
+    ends = round_to_precision(gate + np.concatenate(local_ends), precision)
+
+    keep, clamped_starts, clamped_ends = clamp_track(starts, ends, total_duration, precision)
+    track = np.zeros(keep, dtype=TOKEN_DTYPE)
+    track["sentence"] = segment_ids[:keep]
+    track["word"] = word_ids[:keep]
+    track["start"] = clamped_starts
+    track["end"] = clamped_ends
+    return track
+
+
+def cumulative_offsets(durations: Sequence[Any]) -> List[float]:
+    """Array form of ``timeline.compute_cumulative_offsets``."""
+
+    values = np.array([float(value) for value in durations[:-1]], dtype=np.float64)
+    clamped = np.where(values > 0.0, values, np.where(np.isnan(values), values, 0.0))
+    # The loop starts from ``0.0 +``, which never yields negative zero.
+    running = round6(np.cumsum(clamped) + 0.0)
+    return [0.0, *running.tolist()]
+
+
+def overlap_scan(
+    starts: "np.ndarray",
+    ends: "np.ndarray",
+    tolerance_ms: float,
+) -> Tuple["np.ndarray", List[Tuple[int, int, float]]]:
+    """Return the stable start order and ``(previous, index, overlap_ms)`` overlaps."""
+
+    order = np.lexsort((np.arange(len(starts)), starts))
+    sorted_starts = starts[order]
+    previous_end = np.zeros(len(order), dtype=np.float64)
+    if len(order) > 1:
+        running = np.maximum.accumulate(np.maximum(ends[order], 0.0)) + 0.0
+        previous_end[1:] = running[:-1]
+    overlap_ms = (previous_end - sorted_starts) * 1000.0
+    flagged = np.flatnonzero(overlap_ms > tolerance_ms)
+    pairs = [
+        (int(order[slot - 1]), int(order[slot]), float(overlap_ms[slot]))
+        for slot in flagged
+        if slot > 0
+    ]
+    return order, pairs
+
+
+def boundary_flags(
+    starts: "np.ndarray",
+    ends: "np.ndarray",
+    *,
+    min_start: float,
+    max_end: Optional[float],
+) -> List[Tuple[int, bool, bool, bool]]:
+    """Return ``(index, negative_start, negative_span, out_of_bounds)`` for flagged tokens."""
+
+    negative_start = starts < min_start
+    negative_span = ends < starts
+    out_of_bounds = ends > max_end if max_end is not None else np.zeros(len(ends), dtype=bool)
+    flagged = np.flatnonzero(negative_start | negative_span | out_of_bounds)
+    return [
+        (int(index), bool(negative_start[index]), bool(negative_span[index]), bool(out_of_bounds[index]))
+        for index in flagged
+    ]
+
+
+def sentence_spans(
+    sentences: "np.ndarray",
+    starts: "np.ndarray",
+    ends: "np.ndarray",
+) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray", "np.ndarray"]:
+    """Return sorted sentence ids with their earliest start, latest end and token count."""
+
+    keys, inverse, counts = np.unique(sentences, return_inverse=True, return_counts=True)
+    span_starts = np.full(len(keys), np.inf)
+    span_ends = np.full(len(keys), -np.inf)
+    np.minimum.at(span_starts, inverse, starts)
+    np.maximum.at(span_ends, inverse, ends)
+    return keys, span_starts, span_ends, counts
+
+
+__all__ = [
+    "MIN_VECTOR_TOKENS",
+    "TIMELINE_ENGINE_ENV_VAR",
+    "TOKEN_DTYPE",
+    "boundary_flags",
+    "clamp_track",
+    "cumulative_offsets",
+    "engine_mode",
+    "fit_segments",
+    "fixed_rows",
+    "layout_track",
+    "overlap_scan",
+    "round6",
+    "round_to_precision",
+    "sentence_spans",
+    "smooth_boundaries",
+    "timing_rows",
+    "token_columns",
+    "vectorize",
+]
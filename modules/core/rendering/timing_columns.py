@@ -0,0 +1,464 @@
+"""Columnar, range-addressable storage for exported word timing tracks.
+
+Every batch export writes one small binary file per chunk next to the job
+metadata.  A file holds, for each timing track, a per-sentence token offset
+table followed by packed ``start``/``end``/``wordIdx`` columns, so a reader
+can answer "timing for sentences N..M" by reading the header, the offset
+table and the matching column slices without decoding the rest of the file.
+
+Layout (all integers little-endian)::
+
+    magic  b"ETC1"
+    u32    index length in bytes
+    bytes  UTF-8 JSON index
+    bytes  column data; offsets in the index are relative to this point
+
+Times are stored as unsigned microseconds, which round-trips the 3 ms timing
+grid used by :mod:`modules.core.rendering.timeline` exactly.  Token
+``sentenceIdx`` values are chunk-local, matching ``timingTracks`` in chunk
+metadata, and are derived from the offset table rather than stored.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import struct
+import sys
+import tempfile
+import threading
+from array import array
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from io import BytesIO
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from modules.logging_manager import logger
+
+TIMING_COLUMNS_MAGIC = b"ETC1"
+TIMING_COLUMNS_VERSION = 1
+TIMING_COLUMNS_SUFFIX = ".tcol"
+TIMING_COLUMNS_DIRNAME = "timing"
+TIMING_COLUMNS_MEDIA_TYPE = "application/vnd.ebook-tools.timing-columns"
+
+_HEADER = struct.Struct("<4sI")
+_ITEM_SIZE = 4
+_MAX_MICROSECONDS = 0xFFFFFFFF
+_TRACK_LANES = {"original": "orig", "translation": "trans"}
+_FILENAME_PATTERN = re.compile(r"^(\d+)-(\d+)" + re.escape(TIMING_COLUMNS_SUFFIX) + "$")
+
+# Directory listings keyed by store root and validated against the directory
+# mtime, so range queries on large books do not re-list thousands of files.
+_listing_cache: Dict[Path, Tuple[int, List[Tuple[int, int, Path]]]] = {}
+_listing_lock = threading.Lock()
+
+
+def _u32(values: Iterable[int] = ()) -> array:
+    column = array("I", values)
+    if column.itemsize != _ITEM_SIZE:  # pragma: no cover - exotic platforms
+        column = array("L", values)
+    return column
+
+
+def _to_le(column: array) -> bytes:
+    if sys.byteorder != "little":  # pragma: no cover - big-endian hosts
+        column = array(column.typecode, column)
+        column.byteswap()
+    return column.tobytes()
+
+
+def _from_le(payload: bytes) -> array:
+    column = _u32()
+    column.frombytes(payload)
+    if sys.byteorder != "little":  # pragma: no cover - big-endian hosts
+        column.byteswap()
+    return column
+
+
+def _microseconds(value: Any) -> int:
+    try:
+        seconds = float(value)
+    except (TypeError, ValueError):
+        return 0
+    if not seconds > 0:
+        return 0
+    micros = int(round(seconds * 1_000_000))
+    if micros > _MAX_MICROSECONDS:
+        raise ValueError(f"timing value {seconds!r}s exceeds the columnar range")
+    return micros
+
+
+def _as_int(value: Any, default: int = 0) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
+@dataclass(slots=True)
+class TrackColumns:
+    """Packed timing columns for one track over a run of sentences.
+
+    ``sentence_offsets`` has one entry per sentence plus a terminator; tokens
+    of sentence ``first_local + i`` live at ``[offsets[i], offsets[i + 1])``
+    relative to ``sentence_offsets[0]``.
+    """
+
+    lane: str
+    first_local: int
+    sentence_offsets: array
+    starts: array
+    ends: array
+    words: array
+
+    @property
+    def token_count(self) -> int:
+        return len(self.starts)
+
+    @classmethod
+    def from_tokens(
+        cls,
+        track: str,
+        tokens: Sequence[Mapping[str, Any]],
+        sentence_count: int,
+    ) -> "TrackColumns":
+        """Pack ``timingTracks`` tokens for a chunk of ``sentence_count`` sentences."""
+
+        lane = _TRACK_LANES.get(track, track)
+        ordered = sorted(
+            (token for token in tokens if isinstance(token, Mapping)),
+            key=lambda token: _as_int(token.get("sentenceIdx")),
+        )
+        counts = [0] * max(sentence_count, 0)
+        starts = _u32()
+        ends = _u32()
+        words = _u32()
+        for token in ordered:
+            local = _as_int(token.get("sentenceIdx"))
+            if not 0 <= local < len(counts):
+                continue
+            lane_value = token.get("lane")
+            if isinstance(lane_value, str) and lane_value:
+                lane = lane_value
+            counts[local] += 1
+            starts.append(_microseconds(token.get("start")))
+            ends.append(_microseconds(token.get("end", token.get("start"))))
+            words.append(max(_as_int(token.get("wordIdx")), 0))
+        offsets = _u32([0])
+        running = 0
+        for count in counts:
+            running += count
+            offsets.append(running)
+        return cls(lane, 0, offsets, starts, ends, words)
+
+    def to_tokens(self) -> List[Dict[str, Any]]:
+        """Return the JSON token representation used by chunk ``timingTracks``."""
+
+        tokens: List[Dict[str, Any]] = []
+        base = self.sentence_offsets[0] if self.sentence_offsets else 0
+        for position in range(len(self.sentence_offsets) - 1):
+            sentence_idx = self.first_local + position
+            for index in range(
+                self.sentence_offsets[position] - base,
+                self.sentence_offsets[position + 1] - base,
+            ):
+                tokens.append(
+                    {
+                        "lane": self.lane,
+                        "sentenceIdx": sentence_idx,
+                        "wordIdx": self.words[index],
+                        "start": round(self.starts[index] / 1_000_000, 6),
+                        "end": round(self.ends[index] / 1_000_000, 6),
+                    }
+                )
+        return tokens
+
+
+@dataclass(slots=True)
+class TimingColumnSlice:
+    """Timing columns of one chunk restricted to a sentence range."""
+
+    chunk_id: str
+    chunk_start: int
+    chunk_end: int
+    start_sentence: int
+    end_sentence: int
+    tracks: Dict[str, TrackColumns] = field(default_factory=dict)
+
+    def to_timing_tracks(self) -> Dict[str, List[Dict[str, Any]]]:
+        return {name: columns.to_tokens() for name, columns in self.tracks.items()}
+
+    def encode(self) -> bytes:
+        """Serialise the slice in the on-disk format (a standalone blob)."""
+
+        data = bytearray()
+        track_index: Dict[str, Any] = {}
+        for name, columns in self.tracks.items():
+            entry: Dict[str, Any] = {
+                "lane": columns.lane,
+                "first_sentence_idx": columns.first_local,
+                "tokens": columns.token_count,
+            }
+            base = columns.sentence_offsets[0] if columns.sentence_offsets else 0
+            offsets = _u32(value - base for value in columns.sentence_offsets)
+            for key, column in (
+                ("offsets", offsets),
+                ("start_us", columns.starts),
+                ("end_us", columns.ends),
+                ("word_idx", columns.words),
+            ):
+                entry[key] = len(data)
+                data += _to_le(column)
+            track_index[name] = entry
+        index = {
+            "version": TIMING_COLUMNS_VERSION,
+            "chunk_id": self.chunk_id,
+            "chunk_start": self.chunk_start,
+            "chunk_end": self.chunk_end,
+            "start_sentence": self.start_sentence,
+            "end_sentence": self.end_sentence,
+            "data_length": len(data),
+            "tracks": track_index,
+        }
+        index_bytes = json.dumps(index, separators=(",", ":")).encode("utf-8")
+        return _HEADER.pack(TIMING_COLUMNS_MAGIC, len(index_bytes)) + index_bytes + bytes(data)
+
+
+def encode_timing_columns(
+    chunk_id: str,
+    start_sentence: int,
+    end_sentence: int,
+    timing_tracks: Mapping[str, Sequence[Mapping[str, Any]]],
+) -> bytes:
+    """Return the packed columnar representation of a chunk's timing tracks."""
+
+    sentence_count = max(end_sentence - start_sentence + 1, 0)
+    tracks = {
+        str(name): TrackColumns.from_tokens(str(name), tokens, sentence_count)
+        for name, tokens in timing_tracks.items()
+        if isinstance(tokens, Sequence) and not isinstance(tokens, (str, bytes))
+    }
+    return TimingColumnSlice(
+        chunk_id=chunk_id,
+        chunk_start=start_sentence,
+        chunk_end=end_sentence,
+        start_sentence=start_sentence,
+        end_sentence=end_sentence,
+        tracks=tracks,
+    ).encode()
+
+
+def _read_exact(handle: BinaryIO, size: int) -> bytes:
+    payload = handle.read(size)
+    if len(payload) != size:
+        raise ValueError("Truncated timing columns file")
+    return payload
+
+
+def _read_index(handle: BinaryIO) -> Tuple[Dict[str, Any], int]:
+    magic, index_length = _HEADER.unpack(_read_exact(handle, _HEADER.size))
+    if magic != TIMING_COLUMNS_MAGIC:
+        raise ValueError("Not a timing columns file")
+    index = json.loads(_read_exact(handle, index_length).decode("utf-8"))
+    if not isinstance(index, dict) or index.get("version") != TIMING_COLUMNS_VERSION:
+        raise ValueError("Unsupported timing columns version")
+    return index, _HEADER.size + index_length
+
+
+def read_timing_columns(
+    handle: BinaryIO,
+    from_sentence: Optional[int] = None,
+    to_sentence: Optional[int] = None,
+    *,
+    tracks: Optional[Iterable[str]] = None,
+) -> Optional[TimingColumnSlice]:
+    """Read the part of one columnar blob covering ``from_sentence..to_sentence``.
+
+    Only the header, each track's offset table and the matching column slices
+    are read.  Returns ``None`` when the blob does not overlap the range.
+    """
+
+    index, data_start = _read_index(handle)
+    base = handle.tell() - data_start
+    blob_start = _as_int(index.get("start_sentence"))
+    blob_end = _as_int(index.get("end_sentence"), blob_start - 1)
+    first = blob_start if from_sentence is None else max(from_sentence, blob_start)
+    last = blob_end if to_sentence is None else min(to_sentence, blob_end)
+    if first > last:
+        return None
+    wanted = None if tracks is None else set(tracks)
+    result = TimingColumnSlice(
+        chunk_id=str(index.get("chunk_id") or ""),
+        chunk_start=_as_int(index.get("chunk_start"), blob_start),
+        chunk_end=_as_int(index.get("chunk_end"), blob_end),
+        start_sentence=first,
+        end_sentence=last,
+    )
+    data_origin = base + data_start
+    for name, entry in (index.get("tracks") or {}).items():
+        if wanted is not None and name not in wanted:
+            continue
+        token_count = _as_int(entry.get("tokens"))
+        skip = first - blob_start
+        span = last - first + 1
+        handle.seek(data_origin + _as_int(entry.get("offsets")) + skip * _ITEM_SIZE)
+        offsets = _from_le(_read_exact(handle, (span + 1) * _ITEM_SIZE))
+        lo, hi = offsets[0], offsets[-1]
+        if not 0 <= lo <= hi <= token_count:
+            raise ValueError("Corrupt timing columns offset table")
+        columns: Dict[str, array] = {}
+        for key in ("start_us", "end_us", "word_idx"):
+            handle.seek(data_origin + _as_int(entry.get(key)) + lo * _ITEM_SIZE)
+            columns[key] = _from_le(_read_exact(handle, (hi - lo) * _ITEM_SIZE))
+        result.tracks[name] = TrackColumns(
+            lane=str(entry.get("lane") or _TRACK_LANES.get(name, name)),
+            first_local=_as_int(entry.get("first_sentence_idx")) + skip,
+            sentence_offsets=offsets,
+            starts=columns["start_us"],
+            ends=columns["end_us"],
+            words=columns["word_idx"],
+        )
+    return result
+
+
+def decode_timing_columns(payload: bytes) -> List[TimingColumnSlice]:
+    """Decode a stream of concatenated blobs, as served by the range API."""
+
+    handle = BytesIO(payload)
+    slices: List[TimingColumnSlice] = []
+    while handle.tell() < len(payload):
+        blob_start = handle.tell()
+        index, data_start = _read_index(handle)
+        handle.seek(blob_start)
+        blob = BytesIO(_read_exact(handle, data_start + _as_int(index.get("data_length"))))
+        decoded = read_timing_columns(blob)
+        if decoded is not None:
+            slices.append(decoded)
+    return slices
+
+
+def resolve_timing_columns_root(base_dir: Path | str) -> Path:
+    """Return the column store for an export ``base_dir`` (``<job>/metadata/timing``)."""
+
+    base_path = Path(base_dir)
+    for candidate in (base_path, *base_path.parents):
+        if candidate.name.lower() == "media" and candidate.parent != candidate:
+            return candidate.parent / "metadata" / TIMING_COLUMNS_DIRNAME
+    return base_path / f".{TIMING_COLUMNS_DIRNAME}"
+
+
+class TimingColumnStore:
+    """Directory of per-chunk columnar timing files keyed by sentence range."""
+
+    def __init__(self, root: Path | str) -> None:
+        self._root = Path(root)
+
+    @property
+    def root(self) -> Path:
+        return self._root
+
+    @staticmethod
+    def filename(start_sentence: int, end_sentence: int) -> str:
+        return f"{start_sentence:06d}-{end_sentence:06d}{TIMING_COLUMNS_SUFFIX}"
+
+    def chunks(self) -> List[Tuple[int, int, Path]]:
+        """Return ``(start, end, path)`` for every stored chunk, in sentence order."""
+
+        try:
+            mtime_ns = os.stat(self._root).st_mtime_ns
+        except OSError:
+            return []
+        with _listing_lock:
+            cached = _listing_cache.get(self._root)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+        try:
+            names = os.listdir(self._root)
+        except OSError:
+            return []
+        entries: List[Tuple[int, int, Path]] = []
+        for name in names:
+            match = _FILENAME_PATTERN.match(name)
+            if match:
+                entries.append((int(match.group(1)), int(match.group(2)), self._root / name))
+        entries.sort()
+        with _listing_lock:
+            _listing_cache[self._root] = (mtime_ns, entries)
+        return entries
+
+    def _forget_listing(self) -> None:
+        with _listing_lock:
+            _listing_cache.pop(self._root, None)
+
+    def write_chunk(
+        self,
+        chunk_id: str,
+        start_sentence: int,
+        end_sentence: int,
+        timing_tracks: Mapping[str, Sequence[Mapping[str, Any]]],
+    ) -> Path:
+        """Atomically persist one chunk, replacing any stale overlapping chunk."""
+
+        payload = encode_timing_columns(chunk_id, start_sentence, end_sentence, timing_tracks)
+        self._root.mkdir(parents=True, exist_ok=True)
+        destination = self._root / self.filename(start_sentence, end_sentence)
+        handle = tempfile.NamedTemporaryFile("wb", dir=self._root, delete=False, suffix=".tmp")
+        try:
+            with handle:
+                handle.write(payload)
+            Path(handle.name).replace(destination)
+        except Exception:
+            Path(handle.name).unlink(missing_ok=True)
+            raise
+        self._forget_listing()
+        for start, end, path in self.chunks():
+            if path != destination and start <= end_sentence and end >= start_sentence:
+                path.unlink(missing_ok=True)
+        self._forget_listing()
+        return destination
+
+    def read_range(
+        self,
+        from_sentence: Optional[int] = None,
+        to_sentence: Optional[int] = None,
+        *,
+        tracks: Optional[Iterable[str]] = None,
+    ) -> List[TimingColumnSlice]:
+        """Return slices of every chunk overlapping the inclusive sentence range."""
+
+        wanted = None if tracks is None else tuple(tracks)
+        slices: List[TimingColumnSlice] = []
+        entries = self.chunks()
+        first_index = 0
+        if from_sentence is not None:
+            # Chunks do not overlap, so ends are sorted along with starts.
+            first_index = bisect_left(entries, from_sentence, key=lambda entry: entry[1])
+        for start, end, path in entries[first_index:]:
+            if to_sentence is not None and start > to_sentence:
+                break
+            try:
+                with path.open("rb") as handle:
+                    sliced = read_timing_columns(handle, from_sentence, to_sentence, tracks=wanted)
+            except FileNotFoundError:
+                continue
+            except (OSError, ValueError):
+                logger.debug("Skipping unreadable timing columns %s", path, exc_info=True)
+                continue
+            if sliced is not None:
+                slices.append(sliced)
+        return slices
+
+
+__all__ = [
+    "TIMING_COLUMNS_DIRNAME",
+    "TIMING_COLUMNS_MEDIA_TYPE",
+    "TimingColumnSlice",
+    "TimingColumnStore",
+    "TrackColumns",
+    "decode_timing_columns",
+    "encode_timing_columns",
+    "read_timing_columns",
+    "resolve_timing_columns_root",
+]
@@ -4,6 +4,7 @@ import queue
 from typing import List, Optional, Sequence, Tuple
 
 from .. import translation_engine
+from ..render_priority import PlayheadQueue, RenderPriority
 from ..translation_engine import ThreadWorkerPool
 from ..transliteration import TransliterationService, get_transliterator
 from .. import text_normalization as text_norm
@@ -109,9 +110,17 @@ def build_target_sequence(
     ]
 
 
-def create_translation_queue(max_size: int) -> "queue.Queue":
-    """Return a bounded queue used to hand off translation results."""
+def create_translation_queue(
+    max_size: int,
+    render_priority: Optional[RenderPriority] = None,
+) -> "queue.Queue":
+    """Return a bounded queue used to hand off translation results.
 
+    With ``render_priority`` consumers take the task nearest the playhead.
+    """
+
+    if render_priority is not None:
+        return PlayheadQueue(render_priority, maxsize=max_size)
     return queue.Queue(maxsize=max_size)
 
 
@@ -140,6 +149,7 @@ def start_translation_pipeline(
     transliteration_client=None,
     include_transliteration: bool = False,
     llm_batch_size: Optional[int] = None,
+    render_priority: Optional[RenderPriority] = None,
 ):
     """Start the background translation pipeline using the translation engine."""
 
@@ -161,4 +171,5 @@ def start_translation_pipeline(
         transliteration_client=transliteration_client,
         include_transliteration=include_transliteration,
         llm_batch_size=llm_batch_size,
+        render_priority=render_priority,
     )
@@ -57,6 +57,22 @@ class LibraryItemModel(Base):
         Index("idx_library_items_item_type", "item_type"),
         Index("idx_library_items_search", "search_vector", postgresql_using="gin"),
         Index("idx_library_items_meta", "meta_json", postgresql_using="gin"),
+        Index(
+            "idx_library_items_author_book_language",
+            "author",
+            "book_title",
+            "language",
+            "updated_at",
+        ),
+        Index("idx_library_items_genre_author_book", "genre", "author", "book_title", "updated_at"),
+        Index(
+            "idx_library_items_language_author_book",
+            "language",
+            "author",
+            "book_title",
+            "updated_at",
+        ),
+        Index("idx_library_items_updated_id", "updated_at", "id"),
     )
 
 
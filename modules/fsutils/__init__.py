@@ -2,20 +2,30 @@
 
 from __future__ import annotations
 
-from .atomic_move import atomic_move, AtomicMoveError, ChecksumMismatchError
+from .atomic_move import (
+    atomic_move,
+    AtomicMoveError,
+    ChecksumMismatchError,
+    MoveProgress,
+    MoveResult,
+)
 from .locks import (
     DirectoryLock,
     LockAcquisitionError,
     acquire_lock,
     lock_directory,
+    lock_metrics,
 )
 
 __all__ = [
     "atomic_move",
     "AtomicMoveError",
     "ChecksumMismatchError",
+    "MoveProgress",
+    "MoveResult",
     "DirectoryLock",
     "LockAcquisitionError",
     "acquire_lock",
     "lock_directory",
+    "lock_metrics",
 ]
@@ -1,14 +1,68 @@
-"""Cross-filesystem aware atomic move utilities."""
+"""Cross-filesystem aware atomic move utilities.
+
+:func:`atomic_move` first tries a plain ``rename``.  When that is impossible
+(different filesystems, or bind mounts of the same one) the tree is staged
+into a hidden ``.<name>.partial`` sibling of the destination and renamed into
+place once complete.  Each file is staged with the cheapest available method:
+
+* a hardlink, when source and destination share a filesystem;
+* a reflink (``FICLONE``) on copy-on-write filesystems such as btrfs or XFS;
+* otherwise a single-pass copy with large buffers that hashes the bytes as they
+  are written (or ``copy_file_range`` when no checksum is requested).
+
+Files are staged concurrently up to ``io_parallelism`` workers.  Completed
+files are appended to a ``.<name>.move.jsonl`` manifest so an interrupted move
+resumes where it stopped instead of starting over.  The staged tree is
+verified against the source before the final rename, and the manifest is
+marked committed once that rename is durable; only a committed manifest lets
+a later call finish the move by deleting the source.
+"""
 
 from __future__ import annotations
 
+import errno
 import hashlib
+import json
 import os
 import shutil
+import threading
+import time
 import unicodedata
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Iterable, Tuple
-from uuid import uuid4
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+try:  # pragma: no cover - platform dependent
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+from modules import logging_manager
+
+LOGGER = logging_manager.get_logger().getChild("fsutils.atomic_move")
+
+MOVE_PARALLELISM_ENV = "EBOOK_ATOMIC_MOVE_PARALLELISM"
+DEFAULT_IO_PARALLELISM = 4
+COPY_BUFFER_SIZE = 8 << 20
+PROGRESS_INTERVAL_SECONDS = 0.5
+MANIFEST_VERSION = 1
+
+_FICLONE = 0x40049409
+# errno values meaning "this method is not available here", not "this file failed".
+_UNSUPPORTED_ERRNOS = {
+    errno.EXDEV,
+    errno.EOPNOTSUPP,
+    errno.ENOTSUP,
+    errno.ENOTTY,
+    errno.EINVAL,
+    errno.ENOSYS,
+    errno.EPERM,
+    errno.EMLINK,
+    errno.EBADF,
+}
+# rename() refusals that staging (hardlink first, then copy) can still handle.
+_RENAME_FALLBACK_ERRNOS = {errno.EXDEV, errno.EOPNOTSUPP, errno.ENOTSUP, errno.ENOSYS}
 
 
 class AtomicMoveError(RuntimeError):
@@ -19,11 +73,58 @@ class ChecksumMismatchError(AtomicMoveError):
     """Raised when source and destination checksums do not match."""
 
 
+@dataclass(frozen=True)
+class MoveProgress:
+    """Snapshot passed to ``progress`` callbacks while a move is staged."""
+
+    bytes_done: int
+    bytes_total: int
+    files_done: int
+    files_total: int
+    elapsed_seconds: float
+
+    @property
+    def bytes_per_second(self) -> float:
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.bytes_done / self.elapsed_seconds
+
+
+@dataclass(frozen=True)
+class MoveResult:
+    """Summary of a completed :func:`atomic_move`."""
+
+    method: str
+    files: int = 0
+    bytes: int = 0
+    hardlinked: int = 0
+    reflinked: int = 0
+    copied: int = 0
+    resumed: int = 0
+    elapsed_seconds: float = 0.0
+
+
+ProgressCallback = Callable[[MoveProgress], None]
+
+
 _IGNORED_NAMES = {
     ".DS_Store",
 }
 
 
+def resolve_io_parallelism(value: Optional[int] = None) -> int:
+    """Return the staging worker count, honouring ``EBOOK_ATOMIC_MOVE_PARALLELISM``."""
+
+    if value is None:
+        raw = os.environ.get(MOVE_PARALLELISM_ENV, "").strip()
+        try:
+            value = int(raw) if raw else DEFAULT_IO_PARALLELISM
+        except ValueError:
+            LOGGER.warning("Ignoring invalid %s=%r", MOVE_PARALLELISM_ENV, raw)
+            value = DEFAULT_IO_PARALLELISM
+    return max(1, int(value))
+
+
 def _iter_files(root: Path) -> Iterable[Tuple[Path, Path]]:
     if root.is_file():
         if root.name not in _IGNORED_NAMES:
@@ -50,7 +151,20 @@ def _normalized_rel_path(rel_path: Path) -> str:
     return unicodedata.normalize("NFC", rel_string)
 
 
-def _verify_copy(src: Path, dst: Path, algorithm: str) -> None:
+def _verify_copy(
+    src: Path,
+    dst: Path,
+    algorithm: str,
+    source_digests: Optional[Dict[str, str]] = None,
+) -> None:
+    """Compare both trees file by file.
+
+    ``source_digests`` maps normalized relative paths to digests already
+    computed while copying, so those source files are not read again.
+    Hardlinked files share the source inode and are not hashed.
+    """
+
+    source_digests = source_digests or {}
     src_index: dict[str, tuple[Path, Path]] = {}
     for rel_path, file_path in _iter_files(src):
         key = _normalized_rel_path(rel_path)
@@ -81,10 +195,20 @@ def _verify_copy(src: Path, dst: Path, algorithm: str) -> None:
     for key in sorted(src_index):
         src_rel, src_file = src_index[key]
         _, dst_file = dst_index[key]
-        if _compute_checksum(src_file, algorithm) != _compute_checksum(dst_file, algorithm):
+        if os.path.samestat(os.stat(src_file), os.stat(dst_file)):
+            continue
+        expected = source_digests.get(key) or _compute_checksum(src_file, algorithm)
+        if _compute_checksum(dst_file, algorithm) != expected:
             raise ChecksumMismatchError(f"Checksum mismatch for {src_rel}")
 
 
+def _same_device(src: Path, dst_parent: Path) -> bool:
+    try:
+        return os.stat(src).st_dev == os.stat(dst_parent).st_dev
+    except OSError:
+        return False
+
+
 def _same_filesystem(src: Path, dst_parent: Path) -> bool:
     try:
         return os.stat(src).st_dev == os.stat(dst_parent).st_dev
@@ -92,48 +216,576 @@ def _same_filesystem(src: Path, dst_parent: Path) -> bool:
         raise AtomicMoveError(f"Cannot stat path during move: {exc}") from exc
 
 
-def atomic_move(source: Path | str, destination: Path | str, *, checksum: str = "sha256") -> None:
-    """Move ``source`` to ``destination`` safely, even across filesystems."""
+@dataclass
+class _PlannedFile:
+    rel: str
+    source: Path
+    size: int
+    mtime_ns: int
+
+
+@dataclass
+class _Capabilities:
+    """Staging methods still worth trying; disabled after the first refusal."""
+
+    hardlink: bool = True
+    reflink: bool = fcntl is not None
+    copy_file_range: bool = hasattr(os, "copy_file_range")
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def disable(self, name: str, exc: OSError) -> None:
+        with self.lock:
+            if getattr(self, name):
+                LOGGER.debug("Disabling %s staging for this move: %s", name, exc)
+                setattr(self, name, False)
+
+
+class _ProgressMeter:
+    def __init__(
+        self,
+        callback: Optional[ProgressCallback],
+        *,
+        bytes_total: int,
+        files_total: int,
+    ) -> None:
+        self._callback = callback
+        self._lock = threading.Lock()
+        self._started = time.monotonic()
+        self._last_emit = 0.0
+        self.bytes_total = bytes_total
+        self.files_total = files_total
+        self.bytes_done = 0
+        self.files_done = 0
+
+    def advance(self, size: int = 0, *, files: int = 0) -> None:
+        with self._lock:
+            self.bytes_done += size
+            self.files_done += files
+            now = time.monotonic()
+            finished = self.files_done >= self.files_total
+            if self._callback is None or (
+                not finished and now - self._last_emit < PROGRESS_INTERVAL_SECONDS
+            ):
+                return
+            self._last_emit = now
+            snapshot = MoveProgress(
+                bytes_done=self.bytes_done,
+                bytes_total=self.bytes_total,
+                files_done=self.files_done,
+                files_total=self.files_total,
+                elapsed_seconds=now - self._started,
+            )
+        try:
+            self._callback(snapshot)
+        except Exception:  # pragma: no cover - progress must never break a move
+            LOGGER.debug("Move progress callback failed", exc_info=True)
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self._started
+
+
+_COMMITTED_LINE = json.dumps({"committed": True}, separators=(",", ":"))
+
+
+class _Manifest:
+    """Append-only record of files already staged for one move."""
+
+    def __init__(self, path: Path, *, source: Path, checksum: Optional[str]) -> None:
+        self.path = path
+        self._header = {
+            "version": MANIFEST_VERSION,
+            "source": str(source),
+            "checksum": checksum,
+        }
+        self._lock = threading.Lock()
+
+    def load(self) -> Optional[Dict[str, dict]]:
+        """Return completed entries, or ``None`` when the manifest is absent or foreign."""
+
+        try:
+            lines = self.path.read_text(encoding="utf-8").splitlines()
+        except FileNotFoundError:
+            return None
+        if not lines:
+            return None
+        try:
+            header = json.loads(lines[0])
+        except ValueError:
+            return None
+        if header != self._header:
+            return None
+        entries: Dict[str, dict] = {}
+        for line in lines[1:]:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                break  # torn final line from an interrupted append
+            if isinstance(record, dict) and isinstance(record.get("path"), str):
+                entries[record["path"]] = record
+        return entries
+
+    def committed(self) -> bool:
+        """Return whether this move's final rename was recorded as done."""
+
+        try:
+            lines = self.path.read_text(encoding="utf-8").splitlines()
+        except FileNotFoundError:
+            return False
+        if not lines or lines[-1].strip() != _COMMITTED_LINE:
+            return False
+        try:
+            return json.loads(lines[0]) == self._header
+        except ValueError:
+            return False
+
+    def commit(self) -> None:
+        """Durably record that the staged tree was renamed into place."""
+
+        with self._lock:
+            with self.path.open("a", encoding="utf-8") as handle:
+                handle.write(_COMMITTED_LINE + "\n")
+                handle.flush()
+                os.fsync(handle.fileno())
+
+    def start(self) -> None:
+        self.path.write_text(json.dumps(self._header) + "\n", encoding="utf-8")
+
+    def append(self, record: dict) -> None:
+        line = json.dumps(record, separators=(",", ":")) + "\n"
+        with self._lock:
+            with self.path.open("a", encoding="utf-8") as handle:
+                handle.write(line)
+                handle.flush()
+                os.fsync(handle.fileno())
+
+    def remove(self) -> None:
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def _plan(src_path: Path) -> Tuple[List[_PlannedFile], List[str]]:
+    if not src_path.is_dir():
+        stat_result = os.stat(src_path)
+        return [_PlannedFile(".", src_path, stat_result.st_size, stat_result.st_mtime_ns)], []
+
+    files: List[_PlannedFile] = []
+    directories: List[str] = []
+    for current, dirnames, filenames in os.walk(src_path, followlinks=True):
+        dirnames.sort()
+        current_path = Path(current)
+        rel_dir = current_path.relative_to(src_path)
+        if rel_dir != Path("."):
+            directories.append(rel_dir.as_posix())
+        for name in sorted(filenames):
+            file_path = current_path / name
+            stat_result = os.stat(file_path)
+            files.append(
+                _PlannedFile(
+                    (rel_dir / name).as_posix(),
+                    file_path,
+                    stat_result.st_size,
+                    stat_result.st_mtime_ns,
+                )
+            )
+    return files, directories
+
+
+def _staged_path(partial_root: Path, rel: str) -> Path:
+    return partial_root if rel == "." else partial_root / rel
+
+
+def _remove_path(path: Path) -> None:
+    if path.is_dir() and not path.is_symlink():
+        shutil.rmtree(path, ignore_errors=True)
+        return
+    try:
+        path.unlink()
+    except FileNotFoundError:
+        pass
+
+
+def _try_hardlink(planned: _PlannedFile, target: Path, caps: _Capabilities) -> bool:
+    if not caps.hardlink:
+        return False
+    try:
+        os.link(planned.source, target)
+    except OSError as exc:
+        if exc.errno not in _UNSUPPORTED_ERRNOS:
+            raise
+        caps.disable("hardlink", exc)
+        return False
+    return True
+
+
+def _try_reflink(planned: _PlannedFile, target: Path, caps: _Capabilities) -> bool:
+    if not caps.reflink:
+        return False
+    try:
+        with open(planned.source, "rb") as reader, open(target, "wb") as writer:
+            fcntl.ioctl(writer.fileno(), _FICLONE, reader.fileno())
+    except OSError as exc:
+        _remove_path(target)
+        if exc.errno not in _UNSUPPORTED_ERRNOS:
+            raise
+        caps.disable("reflink", exc)
+        return False
+    shutil.copystat(planned.source, target)
+    return True
+
+
+def _copy_range(reader, writer, size: int, caps: _Capabilities, meter: _ProgressMeter) -> int:
+    """Copy with ``copy_file_range``; returns 0 when the kernel declines."""
+
+    copied = 0
+    try:
+        while copied < size:
+            sent = os.copy_file_range(
+                reader.fileno(), writer.fileno(), min(COPY_BUFFER_SIZE, size - copied)
+            )
+            if sent == 0:
+                break
+            copied += sent
+            meter.advance(sent)
+    except OSError as exc:
+        if exc.errno not in _UNSUPPORTED_ERRNOS or copied:
+            raise
+        caps.disable("copy_file_range", exc)
+    return copied
+
+
+def _copy_file(
+    planned: _PlannedFile,
+    target: Path,
+    caps: _Capabilities,
+    *,
+    checksum: Optional[str],
+    meter: _ProgressMeter,
+) -> Optional[str]:
+    hasher = hashlib.new(checksum) if checksum else None
+    copied = 0
+    with open(planned.source, "rb") as reader, open(target, "wb") as writer:
+        if hasher is None and caps.copy_file_range:
+            copied = _copy_range(reader, writer, planned.size, caps, meter)
+        if copied == 0:
+            buffer = bytearray(COPY_BUFFER_SIZE)
+            view = memoryview(buffer)
+            while True:
+                count = reader.readinto(buffer)
+                if not count:
+                    break
+                chunk = view[:count]
+                if hasher is not None:
+                    hasher.update(chunk)
+                writer.write(chunk)
+                copied += count
+                meter.advance(count)
+        writer.flush()
+        os.fsync(writer.fileno())
+    shutil.copystat(planned.source, target)
+    after = os.stat(planned.source)
+    if copied != planned.size or (after.st_size, after.st_mtime_ns) != (planned.size, planned.mtime_ns):
+        raise ChecksumMismatchError(f"Source file changed during move: {planned.rel}")
+    return hasher.hexdigest() if hasher is not None else None
+
+
+def _stage_file(
+    planned: _PlannedFile,
+    partial_root: Path,
+    caps: _Capabilities,
+    *,
+    checksum: Optional[str],
+    meter: _ProgressMeter,
+    manifest: _Manifest,
+    abort: threading.Event,
+) -> Optional[str]:
+    if abort.is_set():
+        return None
+    try:
+        return _stage_file_unchecked(
+            planned, partial_root, caps, checksum=checksum, meter=meter, manifest=manifest
+        )
+    except BaseException:
+        abort.set()
+        raise
+
+
+def _stage_file_unchecked(
+    planned: _PlannedFile,
+    partial_root: Path,
+    caps: _Capabilities,
+    *,
+    checksum: Optional[str],
+    meter: _ProgressMeter,
+    manifest: _Manifest,
+) -> str:
+    target = _staged_path(partial_root, planned.rel)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    if target.exists() or target.is_symlink():
+        target.unlink()
+
+    digest: Optional[str] = None
+    if _try_hardlink(planned, target, caps):
+        method = "hardlink"
+        meter.advance(planned.size)
+    elif _try_reflink(planned, target, caps):
+        method = "reflink"
+        meter.advance(planned.size)
+    else:
+        method = "copy"
+        digest = _copy_file(planned, target, caps, checksum=checksum, meter=meter)
+    manifest.append(
+        {
+            "path": planned.rel,
+            "size": planned.size,
+            "mtime_ns": planned.mtime_ns,
+            "method": method,
+            "digest": digest,
+        }
+    )
+    meter.advance(files=1)
+    return method
+
+
+def _is_resumable(planned: _PlannedFile, record: Optional[dict], partial_root: Path) -> bool:
+    if record is None:
+        return False
+    if record.get("size") != planned.size or record.get("mtime_ns") != planned.mtime_ns:
+        return False
+    try:
+        return os.stat(_staged_path(partial_root, planned.rel)).st_size == planned.size
+    except OSError:
+        return False
+
+
+def _fsync_directory(path: Path) -> None:
+    try:
+        descriptor = os.open(path, os.O_RDONLY)
+    except OSError:  # pragma: no cover - platform dependent
+        return
+    try:
+        os.fsync(descriptor)
+    except OSError:  # pragma: no cover - platform dependent
+        pass
+    finally:
+        os.close(descriptor)
+
+
+def _remove_source(src_path: Path) -> None:
+    if src_path.is_dir() and not src_path.is_symlink():
+        shutil.rmtree(src_path)
+    elif src_path.exists() or src_path.is_symlink():
+        src_path.unlink()
+
+
+def atomic_move(
+    source: Path | str,
+    destination: Path | str,
+    *,
+    checksum: Optional[str] = "sha256",
+    verify: bool = True,
+    io_parallelism: Optional[int] = None,
+    progress: Optional[ProgressCallback] = None,
+    resume: bool = True,
+) -> MoveResult:
+    """Move ``source`` to ``destination`` safely, even across filesystems.
+
+    ``checksum`` names the hash computed while copying; with ``verify`` (the
+    default) every staged file is hashed again and compared with it before
+    the final rename.  ``checksum=None`` enables ``copy_file_range`` and
+    verification then hashes both sides with SHA-256.  ``progress``
+    receives :class:`MoveProgress` snapshots from worker threads.  With
+    ``resume`` (the default) an interrupted move keeps its staged files and
+    continues from them on the next call with the same source.
+    """
 
     src_path = Path(source)
     dst_path = Path(destination)
+    dst_parent = dst_path.parent
+    partial_root = dst_parent / f".{dst_path.name}.partial"
+    manifest = _Manifest(
+        dst_parent / f".{dst_path.name}.move.jsonl",
+        source=src_path.absolute(),
+        checksum=checksum,
+    )
+
+    if dst_path.exists() and manifest.committed():
+        # Interrupted after the committed final rename; only source cleanup is left.
+        _remove_source(src_path)
+        manifest.remove()
+        return MoveResult(method="transfer")
 
     if not src_path.exists():
         raise FileNotFoundError(f"Source path {src_path} does not exist")
 
-    dst_parent = dst_path.parent
     dst_parent.mkdir(parents=True, exist_ok=True)
 
     if dst_path.exists():
         raise AtomicMoveError(f"Destination path {dst_path} already exists")
 
     if _same_filesystem(src_path, dst_parent):
-        src_path.replace(dst_path)
-        return
-
-    temp_name = f".tmp-{uuid4().hex}"
-    temp_path = dst_parent / f"{dst_path.name}{temp_name}"
+        try:
+            src_path.replace(dst_path)
+        except OSError as exc:
+            # Bind mounts share st_dev but still refuse cross-mount renames;
+            # staging tries hardlinks before copying.
+            if exc.errno not in _RENAME_FALLBACK_ERRNOS:
+                raise
+        else:
+            return MoveResult(method="rename")
+
+    return _transfer(
+        src_path,
+        dst_path,
+        partial_root=partial_root,
+        manifest=manifest,
+        checksum=checksum,
+        verify=verify,
+        io_parallelism=resolve_io_parallelism(io_parallelism),
+        progress=progress,
+        resume=resume,
+    )
+
+
+def _transfer(
+    src_path: Path,
+    dst_path: Path,
+    *,
+    partial_root: Path,
+    manifest: _Manifest,
+    checksum: Optional[str],
+    verify: bool,
+    io_parallelism: int,
+    progress: Optional[ProgressCallback],
+    resume: bool,
+) -> MoveResult:
+    completed = manifest.load() if resume else None
+    if completed is None:
+        _remove_path(partial_root)
+        completed = {}
+        manifest.start()
 
     try:
+        files, directories = _plan(src_path)
         if src_path.is_dir():
-            shutil.copytree(src_path, temp_path)
-        else:
-            shutil.copy2(src_path, temp_path)
-
-        _verify_copy(src_path, temp_path, checksum)
-        temp_path.replace(dst_path)
+            partial_root.mkdir(exist_ok=True)
+            for rel_dir in directories:
+                (partial_root / rel_dir).mkdir(parents=True, exist_ok=True)
+
+        meter = _ProgressMeter(
+            progress,
+            bytes_total=sum(planned.size for planned in files),
+            files_total=len(files),
+        )
+        pending: List[_PlannedFile] = []
+        resumed = 0
+        for planned in files:
+            if _is_resumable(planned, completed.get(planned.rel), partial_root):
+                resumed += 1
+                meter.advance(planned.size, files=1)
+            else:
+                pending.append(planned)
+        # Largest first keeps the workers busy until the end.
+        pending.sort(key=lambda planned: planned.size, reverse=True)
+
+        caps = _Capabilities()
+        if not _same_device(src_path, partial_root.parent):
+            # link() across devices always fails with EXDEV; skip the probe.
+            caps.hardlink = False
+        counts = {"hardlink": 0, "reflink": 0, "copy": 0}
+        abort = threading.Event()
+        if pending:
+            with ThreadPoolExecutor(
+                max_workers=min(io_parallelism, len(pending)),
+                thread_name_prefix="atomic-move",
+            ) as executor:
+                futures = [
+                    executor.submit(
+                        _stage_file,
+                        planned,
+                        partial_root,
+                        caps,
+                        checksum=checksum,
+                        meter=meter,
+                        manifest=manifest,
+                        abort=abort,
+                    )
+                    for planned in pending
+                ]
+                try:
+                    for future in as_completed(futures):
+                        method = future.result()
+                        if method is not None:
+                            counts[method] += 1
+                except BaseException:
+                    abort.set()
+                    raise
 
         if src_path.is_dir():
-            shutil.rmtree(src_path)
+            for rel_dir in sorted(directories, key=lambda value: value.count("/"), reverse=True):
+                shutil.copystat(src_path / rel_dir, partial_root / rel_dir)
+            shutil.copystat(src_path, partial_root)
+
+        if verify:
+            staged = manifest.load() or {}
+            digests = {
+                unicodedata.normalize("NFC", rel): record["digest"]
+                for rel, record in staged.items()
+                if checksum and isinstance(record.get("digest"), str)
+            }
+            _verify_copy(src_path, partial_root, checksum or "sha256", digests)
+
+        partial_root.replace(dst_path)
+        _fsync_directory(dst_path.parent)
+        manifest.commit()
+    except AtomicMoveError:
+        _remove_path(partial_root)
+        manifest.remove()
+        raise
+    except BaseException:
+        if not resume:
+            _remove_path(partial_root)
+            manifest.remove()
         else:
-            src_path.unlink()
-    except Exception:
-        if temp_path.exists():
-            if temp_path.is_dir():
-                shutil.rmtree(temp_path, ignore_errors=True)
-            else:
-                try:
-                    temp_path.unlink()
-                except OSError:
-                    pass
+            LOGGER.warning("Move of %s interrupted; staged files kept for resume", src_path)
         raise
+
+    _remove_source(src_path)
+    manifest.remove()
+    result = MoveResult(
+        method="transfer",
+        files=len(files),
+        bytes=meter.bytes_total,
+        hardlinked=counts["hardlink"],
+        reflinked=counts["reflink"],
+        copied=counts["copy"],
+        resumed=resumed,
+        elapsed_seconds=meter.elapsed,
+    )
+    LOGGER.debug(
+        "Moved %s to %s: %d files, %d bytes (%d hardlinked, %d reflinked, %d copied, %d resumed) in %.2fs",
+        src_path,
+        dst_path,
+        result.files,
+        result.bytes,
+        result.hardlinked,
+        result.reflinked,
+        result.copied,
+        result.resumed,
+        result.elapsed_seconds,
+    )
+    return result
+
+
+__all__ = [
+    "AtomicMoveError",
+    "ChecksumMismatchError",
+    "DEFAULT_IO_PARALLELISM",
+    "MOVE_PARALLELISM_ENV",
+    "MoveProgress",
+    "MoveResult",
+    "atomic_move",
+    "resolve_io_parallelism",
+]
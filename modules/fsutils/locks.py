@@ -1,19 +1,291 @@
-"""Simple advisory locking primitives backed by on-disk lock files."""
+"""Advisory directory locks backed by ``flock`` on an on-disk lock file.
+
+:class:`DirectoryLock` opens ``<directory>/.lock`` and takes an exclusive
+``fcntl.flock`` on it, so waiters sleep in the kernel and wake up as soon as
+the holder releases, and a crashed holder's lock disappears with its process.
+Timed waits park the blocking ``flock`` on a helper thread.  The lock file is
+unlinked on release; acquirers re-check that the path still names the inode
+they locked, which keeps unlink-on-release race free.
+
+Lock files written by the previous ``O_CREAT | O_EXCL`` implementation
+(``"<pid>:<timestamp>"``) carry no kernel lock.  They are honoured while the
+recorded PID is alive on this host and reclaimed otherwise.  Platforms without
+``fcntl`` keep using the exclusive-create protocol.
+
+Wait and hold times are recorded per lock path (see :func:`lock_metrics`) and
+exported to Prometheus per ``scope`` when the web metrics are loaded.
+"""
 
 from __future__ import annotations
 
 import os
+import socket
+import sys
+import threading
 import time
+from collections import OrderedDict
 from contextlib import contextmanager
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Iterator, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
+
+try:  # pragma: no cover - platform dependent
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+from modules import logging_manager
+
+LOGGER = logging_manager.get_logger().getChild("fsutils.locks")
+
+# Upper bounds (seconds) of the wait/hold histogram buckets.
+LOCK_TIME_BUCKETS: Tuple[float, ...] = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0, 120.0)
+MAX_TRACKED_PATHS = 512
+# Legacy lock files this young may still be half-written by their creator.
+LEGACY_GRACE_SECONDS = 5.0
+
+_HOSTNAME = socket.gethostname()
+_FLOCK_MARKER = "flock"
 
 
 class LockAcquisitionError(RuntimeError):
     """Raised when a lock cannot be acquired within the requested constraints."""
 
 
+@dataclass
+class LockTimeHistogram:
+    """Non-cumulative bucket counts for one timing series."""
+
+    counts: List[int] = field(default_factory=lambda: [0] * (len(LOCK_TIME_BUCKETS) + 1))
+    total: float = 0.0
+    samples: int = 0
+    maximum: float = 0.0
+
+    def observe(self, value: float) -> None:
+        index = len(LOCK_TIME_BUCKETS)
+        for position, bound in enumerate(LOCK_TIME_BUCKETS):
+            if value <= bound:
+                index = position
+                break
+        self.counts[index] += 1
+        self.total += value
+        self.samples += 1
+        self.maximum = max(self.maximum, value)
+
+    def as_dict(self) -> Dict[str, object]:
+        buckets = {str(bound): count for bound, count in zip(LOCK_TIME_BUCKETS, self.counts)}
+        buckets["+Inf"] = self.counts[-1]
+        return {
+            "buckets": buckets,
+            "count": self.samples,
+            "sum": self.total,
+            "max": self.maximum,
+        }
+
+
+@dataclass
+class LockPathStats:
+    """Contention statistics for one lock file."""
+
+    scope: str
+    acquisitions: int = 0
+    contended: int = 0
+    timeouts: int = 0
+    stale_recovered: int = 0
+    wait: LockTimeHistogram = field(default_factory=LockTimeHistogram)
+    hold: LockTimeHistogram = field(default_factory=LockTimeHistogram)
+
+    def as_dict(self) -> Dict[str, object]:
+        return {
+            "scope": self.scope,
+            "acquisitions": self.acquisitions,
+            "contended": self.contended,
+            "timeouts": self.timeouts,
+            "stale_recovered": self.stale_recovered,
+            "wait_seconds": self.wait.as_dict(),
+            "hold_seconds": self.hold.as_dict(),
+        }
+
+
+_STATS_LOCK = threading.Lock()
+_STATS: "OrderedDict[str, LockPathStats]" = OrderedDict()
+
+
+def _path_stats(path: Path, scope: str) -> LockPathStats:
+    key = str(path)
+    stats = _STATS.get(key)
+    if stats is None:
+        stats = LockPathStats(scope=scope)
+        _STATS[key] = stats
+        while len(_STATS) > MAX_TRACKED_PATHS:
+            _STATS.popitem(last=False)
+    else:
+        _STATS.move_to_end(key)
+    return stats
+
+
+def _record(path: Path, scope: str, kind: str, seconds: float = 0.0, *, contended: bool = False) -> None:
+    with _STATS_LOCK:
+        stats = _path_stats(path, scope)
+        if kind == "wait":
+            stats.acquisitions += 1
+            stats.contended += int(contended)
+            stats.wait.observe(seconds)
+        elif kind == "hold":
+            stats.hold.observe(seconds)
+        elif kind == "timeout":
+            stats.timeouts += 1
+        elif kind == "stale":
+            stats.stale_recovered += 1
+    _export(scope, kind, seconds)
+
+
+_metrics_bridge: Optional[Dict[str, object]] = None
+
+
+def _get_metrics_bridge() -> Dict[str, object]:
+    """Return the Prometheus collectors once the web metrics module is loaded.
+
+    Locks are taken by CLI workers too, so the web application is never
+    imported from here just to export lock timings.
+    """
+
+    global _metrics_bridge
+    if _metrics_bridge is not None:
+        return _metrics_bridge
+    metrics = sys.modules.get("modules.webapi.metrics")
+    if metrics is None:
+        return {}
+    _metrics_bridge = {
+        key: getattr(metrics, name)
+        for key, name in (
+            ("wait", "FS_LOCK_WAIT"),
+            ("hold", "FS_LOCK_HOLD"),
+            ("events", "FS_LOCK_EVENTS"),
+        )
+        if hasattr(metrics, name)
+    }
+    return _metrics_bridge
+
+
+def _export(scope: str, kind: str, seconds: float) -> None:
+    bridge = _get_metrics_bridge()
+    try:
+        if kind in ("wait", "hold"):
+            histogram = bridge.get(kind)
+            if histogram is not None:
+                histogram.labels(scope=scope).observe(seconds)
+            return
+        counter = bridge.get("events")
+        if counter is not None:
+            counter.labels(scope=scope, event=kind).inc()
+    except Exception:
+        pass
+
+
+def lock_metrics(path: Path | str | None = None) -> Dict[str, Dict[str, object]]:
+    """Return contention statistics keyed by lock file path.
+
+    Only the :data:`MAX_TRACKED_PATHS` most recently used paths are kept.
+    """
+
+    with _STATS_LOCK:
+        if path is not None:
+            stats = _STATS.get(str(Path(path)))
+            return {str(Path(path)): stats.as_dict()} if stats else {}
+        return {key: stats.as_dict() for key, stats in _STATS.items()}
+
+
+def reset_lock_metrics() -> None:
+    with _STATS_LOCK:
+        _STATS.clear()
+
+
+def _pid_alive(pid: int) -> bool:
+    if pid <= 0:
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    except OSError:
+        return False
+    return True
+
+
+def _legacy_holder_alive(content: str, mtime: float) -> bool:
+    """Return ``True`` when a lock file without a kernel lock is still owned.
+
+    Files written by :class:`DirectoryLock` itself (``pid:ts:host:flock``) are
+    only ever found by an acquirer holding the ``flock``, so their writer is
+    gone.  Legacy ``pid:ts`` files are owned while that PID lives on this host.
+    """
+
+    parts = content.strip().split(":")
+    if len(parts) >= 4 and parts[-1] == _FLOCK_MARKER:
+        return False
+    if not content.strip():
+        return time.time() - mtime < LEGACY_GRACE_SECONDS
+    try:
+        pid = int(parts[0])
+    except ValueError:
+        return False
+    if len(parts) >= 3 and parts[2] and parts[2] != _HOSTNAME:
+        # Foreign host: liveness cannot be probed, honour the file.
+        return True
+    return pid != os.getpid() and _pid_alive(pid)
+
+
+def _flock_wait(descriptor: int, timeout: Optional[float]) -> Tuple[bool, bool]:
+    """Take an exclusive ``flock``; returns ``(acquired, contended)``."""
+
+    try:
+        fcntl.flock(descriptor, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return True, False
+    except BlockingIOError:
+        pass
+    if timeout is None:
+        fcntl.flock(descriptor, fcntl.LOCK_EX)
+        return True, True
+    if timeout <= 0:
+        return False, True
+
+    # flock has no timeout; block on a duplicate of the same open file
+    # description in a helper thread and abandon it if the deadline passes.
+    waiter = os.dup(descriptor)
+    condition = threading.Condition()
+    state: Dict[str, object] = {"acquired": False, "cancelled": False, "error": None}
+
+    def _wait() -> None:
+        try:
+            fcntl.flock(waiter, fcntl.LOCK_EX)
+        except OSError as exc:
+            with condition:
+                state["error"] = exc
+                condition.notify_all()
+            os.close(waiter)
+            return
+        with condition:
+            if state["cancelled"]:
+                fcntl.flock(waiter, fcntl.LOCK_UN)
+            else:
+                state["acquired"] = True
+            condition.notify_all()
+        os.close(waiter)
+
+    threading.Thread(target=_wait, name="directory-lock-wait", daemon=True).start()
+    with condition:
+        condition.wait_for(lambda: state["acquired"] or state["error"] is not None, timeout)
+        if state["error"] is not None:
+            raise state["error"]  # type: ignore[misc]
+        if not state["acquired"]:
+            state["cancelled"] = True
+            return False, True
+    return True, True
+
+
 @dataclass
 class DirectoryLock:
     """Create and manage a `.lock` file within a directory."""
@@ -21,6 +293,7 @@ class DirectoryLock:
     target: Path
     filename: str = ".lock"
     poll_interval: float = 0.1
+    scope: str = "directory"
     _locked: bool = False
 
     def __post_init__(self) -> None:
@@ -28,6 +301,9 @@ class DirectoryLock:
         if not self.filename:
             raise ValueError("Lock filename must not be empty")
         self._path = self.target / self.filename
+        self._fd: Optional[int] = None
+        self._token = ""
+        self._acquired_at = 0.0
 
     @property
     def path(self) -> Path:
@@ -35,12 +311,45 @@ class DirectoryLock:
 
         return self._path
 
+    @property
+    def locked(self) -> bool:
+        return self._locked
+
     def relocate(self, new_target: Path | str) -> None:
-        """Point the lock to a new directory without releasing it."""
+        """Point the lock to a new directory without releasing it.
+
+        A cross-device move leaves a copied lock file that nobody holds a
+        ``flock`` on, so the lock is re-taken on the file at the new path.
+        """
 
         new_path = Path(new_target)
         self.target = new_path
         self._path = new_path / self.filename
+        if self._fd is not None:
+            self._rebind_flock()
+
+    def _rebind_flock(self) -> None:
+        held = os.fstat(self._fd)
+        try:
+            current = os.stat(self._path)
+        except FileNotFoundError:
+            current = None
+        if current is not None and (current.st_dev, current.st_ino) == (held.st_dev, held.st_ino):
+            return
+        descriptor = os.open(self._path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(descriptor, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(descriptor)
+            raise LockAcquisitionError(f"Lock at {self._path} was taken while it was being moved")
+        self._token = f"{os.getpid()}:{time.time():.6f}:{_HOSTNAME}:{_FLOCK_MARKER}\n"
+        os.ftruncate(descriptor, 0)
+        os.pwrite(descriptor, self._token.encode("utf-8"), 0)
+        previous, self._fd = self._fd, descriptor
+        try:
+            fcntl.flock(previous, fcntl.LOCK_UN)
+        finally:
+            os.close(previous)
 
     def acquire(self, *, blocking: bool = True, timeout: Optional[float] = None) -> None:
         """Attempt to acquire the lock, optionally waiting until it becomes available."""
@@ -49,38 +358,138 @@ class DirectoryLock:
             return
 
         self.target.mkdir(parents=True, exist_ok=True)
-        deadline = None if timeout is None else time.monotonic() + max(timeout, 0.0)
+        started = time.monotonic()
+        deadline = None if timeout is None else started + max(timeout, 0.0)
+        if not blocking:
+            deadline = started
+        try:
+            if fcntl is None:  # pragma: no cover - platform dependent
+                contended = self._acquire_exclusive_create(deadline, blocking)
+            else:
+                contended = self._acquire_flock(deadline, blocking)
+        except LockAcquisitionError:
+            _record(self._path, self.scope, "timeout")
+            raise
+        self._locked = True
+        self._acquired_at = time.monotonic()
+        _record(self._path, self.scope, "wait", self._acquired_at - started, contended=contended)
+
+    def _remaining(self, deadline: Optional[float]) -> Optional[float]:
+        return None if deadline is None else max(deadline - time.monotonic(), 0.0)
+
+    def _fail(self, blocking: bool) -> LockAcquisitionError:
+        if blocking:
+            return LockAcquisitionError(f"Timed out waiting for lock at {self._path}")
+        return LockAcquisitionError(f"Lock already held at {self._path}")
 
+    def _acquire_flock(self, deadline: Optional[float], blocking: bool) -> bool:
+        contended = False
         while True:
+            descriptor = os.open(self._path, os.O_RDWR | os.O_CREAT, 0o644)
             try:
-                fd = os.open(self._path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
-            except FileExistsError:
-                if not blocking:
-                    raise LockAcquisitionError(f"Lock already held at {self._path}")
-                if deadline is not None and time.monotonic() >= deadline:
-                    raise LockAcquisitionError(f"Timed out waiting for lock at {self._path}")
-                time.sleep(self.poll_interval)
+                acquired, waited = _flock_wait(descriptor, self._remaining(deadline))
+            except BaseException:
+                os.close(descriptor)
+                raise
+            contended = contended or waited
+            if not acquired:
+                os.close(descriptor)
+                raise self._fail(blocking)
+
+            held = os.fstat(descriptor)
+            try:
+                current = os.stat(self._path)
+            except FileNotFoundError:
+                current = None
+            if current is None or (current.st_dev, current.st_ino) != (held.st_dev, held.st_ino):
+                # The previous holder unlinked the file we waited on; start over.
+                os.close(descriptor)
                 continue
 
-            with os.fdopen(fd, "w", encoding="utf-8") as handle:
-                handle.write(f"{os.getpid()}:{time.time():.6f}\n")
-                handle.flush()
-                os.fsync(handle.fileno())
+            content = os.pread(descriptor, 256, 0).decode("utf-8", errors="replace")
+            if content.strip() and _legacy_holder_alive(content, held.st_mtime):
+                os.close(descriptor)
+                contended = True
+                remaining = self._remaining(deadline)
+                if remaining == 0.0:
+                    raise self._fail(blocking)
+                time.sleep(self.poll_interval if remaining is None else min(self.poll_interval, remaining))
+                continue
+            if content.strip():
+                LOGGER.info("Recovered stale lock file at %s (%s)", self._path, content.strip())
+                _record(self._path, self.scope, "stale")
 
-            self._locked = True
-            return
+            self._token = f"{os.getpid()}:{time.time():.6f}:{_HOSTNAME}:{_FLOCK_MARKER}\n"
+            os.ftruncate(descriptor, 0)
+            os.pwrite(descriptor, self._token.encode("utf-8"), 0)
+            self._fd = descriptor
+            return contended
+
+    def _acquire_exclusive_create(self, deadline: Optional[float], blocking: bool) -> bool:  # pragma: no cover
+        contended = False
+        while True:
+            try:
+                descriptor = os.open(self._path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            except FileExistsError:
+                contended = True
+                try:
+                    stat_result = os.stat(self._path)
+                    content = self._path.read_text(encoding="utf-8", errors="replace")
+                except FileNotFoundError:
+                    continue
+                if not _legacy_holder_alive(content, stat_result.st_mtime):
+                    LOGGER.info("Recovered stale lock file at %s", self._path)
+                    _record(self._path, self.scope, "stale")
+                    try:
+                        self._path.unlink()
+                    except FileNotFoundError:
+                        pass
+                    continue
+                remaining = self._remaining(deadline)
+                if remaining == 0.0:
+                    raise self._fail(blocking)
+                time.sleep(self.poll_interval if remaining is None else min(self.poll_interval, remaining))
+                continue
+            self._token = f"{os.getpid()}:{time.time():.6f}:{_HOSTNAME}\n"
+            with os.fdopen(descriptor, "w", encoding="utf-8") as handle:
+                handle.write(self._token)
+            return contended
 
     def release(self) -> None:
         """Release the lock if it is currently held."""
 
         if not self._locked:
             return
+        descriptor, self._fd = self._fd, None
+        try:
+            self._unlink_own_file(descriptor)
+        finally:
+            if descriptor is not None:
+                try:
+                    fcntl.flock(descriptor, fcntl.LOCK_UN)
+                finally:
+                    os.close(descriptor)
+            self._locked = False
+            _record(self._path, self.scope, "hold", time.monotonic() - self._acquired_at)
+
+    def _unlink_own_file(self, descriptor: Optional[int]) -> None:
+        try:
+            current = os.stat(self._path)
+        except FileNotFoundError:
+            return
+        if descriptor is not None:
+            held = os.fstat(descriptor)
+            if (current.st_dev, current.st_ino) != (held.st_dev, held.st_ino):
+                # Relocated by a cross-device move: only remove our own copy.
+                try:
+                    if self._path.read_text(encoding="utf-8", errors="replace") != self._token:
+                        return
+                except FileNotFoundError:
+                    return
         try:
             self._path.unlink()
         except FileNotFoundError:
             pass
-        finally:
-            self._locked = False
 
     def __enter__(self) -> "DirectoryLock":
         self.acquire()
@@ -0,0 +1,132 @@
+"""Hierarchical, cursor-paginated group browsing for the library index.
+
+The grouped library views (``by_author``, ``by_genre``, ``by_language``) are
+three-level hierarchies that end in item lists.  Repositories answer one level
+at a time: ``path`` holds the labels already expanded, the next level's group
+headers (label, item count, latest update) are computed in SQL, and once the
+path is complete the matching items are returned a page at a time.  Cursors are
+opaque keyset tokens, so deep pages cost the same as the first one.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from conf.sync_config import UNKNOWN_AUTHOR, UNKNOWN_GENRE
+
+from .library_models import LibraryEntry
+
+GROUP_HIERARCHIES: Dict[str, Tuple[str, ...]] = {
+    "by_author": ("author", "book_title", "language"),
+    "by_genre": ("genre", "author", "book_title"),
+    "by_language": ("language", "author", "book_title"),
+}
+
+# Labels used for blank values; they match the in-memory grouping helpers.
+GROUP_FALLBACK_LABELS: Dict[str, str] = {
+    "author": UNKNOWN_AUTHOR.replace("_", " "),
+    "book_title": "Untitled Book",
+    "genre": UNKNOWN_GENRE,
+    "language": "",
+}
+
+DEFAULT_GROUP_LIMIT = 50
+MAX_GROUP_LIMIT = 200
+
+
+class GroupQueryError(ValueError):
+    """Raised for unknown views, over-long paths or malformed cursors."""
+
+
+@dataclass(frozen=True)
+class LibraryGroup:
+    """Header for one group at the requested level."""
+
+    label: str
+    count: int
+    latest_updated_at: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class LibraryGroupPage:
+    """One page of group headers, or of items once ``path`` is complete."""
+
+    view: str
+    path: Tuple[str, ...]
+    level: Optional[str]
+    total: int
+    groups: List[LibraryGroup] = field(default_factory=list)
+    items: List[LibraryEntry] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class GroupLevel:
+    """Resolved position in a view hierarchy."""
+
+    view: str
+    parents: Tuple[Tuple[str, str], ...]
+    field: Optional[str]
+
+    @property
+    def path(self) -> Tuple[str, ...]:
+        return tuple(value for _, value in self.parents)
+
+
+def resolve_group_level(view: str, path: Sequence[str] = ()) -> GroupLevel:
+    """Return the field grouped at ``path`` in ``view`` (``None`` for items)."""
+
+    hierarchy = GROUP_HIERARCHIES.get(view)
+    if hierarchy is None:
+        raise GroupQueryError(f"Unsupported grouped view: {view!r}")
+    if len(path) > len(hierarchy):
+        raise GroupQueryError(f"View {view!r} has only {len(hierarchy)} levels")
+    parents = tuple(zip(hierarchy, (str(value) for value in path)))
+    level_field = hierarchy[len(path)] if len(path) < len(hierarchy) else None
+    return GroupLevel(view=view, parents=parents, field=level_field)
+
+
+def normalize_group_limit(limit: Optional[int]) -> int:
+    if limit is None:
+        return DEFAULT_GROUP_LIMIT
+    return max(1, min(int(limit), MAX_GROUP_LIMIT))
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    payload = json.dumps(list(values), separators=(",", ":"), ensure_ascii=False)
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(token: Optional[str], *, size: int) -> Optional[List[Any]]:
+    """Decode a cursor from :func:`encode_cursor`; ``size`` is the expected arity."""
+
+    if not token:
+        return None
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8"))
+    except (binascii.Error, UnicodeError, ValueError) as exc:
+        raise GroupQueryError("Malformed group cursor") from exc
+    if not isinstance(values, list) or len(values) != size:
+        raise GroupQueryError("Malformed group cursor")
+    return values
+
+
+__all__ = [
+    "DEFAULT_GROUP_LIMIT",
+    "GROUP_FALLBACK_LABELS",
+    "GROUP_HIERARCHIES",
+    "GroupLevel",
+    "GroupQueryError",
+    "LibraryGroup",
+    "LibraryGroupPage",
+    "MAX_GROUP_LIMIT",
+    "decode_cursor",
+    "encode_cursor",
+    "normalize_group_limit",
+    "resolve_group_level",
+]
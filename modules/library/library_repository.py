@@ -14,7 +14,18 @@ from modules.library.sync import metadata as metadata_utils
 from modules.permissions import resolve_access_policy
 from modules.services.source_discovery import safe_iterdir, safe_stat
 
+from .library_groups import (
+    GROUP_FALLBACK_LABELS,
+    GroupLevel,
+    LibraryGroup,
+    LibraryGroupPage,
+    decode_cursor,
+    encode_cursor,
+    normalize_group_limit,
+    resolve_group_level,
+)
 from .library_models import LibraryEntry, MetadataSnapshot
+from .sqlite_pool import SQLiteConnectionManager
 
 MIGRATIONS_DIR = Path(__file__).resolve().parent / "migrations"
 UUID_PATTERN = re.compile(
@@ -50,19 +61,30 @@ class LibraryRepository:
         self._state_dir = self._library_root / ".library"
         self._state_dir.mkdir(parents=True, exist_ok=True)
         self._db_path = self._state_dir / "library.db"
+        self._connections = SQLiteConnectionManager(
+            self._db_path,
+            migrate=self._apply_migrations,
+        )
 
     @property
     def db_path(self) -> Path:
         return self._db_path
 
+    @property
+    def connections(self) -> SQLiteConnectionManager:
+        return self._connections
+
     def connect(self) -> sqlite3.Connection:
-        connection = sqlite3.connect(
-            str(self._db_path),
-            detect_types=sqlite3.PARSE_DECLTYPES,
-        )
-        connection.row_factory = sqlite3.Row
-        self._apply_migrations(connection)
-        return connection
+        """Return a new, caller-owned connection with migrations applied.
+
+        Repository methods use the pooled :attr:`connections` instead; this
+        stays for tooling that needs a private connection.
+        """
+
+        return self._connections.open_connection()
+
+    def close(self) -> None:
+        self._connections.close()
 
     def list_entries(
         self,
@@ -98,7 +120,7 @@ class LibraryRepository:
         query_params = dict(params)
         query_params.update({"limit": limit, "offset": offset})
 
-        with self.connect() as connection:
+        with self._connections.reader() as connection:
             cursor = connection.execute(sql, query_params)
             rows = cursor.fetchall()
         return [self._row_to_entry(row) for row in rows]
@@ -123,13 +145,175 @@ class LibraryRepository:
             {join_sql}
             {where_prefix}
         """
-        with self.connect() as connection:
+        with self._connections.reader() as connection:
             cursor = connection.execute(sql, params)
             row = cursor.fetchone()
         return int(row["total"]) if row and row["total"] is not None else 0
 
+    def list_groups(
+        self,
+        *,
+        view: str,
+        path: Sequence[str] = (),
+        query: Optional[str] = None,
+        filters: Mapping[str, Optional[str]] | None = None,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+        sort_desc: bool = True,
+        user_id: Optional[str] = None,
+        user_role: Optional[str] = None,
+    ) -> LibraryGroupPage:
+        """Return one page of group headers (or leaf items) for a grouped view."""
+
+        level = resolve_group_level(view, path)
+        page_size = normalize_group_limit(limit)
+        join_sql, where_sql, params = self._compose_filters(query, filters or {})
+        clauses = [where_sql] if where_sql else []
+        access_sql, access_params = self._compose_access_filter(user_id, user_role)
+        if access_sql:
+            clauses.append(access_sql)
+            params.update(access_params)
+        clauses.extend(self._compose_group_path(level, params))
+
+        if level.field is None:
+            return self._list_group_items(
+                level, join_sql, clauses, params, cursor, page_size, sort_desc
+            )
+
+        label_sql = f"COALESCE(NULLIF(library_items.{level.field}, ''), :group_fallback)"
+        params["group_fallback"] = GROUP_FALLBACK_LABELS[level.field]
+        where_prefix = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        total_sql = f"""
+            SELECT COUNT(DISTINCT {label_sql}) AS total
+            FROM library_items
+            {join_sql}
+            {where_prefix}
+        """
+        after = decode_cursor(cursor, size=1)
+        if after is not None:
+            clauses.append(f"{label_sql} > :group_after")
+            params["group_after"] = str(after[0])
+        where_prefix = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        sql = f"""
+            SELECT {label_sql} AS label,
+                   COUNT(*) AS total,
+                   MAX(library_items.updated_at) AS latest_updated_at
+            FROM library_items
+            {join_sql}
+            {where_prefix}
+            GROUP BY label
+            ORDER BY label
+            LIMIT :group_limit
+        """
+        query_params = dict(params)
+        query_params["group_limit"] = page_size + 1
+        total_params = {key: value for key, value in params.items() if key != "group_after"}
+
+        with self._connections.reader() as connection:
+            total_row = connection.execute(total_sql, total_params).fetchone()
+            rows = connection.execute(sql, query_params).fetchall()
+
+        groups = [
+            LibraryGroup(
+                label=row["label"],
+                count=int(row["total"]),
+                latest_updated_at=row["latest_updated_at"],
+            )
+            for row in rows[:page_size]
+        ]
+        next_cursor = encode_cursor([groups[-1].label]) if len(rows) > page_size else None
+        return LibraryGroupPage(
+            view=view,
+            path=level.path,
+            level=level.field,
+            total=int(total_row["total"]) if total_row else 0,
+            groups=groups,
+            next_cursor=next_cursor,
+        )
+
+    def _list_group_items(
+        self,
+        level: GroupLevel,
+        join_sql: str,
+        clauses: List[str],
+        params: Dict[str, Any],
+        cursor: Optional[str],
+        page_size: int,
+        sort_desc: bool,
+    ) -> LibraryGroupPage:
+        where_prefix = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        total_sql = f"""
+            SELECT COUNT(*) AS total
+            FROM library_items
+            {join_sql}
+            {where_prefix}
+        """
+        total_params = dict(params)
+
+        direction = "DESC" if sort_desc else "ASC"
+        comparison = "<" if sort_desc else ">"
+        updated_sql = "COALESCE(library_items.updated_at, '')"
+        after = decode_cursor(cursor, size=2)
+        if after is not None:
+            clauses = clauses + [
+                f"({updated_sql} {comparison} :after_updated_at"
+                f" OR ({updated_sql} = :after_updated_at"
+                f" AND library_items.id {comparison} :after_id))"
+            ]
+            params["after_updated_at"] = str(after[0] or "")
+            params["after_id"] = str(after[1])
+        where_prefix = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        sql = f"""
+            SELECT library_items.*
+            FROM library_items
+            {join_sql}
+            {where_prefix}
+            ORDER BY {updated_sql} {direction}, library_items.id {direction}
+            LIMIT :group_limit
+        """
+        query_params = dict(params)
+        query_params["group_limit"] = page_size + 1
+
+        with self._connections.reader() as connection:
+            total_row = connection.execute(total_sql, total_params).fetchone()
+            rows = connection.execute(sql, query_params).fetchall()
+
+        items = [self._row_to_entry(row) for row in rows[:page_size]]
+        next_cursor = None
+        if len(rows) > page_size:
+            last = items[-1]
+            next_cursor = encode_cursor([last.updated_at or "", last.id])
+        return LibraryGroupPage(
+            view=level.view,
+            path=level.path,
+            level=None,
+            total=int(total_row["total"]) if total_row else 0,
+            items=items,
+            next_cursor=next_cursor,
+        )
+
+    @staticmethod
+    def _compose_group_path(level: GroupLevel, params: Dict[str, Any]) -> List[str]:
+        """Restrict to the expanded ``path`` using plain column comparisons.
+
+        Blank values are shown under a fallback label, so selecting that label
+        also matches NULL and empty columns.  Keeping the common case a bare
+        equality lets SQLite use the grouping indexes.
+        """
+
+        clauses: List[str] = []
+        for index, (field, value) in enumerate(level.parents):
+            key = f"group_path_{index}"
+            column = f"library_items.{field}"
+            params[key] = value
+            if value == GROUP_FALLBACK_LABELS[field]:
+                clauses.append(f"({column} IS NULL OR {column} = '' OR {column} = :{key})")
+            else:
+                clauses.append(f"{column} = :{key}")
+        return clauses
+
     def get_entry_by_id(self, entry_id: str) -> Optional[LibraryEntry]:
-        with self.connect() as connection:
+        with self._connections.reader() as connection:
             cursor = connection.execute("SELECT * FROM library_items WHERE id = ?", (entry_id,))
             row = cursor.fetchone()
         return self._row_to_entry(row) if row else None
@@ -183,12 +367,12 @@ class LibraryRepository:
         return updated_entry
 
     def delete_entry(self, entry_id: str) -> None:
-        with self.connect() as connection:
+        with self._connections.writer() as connection:
             connection.execute("DELETE FROM library_items WHERE id = ?", (entry_id,))
             connection.execute("DELETE FROM books WHERE id = ?", (entry_id,))
 
     def replace_entries(self, entries: Sequence[LibraryEntry]) -> None:
-        with self.connect() as connection:
+        with self._connections.writer() as connection:
             # Preserve periodical entries — managed by magazine registration
             connection.execute(
                 "DELETE FROM library_item_grants WHERE entry_id IN "
@@ -239,6 +423,24 @@ class LibraryRepository:
                 policy = self._extract_access_policy(entry)
                 self._write_grants(connection, entry.id, policy)
 
+    def apply_delta(
+        self,
+        upserts: Sequence[LibraryEntry],
+        deletes: Iterable[str] = (),
+    ) -> None:
+        """Upsert ``upserts`` and drop ``deletes`` in a single write transaction."""
+
+        delete_ids = [(entry_id,) for entry_id in deletes]
+        with self._connections.writer() as connection:
+            if delete_ids:
+                connection.executemany(
+                    "DELETE FROM library_item_grants WHERE entry_id = ?", delete_ids
+                )
+                connection.executemany("DELETE FROM library_items WHERE id = ?", delete_ids)
+                connection.executemany("DELETE FROM books WHERE id = ?", delete_ids)
+            for entry in upserts:
+                self._upsert_with(connection, entry)
+
     def sync_from_filesystem(self, library_root: Optional[Path] = None) -> int:
         """Scan metadata files on disk and refresh the SQLite index."""
 
@@ -274,10 +476,12 @@ class LibraryRepository:
         (metadata_dir / "job.json").write_text(payload, encoding="utf-8")
 
     def iter_entries(self) -> Iterator[LibraryEntry]:
-        with self.connect() as connection:
-            cursor = connection.execute("SELECT * FROM library_items ORDER BY updated_at DESC")
-            for row in cursor.fetchall():
-                yield self._row_to_entry(row)
+        with self._connections.reader() as connection:
+            rows = connection.execute(
+                "SELECT * FROM library_items ORDER BY updated_at DESC"
+            ).fetchall()
+        for row in rows:
+            yield self._row_to_entry(row)
 
     def _entry_from_metadata(self, metadata: Mapping[str, Any], job_root: Path) -> Optional[LibraryEntry]:
         job_id = str(metadata.get("job_id") or "").strip()
@@ -456,63 +660,66 @@ class LibraryRepository:
         )
 
     def _upsert(self, entry: LibraryEntry) -> None:
+        with self._connections.writer() as connection:
+            self._upsert_with(connection, entry)
+
+    def _upsert_with(self, connection: sqlite3.Connection, entry: LibraryEntry) -> None:
         payload = self._entry_to_db_row(entry)
         book_payload = self._entry_to_book_row(entry)
-        with self.connect() as connection:
-            connection.execute(
-                """
-                INSERT INTO library_items (
-                    id, author, book_title, item_type, genre, language, status,
-                    created_at, updated_at, library_path, cover_path,
-                    isbn, source_path, owner_id, visibility, meta_json
-                )
-                VALUES (
-                    :id, :author, :book_title, :item_type, :genre, :language, :status,
-                    :created_at, :updated_at, :library_path, :cover_path,
-                    :isbn, :source_path, :owner_id, :visibility, :meta_json
-                )
-                ON CONFLICT(id) DO UPDATE SET
-                    author=excluded.author,
-                    book_title=excluded.book_title,
-                    item_type=excluded.item_type,
-                    genre=excluded.genre,
-                    language=excluded.language,
-                    status=excluded.status,
-                    created_at=excluded.created_at,
-                    updated_at=excluded.updated_at,
-                    library_path=excluded.library_path,
-                    cover_path=excluded.cover_path,
-                    isbn=excluded.isbn,
-                    source_path=excluded.source_path,
-                    owner_id=excluded.owner_id,
-                    visibility=excluded.visibility,
-                    meta_json=excluded.meta_json;
-                """,
-                payload,
+        connection.execute(
+            """
+            INSERT INTO library_items (
+                id, author, book_title, item_type, genre, language, status,
+                created_at, updated_at, library_path, cover_path,
+                isbn, source_path, owner_id, visibility, meta_json
             )
-            connection.execute(
-                """
-                INSERT INTO books (
-                    id, title, author, genre, language, cover_path, isbn, source_path, created_at, updated_at
-                )
-                VALUES (
-                    :id, :title, :author, :genre, :language, :cover_path, :isbn, :source_path, :created_at, :updated_at
-                )
-                ON CONFLICT(id) DO UPDATE SET
-                    title=excluded.title,
-                    author=excluded.author,
-                    genre=excluded.genre,
-                    language=excluded.language,
-                    cover_path=excluded.cover_path,
-                    isbn=excluded.isbn,
-                    source_path=excluded.source_path,
-                    created_at=excluded.created_at,
-                    updated_at=excluded.updated_at;
-                """,
-                book_payload,
+            VALUES (
+                :id, :author, :book_title, :item_type, :genre, :language, :status,
+                :created_at, :updated_at, :library_path, :cover_path,
+                :isbn, :source_path, :owner_id, :visibility, :meta_json
             )
-            policy = self._extract_access_policy(entry)
-            self._write_grants(connection, entry.id, policy)
+            ON CONFLICT(id) DO UPDATE SET
+                author=excluded.author,
+                book_title=excluded.book_title,
+                item_type=excluded.item_type,
+                genre=excluded.genre,
+                language=excluded.language,
+                status=excluded.status,
+                created_at=excluded.created_at,
+                updated_at=excluded.updated_at,
+                library_path=excluded.library_path,
+                cover_path=excluded.cover_path,
+                isbn=excluded.isbn,
+                source_path=excluded.source_path,
+                owner_id=excluded.owner_id,
+                visibility=excluded.visibility,
+                meta_json=excluded.meta_json;
+            """,
+            payload,
+        )
+        connection.execute(
+            """
+            INSERT INTO books (
+                id, title, author, genre, language, cover_path, isbn, source_path, created_at, updated_at
+            )
+            VALUES (
+                :id, :title, :author, :genre, :language, :cover_path, :isbn, :source_path, :created_at, :updated_at
+            )
+            ON CONFLICT(id) DO UPDATE SET
+                title=excluded.title,
+                author=excluded.author,
+                genre=excluded.genre,
+                language=excluded.language,
+                cover_path=excluded.cover_path,
+                isbn=excluded.isbn,
+                source_path=excluded.source_path,
+                created_at=excluded.created_at,
+                updated_at=excluded.updated_at;
+            """,
+            book_payload,
+        )
+        policy = self._extract_access_policy(entry)
+        self._write_grants(connection, entry.id, policy)
 
     @staticmethod
     def _extract_access_policy(entry: LibraryEntry):
@@ -558,6 +765,8 @@ class LibraryRepository:
             )
 
     def _apply_migrations(self, connection: sqlite3.Connection) -> None:
+        """Create or upgrade the schema; runs once per process and database file."""
+
         connection.execute("PRAGMA foreign_keys = ON;")
         try:
             connection.execute("PRAGMA journal_mode = WAL;")
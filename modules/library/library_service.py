@@ -6,7 +6,7 @@ import shutil
 import tempfile
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Iterable, Optional
+from typing import Any, Dict, Iterable, Optional
 
 from modules import logging_manager
 from modules.services.file_locator import FileLocator
@@ -23,6 +23,7 @@ from .library_sync import (
     LibrarySearchResult,
     LibrarySync,
 )
+from .sync import reindex
 
 LOGGER = logging_manager.get_logger().getChild("library.service")
 
@@ -103,13 +104,22 @@ class LibraryService:
 
         return self._sync.enrich_metadata(entry_id, force=force)
 
-    def rebuild_index(self) -> int:
-        """Rebuild the SQLite index from filesystem state."""
+    def rebuild_index(self, *, mode: str = "incremental") -> int:
+        """Refresh the library index from filesystem state.
 
-        count = self._repository.sync_from_filesystem(self._sync.library_root)
-        LOGGER.info("Rebuilt library index with %s entries", count)
+        ``mode="full"`` re-parses every job folder; the default incremental
+        mode only re-reads folders changed since the previous scan.
+        """
+
+        count = self._sync.reindex_from_fs(mode=mode)
+        LOGGER.info("Rebuilt library index (%s) with %s entries", mode, count)
         return count
 
+    def reindex_status(self) -> Dict[str, Any]:
+        """Return progress and timings of the running or most recent reindex."""
+
+        return reindex.reindex_progress()
+
     def import_book(self, source_path: Path) -> LibraryEntry:
         """Import an external directory into the library."""
 
@@ -20,8 +20,16 @@ from modules.services.file_locator import FileLocator
 from modules.services.job_manager import PipelineJobManager
 from modules.services.source_discovery import safe_stat
 
-from modules.library.sync import db_sync, file_ops, metadata as metadata_utils, remote_sync, utils
-
+from modules.library.sync import (
+    db_sync,
+    file_ops,
+    metadata as metadata_utils,
+    reindex,
+    remote_sync,
+    utils,
+)
+
+from .library_groups import GroupQueryError, LibraryGroupPage
 from .library_metadata import LibraryMetadataManager
 from .library_models import LibraryEntry, MetadataSnapshot
 from .library_repository import LibraryRepository
@@ -248,7 +256,7 @@ class LibrarySync:
         if not _path_exists(source_job_root):
             raise LibraryNotFoundError(f"Job {job_id} not found in queue storage")
 
-        with DirectoryLock(source_job_root) as lock:
+        with DirectoryLock(source_job_root, scope="library") as lock:
             metadata = file_ops.load_metadata(source_job_root)
             if (
                 str(metadata.get("job_type", "")).strip().lower() == "subtitle"
@@ -444,7 +452,7 @@ class LibrarySync:
         if not _path_exists(job_root):
             raise LibraryNotFoundError(f"Job {job_id} does not exist on disk")
 
-        with DirectoryLock(job_root):
+        with DirectoryLock(job_root, scope="library"):
             metadata = file_ops.load_metadata(job_root)
             removed = file_ops.purge_media_files(job_root)
             metadata["updated_at"] = utils.current_timestamp()
@@ -479,7 +487,7 @@ class LibrarySync:
 
         job_root = Path(item.library_path)
         if _path_exists(job_root.parent):
-            with DirectoryLock(job_root):
+            with DirectoryLock(job_root, scope="library"):
                 if _path_exists(job_root):
                     shutil.rmtree(job_root, ignore_errors=True)
 
@@ -522,7 +530,7 @@ class LibrarySync:
 
         now = utils.current_timestamp()
 
-        with DirectoryLock(job_root) as lock:
+        with DirectoryLock(job_root, scope="library") as lock:
             metadata = file_ops.load_metadata(job_root)
             metadata["book_title"] = normalized_title
             metadata["author"] = normalized_author
@@ -613,7 +621,7 @@ class LibrarySync:
         if not _path_exists(job_root):
             raise LibraryNotFoundError(f"Job {job_id} is missing from the library filesystem")
 
-        with DirectoryLock(job_root):
+        with DirectoryLock(job_root, scope="library"):
             metadata = file_ops.load_metadata(job_root)
             existing = resolve_access_policy(metadata.get("access"), default_visibility="public")
             merged = merge_access_policy(
@@ -647,7 +655,7 @@ class LibrarySync:
         if not _path_exists(job_root):
             raise LibraryNotFoundError(f"Job {job_id} is missing from the library filesystem")
 
-        with DirectoryLock(job_root) as lock:
+        with DirectoryLock(job_root, scope="library") as lock:
             metadata = file_ops.load_metadata(job_root)
             refreshed = remote_sync.refresh_metadata(
                 job_id,
@@ -720,7 +728,7 @@ class LibrarySync:
         if not _path_exists(job_root):
             raise LibraryNotFoundError(f"Job {job_id} is missing from the library filesystem")
 
-        with DirectoryLock(job_root):
+        with DirectoryLock(job_root, scope="library"):
             metadata = file_ops.load_metadata(job_root)
             enriched = remote_sync.enrich_metadata(
                 job_id,
@@ -757,7 +765,7 @@ class LibrarySync:
         if not _path_exists(job_root):
             raise LibraryNotFoundError(f"Job {job_id} is missing from the library filesystem")
 
-        with DirectoryLock(job_root):
+        with DirectoryLock(job_root, scope="library"):
             metadata = file_ops.load_metadata(job_root)
             data_root = job_root / "data"
             data_root.mkdir(parents=True, exist_ok=True)
@@ -822,7 +830,7 @@ class LibrarySync:
         if not _path_exists(job_root):
             raise LibraryNotFoundError(f"Job {job_id} is missing from the library filesystem")
 
-        with DirectoryLock(job_root):
+        with DirectoryLock(job_root, scope="library"):
             metadata = file_ops.load_metadata(job_root)
             updated = remote_sync.apply_isbn_metadata(
                 metadata,
@@ -895,6 +903,49 @@ class LibrarySync:
             groups=groups,
         )
 
+    def browse_groups(
+        self,
+        *,
+        view: str,
+        path: Optional[List[str]] = None,
+        query: Optional[str] = None,
+        author: Optional[str] = None,
+        book_title: Optional[str] = None,
+        genre: Optional[str] = None,
+        language: Optional[str] = None,
+        status: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+        sort: str = "updated_at_desc",
+        user_id: Optional[str] = None,
+        user_role: Optional[str] = None,
+    ) -> LibraryGroupPage:
+        """Return one level of a grouped view, expanded along ``path``."""
+
+        filters = utils.compact_filters(
+            {
+                "author": author,
+                "book_title": book_title,
+                "genre": genre,
+                "language": language,
+                "status": status,
+            }
+        )
+        try:
+            return self._repository.list_groups(
+                view=view,
+                path=tuple(path or ()),
+                query=query,
+                filters=filters,
+                cursor=cursor,
+                limit=limit,
+                sort_desc=sort.lower() != "updated_at_asc",
+                user_id=user_id,
+                user_role=user_role,
+            )
+        except GroupQueryError as exc:
+            raise LibraryError(str(exc)) from exc
+
     def get_item(self, job_id: str) -> Optional[LibraryEntry]:
         """Return the indexed ``LibraryEntry`` for ``job_id`` if present."""
 
@@ -1005,8 +1056,18 @@ class LibrarySync:
         completed_flag = bool(metadata.get("media_completed")) or generated_complete
         return media_map, chunk_records, completed_flag
 
-    def reindex_from_fs(self) -> int:
-        """Scan the library filesystem and rebuild the SQLite index."""
+    def reindex_from_fs(self, *, mode: str = "incremental") -> int:
+        """Scan the library filesystem and refresh the index.
+
+        ``mode="incremental"`` re-reads only job folders whose metadata changed
+        since the last scan; ``mode="full"`` rebuilds every non-periodical row.
+        Returns the number of indexed filesystem entries.
+        """
+
+        return self.reindex_with_report(mode=mode).indexed
+
+    def reindex_with_report(self, *, mode: str = "incremental") -> reindex.ReindexReport:
+        """Run :meth:`reindex_from_fs` and return the full :class:`ReindexReport`."""
 
         def build_entry(metadata: Mapping[str, Any], job_root: Path) -> LibraryEntry:
             return metadata_utils.build_entry(
@@ -1019,12 +1080,17 @@ class LibrarySync:
                 current_timestamp=utils.current_timestamp,
             )
 
-        return db_sync.reindex_from_fs(
-            self._library_root,
-            self._repository,
-            load_metadata=file_ops.load_metadata,
-            build_entry=build_entry,
-        )
+        if mode not in reindex.REINDEX_MODES:
+            raise LibraryError(f"Unsupported reindex mode: {mode}")
+        try:
+            return reindex.run_reindex(
+                self._library_root,
+                self._repository,
+                build_entry=build_entry,
+                mode=mode,
+            )
+        except reindex.ReindexInProgressError as exc:
+            raise LibraryConflictError(str(exc)) from exc
 
     def build_entry(self, metadata: Mapping[str, Any], job_root: Path) -> LibraryEntry:
         """Create a :class:`LibraryEntry` from raw metadata without persisting."""
@@ -0,0 +1,13 @@
+-- Indexes backing the grouped library views (author/genre/language
+-- hierarchies) and keyset pagination of their item lists.
+CREATE INDEX IF NOT EXISTS idx_library_items_author_book_language
+  ON library_items (author, book_title, language, updated_at);
+
+CREATE INDEX IF NOT EXISTS idx_library_items_genre_author_book
+  ON library_items (genre, author, book_title, updated_at);
+
+CREATE INDEX IF NOT EXISTS idx_library_items_language_author_book
+  ON library_items (language, author, book_title, updated_at);
+
+CREATE INDEX IF NOT EXISTS idx_library_items_updated_id
+  ON library_items (updated_at, id);
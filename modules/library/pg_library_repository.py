@@ -5,10 +5,11 @@ from __future__ import annotations
 import json
 import logging
 import re
+from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
 
-from sqlalchemy import and_, delete, func, or_, select, text
+from sqlalchemy import and_, delete, func, literal, or_, select, text
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from ..database.engine import get_db_session
@@ -18,6 +19,17 @@ from ..database.models.library import (
     LibraryItemModel,
 )
 from ..permissions import resolve_access_policy
+from .library_groups import (
+    GROUP_FALLBACK_LABELS,
+    GroupLevel,
+    GroupQueryError,
+    LibraryGroup,
+    LibraryGroupPage,
+    decode_cursor,
+    encode_cursor,
+    normalize_group_limit,
+    resolve_group_level,
+)
 from .library_models import LibraryEntry, MetadataSnapshot
 from .library_repository import LibraryRepositoryError
 from .sync import metadata as metadata_utils
@@ -93,6 +105,134 @@ class PgLibraryRepository:
         with get_db_session() as session:
             return session.execute(stmt).scalar_one()
 
+    def list_groups(
+        self,
+        *,
+        view: str,
+        path: Sequence[str] = (),
+        query: Optional[str] = None,
+        filters: Mapping[str, Optional[str]] | None = None,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None,
+        sort_desc: bool = True,
+        user_id: Optional[str] = None,
+        user_role: Optional[str] = None,
+    ) -> LibraryGroupPage:
+        """Return one page of group headers (or leaf items) for a grouped view."""
+
+        level = resolve_group_level(view, path)
+        page_size = normalize_group_limit(limit)
+
+        def scoped(stmt):
+            stmt = self._apply_search_filter(stmt, query)
+            stmt = self._apply_field_filters(stmt, filters or {})
+            stmt = self._apply_access_filter(stmt, user_id, user_role)
+            return self._apply_group_path(stmt, level)
+
+        if level.field is None:
+            return self._list_group_items(level, scoped, cursor, page_size, sort_desc)
+
+        column = getattr(LibraryItemModel, level.field)
+        label = func.coalesce(
+            func.nullif(column, ""), literal(GROUP_FALLBACK_LABELS[level.field])
+        ).label("label")
+        total_stmt = scoped(select(func.count(func.distinct(label.element))))
+        stmt = scoped(
+            select(
+                label,
+                func.count().label("total"),
+                func.max(LibraryItemModel.updated_at).label("latest_updated_at"),
+            )
+        )
+        after = decode_cursor(cursor, size=1)
+        if after is not None:
+            stmt = stmt.where(label.element > str(after[0]))
+        stmt = stmt.group_by(label.element).order_by(label.element).limit(page_size + 1)
+
+        with get_db_session() as session:
+            total = session.execute(total_stmt).scalar_one()
+            rows = session.execute(stmt).all()
+
+        groups = [
+            LibraryGroup(
+                label=row.label,
+                count=int(row.total),
+                latest_updated_at=str(row.latest_updated_at) if row.latest_updated_at else None,
+            )
+            for row in rows[:page_size]
+        ]
+        next_cursor = encode_cursor([groups[-1].label]) if len(rows) > page_size else None
+        return LibraryGroupPage(
+            view=view,
+            path=level.path,
+            level=level.field,
+            total=int(total or 0),
+            groups=groups,
+            next_cursor=next_cursor,
+        )
+
+    def _list_group_items(
+        self,
+        level: GroupLevel,
+        scoped,
+        cursor: Optional[str],
+        page_size: int,
+        sort_desc: bool,
+    ) -> LibraryGroupPage:
+        updated = LibraryItemModel.updated_at
+        item_id = LibraryItemModel.id
+        total_stmt = scoped(select(func.count()).select_from(LibraryItemModel))
+        stmt = scoped(select(LibraryItemModel))
+        after = decode_cursor(cursor, size=2)
+        if after is not None:
+            after_updated, after_id = after
+            id_after = item_id < after_id if sort_desc else item_id > after_id
+            if after_updated:
+                try:
+                    after_ts = datetime.fromisoformat(str(after_updated))
+                except ValueError as exc:
+                    raise GroupQueryError("Malformed group cursor") from exc
+                updated_after = updated < after_ts if sort_desc else updated > after_ts
+                stmt = stmt.where(
+                    or_(updated_after, and_(updated == after_ts, id_after), updated.is_(None))
+                )
+            else:
+                stmt = stmt.where(and_(updated.is_(None), id_after))
+        if sort_desc:
+            stmt = stmt.order_by(updated.desc().nullslast(), item_id.desc())
+        else:
+            stmt = stmt.order_by(updated.asc().nullslast(), item_id.asc())
+        stmt = stmt.limit(page_size + 1)
+
+        with get_db_session() as session:
+            total = session.execute(total_stmt).scalar_one()
+            models = session.execute(stmt).scalars().all()
+            items = [self._model_to_entry(model) for model in models[:page_size]]
+
+        next_cursor = None
+        if len(models) > page_size:
+            last = items[-1]
+            next_cursor = encode_cursor([last.updated_at or "", last.id])
+        return LibraryGroupPage(
+            view=level.view,
+            path=level.path,
+            level=None,
+            total=int(total or 0),
+            items=items,
+            next_cursor=next_cursor,
+        )
+
+    @staticmethod
+    def _apply_group_path(stmt, level: GroupLevel):
+        """Restrict to the expanded group path; fallback labels match blanks."""
+        for field_name, value in level.parents:
+            column = getattr(LibraryItemModel, field_name)
+            if value == GROUP_FALLBACK_LABELS[field_name]:
+                stmt = stmt.where(or_(column.is_(None), column == "", column == value))
+            else:
+                stmt = stmt.where(column == value)
+        return stmt
+
     def get_entry_by_id(self, entry_id: str) -> Optional[LibraryEntry]:
         with get_db_session() as session:
             model = session.execute(
@@ -199,6 +339,23 @@ class PgLibraryRepository:
                 policy = self._extract_access_policy(entry)
                 self._write_grants(session, entry.id, policy)
 
+    def apply_delta(
+        self,
+        upserts: Sequence[LibraryEntry],
+        deletes: Iterable[str] = (),
+    ) -> None:
+        """Upsert ``upserts`` and drop ``deletes`` in a single transaction."""
+
+        delete_ids = list(deletes)
+        with get_db_session() as session:
+            if delete_ids:
+                # CASCADE handles books and grants
+                session.execute(
+                    delete(LibraryItemModel).where(LibraryItemModel.id.in_(delete_ids))
+                )
+            for entry in upserts:
+                self._upsert_in_session(session, entry)
+
     def sync_from_filesystem(self, library_root: Optional[Path] = None) -> int:
         """Scan metadata files on disk and refresh the PostgreSQL index."""
         root = Path(library_root) if library_root else self._library_root
@@ -395,70 +552,73 @@ class PgLibraryRepository:
         )
 
     def _upsert(self, entry: LibraryEntry) -> None:
+        with get_db_session() as session:
+            self._upsert_in_session(session, entry)
+
+    def _upsert_in_session(self, session, entry: LibraryEntry) -> None:
         meta_json = (
             entry.metadata.data
             if isinstance(entry.metadata, MetadataSnapshot)
             else {}
         )
 
-        with get_db_session() as session:
-            # Upsert library_items
-            item_values = {
-                "id": entry.id,
-                "author": entry.author,
-                "book_title": entry.book_title,
-                "item_type": entry.item_type or "book",
-                "genre": entry.genre,
-                "language": entry.language,
-                "status": entry.status,
-                "created_at": entry.created_at or None,
-                "updated_at": entry.updated_at or None,
-                "library_path": entry.library_path,
-                "cover_path": entry.cover_path,
-                "isbn": entry.isbn,
-                "source_path": entry.source_path,
-                "owner_id": entry.owner_id,
-                "visibility": entry.visibility or "public",
-                "meta_json": meta_json,
-            }
-            item_stmt = pg_insert(LibraryItemModel).values(**item_values)
-            item_stmt = item_stmt.on_conflict_do_update(
-                index_elements=["id"],
-                set_={
-                    k: item_stmt.excluded[k]
-                    for k in item_values
-                    if k != "id"
-                },
-            )
-            session.execute(item_stmt)
-
-            # Upsert books
-            book_values = {
-                "id": entry.id,
-                "title": entry.book_title,
-                "author": entry.author,
-                "genre": entry.genre,
-                "language": entry.language,
-                "cover_path": entry.cover_path,
-                "isbn": entry.isbn,
-                "source_path": entry.source_path,
-                "created_at": entry.created_at or None,
-                "updated_at": entry.updated_at or None,
-            }
-            book_stmt = pg_insert(BookModel).values(**book_values)
-            book_stmt = book_stmt.on_conflict_do_update(
-                index_elements=["id"],
-                set_={
-                    k: book_stmt.excluded[k]
-                    for k in book_values
-                    if k != "id"
-                },
-            )
-            session.execute(book_stmt)
+        # Upsert library_items
+        item_values = {
+            "id": entry.id,
+            "author": entry.author,
+            "book_title": entry.book_title,
+            "item_type": entry.item_type or "book",
+            "genre": entry.genre,
+            "language": entry.language,
+            "status": entry.status,
+            "created_at": entry.created_at or None,
+            "updated_at": entry.updated_at or None,
+            "library_path": entry.library_path,
+            "cover_path": entry.cover_path,
+            "isbn": entry.isbn,
+            "source_path": entry.source_path,
+            "owner_id": entry.owner_id,
+            "visibility": entry.visibility or "public",
+            "meta_json": meta_json,
+        }
+        item_stmt = pg_insert(LibraryItemModel).values(**item_values)
+        item_stmt = item_stmt.on_conflict_do_update(
+            index_elements=["id"],
+            set_={
+                k: item_stmt.excluded[k]
+                for k in item_values
+                if k != "id"
+            },
+        )
+        session.execute(item_stmt)
+
+        # Upsert books
+        book_values = {
+            "id": entry.id,
+            "title": entry.book_title,
+            "author": entry.author,
+            "genre": entry.genre,
+            "language": entry.language,
+            "cover_path": entry.cover_path,
+            "isbn": entry.isbn,
+            "source_path": entry.source_path,
+            "created_at": entry.created_at or None,
+            "updated_at": entry.updated_at or None,
+        }
+        book_stmt = pg_insert(BookModel).values(**book_values)
+        book_stmt = book_stmt.on_conflict_do_update(
+            index_elements=["id"],
+            set_={
+                k: book_stmt.excluded[k]
+                for k in book_values
+                if k != "id"
+            },
+        )
+        session.execute(book_stmt)
 
-            # Write grants
-            policy = self._extract_access_policy(entry)
-            self._write_grants(session, entry.id, policy)
+        # Write grants
+        policy = self._extract_access_policy(entry)
+        self._write_grants(session, entry.id, policy)
 
     @staticmethod
     def _extract_access_policy(entry: LibraryEntry):
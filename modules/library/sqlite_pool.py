@@ -0,0 +1,232 @@
+"""Pooled SQLite connections for the library index.
+
+Opening a connection costs a file open, pragma setup and (in the library
+repository) a scan of the migration directory.  :class:`SQLiteConnectionManager`
+applies migrations once per process and database file, then hands out a small
+pool of read-only connections plus a single writer guarded by a lock.  With
+WAL journaling readers keep serving list/search queries while a reindex holds
+the writer, and each pooled connection keeps its prepared-statement cache.
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from modules import logging_manager
+
+LOGGER = logging_manager.get_logger().getChild("library.sqlite")
+
+LIBRARY_DB_READERS_ENV = "EBOOK_LIBRARY_DB_READERS"
+DEFAULT_READERS = 4
+STATEMENT_CACHE_SIZE = 256
+BUSY_TIMEOUT_MS = 5000
+READER_WAIT_SECONDS = 30.0
+
+# Applied to every connection; journal_mode is persistent and set by migrate.
+CONNECTION_PRAGMAS: Tuple[str, ...] = (
+    "PRAGMA foreign_keys = ON",
+    f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -8192",
+    "PRAGMA mmap_size = 134217728",
+)
+
+MigrationHook = Callable[[sqlite3.Connection], None]
+
+_MIGRATED: Dict[str, Tuple[int, int]] = {}
+_MIGRATED_LOCK = threading.Lock()
+
+
+def resolve_reader_count(value: Optional[int] = None) -> int:
+    """Return the reader pool size, honouring ``EBOOK_LIBRARY_DB_READERS``."""
+
+    if value is None:
+        raw = os.environ.get(LIBRARY_DB_READERS_ENV, "").strip()
+        try:
+            value = int(raw) if raw else DEFAULT_READERS
+        except ValueError:
+            LOGGER.warning("Ignoring invalid %s=%r", LIBRARY_DB_READERS_ENV, raw)
+            value = DEFAULT_READERS
+    return max(1, int(value))
+
+
+def _file_identity(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        stat_result = os.stat(path)
+    except OSError:
+        return None
+    return stat_result.st_dev, stat_result.st_ino
+
+
+class SQLiteConnectionManager:
+    """Hand out pre-migrated SQLite connections for one database file."""
+
+    def __init__(
+        self,
+        db_path: Path,
+        *,
+        migrate: Optional[MigrationHook] = None,
+        readers: Optional[int] = None,
+    ) -> None:
+        self._db_path = Path(db_path)
+        self._migrate = migrate
+        self._reader_limit = resolve_reader_count(readers)
+        self._reader_slots = threading.BoundedSemaphore(self._reader_limit)
+        self._idle_readers: List[sqlite3.Connection] = []
+        self._readers_lock = threading.Lock()
+        self._writer: Optional[sqlite3.Connection] = None
+        self._writer_lock = threading.Lock()
+        self._pid = os.getpid()
+        self._opened = 0
+
+    @property
+    def db_path(self) -> Path:
+        return self._db_path
+
+    def _check_pid(self) -> None:
+        # Connections must not cross a fork; the child starts with empty pools.
+        if self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._idle_readers = []
+            self._writer = None
+
+    def ensure_migrated(self, connection: sqlite3.Connection) -> None:
+        """Run the migration hook unless this process already did for the file."""
+
+        if self._migrate is None:
+            return
+        key = str(self._db_path.resolve())
+        with _MIGRATED_LOCK:
+            identity = _file_identity(self._db_path)
+            if identity is not None and _MIGRATED.get(key) == identity:
+                return
+            self._migrate(connection)
+            identity = _file_identity(self._db_path)
+            if identity is not None:
+                _MIGRATED[key] = identity
+
+    def open_connection(self, *, read_only: bool = False) -> sqlite3.Connection:
+        """Return a new configured, migrated connection owned by the caller."""
+
+        connection = sqlite3.connect(
+            str(self._db_path),
+            detect_types=sqlite3.PARSE_DECLTYPES,
+            check_same_thread=False,
+            cached_statements=STATEMENT_CACHE_SIZE,
+        )
+        connection.row_factory = sqlite3.Row
+        try:
+            for pragma in CONNECTION_PRAGMAS:
+                connection.execute(pragma)
+            self.ensure_migrated(connection)
+            if read_only:
+                connection.execute("PRAGMA query_only = ON")
+        except Exception:
+            connection.close()
+            raise
+        self._opened += 1
+        return connection
+
+    @contextmanager
+    def reader(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a read-only connection from the pool."""
+
+        if not self._reader_slots.acquire(timeout=READER_WAIT_SECONDS):
+            raise sqlite3.OperationalError("Timed out waiting for a library database reader")
+        connection: Optional[sqlite3.Connection] = None
+        try:
+            with self._readers_lock:
+                self._check_pid()
+                if self._idle_readers:
+                    connection = self._idle_readers.pop()
+            if connection is None:
+                connection = self.open_connection(read_only=True)
+            yield connection
+        except sqlite3.DatabaseError:
+            if connection is not None:
+                connection.close()
+                connection = None
+            raise
+        finally:
+            if connection is not None:
+                if connection.in_transaction:
+                    connection.rollback()
+                with self._readers_lock:
+                    self._idle_readers.append(connection)
+            self._reader_slots.release()
+
+    @contextmanager
+    def writer(self) -> Iterator[sqlite3.Connection]:
+        """Hold the single writer connection; commits on success, rolls back on error."""
+
+        started = time.perf_counter()
+        with self._writer_lock:
+            waited = time.perf_counter() - started
+            if waited > 1.0:
+                LOGGER.debug("Waited %.2fs for the library database writer", waited)
+            self._check_pid()
+            if self._writer is None:
+                self._writer = self.open_connection()
+            connection = self._writer
+            try:
+                yield connection
+            except BaseException:
+                try:
+                    connection.rollback()
+                except sqlite3.Error:
+                    self._discard_writer()
+                raise
+            else:
+                connection.commit()
+
+    def _discard_writer(self) -> None:
+        writer, self._writer = self._writer, None
+        if writer is not None:
+            try:
+                writer.close()
+            except sqlite3.Error:
+                pass
+
+    def close(self) -> None:
+        """Close every pooled connection; later calls reopen lazily."""
+
+        with self._readers_lock:
+            idle, self._idle_readers = self._idle_readers, []
+        for connection in idle:
+            connection.close()
+        with self._writer_lock:
+            self._discard_writer()
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._readers_lock:
+            idle = len(self._idle_readers)
+        return {
+            "reader_limit": self._reader_limit,
+            "idle_readers": idle,
+            "writer_open": int(self._writer is not None),
+            "connections_opened": self._opened,
+        }
+
+
+def reset_migration_state() -> None:
+    """Forget which databases were migrated (tests and migration tooling)."""
+
+    with _MIGRATED_LOCK:
+        _MIGRATED.clear()
+
+
+__all__ = [
+    "CONNECTION_PRAGMAS",
+    "DEFAULT_READERS",
+    "LIBRARY_DB_READERS_ENV",
+    "SQLiteConnectionManager",
+    "reset_migration_state",
+    "resolve_reader_count",
+]
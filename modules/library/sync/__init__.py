@@ -1,11 +1,12 @@
 """Support modules for library synchronization workflows."""
 
-from . import db_sync, file_ops, metadata, remote_sync, utils
+from . import db_sync, file_ops, metadata, reindex, remote_sync, utils
 
 __all__ = [
     "db_sync",
     "file_ops",
     "metadata",
+    "reindex",
     "remote_sync",
     "utils",
 ]
@@ -65,36 +65,6 @@ def search_entries(
     return total, items, groups
 
 
-def reindex_from_fs(
-    library_root: Path,
-    repository,
-    *,
-    load_metadata: Callable[[Path], Dict[str, Any]],
-    build_entry: Callable[[Mapping[str, Any], Path], LibraryEntry],
-) -> int:
-    """Rebuild the repository index by scanning the filesystem."""
-
-    items: List[LibraryEntry] = []
-    state_dir = repository.db_path.parent
-    for metadata_file in library_root.rglob("job.json"):
-        if metadata_file.parent.name != "metadata":
-            continue
-        if state_dir in metadata_file.parents:
-            continue
-        job_root = metadata_file.parent.parent
-        try:
-            metadata = load_metadata(job_root)
-        except FileNotFoundError:
-            continue
-        job_id = str(metadata.get("job_id") or "").strip()
-        if not job_id:
-            continue
-        items.append(build_entry(metadata, job_root))
-
-    repository.replace_entries(items)
-    return len(items)
-
-
 def build_groups(
     items: Iterable[LibraryEntry],
     *,
@@ -213,7 +183,6 @@ def _group_by_language(
 
 __all__ = [
     "build_groups",
-    "reindex_from_fs",
     "remove_from_job_queue",
     "search_entries",
 ]
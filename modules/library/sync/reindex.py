@@ -0,0 +1,530 @@
+"""Incremental filesystem reindexing backed by a scan journal.
+
+A full reindex parses every ``metadata/job.json`` below the library root and
+replaces all non-periodical rows.  On network filesystems that means minutes
+of serial reads while the repository writer is held.  The incremental mode
+keeps a journal of ``(job root, metadata path, size, mtime, sha256, job id)``
+next to the index and only re-reads folders whose metadata changed:
+
+* discovery walks the tree with :func:`os.scandir` and stops descending at job
+  roots, so media folders are never listed;
+* metadata files are stat'ed, hashed and parsed on a bounded thread pool
+  (``EBOOK_LIBRARY_REINDEX_WORKERS``), which hides NAS round-trip latency;
+* a file whose size and mtime match the journal is skipped, one whose content
+  hash matches is only re-stamped, and everything else is rebuilt;
+* upserts and deletes are applied as one delta transaction via
+  ``repository.apply_delta``.
+
+The full mode remains available and is used automatically when the journal is
+missing, unreadable, written for another library root, or clearly out of step
+with the index.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Mapping, Optional, Set, Tuple
+
+from modules import logging_manager
+from modules.library.library_models import LibraryEntry
+
+LOGGER = logging_manager.get_logger().getChild("library.sync.reindex")
+
+REINDEX_WORKERS_ENV = "EBOOK_LIBRARY_REINDEX_WORKERS"
+DEFAULT_REINDEX_WORKERS = 8
+JOURNAL_FILENAME = "reindex_journal.json"
+JOURNAL_VERSION = 1
+REINDEX_MODES: Tuple[str, ...] = ("incremental", "full")
+
+# Files modified this close to the scan start may change again within the same
+# mtime tick, so their stat signature alone is not trusted.
+RACY_WINDOW_NS = 2_000_000_000
+
+_STATE_DIRNAME = ".library"
+_METADATA_DIRNAME = "metadata"
+_METADATA_FILENAME = "job.json"
+
+BuildEntry = Callable[[Mapping[str, Any], Path], LibraryEntry]
+
+
+class ReindexInProgressError(RuntimeError):
+    """Raised when a reindex is requested while another one is running."""
+
+
+@dataclass(frozen=True)
+class JournalRecord:
+    """Scan state for one job root."""
+
+    metadata_path: str
+    size: int
+    mtime_ns: int
+    sha256: str
+    job_id: str
+
+
+@dataclass
+class ReindexReport:
+    """Outcome and phase timings of one reindex run."""
+
+    mode: str
+    requested_mode: str
+    indexed: int = 0
+    scanned: int = 0
+    parsed: int = 0
+    unchanged: int = 0
+    upserted: int = 0
+    deleted: int = 0
+    failed: int = 0
+    fallback_reason: Optional[str] = None
+    duration_seconds: float = 0.0
+    timings: Dict[str, float] = field(default_factory=dict)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass
+class _LoadResult:
+    key: str
+    outcome: str  # "unchanged", "parsed", "skipped", "missing" or "failed"
+    record: Optional[JournalRecord] = None
+    entry: Optional[LibraryEntry] = None
+
+
+_RUN_LOCK = threading.Lock()
+_PROGRESS_LOCK = threading.Lock()
+_PROGRESS: Dict[str, Any] = {"state": "idle"}
+
+
+def resolve_worker_count(value: Optional[int] = None) -> int:
+    """Return the loader pool size, honouring ``EBOOK_LIBRARY_REINDEX_WORKERS``."""
+
+    if value is None:
+        raw = os.environ.get(REINDEX_WORKERS_ENV, "").strip()
+        try:
+            value = int(raw) if raw else DEFAULT_REINDEX_WORKERS
+        except ValueError:
+            LOGGER.warning("Ignoring invalid %s=%r", REINDEX_WORKERS_ENV, raw)
+            value = DEFAULT_REINDEX_WORKERS
+    return max(1, int(value))
+
+
+def reindex_progress() -> Dict[str, Any]:
+    """Return a snapshot of the running (or most recent) reindex."""
+
+    with _PROGRESS_LOCK:
+        snapshot = dict(_PROGRESS)
+    started = snapshot.get("started_monotonic")
+    if snapshot.get("state") == "running" and isinstance(started, float):
+        snapshot["elapsed_seconds"] = time.monotonic() - started
+    snapshot.pop("started_monotonic", None)
+    return snapshot
+
+
+def _update_progress(**fields: Any) -> None:
+    with _PROGRESS_LOCK:
+        _PROGRESS.update(fields)
+
+
+def _reset_progress(**fields: Any) -> None:
+    with _PROGRESS_LOCK:
+        _PROGRESS.clear()
+        _PROGRESS.update(fields)
+
+
+def journal_path_for(library_root: Path) -> Path:
+    return Path(library_root) / _STATE_DIRNAME / JOURNAL_FILENAME
+
+
+def load_journal(path: Path, *, library_root: Path) -> Optional[Dict[str, JournalRecord]]:
+    """Return journal records, or ``None`` when the journal cannot be trusted."""
+
+    try:
+        payload = json.loads(Path(path).read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError):
+        LOGGER.warning("Ignoring unreadable library reindex journal", exc_info=True)
+        return None
+    if not isinstance(payload, dict) or payload.get("version") != JOURNAL_VERSION:
+        return None
+    if payload.get("library_root") != str(Path(library_root).resolve()):
+        return None
+    records: Dict[str, JournalRecord] = {}
+    entries = payload.get("entries")
+    if not isinstance(entries, dict):
+        return None
+    for key, raw in entries.items():
+        try:
+            records[str(key)] = JournalRecord(
+                metadata_path=str(raw["metadata_path"]),
+                size=int(raw["size"]),
+                mtime_ns=int(raw["mtime_ns"]),
+                sha256=str(raw["sha256"]),
+                job_id=str(raw.get("job_id") or ""),
+            )
+        except (KeyError, TypeError, ValueError):
+            return None
+    return records
+
+
+def save_journal(path: Path, records: Mapping[str, JournalRecord], *, library_root: Path) -> None:
+    """Atomically write ``records`` to ``path``."""
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "version": JOURNAL_VERSION,
+        "library_root": str(Path(library_root).resolve()),
+        "entries": {key: asdict(record) for key, record in sorted(records.items())},
+    }
+    temp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    temp_path.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+    os.replace(temp_path, path)
+
+
+def discover_job_roots(library_root: Path) -> List[Path]:
+    """Return directories holding a ``metadata`` folder below ``library_root``.
+
+    Symlinked directories are not followed, the ``.library`` state directory is
+    skipped and job roots (never the library root itself) are not descended
+    into.
+    """
+
+    root = Path(library_root)
+    state_dir = root / _STATE_DIRNAME
+    job_roots: List[Path] = []
+    pending = [root]
+    while pending:
+        directory = pending.pop()
+        try:
+            with os.scandir(directory) as iterator:
+                children = [
+                    Path(entry.path)
+                    for entry in iterator
+                    if entry.is_dir(follow_symlinks=False)
+                ]
+        except OSError:
+            LOGGER.debug("Skipping unreadable library directory %s", directory, exc_info=True)
+            continue
+        if directory != root and any(child.name == _METADATA_DIRNAME for child in children):
+            job_roots.append(directory)
+            continue
+        pending.extend(child for child in children if child != state_dir)
+    job_roots.sort()
+    return job_roots
+
+
+def _load_job_root(
+    job_root: Path,
+    key: str,
+    previous: Optional[JournalRecord],
+    *,
+    build_entry: BuildEntry,
+    force: bool,
+    racy_cutoff_ns: int,
+) -> _LoadResult:
+    metadata_path = job_root / _METADATA_DIRNAME / _METADATA_FILENAME
+    try:
+        stat_result = os.stat(metadata_path)
+    except FileNotFoundError:
+        return _LoadResult(key=key, outcome="missing")
+    relative_path = (Path(key) / _METADATA_DIRNAME / _METADATA_FILENAME).as_posix()
+    if (
+        not force
+        and previous is not None
+        and previous.size == stat_result.st_size
+        and previous.mtime_ns == stat_result.st_mtime_ns
+        and stat_result.st_mtime_ns < racy_cutoff_ns
+    ):
+        return _LoadResult(key=key, outcome="unchanged", record=previous)
+
+    raw = metadata_path.read_bytes()
+    digest = hashlib.sha256(raw).hexdigest()
+    if not force and previous is not None and previous.sha256 == digest:
+        record = JournalRecord(
+            metadata_path=relative_path,
+            size=len(raw),
+            mtime_ns=stat_result.st_mtime_ns,
+            sha256=digest,
+            job_id=previous.job_id,
+        )
+        return _LoadResult(key=key, outcome="unchanged", record=record)
+
+    metadata = json.loads(raw)
+    job_id = str(metadata.get("job_id") or "").strip() if isinstance(metadata, dict) else ""
+    record = JournalRecord(
+        metadata_path=relative_path,
+        size=len(raw),
+        mtime_ns=stat_result.st_mtime_ns,
+        sha256=digest,
+        job_id=job_id,
+    )
+    if not job_id:
+        return _LoadResult(key=key, outcome="skipped", record=record)
+    return _LoadResult(key=key, outcome="parsed", record=record, entry=build_entry(metadata, job_root))
+
+
+def _journal_out_of_step(repository, previous: Mapping[str, JournalRecord]) -> bool:
+    """Detect an index that lost rows behind the journal's back (e.g. a reset DB)."""
+
+    journaled = {record.job_id for record in previous.values() if record.job_id}
+    if not journaled:
+        return False
+    try:
+        stored = repository.count_entries(user_role="admin")
+    except Exception:
+        LOGGER.debug("Unable to count library entries for journal check", exc_info=True)
+        return True
+    return stored < len(journaled)
+
+
+def _retained_entries(
+    repository,
+    library_root: Path,
+    failed_keys: Set[str],
+    previous: Mapping[str, JournalRecord],
+) -> List[LibraryEntry]:
+    """Return the stored rows of folders whose metadata could not be loaded.
+
+    A full run replaces every non-periodical row, so without this a transient
+    parse or read error would drop the book from the index.
+    """
+
+    if not failed_keys:
+        return []
+    failed_ids = {
+        previous[key].job_id for key in failed_keys if key in previous and previous[key].job_id
+    }
+    retained: List[LibraryEntry] = []
+    for entry in repository.iter_entries():
+        if entry.item_type == "periodical":
+            continue
+        if entry.id in failed_ids:
+            retained.append(entry)
+            continue
+        try:
+            key = Path(entry.library_path).relative_to(library_root).as_posix()
+        except ValueError:
+            continue
+        if key in failed_keys:
+            retained.append(entry)
+    return retained
+
+
+def run_reindex(
+    library_root: Path,
+    repository,
+    *,
+    build_entry: BuildEntry,
+    mode: str = "incremental",
+    workers: Optional[int] = None,
+    journal_path: Optional[Path] = None,
+) -> ReindexReport:
+    """Reindex ``library_root`` into ``repository`` and return a report.
+
+    ``mode`` is ``"incremental"`` (journal-driven delta) or ``"full"`` (parse
+    everything and replace all non-periodical rows).
+    """
+
+    if mode not in REINDEX_MODES:
+        raise ValueError(f"Unsupported reindex mode: {mode!r}")
+    if not _RUN_LOCK.acquire(blocking=False):
+        raise ReindexInProgressError("A library reindex is already running")
+    try:
+        return _run_locked(
+            Path(library_root),
+            repository,
+            build_entry=build_entry,
+            mode=mode,
+            workers=resolve_worker_count(workers),
+            journal_path=Path(journal_path) if journal_path else journal_path_for(library_root),
+        )
+    finally:
+        _RUN_LOCK.release()
+
+
+def _run_locked(
+    library_root: Path,
+    repository,
+    *,
+    build_entry: BuildEntry,
+    mode: str,
+    workers: int,
+    journal_path: Path,
+) -> ReindexReport:
+    started = time.monotonic()
+    started_at = time.time()
+    report = ReindexReport(mode=mode, requested_mode=mode)
+    _reset_progress(
+        state="running",
+        mode=mode,
+        requested_mode=mode,
+        phase="scan",
+        processed=0,
+        total=0,
+        workers=workers,
+        started_at=started_at,
+        started_monotonic=started,
+    )
+    try:
+        previous: Dict[str, JournalRecord] = {}
+        if mode == "incremental":
+            journal = load_journal(journal_path, library_root=library_root)
+            if journal is None:
+                report.fallback_reason = "journal_unavailable"
+            elif _journal_out_of_step(repository, journal):
+                report.fallback_reason = "index_out_of_step"
+            else:
+                previous = journal
+            if report.fallback_reason:
+                report.mode = "full"
+                _update_progress(mode="full", fallback_reason=report.fallback_reason)
+        force = report.mode == "full"
+
+        phase_started = time.monotonic()
+        job_roots = discover_job_roots(library_root)
+        report.scanned = len(job_roots)
+        report.timings["scan"] = time.monotonic() - phase_started
+        _update_progress(phase="load", total=len(job_roots))
+
+        phase_started = time.monotonic()
+        racy_cutoff_ns = time.time_ns() - RACY_WINDOW_NS
+        results: List[_LoadResult] = []
+        with ThreadPoolExecutor(
+            max_workers=min(workers, max(1, len(job_roots))),
+            thread_name_prefix="library-reindex",
+        ) as executor:
+            futures = {}
+            for job_root in job_roots:
+                key = job_root.relative_to(library_root).as_posix()
+                future = executor.submit(
+                    _load_job_root,
+                    job_root,
+                    key,
+                    previous.get(key),
+                    build_entry=build_entry,
+                    force=force,
+                    racy_cutoff_ns=racy_cutoff_ns,
+                )
+                futures[future] = key
+            for processed, future in enumerate(as_completed(futures), start=1):
+                key = futures[future]
+                try:
+                    results.append(future.result())
+                except Exception:
+                    LOGGER.warning("Unable to index library folder %s", key, exc_info=True)
+                    results.append(_LoadResult(key=key, outcome="failed"))
+                if processed % 64 == 0 or processed == len(futures):
+                    _update_progress(processed=processed)
+        report.timings["load"] = time.monotonic() - phase_started
+
+        records: Dict[str, JournalRecord] = {}
+        upserts: Dict[str, LibraryEntry] = {}
+        failed_keys: Set[str] = set()
+        for result in sorted(results, key=lambda item: item.key):
+            if result.outcome == "failed":
+                report.failed += 1
+                failed_keys.add(result.key)
+                prior = previous.get(result.key)
+                if prior is not None:
+                    records[result.key] = prior
+                continue
+            if result.outcome == "missing" or result.record is None:
+                continue
+            records[result.key] = result.record
+            if result.outcome == "unchanged":
+                report.unchanged += 1
+            elif result.outcome == "parsed" and result.entry is not None:
+                report.parsed += 1
+                if result.entry.id in upserts:
+                    LOGGER.warning(
+                        "Library job %s found in several folders; keeping the first",
+                        result.entry.id,
+                    )
+                    continue
+                upserts[result.entry.id] = result.entry
+
+        live_ids: Set[str] = {record.job_id for record in records.values() if record.job_id}
+        _update_progress(phase="apply")
+        phase_started = time.monotonic()
+        if force:
+            retained = [
+                entry
+                for entry in _retained_entries(repository, library_root, failed_keys, previous)
+                if entry.id not in upserts
+            ]
+            repository.replace_entries(list(upserts.values()) + retained)
+            live_ids.update(entry.id for entry in retained)
+            report.deleted = 0
+        else:
+            stale_ids = {
+                record.job_id for record in previous.values() if record.job_id
+            } - live_ids
+            repository.apply_delta(list(upserts.values()), sorted(stale_ids))
+            report.deleted = len(stale_ids)
+        report.upserted = len(upserts)
+        report.indexed = len(live_ids)
+        report.timings["apply"] = time.monotonic() - phase_started
+
+        _update_progress(phase="journal")
+        phase_started = time.monotonic()
+        save_journal(journal_path, records, library_root=library_root)
+        report.timings["journal"] = time.monotonic() - phase_started
+    except Exception as exc:
+        _update_progress(
+            state="failed",
+            error=type(exc).__name__,
+            finished_at=time.time(),
+            duration_seconds=time.monotonic() - started,
+        )
+        raise
+
+    report.duration_seconds = time.monotonic() - started
+    _reset_progress(
+        state="completed",
+        phase="done",
+        processed=report.scanned,
+        total=report.scanned,
+        workers=workers,
+        started_at=started_at,
+        finished_at=time.time(),
+        **report.as_dict(),
+    )
+    LOGGER.info(
+        "Library reindex (%s) indexed=%d parsed=%d unchanged=%d upserted=%d deleted=%d failed=%d in %.2fs",
+        report.mode,
+        report.indexed,
+        report.parsed,
+        report.unchanged,
+        report.upserted,
+        report.deleted,
+        report.failed,
+        report.duration_seconds,
+    )
+    return report
+
+
+__all__ = [
+    "DEFAULT_REINDEX_WORKERS",
+    "JOURNAL_FILENAME",
+    "JournalRecord",
+    "REINDEX_MODES",
+    "REINDEX_WORKERS_ENV",
+    "ReindexInProgressError",
+    "ReindexReport",
+    "discover_job_roots",
+    "journal_path_for",
+    "load_journal",
+    "reindex_progress",
+    "resolve_worker_count",
+    "run_reindex",
+    "save_journal",
+]
@@ -3,14 +3,19 @@
 from __future__ import annotations
 
 import json
+import re
 import time
-from dataclasses import dataclass
-from typing import Any, Callable, Mapping, Optional, Sequence
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
 
 from modules import prompt_templates
-from modules.llm_client import LLMClient
+from modules.llm_client import LLMClient, LLMResponse
 
 JsonValidator = Callable[[Any], bool]
+ItemCallback = Callable[[Mapping[str, Any]], None]
+
+_STREAM_RETRY_BACKOFF_SECONDS = 1.0
+_ITEMS_KEY_PATTERN = re.compile(r'"items"\s*:\s*$')
 
 
 @dataclass(slots=True)
@@ -21,6 +26,9 @@ class JsonBatchResponse:
     raw_text: str
     error: Optional[str]
     elapsed: float
+    token_usage: Dict[str, int] = field(default_factory=dict)
+    streamed_items: int = 0
+    first_item_elapsed: Optional[float] = None
 
 
 def build_json_batch_payload(items: Sequence[Mapping[str, Any]]) -> str:
@@ -71,6 +79,123 @@ def parse_json_payload(text: str) -> Optional[Any]:
     return None
 
 
+class JsonItemStreamParser:
+    """Emit batch items from a JSON response while it is still streaming.
+
+    Text is fed in arbitrary chunks. Every object that completes directly
+    inside a top-level array, or inside the ``"items"`` array of a top-level
+    object, is decoded and passed to ``on_item``. Braces inside strings are
+    ignored, as is any text around the JSON (code fences, preambles).
+    """
+
+    def __init__(self, on_item: ItemCallback) -> None:
+        self._on_item = on_item
+        self._text = ""
+        self._pos = 0
+        self._stack: List[str] = []
+        self._in_string = False
+        self._escaped = False
+        self._item_start: Optional[int] = None
+        self._item_array_depth: Optional[int] = None
+        self.items_emitted = 0
+
+    def feed(self, chunk: str) -> None:
+        """Consume ``chunk`` and emit every item it completes."""
+
+        if not chunk:
+            return
+        self._text += chunk
+        text = self._text
+        for pos in range(self._pos, len(text)):
+            char = text[pos]
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+                continue
+            if char == '"':
+                if self._stack:
+                    self._in_string = True
+            elif char == "[":
+                if self._is_items_array_start(pos):
+                    self._item_array_depth = len(self._stack) + 1
+                self._stack.append(char)
+            elif char == "{":
+                if (
+                    self._item_start is None
+                    and self._item_array_depth is not None
+                    and len(self._stack) == self._item_array_depth
+                ):
+                    self._item_start = pos
+                self._stack.append(char)
+            elif char in "]}" and self._stack:
+                self._stack.pop()
+                depth = len(self._stack)
+                if char == "}" and self._item_start is not None and depth == self._item_array_depth:
+                    self._emit(text[self._item_start : pos + 1])
+                    self._item_start = None
+                elif char == "]" and self._item_array_depth is not None and depth < self._item_array_depth:
+                    self._item_array_depth = None
+        self._pos = len(text)
+
+    @property
+    def text(self) -> str:
+        """Return all text fed so far."""
+
+        return self._text
+
+    def _is_items_array_start(self, pos: int) -> bool:
+        if not self._stack:
+            return True
+        if self._stack != ["{"]:
+            return False
+        return bool(_ITEMS_KEY_PATTERN.search(self._text[max(0, pos - 64) : pos]))
+
+    def _emit(self, fragment: str) -> None:
+        try:
+            item = json.loads(fragment)
+        except json.JSONDecodeError:
+            return
+        if isinstance(item, Mapping):
+            self.items_emitted += 1
+            self._on_item(item)
+
+
+def _send_streamed_request(
+    client: LLMClient,
+    payload: Dict[str, Any],
+    *,
+    timeout_seconds: float,
+    max_attempts: int,
+    validator: Callable[[str], bool],
+    on_item: ItemCallback,
+) -> Tuple[LLMResponse, int]:
+    """Send ``payload`` with streaming, feeding each attempt to a fresh parser."""
+
+    response: Optional[LLMResponse] = None
+    emitted = 0
+    for attempt in range(1, max(1, max_attempts) + 1):
+        parser = JsonItemStreamParser(on_item)
+        response = client.send_chat_request(
+            payload,
+            max_attempts=1,
+            timeout=timeout_seconds,
+            validator=validator,
+            backoff_seconds=0.0,
+            on_text=parser.feed,
+        )
+        emitted += parser.items_emitted
+        if not response.error:
+            break
+        if attempt < max_attempts:
+            time.sleep(_STREAM_RETRY_BACKOFF_SECONDS * attempt)
+    assert response is not None
+    return response, emitted
+
+
 def request_json_batch(
     *,
     client: LLMClient,
@@ -79,14 +204,23 @@ def request_json_batch(
     timeout_seconds: float,
     max_attempts: int = 3,
     validator: Optional[JsonValidator] = None,
+    on_item: Optional[ItemCallback] = None,
 ) -> JsonBatchResponse:
-    """Send a JSON batch request and parse the response."""
+    """Send a JSON batch request and parse the response.
+
+    When ``on_item`` is given the response is streamed and each item object
+    is handed to it as soon as it is complete, before the batch finishes.
+    Endpoints that cannot stream answer in one piece and the items are then
+    emitted together once the response arrives. Items from attempts that
+    are later retried have already been emitted, so callers should ignore
+    ids they have seen.
+    """
 
     user_payload = build_json_batch_payload(items)
     payload = prompt_templates.make_sentence_payload(
         user_payload,
         model=client.model,
-        stream=False,
+        stream=on_item is not None,
         system_prompt=system_prompt,
     )
 
@@ -102,12 +236,31 @@ def request_json_batch(
             return False
 
     start_time = time.perf_counter()
-    response = client.send_chat_request(
-        payload,
-        max_attempts=max_attempts,
-        timeout=timeout_seconds,
-        validator=_validate_response,
-    )
+    streamed_items = 0
+    first_item_elapsed: Optional[float] = None
+    if on_item is None:
+        response = client.send_chat_request(
+            payload,
+            max_attempts=max_attempts,
+            timeout=timeout_seconds,
+            validator=_validate_response,
+        )
+    else:
+
+        def _timed_item(item: Mapping[str, Any]) -> None:
+            nonlocal first_item_elapsed
+            if first_item_elapsed is None:
+                first_item_elapsed = time.perf_counter() - start_time
+            on_item(item)
+
+        response, streamed_items = _send_streamed_request(
+            client,
+            payload,
+            timeout_seconds=timeout_seconds,
+            max_attempts=max_attempts,
+            validator=_validate_response,
+            on_item=_timed_item,
+        )
     elapsed = time.perf_counter() - start_time
     parsed = parse_json_payload(response.text)
     error = response.error
@@ -120,11 +273,16 @@ def request_json_batch(
         raw_text=response.text or "",
         error=error,
         elapsed=elapsed,
+        token_usage=dict(response.token_usage or {}),
+        streamed_items=streamed_items,
+        first_item_elapsed=first_item_elapsed,
     )
 
 
 __all__ = [
+    "ItemCallback",
     "JsonBatchResponse",
+    "JsonItemStreamParser",
     "build_json_batch_payload",
     "parse_json_payload",
     "request_json_batch",
@@ -27,6 +27,7 @@ logger = log_mgr.get_logger()
 
 TokenUsage = Dict[str, int]
 Validator = Callable[[str], bool]
+TextCallback = Callable[[str], None]
 
 
 @dataclass(frozen=True)
@@ -175,7 +176,11 @@ class LLMClient:
         for key, value in self._extract_token_usage(new_data).items():
             existing[key] = value
 
-    def _parse_stream(self, response: requests.Response) -> LLMResponse:
+    def _parse_stream(
+        self,
+        response: requests.Response,
+        on_text: Optional[TextCallback] = None,
+    ) -> LLMResponse:
         full_text = ""
         token_usage: TokenUsage = {}
         raw_chunks: List[Dict[str, Any]] = []
@@ -203,7 +208,7 @@ class LLMClient:
             try:
                 payload = json.loads(payload_text)
             except json.JSONDecodeError:
-                self._log_debug("Skipping non-JSON line from stream: %s", line)
+                self._log_debug("Skipping non-JSON line from stream: %s", payload_text)
                 continue
             raw_chunks.append(payload)
             message = payload.get("message", {}).get("content")
@@ -223,6 +228,8 @@ class LLMClient:
                         break
             if message:
                 full_text += message
+                if on_text is not None:
+                    on_text(message)
             self._merge_token_usage(token_usage, payload)
 
         response_payload = LLMResponse(
@@ -320,6 +327,7 @@ class LLMClient:
         *,
         timeout: Optional[int] = None,
         request_mode: str = "chat",
+        on_text: Optional[TextCallback] = None,
     ) -> LLMResponse:
         timeout = timeout or 90
         base_payload = dict(payload)
@@ -401,11 +409,13 @@ class LLMClient:
                 endpoint_errors.append(f"{endpoint.source.value}: {error_message}")
                 continue
 
-            parsed = (
-                self._parse_stream(response)
-                if attempt_stream
-                else self._parse_json_response(response)
-            )
+            if attempt_stream:
+                parsed = self._parse_stream(response, on_text)
+            else:
+                parsed = self._parse_json_response(response)
+                # Endpoints without streaming deliver the whole text at once.
+                if on_text is not None and parsed.text:
+                    on_text(parsed.text)
             parsed.raw = parsed.raw or response.text
             parsed.source = endpoint.source.value
             return parsed
@@ -431,6 +441,7 @@ class LLMClient:
         timeout: Optional[int] = None,
         validator: Optional[Validator] = None,
         backoff_seconds: float = 1.0,
+        on_text: Optional[TextCallback] = None,
     ) -> LLMResponse:
         working_payload = dict(payload)
         working_payload.setdefault("model", self.model)
@@ -442,6 +453,7 @@ class LLMClient:
                     working_payload,
                     timeout=timeout,
                     request_mode=request_mode,
+                    on_text=on_text,
                 )
             except requests.exceptions.RequestException as exc:
                 last_error = str(exc)
@@ -494,8 +506,13 @@ class LLMClient:
         timeout: Optional[int] = None,
         validator: Optional[Validator] = None,
         backoff_seconds: float = 1.0,
+        on_text: Optional[TextCallback] = None,
     ) -> LLMResponse:
-        """Send a chat request with retries and optional response validation."""
+        """Send a chat request with retries and optional response validation.
+
+        ``on_text`` receives response text as it arrives when the payload asks
+        for streaming, or the whole text at once otherwise.
+        """
 
         return self._send_request(
             payload,
@@ -504,6 +521,7 @@ class LLMClient:
             timeout=timeout,
             validator=validator,
             backoff_seconds=backoff_seconds,
+            on_text=on_text,
         )
 
     def send_completion_request(
@@ -514,8 +532,13 @@ class LLMClient:
         timeout: Optional[int] = None,
         validator: Optional[Validator] = None,
         backoff_seconds: float = 1.0,
+        on_text: Optional[TextCallback] = None,
     ) -> LLMResponse:
-        """Send a completion request with retries and optional response validation."""
+        """Send a completion request with retries and optional response validation.
+
+        ``on_text`` receives response text as it arrives when the payload asks
+        for streaming, or the whole text at once otherwise.
+        """
 
         return self._send_request(
             payload,
@@ -524,6 +547,7 @@ class LLMClient:
             timeout=timeout,
             validator=validator,
             backoff_seconds=backoff_seconds,
+            on_text=on_text,
         )
 
     def list_available_tags(self) -> Optional[Dict[str, Any]]:
@@ -17,6 +17,7 @@ from PIL import Image, ImageDraw, ImageFont
 from bs4 import BeautifulSoup
 from ebooklib import epub
 
+from . import chunk_index
 from . import config_manager as cfg
 from . import logging_manager as log_mgr
 from .llm_client import LLMClient, create_client
@@ -760,12 +761,19 @@ def populate_config_metadata(
 
 
 class MetadataLoader:
-    """Helper class for reading per-chunk pipeline metadata payloads."""
+    """Helper class for reading per-chunk pipeline metadata payloads.
+
+    Summary reads (``include_sentences=False``) are answered from the job's
+    chunk summary index when it is current for the chunk file, and only
+    open the chunk file when its timing tracks are requested.
+    """
 
     def __init__(self, job_root: str | Path) -> None:
         self._job_root = Path(job_root)
         self._metadata_root = self._job_root / "metadata"
         self._manifest_cache: Optional[Dict[str, Any]] = None
+        self._chunk_index: Optional[Mapping[str, Any]] = None
+        self._chunk_index_loaded = False
 
     def _manifest_path(self) -> Path:
         return self._metadata_root / "job.json"
@@ -806,9 +814,18 @@ class MetadataLoader:
             if isinstance(chunk, Mapping)
         )
 
-    def load_chunks(self, *, include_sentences: bool = True) -> List[Dict[str, Any]]:
+    def load_chunks(
+        self,
+        *,
+        include_sentences: bool = True,
+        include_timing: bool = True,
+    ) -> List[Dict[str, Any]]:
         return [
-            self._load_chunk_payload(chunk, include_sentences=include_sentences)
+            self._load_chunk_payload(
+                chunk,
+                include_sentences=include_sentences,
+                include_timing=include_timing,
+            )
             for chunk in self.iter_chunks()
         ]
 
@@ -817,8 +834,13 @@ class MetadataLoader:
         chunk: Mapping[str, Any],
         *,
         include_sentences: bool = True,
+        include_timing: bool = True,
     ) -> Dict[str, Any]:
-        return self._load_chunk_payload(chunk, include_sentences=include_sentences)
+        return self._load_chunk_payload(
+            chunk,
+            include_sentences=include_sentences,
+            include_timing=include_timing,
+        )
 
     def load_chunk_sentences(self, chunk: Mapping[str, Any]) -> List[Any]:
         metadata_payload: Optional[Mapping[str, Any]] = None
@@ -831,7 +853,9 @@ class MetadataLoader:
     def build_chunk_manifest(self) -> Dict[str, Any]:
         chunk_entries = []
         for index, chunk in enumerate(self.iter_chunks()):
-            summary = self._load_chunk_payload(chunk, include_sentences=False)
+            summary = self._load_chunk_payload(
+                chunk, include_sentences=False, include_timing=False
+            )
             chunk_entries.append(
                 {
                     "index": index,
@@ -850,6 +874,44 @@ class MetadataLoader:
             return candidate
         return self._job_root / candidate
 
+    def _indexed_chunk_entry(self, path_value: str) -> Optional[Mapping[str, Any]]:
+        """Return the chunk index entry for a chunk file while it is current."""
+
+        if not self._chunk_index_loaded:
+            self._chunk_index_loaded = True
+            self._chunk_index = chunk_index.load_chunk_index(self._metadata_root)
+        if self._chunk_index is None:
+            return None
+        candidate = self._resolve_chunk_path(path_value)
+        if candidate.parent != self._metadata_root:
+            return None
+        entry = self._chunk_index["chunks"].get(candidate.name)
+        if not isinstance(entry, Mapping) or not entry.get("valid"):
+            return None
+        try:
+            stat_result = candidate.stat()
+        except OSError:
+            return None
+        if not chunk_index.entry_is_current(entry, stat_result):
+            return None
+        return entry
+
+    @staticmethod
+    def _chunk_stub(entry: Mapping[str, Any]) -> Dict[str, Any]:
+        """Return the chunk file keys :meth:`_load_chunk_payload` reads, from an index entry.
+
+        ``timingTracks`` is left empty: the index only records token counts.
+        """
+
+        stub: Dict[str, Any] = {}
+        if isinstance(entry.get("sentence_count"), int):
+            stub["sentence_count"] = entry["sentence_count"]
+        if isinstance(entry.get("audioTracks"), Mapping):
+            stub["audioTracks"] = entry["audioTracks"]
+        if isinstance(entry.get("timingTracks"), Mapping):
+            stub["timingTracks"] = {}
+        return stub
+
     def _read_chunk_file(self, path_value: str) -> Optional[Mapping[str, Any]]:
         candidate = self._resolve_chunk_path(path_value)
         try:
@@ -864,6 +926,7 @@ class MetadataLoader:
         chunk: Mapping[str, Any],
         *,
         include_sentences: bool,
+        include_timing: bool = True,
     ) -> Dict[str, Any]:
         payload = {
             key: copy.deepcopy(value)
@@ -874,7 +937,14 @@ class MetadataLoader:
         metadata_payload: Optional[Mapping[str, Any]] = None
         metadata_path = chunk.get("metadata_path")
         if isinstance(metadata_path, str) and metadata_path.strip():
-            metadata_payload = self._read_chunk_file(metadata_path)
+            if not include_sentences:
+                entry = self._indexed_chunk_entry(metadata_path)
+                # Timing tokens are not indexed, so chunks that have them are
+                # still read when the caller wants them.
+                if entry is not None and (not include_timing or not entry.get("timingTracks")):
+                    metadata_payload = self._chunk_stub(entry)
+            if metadata_payload is None:
+                metadata_payload = self._read_chunk_file(metadata_path)
 
         sentence_count = payload.get("sentence_count")
         if not isinstance(sentence_count, int):
@@ -917,18 +987,19 @@ class MetadataLoader:
         if audio_tracks:
             payload["audioTracks"] = copy.deepcopy(audio_tracks)
 
-        timing_source: Optional[Mapping[str, Any]] = None
-        if isinstance(metadata_payload, Mapping):
-            candidate = metadata_payload.get("timingTracks")
-            if isinstance(candidate, Mapping):
-                timing_source = candidate
-        if timing_source is None:
-            candidate = chunk.get("timingTracks")
-            if isinstance(candidate, Mapping):
-                timing_source = candidate
-        timing_tracks = _clone_mapping(timing_source)
-        if timing_tracks:
-            payload["timingTracks"] = copy.deepcopy(timing_tracks)
+        if include_timing:
+            timing_source: Optional[Mapping[str, Any]] = None
+            if isinstance(metadata_payload, Mapping):
+                candidate = metadata_payload.get("timingTracks")
+                if isinstance(candidate, Mapping):
+                    timing_source = candidate
+            if timing_source is None:
+                candidate = chunk.get("timingTracks")
+                if isinstance(candidate, Mapping):
+                    timing_source = candidate
+            timing_tracks = _clone_mapping(timing_source)
+            if timing_tracks:
+                payload["timingTracks"] = copy.deepcopy(timing_tracks)
 
         payload["sentence_count"] = sentence_count
         return payload
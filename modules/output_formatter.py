@@ -9,11 +9,6 @@ from pathlib import Path
 from typing import Iterable, Sequence
 
 from ebooklib import epub
-from reportlab.lib.pagesizes import letter
-from reportlab.lib.styles import getSampleStyleSheet
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
-from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer
 
 from modules import config_manager as cfg
 from modules import logging_manager as log_mgr
@@ -72,6 +67,14 @@ def write_pdf_file(
     target_language: str,
 ) -> None:
     """Persist the provided blocks into a PDF document with unicode font support."""
+    # reportlab is only needed for PDF output; importing it lazily keeps it
+    # off the API start-up path.
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.pdfbase import pdfmetrics
+    from reportlab.pdfbase.ttfonts import TTFont
+    from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer
+
     try:
         font_path = None
         if sys.platform == "darwin":
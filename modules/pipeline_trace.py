@@ -0,0 +1,734 @@
+"""Per-job span recording for pipeline stage timing breakdowns.
+
+A :class:`JobTraceRecorder` collects lightweight spans for every sentence as
+it moves through translate → transliterate → TTS → align → export, including
+the time spent waiting in the hand-off queues between those stages. Spans are
+kept in memory, flushed periodically to ``metadata/trace.json`` inside the job
+directory and mirrored into the Prometheus exporter, so no external collector
+is required to answer "why was this job slow?".
+
+Call sites do not hold a recorder directly; they use the module-level helpers
+(:func:`trace_span`, :func:`record_span`, :func:`record_llm_usage`, …) with the
+job's :class:`~modules.progress_tracker.ProgressTracker`. The helpers are
+no-ops when the tracker has no recorder attached.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import math
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+from . import logging_manager as log_mgr
+
+logger = log_mgr.get_logger()
+
+TRACE_FILENAME = "trace.json"
+TRACE_VERSION = 1
+
+DEFAULT_MAX_SPANS = 200_000
+DEFAULT_FLUSH_INTERVAL_SECONDS = 5.0
+
+# Canonical per-sentence stage order used when building the critical path.
+SENTENCE_STAGE_ORDER: Tuple[str, ...] = (
+    "translate",
+    "queue.translation",
+    "transliterate",
+    "tts",
+    "align",
+    "queue.media",
+    "export",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class TraceSpan:
+    """Single timed interval recorded for a job."""
+
+    stage: str
+    start: float
+    duration: float
+    sentence_number: Optional[int] = None
+    attributes: Mapping[str, Any] = field(default_factory=dict)
+
+    @property
+    def end(self) -> float:
+        return self.start + self.duration
+
+    def to_dict(self) -> Dict[str, Any]:
+        payload: Dict[str, Any] = {
+            "stage": self.stage,
+            "start": round(self.start, 6),
+            "duration": round(self.duration, 6),
+        }
+        if self.sentence_number is not None:
+            payload["sentence"] = self.sentence_number
+        if self.attributes:
+            payload["attributes"] = dict(self.attributes)
+        return payload
+
+    @classmethod
+    def from_dict(cls, payload: Mapping[str, Any]) -> Optional["TraceSpan"]:
+        stage = payload.get("stage")
+        if not isinstance(stage, str) or not stage:
+            return None
+        try:
+            start = float(payload.get("start", 0.0))
+            duration = max(0.0, float(payload.get("duration", 0.0)))
+        except (TypeError, ValueError):
+            return None
+        sentence = payload.get("sentence")
+        sentence_number = sentence if isinstance(sentence, int) else None
+        attributes = payload.get("attributes")
+        return cls(
+            stage=stage,
+            start=start,
+            duration=duration,
+            sentence_number=sentence_number,
+            attributes=dict(attributes) if isinstance(attributes, Mapping) else {},
+        )
+
+
+# ---------------------------------------------------------------------------
+# Prometheus bridge
+# ---------------------------------------------------------------------------
+
+_metrics_bridge: Optional[Dict[str, Any]] = None
+
+
+def _get_metrics_bridge() -> Dict[str, Any]:
+    """Resolve the Prometheus collectors once; empty when unavailable."""
+
+    global _metrics_bridge
+    if _metrics_bridge is not None:
+        return _metrics_bridge
+    try:
+        from modules.webapi.metrics import (
+            PIPELINE_LLM_TOKENS,
+            PIPELINE_QUEUE_WAIT,
+            PIPELINE_SPAN_DURATION,
+        )
+
+        _metrics_bridge = {
+            "span": PIPELINE_SPAN_DURATION,
+            "queue": PIPELINE_QUEUE_WAIT,
+            "tokens": PIPELINE_LLM_TOKENS,
+        }
+    except Exception:
+        _metrics_bridge = {}
+    return _metrics_bridge
+
+
+def _export_span_metric(stage: str, duration: float) -> None:
+    bridge = _get_metrics_bridge()
+    try:
+        if stage.startswith("queue."):
+            histogram = bridge.get("queue")
+            if histogram is not None:
+                histogram.labels(queue=stage[len("queue."):]).observe(duration)
+            return
+        histogram = bridge.get("span")
+        if histogram is not None:
+            histogram.labels(stage=stage).observe(duration)
+    except Exception:
+        pass
+
+
+def _export_token_metric(stage: str, kind: str, value: int) -> None:
+    counter = _get_metrics_bridge().get("tokens")
+    if counter is None or value <= 0:
+        return
+    try:
+        counter.labels(stage=stage, kind=kind).inc(value)
+    except Exception:
+        pass
+
+
+# ---------------------------------------------------------------------------
+# Recorder
+# ---------------------------------------------------------------------------
+
+
+def _atomic_write_json(path: Path, payload: Mapping[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+    tmp_path.replace(path)
+
+
+class JobTraceRecorder:
+    """Thread-safe span collector persisted to a per-job trace file.
+
+    Span start times are wall-clock epoch seconds so traces from a paused and
+    resumed job can be merged into one file without rebasing.
+    """
+
+    def __init__(
+        self,
+        job_id: str,
+        *,
+        path: Optional[Path] = None,
+        max_spans: int = DEFAULT_MAX_SPANS,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+        export_metrics: bool = True,
+    ) -> None:
+        self._job_id = job_id
+        self._path = Path(path) if path is not None else None
+        self._max_spans = max(1, int(max_spans))
+        self._flush_interval = max(0.0, float(flush_interval))
+        self._export_metrics = export_metrics
+        self._lock = threading.Lock()
+        self._spans: Deque[TraceSpan] = deque(maxlen=self._max_spans)
+        self._dropped = 0
+        self._dirty = False
+        self._closed = False
+        self._last_flush = time.monotonic()
+        self._pending_marks: Dict[Tuple[str, object], float] = {}
+        # perf_counter → epoch offset so perf_counter readings can be stored as wall time.
+        self._epoch_offset = time.time() - time.perf_counter()
+        self._runs: List[Dict[str, Any]] = []
+        if self._path is not None:
+            self._load_existing()
+        self._runs.append({"started_at": round(time.time(), 6)})
+
+    @classmethod
+    def for_job(cls, job_id: str, metadata_root: Path, **kwargs: Any) -> "JobTraceRecorder":
+        """Return a recorder writing to ``metadata_root / trace.json``."""
+
+        return cls(job_id, path=Path(metadata_root) / TRACE_FILENAME, **kwargs)
+
+    @property
+    def job_id(self) -> str:
+        return self._job_id
+
+    @property
+    def path(self) -> Optional[Path]:
+        return self._path
+
+    def _load_existing(self) -> None:
+        payload = load_trace(self._path) if self._path is not None else None
+        if not payload:
+            return
+        spans = payload.get("spans")
+        if isinstance(spans, list):
+            for entry in spans[-self._max_spans:]:
+                if isinstance(entry, Mapping):
+                    span = TraceSpan.from_dict(entry)
+                    if span is not None:
+                        self._spans.append(span)
+        runs = payload.get("runs")
+        if isinstance(runs, list):
+            self._runs.extend(run for run in runs if isinstance(run, dict))
+        try:
+            self._dropped = max(0, int(payload.get("dropped_spans", 0)))
+        except (TypeError, ValueError):
+            self._dropped = 0
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+    def to_wall_time(self, perf_value: float) -> float:
+        """Convert a :func:`time.perf_counter` reading into epoch seconds."""
+
+        return perf_value + self._epoch_offset
+
+    def record(
+        self,
+        stage: str,
+        start: float,
+        end: float,
+        *,
+        sentence_number: Optional[int] = None,
+        attributes: Optional[Mapping[str, Any]] = None,
+    ) -> None:
+        """Record a span from two :func:`time.perf_counter` readings."""
+
+        duration = max(0.0, end - start)
+        span = TraceSpan(
+            stage=stage,
+            start=self.to_wall_time(start),
+            duration=duration,
+            sentence_number=sentence_number,
+            attributes=dict(attributes or {}),
+        )
+        should_flush = False
+        with self._lock:
+            if self._closed:
+                return
+            if len(self._spans) >= self._max_spans:
+                self._dropped += 1
+            self._spans.append(span)
+            self._dirty = True
+            if (
+                self._path is not None
+                and self._flush_interval > 0
+                and time.monotonic() - self._last_flush >= self._flush_interval
+            ):
+                should_flush = True
+        if self._export_metrics:
+            _export_span_metric(stage, duration)
+        if should_flush:
+            self.flush()
+
+    @contextlib.contextmanager
+    def span(
+        self,
+        stage: str,
+        *,
+        sentence_number: Optional[int] = None,
+        attributes: Optional[Mapping[str, Any]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Context manager that records the enclosed block as ``stage``.
+
+        The yielded dict may be updated with extra attributes before exit.
+        """
+
+        extra: Dict[str, Any] = dict(attributes or {})
+        start = time.perf_counter()
+        try:
+            yield extra
+        finally:
+            self.record(
+                stage,
+                start,
+                time.perf_counter(),
+                sentence_number=sentence_number,
+                attributes=extra,
+            )
+
+    def mark_enqueued(self, queue_name: str, key: object) -> None:
+        """Remember when ``key`` entered ``queue_name``."""
+
+        with self._lock:
+            self._pending_marks[(queue_name, key)] = time.perf_counter()
+
+    def mark_dequeued(
+        self,
+        queue_name: str,
+        key: object,
+        *,
+        sentence_number: Optional[int] = None,
+    ) -> Optional[float]:
+        """Record the wait for ``key`` in ``queue_name`` and return it."""
+
+        now = time.perf_counter()
+        with self._lock:
+            enqueued_at = self._pending_marks.pop((queue_name, key), None)
+        if enqueued_at is None:
+            return None
+        self.record(
+            f"queue.{queue_name}",
+            enqueued_at,
+            now,
+            sentence_number=sentence_number,
+        )
+        return now - enqueued_at
+
+    def record_llm_usage(
+        self,
+        stage: str,
+        usage: Optional[Mapping[str, Any]],
+        *,
+        elapsed: float,
+        sentence_numbers: Sequence[int] = (),
+        attributes: Optional[Mapping[str, Any]] = None,
+    ) -> None:
+        """Record an LLM request span with prompt/completion token counts."""
+
+        prompt_tokens = _coerce_token_count(usage, "prompt_eval_count", "prompt_tokens")
+        completion_tokens = _coerce_token_count(usage, "eval_count", "completion_tokens")
+        attrs: Dict[str, Any] = dict(attributes or {})
+        attrs["prompt_tokens"] = prompt_tokens
+        attrs["completion_tokens"] = completion_tokens
+        if sentence_numbers:
+            attrs["items"] = len(sentence_numbers)
+            attrs["first_sentence"] = min(sentence_numbers)
+            attrs["last_sentence"] = max(sentence_numbers)
+        end = time.perf_counter()
+        sentence_number = sentence_numbers[0] if len(sentence_numbers) == 1 else None
+        self.record(
+            f"llm.{stage}",
+            end - max(0.0, elapsed),
+            end,
+            sentence_number=sentence_number,
+            attributes=attrs,
+        )
+        if self._export_metrics:
+            _export_token_metric(stage, "prompt", prompt_tokens)
+            _export_token_metric(stage, "completion", completion_tokens)
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+    def spans(self) -> List[TraceSpan]:
+        with self._lock:
+            return list(self._spans)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the serialisable trace payload."""
+
+        with self._lock:
+            spans = [span.to_dict() for span in self._spans]
+            dropped = self._dropped
+            runs = [dict(run) for run in self._runs]
+        return {
+            "version": TRACE_VERSION,
+            "job_id": self._job_id,
+            "updated_at": round(time.time(), 6),
+            "runs": runs,
+            "dropped_spans": dropped,
+            "spans": spans,
+        }
+
+    def flush(self) -> None:
+        """Persist the trace file when spans changed since the last flush."""
+
+        if self._path is None:
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            self._dirty = False
+            self._last_flush = time.monotonic()
+        try:
+            _atomic_write_json(self._path, self.snapshot())
+        except OSError as exc:
+            logger.debug(
+                "Unable to persist pipeline trace",
+                extra={
+                    "event": "pipeline.trace.flush_failed",
+                    "attributes": {"job_id": self._job_id, "error": str(exc)},
+                    "console_suppress": True,
+                },
+            )
+
+    def close(self) -> None:
+        """Stamp the current run as finished and flush the trace file."""
+
+        with self._lock:
+            if self._closed:
+                return
+            if self._runs:
+                self._runs[-1]["finished_at"] = round(time.time(), 6)
+            self._dirty = True
+        self.flush()
+        with self._lock:
+            self._closed = True
+            self._pending_marks.clear()
+
+
+def _coerce_token_count(usage: Optional[Mapping[str, Any]], *keys: str) -> int:
+    if not isinstance(usage, Mapping):
+        return 0
+    for key in keys:
+        value = usage.get(key)
+        if isinstance(value, int) and not isinstance(value, bool):
+            return max(0, value)
+    return 0
+
+
+# ---------------------------------------------------------------------------
+# Tracker-scoped helpers
+# ---------------------------------------------------------------------------
+
+
+def get_recorder(tracker: Any) -> Optional[JobTraceRecorder]:
+    """Return the recorder attached to ``tracker`` when present."""
+
+    if tracker is None:
+        return None
+    recorder = getattr(tracker, "trace_recorder", None)
+    return recorder if isinstance(recorder, JobTraceRecorder) else None
+
+
+@contextlib.contextmanager
+def trace_span(
+    tracker: Any,
+    stage: str,
+    *,
+    sentence_number: Optional[int] = None,
+    attributes: Optional[Mapping[str, Any]] = None,
+) -> Iterator[Dict[str, Any]]:
+    """Record the enclosed block on ``tracker``'s recorder (no-op without one)."""
+
+    recorder = get_recorder(tracker)
+    if recorder is None:
+        yield dict(attributes or {})
+        return
+    with recorder.span(stage, sentence_number=sentence_number, attributes=attributes) as extra:
+        yield extra
+
+
+def record_span(
+    tracker: Any,
+    stage: str,
+    start: float,
+    end: float,
+    *,
+    sentence_number: Optional[int] = None,
+    attributes: Optional[Mapping[str, Any]] = None,
+) -> None:
+    """Record a span measured with :func:`time.perf_counter` readings."""
+
+    recorder = get_recorder(tracker)
+    if recorder is not None:
+        recorder.record(
+            stage,
+            start,
+            end,
+            sentence_number=sentence_number,
+            attributes=attributes,
+        )
+
+
+def record_batch_span(
+    tracker: Any,
+    stage: str,
+    start: float,
+    end: float,
+    *,
+    sentence_numbers: Sequence[int],
+    attributes: Optional[Mapping[str, Any]] = None,
+) -> None:
+    """Record one span for work done on several sentences at once.
+
+    The window is counted once in the stage totals; the sentences are listed
+    in the ``sentences`` attribute, which places the span on each of their
+    critical paths.
+    """
+
+    if not sentence_numbers:
+        return
+    attrs: Dict[str, Any] = dict(attributes or {})
+    attrs["sentences"] = list(sentence_numbers)
+    record_span(
+        tracker,
+        stage,
+        start,
+        end,
+        sentence_number=sentence_numbers[0] if len(sentence_numbers) == 1 else None,
+        attributes=attrs,
+    )
+
+
+def mark_enqueued(tracker: Any, queue_name: str, key: object) -> None:
+    recorder = get_recorder(tracker)
+    if recorder is not None:
+        recorder.mark_enqueued(queue_name, key)
+
+
+def mark_dequeued(
+    tracker: Any,
+    queue_name: str,
+    key: object,
+    *,
+    sentence_number: Optional[int] = None,
+) -> None:
+    recorder = get_recorder(tracker)
+    if recorder is not None:
+        recorder.mark_dequeued(queue_name, key, sentence_number=sentence_number)
+
+
+def record_llm_usage(
+    tracker: Any,
+    stage: str,
+    usage: Optional[Mapping[str, Any]],
+    *,
+    elapsed: float,
+    sentence_numbers: Sequence[int] = (),
+    attributes: Optional[Mapping[str, Any]] = None,
+) -> None:
+    recorder = get_recorder(tracker)
+    if recorder is not None:
+        recorder.record_llm_usage(
+            stage,
+            usage,
+            elapsed=elapsed,
+            sentence_numbers=sentence_numbers,
+            attributes=attributes,
+        )
+
+
+# ---------------------------------------------------------------------------
+# Loading and summarising
+# ---------------------------------------------------------------------------
+
+
+def load_trace(path: Path) -> Optional[Dict[str, Any]]:
+    """Return the parsed trace payload stored at ``path`` or ``None``."""
+
+    try:
+        raw = Path(path).read_text(encoding="utf-8")
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    except OSError:
+        return None
+    try:
+        payload = json.loads(raw)
+    except json.JSONDecodeError:
+        return None
+    return payload if isinstance(payload, dict) else None
+
+
+def _percentile(sorted_values: Sequence[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, math.ceil(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def _stage_stats(durations: List[float]) -> Dict[str, Any]:
+    durations.sort()
+    total = sum(durations)
+    return {
+        "count": len(durations),
+        "total_seconds": round(total, 6),
+        "mean_seconds": round(total / len(durations), 6) if durations else 0.0,
+        "p50_seconds": round(_percentile(durations, 0.5), 6),
+        "p95_seconds": round(_percentile(durations, 0.95), 6),
+        "max_seconds": round(durations[-1], 6) if durations else 0.0,
+    }
+
+
+def _stage_rank(stage: str) -> int:
+    try:
+        return SENTENCE_STAGE_ORDER.index(stage)
+    except ValueError:
+        return len(SENTENCE_STAGE_ORDER)
+
+
+def _span_sentences(span: TraceSpan) -> List[int]:
+    if span.sentence_number is not None:
+        return [span.sentence_number]
+    listed = span.attributes.get("sentences")
+    if not isinstance(listed, list):
+        return []
+    return [number for number in listed if isinstance(number, int)]
+
+
+def summarize_trace(payload: Mapping[str, Any]) -> Dict[str, Any]:
+    """Aggregate a trace payload into stage, queue, token and critical-path views.
+
+    The critical path follows the sentence that became ready last: its
+    per-stage spans (including queue waits) explain where the tail latency of
+    the job went. ``bottleneck_stage`` is the stage with the largest share of
+    that path.
+    """
+
+    raw_spans = payload.get("spans") if isinstance(payload, Mapping) else None
+    spans: List[TraceSpan] = []
+    if isinstance(raw_spans, list):
+        for entry in raw_spans:
+            if isinstance(entry, Mapping):
+                span = TraceSpan.from_dict(entry)
+                if span is not None:
+                    spans.append(span)
+
+    summary: Dict[str, Any] = {
+        "span_count": len(spans),
+        "dropped_spans": int(payload.get("dropped_spans", 0) or 0)
+        if isinstance(payload, Mapping)
+        else 0,
+        "wall_seconds": 0.0,
+        "stages": {},
+        "queues": {},
+        "llm_tokens": {"prompt": 0, "completion": 0, "by_stage": {}},
+        "sentences": 0,
+        "critical_path": None,
+        "bottleneck_stage": None,
+    }
+    if not spans:
+        return summary
+
+    first_start = min(span.start for span in spans)
+    last_end = max(span.end for span in spans)
+    summary["wall_seconds"] = round(last_end - first_start, 6)
+
+    stage_durations: Dict[str, List[float]] = {}
+    queue_durations: Dict[str, List[float]] = {}
+    by_sentence: Dict[int, List[TraceSpan]] = {}
+    tokens_by_stage: Dict[str, Dict[str, int]] = {}
+    for span in spans:
+        if span.stage.startswith("queue."):
+            queue_durations.setdefault(span.stage[len("queue."):], []).append(span.duration)
+        else:
+            stage_durations.setdefault(span.stage, []).append(span.duration)
+        if span.stage.startswith("llm."):
+            bucket = tokens_by_stage.setdefault(
+                span.stage[len("llm."):], {"prompt": 0, "completion": 0}
+            )
+            bucket["prompt"] += _coerce_token_count(span.attributes, "prompt_tokens")
+            bucket["completion"] += _coerce_token_count(span.attributes, "completion_tokens")
+        for sentence_number in _span_sentences(span):
+            by_sentence.setdefault(sentence_number, []).append(span)
+
+    summary["stages"] = {
+        stage: _stage_stats(values) for stage, values in sorted(stage_durations.items())
+    }
+    summary["queues"] = {
+        name: _stage_stats(values) for name, values in sorted(queue_durations.items())
+    }
+    summary["llm_tokens"] = {
+        "prompt": sum(bucket["prompt"] for bucket in tokens_by_stage.values()),
+        "completion": sum(bucket["completion"] for bucket in tokens_by_stage.values()),
+        "by_stage": dict(sorted(tokens_by_stage.items())),
+    }
+    summary["sentences"] = len(by_sentence)
+
+    if by_sentence:
+        critical_sentence, sentence_spans = max(
+            by_sentence.items(),
+            key=lambda item: (max(span.end for span in item[1]), item[0]),
+        )
+        ordered = sorted(sentence_spans, key=lambda span: (span.start, _stage_rank(span.stage)))
+        segments = [
+            {
+                "stage": span.stage,
+                "offset_seconds": round(span.start - first_start, 6),
+                "duration_seconds": round(span.duration, 6),
+            }
+            for span in ordered
+        ]
+        per_stage: Dict[str, float] = {}
+        for span in ordered:
+            per_stage[span.stage] = per_stage.get(span.stage, 0.0) + span.duration
+        path_start = ordered[0].start
+        path_end = max(span.end for span in ordered)
+        summary["critical_path"] = {
+            "sentence_number": critical_sentence,
+            "start_offset_seconds": round(path_start - first_start, 6),
+            "duration_seconds": round(path_end - path_start, 6),
+            "segments": segments,
+            "stage_totals": {
+                stage: round(value, 6) for stage, value in sorted(per_stage.items())
+            },
+        }
+        if per_stage:
+            summary["bottleneck_stage"] = max(per_stage.items(), key=lambda item: item[1])[0]
+
+    return summary
+
+
+__all__ = [
+    "DEFAULT_FLUSH_INTERVAL_SECONDS",
+    "DEFAULT_MAX_SPANS",
+    "JobTraceRecorder",
+    "SENTENCE_STAGE_ORDER",
+    "TRACE_FILENAME",
+    "TraceSpan",
+    "get_recorder",
+    "load_trace",
+    "mark_dequeued",
+    "mark_enqueued",
+    "record_batch_span",
+    "record_llm_usage",
+    "record_span",
+    "summarize_trace",
+    "trace_span",
+]
@@ -10,6 +10,8 @@ import time
 import copy
 from typing import Any, AsyncIterator, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
 
+from modules.render_priority import RenderPriority
+
 
 def _shallow_copy_mapping(m: Mapping[str, Any]) -> Dict[str, Any]:
     """Create a shallow copy of a mapping, suitable for immutable values."""
@@ -135,6 +137,10 @@ class ProgressTracker:
         # Throttling state
         self._last_progress_emit: float = 0.0
         self._throttled_event: Optional[ProgressEvent] = None
+        # Optional per-job span recorder (see modules.pipeline_trace)
+        self._trace_recorder: Optional[Any] = None
+        # Playhead reported by clients watching the job while it renders
+        self._render_priority = RenderPriority()
 
     @property
     def report_interval(self) -> float:
@@ -142,6 +148,23 @@ class ProgressTracker:
 
         return self._report_interval
 
+    @property
+    def trace_recorder(self) -> Optional[Any]:
+        """Return the span recorder attached to this tracker, if any."""
+
+        return self._trace_recorder
+
+    def attach_trace_recorder(self, recorder: Optional[Any]) -> None:
+        """Attach (or detach with ``None``) a :class:`JobTraceRecorder`."""
+
+        self._trace_recorder = recorder
+
+    @property
+    def render_priority(self) -> RenderPriority:
+        """Return the playhead state used to prioritize pending render work."""
+
+        return self._render_priority
+
     def set_total(self, total_blocks: int) -> None:
         """Update the expected total number of blocks to process."""
 
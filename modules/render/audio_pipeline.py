@@ -17,6 +17,7 @@ from pydub.silence import detect_silence
 
 from modules import logging_manager as log_mgr
 from modules import config_manager as cfg
+from modules import pipeline_trace
 from modules import text_normalization as text_norm
 from modules.audio.backends import get_default_backend_name
 from modules.render.backends.base import SynthesisResult
@@ -663,6 +664,12 @@ def audio_worker_body(
         if translation_task is None:
             audio_task_queue.task_done()
             break
+        pipeline_trace.mark_dequeued(
+            progress_tracker,
+            "translation",
+            translation_task.sentence_number,
+            sentence_number=translation_task.sentence_number,
+        )
 
         start_time = time.perf_counter()
         audio_segment: Optional[AudioSegment] = None
@@ -734,7 +741,17 @@ def audio_worker_body(
         finally:
             audio_task_queue.task_done()
 
-        elapsed = time.perf_counter() - start_time
+        end_time = time.perf_counter()
+        elapsed = end_time - start_time
+        if generate_audio and audio_generator is not None:
+            pipeline_trace.record_span(
+                progress_tracker,
+                "tts",
+                start_time,
+                end_time,
+                sentence_number=translation_task.sentence_number,
+                attributes={"backend": tts_backend},
+            )
         logger.debug(
             "Consumer %s processed sentence %s in %.3fs",
             worker_name,
@@ -908,13 +925,19 @@ def audio_worker_body(
                     target_language_label or "?",
                     target_language_code or "unknown",
                 )
-                aligned_tokens, retry_exhausted = _align_with_backend(
-                    audio_segment=audio_segment,
-                    text=translation_text,
-                    backend=backend_name,
-                    model=alignment_model,
-                    language=target_language_code,
-                )
+                with pipeline_trace.trace_span(
+                    progress_tracker,
+                    "align",
+                    sentence_number=translation_task.sentence_number,
+                    attributes={"backend": backend_name, "track": "translation"},
+                ):
+                    aligned_tokens, retry_exhausted = _align_with_backend(
+                        audio_segment=audio_segment,
+                        text=translation_text,
+                        backend=backend_name,
+                        model=alignment_model,
+                        language=target_language_code,
+                    )
                 if aligned_tokens:
                     word_tokens = aligned_tokens
                     alignment_policy = "forced"
@@ -1115,13 +1138,19 @@ def audio_worker_body(
                         original_language_label or "?",
                         original_language_code or "unknown",
                     )
-                    aligned_tokens, retry_exhausted = _align_with_backend(
-                        audio_segment=original_audio_segment,
-                        text=original_text,
-                        backend=backend_name,
-                        model=alignment_model,
-                        language=original_language_code,
-                    )
+                    with pipeline_trace.trace_span(
+                        progress_tracker,
+                        "align",
+                        sentence_number=translation_task.sentence_number,
+                        attributes={"backend": backend_name, "track": "original"},
+                    ):
+                        aligned_tokens, retry_exhausted = _align_with_backend(
+                            audio_segment=original_audio_segment,
+                            text=original_text,
+                            backend=backend_name,
+                            model=alignment_model,
+                            language=original_language_code,
+                        )
                     if aligned_tokens:
                         original_word_tokens = aligned_tokens
                         original_alignment_policy = "forced"
@@ -1243,6 +1272,9 @@ def audio_worker_body(
             metadata=metadata,
         )
 
+        pipeline_trace.mark_enqueued(
+            progress_tracker, "media", translation_task.sentence_number
+        )
         while True:
             if audio_stop_event and audio_stop_event.is_set():
                 break
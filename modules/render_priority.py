@@ -0,0 +1,181 @@
+"""Playhead-aware ordering of pending render work.
+
+Listeners often start playing a job while it is still rendering and then
+seek ahead.  :class:`RenderPriority` holds the sentence a client last
+reported for a job and orders pending work so the region from the playhead
+forward is produced first.  Every ``fairness_interval``-th pick still takes
+the earliest pending item, so the rest of the job keeps moving, and
+reports older than ``stale_after_seconds`` are ignored so an abandoned
+player lets the job fall back to sentence order.
+
+The pipeline registers a region resolver (its chunk plan) so a playhead
+inside a chunk prioritizes the whole chunk rather than only its tail.
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+DEFAULT_FAIRNESS_INTERVAL = 4
+DEFAULT_STALE_AFTER_SECONDS = 300.0
+
+RegionResolver = Callable[[int], int]
+
+
+class RenderPriority:
+    """Thread-safe playhead state shared by the API and the render pipeline."""
+
+    def __init__(
+        self,
+        *,
+        fairness_interval: int = DEFAULT_FAIRNESS_INTERVAL,
+        stale_after_seconds: float = DEFAULT_STALE_AFTER_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._fairness_interval = max(2, int(fairness_interval))
+        self._stale_after = float(stale_after_seconds)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._sentence: Optional[int] = None
+        self._reported_at = 0.0
+        self._region_resolver: Optional[RegionResolver] = None
+        self._reports = 0
+        self._seeks = 0
+        self._picks = 0
+        self._prioritized_picks = 0
+        self._fairness_picks = 0
+
+    def report(self, sentence_number: int, *, seek: bool = False) -> None:
+        """Record the sentence a client is playing, or has just seeked to."""
+
+        with self._lock:
+            self._sentence = max(1, int(sentence_number))
+            self._reported_at = self._clock()
+            self._reports += 1
+            if seek:
+                self._seeks += 1
+
+    def clear(self) -> None:
+        """Forget the playhead; pending work returns to sentence order."""
+
+        with self._lock:
+            self._sentence = None
+
+    def set_region_resolver(self, resolver: Optional[RegionResolver]) -> None:
+        """Map a playhead sentence to the first sentence of its region."""
+
+        with self._lock:
+            self._region_resolver = resolver
+
+    @property
+    def focus(self) -> Optional[int]:
+        """Return the first sentence of the prioritized region, if any."""
+
+        with self._lock:
+            return self._focus_locked()
+
+    def select(self, positions: Sequence[int]) -> int:
+        """Return the index in ``positions`` (sentence numbers) to run next."""
+
+        if not positions:
+            raise ValueError("select() needs at least one position")
+        earliest = min(range(len(positions)), key=positions.__getitem__)
+        with self._lock:
+            focus = self._focus_locked()
+            if focus is None:
+                return earliest
+            self._picks += 1
+            if self._picks % self._fairness_interval == 0:
+                self._fairness_picks += 1
+                return earliest
+            chosen = min(
+                range(len(positions)),
+                key=lambda index: _priority_key(positions[index], focus),
+            )
+            if chosen != earliest:
+                self._prioritized_picks += 1
+            return chosen
+
+    def prioritizes(self, end_sentence: int) -> bool:
+        """Return whether a region ending at ``end_sentence`` is at or past the playhead."""
+
+        focus = self.focus
+        return focus is not None and int(end_sentence) >= focus
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the playhead and scheduling counters for API responses."""
+
+        with self._lock:
+            focus = self._focus_locked()
+            return {
+                "sentence_number": self._sentence,
+                "region_start": focus,
+                "active": focus is not None,
+                "reports": self._reports,
+                "seeks": self._seeks,
+                "prioritized_picks": self._prioritized_picks,
+                "fairness_picks": self._fairness_picks,
+            }
+
+    def _focus_locked(self) -> Optional[int]:
+        if self._sentence is None:
+            return None
+        if self._stale_after > 0 and self._clock() - self._reported_at > self._stale_after:
+            return None
+        if self._region_resolver is None:
+            return self._sentence
+        try:
+            return min(self._sentence, int(self._region_resolver(self._sentence)))
+        except Exception:
+            return self._sentence
+
+
+def _priority_key(position: int, focus: int) -> tuple[int, int]:
+    # Work at or after the playhead first, nearest first; then the rest in order.
+    if position >= focus:
+        return (0, position - focus)
+    return (1, position)
+
+
+class PlayheadQueue(queue.Queue):
+    """Hand-off queue whose consumers take the item nearest the playhead.
+
+    Items expose ``sentence_number``; ``None`` end-of-stream markers are only
+    returned once no real items remain.
+    """
+
+    def __init__(self, priority: RenderPriority, maxsize: int = 0) -> None:
+        self._priority = priority
+        super().__init__(maxsize=maxsize)
+
+    def _init(self, maxsize: int) -> None:
+        self._items: List[Any] = []
+        self._sentinels = 0
+
+    def _qsize(self) -> int:
+        return len(self._items) + self._sentinels
+
+    def _put(self, item: Any) -> None:
+        if item is None:
+            self._sentinels += 1
+        else:
+            self._items.append(item)
+
+    def _get(self) -> Any:
+        if not self._items:
+            self._sentinels -= 1
+            return None
+        positions = [int(getattr(item, "sentence_number", 0) or 0) for item in self._items]
+        return self._items.pop(self._priority.select(positions))
+
+
+__all__ = [
+    "DEFAULT_FAIRNESS_INTERVAL",
+    "DEFAULT_STALE_AFTER_SECONDS",
+    "PlayheadQueue",
+    "RegionResolver",
+    "RenderPriority",
+]
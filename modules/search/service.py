@@ -884,7 +884,7 @@ def search_generated_media(
             ):
                 try:
                     metadata_payload = metadata_loader.load_chunk(
-                        chunk, include_sentences=False
+                        chunk, include_sentences=False, include_timing=False
                     )
                 except Exception:
                     metadata_payload = None
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import time
 from collections.abc import Mapping, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, wait
 from dataclasses import dataclass
 from typing import Any
 
@@ -10,7 +12,17 @@ import requests
 
 from .provider_catalog import discovery_media_kinds_for
 from .provider_registry import default_discovery_provider_ids
+from .discovery_fanout import (
+    UNCACHED_DISCOVERY_PROVIDERS,
+    DiscoveryResultCache,
+    DiscoveryTimeouts,
+    ProviderDiscoveryUpdate,
+    ProviderUpdateCallback,
+    get_discovery_executor,
+    resolve_discovery_timeouts,
+)
 from .discovery_planning import (
+    LOCAL_FILE_DISCOVERY_PROVIDERS,
     order_default_discovery_candidates,
     provider_query_limit,
 )
@@ -76,8 +88,18 @@ def discover_acquisition_candidates(
     source_ids: Sequence[str] | None = None,
     config: Mapping[str, Any] | None = None,
     session: requests.Session | None = None,
+    cache: DiscoveryResultCache | None = None,
+    on_provider_result: ProviderUpdateCallback | None = None,
 ) -> AcquisitionDiscoveryResult:
-    """Search configured lawful source providers and normalize candidates."""
+    """Search configured lawful source providers and normalize candidates.
+
+    Default-source searches read local providers first and then query the
+    remote providers concurrently, each under its own timeout and all under
+    a global deadline (see :func:`resolve_discovery_timeouts`).  Providers
+    that fail or miss the deadline become policy notes.  Remote results are
+    reused from ``cache`` when one is given, and ``on_provider_result`` is
+    called as each provider finishes.
+    """
 
     config = config or {}
     normalized_kind = _normalize_media_kind(media_kind)
@@ -110,41 +132,96 @@ def discover_acquisition_candidates(
         session=session,
     )
 
-    candidates: list[AcquisitionCandidate] = []
-    queried: list[str] = []
-    policy_notes = list(DEFAULT_DISCOVERY_POLICY_NOTES)
+    if not is_default_provider_fanout:
+        (provider_id,) = providers
+        started_at = time.monotonic()
+        provider_candidates = _cached_provider_candidates(
+            cache, provider_id, discovery_context, effective_limit
+        )
+        status = "cached"
+        if provider_candidates is None:
+            provider_candidates = _query_provider_candidates(
+                provider_id, discovery_context, effective_limit, cache
+            )
+            status = "ok"
+        _notify(
+            on_provider_result,
+            ProviderDiscoveryUpdate(
+                provider=provider_id,
+                status=status,
+                candidates=tuple(provider_candidates),
+                elapsed_seconds=time.monotonic() - started_at,
+            ),
+        )
+        return AcquisitionDiscoveryResult(
+            candidates=tuple(provider_candidates[:effective_limit]),
+            policy_notes=DEFAULT_DISCOVERY_POLICY_NOTES,
+            providers_queried=(provider_id,),
+        )
+
+    results: dict[str, list[AcquisitionCandidate]] = {}
+    failure_notes: dict[str, str] = {}
+    local_candidates: list[AcquisitionCandidate] = []
     for provider_id in providers:
+        if provider_id not in LOCAL_FILE_DISCOVERY_PROVIDERS:
+            continue
+        started_at = time.monotonic()
         try:
-            if not is_default_provider_fanout and len(candidates) >= effective_limit:
-                break
-            remaining = provider_query_limit(
-                provider_id,
-                candidates=candidates,
-                effective_limit=effective_limit,
-                is_default_provider_fanout=is_default_provider_fanout,
-            )
-            if remaining <= 0:
-                continue
-            provider_candidates = _discover_provider_candidates(
-                provider_id,
-                discovery_context,
-                remaining,
+            provider_candidates = _query_provider_candidates(
+                provider_id, discovery_context, effective_limit, None
             )
-            queried.append(provider_id)
-            candidates.extend(provider_candidates)
         except AcquisitionProviderDiscoveryError as exc:
-            if not is_default_provider_fanout:
-                raise
-            if provider_id not in queried:
-                queried.append(provider_id)
-            policy_notes.append(_default_provider_failure_note(exc))
+            failure_notes[provider_id] = _default_provider_failure_note(exc)
+            _notify_failure(on_provider_result, provider_id, "error", failure_notes[provider_id], started_at)
             continue
+        results[provider_id] = provider_candidates
+        local_candidates.extend(provider_candidates)
+        _notify(
+            on_provider_result,
+            ProviderDiscoveryUpdate(
+                provider=provider_id,
+                status="ok",
+                candidates=tuple(provider_candidates),
+                elapsed_seconds=time.monotonic() - started_at,
+            ),
+        )
 
-    ordered_candidates = (
-        order_default_discovery_candidates(candidates, providers)
-        if is_default_provider_fanout
-        else candidates
-    )
+    remote_providers = [
+        provider_id
+        for provider_id in providers
+        if provider_id not in LOCAL_FILE_DISCOVERY_PROVIDERS
+        and provider_query_limit(
+            provider_id,
+            candidates=local_candidates,
+            effective_limit=effective_limit,
+            is_default_provider_fanout=True,
+        )
+        > 0
+    ]
+    if remote_providers:
+        _fan_out_remote_providers(
+            remote_providers,
+            discovery_context,
+            effective_limit - len(local_candidates),
+            cache=cache,
+            timeouts=resolve_discovery_timeouts(config),
+            results=results,
+            failure_notes=failure_notes,
+            on_provider_result=on_provider_result,
+        )
+
+    candidates: list[AcquisitionCandidate] = []
+    queried: list[str] = []
+    policy_notes = list(DEFAULT_DISCOVERY_POLICY_NOTES)
+    for provider_id in providers:
+        if provider_id in results:
+            queried.append(provider_id)
+            candidates.extend(results[provider_id])
+        elif provider_id in failure_notes:
+            queried.append(provider_id)
+            policy_notes.append(failure_notes[provider_id])
+
+    ordered_candidates = order_default_discovery_candidates(candidates, providers)
     return AcquisitionDiscoveryResult(
         candidates=tuple(ordered_candidates[:effective_limit]),
         policy_notes=tuple(policy_notes),
@@ -152,6 +229,146 @@ def discover_acquisition_candidates(
     )
 
 
+def _fan_out_remote_providers(
+    provider_ids: Sequence[str],
+    context: _ProviderDiscoveryContext,
+    limit: int,
+    *,
+    cache: DiscoveryResultCache | None,
+    timeouts: DiscoveryTimeouts,
+    results: dict[str, list[AcquisitionCandidate]],
+    failure_notes: dict[str, str],
+    on_provider_result: ProviderUpdateCallback | None,
+) -> None:
+    """Query remote providers concurrently until they finish or time out."""
+
+    executor = get_discovery_executor()
+    global_deadline = time.monotonic() + timeouts.deadline_seconds
+    pending: dict[Future, tuple[str, float, float]] = {}
+    for provider_id in provider_ids:
+        started_at = time.monotonic()
+        cached = _cached_provider_candidates(cache, provider_id, context, limit)
+        if cached is not None:
+            results[provider_id] = cached
+            _notify(
+                on_provider_result,
+                ProviderDiscoveryUpdate(
+                    provider=provider_id,
+                    status="cached",
+                    candidates=tuple(cached),
+                    elapsed_seconds=time.monotonic() - started_at,
+                ),
+            )
+            continue
+        deadline = min(
+            global_deadline,
+            started_at + timeouts.provider_timeout(provider_id, context.config),
+        )
+        future = executor.submit(_query_provider_candidates, provider_id, context, limit, cache)
+        pending[future] = (provider_id, started_at, deadline)
+
+    while pending:
+        next_deadline = min(deadline for _provider, _started, deadline in pending.values())
+        done, _ = wait(
+            list(pending),
+            timeout=max(0.0, next_deadline - time.monotonic()),
+            return_when=FIRST_COMPLETED,
+        )
+        for future in done:
+            provider_id, started_at, _deadline = pending.pop(future)
+            try:
+                provider_candidates = future.result()
+            except AcquisitionProviderDiscoveryError as exc:
+                failure_notes[provider_id] = _default_provider_failure_note(exc)
+                _notify_failure(on_provider_result, provider_id, "error", failure_notes[provider_id], started_at)
+                continue
+            results[provider_id] = provider_candidates
+            _notify(
+                on_provider_result,
+                ProviderDiscoveryUpdate(
+                    provider=provider_id,
+                    status="ok",
+                    candidates=tuple(provider_candidates),
+                    elapsed_seconds=time.monotonic() - started_at,
+                ),
+            )
+        now = time.monotonic()
+        for future, (provider_id, started_at, deadline) in list(pending.items()):
+            if future.done() or now < deadline:
+                continue
+            # The request keeps running; a late answer still fills the cache.
+            pending.pop(future)
+            future.cancel()
+            failure_notes[provider_id] = _default_provider_failure_note(
+                AcquisitionProviderDiscoveryError(
+                    provider=provider_id,
+                    reason="timeout",
+                    message=f"No response within {now - started_at:.0f}s; showing results from the other sources.",
+                )
+            )
+            _notify_failure(on_provider_result, provider_id, "timeout", failure_notes[provider_id], started_at)
+
+
+def _cached_provider_candidates(
+    cache: DiscoveryResultCache | None,
+    provider_id: str,
+    context: _ProviderDiscoveryContext,
+    limit: int,
+) -> list[AcquisitionCandidate] | None:
+    if cache is None or provider_id in UNCACHED_DISCOVERY_PROVIDERS:
+        return None
+    cached = cache.get(_cache_key(provider_id, context), limit)
+    return None if cached is None else list(cached)
+
+
+def _query_provider_candidates(
+    provider_id: str,
+    context: _ProviderDiscoveryContext,
+    limit: int,
+    cache: DiscoveryResultCache | None,
+) -> list[AcquisitionCandidate]:
+    provider_candidates = _discover_provider_candidates(provider_id, context, limit)
+    if cache is not None and provider_id not in UNCACHED_DISCOVERY_PROVIDERS:
+        cache.put(_cache_key(provider_id, context), provider_candidates, limit)
+    return provider_candidates
+
+
+def _cache_key(provider_id: str, context: _ProviderDiscoveryContext):
+    return DiscoveryResultCache.make_key(
+        provider_id,
+        query=context.query,
+        language=context.language,
+        media_kind=context.media_kind,
+        source_ids=context.source_ids if provider_id == "internet_archive" else (),
+    )
+
+
+def _notify(
+    callback: ProviderUpdateCallback | None,
+    update: ProviderDiscoveryUpdate,
+) -> None:
+    if callback is not None:
+        callback(update)
+
+
+def _notify_failure(
+    callback: ProviderUpdateCallback | None,
+    provider_id: str,
+    status: str,
+    note: str,
+    started_at: float,
+) -> None:
+    _notify(
+        callback,
+        ProviderDiscoveryUpdate(
+            provider=provider_id,
+            status=status,
+            elapsed_seconds=time.monotonic() - started_at,
+            note=note,
+        ),
+    )
+
+
 def _default_provider_failure_note(error: AcquisitionProviderDiscoveryError) -> str:
     return f"{error.provider} unavailable during Default sources: {error.public_message}"
 
@@ -0,0 +1,216 @@
+"""Concurrent provider fan-out support for acquisition discovery.
+
+Default-source discovery queries remote providers in parallel on a shared
+worker pool.  Each provider gets its own timeout and the whole search a
+global deadline; providers that miss it are reported as unavailable while
+their late results still land in the result cache.  The cache keeps remote
+provider results for a short TTL, keyed by provider, normalized query,
+language and media kind, so repeated searches return immediately.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from .discovery_planning import LOCAL_FILE_DISCOVERY_PROVIDERS
+from .models import AcquisitionCandidate
+
+DEFAULT_DISCOVERY_DEADLINE_SECONDS = 12.0
+DEFAULT_PROVIDER_TIMEOUT_SECONDS = 8.0
+DEFAULT_DISCOVERY_CACHE_TTL_SECONDS = 300.0
+DEFAULT_DISCOVERY_CACHE_MAX_ENTRIES = 256
+_DISCOVERY_WORKERS = 8
+
+# Providers that read local files or parse the query need no caching.
+UNCACHED_DISCOVERY_PROVIDERS = frozenset({*LOCAL_FILE_DISCOVERY_PROVIDERS, "youtube_url"})
+
+DiscoveryCacheKey = tuple[str, str, str, str, tuple[str, ...]]
+
+
+@dataclass(frozen=True)
+class ProviderDiscoveryUpdate:
+    """Outcome of one provider, reported as soon as it is known.
+
+    ``status`` is ``ok``, ``cached``, ``error`` or ``timeout``.
+    """
+
+    provider: str
+    status: str
+    candidates: tuple[AcquisitionCandidate, ...] = ()
+    elapsed_seconds: float = 0.0
+    note: str | None = None
+
+
+ProviderUpdateCallback = Callable[[ProviderDiscoveryUpdate], None]
+
+
+@dataclass(frozen=True)
+class DiscoveryTimeouts:
+    """Global deadline and per-provider timeout for one discovery pass."""
+
+    deadline_seconds: float = DEFAULT_DISCOVERY_DEADLINE_SECONDS
+    provider_timeout_seconds: float = DEFAULT_PROVIDER_TIMEOUT_SECONDS
+
+    def provider_timeout(self, provider_id: str, config: Mapping[str, Any]) -> float:
+        """Return the timeout for ``provider_id``, honouring per-provider overrides."""
+
+        overrides = config.get("acquisition_discovery_provider_timeouts")
+        if isinstance(overrides, Mapping):
+            return _positive_float(overrides.get(provider_id), default=self.provider_timeout_seconds)
+        return self.provider_timeout_seconds
+
+
+def resolve_discovery_timeouts(config: Mapping[str, Any]) -> DiscoveryTimeouts:
+    """Read discovery deadlines from runtime ``config``."""
+
+    return DiscoveryTimeouts(
+        deadline_seconds=_positive_float(
+            config.get("acquisition_discovery_deadline_seconds"),
+            default=DEFAULT_DISCOVERY_DEADLINE_SECONDS,
+        ),
+        provider_timeout_seconds=_positive_float(
+            config.get("acquisition_discovery_provider_timeout_seconds"),
+            default=DEFAULT_PROVIDER_TIMEOUT_SECONDS,
+        ),
+    )
+
+
+@dataclass(frozen=True)
+class _CacheEntry:
+    candidates: tuple[AcquisitionCandidate, ...]
+    limit: int
+    stored_at: float
+
+
+class DiscoveryResultCache:
+    """Thread-safe TTL cache of per-provider discovery results."""
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float = DEFAULT_DISCOVERY_CACHE_TTL_SECONDS,
+        max_entries: int = DEFAULT_DISCOVERY_CACHE_MAX_ENTRIES,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._ttl = float(ttl_seconds)
+        self._max_entries = max(1, int(max_entries))
+        self._clock = clock
+        self._entries: OrderedDict[DiscoveryCacheKey, _CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(
+        provider_id: str,
+        *,
+        query: str,
+        language: str | None,
+        media_kind: str,
+        source_ids: Sequence[str] = (),
+    ) -> DiscoveryCacheKey:
+        return (
+            provider_id,
+            " ".join(query.casefold().split()),
+            (language or "").casefold(),
+            media_kind,
+            tuple(source_ids),
+        )
+
+    def get(self, key: DiscoveryCacheKey, limit: int) -> tuple[AcquisitionCandidate, ...] | None:
+        """Return up to ``limit`` cached candidates, or ``None`` when they may be incomplete."""
+
+        if self._ttl <= 0:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if self._clock() - entry.stored_at > self._ttl:
+                del self._entries[key]
+                return None
+            # A shorter earlier request only answers this one if it was exhaustive.
+            if entry.limit < limit and len(entry.candidates) >= entry.limit:
+                return None
+            self._entries.move_to_end(key)
+            return entry.candidates[:limit]
+
+    def put(
+        self,
+        key: DiscoveryCacheKey,
+        candidates: Sequence[AcquisitionCandidate],
+        limit: int,
+    ) -> None:
+        """Store the candidates a provider returned for ``limit`` slots."""
+
+        if self._ttl <= 0:
+            return
+        with self._lock:
+            existing = self._entries.get(key)
+            if existing is not None and existing.limit > limit and self._clock() - existing.stored_at <= self._ttl:
+                return
+            self._entries[key] = _CacheEntry(tuple(candidates), int(limit), self._clock())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached result."""
+
+        with self._lock:
+            self._entries.clear()
+
+
+def _positive_float(value: Any, *, default: float) -> float:
+    try:
+        parsed = float(value)
+    except (TypeError, ValueError):
+        return default
+    return parsed if parsed > 0 else default
+
+
+_shared_cache: DiscoveryResultCache | None = None
+_shared_executor: ThreadPoolExecutor | None = None
+_shared_lock = threading.Lock()
+
+
+def get_discovery_result_cache() -> DiscoveryResultCache:
+    """Return the process-wide discovery result cache."""
+
+    global _shared_cache
+    with _shared_lock:
+        if _shared_cache is None:
+            _shared_cache = DiscoveryResultCache()
+        return _shared_cache
+
+
+def get_discovery_executor() -> ThreadPoolExecutor:
+    """Return the worker pool remote discovery providers run on."""
+
+    global _shared_executor
+    with _shared_lock:
+        if _shared_executor is None:
+            _shared_executor = ThreadPoolExecutor(
+                max_workers=_DISCOVERY_WORKERS,
+                thread_name_prefix="AcquisitionDiscovery",
+            )
+        return _shared_executor
+
+
+__all__ = [
+    "DEFAULT_DISCOVERY_CACHE_TTL_SECONDS",
+    "DEFAULT_DISCOVERY_DEADLINE_SECONDS",
+    "DEFAULT_PROVIDER_TIMEOUT_SECONDS",
+    "DiscoveryResultCache",
+    "DiscoveryTimeouts",
+    "ProviderDiscoveryUpdate",
+    "ProviderUpdateCallback",
+    "UNCACHED_DISCOVERY_PROVIDERS",
+    "get_discovery_executor",
+    "get_discovery_result_cache",
+    "resolve_discovery_timeouts",
+]
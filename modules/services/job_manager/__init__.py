@@ -8,10 +8,19 @@ from .backpressure import (
     BackpressureState,
     QueueFullError,
 )
+from .admission import (
+    AdmissionBudget,
+    AdmissionDecision,
+    AdmissionScheduler,
+    ResourceEstimate,
+    estimate_job_resources,
+)
+from .distributed_worker import DistributedJobWorker
 from .dynamic_executor import DynamicThreadPoolExecutor
 from .job import PipelineJob, PipelineJobStatus, PipelineJobTransitionError
 from .execution_adapter import PipelineExecutionAdapter
 from .executor import PipelineJobExecutor, PipelineJobExecutorHooks
+from .job_queue import JobLease, JobQueue, RedisJobQueue, SqliteJobQueue, build_job_queue
 from .job_storage import JobStorageCoordinator
 from .job_tuner import PipelineJobTuner, WorkerPoolCache
 from .locking import JobLockManager, CompatibilityLockManager
@@ -19,7 +28,7 @@ from .manager import PipelineJobManager
 from .metadata import PipelineJobMetadata
 from .metadata_refresher import PipelineJobMetadataRefresher
 from .persistence import PipelineJobPersistence
-from .stores import FileJobStore, InMemoryJobStore, JobStore, RedisJobStore
+from .stores import FencedJobStore, FileJobStore, InMemoryJobStore, JobStore, RedisJobStore
 
 __all__ = [
     "PipelineJobManager",
@@ -36,6 +45,11 @@ __all__ = [
     "BackpressurePolicy",
     "BackpressureState",
     "QueueFullError",
+    "AdmissionBudget",
+    "AdmissionDecision",
+    "AdmissionScheduler",
+    "ResourceEstimate",
+    "estimate_job_resources",
     "PipelineExecutionAdapter",
     "PipelineJob",
     "PipelineJobStatus",
@@ -47,5 +61,12 @@ __all__ = [
     "InMemoryJobStore",
     "FileJobStore",
     "RedisJobStore",
+    "FencedJobStore",
+    "JobLease",
+    "JobQueue",
+    "SqliteJobQueue",
+    "RedisJobQueue",
+    "build_job_queue",
+    "DistributedJobWorker",
     "FileLocator",
 ]
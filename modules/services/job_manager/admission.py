@@ -0,0 +1,743 @@
+"""Resource-aware admission control for locally executed jobs.
+
+Backpressure only looks at queue depth, so two long dual-track books and a
+dubbing job can start together and push the host into swap while small
+subtitle jobs wait behind them.  The :class:`AdmissionScheduler` estimates
+the footprint of every job from its request, reserves it against memory,
+CPU, LLM and image-node budgets and keeps jobs that do not fit waiting until
+running jobs release their reservations.
+"""
+
+from __future__ import annotations
+
+import itertools
+import os
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+from ... import logging_manager as log_mgr
+
+try:  # pragma: no cover - optional dependency safety
+    import psutil
+except Exception:  # pragma: no cover - environment fallback
+    psutil = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:  # pragma: no cover - imports for type checking only
+    from .job import PipelineJob
+
+logger = log_mgr.logger
+
+MEMORY_BUDGET_ENV_VAR = "EBOOK_ADMISSION_MEMORY_MB"
+CPU_BUDGET_ENV_VAR = "EBOOK_ADMISSION_CPU_CORES"
+LLM_BUDGET_ENV_VAR = "EBOOK_ADMISSION_LLM_SLOTS"
+IMAGE_BUDGET_ENV_VAR = "EBOOK_ADMISSION_IMAGE_SLOTS"
+STARVATION_ENV_VAR = "EBOOK_ADMISSION_STARVATION_SECONDS"
+
+# Share of physical memory jobs may reserve when no budget is configured.
+_DEFAULT_MEMORY_FRACTION = 0.75
+_DEFAULT_STARVATION_SECONDS = 300.0
+_DEFAULT_AGING_SECONDS = 60.0
+# Sentence count assumed when a request does not bound its range.
+_DEFAULT_SENTENCE_COUNT = 2000
+# Video duration assumed when a dubbing request has no time window.
+_DEFAULT_VIDEO_SECONDS = 1800.0
+_SAMPLE_INTERVAL_SECONDS = 1.0
+
+ADMITTED = "admitted"
+QUEUED = "queued"
+
+_NON_LLM_PROVIDERS = {"googletrans", "google", "none", "off", ""}
+
+
+@dataclass(frozen=True)
+class ResourceEstimate:
+    """Estimated footprint of a single job."""
+
+    memory_mb: float
+    cpu_cores: float
+    llm_slots: int = 0
+    image_slots: int = 0
+    basis: Mapping[str, Any] = field(default_factory=dict)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "memory_mb": round(self.memory_mb, 1),
+            "cpu_cores": round(self.cpu_cores, 2),
+            "llm_slots": self.llm_slots,
+            "image_slots": self.image_slots,
+            "basis": dict(self.basis),
+        }
+
+
+@dataclass(frozen=True)
+class AdmissionBudget:
+    """Resource limits admitted jobs must fit into; ``None`` means unlimited."""
+
+    memory_mb: Optional[float] = None
+    cpu_cores: Optional[float] = None
+    llm_slots: Optional[int] = None
+    image_slots: Optional[int] = None
+    starvation_seconds: float = _DEFAULT_STARVATION_SECONDS
+    aging_seconds: float = _DEFAULT_AGING_SECONDS
+
+    @classmethod
+    def from_environment(cls) -> "AdmissionBudget":
+        """Build a budget from environment overrides and host capacity."""
+
+        memory_mb = _env_float(MEMORY_BUDGET_ENV_VAR)
+        if memory_mb is None:
+            total_mb = _host_memory_mb()
+            memory_mb = total_mb * _DEFAULT_MEMORY_FRACTION if total_mb else None
+        cpu_cores = _env_float(CPU_BUDGET_ENV_VAR)
+        if cpu_cores is None:
+            cpu_cores = float(max(1, os.cpu_count() or 1))
+        llm_slots = _env_float(LLM_BUDGET_ENV_VAR)
+        image_slots = _env_float(IMAGE_BUDGET_ENV_VAR)
+        starvation = _env_float(STARVATION_ENV_VAR)
+        return cls(
+            memory_mb=memory_mb if memory_mb and memory_mb > 0 else None,
+            cpu_cores=cpu_cores if cpu_cores and cpu_cores > 0 else None,
+            llm_slots=int(llm_slots) if llm_slots and llm_slots > 0 else None,
+            image_slots=int(image_slots) if image_slots and image_slots > 0 else None,
+            starvation_seconds=(
+                starvation if starvation is not None and starvation >= 0 else _DEFAULT_STARVATION_SECONDS
+            ),
+        )
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "memory_mb": self.memory_mb,
+            "cpu_cores": self.cpu_cores,
+            "llm_slots": self.llm_slots,
+            "image_slots": self.image_slots,
+        }
+
+
+@dataclass(frozen=True)
+class AdmissionDecision:
+    """Outcome of an admission check, surfaced in the job's tuning summary."""
+
+    job_id: str
+    decision: str
+    reason: str
+    estimate: ResourceEstimate
+    priority: int = 0
+    position: Optional[int] = None
+    waited_seconds: float = 0.0
+    decided_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+    @property
+    def admitted(self) -> bool:
+        return self.decision == ADMITTED
+
+    def as_dict(self) -> Dict[str, Any]:
+        payload: Dict[str, Any] = {
+            "decision": self.decision,
+            "reason": self.reason,
+            "priority": self.priority,
+            "estimate": self.estimate.as_dict(),
+            "decided_at": self.decided_at.isoformat(),
+        }
+        if self.position is not None:
+            payload["queue_position"] = self.position
+        if self.waited_seconds:
+            payload["waited_seconds"] = round(self.waited_seconds, 3)
+        return payload
+
+
+def _env_float(name: str) -> Optional[float]:
+    raw = os.environ.get(name)
+    if raw is None or not raw.strip():
+        return None
+    try:
+        return float(raw)
+    except ValueError:
+        logger.warning("Ignoring invalid %s value %r", name, raw)
+        return None
+
+
+def _host_memory_mb() -> float:
+    if psutil is None:  # pragma: no cover - optional dependency
+        return 0.0
+    try:
+        return float(psutil.virtual_memory().total) / (1024**2)
+    except Exception:  # pragma: no cover - defensive fallback
+        return 0.0
+
+
+def _coerce_int(value: Any) -> Optional[int]:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _coerce_float(value: Any) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _request_inputs(job: "PipelineJob") -> Mapping[str, Any]:
+    request = job.request
+    inputs = getattr(request, "inputs", None) if request is not None else None
+    if inputs is not None:
+        media_metadata = getattr(inputs, "media_metadata", None)
+        values = {
+            name: getattr(inputs, name, None)
+            for name in (
+                "start_sentence",
+                "end_sentence",
+                "target_languages",
+                "generate_audio",
+                "add_images",
+                "stitch_full",
+                "include_transliteration",
+                "translation_provider",
+            )
+        }
+        if media_metadata is not None and hasattr(media_metadata, "as_dict"):
+            values["media_metadata"] = media_metadata.as_dict()
+        return values
+    payload = job.request_payload or {}
+    nested = payload.get("inputs")
+    return nested if isinstance(nested, Mapping) else payload
+
+
+def _sentence_count(inputs: Mapping[str, Any]) -> Tuple[int, str]:
+    start = _coerce_int(inputs.get("start_sentence")) or 1
+    end = _coerce_int(inputs.get("end_sentence"))
+    if end is not None and end >= start:
+        return end - start + 1, "range"
+    metadata = inputs.get("media_metadata")
+    if isinstance(metadata, Mapping):
+        for key in ("total_sentences", "book_sentence_count"):
+            total = _coerce_int(metadata.get(key))
+            if total and total > 0:
+                return max(1, total - start + 1), "metadata"
+    return _DEFAULT_SENTENCE_COUNT, "default"
+
+
+def _uses_llm(provider: Any) -> bool:
+    if provider is None:
+        return True
+    return str(provider).strip().lower() not in _NON_LLM_PROVIDERS
+
+
+def _estimate_pipeline(inputs: Mapping[str, Any]) -> ResourceEstimate:
+    sentences, source = _sentence_count(inputs)
+    languages = inputs.get("target_languages") or []
+    tracks = max(1, len(languages) if isinstance(languages, (list, tuple)) else 1)
+    audio = bool(inputs.get("generate_audio"))
+    images = bool(inputs.get("add_images"))
+    stitch = bool(inputs.get("stitch_full"))
+
+    # Sentence text, lookup caches and per-track chunk metadata stay resident
+    # for the whole job; synthesized audio is buffered per chunk and again
+    # when the full book is stitched.
+    memory = 256.0 + 0.05 * sentences * tracks
+    cpu = 0.5
+    if audio:
+        memory += 192.0 + 0.02 * sentences * tracks
+        cpu += 0.5
+        if stitch:
+            memory += 0.1 * sentences * tracks
+    if images:
+        memory += 256.0
+        cpu += 0.25
+    return ResourceEstimate(
+        memory_mb=memory,
+        cpu_cores=cpu,
+        llm_slots=1 if _uses_llm(inputs.get("translation_provider")) else 0,
+        image_slots=1 if images else 0,
+        basis={
+            "sentences": sentences,
+            "sentence_source": source,
+            "tracks": tracks,
+            "audio": audio,
+            "images": images,
+        },
+    )
+
+
+def _estimate_dub(payload: Mapping[str, Any]) -> ResourceEstimate:
+    start = _coerce_float(payload.get("start_time_offset")) or 0.0
+    end = _coerce_float(payload.get("end_time_offset"))
+    if end is not None and end > start:
+        duration, source = end - start, "window"
+    else:
+        duration, source = _DEFAULT_VIDEO_SECONDS, "default"
+    height = _coerce_int(payload.get("target_height")) or 480
+    # ffmpeg decodes, muxes and re-encodes the video while TTS runs alongside.
+    memory = 384.0 + duration / 60.0 * 4.0 * (height / 480.0)
+    return ResourceEstimate(
+        memory_mb=memory,
+        cpu_cores=1.5,
+        llm_slots=1 if _uses_llm(payload.get("translation_provider")) else 0,
+        basis={"video_seconds": round(duration, 1), "duration_source": source, "height": height},
+    )
+
+
+def _estimate_subtitle(payload: Mapping[str, Any]) -> ResourceEstimate:
+    options = payload.get("options")
+    options = options if isinstance(options, Mapping) else {}
+    audio = bool(options.get("generate_audio_book"))
+    return ResourceEstimate(
+        memory_mb=128.0 + (192.0 if audio else 0.0),
+        cpu_cores=0.25 + (0.5 if audio else 0.0),
+        llm_slots=1 if _uses_llm(options.get("translation_provider")) else 0,
+        basis={"audio": audio},
+    )
+
+
+def estimate_job_resources(job: "PipelineJob") -> ResourceEstimate:
+    """Estimate the memory, CPU and backend slots ``job`` will hold while running."""
+
+    job_type = job.job_type
+    if job_type in {"pipeline", "book"}:
+        return _estimate_pipeline(_request_inputs(job))
+    payload = job.request_payload or {}
+    if job_type == "youtube_dub":
+        return _estimate_dub(payload)
+    if job_type == "subtitle":
+        return _estimate_subtitle(payload)
+    return ResourceEstimate(memory_mb=128.0, cpu_cores=0.25, basis={"job_type": job_type})
+
+
+def resolve_job_priority(job: "PipelineJob") -> int:
+    """Return the admission priority requested for ``job`` (higher runs first)."""
+
+    request = job.request
+    candidates = []
+    if request is not None:
+        candidates.append(getattr(request, "pipeline_overrides", {}).get("job_priority"))
+        candidates.append(getattr(request, "config", {}).get("job_priority"))
+    payload = job.request_payload or {}
+    candidates.append(payload.get("job_priority"))
+    for candidate in candidates:
+        value = _coerce_int(candidate)
+        if value is not None:
+            return value
+    return 0
+
+
+class ProcessUsageSampler:
+    """Measure memory and CPU this process spends on top of its idle baseline.
+
+    Jobs run as threads of the API process, so their usage is measured at
+    process level and attributed to the running set as a whole.
+    """
+
+    def __init__(self) -> None:
+        self._process = None
+        if psutil is not None:
+            try:
+                self._process = psutil.Process()
+                self._process.cpu_percent(None)
+            except Exception:  # pragma: no cover - platform specific
+                self._process = None
+        self._baseline_mb = self._rss_mb()
+
+    def _rss_mb(self) -> float:
+        if self._process is None:
+            return 0.0
+        try:
+            return float(self._process.memory_info().rss) / (1024**2)
+        except Exception:  # pragma: no cover - platform specific
+            return 0.0
+
+    def reset_baseline(self) -> None:
+        """Record current usage as the idle baseline (no admitted jobs running)."""
+
+        self._baseline_mb = self._rss_mb()
+        if self._process is not None:
+            try:
+                self._process.cpu_percent(None)
+            except Exception:  # pragma: no cover - platform specific
+                pass
+
+    def sample(self) -> Tuple[float, float]:
+        """Return ``(memory_mb, cpu_cores)`` used above the idle baseline."""
+
+        if self._process is None:
+            return 0.0, 0.0
+        memory = max(0.0, self._rss_mb() - self._baseline_mb)
+        try:
+            cpu = float(self._process.cpu_percent(None)) / 100.0
+        except Exception:  # pragma: no cover - platform specific
+            cpu = 0.0
+        return memory, cpu
+
+
+@dataclass
+class _Waiter:
+    job_id: str
+    estimate: ResourceEstimate
+    user_id: Optional[str]
+    priority: int
+    sequence: int
+    enqueued_at: float
+    reason: str = ""
+
+
+@dataclass
+class _Reservation:
+    job_id: str
+    estimate: ResourceEstimate
+    user_id: Optional[str]
+    admitted_at: float
+    # Dispatches still holding the reservation; each one releases it once.
+    holders: int = 1
+
+
+_metrics_bridge: Optional[Dict[str, object]] = None
+
+
+def _get_metrics_bridge() -> Dict[str, object]:
+    """Return the Prometheus collectors once the web metrics module is loaded."""
+
+    global _metrics_bridge
+    if _metrics_bridge is not None:
+        return _metrics_bridge
+    metrics = sys.modules.get("modules.webapi.metrics")
+    if metrics is None:
+        return {}
+    _metrics_bridge = {
+        key: getattr(metrics, name)
+        for key, name in (
+            ("decisions", "JOB_ADMISSION_DECISIONS"),
+            ("wait", "JOB_ADMISSION_WAIT"),
+            ("reserved", "JOB_ADMISSION_RESERVED"),
+            ("waiting", "JOB_ADMISSION_WAITING"),
+        )
+        if hasattr(metrics, name)
+    }
+    return _metrics_bridge
+
+
+class AdmissionScheduler:
+    """Admit jobs against resource budgets, queueing the ones that do not fit.
+
+    Waiting jobs are ranked by priority (raised by one step for every
+    ``aging_seconds`` spent waiting), then by how many jobs their owner
+    already has running, then by arrival.  Smaller jobs may backfill around a
+    blocked head until it has waited ``starvation_seconds``; from then on
+    capacity is held for it.  A job larger than the whole budget is admitted
+    once nothing else is running so it cannot wait forever.
+    """
+
+    def __init__(
+        self,
+        budget: Optional[AdmissionBudget] = None,
+        *,
+        usage_sampler: Optional[ProcessUsageSampler] = None,
+        activity_getter: Optional[Callable[[], Mapping[str, Any]]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._budget = budget or AdmissionBudget.from_environment()
+        self._sampler = usage_sampler if usage_sampler is not None else ProcessUsageSampler()
+        self._activity_getter = activity_getter
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._sequence = itertools.count()
+        self._waiting: Dict[str, _Waiter] = {}
+        self._running: Dict[str, _Reservation] = {}
+        self._measured: Tuple[float, float] = (0.0, 0.0)
+        self._measured_at = float("-inf")
+
+    @property
+    def budget(self) -> AdmissionBudget:
+        return self._budget
+
+    def submit(
+        self,
+        job_id: str,
+        estimate: ResourceEstimate,
+        *,
+        user_id: Optional[str] = None,
+        priority: int = 0,
+    ) -> Tuple[AdmissionDecision, List[AdmissionDecision]]:
+        """Register ``job_id`` and admit whatever now fits.
+
+        Returns the decision for ``job_id`` together with every job admitted
+        by this call, which may include jobs that were already waiting.
+        """
+
+        with self._lock:
+            if job_id in self._running:
+                # Resumed before its previous run unwound: the new dispatch
+                # shares the reservation until both runs have released it.
+                reservation = self._running[job_id]
+                reservation.holders += 1
+                decision = AdmissionDecision(
+                    job_id, ADMITTED, "already_running", reservation.estimate, priority
+                )
+                return decision, [decision]
+            if job_id not in self._waiting:
+                self._waiting[job_id] = _Waiter(
+                    job_id=job_id,
+                    estimate=estimate,
+                    user_id=user_id,
+                    priority=int(priority),
+                    sequence=next(self._sequence),
+                    enqueued_at=self._clock(),
+                )
+            admitted = self._drain_locked()
+            decision = next((item for item in admitted if item.job_id == job_id), None)
+            if decision is None:
+                decision = self._queued_decision_locked(job_id)
+                self._record_decision(decision)
+            self._publish_gauges_locked()
+        return decision, admitted
+
+    def release(self, job_id: str) -> List[AdmissionDecision]:
+        """Release one dispatch of ``job_id`` and admit waiting jobs that now fit.
+
+        The reservation is returned once every dispatch admitted for the job
+        has released it.
+        """
+
+        with self._lock:
+            reservation = self._running.get(job_id)
+            if reservation is None:
+                return []
+            reservation.holders -= 1
+            if reservation.holders > 0:
+                return []
+            del self._running[job_id]
+            if not self._running:
+                self._sampler.reset_baseline()
+                self._measured = (0.0, 0.0)
+            admitted = self._drain_locked()
+            self._publish_gauges_locked()
+        return admitted
+
+    def discard(self, job_id: str) -> List[AdmissionDecision]:
+        """Forget a waiting job (cancelled, paused or deleted) and re-run admission."""
+
+        with self._lock:
+            if self._waiting.pop(job_id, None) is None:
+                return []
+            admitted = self._drain_locked()
+            self._publish_gauges_locked()
+        return admitted
+
+    def queued_decisions(self) -> List[AdmissionDecision]:
+        """Return the current decision for every waiting job, in admission order."""
+
+        with self._lock:
+            return [self._queued_decision_locked(waiter.job_id) for waiter in self._ranked_locked()]
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return budgets, reservations, measured usage and the waiting queue."""
+
+        with self._lock:
+            memory, cpu = self._reserved_locked()
+            llm, image = self._slots_locked()
+            measured_memory, measured_cpu = self._measured
+            snapshot: Dict[str, Any] = {
+                "budget": self._budget.as_dict(),
+                "reserved": {
+                    "memory_mb": round(memory, 1),
+                    "cpu_cores": round(cpu, 2),
+                    "llm_slots": llm,
+                    "image_slots": image,
+                },
+                "measured": {
+                    "memory_mb": round(measured_memory, 1),
+                    "cpu_cores": round(measured_cpu, 2),
+                },
+                "running": sorted(self._running),
+                "waiting": [waiter.job_id for waiter in self._ranked_locked()],
+            }
+        if self._activity_getter is not None:
+            try:
+                snapshot["activity"] = dict(self._activity_getter())
+            except Exception:  # pragma: no cover - defensive logging
+                logger.debug("Unable to collect executor activity", exc_info=True)
+        return snapshot
+
+    # ------------------------------------------------------------------
+    # Internal helpers (callers hold ``self._lock``)
+    # ------------------------------------------------------------------
+    def _reserved_locked(self) -> Tuple[float, float]:
+        memory = sum(item.estimate.memory_mb for item in self._running.values())
+        cpu = sum(item.estimate.cpu_cores for item in self._running.values())
+        return memory, cpu
+
+    def _slots_locked(self) -> Tuple[int, int]:
+        llm = sum(item.estimate.llm_slots for item in self._running.values())
+        image = sum(item.estimate.image_slots for item in self._running.values())
+        return llm, image
+
+    def _usage_locked(self) -> Tuple[float, float]:
+        """Return memory/CPU in use: reservations, or live usage when higher."""
+
+        reserved_memory, reserved_cpu = self._reserved_locked()
+        if not self._running:
+            return reserved_memory, reserved_cpu
+        now = self._clock()
+        if now - self._measured_at >= _SAMPLE_INTERVAL_SECONDS:
+            try:
+                self._measured = self._sampler.sample()
+            except Exception:  # pragma: no cover - defensive logging
+                logger.debug("Unable to sample process usage", exc_info=True)
+            self._measured_at = now
+        measured_memory, measured_cpu = self._measured
+        return max(reserved_memory, measured_memory), max(reserved_cpu, measured_cpu)
+
+    def _user_load_locked(self, user_id: Optional[str]) -> int:
+        return sum(1 for item in self._running.values() if item.user_id == user_id)
+
+    def _ranked_locked(self) -> List[_Waiter]:
+        now = self._clock()
+        aging = self._budget.aging_seconds
+
+        def _rank(waiter: _Waiter) -> Tuple[int, int, int]:
+            boost = int((now - waiter.enqueued_at) // aging) if aging > 0 else 0
+            return (-(waiter.priority + boost), self._user_load_locked(waiter.user_id), waiter.sequence)
+
+        return sorted(self._waiting.values(), key=_rank)
+
+    def _blocking_resource_locked(self, estimate: ResourceEstimate) -> Optional[str]:
+        budget = self._budget
+        memory, cpu = self._usage_locked()
+        llm, image = self._slots_locked()
+        if budget.memory_mb is not None and memory + estimate.memory_mb > budget.memory_mb:
+            return "memory"
+        if budget.cpu_cores is not None and cpu + estimate.cpu_cores > budget.cpu_cores:
+            return "cpu"
+        if budget.llm_slots is not None and estimate.llm_slots and llm + estimate.llm_slots > budget.llm_slots:
+            return "llm_slots"
+        if (
+            budget.image_slots is not None
+            and estimate.image_slots
+            and image + estimate.image_slots > budget.image_slots
+        ):
+            return "image_slots"
+        return None
+
+    def _drain_locked(self) -> List[AdmissionDecision]:
+        admitted: List[AdmissionDecision] = []
+        skipped: set[str] = set()
+        head_blocked = False
+        while True:
+            # Re-rank after every admission so per-user load stays current.
+            waiter = next(
+                (item for item in self._ranked_locked() if item.job_id not in skipped),
+                None,
+            )
+            if waiter is None:
+                break
+            blocking = self._blocking_resource_locked(waiter.estimate)
+            if blocking is None:
+                admitted.append(self._admit_locked(waiter, "backfill" if head_blocked else "fits"))
+                continue
+            if not self._running and not head_blocked:
+                # Larger than the whole budget: run it alone rather than never.
+                admitted.append(self._admit_locked(waiter, "exceeds_budget_idle"))
+                continue
+            waiter.reason = blocking
+            skipped.add(waiter.job_id)
+            if not head_blocked:
+                head_blocked = True
+                if self._clock() - waiter.enqueued_at >= self._budget.starvation_seconds:
+                    # Hold capacity for the starving head instead of backfilling.
+                    break
+        return admitted
+
+    def _admit_locked(self, waiter: _Waiter, reason: str) -> AdmissionDecision:
+        now = self._clock()
+        self._waiting.pop(waiter.job_id, None)
+        self._running[waiter.job_id] = _Reservation(
+            job_id=waiter.job_id,
+            estimate=waiter.estimate,
+            user_id=waiter.user_id,
+            admitted_at=now,
+        )
+        decision = AdmissionDecision(
+            job_id=waiter.job_id,
+            decision=ADMITTED,
+            reason=reason,
+            estimate=waiter.estimate,
+            priority=waiter.priority,
+            waited_seconds=max(0.0, now - waiter.enqueued_at),
+        )
+        self._record_decision(decision)
+        return decision
+
+    def _queued_decision_locked(self, job_id: str) -> AdmissionDecision:
+        ranked = self._ranked_locked()
+        position = next(index for index, waiter in enumerate(ranked, start=1) if waiter.job_id == job_id)
+        waiter = self._waiting[job_id]
+        return AdmissionDecision(
+            job_id=job_id,
+            decision=QUEUED,
+            reason=waiter.reason or "priority",
+            estimate=waiter.estimate,
+            priority=waiter.priority,
+            position=position,
+            waited_seconds=max(0.0, self._clock() - waiter.enqueued_at),
+        )
+
+    def _record_decision(self, decision: AdmissionDecision) -> None:
+        logger.debug(
+            "Job %s %s by admission control (%s)",
+            decision.job_id,
+            decision.decision,
+            decision.reason,
+            extra={
+                "event": "pipeline.job.admission",
+                "job_id": decision.job_id,
+                "attributes": decision.as_dict(),
+                "console_suppress": True,
+            },
+        )
+        bridge = _get_metrics_bridge()
+        try:
+            counter = bridge.get("decisions")
+            if counter is not None:
+                counter.labels(decision=decision.decision, reason=decision.reason).inc()
+            histogram = bridge.get("wait")
+            if histogram is not None and decision.admitted:
+                histogram.observe(decision.waited_seconds)
+        except Exception:
+            pass
+
+    def _publish_gauges_locked(self) -> None:
+        bridge = _get_metrics_bridge()
+        if not bridge:
+            return
+        memory, cpu = self._reserved_locked()
+        llm, image = self._slots_locked()
+        try:
+            reserved = bridge.get("reserved")
+            if reserved is not None:
+                for resource, value in (
+                    ("memory_mb", memory),
+                    ("cpu_cores", cpu),
+                    ("llm_slots", llm),
+                    ("image_slots", image),
+                ):
+                    reserved.labels(resource=resource).set(value)
+            waiting = bridge.get("waiting")
+            if waiting is not None:
+                waiting.set(len(self._waiting))
+        except Exception:
+            pass
+
+
+__all__ = [
+    "AdmissionBudget",
+    "AdmissionDecision",
+    "AdmissionScheduler",
+    "ProcessUsageSampler",
+    "ResourceEstimate",
+    "estimate_job_resources",
+    "resolve_job_priority",
+]
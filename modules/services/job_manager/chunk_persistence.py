@@ -9,6 +9,7 @@ from pathlib import Path
 from typing import Any, Dict, Mapping, Optional
 
 from ... import logging_manager
+from ...chunk_index import refresh_chunk_index
 from ..file_locator import FileLocator
 
 _LOGGER = logging_manager.get_logger().getChild("job_manager.chunk_persistence")
@@ -94,23 +95,38 @@ def cleanup_unused_chunk_files(metadata_root: Path, preserved: set[str]) -> None
             )
 
 
+def _refresh_chunk_index(job_id: str, metadata_root: Path, written: set[str]) -> None:
+    """Update the chunk summary index, re-reading only ``written`` and new files."""
+
+    try:
+        refresh_chunk_index(metadata_root, refresh=written)
+    except Exception:  # pragma: no cover - defensive logging
+        _LOGGER.debug("Unable to refresh chunk index for job %s", job_id, exc_info=True)
+
+
 def write_chunk_metadata(
     job_id: str,
     metadata_root: Path,
     generated: Mapping[str, Any],
     file_locator: FileLocator,
 ) -> Dict[str, Any]:
-    """Write chunk metadata files and return updated payload."""
+    """Write chunk metadata files and return updated payload.
+
+    ``metadata/chunks_index.json`` is refreshed afterwards so readers can
+    answer summary queries without opening the chunk files.
+    """
 
     chunks_raw = generated.get("chunks")
     payload = dict(generated)
     if not isinstance(chunks_raw, list):
         payload["chunks"] = []
         cleanup_unused_chunk_files(metadata_root, set())
+        _refresh_chunk_index(job_id, metadata_root, set())
         return payload
 
     updated_chunks: list[Dict[str, Any]] = []
     preserved_files: set[str] = set()
+    written_files: set[str] = set()
 
     for index, chunk in enumerate(chunks_raw):
         if not isinstance(chunk, Mapping):
@@ -196,6 +212,7 @@ def write_chunk_metadata(
                     metadata_url_str = url_candidate
                 sentence_count = len(sentences)
                 preserved_files.add(destination.name)
+                written_files.add(destination.name)
                 wrote_chunk_file = True
         elif isinstance(metadata_path_str, str):
             preserved_files.add(Path(metadata_path_str).name)
@@ -223,6 +240,7 @@ def write_chunk_metadata(
         updated_chunks.append(chunk_entry)
 
     cleanup_unused_chunk_files(metadata_root, preserved_files)
+    _refresh_chunk_index(job_id, metadata_root, written_files)
 
     payload["chunks"] = updated_chunks
     return payload
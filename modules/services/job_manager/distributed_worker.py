@@ -0,0 +1,218 @@
+"""Queue worker that claims and executes pipeline jobs on any node."""
+
+from __future__ import annotations
+
+import os
+import socket
+import threading
+import time
+import uuid
+from typing import TYPE_CHECKING, Optional
+
+from ... import logging_manager as log_mgr
+from .job import PipelineJobStatus
+from .job_queue import DEFAULT_LEASE_SECONDS, JobLease, JobQueue
+
+if TYPE_CHECKING:  # pragma: no cover - imports for type checking only
+    from .manager import PipelineJobManager
+
+logger = log_mgr.logger
+
+# Workers act on behalf of the system rather than a requesting user.
+_WORKER_ROLE = "admin"
+_ACTIVE_STATES = (PipelineJobStatus.PENDING, PipelineJobStatus.RUNNING)
+
+
+def default_worker_id() -> str:
+    """Return an identifier unique to this host and process."""
+
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+
+
+class _LeaseHeartbeat:
+    """Background thread renewing a lease and relaying stop requests."""
+
+    def __init__(
+        self,
+        worker: "DistributedJobWorker",
+        lease: JobLease,
+    ) -> None:
+        self._worker = worker
+        self._lease = lease
+        self._done = threading.Event()
+        self._lost = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run,
+            name=f"lease-heartbeat-{lease.job_id}",
+            daemon=True,
+        )
+
+    @property
+    def lost(self) -> bool:
+        return self._lost.is_set()
+
+    def __enter__(self) -> "_LeaseHeartbeat":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *_exc_info) -> None:
+        self._done.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        worker = self._worker
+        queue = worker.queue
+        job_id = self._lease.job_id
+        renew_interval = worker.lease_seconds / 3.0
+        next_renewal = time.monotonic() + renew_interval
+        last_renewed = time.monotonic()
+        stop_forwarded = False
+        while not self._done.wait(worker.stop_poll_interval):
+            try:
+                if not stop_forwarded:
+                    requested = queue.stop_request(job_id)
+                    if requested:
+                        stop_forwarded = True
+                        worker.manager.apply_stop_request(job_id, PipelineJobStatus(requested))
+                now = time.monotonic()
+                if now < next_renewal:
+                    continue
+                renewed = queue.renew(self._lease, lease_seconds=worker.lease_seconds)
+            except Exception:
+                logger.warning("Lease heartbeat failed for job %s", job_id, exc_info=True)
+                if time.monotonic() - last_renewed < worker.lease_seconds:
+                    continue
+                renewed = None
+            if renewed is None:
+                self._lost.set()
+                logger.warning(
+                    "Lost lease for job %s; abandoning local execution",
+                    job_id,
+                    extra={"event": "pipeline.job.lease.lost", "job_id": job_id},
+                )
+                worker.manager.abandon_claimed_job(job_id)
+                return
+            self._lease = renewed
+            last_renewed = time.monotonic()
+            next_renewal = last_renewed + renew_interval
+
+
+class DistributedJobWorker:
+    """Claim pipeline jobs from ``queue`` and execute them through ``manager``.
+
+    The lease is renewed every third of ``lease_seconds`` while the job runs.
+    Pause and cancel requests issued on other nodes are polled every
+    ``stop_poll_interval`` seconds.  Jobs that have been claimed more than
+    ``max_attempts`` times, typically because their workers keep dying, are
+    marked as failed instead of being retried forever.
+    """
+
+    def __init__(
+        self,
+        manager: "PipelineJobManager",
+        queue: JobQueue,
+        *,
+        worker_id: Optional[str] = None,
+        lease_seconds: float = DEFAULT_LEASE_SECONDS,
+        poll_interval: float = 1.0,
+        stop_poll_interval: float = 1.0,
+        max_attempts: int = 3,
+    ) -> None:
+        if lease_seconds <= 0:
+            raise ValueError("lease_seconds must be positive")
+        self.manager = manager
+        self.queue = queue
+        self.worker_id = worker_id or default_worker_id()
+        self.lease_seconds = float(lease_seconds)
+        self.poll_interval = max(0.01, float(poll_interval))
+        self.stop_poll_interval = max(0.01, min(float(stop_poll_interval), self.lease_seconds / 3.0))
+        self.max_attempts = max(1, int(max_attempts))
+
+    def run_once(self) -> Optional[str]:
+        """Claim and execute a single job; return its id or ``None`` if idle."""
+
+        lease = self.queue.claim(self.worker_id, lease_seconds=self.lease_seconds)
+        if lease is None:
+            return None
+        with log_mgr.log_context(job_id=lease.job_id):
+            logger.info(
+                "Claimed job %s (attempt %s%s)",
+                lease.job_id,
+                lease.attempts,
+                ", reclaimed" if lease.reclaimed else "",
+                extra={
+                    "event": "pipeline.job.lease.claimed",
+                    "attributes": {
+                        "worker_id": self.worker_id,
+                        "attempts": lease.attempts,
+                        "reclaimed": lease.reclaimed,
+                    },
+                    "console_suppress": True,
+                },
+            )
+            if lease.attempts > self.max_attempts:
+                self._fail_exhausted(lease)
+            else:
+                self._execute(lease)
+        return lease.job_id
+
+    def run_forever(self, stop_event: threading.Event) -> None:
+        """Process jobs until ``stop_event`` is set; the running job finishes first."""
+
+        while not stop_event.is_set():
+            try:
+                job_id = self.run_once()
+            except Exception:
+                logger.exception("Job worker %s failed to process a job", self.worker_id)
+                job_id = None
+            if job_id is None:
+                stop_event.wait(self.poll_interval)
+
+    def _execute(self, lease: JobLease) -> None:
+        job = None
+        with _LeaseHeartbeat(self, lease) as heartbeat:
+            try:
+                job = self.manager.execute_claimed_job(lease.job_id)
+            except Exception:
+                if not heartbeat.lost:
+                    self.queue.release(lease)
+                raise
+        if heartbeat.lost:
+            return
+        self.queue.complete(lease)
+        if job is not None:
+            self._requeue_if_resumed(lease.job_id)
+
+    def _requeue_if_resumed(self, job_id: str) -> None:
+        # A resume issued while this worker was unwinding a pause could not
+        # enqueue the still-leased job, so hand it back to the queue here.
+        try:
+            job = self.manager.get(job_id, user_role=_WORKER_ROLE)
+        except KeyError:
+            return
+        if job.status == PipelineJobStatus.PENDING:
+            self.queue.enqueue(job_id)
+
+    def _fail_exhausted(self, lease: JobLease) -> None:
+        try:
+            job = self.manager.get(lease.job_id, user_role=_WORKER_ROLE)
+        except KeyError:
+            job = None
+        if job is not None and job.status in _ACTIVE_STATES:
+            logger.warning(
+                "Job %s exceeded %s execution attempts",
+                lease.job_id,
+                self.max_attempts,
+                extra={"event": "pipeline.job.lease.exhausted", "job_id": lease.job_id},
+            )
+            self.manager.finish_job(
+                lease.job_id,
+                status=PipelineJobStatus.FAILED,
+                error_message=(
+                    f"Job abandoned after {lease.attempts - 1} interrupted execution attempts"
+                ),
+            )
+        self.queue.complete(lease)
+
+
+__all__ = ["DistributedJobWorker", "default_worker_id"]
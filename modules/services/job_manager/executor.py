@@ -7,7 +7,7 @@ import logging
 from contextlib import AbstractContextManager, nullcontext
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Callable, Mapping, Optional
+from typing import Any, Callable, Mapping, Optional
 
 from ..pipeline_service import PipelineResponse, serialize_pipeline_response
 from ...translation_engine import ThreadWorkerPool
@@ -34,6 +34,7 @@ class PipelineJobExecutorHooks:
     record_metric: Optional[
         Callable[[str, float, Mapping[str, str]], None]
     ] = None
+    trace_recorder_factory: Optional[Callable[[PipelineJob], Any]] = None
 
 
 class PipelineJobExecutor:
@@ -77,6 +78,7 @@ class PipelineJobExecutor:
         self._store.update(snapshot)
 
         self._dispatch_hook("on_start", job)
+        trace_recorder = self._attach_trace_recorder(job)
 
         response: Optional[PipelineResponse] = None
         status_after_error: Optional[PipelineJobStatus] = None
@@ -183,6 +185,8 @@ class PipelineJobExecutor:
                     job.tracker.mark_finished(reason="failed", forced=True)
                 elif status == PipelineJobStatus.CANCELLED:
                     job.tracker.mark_finished(reason="cancelled", forced=True)
+            if trace_recorder is not None:
+                self._close_trace_recorder(job, trace_recorder)
             if status in {
                 PipelineJobStatus.COMPLETED,
                 PipelineJobStatus.FAILED,
@@ -214,6 +218,33 @@ class PipelineJobExecutor:
             return nullcontext()
         return factory(job)
 
+    def _attach_trace_recorder(self, job: PipelineJob) -> Optional[Any]:
+        factory = self._hooks.trace_recorder_factory
+        tracker = job.tracker
+        if factory is None or tracker is None:
+            return None
+        try:
+            recorder = factory(job)
+        except Exception:  # pragma: no cover - defensive logging
+            self._logger.debug(
+                "Unable to create pipeline trace recorder", exc_info=True
+            )
+            return None
+        if recorder is not None:
+            tracker.attach_trace_recorder(recorder)
+        return recorder
+
+    def _close_trace_recorder(self, job: PipelineJob, recorder: Any) -> None:
+        tracker = job.tracker
+        if tracker is not None and tracker.trace_recorder is recorder:
+            tracker.attach_trace_recorder(None)
+        try:
+            recorder.close()
+        except Exception:  # pragma: no cover - defensive logging
+            self._logger.debug(
+                "Unable to close pipeline trace recorder", exc_info=True
+            )
+
     def _record_metric(
         self, name: str, value: float, attributes: Mapping[str, str]
     ) -> None:
@@ -0,0 +1,512 @@
+"""Durable work queues used to distribute pipeline jobs across worker nodes.
+
+Submitting hosts enqueue job identifiers while the job metadata itself stays
+in the shared :class:`~modules.services.job_manager.stores.JobStore`.  Worker
+processes claim queued jobs under a time-limited lease that they renew with a
+heartbeat; a lease that is not renewed in time expires and the job becomes
+claimable again, which is how work fails over when a worker dies.  Every
+mutation of a claimed job is guarded by the lease token so that a worker that
+lost its lease can no longer complete or release the job.
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Protocol, Union
+
+try:  # pragma: no cover - optional dependency
+    import redis  # type: ignore
+except Exception:  # pragma: no cover - defensive import guard
+    redis = None
+
+from ... import logging_manager as log_mgr
+
+logger = log_mgr.logger
+
+JOB_QUEUE_URL_ENV_VAR = "JOB_QUEUE_URL"
+DEFAULT_LEASE_SECONDS = 30.0
+
+
+@dataclass(frozen=True)
+class JobLease:
+    """Claim on a queued job held by a single worker until ``expires_at``."""
+
+    job_id: str
+    worker_id: str
+    token: str
+    expires_at: float
+    attempts: int = 1
+    reclaimed: bool = False
+
+
+class JobQueue(Protocol):
+    """Durable queue of job identifiers with lease-based claiming."""
+
+    def enqueue(self, job_id: str, *, priority: int = 0) -> None:
+        """Queue ``job_id`` unless it is already queued or leased.
+
+        Re-enqueueing a job that is still waiting clears its stop request, so
+        a job paused before any worker claimed it can be resumed.
+        """
+        ...
+
+    def claim(
+        self, worker_id: str, *, lease_seconds: float = DEFAULT_LEASE_SECONDS
+    ) -> Optional[JobLease]:
+        """Lease the next runnable job, including jobs whose lease expired."""
+        ...
+
+    def renew(
+        self, lease: JobLease, *, lease_seconds: float = DEFAULT_LEASE_SECONDS
+    ) -> Optional[JobLease]:
+        """Extend ``lease``; return ``None`` when it is no longer held."""
+        ...
+
+    def complete(self, lease: JobLease) -> bool:
+        """Remove the leased job from the queue."""
+        ...
+
+    def release(self, lease: JobLease) -> bool:
+        """Return the leased job to the queue for another worker."""
+        ...
+
+    def request_stop(self, job_id: str, status: str) -> None:
+        """Ask the worker executing ``job_id`` to stop with ``status``."""
+        ...
+
+    def stop_request(self, job_id: str) -> Optional[str]:
+        """Return the pending stop request for ``job_id`` if any."""
+        ...
+
+    def remove(self, job_id: str) -> None:
+        """Drop ``job_id`` from the queue regardless of its lease."""
+        ...
+
+    def depth(self) -> int:
+        """Return the number of queued and leased jobs."""
+        ...
+
+    def close(self) -> None:
+        ...
+
+
+def _new_token() -> str:
+    return uuid.uuid4().hex
+
+
+class SqliteJobQueue(JobQueue):
+    """Embedded queue backed by a SQLite database in WAL mode.
+
+    Suitable for several worker processes on one host (or on hosts sharing a
+    local filesystem with working POSIX locks).  Claims run inside ``BEGIN
+    IMMEDIATE`` transactions, which serialise concurrent claimers.
+    """
+
+    def __init__(self, path: Union[str, Path], *, timeout: float = 30.0) -> None:
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._timeout = timeout
+        self._local = threading.local()
+        connection = self._connection()
+        connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS job_queue (
+                job_id TEXT PRIMARY KEY,
+                priority INTEGER NOT NULL DEFAULT 0,
+                enqueued_at REAL NOT NULL,
+                worker_id TEXT,
+                lease_token TEXT,
+                lease_expires_at REAL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                stop_request TEXT
+            );
+            CREATE INDEX IF NOT EXISTS job_queue_claim_idx
+                ON job_queue (lease_expires_at, priority, enqueued_at);
+            """
+        )
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def _connection(self) -> sqlite3.Connection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(
+                str(self._path),
+                timeout=self._timeout,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    def enqueue(self, job_id: str, *, priority: int = 0) -> None:
+        self._connection().execute(
+            """
+            INSERT INTO job_queue (job_id, priority, enqueued_at) VALUES (?, ?, ?)
+            ON CONFLICT (job_id) DO UPDATE SET stop_request = NULL
+            WHERE lease_token IS NULL
+            """,
+            (job_id, int(priority), time.time()),
+        )
+
+    def claim(
+        self, worker_id: str, *, lease_seconds: float = DEFAULT_LEASE_SECONDS
+    ) -> Optional[JobLease]:
+        connection = self._connection()
+        now = time.time()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            row = connection.execute(
+                """
+                SELECT job_id, attempts, lease_token FROM job_queue
+                WHERE lease_token IS NULL OR lease_expires_at < ?
+                ORDER BY priority DESC, enqueued_at ASC
+                LIMIT 1
+                """,
+                (now,),
+            ).fetchone()
+            if row is None:
+                connection.execute("COMMIT")
+                return None
+            job_id, attempts, previous_token = row
+            token = _new_token()
+            expires_at = now + lease_seconds
+            connection.execute(
+                """
+                UPDATE job_queue
+                SET worker_id = ?, lease_token = ?, lease_expires_at = ?, attempts = ?
+                WHERE job_id = ?
+                """,
+                (worker_id, token, expires_at, attempts + 1, job_id),
+            )
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        return JobLease(
+            job_id=job_id,
+            worker_id=worker_id,
+            token=token,
+            expires_at=expires_at,
+            attempts=attempts + 1,
+            reclaimed=previous_token is not None,
+        )
+
+    def renew(
+        self, lease: JobLease, *, lease_seconds: float = DEFAULT_LEASE_SECONDS
+    ) -> Optional[JobLease]:
+        expires_at = time.time() + lease_seconds
+        cursor = self._connection().execute(
+            "UPDATE job_queue SET lease_expires_at = ? WHERE job_id = ? AND lease_token = ?",
+            (expires_at, lease.job_id, lease.token),
+        )
+        if cursor.rowcount != 1:
+            return None
+        return JobLease(
+            job_id=lease.job_id,
+            worker_id=lease.worker_id,
+            token=lease.token,
+            expires_at=expires_at,
+            attempts=lease.attempts,
+            reclaimed=lease.reclaimed,
+        )
+
+    def complete(self, lease: JobLease) -> bool:
+        cursor = self._connection().execute(
+            "DELETE FROM job_queue WHERE job_id = ? AND lease_token = ?",
+            (lease.job_id, lease.token),
+        )
+        return cursor.rowcount == 1
+
+    def release(self, lease: JobLease) -> bool:
+        cursor = self._connection().execute(
+            """
+            UPDATE job_queue
+            SET worker_id = NULL, lease_token = NULL, lease_expires_at = NULL,
+                stop_request = NULL
+            WHERE job_id = ? AND lease_token = ?
+            """,
+            (lease.job_id, lease.token),
+        )
+        return cursor.rowcount == 1
+
+    def request_stop(self, job_id: str, status: str) -> None:
+        self._connection().execute(
+            "UPDATE job_queue SET stop_request = ? WHERE job_id = ?",
+            (status, job_id),
+        )
+
+    def stop_request(self, job_id: str) -> Optional[str]:
+        row = self._connection().execute(
+            "SELECT stop_request FROM job_queue WHERE job_id = ?", (job_id,)
+        ).fetchone()
+        return row[0] if row is not None else None
+
+    def remove(self, job_id: str) -> None:
+        self._connection().execute("DELETE FROM job_queue WHERE job_id = ?", (job_id,))
+
+    def depth(self) -> int:
+        row = self._connection().execute("SELECT COUNT(*) FROM job_queue").fetchone()
+        return int(row[0]) if row else 0
+
+    def close(self) -> None:
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+
+# Scripts run atomically on the Redis server and read its clock so that lease
+# expiry does not depend on worker clocks being in sync.
+_REDIS_NOW = "local t = redis.call('TIME') local now = tonumber(t[1]) + tonumber(t[2]) / 1000000 "
+
+_REDIS_ENQUEUE = """
+if redis.call('ZSCORE', KEYS[2], ARGV[1]) then
+    return 0
+end
+if redis.call('ZSCORE', KEYS[1], ARGV[1]) then
+    redis.call('HDEL', KEYS[4], ARGV[1])
+    return 0
+end
+""" + _REDIS_NOW + """
+redis.call('ZADD', KEYS[1], now - tonumber(ARGV[2]) * 1000000000, ARGV[1])
+redis.call('HDEL', KEYS[3], ARGV[1])
+redis.call('HDEL', KEYS[4], ARGV[1])
+return 1
+"""
+
+_REDIS_CLAIM = _REDIS_NOW + """
+local job = nil
+local reclaimed = 0
+local expired = redis.call('ZRANGEBYSCORE', KEYS[2], '-inf', now, 'LIMIT', 0, 1)
+if #expired > 0 then
+    job = expired[1]
+    reclaimed = 1
+else
+    local popped = redis.call('ZPOPMIN', KEYS[1])
+    if #popped == 0 then
+        return false
+    end
+    job = popped[1]
+end
+local expires_at = now + tonumber(ARGV[2])
+local attempts = redis.call('HINCRBY', KEYS[3], job, 1)
+redis.call('ZADD', KEYS[2], expires_at, job)
+redis.call('HSET', KEYS[4], job, ARGV[1])
+return {job, attempts, reclaimed, tostring(expires_at)}
+"""
+
+_REDIS_RENEW = """
+if redis.call('HGET', KEYS[2], ARGV[1]) ~= ARGV[2] then
+    return false
+end
+""" + _REDIS_NOW + """
+local expires_at = now + tonumber(ARGV[3])
+redis.call('ZADD', KEYS[1], expires_at, ARGV[1])
+return tostring(expires_at)
+"""
+
+_REDIS_COMPLETE = """
+if redis.call('HGET', KEYS[2], ARGV[1]) ~= ARGV[2] then
+    return 0
+end
+redis.call('ZREM', KEYS[1], ARGV[1])
+redis.call('HDEL', KEYS[2], ARGV[1])
+redis.call('HDEL', KEYS[3], ARGV[1])
+redis.call('HDEL', KEYS[4], ARGV[1])
+return 1
+"""
+
+_REDIS_RELEASE = """
+if redis.call('HGET', KEYS[2], ARGV[1]) ~= ARGV[2] then
+    return 0
+end
+""" + _REDIS_NOW + """
+redis.call('ZREM', KEYS[1], ARGV[1])
+redis.call('HDEL', KEYS[2], ARGV[1])
+redis.call('HDEL', KEYS[4], ARGV[1])
+redis.call('ZADD', KEYS[3], now, ARGV[1])
+return 1
+"""
+
+
+class RedisJobQueue(JobQueue):
+    """Queue stored in Redis (or any server speaking the Redis protocol).
+
+    Layout under ``namespace``: ``pending`` (sorted set ordered by priority
+    and enqueue time), ``leases`` (sorted set scored by lease expiry),
+    ``owners`` (hash of lease tokens), ``attempts`` (hash of claim counts)
+    and ``stops`` (hash of pending stop requests).
+    """
+
+    def __init__(self, url: str, *, namespace: str = "ebook-tools:queue") -> None:
+        if redis is None:  # pragma: no cover - optional dependency
+            raise RuntimeError("redis-py is not available; cannot use RedisJobQueue")
+        self._client = redis.Redis.from_url(url, decode_responses=True)
+        self._namespace = namespace
+        self._enqueue_script = self._client.register_script(_REDIS_ENQUEUE)
+        self._claim_script = self._client.register_script(_REDIS_CLAIM)
+        self._renew_script = self._client.register_script(_REDIS_RENEW)
+        self._complete_script = self._client.register_script(_REDIS_COMPLETE)
+        self._release_script = self._client.register_script(_REDIS_RELEASE)
+
+    def _key(self, name: str) -> str:
+        return f"{self._namespace}:{name}"
+
+    def enqueue(self, job_id: str, *, priority: int = 0) -> None:
+        self._enqueue_script(
+            keys=[
+                self._key("pending"),
+                self._key("leases"),
+                self._key("attempts"),
+                self._key("stops"),
+            ],
+            args=[job_id, int(priority)],
+        )
+
+    def claim(
+        self, worker_id: str, *, lease_seconds: float = DEFAULT_LEASE_SECONDS
+    ) -> Optional[JobLease]:
+        token = _new_token()
+        result = self._claim_script(
+            keys=[
+                self._key("pending"),
+                self._key("leases"),
+                self._key("attempts"),
+                self._key("owners"),
+            ],
+            args=[token, lease_seconds],
+        )
+        if not result:
+            return None
+        job_id, attempts, reclaimed, expires_at = result
+        return JobLease(
+            job_id=job_id,
+            worker_id=worker_id,
+            token=token,
+            expires_at=float(expires_at),
+            attempts=int(attempts),
+            reclaimed=bool(int(reclaimed)),
+        )
+
+    def renew(
+        self, lease: JobLease, *, lease_seconds: float = DEFAULT_LEASE_SECONDS
+    ) -> Optional[JobLease]:
+        result = self._renew_script(
+            keys=[self._key("leases"), self._key("owners")],
+            args=[lease.job_id, lease.token, lease_seconds],
+        )
+        if not result:
+            return None
+        return JobLease(
+            job_id=lease.job_id,
+            worker_id=lease.worker_id,
+            token=lease.token,
+            expires_at=float(result),
+            attempts=lease.attempts,
+            reclaimed=lease.reclaimed,
+        )
+
+    def complete(self, lease: JobLease) -> bool:
+        result = self._complete_script(
+            keys=[
+                self._key("leases"),
+                self._key("owners"),
+                self._key("attempts"),
+                self._key("stops"),
+            ],
+            args=[lease.job_id, lease.token],
+        )
+        return bool(result)
+
+    def release(self, lease: JobLease) -> bool:
+        result = self._release_script(
+            keys=[
+                self._key("leases"),
+                self._key("owners"),
+                self._key("pending"),
+                self._key("stops"),
+            ],
+            args=[lease.job_id, lease.token],
+        )
+        return bool(result)
+
+    def request_stop(self, job_id: str, status: str) -> None:
+        self._client.hset(self._key("stops"), job_id, status)
+
+    def stop_request(self, job_id: str) -> Optional[str]:
+        return self._client.hget(self._key("stops"), job_id)
+
+    def remove(self, job_id: str) -> None:
+        pipeline = self._client.pipeline()
+        pipeline.zrem(self._key("pending"), job_id)
+        pipeline.zrem(self._key("leases"), job_id)
+        for name in ("owners", "attempts", "stops"):
+            pipeline.hdel(self._key(name), job_id)
+        pipeline.execute()
+
+    def depth(self) -> int:
+        return int(self._client.zcard(self._key("pending"))) + int(
+            self._client.zcard(self._key("leases"))
+        )
+
+    def close(self) -> None:
+        try:
+            self._client.close()
+        except Exception:  # pragma: no cover - defensive cleanup
+            pass
+
+
+def build_job_queue(url: str) -> JobQueue:
+    """Return the queue backend addressed by ``url``.
+
+    ``redis://``, ``rediss://`` and ``unix://`` URLs select
+    :class:`RedisJobQueue`; ``sqlite:///relative.db``,
+    ``sqlite:////absolute.db`` or a bare filesystem path selects
+    :class:`SqliteJobQueue`.
+    """
+
+    candidate = url.strip()
+    lowered = candidate.lower()
+    if lowered.startswith(("redis://", "rediss://", "unix://")):
+        return RedisJobQueue(candidate)
+    if lowered.startswith("sqlite:///"):
+        candidate = candidate[len("sqlite:///"):]
+    if not candidate:
+        raise ValueError(f"Unsupported job queue URL: {url!r}")
+    return SqliteJobQueue(candidate)
+
+
+def resolve_job_queue() -> Optional[JobQueue]:
+    """Return the queue configured via ``JOB_QUEUE_URL`` or ``None``."""
+
+    url = os.environ.get(JOB_QUEUE_URL_ENV_VAR, "").strip()
+    if not url:
+        return None
+    try:
+        return build_job_queue(url)
+    except Exception as exc:  # pragma: no cover - defensive logging
+        logger.warning("Failed to initialize job queue at %s: %s", url, exc)
+        return None
+
+
+__all__ = [
+    "DEFAULT_LEASE_SECONDS",
+    "JOB_QUEUE_URL_ENV_VAR",
+    "JobLease",
+    "JobQueue",
+    "RedisJobQueue",
+    "SqliteJobQueue",
+    "build_job_queue",
+    "resolve_job_queue",
+]
@@ -5,6 +5,7 @@ from __future__ import annotations
 import copy
 from typing import Any, Dict, Mapping, Optional
 
+from ...core.rendering.checkpoints import compute_block_start
 from ..pipeline_service import serialize_pipeline_request
 from ..pipeline_types import PipelineMetadata
 from .job import PipelineJob, PipelineJobStatus
@@ -72,13 +73,6 @@ def _resolve_block_size(job: PipelineJob, inputs: Mapping[str, Any]) -> int:
     return 1
 
 
-def _compute_block_start(sentence_number: int, block_size: int) -> int:
-    if sentence_number <= 0:
-        return 1
-    size = max(1, block_size)
-    return ((sentence_number - 1) // size) * size + 1
-
-
 def compute_resume_context(job: PipelineJob) -> Optional[Dict[str, Any]]:
     """Return a payload describing how to resume ``job`` from the last block."""
 
@@ -95,7 +89,7 @@ def compute_resume_context(job: PipelineJob) -> Optional[Dict[str, Any]]:
         start_sentence = 1
 
     if last_sentence is not None:
-        block_start = _compute_block_start(last_sentence, block_size)
+        block_start = compute_block_start(last_sentence, block_size)
         inputs["start_sentence"] = block_start
         inputs["resume_block_start"] = block_start
         inputs["resume_last_sentence"] = last_sentence
@@ -14,22 +14,31 @@ from typing import Any, Awaitable, Callable, Dict, Mapping, Optional, Tuple
 
 from ... import config_manager as cfg
 from ... import logging_manager as log_mgr
+from ...pipeline_trace import JobTraceRecorder
 from ...progress_tracker import ProgressEvent, ProgressTracker
 from ...translation_engine import ThreadWorkerPool
 from ..file_locator import FileLocator
 from ..pipeline_service import PipelineRequest, serialize_pipeline_request
 from ..source_discovery import safe_stat
 from ...permissions import can_access, default_job_access, is_admin_role, resolve_access_policy
+from .admission import (
+    AdmissionBudget,
+    AdmissionDecision,
+    AdmissionScheduler,
+    estimate_job_resources,
+    resolve_job_priority,
+)
 from .dynamic_executor import DynamicThreadPoolExecutor
 from .job import PipelineJob, PipelineJobStatus
-from .lifecycle import compute_resume_context
+from .lifecycle import apply_resume_context, compute_resume_context
 from .locking import JobLockManager
 from .metadata import PipelineJobMetadata
 from .metadata_refresher import PipelineJobMetadataRefresher
 from .persistence import PipelineJobPersistence
 from .job_storage import JobStorageCoordinator
 from .job_tuner import PipelineJobTuner
-from .stores import JobStore
+from .job_queue import JobQueue, resolve_job_queue
+from .stores import FencedJobStore, JobStore
 from .execution_adapter import PipelineExecutionAdapter
 from .executor import PipelineJobExecutor, PipelineJobExecutorHooks
 from .request_factory import PipelineRequestFactory
@@ -62,6 +71,9 @@ from .job_submission import apply_backpressure, create_pipeline_job, create_back
 
 logger = log_mgr.logger
 
+# Job types executed by distributed queue workers when a job queue is configured.
+_QUEUED_JOB_TYPES = frozenset({"pipeline", "book"})
+
 
 def _path_exists(path: Path) -> bool:
     return safe_stat(path) is not None
@@ -84,6 +96,9 @@ class PipelineJobManager:
         file_locator: Optional[FileLocator] = None,
         backpressure_policy: Optional[BackpressurePolicy] = None,
         enable_backpressure: bool = True,
+        job_queue: Optional[JobQueue] = None,
+        enable_admission: bool = True,
+        admission_budget: Optional[AdmissionBudget] = None,
     ) -> None:
         # Fine-grained locking: per-job locks reduce contention
         self._job_locks = JobLockManager()
@@ -98,6 +113,9 @@ class PipelineJobManager:
         ] = None
         # Event deduplication: track last stored event signature per job
         self._last_event_sig: Dict[str, tuple] = {}
+        # Distributed mode: pipeline jobs are claimed from the queue by workers
+        self._job_queue = job_queue if job_queue is not None else resolve_job_queue()
+        self._claimed_jobs: set[str] = set()
         settings = cfg.get_settings()
         configured_workers = max_workers if max_workers is not None else settings.job_max_workers
         if max_workers is None:
@@ -132,6 +150,8 @@ class PipelineJobManager:
 
         # Initialize backpressure controller
         def _get_queue_depth() -> int:
+            if self._job_queue is not None:
+                return self._job_queue.depth()
             if hasattr(self._executor, "queue_depth"):
                 return self._executor.queue_depth
             # For ThreadPoolExecutor, estimate from pending jobs
@@ -163,13 +183,31 @@ class PipelineJobManager:
         else:
             self._backpressure = None
 
+        if storage_coordinator is None and self._job_queue is not None:
+            # Other nodes write the same records, so reads must not be cached
+            # and writes must not be deferred.
+            storage_coordinator = JobStorageCoordinator(
+                store=store, enable_batching=False, enable_caching=False
+            )
         self._storage = storage_coordinator or JobStorageCoordinator(store=store)
         self._store = self._storage.store
+        if self._job_queue is not None:
+            self._store = FencedJobStore(self._store)
         executor_slots_getter = lambda: getattr(self._executor, "_max_workers", None)
         self._tuner = tuner or PipelineJobTuner(
             worker_pool_factory=worker_pool_factory,
             executor_slots_getter=executor_slots_getter,
         )
+        if enable_admission:
+            self._admission: Optional[AdmissionScheduler] = AdmissionScheduler(
+                admission_budget,
+                activity_getter=lambda: {
+                    "executor_active": _get_active_count(),
+                    **self._tuner.pool_cache_stats,
+                },
+            )
+        else:
+            self._admission = None
         self._execution = execution_adapter or PipelineExecutionAdapter()
         self._file_locator = file_locator or FileLocator()
         self._persistence = PipelineJobPersistence(self._file_locator)
@@ -199,6 +237,7 @@ class PipelineJobManager:
             on_interrupted=self._log_job_interrupted,
             pipeline_context_factory=self._pipeline_operation_context,
             record_metric=self._record_job_metric,
+            trace_recorder_factory=self._create_trace_recorder,
         )
         self._job_executor = PipelineJobExecutor(
             job_getter=self._get_unchecked,
@@ -218,9 +257,16 @@ class PipelineJobManager:
 
         updates: list[PipelineJobMetadata] = []
         pending_jobs: list[str] = []
+        queued_jobs: list[str] = []
         with self._lock:
             for job_id, metadata in stored_jobs.items():
                 job = self._persistence.build_job(metadata)
+                if self._job_queue is not None and job.job_type in _QUEUED_JOB_TYPES:
+                    # Running jobs belong to queue workers; expired leases are
+                    # reclaimed by the queue instead of pausing them here.
+                    if job.status == PipelineJobStatus.PENDING:
+                        queued_jobs.append(job_id)
+                    continue
                 if job.status == PipelineJobStatus.RUNNING:
                     job.status = PipelineJobStatus.PAUSED
                     updates.append(self._persistence.snapshot(job))
@@ -239,7 +285,167 @@ class PipelineJobManager:
 
         self._storage.persist_reconciliation(updates)
         for job_id in pending_jobs:
-            self._executor.submit(self._dispatch_execution, job_id)
+            self._start_local(self._jobs[job_id])
+        for job_id in queued_jobs:
+            self._job_queue.enqueue(job_id)
+
+    @property
+    def job_queue(self) -> Optional[JobQueue]:
+        """Return the distributed job queue, or None when jobs run locally."""
+        return self._job_queue
+
+    def _schedule(self, job: PipelineJob) -> bool:
+        """Run ``job`` on the local executor or hand it to the job queue.
+
+        Returns True when the job was queued for a distributed worker.
+        """
+
+        if self._job_queue is None or job.job_type not in _QUEUED_JOB_TYPES:
+            self._start_local(job)
+            return False
+        self._forget_remote_job(job.job_id)
+        self._job_queue.enqueue(job.job_id)
+        return True
+
+    def _start_local(self, job: PipelineJob) -> None:
+        """Run ``job`` on the executor once admission control lets it start."""
+
+        if self._admission is None:
+            self._executor.submit(self._dispatch_execution, job.job_id)
+            return
+        decision, admitted = self._admission.submit(
+            job.job_id,
+            estimate_job_resources(job),
+            user_id=job.user_id,
+            priority=resolve_job_priority(job),
+        )
+        if not decision.admitted:
+            self._record_admission(decision)
+        self._launch_admitted(admitted)
+
+    def _launch_admitted(self, decisions: list[AdmissionDecision]) -> None:
+        for decision in decisions:
+            self._record_admission(decision)
+            self._executor.submit(self._dispatch_execution, decision.job_id)
+
+    def _record_admission(self, decision: AdmissionDecision) -> None:
+        """Expose ``decision`` in the job's tuning summary and persist it."""
+
+        with self._lock:
+            job = self._jobs.get(decision.job_id)
+            if job is None:
+                return
+            summary = dict(job.tuning_summary or {})
+            summary["admission"] = decision.as_dict()
+            job.tuning_summary = summary
+            snapshot = self._persistence.snapshot(job)
+        self._store.update(snapshot)
+
+    def _withdraw_admission(self, job_id: str) -> None:
+        """Drop ``job_id`` from the admission queue and start jobs that now fit."""
+
+        if self._admission is not None:
+            self._launch_admitted(self._admission.discard(job_id))
+
+    def admission_snapshot(self) -> Optional[Dict[str, Any]]:
+        """Return admission budgets, reservations and waiting jobs, if enabled."""
+
+        if self._admission is None:
+            return None
+        return self._admission.snapshot()
+
+    def _forget_remote_job(self, job_id: str) -> None:
+        """Drop local state for a job that executes on a queue worker."""
+
+        if self._job_queue is None:
+            return
+        with self._lock:
+            if job_id in self._claimed_jobs or job_id in self._custom_workers:
+                return
+            job = self._jobs.get(job_id)
+            if job is None or job.job_type not in _QUEUED_JOB_TYPES:
+                return
+            self._jobs.pop(job_id, None)
+            self._job_handlers.pop(job_id, None)
+        self._last_event_sig.pop(job_id, None)
+
+    def execute_claimed_job(self, job_id: str) -> Optional[PipelineJob]:
+        """Execute ``job_id`` after this process claimed it from the job queue.
+
+        The request is rebuilt from the persisted payload, so any node sharing
+        the job store and storage root can run it.  Jobs that were cancelled
+        or paused while queued are returned without executing.  A job found
+        in the running state was abandoned by a failed worker and resumes from
+        its last recorded resume context.
+        """
+
+        try:
+            metadata = self._store.get(job_id)
+        except KeyError:
+            return None
+        job = self._persistence.build_job(metadata)
+        if job.status not in (PipelineJobStatus.PENDING, PipelineJobStatus.RUNNING):
+            return job
+
+        payload = job.resume_context or job.request_payload
+        if payload is None:
+            raise ValueError(f"Job {job_id} is missing request payload and cannot be executed")
+        if job.status == PipelineJobStatus.RUNNING:
+            payload = apply_resume_context(job, payload)
+            job.status = PipelineJobStatus.PENDING
+
+        stop_event = threading.Event()
+        with self._lock:
+            self._claimed_jobs.add(job_id)
+            job.request = self._request_factory.hydrate_request(job, payload, stop_event=stop_event)
+            job.stop_event = stop_event
+            self._jobs[job_id] = job
+            self._register_job_handler(job_id, job)
+        try:
+            self._job_executor.execute(job_id)
+        finally:
+            with self._lock:
+                self._claimed_jobs.discard(job_id)
+                self._jobs.pop(job_id, None)
+                self._job_handlers.pop(job_id, None)
+            self._last_event_sig.pop(job_id, None)
+            if isinstance(self._store, FencedJobStore):
+                self._store.unfence(job_id)
+        return job
+
+    def apply_stop_request(self, job_id: str, status: PipelineJobStatus) -> None:
+        """Apply a pause/cancel requested on another node to a claimed job."""
+
+        with self._lock:
+            job = self._jobs.get(job_id) if job_id in self._claimed_jobs else None
+            if job is None or job.status != PipelineJobStatus.RUNNING:
+                return
+        try:
+            if status == PipelineJobStatus.CANCELLED:
+                self._transitions.cancel_job(job_id, enforce_authorization=False)
+            else:
+                self._transitions.pause_job(job_id, enforce_authorization=False)
+        except ValueError:
+            logger.debug("Ignoring %s request for job %s", status.value, job_id, exc_info=True)
+
+    def abandon_claimed_job(self, job_id: str) -> None:
+        """Stop a claimed job whose lease was lost without persisting its state.
+
+        Another worker may already own the job, so writes from this execution
+        are fenced off until it unwinds.
+        """
+
+        if isinstance(self._store, FencedJobStore):
+            self._store.fence(job_id)
+        with self._lock:
+            job = self._jobs.get(job_id) if job_id in self._claimed_jobs else None
+            if job is None:
+                return
+            if job.status == PipelineJobStatus.RUNNING:
+                # Unwind as an interruption rather than a completion.
+                job.status = PipelineJobStatus.PAUSING
+        if job.stop_event is not None:
+            job.stop_event.set()
 
     def submit(
         self,
@@ -284,9 +490,9 @@ class PipelineJobManager:
                 },
             )
 
-        self._executor.submit(self._dispatch_execution, job.job_id)
+        queued = self._schedule(job)
 
-        if self._backpressure is not None:
+        if self._backpressure is not None and not queued:
             self._backpressure.record_submission()
 
         return job
@@ -328,7 +534,7 @@ class PipelineJobManager:
             self._store.save(snapshot)
 
         log_generic_job_submitted(job)
-        self._executor.submit(self._dispatch_execution, job.job_id)
+        self._start_local(job)
 
         if self._backpressure is not None:
             self._backpressure.record_submission()
@@ -459,6 +665,8 @@ class PipelineJobManager:
         finally:
             if self._backpressure is not None:
                 self._backpressure.record_completion()
+            if self._admission is not None:
+                self._launch_admitted(self._admission.release(job_id))
 
     # Wrapper methods for logging to maintain backward compatibility
     def _log_job_started(self, job: PipelineJob) -> None:
@@ -481,6 +689,11 @@ class PipelineJobManager:
     def _record_job_metric(self, name: str, value: float, attributes: Mapping[str, str]) -> None:
         record_job_metric(name, value, dict(attributes))
 
+    def _create_trace_recorder(self, job: PipelineJob) -> JobTraceRecorder:
+        return JobTraceRecorder.for_job(
+            job.job_id, self._file_locator.metadata_root(job.job_id)
+        )
+
     def _execute_pipeline(self, job_id: str) -> None:
         self._job_executor.execute(job_id)
 
@@ -671,11 +884,14 @@ class PipelineJobManager:
     ) -> PipelineJob:
         """Mark ``job_id`` as paused and persist the updated status."""
 
-        return self._transitions.pause_job(
+        job = self._transitions.pause_job(
             job_id,
             user_id=user_id,
             user_role=user_role,
         )
+        self._withdraw_admission(job_id)
+        self._request_remote_stop(job_id, PipelineJobStatus.PAUSED)
+        return job
 
     def resume_job(
         self,
@@ -694,7 +910,7 @@ class PipelineJobManager:
         with self._lock:
             self._jobs[job_id] = job
             self._register_job_handler(job_id, job)
-        self._executor.submit(self._dispatch_execution, job_id)
+        self._schedule(job)
         return job
 
     def _cleanup_generated_outputs(self, job_id: str) -> None:
@@ -785,7 +1001,7 @@ class PipelineJobManager:
 
         self._store.update(snapshot)
         tracker.publish_progress({"stage": "restart", "previous_status": previous_status.value})
-        self._executor.submit(self._dispatch_execution, job_id)
+        self._schedule(job)
         return job
 
     def cancel_job(
@@ -797,11 +1013,25 @@ class PipelineJobManager:
     ) -> PipelineJob:
         """Cancel ``job_id`` and persist the terminal state."""
 
-        return self._transitions.cancel_job(
+        job = self._transitions.cancel_job(
             job_id,
             user_id=user_id,
             user_role=user_role,
         )
+        self._withdraw_admission(job_id)
+        self._request_remote_stop(job_id, PipelineJobStatus.CANCELLED)
+        return job
+
+    def _request_remote_stop(self, job_id: str, status: PipelineJobStatus) -> None:
+        """Forward a pause/cancel to the queue worker executing ``job_id``."""
+
+        if self._job_queue is None:
+            return
+        self._forget_remote_job(job_id)
+        try:
+            self._job_queue.request_stop(job_id, status.value)
+        except Exception:  # pragma: no cover - defensive logging
+            logger.warning("Unable to forward %s request for job %s", status.value, job_id, exc_info=True)
 
     def delete_job(
         self,
@@ -819,6 +1049,9 @@ class PipelineJobManager:
         )
         self._last_event_sig.pop(job_id, None)
         self._job_locks.remove_job_lock(job_id)
+        self._withdraw_admission(job_id)
+        if self._job_queue is not None:
+            self._job_queue.remove(job_id)
         job_root = self._file_locator.job_root(job.job_id)
         try:
             shutil.rmtree(job_root)
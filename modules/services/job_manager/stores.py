@@ -506,6 +506,66 @@ class BatchingJobStore:
             self._flush_thread.join(timeout=2.0)
 
 
+class FencedJobStore:
+    """Wrapper that drops writes for jobs whose execution lease was lost.
+
+    Distributed workers fence a job once another worker may own it, so the
+    abandoned execution cannot overwrite the new owner's progress.
+    """
+
+    def __init__(self, store: JobStore) -> None:
+        self._store = store
+        self._lock = threading.Lock()
+        self._fenced: set[str] = set()
+
+    @property
+    def inner(self) -> JobStore:
+        """Return the wrapped store."""
+        return self._store
+
+    def fence(self, job_id: str) -> None:
+        """Start dropping writes for ``job_id``."""
+        with self._lock:
+            self._fenced.add(job_id)
+
+    def unfence(self, job_id: str) -> None:
+        """Resume forwarding writes for ``job_id``."""
+        with self._lock:
+            self._fenced.discard(job_id)
+
+    def is_fenced(self, job_id: str) -> bool:
+        with self._lock:
+            return job_id in self._fenced
+
+    def save(self, metadata: PipelineJobMetadata) -> None:
+        if not self.is_fenced(metadata.job_id):
+            self._store.save(metadata)
+
+    def update(self, metadata: PipelineJobMetadata) -> None:
+        if not self.is_fenced(metadata.job_id):
+            self._store.update(metadata)
+
+    def get(self, job_id: str) -> PipelineJobMetadata:
+        return self._store.get(job_id)
+
+    def list(
+        self,
+        *,
+        offset: Optional[int] = None,
+        limit: Optional[int] = None,
+    ) -> Dict[str, PipelineJobMetadata]:
+        return self._store.list(offset=offset, limit=limit)
+
+    def count(self) -> int:
+        return self._store.count()
+
+    def list_ids(self) -> List[str]:
+        return self._store.list_ids()
+
+    def delete(self, job_id: str) -> None:
+        self._store.delete(job_id)
+
+
 __all__ = [
     "JobStore",
     "InMemoryJobStore",
@@ -513,4 +573,5 @@ __all__ = [
     "RedisJobStore",
     "CachingJobStore",
     "BatchingJobStore",
+    "FencedJobStore",
 ]
@@ -83,6 +83,7 @@ class PipelineJobTransitionCoordinator:
         *,
         user_id: Optional[str] = None,
         user_role: Optional[str] = None,
+        enforce_authorization: bool = True,
     ) -> PipelineJob:
         """Mark ``job_id`` as paused and persist the updated status."""
 
@@ -109,6 +110,7 @@ class PipelineJobTransitionCoordinator:
             _pause,
             user_id=user_id,
             user_role=user_role,
+            enforce_authorization=enforce_authorization,
         )
 
     def resume_job(
@@ -168,6 +170,7 @@ class PipelineJobTransitionCoordinator:
         *,
         user_id: Optional[str] = None,
         user_role: Optional[str] = None,
+        enforce_authorization: bool = True,
     ) -> PipelineJob:
         """Cancel ``job_id`` and persist the terminal state."""
 
@@ -202,6 +205,7 @@ class PipelineJobTransitionCoordinator:
             _cancel,
             user_id=user_id,
             user_role=user_role,
+            enforce_authorization=enforce_authorization,
         )
 
     def delete_job(
@@ -14,6 +14,7 @@ from .types import (
 )
 from .cache import MetadataCache
 from .registry import MetadataSourceRegistry, create_registry_from_config
+from .sessions import ProviderSessionPool, RateLimiter, get_session_pool
 from .pipeline import MetadataLookupPipeline, create_pipeline
 from .normalization import merge_results, deduplicate_genres
 from .enrichment import (
@@ -47,6 +48,10 @@ __all__ = [
     # Registry
     "MetadataSourceRegistry",
     "create_registry_from_config",
+    # Sessions
+    "ProviderSessionPool",
+    "RateLimiter",
+    "get_session_pool",
     # Pipeline
     "MetadataLookupPipeline",
     "create_pipeline",
@@ -24,22 +24,26 @@ class MetadataCache:
     """File-based cache for metadata lookup results.
 
     Stores results as JSON files with SHA256-based filenames.
-    Supports configurable TTL for automatic expiry.
+    Supports configurable TTL for automatic expiry. Lookups that found
+    nothing can be recorded as misses, which expire on a shorter TTL.
     """
 
     def __init__(
         self,
         cache_dir: Path,
         ttl_hours: int = 24 * 7,  # 1 week default
+        negative_ttl_minutes: int = 60,
     ) -> None:
         """Initialize the cache.
 
         Args:
             cache_dir: Directory to store cache files.
             ttl_hours: Time-to-live in hours for cache entries.
+            negative_ttl_minutes: Time-to-live in minutes for recorded misses.
         """
         self._cache_dir = Path(cache_dir)
         self._ttl = timedelta(hours=ttl_hours)
+        self._negative_ttl = timedelta(minutes=negative_ttl_minutes)
         self._cache_dir.mkdir(parents=True, exist_ok=True)
 
     def _cache_key(self, query: LookupQuery) -> str:
@@ -66,6 +70,30 @@ class MetadataCache:
         """
         return self._cache_dir / f"{key}.json"
 
+    def _entry_ttl(self, data: dict) -> timedelta:
+        """Return the TTL that applies to a stored entry."""
+        return self._negative_ttl if data.get("miss") else self._ttl
+
+    def _query_payload(self, query: LookupQuery) -> dict:
+        return {
+            "media_type": query.media_type.value,
+            "title": query.title,
+            "author": query.author,
+            "isbn": query.isbn,
+            "series_name": query.series_name,
+            "season": query.season,
+            "episode": query.episode,
+            "youtube_video_id": query.youtube_video_id,
+        }
+
+    def _write_entry(self, path: Path, data: dict) -> bool:
+        try:
+            path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+            return True
+        except OSError as exc:
+            logger.warning("Failed to write cache file %s: %s", path, exc)
+            return False
+
     def get(self, query: LookupQuery) -> Optional[UnifiedMetadataResult]:
         """Retrieve cached result if valid.
 
@@ -92,7 +120,7 @@ class MetadataCache:
         if cached_at:
             try:
                 cached_time = datetime.fromisoformat(cached_at)
-                if datetime.now(timezone.utc) - cached_time > self._ttl:
+                if datetime.now(timezone.utc) - cached_time > self._entry_ttl(data):
                     logger.debug("Cache entry expired for key %s", key)
                     path.unlink(missing_ok=True)
                     return None
@@ -124,24 +152,55 @@ class MetadataCache:
 
         data = {
             "cached_at": datetime.now(timezone.utc).isoformat(),
-            "query": {
-                "media_type": query.media_type.value,
-                "title": query.title,
-                "author": query.author,
-                "isbn": query.isbn,
-                "series_name": query.series_name,
-                "season": query.season,
-                "episode": query.episode,
-                "youtube_video_id": query.youtube_video_id,
-            },
+            "query": self._query_payload(query),
             "result": result.to_dict(include_raw=False),
         }
 
-        try:
-            path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+        if self._write_entry(path, data):
             logger.debug("Cached result for key %s", key)
-        except OSError as exc:
-            logger.warning("Failed to write cache file %s: %s", path, exc)
+
+    def set_miss(self, query: LookupQuery) -> None:
+        """Record that no source had metadata for the query.
+
+        Args:
+            query: The lookup query.
+        """
+        key = self._cache_key(query)
+        data = {
+            "cached_at": datetime.now(timezone.utc).isoformat(),
+            "query": self._query_payload(query),
+            "miss": True,
+            "result": None,
+        }
+        if self._write_entry(self._cache_path(key), data):
+            logger.debug("Cached miss for key %s", key)
+
+    def is_miss(self, query: LookupQuery) -> bool:
+        """Return True if an unexpired miss is recorded for the query.
+
+        Args:
+            query: The lookup query.
+
+        Returns:
+            True if the last lookup found nothing and the miss has not expired.
+        """
+        path = self._cache_path(self._cache_key(query))
+        if not _path_exists(path):
+            return False
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return False
+        if not isinstance(data, dict) or not data.get("miss"):
+            return False
+        try:
+            cached_time = datetime.fromisoformat(data.get("cached_at") or "")
+        except ValueError:
+            return False
+        if datetime.now(timezone.utc) - cached_time > self._negative_ttl:
+            path.unlink(missing_ok=True)
+            return False
+        return True
 
     def delete(self, query: LookupQuery) -> bool:
         """Delete a cached result.
@@ -195,7 +254,7 @@ class MetadataCache:
                 cached_at = data.get("cached_at")
                 if cached_at:
                     cached_time = datetime.fromisoformat(cached_at)
-                    if now - cached_time > self._ttl:
+                    if now - cached_time > self._entry_ttl(data):
                         path.unlink()
                         count += 1
             except (OSError, json.JSONDecodeError, ValueError):
@@ -220,5 +279,10 @@ class MetadataCache:
         """Return the TTL in hours."""
         return int(self._ttl.total_seconds() / 3600)
 
+    @property
+    def negative_ttl_minutes(self) -> int:
+        """Return the TTL for recorded misses in minutes."""
+        return int(self._negative_ttl.total_seconds() / 60)
+
 
 __all__ = ["MetadataCache"]
@@ -164,10 +164,15 @@ def _cover_destination(query_key: str) -> Path:
     return root / f"openlibrary_{safe_base}_{digest}.jpg"
 
 
-def _download_cover(url: str, destination: Path, timeout: float = 10.0) -> bool:
-    """Download a cover image."""
+def _download_cover(
+    url: str,
+    destination: Path,
+    timeout: float = 10.0,
+    session: Optional[requests.Session] = None,
+) -> bool:
+    """Download a cover image, reusing the client's session when given."""
     try:
-        response = requests.get(url, timeout=timeout)
+        response = (session or requests).get(url, timeout=timeout)
         if response.status_code != 200:
             return False
         destination.parent.mkdir(parents=True, exist_ok=True)
@@ -396,7 +401,9 @@ class OpenLibraryClient(BaseMetadataClient):
         cover_file = None
         if cover_url and options.download_cover:
             destination = _cover_destination(f"isbn_{query.isbn}")
-            if _download_cover(cover_url, destination, timeout=options.timeout_seconds):
+            if _download_cover(
+                cover_url, destination, timeout=options.timeout_seconds, session=self._session
+            ):
                 cover_file = str(destination)
 
         # Extract subjects/genres
@@ -473,7 +480,9 @@ class OpenLibraryClient(BaseMetadataClient):
             cover_url = _OPENLIBRARY_COVER_TEMPLATE.format(cover_id=cover_id)
             if options.download_cover:
                 destination = _cover_destination(f"cover_{cover_id}")
-                if _download_cover(cover_url, destination, timeout=options.timeout_seconds):
+                if _download_cover(
+                    cover_url, destination, timeout=options.timeout_seconds, session=self._session
+                ):
                     cover_file = str(destination)
 
         # Extract summary (from first_sentence or work description)
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import importlib.util
 import re
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Mapping, Optional
+from typing import Any, Dict, Mapping, Optional, Tuple
 
 from modules import logging_manager as log_mgr
 
@@ -22,17 +24,18 @@ from .base import BaseMetadataClient
 
 logger = log_mgr.get_logger().getChild("services.metadata.clients.ytdlp")
 
-# Import yt-dlp conditionally to allow graceful degradation
-try:
+# yt-dlp is slow to import; probe for it here and import on first lookup.
+_YTDLP_AVAILABLE = importlib.util.find_spec("yt_dlp") is not None
+
+
+@lru_cache(maxsize=1)
+def _load_yt_dlp() -> Tuple[Any, Tuple[type, ...]]:
+    """Return ``(YoutubeDL, retryable_error_types)``."""
+
     from yt_dlp import YoutubeDL
     from yt_dlp.utils import DownloadError, ExtractorError
 
-    _YTDLP_AVAILABLE = True
-except ImportError:
-    _YTDLP_AVAILABLE = False
-    YoutubeDL = None
-    DownloadError = Exception
-    ExtractorError = Exception
+    return YoutubeDL, (DownloadError, ExtractorError)
 
 # YouTube ID patterns
 _YOUTUBE_ID_IN_BRACKETS = re.compile(r"\[(?P<id>[A-Za-z0-9_-]{11})\]")
@@ -157,7 +160,7 @@ def _extract_with_backoff(ydl, url: str, download: bool = False, max_retries: in
     for attempt in range(max_retries):
         try:
             return ydl.extract_info(url, download=download)
-        except (DownloadError, ExtractorError) as exc:
+        except _load_yt_dlp()[1] as exc:
             last_exc = exc
             if attempt < max_retries - 1:
                 time.sleep(2**attempt)
@@ -244,10 +247,11 @@ class YtDlpClient(BaseMetadataClient):
         yt_opts = dict(_COMMON_YT_OPTS)
         yt_opts["socket_timeout"] = options.timeout_seconds
 
+        youtube_dl, extraction_errors = _load_yt_dlp()
         try:
-            with YoutubeDL(yt_opts) as ydl:
+            with youtube_dl(yt_opts) as ydl:
                 info = _extract_with_backoff(ydl, url, download=False)
-        except (DownloadError, ExtractorError) as exc:
+        except extraction_errors as exc:
             return UnifiedMetadataResult(
                 title="Unknown",
                 type=MediaType.YOUTUBE_VIDEO,
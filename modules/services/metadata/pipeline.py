@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Sequence, Tuple
 
 from modules import config_manager as cfg
 from modules import logging_manager as log_mgr
@@ -13,10 +16,13 @@ from .types import (
     ConfidenceLevel,
     LookupOptions,
     LookupQuery,
+    MetadataSource,
     UnifiedMetadataResult,
 )
+from .clients.base import BaseMetadataClient
 from .registry import MetadataSourceRegistry, create_registry_from_config
 from .cache import MetadataCache
+from .sessions import reset_transport_errors, transport_errors
 from .normalization import merge_results, deduplicate_genres
 
 logger = log_mgr.get_logger().getChild("services.metadata.pipeline")
@@ -27,10 +33,11 @@ class MetadataLookupPipeline:
 
     The pipeline:
     1. Checks cache if enabled
-    2. Tries sources in order from the fallback chain
-    3. Stops early on high confidence results or when all required fields are present
-    4. Merges results from multiple sources
-    5. Caches and returns the result
+    2. Queries the sources in the fallback chain concurrently
+    3. Stops early (cancelling slower fallbacks) once the results in chain
+       order include one with all required fields
+    4. Merges results from multiple sources in chain order
+    5. Caches and returns the result, or records a miss
     """
 
     def __init__(
@@ -65,8 +72,13 @@ class MetadataLookupPipeline:
             cache_dir = metadata_config.get("cache_dir", "storage/cache/metadata")
             cache_path = cfg.resolve_directory(None, cache_dir)
             ttl_hours = metadata_config.get("cache_ttl_hours", 168)
+            negative_ttl_minutes = metadata_config.get("cache_negative_ttl_minutes", 60)
 
-            return MetadataCache(cache_dir=cache_path, ttl_hours=ttl_hours)
+            return MetadataCache(
+                cache_dir=cache_path,
+                ttl_hours=ttl_hours,
+                negative_ttl_minutes=negative_ttl_minutes,
+            )
         except Exception as exc:
             logger.warning("Failed to create metadata cache: %s", exc)
             return None
@@ -93,6 +105,12 @@ class MetadataLookupPipeline:
             if cached is not None:
                 logger.debug("Cache hit for %s", query.title or query.isbn or query.youtube_video_id)
                 return cached
+            if self._cache.is_miss(query):
+                logger.debug(
+                    "Cached miss for %s",
+                    query.title or query.isbn or query.youtube_video_id,
+                )
+                return None
 
         # Get available sources for this media type
         available_sources = self._registry.get_available_sources(query.media_type)
@@ -101,67 +119,17 @@ class MetadataLookupPipeline:
             logger.warning("No available sources for media type %s", query.media_type)
             return None
 
-        results: list[UnifiedMetadataResult] = []
-        primary_source = None
-
-        for source in available_sources:
-            if len(results) >= opts.max_sources:
-                logger.debug("Reached max sources (%d), stopping chain", opts.max_sources)
-                break
-
-            client = self._registry.get_client(source)
-            if client is None:
-                continue
-
-            logger.info(
-                "Querying %s for %s",
-                source.value,
-                query.title or query.isbn or query.youtube_video_id or "unknown",
-            )
-
-            try:
-                result = client.lookup(query, opts)
-            except Exception as exc:
-                logger.warning("Source %s failed: %s", source.value, exc)
-                continue
-
-            if result is None:
-                logger.debug("Source %s returned no results", source.value)
-                continue
-
-            # Skip error results from this source
-            if result.error and not result.title:
-                logger.debug("Source %s returned error: %s", source.value, result.error)
-                continue
-
-            results.append(result)
-            if primary_source is None:
-                primary_source = source
-
-            logger.info(
-                "Source %s returned: title=%s, genres=%s, has_required=%s",
-                source.value,
-                result.title,
-                result.genres[:3] if result.genres else [],
-                result.has_required_fields(),
-            )
-
-            # Check if we have all required fields (title, year, genres, summary, cover)
-            # This takes precedence over confidence level to ensure we get complete metadata
-            if result.has_required_fields():
-                logger.debug("All required fields found after %s", source.value)
-                break
-
-            # Only stop on high confidence if we also have required fields
-            # Otherwise continue to fill missing fields from fallback sources
-            if result.confidence == ConfidenceLevel.HIGH:
-                logger.info(
-                    "High confidence result from %s but missing fields, continuing to fallbacks",
-                    source.value,
-                )
+        results, primary_source, all_answered = self._query_sources(query, opts, available_sources)
 
         if not results:
             logger.info("No results found from any source")
+            # Only remember a miss when every source answered; failures and
+            # timeouts are worth retrying on the next lookup.
+            if self._cache and not opts.skip_cache and all_answered:
+                try:
+                    self._cache.set_miss(query)
+                except Exception as exc:
+                    logger.warning("Failed to cache miss: %s", exc)
             return None
 
         # Merge results
@@ -189,6 +157,134 @@ class MetadataLookupPipeline:
 
         return merged
 
+    def _query_sources(
+        self,
+        query: LookupQuery,
+        opts: LookupOptions,
+        sources: Sequence[MetadataSource],
+    ) -> Tuple[List[UnifiedMetadataResult], Optional[MetadataSource], bool]:
+        """Query sources and select results in fallback-chain order.
+
+        Sources are queried concurrently unless ``opts.parallel_sources`` is
+        off. The selected results are always the ones the sequential chain
+        would have produced: sources are taken in priority order until one
+        has all required fields or ``max_sources`` results are collected, so
+        lower-priority sources still in flight are cancelled as soon as
+        that prefix is settled.
+
+        Returns:
+            The selected results, the primary source, and whether every
+            source that was needed gave an answer (no failures or timeouts).
+        """
+        clients: List[Tuple[MetadataSource, BaseMetadataClient]] = []
+        for source in sources:
+            client = self._registry.get_client(source)
+            if client is not None:
+                clients.append((source, client))
+
+        outcomes: Dict[MetadataSource, _SourceOutcome] = {}
+        if not opts.parallel_sources or len(clients) <= 1:
+            for source, client in clients:
+                outcomes[source] = self._query_source(source, client, query, opts)
+                if _select_results(clients, outcomes, opts) is not None:
+                    break
+        else:
+            self._query_sources_parallel(clients, outcomes, query, opts)
+
+        return _select_results(clients, outcomes, opts, settle_pending=True)
+
+    def _query_sources_parallel(
+        self,
+        clients: List[Tuple[MetadataSource, BaseMetadataClient]],
+        outcomes: Dict[MetadataSource, "_SourceOutcome"],
+        query: LookupQuery,
+        opts: LookupOptions,
+    ) -> None:
+        """Fan out to every source and stop once the selection is settled."""
+        executor = ThreadPoolExecutor(
+            max_workers=len(clients),
+            thread_name_prefix="metadata-lookup",
+        )
+        deadline = time.monotonic() + max(0.0, float(opts.timeout_seconds))
+        pending: Dict[Future, MetadataSource] = {}
+        try:
+            for source, client in clients:
+                future = executor.submit(self._query_source, source, client, query, opts)
+                pending[future] = source
+
+            while pending:
+                remaining = deadline - time.monotonic()
+                done, _ = wait(pending, timeout=max(0.0, remaining), return_when=FIRST_COMPLETED)
+                for future in done:
+                    source = pending.pop(future)
+                    outcomes[source] = future.result()
+                if not done and remaining <= 0:
+                    for future, source in pending.items():
+                        logger.warning(
+                            "Source %s timed out after %.1fs",
+                            source.value,
+                            opts.timeout_seconds,
+                        )
+                        outcomes[source] = _SourceOutcome(None, failed=True)
+                        future.cancel()
+                    pending.clear()
+                    break
+                if _select_results(clients, outcomes, opts) is not None:
+                    if pending:
+                        logger.debug(
+                            "Cancelling lower-priority sources: %s",
+                            [source.value for source in pending.values()],
+                        )
+                    for future in pending:
+                        future.cancel()
+                    break
+        finally:
+            # Do not wait for cancelled or timed-out requests; their threads
+            # finish in the background and their results are discarded.
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _query_source(
+        self,
+        source: MetadataSource,
+        client: BaseMetadataClient,
+        query: LookupQuery,
+        opts: LookupOptions,
+    ) -> "_SourceOutcome":
+        """Query one source and classify its answer."""
+        logger.info(
+            "Querying %s for %s",
+            source.value,
+            query.title or query.isbn or query.youtube_video_id or "unknown",
+        )
+
+        reset_transport_errors()
+        try:
+            result = client.lookup(query, opts)
+        except Exception as exc:
+            logger.warning("Source %s failed: %s", source.value, exc)
+            return _SourceOutcome(None, failed=True)
+
+        if result is None:
+            if transport_errors():
+                logger.debug("Source %s could not be reached", source.value)
+                return _SourceOutcome(None, failed=True)
+            logger.debug("Source %s returned no results", source.value)
+            return _SourceOutcome(None)
+
+        # Skip error results from this source
+        if result.error and not result.title:
+            logger.debug("Source %s returned error: %s", source.value, result.error)
+            return _SourceOutcome(None)
+
+        logger.info(
+            "Source %s returned: title=%s, genres=%s, has_required=%s",
+            source.value,
+            result.title,
+            result.genres[:3] if result.genres else [],
+            result.has_required_fields(),
+        )
+        return _SourceOutcome(result)
+
     def lookup_with_fallback(
         self,
         query: LookupQuery,
@@ -250,6 +346,61 @@ class MetadataLookupPipeline:
         self.close()
 
 
+@dataclass(frozen=True, slots=True)
+class _SourceOutcome:
+    """Answer from one source: a usable result, nothing, or a failure."""
+
+    result: Optional[UnifiedMetadataResult]
+    failed: bool = False
+
+
+def _select_results(
+    clients: Sequence[Tuple[MetadataSource, BaseMetadataClient]],
+    outcomes: Dict[MetadataSource, _SourceOutcome],
+    opts: LookupOptions,
+    *,
+    settle_pending: bool = False,
+) -> Optional[Tuple[List[UnifiedMetadataResult], Optional[MetadataSource], bool]]:
+    """Select results in chain order, or return None while still undecided.
+
+    Walks the sources in priority order. The selection is settled once a
+    result has all required fields, ``max_sources`` results are collected,
+    or every source has answered. An unanswered source ahead of that point
+    leaves the selection undecided unless ``settle_pending`` is set.
+    """
+    results: List[UnifiedMetadataResult] = []
+    primary_source: Optional[MetadataSource] = None
+    all_answered = True
+
+    for source, _client in clients:
+        if len(results) >= opts.max_sources:
+            logger.debug("Reached max sources (%d), stopping chain", opts.max_sources)
+            break
+        outcome = outcomes.get(source)
+        if outcome is None:
+            if not settle_pending:
+                return None
+            all_answered = False
+            continue
+        if outcome.failed:
+            all_answered = False
+        result = outcome.result
+        if result is None:
+            continue
+
+        results.append(result)
+        if primary_source is None:
+            primary_source = source
+
+        # Check if we have all required fields (title, year, genres, summary, cover)
+        # This takes precedence over confidence level to ensure we get complete metadata
+        if result.has_required_fields():
+            logger.debug("All required fields found after %s", source.value)
+            break
+
+    return results, primary_source, all_answered
+
+
 def create_pipeline(
     api_keys: Optional[dict] = None,
     cache_enabled: bool = True,
@@ -278,7 +429,12 @@ def create_pipeline(
             cache_dir = metadata_config.get("cache_dir", "storage/cache/metadata")
             cache_path = cfg.resolve_directory(None, cache_dir)
             ttl_hours = metadata_config.get("cache_ttl_hours", 168)
-            cache = MetadataCache(cache_dir=cache_path, ttl_hours=ttl_hours)
+            negative_ttl_minutes = metadata_config.get("cache_negative_ttl_minutes", 60)
+            cache = MetadataCache(
+                cache_dir=cache_path,
+                ttl_hours=ttl_hours,
+                negative_ttl_minutes=negative_ttl_minutes,
+            )
         except Exception:
             pass
 
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Sequence, Type
+from typing import Any, Dict, List, Optional, Sequence, Type
 
 from .types import MediaType, MetadataSource
+from .sessions import ProviderSessionPool, get_session_pool
 from .clients.base import BaseMetadataClient
 from .clients.openlibrary import OpenLibraryClient
 from .clients.google_books import GoogleBooksClient
@@ -75,6 +76,8 @@ class MetadataSourceRegistry:
         self,
         api_keys: Optional[Dict[str, str]] = None,
         custom_chains: Optional[Dict[MediaType, List[MetadataSource]]] = None,
+        session_pool: Optional[ProviderSessionPool] = None,
+        client_options: Optional[Dict[MetadataSource, Dict[str, Any]]] = None,
     ) -> None:
         """Initialize the registry.
 
@@ -82,8 +85,14 @@ class MetadataSourceRegistry:
             api_keys: Dictionary mapping source names to API keys.
                       Keys should be source enum values (e.g., "tmdb", "omdb").
             custom_chains: Optional custom fallback chains to override defaults.
+            session_pool: Pool of shared provider sessions. Defaults to the
+                          process-wide pool so connections outlive the registry.
+            client_options: Extra constructor arguments per source
+                            (e.g., ``base_url`` or ``timeout_seconds``).
         """
         self._api_keys = api_keys or {}
+        self._session_pool = session_pool if session_pool is not None else get_session_pool()
+        self._client_options = client_options or {}
         self._clients: Dict[MetadataSource, BaseMetadataClient] = {}
         self._chains = {**DEFAULT_CHAINS}
         if custom_chains:
@@ -108,9 +117,11 @@ class MetadataSourceRegistry:
         # Get API key for this source
         api_key = self._api_keys.get(source.value)
 
-        # Create client
+        # Create client on the provider's shared session
+        kwargs = dict(self._client_options.get(source, {}))
+        kwargs.setdefault("session", self._session_pool.session_for(source))
         try:
-            client = client_class(api_key=api_key)
+            client = client_class(api_key=api_key, **kwargs)
         except Exception:
             return None
 
@@ -174,7 +185,10 @@ class MetadataSourceRegistry:
             del self._clients[source]
 
     def close(self) -> None:
-        """Close all clients and release resources."""
+        """Close all clients and release resources.
+
+        Shared provider sessions stay open in the session pool.
+        """
         for client in self._clients.values():
             try:
                 client.close()
@@ -252,6 +266,16 @@ def create_registry_from_config(config: Optional[Dict] = None) -> MetadataSource
             except (ValueError, KeyError):
                 pass
 
+    # Per-provider rate limits (requests per second) apply to the shared pool
+    rate_limits = metadata_config.get("rate_limits_per_second") or {}
+    if isinstance(rate_limits, dict):
+        pool = get_session_pool()
+        for source_str, rate in rate_limits.items():
+            try:
+                pool.set_rate_limit(MetadataSource(source_str), float(rate))
+            except (TypeError, ValueError):
+                pass
+
     return MetadataSourceRegistry(api_keys=api_keys, custom_chains=custom_chains)
 
 
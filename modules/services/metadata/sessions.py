@@ -0,0 +1,227 @@
+"""Shared, rate-limited HTTP sessions for metadata providers."""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Dict, Mapping, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from modules import logging_manager as log_mgr
+
+from .types import MetadataSource
+
+logger = log_mgr.get_logger().getChild("services.metadata.sessions")
+
+
+# Requests per second allowed against each provider, shared by every
+# pipeline in the process. These stay under the published API limits.
+DEFAULT_RATE_LIMITS: Dict[MetadataSource, float] = {
+    MetadataSource.OPENLIBRARY: 3.0,
+    MetadataSource.GOOGLE_BOOKS: 10.0,
+    MetadataSource.TMDB: 20.0,
+    MetadataSource.OMDB: 5.0,
+    MetadataSource.TVMAZE: 2.0,
+    MetadataSource.WIKIPEDIA: 10.0,
+}
+
+_DEFAULT_POOL_MAXSIZE = 8
+
+# Requests that failed in transport (connection errors, timeouts, 429/5xx)
+# on the current thread. Clients swallow these and return None, so the
+# pipeline reads this to tell "nothing found" apart from "could not ask".
+_transport_state = threading.local()
+
+
+def reset_transport_errors() -> None:
+    """Reset the transport error count for the current thread."""
+    _transport_state.errors = 0
+
+
+def transport_errors() -> int:
+    """Return transport errors seen on the current thread since the last reset."""
+    return getattr(_transport_state, "errors", 0)
+
+
+def _record_transport_error() -> None:
+    _transport_state.errors = transport_errors() + 1
+
+
+class RateLimiter:
+    """Thread-safe token bucket.
+
+    ``rate`` tokens are added per second up to ``burst``. A rate of zero or
+    less disables limiting.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[float] = None,
+        *,
+        clock=time.monotonic,
+        sleep=time.sleep,
+    ) -> None:
+        self._rate = float(rate)
+        self._burst = max(1.0, float(burst if burst is not None else rate))
+        self._tokens = self._burst
+        self._clock = clock
+        self._sleep = sleep
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self) -> float:
+        """Return the refill rate in tokens per second."""
+        return self._rate
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """Take one token, waiting up to ``timeout`` seconds for it.
+
+        Returns:
+            True if a token was taken, False if the wait would exceed the timeout.
+        """
+        if self._rate <= 0:
+            return True
+        deadline = None if timeout is None else self._clock() + max(0.0, timeout)
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._tokens = min(self._burst, self._tokens + (now - self._updated) * self._rate)
+                self._updated = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return True
+                wait = (1.0 - self._tokens) / self._rate
+            if deadline is not None and now + wait > deadline:
+                return False
+            self._sleep(wait)
+
+
+class RateLimitedSession(requests.Session):
+    """Keep-alive session that waits for a rate-limit token before each request.
+
+    Failed requests are counted for :func:`transport_errors`.
+    """
+
+    def __init__(
+        self,
+        limiter: Optional[RateLimiter] = None,
+        *,
+        pool_maxsize: int = _DEFAULT_POOL_MAXSIZE,
+    ) -> None:
+        super().__init__()
+        self.limiter = limiter
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_maxsize)
+        self.mount("https://", adapter)
+        self.mount("http://", adapter)
+
+    def request(self, method, url, *args, **kwargs):  # type: ignore[override]
+        limiter = self.limiter
+        if limiter is not None:
+            timeout = kwargs.get("timeout")
+            if isinstance(timeout, tuple):
+                timeout = timeout[0]
+            if not limiter.acquire(timeout=timeout):
+                _record_transport_error()
+                raise requests.exceptions.Timeout(f"Rate limit wait exceeded for {url}")
+        try:
+            response = super().request(method, url, *args, **kwargs)
+        except requests.RequestException:
+            _record_transport_error()
+            raise
+        if response.status_code == 429 or response.status_code >= 500:
+            _record_transport_error()
+        return response
+
+
+class ProviderSessionPool:
+    """Hands out one pooled, rate-limited session per metadata provider.
+
+    Pipelines and registries are short-lived, so the sessions live here and
+    keep their connections alive across lookups.
+    """
+
+    def __init__(
+        self,
+        rate_limits: Optional[Mapping[MetadataSource, float]] = None,
+        *,
+        pool_maxsize: int = _DEFAULT_POOL_MAXSIZE,
+    ) -> None:
+        self._rate_limits: Dict[MetadataSource, float] = {**DEFAULT_RATE_LIMITS, **(rate_limits or {})}
+        self._pool_maxsize = pool_maxsize
+        self._sessions: Dict[MetadataSource, RateLimitedSession] = {}
+        self._lock = threading.Lock()
+
+    def session_for(self, source: MetadataSource) -> RateLimitedSession:
+        """Return the shared session for ``source``, creating it on first use."""
+        with self._lock:
+            session = self._sessions.get(source)
+            if session is None:
+                session = RateLimitedSession(
+                    self._build_limiter(source),
+                    pool_maxsize=self._pool_maxsize,
+                )
+                self._sessions[source] = session
+            return session
+
+    def set_rate_limit(self, source: MetadataSource, requests_per_second: float) -> None:
+        """Change the rate limit for ``source``, including an existing session."""
+        with self._lock:
+            self._rate_limits[source] = float(requests_per_second)
+            session = self._sessions.get(source)
+            if session is not None:
+                session.limiter = self._build_limiter(source)
+
+    def _build_limiter(self, source: MetadataSource) -> Optional[RateLimiter]:
+        rate = self._rate_limits.get(source)
+        if not rate or rate <= 0:
+            return None
+        return RateLimiter(rate)
+
+    def close(self) -> None:
+        """Close every session and drop pooled connections."""
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for session in sessions:
+            try:
+                session.close()
+            except Exception:
+                logger.debug("Failed to close metadata session", exc_info=True)
+
+
+_shared_pool: Optional[ProviderSessionPool] = None
+_shared_pool_lock = threading.Lock()
+
+
+def get_session_pool() -> ProviderSessionPool:
+    """Return the process-wide provider session pool."""
+    global _shared_pool
+    with _shared_pool_lock:
+        if _shared_pool is None:
+            _shared_pool = ProviderSessionPool()
+        return _shared_pool
+
+
+def close_session_pool() -> None:
+    """Close and discard the process-wide provider session pool."""
+    global _shared_pool
+    with _shared_pool_lock:
+        pool, _shared_pool = _shared_pool, None
+    if pool is not None:
+        pool.close()
+
+
+__all__ = [
+    "DEFAULT_RATE_LIMITS",
+    "ProviderSessionPool",
+    "RateLimitedSession",
+    "RateLimiter",
+    "close_session_pool",
+    "get_session_pool",
+    "reset_transport_errors",
+    "transport_errors",
+]
@@ -389,6 +389,7 @@ class LookupOptions:
     timeout_seconds: float = 30.0  # Per-source timeout
     include_raw_responses: bool = False  # Include raw API responses
     download_cover: bool = True  # Download cover image to local file
+    parallel_sources: bool = True  # Query sources concurrently instead of one by one
 
 
 __all__ = [
@@ -83,6 +83,7 @@ def run_ingestion(
             "max_words": config_result.pipeline_config.max_words,
             "sentence_splitter_mode": config_result.pipeline_config.sentence_splitter_mode,
         },
+        language=request.inputs.input_language,
     )
     content_index = ingestion.get_content_index(
         request.inputs.input_file,
@@ -95,6 +96,7 @@ def run_ingestion(
             "max_words": config_result.pipeline_config.max_words,
             "sentence_splitter_mode": config_result.pipeline_config.sentence_splitter_mode,
         },
+        language=request.inputs.input_language,
     )
     if content_index and not metadata.get("content_index"):
         metadata.update({"content_index": content_index})
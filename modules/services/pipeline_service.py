@@ -14,6 +14,7 @@ from .. import config_manager as cfg
 from .. import logging_manager as log_mgr
 from .. import metadata_manager
 from .. import observability
+from .. import pipeline_trace
 from ..permissions import merge_access_policy, resolve_access_policy
 from ..core import ingestion
 from ..core.config import PipelineConfig
@@ -234,7 +235,7 @@ def run_pipeline(request: PipelineRequest) -> PipelineResponse:
                     **pipeline_attrs.as_dict(),
                     "target_languages": tuple(request.inputs.target_languages),
                 },
-            ):
+            ), pipeline_trace.trace_span(tracker, "stage.ingestion"):
                 metadata_result = metadata_phase.run_ingestion(
                     request, config_result, metadata, tracker
                 )
@@ -260,7 +261,7 @@ def run_pipeline(request: PipelineRequest) -> PipelineResponse:
                     **pipeline_attrs.as_dict(),
                     "total_sentences": metadata_result.ingestion.total_sentences,
                 },
-            ):
+            ), pipeline_trace.trace_span(tracker, "stage.rendering"):
                 render_result = render_phase.execute_render_phase(
                     request, config_result, metadata_result, tracker
                 )
@@ -286,7 +287,9 @@ def run_pipeline(request: PipelineRequest) -> PipelineResponse:
                             }
                         )
             elif request.inputs.stitch_full:
-                with observability.pipeline_stage("stitching", post_process_attrs):
+                with observability.pipeline_stage(
+                    "stitching", post_process_attrs
+                ), pipeline_trace.trace_span(tracker, "stage.stitching"):
                     stitching_result = render_phase.build_stitching_artifacts(
                         request, config_result, metadata_result, render_result
                     )
@@ -807,6 +810,7 @@ class PipelineService:
                     "target_languages": request.inputs.target_languages,
                     "max_words": pipeline_config.max_words,
                 },
+                language=request.inputs.input_language,
             )
             refined_sentences = list(refined)
         except Exception:
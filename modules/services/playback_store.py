@@ -0,0 +1,493 @@
+"""Indexed SQLite storage for playback resume positions and bookmarks.
+
+The file-backed :class:`ResumeService` rewrites one JSON document per
+``(user, job)`` on every save and lists positions by parsing every file in
+the user's directory.  Players save their position every few seconds on each
+device, so :class:`PlaybackStateStore` keeps both kinds of state in a single
+WAL-mode SQLite database indexed by ``updated_at``/``created_at`` and
+coalesces resume saves in memory: only the latest position per job is
+written, at most every ``flush_interval`` seconds, and pending positions are
+flushed when the store is closed.
+
+Legacy JSON files are imported the first time a user's state is accessed.
+"""
+
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .. import logging_manager
+from .bookmark_service import BookmarkEntry, BookmarkService
+from .file_locator import FileLocator
+from .resume_service import ResumeEntry, ResumeService, normalize_resume_job_ids
+from .source_discovery import safe_iterdir, safe_stat
+
+logger = logging_manager.get_logger().getChild("playback_store")
+
+PLAYBACK_STORE_ENV_VAR = "EBOOK_PLAYBACK_STORE"
+DEFAULT_FLUSH_INTERVAL_SECONDS = 2.0
+DEFAULT_MAX_PENDING = 512
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS resume_positions (
+        user_id TEXT NOT NULL,
+        job_id TEXT NOT NULL,
+        updated_at REAL NOT NULL,
+        payload TEXT NOT NULL,
+        PRIMARY KEY (user_id, job_id)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_resume_user_updated ON resume_positions (user_id, updated_at DESC)",
+    """
+    CREATE TABLE IF NOT EXISTS bookmarks (
+        user_id TEXT NOT NULL,
+        job_id TEXT NOT NULL,
+        bookmark_id TEXT NOT NULL,
+        created_at REAL NOT NULL,
+        payload TEXT NOT NULL,
+        PRIMARY KEY (user_id, job_id, bookmark_id)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_bookmarks_user_job_created ON bookmarks (user_id, job_id, created_at DESC)",
+    "CREATE TABLE IF NOT EXISTS imported_users (user_id TEXT PRIMARY KEY)",
+)
+
+# Mirrors the fragment rules of the file services so legacy files can be found.
+_ALLOWED_FRAGMENT_CHARS = {
+    *"abcdefghijklmnopqrstuvwxyz",
+    *"ABCDEFGHIJKLMNOPQRSTUVWXYZ",
+    *"0123456789",
+    "-",
+    "_",
+}
+
+
+def _sanitize_fragment(value: str, fallback: str) -> str:
+    if not value:
+        return fallback
+    sanitized = [ch if ch in _ALLOWED_FRAGMENT_CHARS else "_" for ch in value]
+    result = "".join(sanitized).strip("._")
+    return result or fallback
+
+
+def use_indexed_playback_store() -> bool:
+    """Return False when ``EBOOK_PLAYBACK_STORE`` selects the JSON file services."""
+
+    value = os.environ.get(PLAYBACK_STORE_ENV_VAR, "").strip().lower()
+    return value not in {"file", "files", "json"}
+
+
+class PlaybackStateStore:
+    """SQLite-backed resume and bookmark state with coalesced resume writes."""
+
+    def __init__(
+        self,
+        db_path: Path,
+        *,
+        legacy_root: Optional[Path] = None,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+        max_pending: int = DEFAULT_MAX_PENDING,
+    ) -> None:
+        self._db_path = Path(db_path)
+        self._legacy_root = Path(legacy_root) if legacy_root is not None else None
+        self._flush_interval = max(0.0, float(flush_interval))
+        self._max_pending = max(1, int(max_pending))
+        self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            str(self._db_path),
+            timeout=30.0,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        for statement in _SCHEMA:
+            self._conn.execute(statement)
+        # Serialises access to the shared connection.
+        self._db_lock = threading.Lock()
+        # Guards the pending map; never held while waiting for ``_db_lock``.
+        self._pending_lock = threading.Condition()
+        self._pending: Dict[Tuple[str, str], Tuple[float, str]] = {}
+        self._imported: set[str] = set()
+        self._closed = False
+        self._flusher: Optional[threading.Thread] = None
+        atexit.register(self.close)
+
+    @property
+    def db_path(self) -> Path:
+        return self._db_path
+
+    # ------------------------------------------------------------------
+    # Resume positions
+    # ------------------------------------------------------------------
+    def get_resume(self, user_id: str, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._pending_lock:
+            pending = self._pending.get((user_id, job_id))
+        if pending is not None:
+            return json.loads(pending[1])
+        self._ensure_imported(user_id)
+        with self._db_lock:
+            row = self._conn.execute(
+                "SELECT payload FROM resume_positions WHERE user_id = ? AND job_id = ?",
+                (user_id, job_id),
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def list_resume(
+        self,
+        user_id: str,
+        *,
+        job_ids: Optional[Sequence[str]] = None,
+        limit: int = 200,
+    ) -> List[Dict[str, Any]]:
+        """Return resume payloads for ``user_id``, most recently updated first."""
+
+        if limit <= 0:
+            return []
+        wanted = set(job_ids) if job_ids else None
+        with self._pending_lock:
+            pending = {
+                job_id: value
+                for (owner, job_id), value in self._pending.items()
+                if owner == user_id and (wanted is None or job_id in wanted)
+            }
+        self._ensure_imported(user_id)
+        # Pending saves can replace rows in the window, so over-fetch by that many.
+        fetch = limit + len(pending)
+        query = "SELECT job_id, updated_at, payload FROM resume_positions WHERE user_id = ?"
+        params: List[Any] = [user_id]
+        if wanted is not None:
+            query += f" AND job_id IN ({', '.join('?' for _ in wanted)})"
+            params.extend(wanted)
+        query += " ORDER BY updated_at DESC LIMIT ?"
+        params.append(fetch)
+        with self._db_lock:
+            rows = self._conn.execute(query, params).fetchall()
+        merged: Dict[str, Tuple[float, str]] = {job_id: (updated_at, payload) for job_id, updated_at, payload in rows}
+        merged.update(pending)
+        ordered = sorted(merged.values(), key=lambda item: item[0], reverse=True)[:limit]
+        return [json.loads(payload) for _, payload in ordered]
+
+    def put_resume(self, user_id: str, job_id: str, payload: Dict[str, Any], updated_at: float) -> None:
+        """Record a resume position; it is written on the next flush."""
+
+        encoded = json.dumps(payload, ensure_ascii=False, sort_keys=True)
+        with self._pending_lock:
+            self._pending[(user_id, job_id)] = (float(updated_at), encoded)
+            overflow = len(self._pending) >= self._max_pending
+            if not overflow:
+                self._ensure_flusher_locked()
+        if overflow or self._flush_interval == 0:
+            self.flush()
+
+    def delete_resume(self, user_id: str, job_id: str) -> bool:
+        with self._pending_lock:
+            removed_pending = self._pending.pop((user_id, job_id), None) is not None
+        self._ensure_imported(user_id)
+        with self._db_lock:
+            cursor = self._conn.execute(
+                "DELETE FROM resume_positions WHERE user_id = ? AND job_id = ?",
+                (user_id, job_id),
+            )
+        return removed_pending or cursor.rowcount > 0
+
+    # ------------------------------------------------------------------
+    # Bookmarks
+    # ------------------------------------------------------------------
+    def load_bookmarks(self, user_id: str, job_id: str) -> List[Dict[str, Any]]:
+        self._ensure_imported(user_id)
+        with self._db_lock:
+            rows = self._conn.execute(
+                "SELECT payload FROM bookmarks WHERE user_id = ? AND job_id = ? ORDER BY created_at DESC",
+                (user_id, job_id),
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def replace_bookmarks(self, user_id: str, job_id: str, bookmarks: Iterable[Dict[str, Any]]) -> None:
+        rows = [
+            (
+                user_id,
+                job_id,
+                str(bookmark["id"]),
+                float(bookmark.get("created_at") or 0.0),
+                json.dumps(bookmark, ensure_ascii=False, sort_keys=True),
+            )
+            for bookmark in bookmarks
+        ]
+        self._ensure_imported(user_id)
+        with self._db_lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute(
+                    "DELETE FROM bookmarks WHERE user_id = ? AND job_id = ?",
+                    (user_id, job_id),
+                )
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO bookmarks (user_id, job_id, bookmark_id, created_at, payload)"
+                    " VALUES (?, ?, ?, ?, ?)",
+                    rows,
+                )
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    # ------------------------------------------------------------------
+    # Flushing
+    # ------------------------------------------------------------------
+    def flush(self) -> int:
+        """Write pending resume positions; return how many rows were written."""
+
+        with self._pending_lock:
+            if not self._pending:
+                return 0
+            batch = self._pending
+            self._pending = {}
+        rows = [(user_id, job_id, updated_at, payload) for (user_id, job_id), (updated_at, payload) in batch.items()]
+        try:
+            with self._db_lock:
+                self._conn.execute("BEGIN IMMEDIATE")
+                try:
+                    # Keep the newer position when another process saved meanwhile.
+                    self._conn.executemany(
+                        """
+                        INSERT INTO resume_positions (user_id, job_id, updated_at, payload)
+                        VALUES (?, ?, ?, ?)
+                        ON CONFLICT (user_id, job_id) DO UPDATE SET
+                            updated_at = excluded.updated_at,
+                            payload = excluded.payload
+                        WHERE excluded.updated_at >= resume_positions.updated_at
+                        """,
+                        rows,
+                    )
+                except Exception:
+                    self._conn.execute("ROLLBACK")
+                    raise
+                self._conn.execute("COMMIT")
+        except Exception:
+            with self._pending_lock:
+                # Re-queue, without clobbering positions saved during the attempt.
+                for key, value in batch.items():
+                    self._pending.setdefault(key, value)
+            raise
+        return len(rows)
+
+    def close(self) -> None:
+        """Flush pending positions durably and close the database."""
+
+        with self._pending_lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._pending_lock.notify_all()
+        flusher = self._flusher
+        if flusher is not None and flusher is not threading.current_thread():
+            flusher.join(timeout=5.0)
+        try:
+            self.flush()
+        except Exception:
+            logger.warning("Failed to flush pending resume positions on shutdown", exc_info=True)
+        with self._db_lock:
+            try:
+                self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            except sqlite3.Error:
+                logger.debug("Playback store checkpoint failed", exc_info=True)
+            self._conn.close()
+        atexit.unregister(self.close)
+
+    def _ensure_flusher_locked(self) -> None:
+        if self._flusher is not None or self._closed or self._flush_interval == 0:
+            return
+        self._flusher = threading.Thread(target=self._flush_loop, name="playback-store-flush", daemon=True)
+        self._flusher.start()
+
+    def _flush_loop(self) -> None:
+        while True:
+            with self._pending_lock:
+                if self._closed:
+                    return
+                self._pending_lock.wait(self._flush_interval)
+                if self._closed:
+                    return
+            try:
+                self.flush()
+            except Exception:
+                logger.warning("Failed to flush resume positions; retrying", exc_info=True)
+
+    # ------------------------------------------------------------------
+    # Legacy JSON import
+    # ------------------------------------------------------------------
+    def _ensure_imported(self, user_id: str) -> None:
+        if user_id in self._imported:
+            return
+        with self._db_lock:
+            row = self._conn.execute("SELECT 1 FROM imported_users WHERE user_id = ?", (user_id,)).fetchone()
+        if row is None:
+            resume_rows, bookmark_rows = self._read_legacy_files(user_id)
+            with self._db_lock:
+                self._conn.execute("BEGIN IMMEDIATE")
+                try:
+                    self._conn.executemany(
+                        "INSERT OR IGNORE INTO resume_positions (user_id, job_id, updated_at, payload)"
+                        " VALUES (?, ?, ?, ?)",
+                        resume_rows,
+                    )
+                    self._conn.executemany(
+                        "INSERT OR IGNORE INTO bookmarks (user_id, job_id, bookmark_id, created_at, payload)"
+                        " VALUES (?, ?, ?, ?, ?)",
+                        bookmark_rows,
+                    )
+                    self._conn.execute("INSERT OR IGNORE INTO imported_users (user_id) VALUES (?)", (user_id,))
+                except Exception:
+                    self._conn.execute("ROLLBACK")
+                    raise
+                self._conn.execute("COMMIT")
+            if resume_rows or bookmark_rows:
+                logger.info(
+                    "Imported %s resume positions and %s bookmarks from JSON storage",
+                    len(resume_rows),
+                    len(bookmark_rows),
+                )
+        self._imported.add(user_id)
+
+    def _legacy_documents(self, kind: str, user_id: str) -> Iterable[Dict[str, Any]]:
+        if self._legacy_root is None:
+            return
+        root = self._legacy_root / kind / _sanitize_fragment(user_id, "user")
+        if safe_stat(root) is None:
+            return
+        for path in sorted(safe_iterdir(root)):
+            if path.suffix != ".json":
+                continue
+            try:
+                document = json.loads(path.read_text(encoding="utf-8"))
+            except Exception:
+                logger.warning("Skipping unreadable %s file during import", kind)
+                continue
+            if not isinstance(document, dict):
+                continue
+            owner = document.get("user_id")
+            if isinstance(owner, str) and owner and owner != user_id:
+                # Another user id that sanitises to the same directory.
+                continue
+            document.setdefault("job_id", path.stem)
+            yield document
+
+    def _read_legacy_files(self, user_id: str) -> Tuple[List[tuple], List[tuple]]:
+        resume_rows: List[tuple] = []
+        for document in self._legacy_documents("resume", user_id):
+            entry = document.get("entry")
+            if not isinstance(entry, dict):
+                continue
+            job_id = str(document.get("job_id"))
+            try:
+                updated_at = float(entry.get("updated_at") or document.get("updated_at") or 0.0)
+            except (TypeError, ValueError):
+                updated_at = 0.0
+            resume_rows.append((user_id, job_id, updated_at, json.dumps(entry, ensure_ascii=False, sort_keys=True)))
+        bookmark_rows: List[tuple] = []
+        for document in self._legacy_documents("bookmarks", user_id):
+            job_id = str(document.get("job_id"))
+            for bookmark in document.get("bookmarks") or []:
+                if not isinstance(bookmark, dict) or not bookmark.get("id"):
+                    continue
+                try:
+                    created_at = float(bookmark.get("created_at") or 0.0)
+                except (TypeError, ValueError):
+                    created_at = 0.0
+                bookmark_rows.append(
+                    (
+                        user_id,
+                        job_id,
+                        str(bookmark["id"]),
+                        created_at,
+                        json.dumps(bookmark, ensure_ascii=False, sort_keys=True),
+                    )
+                )
+        return resume_rows, bookmark_rows
+
+
+class IndexedResumeService(ResumeService):
+    """:class:`ResumeService` backed by a :class:`PlaybackStateStore`."""
+
+    def __init__(
+        self,
+        *,
+        store: PlaybackStateStore,
+        file_locator: Optional[FileLocator] = None,
+    ) -> None:
+        super().__init__(file_locator=file_locator)
+        self._store = store
+
+    def get(self, job_id: str, user_id: str) -> Optional[ResumeEntry]:
+        payload = self._store.get_resume(user_id, job_id)
+        if not isinstance(payload, dict):
+            return None
+        return self._normalize_entry(job_id, payload)
+
+    def list(
+        self,
+        user_id: str,
+        *,
+        job_ids: Optional[Sequence[str]] = None,
+        limit: int = 200,
+    ) -> list[ResumeEntry]:
+        requested_job_ids = normalize_resume_job_ids(job_ids)
+        if job_ids is not None and not requested_job_ids:
+            return []
+        payloads = self._store.list_resume(user_id, job_ids=requested_job_ids or None, limit=limit)
+        return [
+            self._normalize_entry(self._coerce_string(payload.get("job_id")) or "", payload)
+            for payload in payloads
+        ]
+
+    def save(self, job_id: str, user_id: str, data: Dict[str, Any]) -> ResumeEntry:
+        entry = self._normalize_entry(job_id, data)
+        self._store.put_resume(user_id, job_id, self._serialize(entry), entry.updated_at)
+        return entry
+
+    def clear(self, job_id: str, user_id: str) -> bool:
+        return self._store.delete_resume(user_id, job_id)
+
+    def flush(self) -> int:
+        return self._store.flush()
+
+
+class IndexedBookmarkService(BookmarkService):
+    """:class:`BookmarkService` backed by a :class:`PlaybackStateStore`."""
+
+    def __init__(
+        self,
+        *,
+        store: PlaybackStateStore,
+        file_locator: Optional[FileLocator] = None,
+        max_entries: int = 300,
+    ) -> None:
+        super().__init__(file_locator=file_locator, max_entries=max_entries)
+        self._store = store
+
+    def _load_payload(self, job_id: str, user_id: str) -> Dict[str, Any]:
+        return {
+            "version": 1,
+            "job_id": job_id,
+            "user_id": user_id,
+            "bookmarks": self._store.load_bookmarks(user_id, job_id),
+        }
+
+    def _persist(self, job_id: str, user_id: str, entries: Iterable[BookmarkEntry]) -> None:
+        self._store.replace_bookmarks(user_id, job_id, [self._serialize(entry) for entry in entries])
+
+
+__all__ = [
+    "IndexedBookmarkService",
+    "IndexedResumeService",
+    "PlaybackStateStore",
+    "use_indexed_playback_store",
+]
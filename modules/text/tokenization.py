@@ -3,13 +3,20 @@
 from __future__ import annotations
 
 import unicodedata
-from typing import List
+from functools import lru_cache
+from typing import Callable, List, Optional
 
-try:
-    # Optional Thai tokenizer; falls back to grapheme splitting when unavailable.
-    from pythainlp.tokenize import word_tokenize as _thai_word_tokenize
-except Exception:  # pragma: no cover - optional dependency
-    _thai_word_tokenize = None
+
+@lru_cache(maxsize=1)
+def _thai_word_tokenize() -> Optional[Callable[[str], List[str]]]:
+    """Return pythainlp's word tokenizer, imported on first Thai input."""
+
+    try:
+        # Optional Thai tokenizer; falls back to grapheme splitting when unavailable.
+        from pythainlp.tokenize import word_tokenize
+    except Exception:  # pragma: no cover - optional dependency
+        return None
+    return word_tokenize
 
 try:
     # Optional Japanese tokenizer via fugashi; falls back to graphemes when unavailable.
@@ -170,8 +177,9 @@ def split_highlight_tokens(text: str) -> List[str]:
         return whitespace_tokens
 
     # Thai: prefer dictionary-based segmentation when available so highlights follow words.
-    if _THAI_PATTERN.search(stripped) and _thai_word_tokenize:
-        thai_tokens = [tok.strip() for tok in _thai_word_tokenize(stripped) if tok.strip()]
+    thai_tokenizer = _thai_word_tokenize() if _THAI_PATTERN.search(stripped) else None
+    if thai_tokenizer is not None:
+        thai_tokens = [tok.strip() for tok in thai_tokenizer(stripped) if tok.strip()]
         if len(thai_tokens) > 1:
             return thai_tokens
 
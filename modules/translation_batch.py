@@ -7,16 +7,29 @@ including batch building, payload parsing, validation, and LLM communication.
 from __future__ import annotations
 
 import time
+from collections import deque
 from pathlib import Path
-from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple, TYPE_CHECKING
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    TYPE_CHECKING,
+)
 
 if TYPE_CHECKING:
     from modules.progress_tracker import ProgressTracker
     from modules.transliteration import TransliterationService
 
 from modules import config_manager as cfg, logging_manager as log_mgr
-from modules import llm_batch, prompt_templates, text_normalization as text_norm
-from modules import translation_validation as tv
+from modules import llm_batch, pipeline_trace, prompt_templates, text_normalization as text_norm
+from modules.translation_validation_profiles import BatchValidator
 from modules.text import align_token_counts
 from modules.transliteration_aligned import generate_word_aligned_transliteration
 from modules.llm_client import LLMClient
@@ -28,6 +41,13 @@ from modules.translation_logging import (
     TRANSLITERATION_SUBDIR,
 )
 from modules.transliteration import is_python_transliteration_mode
+from modules.translation_batch_sizing import (
+    AdaptiveBatchSizer,
+    BatchSizeKey,
+    completion_token_count,
+    get_batch_sizer,
+    make_batch_size_key,
+)
 
 logger = log_mgr.logger
 
@@ -35,6 +55,21 @@ logger = log_mgr.logger
 _LLM_REQUEST_ATTEMPTS = 4
 _TRANSLATION_RESPONSE_ATTEMPTS = 5
 _TRANSLATION_RETRY_DELAY_SECONDS = 1.0
+# Outright failures of a multi-item group before it is split in half.
+_BISECT_AFTER_FAILURES = 2
+# Attempts for an item isolated by salvage or bisection before the caller's
+# per-sentence fallback takes over.
+_ISOLATED_ITEM_ATTEMPTS = 2
+# Errors meaning the model answered with unusable content rather than the
+# request failing; those are worth bisecting.
+_CONTENT_ERROR_PREFIXES = (
+    "Invalid JSON response",
+    "JSON response failed validation",
+    "Validation failed",
+    "Empty response",
+)
+
+_T = TypeVar("_T")
 
 
 def normalize_llm_batch_size(value: Optional[int]) -> Optional[int]:
@@ -306,7 +341,9 @@ def validate_batch_translation(
     """Validate a batch translation result.
 
     Checks for common translation issues like transliteration, truncation,
-    missing diacritics, script mismatches, and sentence boundary violations.
+    missing diacritics, script mismatches, and sentence boundary violations,
+    using the precompiled profile of ``target_language``. Use a shared
+    :class:`BatchValidator` when validating many items for one target.
 
     Args:
         original_sentence: Original sentence
@@ -317,28 +354,11 @@ def validate_batch_translation(
     Returns:
         Error message if validation fails, None if valid
     """
-    if not tv.is_valid_translation(translation_text):
-        return "Invalid or placeholder translation"
-    if tv.is_probable_transliteration(original_sentence, translation_text, target_language):
-        return "Transliteration returned instead of translation"
-    if tv.is_translation_too_short(original_sentence, translation_text, target_language):
-        return "Translation shorter than expected"
-    missing_diacritics, label = tv.missing_required_diacritics(translation_text, target_language)
-    if missing_diacritics:
-        return f"Missing {label or 'required diacritics'}"
-    script_mismatch, script_label = tv.unexpected_script_used(translation_text, target_language)
-    if script_mismatch:
-        return f"Unexpected script used; expected {script_label or 'target script'}"
-
-    # Check for sentence overflow/combination (works for ALL languages)
-    if check_sentence_boundaries:
-        boundary_error = tv.validate_batch_sentence_boundaries(
-            original_sentence, translation_text
-        )
-        if boundary_error:
-            return boundary_error
-
-    return None
+    return BatchValidator(target_language).validate(
+        original_sentence,
+        translation_text,
+        check_sentence_boundaries=check_sentence_boundaries,
+    )
 
 
 def validate_batch_transliteration(transliteration_text: str) -> Optional[str]:
@@ -358,6 +378,203 @@ def validate_batch_transliteration(transliteration_text: str) -> Optional[str]:
     return None
 
 
+def _is_transport_error(error: Optional[str]) -> bool:
+    """Return True when a batch request failed before the model answered.
+
+    Timeouts are not counted: a smaller batch may well finish in time.
+    """
+    if not error or error.startswith(_CONTENT_ERROR_PREFIXES):
+        return False
+    lowered = error.lower()
+    return "timeout" not in lowered and "timed out" not in lowered
+
+
+def _run_llm_batch(
+    batch_items: Sequence[Tuple[int, str]],
+    *,
+    operation: str,
+    system_prompt: str,
+    resolved_client: LLMClient,
+    progress_tracker: Optional["ProgressTracker"],
+    timeout_seconds: float,
+    parse_payload: Callable[[Any, Sequence[int]], Dict[int, _T]],
+    validate_item: Callable[[str, _T], Optional[str]],
+    write_artifact: Callable[..., None],
+    sizer_key: BatchSizeKey,
+    batch_size: Optional[int],
+    batch_sizer: Optional[AdaptiveBatchSizer],
+    batch_stats: Optional[BatchStatsRecorder],
+    on_item: Optional[Callable[[int, _T], None]] = None,
+    sentence_numbers: Optional[Mapping[int, int]] = None,
+) -> Tuple[Dict[int, _T], Optional[str]]:
+    """Request ``batch_items`` from the LLM, salvaging partial responses.
+
+    Valid items from a response are kept and only missing or invalid ids are
+    re-requested. A group that fails outright twice is bisected so a single
+    bad sentence cannot sink the whole batch. Items that are still invalid
+    when the request budget runs out are returned as-is for the caller's
+    per-sentence fallback.
+
+    With ``on_item`` the responses are streamed: each item that carries its
+    id and passes validation is accepted and handed to ``on_item`` as soon
+    as it has been parsed, ahead of the rest of the batch.
+
+    ``sentence_numbers`` maps item ids to sentence numbers so each request's
+    trace span lists the sentences it carried.
+    """
+    stage = "translate" if operation == "translation" else "transliterate"
+    empty_error = f"Empty {operation} payload"
+    invalid_error = f"Invalid {operation} response"
+
+    group_size = len(batch_items)
+    if batch_sizer is not None:
+        group_size = batch_sizer.batch_size_for(sizer_key, batch_size or len(batch_items))
+    queue: Deque[Tuple[List[Tuple[int, str]], int]] = deque(
+        (chunk, 0) for chunk in chunk_batch_items(batch_items, batch_size=group_size)
+    )
+    single_item_attempts = (
+        _TRANSLATION_RESPONSE_ATTEMPTS if len(batch_items) == 1 else _ISOLATED_ITEM_ATTEMPTS
+    )
+    max_requests = _TRANSLATION_RESPONSE_ATTEMPTS + 3 * len(batch_items).bit_length()
+
+    accepted: Dict[int, _T] = {}
+    candidates: Dict[int, _T] = {}
+    last_error: Optional[str] = None
+    requests = 0
+    salvaged = 0
+    bisections = 0
+    streamed = 0
+    first_item_seconds: Optional[float] = None
+
+    while queue and requests < max_requests:
+        group, failures = queue.popleft()
+        if failures:
+            time.sleep(_TRANSLATION_RETRY_DELAY_SECONDS)
+        requests += 1
+        request_items = [{"id": item_id, "text": text} for item_id, text in group]
+        stream_kwargs: Dict[str, Any] = {}
+        if on_item is not None:
+            group_texts = dict(group)
+
+            def _accept_streamed(raw_item: Mapping[str, Any]) -> None:
+                nonlocal streamed
+                # Without an explicit id the item can only be placed positionally,
+                # which waits for the full response.
+                for item_id, value in parse_payload({"items": [raw_item]}, ()).items():
+                    text = group_texts.get(item_id)
+                    if text is None or item_id in accepted or validate_item(text, value):
+                        continue
+                    accepted[item_id] = value
+                    candidates.pop(item_id, None)
+                    streamed += 1
+                    on_item(item_id, value)
+
+            stream_kwargs["on_item"] = _accept_streamed
+        response = llm_batch.request_json_batch(
+            client=resolved_client,
+            system_prompt=system_prompt,
+            items=request_items,
+            timeout_seconds=timeout_seconds,
+            max_attempts=_LLM_REQUEST_ATTEMPTS,
+            validator=_payload_has_items,
+            **stream_kwargs,
+        )
+        if first_item_seconds is None and response.first_item_elapsed is not None:
+            first_item_seconds = response.first_item_elapsed
+        pipeline_trace.record_llm_usage(
+            progress_tracker,
+            stage,
+            response.token_usage,
+            elapsed=response.elapsed,
+            sentence_numbers=[
+                sentence_numbers[item_id]
+                for item_id, _text in group
+                if sentence_numbers and item_id in sentence_numbers
+            ],
+            attributes={"batch_size": len(request_items), "attempt": requests},
+        )
+        write_artifact(request_items=request_items, response=response, attempt=requests)
+
+        group_ids = [item_id for item_id, _text in group]
+        parsed: Dict[int, _T] = {}
+        if response.payload is not None:
+            parsed = parse_payload(response.payload, group_ids)
+            last_error = None if parsed else empty_error
+        else:
+            last_error = response.error or invalid_error
+
+        leftover: List[Tuple[int, str]] = []
+        for item_id, text in group:
+            if item_id in accepted:
+                continue
+            value = parsed.get(item_id)
+            if value is None:
+                leftover.append((item_id, text))
+                continue
+            item_error = validate_item(text, value)
+            if item_error:
+                candidates[item_id] = value
+                leftover.append((item_id, text))
+                last_error = item_error
+                continue
+            accepted[item_id] = value
+            candidates.pop(item_id, None)
+
+        if batch_sizer is not None:
+            batch_sizer.observe(
+                sizer_key,
+                item_count=len(group),
+                failed_items=len(leftover),
+                elapsed_seconds=response.elapsed,
+                completion_tokens=completion_token_count(response.token_usage),
+                timeout_seconds=timeout_seconds,
+            )
+        if not leftover:
+            continue
+        if progress_tracker is not None and last_error:
+            progress_tracker.record_retry(operation, last_error)
+
+        if len(leftover) < len(group):
+            # Partial response: keep the good items, re-request the rest.
+            salvaged += len(group) - len(leftover)
+            queue.appendleft((leftover, 0))
+            continue
+
+        failures += 1
+        if response.payload is None and _is_transport_error(response.error):
+            if failures < _TRANSLATION_RESPONSE_ATTEMPTS:
+                queue.appendleft((group, failures))
+            continue
+        if len(group) > 1 and failures >= _BISECT_AFTER_FAILURES:
+            middle = len(group) // 2
+            queue.appendleft((group[middle:], 0))
+            queue.appendleft((group[:middle], 0))
+            bisections += 1
+        elif len(group) > 1 or failures < single_item_attempts:
+            queue.appendleft((group, failures))
+
+    if batch_stats is not None:
+        batch_stats.record_adaptation(
+            f"{sizer_key[2]}->{sizer_key[3]}",
+            group_size,
+            requests=requests,
+            salvaged_items=salvaged,
+            bisections=bisections,
+        )
+        if on_item is not None:
+            batch_stats.record_streaming(
+                streamed_items=streamed,
+                first_item_seconds=first_item_seconds,
+            )
+    results: Dict[int, _T] = {**candidates, **accepted}
+    return results, None if results else last_error
+
+
+def _payload_has_items(payload: Any) -> bool:
+    items = extract_batch_items(payload)
+    return bool(items)
+
+
 def translate_llm_batch_items(
     batch_items: Sequence[Tuple[int, str]],
     input_language: str,
@@ -368,6 +585,11 @@ def translate_llm_batch_items(
     progress_tracker: Optional["ProgressTracker"],
     timeout_seconds: float,
     batch_log_dir: Optional[Path] = None,
+    batch_size: Optional[int] = None,
+    batch_sizer: Optional[AdaptiveBatchSizer] = None,
+    batch_stats: Optional[BatchStatsRecorder] = None,
+    on_item: Optional[Callable[[int, Tuple[str, str]], None]] = None,
+    sentence_numbers: Optional[Mapping[int, int]] = None,
 ) -> Tuple[Dict[int, Tuple[str, str]], Optional[str], float]:
     """Translate a batch of items using the LLM.
 
@@ -380,6 +602,13 @@ def translate_llm_batch_items(
         progress_tracker: Optional progress tracker
         timeout_seconds: Request timeout
         batch_log_dir: Optional directory for batch logging
+        batch_size: Configured batch size, the ceiling for adaptive sizing
+        batch_sizer: Optional adaptive sizer; splits the batch into tuned groups
+        batch_stats: Optional recorder for the chosen size and retry work
+        on_item: Optional callback that streams the response and receives
+            each validated (item_id, (translation, transliteration)) as soon
+            as it is parsed; streamed items are also part of the results
+        sentence_numbers: Optional item_id -> sentence number map for trace spans
 
     Returns:
         Tuple of (results_dict, error, elapsed_seconds)
@@ -390,33 +619,23 @@ def translate_llm_batch_items(
         target_language,
         include_transliteration=include_transliteration,
     )
-    request_items = [
-        {"id": item_id, "text": sentence} for item_id, sentence in batch_items
-    ]
-    user_payload = llm_batch.build_json_batch_payload(request_items)
-    request_payload = prompt_templates.make_sentence_payload(
-        user_payload,
-        model=resolved_client.model,
-        stream=False,
-        system_prompt=system_prompt,
-    )
-    input_ids = [item_id for item_id, _sentence in batch_items]
-
-    def _payload_has_items(payload: Any) -> bool:
-        items = extract_batch_items(payload)
-        return bool(items)
 
-    start_time = time.perf_counter()
-    last_error: Optional[str] = None
-    for attempt in range(1, _TRANSLATION_RESPONSE_ATTEMPTS + 1):
-        response = llm_batch.request_json_batch(
-            client=resolved_client,
-            system_prompt=system_prompt,
-            items=request_items,
-            timeout_seconds=timeout_seconds,
-            max_attempts=_LLM_REQUEST_ATTEMPTS,
-            validator=_payload_has_items,
+    def _parse(payload: Any, input_ids: Sequence[int]) -> Dict[int, Tuple[str, str]]:
+        return parse_batch_translation_payload(
+            payload,
+            input_ids=input_ids,
+            include_transliteration=include_transliteration,
+            target_language=target_language,
+            align_tokens=True,
         )
+
+    validator = BatchValidator(target_language)
+
+    def _validate(sentence: str, value: Tuple[str, str]) -> Optional[str]:
+        return validator.validate(sentence, value[0])
+
+    def _write_artifact(*, request_items, response, attempt: int) -> None:
+        user_payload = llm_batch.build_json_batch_payload(request_items)
         write_llm_batch_artifact(
             log_dir=batch_log_dir,
             request_items=request_items,
@@ -425,7 +644,12 @@ def translate_llm_batch_items(
             include_transliteration=include_transliteration,
             system_prompt=system_prompt,
             user_payload=user_payload,
-            request_payload=request_payload,
+            request_payload=prompt_templates.make_sentence_payload(
+                user_payload,
+                model=resolved_client.model,
+                stream=on_item is not None,
+                system_prompt=system_prompt,
+            ),
             response_payload=response.payload,
             response_raw_text=response.raw_text,
             response_error=response.error,
@@ -434,26 +658,26 @@ def translate_llm_batch_items(
             timeout_seconds=timeout_seconds,
             client=resolved_client,
         )
-        if response.payload is not None:
-            parsed = parse_batch_translation_payload(
-                response.payload,
-                input_ids=input_ids,
-                include_transliteration=include_transliteration,
-                target_language=target_language,
-                align_tokens=True,
-            )
-            if parsed:
-                elapsed = time.perf_counter() - start_time
-                return parsed, None, elapsed
-            last_error = "Empty translation payload"
-        else:
-            last_error = response.error or "Invalid translation response"
-        if progress_tracker is not None and last_error:
-            progress_tracker.record_retry("translation", last_error)
-        if attempt < _TRANSLATION_RESPONSE_ATTEMPTS:
-            time.sleep(_TRANSLATION_RETRY_DELAY_SECONDS)
-    elapsed = time.perf_counter() - start_time
-    return {}, last_error, elapsed
+
+    start_time = time.perf_counter()
+    results, error = _run_llm_batch(
+        batch_items,
+        operation="translation",
+        system_prompt=system_prompt,
+        resolved_client=resolved_client,
+        progress_tracker=progress_tracker,
+        timeout_seconds=timeout_seconds,
+        parse_payload=_parse,
+        validate_item=_validate,
+        write_artifact=_write_artifact,
+        sizer_key=make_batch_size_key(resolved_client, input_language, target_language),
+        batch_size=batch_size,
+        batch_sizer=batch_sizer,
+        batch_stats=batch_stats,
+        on_item=on_item,
+        sentence_numbers=sentence_numbers,
+    )
+    return results, error, time.perf_counter() - start_time
 
 
 def transliterate_llm_batch_items(
@@ -464,6 +688,10 @@ def transliterate_llm_batch_items(
     progress_tracker: Optional["ProgressTracker"],
     timeout_seconds: float,
     batch_log_dir: Optional[Path] = None,
+    batch_size: Optional[int] = None,
+    batch_sizer: Optional[AdaptiveBatchSizer] = None,
+    batch_stats: Optional[BatchStatsRecorder] = None,
+    sentence_numbers: Optional[Mapping[int, int]] = None,
 ) -> Tuple[Dict[int, str], Optional[str], float]:
     """Transliterate a batch of items using the LLM.
 
@@ -474,39 +702,25 @@ def transliterate_llm_batch_items(
         progress_tracker: Optional progress tracker
         timeout_seconds: Request timeout
         batch_log_dir: Optional directory for batch logging
+        batch_size: Configured batch size, the ceiling for adaptive sizing
+        batch_sizer: Optional adaptive sizer; splits the batch into tuned groups
+        batch_stats: Optional recorder for the chosen size and retry work
+        sentence_numbers: Optional item_id -> sentence number map for trace spans
 
     Returns:
         Tuple of (results_dict, error, elapsed_seconds)
         results_dict maps item_id -> transliteration
     """
     system_prompt = prompt_templates.make_transliteration_batch_prompt(target_language)
-    request_items = [
-        {"id": item_id, "text": sentence} for item_id, sentence in batch_items
-    ]
-    user_payload = llm_batch.build_json_batch_payload(request_items)
-    request_payload = prompt_templates.make_sentence_payload(
-        user_payload,
-        model=resolved_client.model,
-        stream=False,
-        system_prompt=system_prompt,
-    )
-    input_ids = [item_id for item_id, _sentence in batch_items]
 
-    def _payload_has_items(payload: Any) -> bool:
-        items = extract_batch_items(payload)
-        return bool(items)
+    def _parse(payload: Any, input_ids: Sequence[int]) -> Dict[int, str]:
+        return parse_batch_transliteration_payload(payload, input_ids=input_ids)
 
-    start_time = time.perf_counter()
-    last_error: Optional[str] = None
-    for attempt in range(1, _TRANSLATION_RESPONSE_ATTEMPTS + 1):
-        response = llm_batch.request_json_batch(
-            client=resolved_client,
-            system_prompt=system_prompt,
-            items=request_items,
-            timeout_seconds=timeout_seconds,
-            max_attempts=_LLM_REQUEST_ATTEMPTS,
-            validator=_payload_has_items,
-        )
+    def _validate(_text: str, value: str) -> Optional[str]:
+        return validate_batch_transliteration(text_norm.collapse_whitespace(value.strip()))
+
+    def _write_artifact(*, request_items, response, attempt: int) -> None:
+        user_payload = llm_batch.build_json_batch_payload(request_items)
         write_llm_batch_artifact(
             operation="transliteration",
             log_dir=batch_log_dir,
@@ -516,7 +730,12 @@ def transliterate_llm_batch_items(
             include_transliteration=True,
             system_prompt=system_prompt,
             user_payload=user_payload,
-            request_payload=request_payload,
+            request_payload=prompt_templates.make_sentence_payload(
+                user_payload,
+                model=resolved_client.model,
+                stream=False,
+                system_prompt=system_prompt,
+            ),
             response_payload=response.payload,
             response_raw_text=response.raw_text,
             response_error=response.error,
@@ -525,23 +744,25 @@ def transliterate_llm_batch_items(
             timeout_seconds=timeout_seconds,
             client=resolved_client,
         )
-        if response.payload is not None:
-            parsed = parse_batch_transliteration_payload(
-                response.payload,
-                input_ids=input_ids,
-            )
-            if parsed:
-                elapsed = time.perf_counter() - start_time
-                return parsed, None, elapsed
-            last_error = "Empty transliteration payload"
-        else:
-            last_error = response.error or "Invalid transliteration response"
-        if progress_tracker is not None and last_error:
-            progress_tracker.record_retry("transliteration", last_error)
-        if attempt < _TRANSLATION_RESPONSE_ATTEMPTS:
-            time.sleep(_TRANSLATION_RETRY_DELAY_SECONDS)
-    elapsed = time.perf_counter() - start_time
-    return {}, last_error, elapsed
+
+    start_time = time.perf_counter()
+    results, error = _run_llm_batch(
+        batch_items,
+        operation="transliteration",
+        system_prompt=system_prompt,
+        resolved_client=resolved_client,
+        progress_tracker=progress_tracker,
+        timeout_seconds=timeout_seconds,
+        parse_payload=_parse,
+        validate_item=_validate,
+        write_artifact=_write_artifact,
+        sizer_key=make_batch_size_key(resolved_client, target_language, "latin"),
+        batch_size=batch_size,
+        batch_sizer=batch_sizer,
+        batch_stats=batch_stats,
+        sentence_numbers=sentence_numbers,
+    )
+    return results, error, time.perf_counter() - start_time
 
 
 def resolve_batch_transliterations(
@@ -556,6 +777,7 @@ def resolve_batch_transliterations(
     batch_size: Optional[int],
     batch_log_dir: Optional[Path],
     batch_stats: Optional[BatchStatsRecorder],
+    sentence_numbers: Optional[Mapping[int, int]] = None,
 ) -> Dict[int, str]:
     """Resolve transliterations for a batch of items.
 
@@ -573,6 +795,7 @@ def resolve_batch_transliterations(
         batch_size: Maximum batch size for LLM requests
         batch_log_dir: Optional directory for batch logging
         batch_stats: Optional batch statistics recorder
+        sentence_numbers: Optional item_id -> sentence number map for trace spans
 
     Returns:
         Dict mapping item_id -> transliteration
@@ -637,6 +860,10 @@ def resolve_batch_transliterations(
                 progress_tracker=progress_tracker,
                 timeout_seconds=cfg.get_translation_llm_timeout_seconds(),
                 batch_log_dir=batch_log_dir,
+                batch_size=batch_size,
+                batch_sizer=get_batch_sizer(),
+                batch_stats=batch_stats,
+                sentence_numbers=sentence_numbers,
             )
             if batch_stats is not None:
                 batch_stats.record(_elapsed, len(chunk))
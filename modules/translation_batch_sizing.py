@@ -0,0 +1,229 @@
+"""Adaptive LLM batch sizing for translation and transliteration batches.
+
+Batch sizes are tuned per (provider, model, input language, target language)
+from what each batch request actually cost: latency relative to the request
+timeout, completion tokens per item and the share of items that came back
+missing or invalid. Sizes shrink multiplicatively when batches time out or
+lose items and grow by one item at a time while batches stay clean, never
+exceeding the configured batch size.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from modules import logging_manager as log_mgr
+
+logger = log_mgr.logger
+
+BatchSizeKey = Tuple[str, str, str, str]
+
+_MAX_OUTPUT_TOKENS_ENV = "EBOOK_LLM_BATCH_MAX_OUTPUT_TOKENS"
+_DEFAULT_MAX_OUTPUT_TOKENS = 4096
+# Share of the timeout / output budget a batch may use before growth stops.
+_GROWTH_LATENCY_RATIO = 0.5
+_GROWTH_TOKEN_RATIO = 0.75
+# Share of the timeout after which a batch counts as too slow.
+_SLOW_LATENCY_RATIO = 0.8
+_FAILURE_RATE_THRESHOLD = 0.25
+_EWMA_ALPHA = 0.3
+
+
+def _resolve_max_output_tokens() -> int:
+    raw = os.environ.get(_MAX_OUTPUT_TOKENS_ENV)
+    if not raw:
+        return _DEFAULT_MAX_OUTPUT_TOKENS
+    try:
+        value = int(raw)
+    except ValueError:
+        return _DEFAULT_MAX_OUTPUT_TOKENS
+    return value if value > 0 else _DEFAULT_MAX_OUTPUT_TOKENS
+
+
+def completion_token_count(usage: Optional[Mapping[str, Any]]) -> int:
+    """Return completion tokens from an Ollama- or OpenAI-style usage mapping."""
+
+    if not usage:
+        return 0
+    for key in ("eval_count", "completion_tokens"):
+        value = usage.get(key)
+        if isinstance(value, (int, float)) and value > 0:
+            return int(value)
+    return 0
+
+
+def make_batch_size_key(
+    client: Any,
+    input_language: str,
+    target_language: str,
+) -> BatchSizeKey:
+    """Return the tuning key for ``client`` translating between two languages."""
+
+    provider = getattr(client, "llm_source", None)
+    model = getattr(client, "model", None)
+    return (
+        str(provider or "unknown"),
+        str(model or "unknown"),
+        (input_language or "").strip().lower(),
+        (target_language or "").strip().lower(),
+    )
+
+
+@dataclass(slots=True)
+class _BatchSizeState:
+    size: int
+    ceiling: int
+    seconds_per_item: Optional[float] = None
+    tokens_per_item: Optional[float] = None
+    failure_rate: float = 0.0
+    observations: int = 0
+
+
+class AdaptiveBatchSizer:
+    """Thread-safe per-key batch size tuner (additive increase, multiplicative decrease)."""
+
+    def __init__(
+        self,
+        *,
+        min_size: int = 1,
+        max_output_tokens: Optional[int] = None,
+    ) -> None:
+        self._min_size = max(1, int(min_size))
+        self._max_output_tokens = max_output_tokens or _resolve_max_output_tokens()
+        self._states: Dict[BatchSizeKey, _BatchSizeState] = {}
+        self._lock = threading.Lock()
+
+    def batch_size_for(self, key: BatchSizeKey, configured: int) -> int:
+        """Return the current batch size for ``key``, capped at ``configured``."""
+
+        configured = max(self._min_size, int(configured))
+        with self._lock:
+            state = self._states.get(key)
+            if state is None:
+                state = _BatchSizeState(size=configured, ceiling=configured)
+                self._states[key] = state
+            elif state.ceiling != configured:
+                state.ceiling = configured
+                state.size = min(max(state.size, self._min_size), configured)
+            return state.size
+
+    def observe(
+        self,
+        key: BatchSizeKey,
+        *,
+        item_count: int,
+        failed_items: int,
+        elapsed_seconds: float,
+        completion_tokens: int = 0,
+        timeout_seconds: Optional[float] = None,
+    ) -> int:
+        """Record one batch request and return the updated size for ``key``."""
+
+        if item_count <= 0:
+            return self.batch_size_for(key, self._min_size)
+        failed_items = min(max(0, int(failed_items)), item_count)
+        failure_rate = failed_items / float(item_count)
+        seconds_per_item = max(0.0, float(elapsed_seconds)) / item_count
+        succeeded = item_count - failed_items
+        tokens_per_item = completion_tokens / float(succeeded) if completion_tokens and succeeded else None
+
+        with self._lock:
+            state = self._states.get(key)
+            if state is None:
+                state = _BatchSizeState(size=item_count, ceiling=max(item_count, self._min_size))
+                self._states[key] = state
+            state.observations += 1
+            state.failure_rate = _ewma(state.failure_rate, failure_rate)
+            state.seconds_per_item = _ewma(state.seconds_per_item, seconds_per_item)
+            if tokens_per_item is not None:
+                state.tokens_per_item = _ewma(state.tokens_per_item, tokens_per_item)
+
+            previous = state.size
+            too_slow = bool(timeout_seconds) and elapsed_seconds >= _SLOW_LATENCY_RATIO * float(timeout_seconds)
+            if failure_rate > _FAILURE_RATE_THRESHOLD or too_slow:
+                # Only shrink for batches at least as large as the current size;
+                # small bisected retries say little about the full batch.
+                if item_count >= state.size:
+                    state.size = max(self._min_size, state.size // 2)
+            elif failed_items == 0 and item_count >= state.size and self._has_headroom(state, timeout_seconds):
+                state.size = min(state.ceiling, state.size + 1)
+            if state.size != previous:
+                logger.debug(
+                    "Adjusted LLM batch size for %s from %d to %d "
+                    "(failure_rate=%.2f, seconds_per_item=%.2f, tokens_per_item=%s)",
+                    "/".join(key),
+                    previous,
+                    state.size,
+                    state.failure_rate,
+                    state.seconds_per_item or 0.0,
+                    None if state.tokens_per_item is None else round(state.tokens_per_item, 1),
+                )
+            return state.size
+
+    def _has_headroom(self, state: _BatchSizeState, timeout_seconds: Optional[float]) -> bool:
+        next_size = state.size + 1
+        if timeout_seconds and state.seconds_per_item is not None:
+            if state.seconds_per_item * next_size > _GROWTH_LATENCY_RATIO * float(timeout_seconds):
+                return False
+        if state.tokens_per_item is not None:
+            if state.tokens_per_item * next_size > _GROWTH_TOKEN_RATIO * self._max_output_tokens:
+                return False
+        return state.failure_rate <= _FAILURE_RATE_THRESHOLD / 2
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Return the tuned state per key, keyed by ``provider/model/input/target``."""
+
+        with self._lock:
+            return {
+                "/".join(key): {
+                    "batch_size": state.size,
+                    "configured_batch_size": state.ceiling,
+                    "failure_rate": round(state.failure_rate, 3),
+                    "seconds_per_item": None
+                    if state.seconds_per_item is None
+                    else round(state.seconds_per_item, 3),
+                    "tokens_per_item": None
+                    if state.tokens_per_item is None
+                    else round(state.tokens_per_item, 1),
+                    "observations": state.observations,
+                }
+                for key, state in self._states.items()
+            }
+
+    def reset(self) -> None:
+        """Forget all tuned sizes."""
+
+        with self._lock:
+            self._states.clear()
+
+
+def _ewma(previous: Optional[float], value: float) -> float:
+    if previous is None:
+        return value
+    return (1.0 - _EWMA_ALPHA) * previous + _EWMA_ALPHA * value
+
+
+_shared_sizer: Optional[AdaptiveBatchSizer] = None
+_shared_sizer_lock = threading.Lock()
+
+
+def get_batch_sizer() -> AdaptiveBatchSizer:
+    """Return the process-wide batch sizer so tuning carries across jobs."""
+
+    global _shared_sizer
+    with _shared_sizer_lock:
+        if _shared_sizer is None:
+            _shared_sizer = AdaptiveBatchSizer()
+        return _shared_sizer
+
+
+__all__ = [
+    "AdaptiveBatchSizer",
+    "BatchSizeKey",
+    "completion_token_count",
+    "get_batch_sizer",
+    "make_batch_size_key",
+]
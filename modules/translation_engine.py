@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import bisect
 import concurrent.futures
 import json
 from dataclasses import dataclass
@@ -21,16 +22,18 @@ if TYPE_CHECKING:
 from modules import config_manager as cfg
 from modules import fallbacks
 from modules import logging_manager as log_mgr
-from modules import observability, prompt_templates
+from modules import observability, pipeline_trace, prompt_templates
 from modules import llm_batch
 from modules import llm_client_manager
 from modules import language_policies
 from modules import text_normalization as text_norm
 from modules import translation_validation as tv
+from modules.translation_validation_profiles import BatchValidator
 from modules.text import split_highlight_tokens, align_token_counts
 from modules.transliteration_aligned import generate_word_aligned_transliteration
 from modules.retry_annotations import format_retry_failure, is_failure_annotation
 from modules.llm_client import LLMClient
+from modules.render_priority import RenderPriority
 from modules.transliteration import (
     TransliterationService,
     get_transliterator,
@@ -43,6 +46,7 @@ from modules.translation_providers import (
     translate_with_googletrans,
 )
 from modules.translation_workers import AsyncWorkerPool, ThreadWorkerPool
+from modules.translation_batch_sizing import get_batch_sizer
 from modules.translation_logging import (
     BatchStatsRecorder,
     resolve_llm_batch_log_dir,
@@ -109,8 +113,10 @@ def _translate_with_llm(
     best_translation: Optional[str] = None
     best_score = -1
     fatal_violation = False
+    validator = BatchValidator(target_language)
     for attempt in range(1, _TRANSLATION_RESPONSE_ATTEMPTS + 1):
         attempt_error: Optional[str] = None
+        attempt_start = time.perf_counter()
         if request_mode == "completion":
             response = resolved_client.send_completion_request(
                 payload,
@@ -127,6 +133,13 @@ def _translate_with_llm(
                 validator=_valid_translation,
                 backoff_seconds=1.0,
             )
+        pipeline_trace.record_llm_usage(
+            progress_tracker,
+            "translate",
+            response.token_usage,
+            elapsed=time.perf_counter() - attempt_start,
+            attributes={"attempt": attempt},
+        )
 
         if response.text:
             cleaned_text = text_norm.collapse_whitespace(response.text.strip())
@@ -134,13 +147,11 @@ def _translate_with_llm(
                 translation_text, transliteration_text = text_norm.split_translation_and_transliteration(
                     cleaned_text
                 )
-                score = _letter_count(translation_text)
+                score = validator.letter_count(translation_text)
                 if score > best_score:
                     best_translation = cleaned_text
                     best_score = score
-                if _is_probable_transliteration(
-                    sentence, translation_text, target_language
-                ):
+                if validator.is_probable_transliteration(sentence, translation_text):
                     attempt_error = "Transliteration returned instead of translation"
                     if resolved_client.debug_enabled:
                         logger.debug(
@@ -148,7 +159,7 @@ def _translate_with_llm(
                             attempt,
                             _TRANSLATION_RESPONSE_ATTEMPTS,
                         )
-                elif _is_translation_too_short(sentence, translation_text, target_language):
+                elif validator.is_translation_too_short(sentence, translation_text):
                     attempt_error = "Translation shorter than expected"
                     if resolved_client.debug_enabled:
                         logger.debug(
@@ -157,8 +168,8 @@ def _translate_with_llm(
                             _TRANSLATION_RESPONSE_ATTEMPTS,
                         )
                 else:
-                    missing_diacritics, label = _missing_required_diacritics(
-                        translation_text, target_language
+                    missing_diacritics, label = validator.missing_required_diacritics(
+                        translation_text
                     )
                     if missing_diacritics:
                         attempt_error = f"Missing {label or 'required diacritics'}"
@@ -169,8 +180,8 @@ def _translate_with_llm(
                                 _TRANSLATION_RESPONSE_ATTEMPTS,
                             )
                     if not attempt_error:
-                        script_mismatch, script_label = _unexpected_script_used(
-                            translation_text, target_language
+                        script_mismatch, script_label = validator.unexpected_script_used(
+                            translation_text
                         )
                         if script_mismatch:
                             attempt_error = (
@@ -183,13 +194,13 @@ def _translate_with_llm(
                                     attempt,
                                     _TRANSLATION_RESPONSE_ATTEMPTS,
                                 )
-                if not attempt_error and _is_segmentation_ok(
-                    sentence, cleaned_text, target_language, translation_text=translation_text
+                if not attempt_error and validator.is_segmentation_ok(
+                    sentence, cleaned_text, translation_text=translation_text
                 ):
                     # Check token alignment between translation and transliteration
                     if include_transliteration and transliteration_text:
-                        token_alignment_error = tv.get_token_alignment_error(
-                            translation_text, transliteration_text, target_language
+                        token_alignment_error = validator.token_alignment_error(
+                            translation_text, transliteration_text
                         )
                         if token_alignment_error:
                             attempt_error = token_alignment_error
@@ -571,6 +582,10 @@ def translate_batch(
                 include_transliteration_for_target = _should_include_transliteration(
                     include_transliteration_any, target
                 )
+                sentence_numbers = {
+                    idx: sentence_ids[idx] if sentence_ids is not None else idx + 1
+                    for idx, _sentence in items
+                }
                 translation_map, _error, elapsed = translate_llm_batch_items(
                     items,
                     input_language,
@@ -580,6 +595,10 @@ def translate_batch(
                     progress_tracker=progress_tracker,
                     timeout_seconds=cfg.get_translation_llm_timeout_seconds(),
                     batch_log_dir=batch_log_dir,
+                    batch_size=batch_size,
+                    batch_sizer=get_batch_sizer(),
+                    batch_stats=batch_stats,
+                    sentence_numbers=sentence_numbers,
                 )
                 batch_stats.record(elapsed, len(items))
                 per_item_elapsed = (
@@ -590,11 +609,10 @@ def translate_batch(
                     _log_translation_timing(idx, per_item_elapsed, mode_label)
                 resolved_items: Dict[int, Tuple[str, str]] = {}
                 pending_transliteration: List[Tuple[int, str]] = []
+                validator = BatchValidator(target)
                 for idx, sentence in items:
                     translation, transliteration = translation_map.get(idx, ("", ""))
-                    translation_error = validate_batch_translation(
-                        sentence, translation, target
-                    )
+                    translation_error = validator.validate(sentence, translation)
                     if translation_error:
                         if progress_tracker is not None:
                             progress_tracker.record_retry(
@@ -630,17 +648,17 @@ def translate_batch(
 
                 transliteration_map: Dict[int, str] = {}
                 if include_transliteration_for_target and pending_transliteration:
-                    transliteration_map = resolve_batch_transliterations(
+                    transliteration_map = transliterator.transliterate_batch(
                         pending_transliteration,
                         target,
-                        transliterator=transliterator,
-                        transliteration_mode=transliteration_mode,
+                        mode=transliteration_mode,
                         transliteration_client=transliteration_client,
                         local_client=resolved_client,
                         progress_tracker=progress_tracker,
                         batch_size=transliteration_batch_size,
                         batch_log_dir=transliteration_batch_log_dir,
                         batch_stats=transliteration_stats,
+                        sentence_numbers=sentence_numbers,
                     )
 
                 batch_results: List[Tuple[int, str]] = []
@@ -655,10 +673,9 @@ def translate_batch(
                     batch_results.append((idx, combined))
                 if progress_tracker is not None:
                     for idx, _sentence in items:
-                        sentence_number = (
-                            sentence_ids[idx] if sentence_ids is not None else idx + 1
+                        progress_tracker.record_translation_completion(
+                            idx, sentence_numbers[idx]
                         )
-                        progress_tracker.record_translation_completion(idx, sentence_number)
                 return batch_results
 
             try:
@@ -724,7 +741,12 @@ def _enqueue_with_backpressure(
     task: Optional[TranslationTask],
     *,
     stop_event: Optional[threading.Event],
+    progress_tracker: Optional["ProgressTracker"] = None,
 ) -> bool:
+    if task is not None:
+        pipeline_trace.mark_enqueued(
+            progress_tracker, "translation", task.sentence_number
+        )
     while True:
         if stop_event and stop_event.is_set():
             return False
@@ -735,6 +757,52 @@ def _enqueue_with_backpressure(
             continue
 
 
+def _iter_prioritized(
+    pool: ThreadWorkerPool,
+    units: Sequence[Tuple[int, Any, Tuple[Any, ...]]],
+    futures_map: Dict[Any, Any],
+    render_priority: RenderPriority,
+    *,
+    func,
+    window: int,
+    stop_event: Optional[threading.Event],
+) -> Iterator["Future"]:
+    """Submit ``units`` nearest the playhead first and yield them as they finish.
+
+    ``units`` are ``(sentence_number, key, args)`` tuples; at most ``window``
+    run at once so a new playhead takes effect within one window of work.
+    Each submitted future is recorded in ``futures_map`` under its key.
+    """
+
+    ordered = sorted(units, key=lambda unit: unit[0])
+    positions = [unit[0] for unit in ordered]
+    in_flight: set = set()
+    while positions or in_flight:
+        while positions and len(in_flight) < window:
+            if stop_event and stop_event.is_set():
+                break
+            candidates = [0]
+            focus = render_priority.focus
+            if focus is not None:
+                ahead = bisect.bisect_left(positions, focus)
+                if 0 < ahead < len(positions):
+                    candidates.append(ahead)
+            chosen = candidates[render_priority.select([positions[c] for c in candidates])]
+            positions.pop(chosen)
+            _position, key, args = ordered.pop(chosen)
+            future = pool.submit(func, *args)
+            futures_map[future] = key
+            in_flight.add(future)
+        if not in_flight:
+            return
+        done, _pending = concurrent.futures.wait(
+            in_flight, return_when=concurrent.futures.FIRST_COMPLETED
+        )
+        for future in done:
+            in_flight.discard(future)
+            yield future
+
+
 def _log_translation_timing(sentence_number: int, elapsed: float, mode: str) -> None:
     observability.record_metric(
         "translation.duration_seconds",
@@ -767,8 +835,13 @@ def start_translation_pipeline(
     transliteration_client: Optional[LLMClient] = None,
     include_transliteration: bool = False,
     llm_batch_size: Optional[int] = None,
+    render_priority: Optional[RenderPriority] = None,
 ) -> threading.Thread:
-    """Spawn a background producer thread that streams translations into ``output_queue``."""
+    """Spawn a background producer thread that streams translations into ``output_queue``.
+
+    With ``render_priority`` work is submitted lazily, nearest the reported
+    playhead first, instead of all at once in sentence order.
+    """
 
     worker_count = max_workers or cfg.get_thread_count()
     worker_count = max(1, min(worker_count, len(sentences) or 1))
@@ -801,6 +874,7 @@ def start_translation_pipeline(
                 )
             batch_size = None
         batch_log_dir = resolve_llm_batch_log_dir() if batch_size else None
+        stream_batches = bool(batch_size) and cfg.get_translation_llm_batch_streaming()
         transliteration_batch_size = (
             normalize_llm_batch_size(llm_batch_size) if include_transliteration_any else None
         )
@@ -869,17 +943,31 @@ def start_translation_pipeline(
                         transliteration_text = inline_transliteration.strip()
                         transliteration_source = translation_only or translation
                         if transliteration_source and not transliteration_text:
-                            transliteration_result = transliterator.transliterate(
-                                transliteration_source,
-                                target,
-                                client=transliteration_client or local_client,
-                                progress_tracker=progress_tracker,
-                                mode=transliteration_mode,
-                            )
+                            with pipeline_trace.trace_span(
+                                progress_tracker,
+                                "transliterate",
+                                sentence_number=start_sentence + index,
+                            ):
+                                transliteration_result = transliterator.transliterate(
+                                    transliteration_source,
+                                    target,
+                                    client=transliteration_client or local_client,
+                                    progress_tracker=progress_tracker,
+                                    mode=transliteration_mode,
+                                )
                             transliteration_text = transliteration_result.text.strip()
                 finally:
-                    elapsed = time.perf_counter() - start_time
+                    end_time = time.perf_counter()
+                    elapsed = end_time - start_time
                     _log_translation_timing(start_sentence + index, elapsed, pool_mode)
+                    pipeline_trace.record_span(
+                        progress_tracker,
+                        "translate",
+                        start_time,
+                        end_time,
+                        sentence_number=start_sentence + index,
+                        attributes={"mode": pool_mode},
+                    )
                 # Prefer deterministic per-word transliteration when available
                 # (currently Chinese via pypinyin); eliminates LLM alignment drift.
                 if translation and transliteration_text:
@@ -903,12 +991,92 @@ def start_translation_pipeline(
                     transliteration=transliteration_text,
                 )
 
+            # Indices already handed to the media queue by streamed batches.
+            streamed_indices: set[int] = set()
+
+            def _build_batch_task(
+                idx: int,
+                sentence: str,
+                target: str,
+                translation: str,
+                transliteration: str,
+            ) -> TranslationTask:
+                if translation and transliteration:
+                    deterministic = generate_word_aligned_transliteration(
+                        translation, target
+                    )
+                    if deterministic:
+                        transliteration = deterministic
+                # Apply token alignment for CJK languages (no-op if already aligned)
+                if translation and transliteration:
+                    _, aligned_translit, _ = align_token_counts(
+                        translation, transliteration, target
+                    )
+                    transliteration = aligned_translit
+                return TranslationTask(
+                    index=idx,
+                    sentence_number=start_sentence + idx,
+                    sentence=sentence,
+                    target_language=target,
+                    translation=translation,
+                    transliteration=transliteration,
+                )
+
             def _translate_batch(
                 target: str, items: Sequence[Tuple[int, str]]
             ) -> List[TranslationTask]:
                 include_transliteration_for_target = _should_include_transliteration(
                     include_transliteration_any, target
                 )
+                batch_start = time.perf_counter()
+                sentences_by_index = dict(items)
+                sentence_numbers = {idx: start_sentence + idx for idx, _sentence in items}
+                # Sentence index -> time it was handed to the media queue
+                # while the rest of its batch was still streaming.
+                streamed_at: Dict[int, float] = {}
+                # Streamed sentences each get the slice since the previous
+                # emission and the rest of the batch one span, so the batch
+                # window is counted once in the translate stage.
+                span_start = [batch_start]
+
+                def _on_streamed_item(idx: int, value: Tuple[str, str]) -> None:
+                    translation, transliteration = value
+                    sentence = sentences_by_index.get(idx)
+                    if sentence is None or not translation:
+                        return
+                    if include_transliteration_for_target and not transliteration:
+                        # Needs the batch transliteration pass; sent with the batch.
+                        return
+                    task = _build_batch_task(
+                        idx, sentence, target, translation, transliteration
+                    )
+                    emitted_at = time.perf_counter()
+                    pipeline_trace.record_span(
+                        progress_tracker,
+                        "translate",
+                        span_start[0],
+                        emitted_at,
+                        sentence_number=task.sentence_number,
+                        attributes={
+                            "mode": "batch",
+                            "batch_size": len(items),
+                            "streamed": True,
+                        },
+                    )
+                    if progress_tracker:
+                        progress_tracker.record_translation_completion(
+                            task.index, task.sentence_number
+                        )
+                    if _enqueue_with_backpressure(
+                        output_queue,
+                        task,
+                        stop_event=stop_event,
+                        progress_tracker=progress_tracker,
+                    ):
+                        streamed_at[idx] = emitted_at
+                        streamed_indices.add(idx)
+                    span_start[0] = emitted_at
+
                 translation_map, _error, elapsed = translate_llm_batch_items(
                     items,
                     input_language,
@@ -918,6 +1086,28 @@ def start_translation_pipeline(
                     progress_tracker=progress_tracker,
                     timeout_seconds=cfg.get_translation_llm_timeout_seconds(),
                     batch_log_dir=batch_log_dir,
+                    batch_size=batch_size,
+                    batch_sizer=get_batch_sizer(),
+                    batch_stats=batch_stats,
+                    on_item=_on_streamed_item if stream_batches else None,
+                    sentence_numbers=sentence_numbers,
+                )
+                batch_end = time.perf_counter()
+                if streamed_at and batch_stats is not None:
+                    batch_stats.record_streaming(
+                        overlap_seconds=sum(
+                            batch_end - emitted_at for emitted_at in streamed_at.values()
+                        )
+                    )
+                pipeline_trace.record_batch_span(
+                    progress_tracker,
+                    "translate",
+                    span_start[0],
+                    batch_end,
+                    sentence_numbers=[
+                        sentence_numbers[idx] for idx, _sentence in items if idx not in streamed_at
+                    ],
+                    attributes={"mode": "batch", "batch_size": len(items)},
                 )
                 if batch_stats is not None:
                     batch_stats.record(elapsed, len(items))
@@ -927,14 +1117,15 @@ def start_translation_pipeline(
                 mode_label = f"{pool_mode}-batch"
                 resolved_items: Dict[int, Tuple[str, str]] = {}
                 pending_transliteration: List[Tuple[int, str]] = []
+                validator = BatchValidator(target)
                 for idx, sentence in items:
                     _log_translation_timing(
                         start_sentence + idx, per_item_elapsed, mode_label
                     )
+                    if idx in streamed_at:
+                        continue
                     translation, transliteration = translation_map.get(idx, ("", ""))
-                    translation_error = validate_batch_translation(
-                        sentence, translation, target
-                    )
+                    translation_error = validator.validate(sentence, translation)
                     if translation_error:
                         if progress_tracker is not None:
                             progress_tracker.record_retry(
@@ -970,44 +1161,40 @@ def start_translation_pipeline(
 
                 transliteration_map: Dict[int, str] = {}
                 if include_transliteration_for_target and pending_transliteration:
-                    transliteration_map = resolve_batch_transliterations(
+                    transliteration_start = time.perf_counter()
+                    transliteration_map = transliterator.transliterate_batch(
                         pending_transliteration,
                         target,
-                        transliterator=transliterator,
-                        transliteration_mode=transliteration_mode,
+                        mode=transliteration_mode,
                         transliteration_client=transliteration_client,
                         local_client=local_client,
                         progress_tracker=progress_tracker,
                         batch_size=transliteration_batch_size,
                         batch_log_dir=transliteration_batch_log_dir,
                         batch_stats=transliteration_stats,
+                        sentence_numbers=sentence_numbers,
+                    )
+                    pipeline_trace.record_batch_span(
+                        progress_tracker,
+                        "transliterate",
+                        transliteration_start,
+                        time.perf_counter(),
+                        sentence_numbers=[
+                            sentence_numbers[idx] for idx, _translation in pending_transliteration
+                        ],
+                        attributes={"batch_size": len(pending_transliteration)},
                     )
 
                 tasks: List[TranslationTask] = []
                 for idx, sentence in items:
+                    if idx in streamed_at:
+                        continue
                     translation, transliteration = resolved_items.get(idx, ("", ""))
                     if include_transliteration_for_target and not transliteration:
                         transliteration = transliteration_map.get(idx, "")
-                    if translation and transliteration:
-                        deterministic = generate_word_aligned_transliteration(
-                            translation, target
-                        )
-                        if deterministic:
-                            transliteration = deterministic
-                    # Apply token alignment for CJK languages (no-op if already aligned)
-                    if translation and transliteration:
-                        _, aligned_translit, _ = align_token_counts(
-                            translation, transliteration, target
-                        )
-                        transliteration = aligned_translit
                     tasks.append(
-                        TranslationTask(
-                            index=idx,
-                            sentence_number=start_sentence + idx,
-                            sentence=sentence,
-                            target_language=target,
-                            translation=translation,
-                            transliteration=transliteration,
+                        _build_batch_task(
+                            idx, sentence, target, translation, transliteration
                         )
                     )
                 return tasks
@@ -1017,12 +1204,29 @@ def start_translation_pipeline(
                     raise RuntimeError(
                         "start_translation_pipeline requires a threaded worker pool in synchronous mode"
                     )
+                dispatch_window = 2 * max(1, getattr(pool, "max_workers", worker_count))
                 if batch_size:
-                    futures_map = {
-                        pool.submit(_translate_batch, target, items): (target, items)
-                        for target, items in batches
-                    }
-                    for future in pool.iter_completed(futures_map):
+                    if render_priority is not None:
+                        futures_map = {}
+                        completed = _iter_prioritized(
+                            pool,
+                            [
+                                (start_sentence + min(idx for idx, _ in items), (target, items), (target, items))
+                                for target, items in batches
+                            ],
+                            futures_map,
+                            render_priority,
+                            func=_translate_batch,
+                            window=dispatch_window,
+                            stop_event=stop_event,
+                        )
+                    else:
+                        futures_map = {
+                            pool.submit(_translate_batch, target, items): (target, items)
+                            for target, items in batches
+                        }
+                        completed = pool.iter_completed(futures_map)
+                    for future in completed:
                         if stop_event and stop_event.is_set():
                             break
                         target, items = futures_map[future]
@@ -1036,6 +1240,8 @@ def start_translation_pipeline(
                             )
                             tasks = []
                             for idx, sentence in items:
+                                if idx in streamed_indices:
+                                    continue
                                 fallback = translate_sentence_simple(
                                     sentence,
                                     input_language,
@@ -1082,18 +1288,37 @@ def start_translation_pipeline(
                                     task.index, task.sentence_number
                                 )
                             if not _enqueue_with_backpressure(
-                                output_queue, task, stop_event=stop_event
+                                output_queue,
+                                task,
+                                stop_event=stop_event,
+                                progress_tracker=progress_tracker,
                             ):
                                 break
                     else:
                         # Only executed if loop did not break
                         pass
                 else:
-                    futures_map = {
-                        pool.submit(_translate, idx, sentence, target): idx
-                        for idx, (sentence, target) in enumerate(zip(sentences, target_language))
-                    }
-                    for future in pool.iter_completed(futures_map):
+                    if render_priority is not None:
+                        futures_map = {}
+                        completed = _iter_prioritized(
+                            pool,
+                            [
+                                (start_sentence + idx, idx, (idx, sentence, target))
+                                for idx, (sentence, target) in enumerate(zip(sentences, target_language))
+                            ],
+                            futures_map,
+                            render_priority,
+                            func=_translate,
+                            window=dispatch_window,
+                            stop_event=stop_event,
+                        )
+                    else:
+                        futures_map = {
+                            pool.submit(_translate, idx, sentence, target): idx
+                            for idx, (sentence, target) in enumerate(zip(sentences, target_language))
+                        }
+                        completed = pool.iter_completed(futures_map)
+                    for future in completed:
                         if stop_event and stop_event.is_set():
                             break
                         idx = futures_map[future]
@@ -1116,7 +1341,10 @@ def start_translation_pipeline(
                                 task.index, task.sentence_number
                             )
                         if not _enqueue_with_backpressure(
-                            output_queue, task, stop_event=stop_event
+                            output_queue,
+                            task,
+                            stop_event=stop_event,
+                            progress_tracker=progress_tracker,
                         ):
                             break
                     else:
@@ -55,6 +55,14 @@ class BatchStatsRecorder:
         self._total_batch_seconds = 0.0
         self._last_batch_seconds = 0.0
         self._last_batch_items = 0
+        self._tuned_batch_sizes: Dict[str, int] = {}
+        self._batch_requests = 0
+        self._salvaged_items = 0
+        self._bisections = 0
+        self._streamed_items = 0
+        self._first_item_samples = 0
+        self._first_item_seconds_total = 0.0
+        self._stream_overlap_seconds = 0.0
         self._lock = threading.Lock()
 
     def set_total(
@@ -99,6 +107,46 @@ class BatchStatsRecorder:
             payload = self._build_payload_locked()
         self._publish(payload)
 
+    def record_adaptation(
+        self,
+        label: str,
+        batch_size: int,
+        *,
+        requests: int = 0,
+        salvaged_items: int = 0,
+        bisections: int = 0,
+    ) -> None:
+        """Record the adaptive batch size chosen for ``label`` and retry work done."""
+        with self._lock:
+            self._tuned_batch_sizes[label or "default"] = max(1, int(batch_size))
+            self._batch_requests += max(0, int(requests))
+            self._salvaged_items += max(0, int(salvaged_items))
+            self._bisections += max(0, int(bisections))
+            payload = self._build_payload_locked()
+        self._publish(payload)
+
+    def record_streaming(
+        self,
+        *,
+        streamed_items: int = 0,
+        first_item_seconds: Optional[float] = None,
+        overlap_seconds: float = 0.0,
+    ) -> None:
+        """Record items delivered before their batch finished.
+
+        ``first_item_seconds`` is the delay until a batch produced its first
+        item; ``overlap_seconds`` is how long early items were available to
+        downstream stages before the batch completed.
+        """
+        with self._lock:
+            self._streamed_items += max(0, int(streamed_items))
+            if first_item_seconds is not None:
+                self._first_item_samples += 1
+                self._first_item_seconds_total += max(0.0, float(first_item_seconds))
+            self._stream_overlap_seconds += max(0.0, float(overlap_seconds))
+            payload = self._build_payload_locked()
+        self._publish(payload)
+
     def _build_payload_locked(self) -> Dict[str, object]:
         """Build statistics payload (must be called with lock held)."""
         avg_batch = (
@@ -121,6 +169,20 @@ class BatchStatsRecorder:
             "last_batch_items": self._last_batch_items,
             "last_updated": round(time.time(), 3),
         }
+        if self._tuned_batch_sizes:
+            payload["tuned_batch_sizes"] = dict(self._tuned_batch_sizes)
+            payload["batch_requests"] = self._batch_requests
+            payload["salvaged_items"] = self._salvaged_items
+            payload["bisections"] = self._bisections
+        if self._first_item_samples or self._streamed_items:
+            payload["streamed_items"] = self._streamed_items
+            payload["avg_first_item_seconds"] = round(
+                self._first_item_seconds_total / self._first_item_samples
+                if self._first_item_samples
+                else 0.0,
+                3,
+            )
+            payload["stream_overlap_seconds"] = round(self._stream_overlap_seconds, 3)
         if self._total_batches is not None:
             payload["batches_total"] = self._total_batches
         if self._items_total is not None:
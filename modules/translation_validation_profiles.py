@@ -0,0 +1,432 @@
+"""Precompiled per-language translation validation.
+
+The checks in :mod:`modules.translation_validation` re-derive everything on
+every call: the target language is matched against alias tables, the text is
+rescanned once per script block and letters are counted character by
+character.  They run for every candidate on every retry attempt and for every
+item of a batch, which adds up on long CJK and Indic batches.
+
+:class:`ValidationProfile` resolves everything that depends only on the
+target language once (script policy, required diacritics, density hint,
+segmentation thresholds) and caches it per language.  Texts are reduced to a
+:class:`TextStats` from a single :class:`collections.Counter` pass, with the
+per-character classification memoized process-wide, so the work per text is
+proportional to its distinct characters rather than to its length times the
+number of scripts.  :class:`BatchValidator` applies a profile to many items,
+sharing text statistics and highlight tokenization between the checks and
+across repeated texts.
+
+Every check returns exactly what the matching function in
+:mod:`modules.translation_validation` returns; those functions remain the
+reference implementation.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+import regex
+
+from modules import language_policies, text_normalization as text_norm
+from modules import translation_validation as tv
+from modules.text import split_highlight_tokens
+
+_ALPHA = 1
+_LATIN = 2
+_NON_LATIN_LETTER = 4
+_HIGH_DENSITY = 8
+
+_KHMER_LANGS = frozenset({"khmer", "km", "cambodian"})
+
+# Character -> (trait bits, script block labels).  Bounded by the number of
+# distinct code points ever validated.
+_CHAR_TRAITS: Dict[str, Tuple[int, Tuple[str, ...]]] = {}
+_SCRIPT_BLOCK_ITEMS = tuple(language_policies.SCRIPT_BLOCKS.items())
+
+
+def _char_traits(char: str) -> Tuple[int, Tuple[str, ...]]:
+    traits = _CHAR_TRAITS.get(char)
+    if traits is None:
+        bits = 0
+        if char.isalpha():
+            bits |= _ALPHA
+        if tv._LATIN_LETTER_PATTERN.match(char):
+            bits |= _LATIN
+        if tv._NON_LATIN_LETTER_PATTERN.match(char):
+            bits |= _NON_LATIN_LETTER
+        if tv._HIGH_DENSITY_SCRIPT_PATTERN.match(char):
+            bits |= _HIGH_DENSITY
+        scripts = tuple(label for label, pattern in _SCRIPT_BLOCK_ITEMS if pattern.match(char))
+        traits = (bits, scripts)
+        _CHAR_TRAITS[char] = traits
+    return traits
+
+
+class _CharClass:
+    """Memoized membership test for a single-character pattern."""
+
+    __slots__ = ("_pattern", "_members")
+
+    def __init__(self, pattern: regex.Pattern) -> None:
+        self._pattern = pattern
+        self._members: Dict[str, bool] = {}
+
+    def count(self, stats: "TextStats") -> int:
+        members = self._members
+        total = 0
+        for char, occurrences in stats.chars.items():
+            hit = members.get(char)
+            if hit is None:
+                hit = self._pattern.match(char) is not None
+                members[char] = hit
+            if hit:
+                total += occurrences
+        return total
+
+
+@dataclass(frozen=True, slots=True)
+class TextStats:
+    """Character statistics of one text, computed in a single pass."""
+
+    chars: Mapping[str, int]
+    letters: int
+    latin: int
+    non_latin: int
+    high_density_script: bool
+    script_counts: Dict[str, int]
+
+    @classmethod
+    def of(cls, value: str) -> "TextStats":
+        chars = Counter(value)
+        letters = latin = non_latin = 0
+        high_density = False
+        per_script: Dict[str, int] = {}
+        for char, occurrences in chars.items():
+            bits, scripts = _char_traits(char)
+            if bits & _ALPHA:
+                letters += occurrences
+            if bits & _LATIN:
+                latin += occurrences
+            if bits & _NON_LATIN_LETTER:
+                non_latin += occurrences
+            if bits & _HIGH_DENSITY:
+                high_density = True
+            for label in scripts:
+                per_script[label] = per_script.get(label, 0) + occurrences
+        # Same label order as language_policies.script_counts.
+        ordered = {
+            label: per_script[label] for label, _pattern in _SCRIPT_BLOCK_ITEMS if label in per_script
+        }
+        return cls(
+            chars=chars,
+            letters=letters,
+            latin=latin,
+            non_latin=non_latin,
+            high_density_script=high_density,
+            script_counts=ordered,
+        )
+
+    @property
+    def latin_fraction(self) -> float:
+        total = self.latin + self.non_latin
+        if total == 0:
+            return 0.0
+        return self.latin / total
+
+
+class ValidationProfile:
+    """Everything the validation checks derive from the target language alone."""
+
+    __slots__ = (
+        "target_language",
+        "non_latin_hint",
+        "high_density_hint",
+        "diacritic_label",
+        "diacritic_class",
+        "diacritic_script_class",
+        "script_label",
+        "script_class",
+        "needs_segmentation",
+        "khmer_segmentation",
+    )
+
+    def __init__(self, target_language: str) -> None:
+        target_lower = (target_language or "").lower()
+        self.target_language = target_language
+        self.non_latin_hint = language_policies.is_non_latin_language_hint(target_language)
+        self.high_density_hint = bool(tv._HIGH_DENSITY_TARGET_PATTERN.search(target_lower))
+
+        self.diacritic_label: Optional[str] = None
+        self.diacritic_class: Optional[_CharClass] = None
+        self.diacritic_script_class: Optional[_CharClass] = None
+        for requirement in tv._DIACRITIC_PATTERNS.values():
+            if any(alias in target_lower for alias in requirement["aliases"]):
+                self.diacritic_label = requirement["label"]
+                self.diacritic_class = _CharClass(requirement["pattern"])
+                script_pattern = requirement.get("script_pattern")
+                if script_pattern:
+                    self.diacritic_script_class = _CharClass(script_pattern)
+                break
+
+        policy = language_policies.script_policy_for(target_language)
+        self.script_label = policy.script_label if policy is not None else None
+        self.script_class = _CharClass(policy.script_pattern) if policy is not None else None
+
+        segmentation_lang = (target_language or "").strip().lower()
+        self.needs_segmentation = segmentation_lang in tv._SEGMENTATION_LANGS
+        self.khmer_segmentation = segmentation_lang in _KHMER_LANGS
+
+    def segmentation_thresholds(self, source_words: int) -> Tuple[int, int]:
+        if self.khmer_segmentation:
+            required_min = max(2, int(source_words * 0.6))
+            return required_min, max(source_words * 2, required_min + 1)
+        return max(4, int(source_words * 0.6)), source_words * 4
+
+
+@lru_cache(maxsize=256)
+def validation_profile(target_language: Optional[str]) -> ValidationProfile:
+    """Return the (cached) validation profile for ``target_language``."""
+
+    return ValidationProfile(target_language or "")
+
+
+class BatchValidator:
+    """Apply one language profile to many texts with shared analysis.
+
+    Text statistics and highlight tokens are computed at most once per
+    distinct text for the lifetime of the validator.
+    """
+
+    def __init__(self, target_language: Optional[str]) -> None:
+        self.profile = validation_profile(target_language)
+        self._stats: Dict[str, TextStats] = {}
+        self._tokens: Dict[str, List[str]] = {}
+
+    def stats(self, value: str) -> TextStats:
+        stats = self._stats.get(value)
+        if stats is None:
+            stats = TextStats.of(value)
+            self._stats[value] = stats
+        return stats
+
+    def tokens(self, value: str) -> List[str]:
+        tokens = self._tokens.get(value)
+        if tokens is None:
+            tokens = split_highlight_tokens(value)
+            self._tokens[value] = tokens
+        return tokens
+
+    def _segmentation_tokens(self, value: str) -> List[str]:
+        return self.tokens(tv._ZERO_WIDTH_SPACE_PATTERN.sub(" ", value))
+
+    # ------------------------------------------------------------------
+    # Individual checks (see the same-named functions in translation_validation)
+    # ------------------------------------------------------------------
+    def letter_count(self, value: str) -> int:
+        return self.stats(value).letters
+
+    def is_probable_transliteration(self, original_sentence: str, translation_text: str) -> bool:
+        if not translation_text or not self.stats(original_sentence).non_latin:
+            return False
+        if not self.profile.non_latin_hint:
+            return False
+        return self.stats(translation_text).latin_fraction >= 0.6
+
+    def is_translation_too_short(self, original_sentence: str, translation_text: str) -> bool:
+        translation_text = translation_text or ""
+        original_letters = self.stats(original_sentence).letters
+        if original_letters <= 12:
+            return False
+        translation_stats = self.stats(translation_text)
+        translation_letters = translation_stats.letters
+        if translation_letters == 0:
+            return True
+        if self.profile.high_density_hint or translation_stats.high_density_script:
+            if original_letters >= 80 and translation_letters < 6:
+                return True
+            ratio = translation_letters / float(original_letters)
+            return original_letters >= 30 and ratio < 0.10
+        if original_letters >= 80 and translation_letters < 15:
+            return True
+        ratio = translation_letters / float(original_letters)
+        return original_letters >= 30 and ratio < 0.28
+
+    def missing_required_diacritics(self, translation_text: str) -> Tuple[bool, Optional[str]]:
+        profile = self.profile
+        if profile.diacritic_class is None:
+            return False, None
+        stats = self.stats(translation_text or "")
+        if profile.diacritic_script_class is not None and not profile.diacritic_script_class.count(stats):
+            return False, None
+        if not profile.diacritic_class.count(stats):
+            return True, profile.diacritic_label
+        return False, None
+
+    def unexpected_script_used(self, translation_text: str) -> Tuple[bool, Optional[str]]:
+        candidate = translation_text or ""
+        if not candidate:
+            return False, None
+        stats = self.stats(candidate)
+        if not stats.non_latin:
+            return False, None
+        profile = self.profile
+        if profile.script_class is None:
+            return False, None
+
+        script_distribution = stats.script_counts
+        total_non_latin = stats.non_latin
+        expected_label = profile.script_label
+        expected_count = profile.script_class.count(stats)
+        if expected_count == 0:
+            return True, expected_label
+        expected_ratio = expected_count / float(total_non_latin)
+        other_count = total_non_latin - expected_count
+        dominant_label, dominant_count = max(
+            script_distribution.items(), key=lambda item: item[1], default=(None, 0)
+        )
+        if expected_ratio < 0.85 or other_count > max(2, expected_count * 0.1):
+            offenders = [
+                label
+                for label, count in script_distribution.items()
+                if label != expected_label and count > 0
+            ]
+            offender_label = f" (found {', '.join(offenders)})" if offenders else ""
+            return True, f"{expected_label}{offender_label}"
+        if dominant_label and dominant_label != expected_label and dominant_count > expected_count:
+            return True, f"{expected_label} (found {dominant_label})"
+        return False, None
+
+    def is_segmentation_ok(
+        self,
+        original_sentence: str,
+        translation: str,
+        *,
+        translation_text: Optional[str] = None,
+    ) -> bool:
+        profile = self.profile
+        if not profile.needs_segmentation:
+            return True
+        original_word_count = max(len(original_sentence.split()), 1)
+        if original_word_count <= 1:
+            return True
+        tokens = self._segmentation_tokens(translation_text or translation)
+        token_count = len(tokens)
+        if token_count <= 1:
+            return False
+        if profile.khmer_segmentation and token_count > 2:
+            short_tokens = sum(1 for token in tokens if len(token) <= 2)
+            if short_tokens / float(token_count) > 0.1:
+                return False
+        required_min, max_reasonable = profile.segmentation_thresholds(original_word_count)
+        return required_min <= token_count <= max_reasonable
+
+    def token_alignment_error(
+        self, translation_text: str, transliteration_text: str
+    ) -> Optional[str]:
+        if not self.profile.needs_segmentation:
+            return None
+        if not translation_text or not transliteration_text:
+            return None
+        trans_count = len(self._segmentation_tokens(translation_text))
+        translit_count = len(self._segmentation_tokens(transliteration_text))
+        diff = abs(trans_count - translit_count)
+        if diff <= 1:
+            return None
+        return (
+            f"Token count mismatch: translation={trans_count}, "
+            f"transliteration={translit_count} (diff={diff})"
+        )
+
+    def sentence_boundary_error(
+        self, original_sentence: str, translation_text: str, *, strict: bool = False
+    ) -> Optional[str]:
+        if not original_sentence or not translation_text:
+            return None
+        min_ratio = 0.3 if strict else 0.2
+        max_ratio = 4.0 if strict else 5.0
+        orig_count = len(self.tokens(original_sentence))
+        if orig_count <= 2:
+            return None
+        trans_count = len(self.tokens(translation_text))
+        ratio = trans_count / orig_count
+        if ratio < min_ratio:
+            return (
+                f"Translation appears truncated: {trans_count} tokens vs "
+                f"{orig_count} source tokens (ratio={ratio:.2f}, min={min_ratio})"
+            )
+        if ratio > max_ratio:
+            return (
+                f"Translation appears to combine sentences: {trans_count} tokens vs "
+                f"{orig_count} source tokens (ratio={ratio:.2f}, max={max_ratio})"
+            )
+        return None
+
+    # ------------------------------------------------------------------
+    # Combined checks
+    # ------------------------------------------------------------------
+    def validate(
+        self,
+        original_sentence: str,
+        translation_text: str,
+        *,
+        check_sentence_boundaries: bool = True,
+    ) -> Optional[str]:
+        """Return the error ``validate_batch_translation`` reports, if any."""
+
+        if text_norm.is_placeholder_translation(translation_text):
+            return "Invalid or placeholder translation"
+        if self.is_probable_transliteration(original_sentence, translation_text):
+            return "Transliteration returned instead of translation"
+        if self.is_translation_too_short(original_sentence, translation_text):
+            return "Translation shorter than expected"
+        missing_diacritics, label = self.missing_required_diacritics(translation_text)
+        if missing_diacritics:
+            return f"Missing {label or 'required diacritics'}"
+        script_mismatch, script_label = self.unexpected_script_used(translation_text)
+        if script_mismatch:
+            return f"Unexpected script used; expected {script_label or 'target script'}"
+        if check_sentence_boundaries:
+            return self.sentence_boundary_error(original_sentence, translation_text)
+        return None
+
+    def validate_many(
+        self,
+        items: Sequence[Tuple[str, str]],
+        *,
+        check_sentence_boundaries: bool = True,
+    ) -> List[Optional[str]]:
+        """Validate ``(original, translation)`` pairs; one error slot per item."""
+
+        return [
+            self.validate(
+                original,
+                translation,
+                check_sentence_boundaries=check_sentence_boundaries,
+            )
+            for original, translation in items
+        ]
+
+
+def validate_translation_batch(
+    items: Sequence[Tuple[str, str]],
+    target_language: Optional[str],
+    *,
+    check_sentence_boundaries: bool = True,
+) -> List[Optional[str]]:
+    """Validate a batch of ``(original, translation)`` pairs for one target."""
+
+    return BatchValidator(target_language).validate_many(
+        items, check_sentence_boundaries=check_sentence_boundaries
+    )
+
+
+__all__ = [
+    "BatchValidator",
+    "TextStats",
+    "ValidationProfile",
+    "validate_translation_batch",
+    "validation_profile",
+]
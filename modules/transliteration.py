@@ -3,10 +3,13 @@
 from __future__ import annotations
 
 import re
+import threading
 import time
 import unicodedata
+import weakref
 from dataclasses import dataclass
-from typing import Optional
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Sequence, Tuple
 
 from modules import config_manager as cfg
 from modules import fallbacks
@@ -14,6 +17,14 @@ from modules import logging_manager as log_mgr, prompt_templates, text_normaliza
 from modules import llm_client_manager
 from modules.llm_client import LLMClient
 from modules.retry_annotations import format_retry_failure, is_failure_annotation
+from modules.transliteration_memory import (
+    TransliterationKey,
+    TransliterationMemory,
+    get_transliteration_memory,
+)
+
+if TYPE_CHECKING:  # pragma: no cover - typing only
+    from modules.translation_logging import BatchStatsRecorder
 
 logger = log_mgr.logger
 
@@ -27,6 +38,8 @@ _PYTHON_ONLY_MODES = {
     "local-module",
     "local_module",
 }
+_MEMORY_STATS_METADATA_KEY = "transliteration_memory"
+_MEMORY_COUNTERS = ("requests", "memory_hits", "local", "deduplicated", "llm")
 _LANGUAGE_ALIASES = {
     "arabic": {"arabic", "ar"},
     "chinese": {
@@ -97,7 +110,34 @@ class TransliterationResult:
 
 
 class TransliterationService:
-    """Best-effort transliteration handler with local fallbacks and LLM support."""
+    """Best-effort transliteration handler with local fallbacks and LLM support.
+
+    LLM transliterations are remembered in ``memory`` (or the shared
+    :func:`get_transliteration_memory` when ``use_shared_memory`` is set) and
+    reused for the same text, language, mode and model.
+    """
+
+    def __init__(
+        self,
+        *,
+        memory: Optional[TransliterationMemory] = None,
+        use_shared_memory: bool = False,
+    ) -> None:
+        self._memory = memory
+        self._use_shared_memory = use_shared_memory
+        self._usage_lock = threading.Lock()
+        self._usage: "weakref.WeakKeyDictionary[Any, Dict[str, int]]" = weakref.WeakKeyDictionary()
+        # Set while a batch delegates to resolve_batch_transliterations, whose
+        # per-sentence calls are already counted by the batch.
+        self._batch_scope = threading.local()
+
+    @property
+    def memory(self) -> Optional[TransliterationMemory]:
+        """Return the transliteration memory in use, if any."""
+
+        if self._memory is None and self._use_shared_memory:
+            return get_transliteration_memory()
+        return self._memory
 
     def transliterate(
         self,
@@ -116,6 +156,7 @@ class TransliterationService:
         fallback_client = (
             fallbacks.get_fallback_llm_client(fallback_model) if fallback_model else None
         )
+        memory = None if python_only else self.memory
 
         def _run_llm(resolved_client: LLMClient) -> tuple[TransliterationResult, Optional[str], float]:
             system_prompt = prompt_templates.make_transliteration_prompt(target_language)
@@ -135,6 +176,13 @@ class TransliterationService:
                     candidate = response.text.strip()
                     if not text_norm.is_placeholder_value(candidate):
                         elapsed = time.perf_counter() - start_time
+                        if memory is not None:
+                            memory.put(
+                                TransliterationKey.build(
+                                    sentence, lang, mode=mode_label, model=resolved_client.model
+                                ),
+                                candidate,
+                            )
                         return TransliterationResult(candidate, used_llm=True), None, elapsed
                     last_error = "Placeholder transliteration response"
                 else:
@@ -159,6 +207,7 @@ class TransliterationService:
             try:
                 local_text = _transliterate_with_python(sentence, lang)
                 if local_text:
+                    self._record_usage(progress_tracker, requests=1, local=1, publish=False)
                     return TransliterationResult(local_text, used_llm=False)
             except Exception as exc:  # pragma: no cover - best-effort helper
                 if resolved_client.debug_enabled:
@@ -173,6 +222,14 @@ class TransliterationService:
                 )
                 return TransliterationResult(failure_text, used_llm=False)
 
+            if memory is not None:
+                remembered = memory.get(
+                    TransliterationKey.build(sentence, lang, mode=mode_label, model=current_model)
+                )
+                if remembered is not None:
+                    self._record_usage(progress_tracker, requests=1, memory_hits=1)
+                    return TransliterationResult(remembered, used_llm=True)
+            self._record_usage(progress_tracker, requests=1, llm=1)
             result, last_error, elapsed = _run_llm(resolved_client)
 
         if not fallback_active:
@@ -207,8 +264,171 @@ class TransliterationService:
 
         return result
 
+    def transliterate_batch(
+        self,
+        items: Sequence[Tuple[int, str]],
+        target_language: str,
+        *,
+        local_client: LLMClient,
+        transliteration_client: Optional[LLMClient] = None,
+        mode: Optional[str] = None,
+        progress_tracker=None,
+        batch_size: Optional[int] = None,
+        batch_log_dir: Optional[Path] = None,
+        batch_stats: Optional["BatchStatsRecorder"] = None,
+        sentence_numbers: Optional[Mapping[int, int]] = None,
+    ) -> Dict[int, str]:
+        """Transliterate ``(item_id, text)`` pairs, calling the LLM only when needed.
+
+        Remembered transliterations and local-module conversions are
+        resolved first; repeated texts are sent once, and the remainder goes
+        to :func:`resolve_batch_transliterations` in LLM batches.
+        ``sentence_numbers`` maps item ids to sentence numbers for the LLM
+        trace spans.
+
+        Returns:
+            Dict mapping item_id -> transliteration
+        """
+        from modules.translation_batch import resolve_batch_transliterations
+
+        if not items:
+            return {}
+        lang = _normalize_language_hint(target_language)
+        mode_label = (mode or "").strip().lower()
+        python_only = mode_label in _PYTHON_ONLY_MODES
+        memory = None if python_only else self.memory
+        resolved_client = transliteration_client or local_client
+        model = fallbacks.get_llm_fallback_model(progress_tracker) or resolved_client.model
+        results: Dict[int, str] = {}
+        counts = dict.fromkeys(_MEMORY_COUNTERS, 0)
+        counts["requests"] = len(items)
+
+        keys: Dict[int, TransliterationKey] = {}
+        if memory is not None:
+            keys = {
+                idx: TransliterationKey.build(text, lang, mode=mode_label, model=model)
+                for idx, text in items
+            }
+            remembered = memory.get_many(keys.values())
+            for idx, _text in items:
+                value = remembered.get(keys[idx])
+                if value is not None:
+                    results[idx] = value
+                    counts["memory_hits"] += 1
+
+        pending: List[Tuple[int, str]] = []
+        for idx, text in items:
+            if idx in results:
+                continue
+            local_text = _local_transliteration(text, lang)
+            if local_text:
+                results[idx] = local_text
+                counts["local"] += 1
+            else:
+                pending.append((idx, text))
+
+        # Send each distinct text once; repeats reuse its result.
+        unique: List[Tuple[int, str]] = []
+        duplicates: Dict[int, List[int]] = {}
+        first_by_text: Dict[str, int] = {}
+        for idx, text in pending:
+            normalized = " ".join(text.split())
+            leader = first_by_text.get(normalized)
+            if leader is None:
+                first_by_text[normalized] = idx
+                unique.append((idx, text))
+            else:
+                duplicates.setdefault(leader, []).append(idx)
+                counts["deduplicated"] += 1
+
+        if unique:
+            if not python_only:
+                counts["llm"] = len(unique)
+            self._batch_scope.active = True
+            try:
+                resolved = resolve_batch_transliterations(
+                    unique,
+                    target_language,
+                    transliterator=self,
+                    transliteration_mode=mode,
+                    transliteration_client=transliteration_client,
+                    local_client=local_client,
+                    progress_tracker=progress_tracker,
+                    batch_size=batch_size,
+                    batch_log_dir=batch_log_dir,
+                    batch_stats=batch_stats,
+                    sentence_numbers=sentence_numbers,
+                )
+            finally:
+                self._batch_scope.active = False
+            learned: List[Tuple[TransliterationKey, str]] = []
+            for idx, _text in unique:
+                value = resolved.get(idx, "")
+                results[idx] = value
+                for duplicate in duplicates.get(idx, ()):
+                    results[duplicate] = value
+                if (
+                    memory is not None
+                    and value
+                    and not is_failure_annotation(value)
+                    and not text_norm.is_placeholder_value(value)
+                ):
+                    learned.append((keys[idx], value))
+            if learned and memory is not None:
+                memory.put_many(learned)
+
+        self._record_usage(progress_tracker, **counts)
+        return results
+
+    def memory_usage(self, progress_tracker) -> Dict[str, Any]:
+        """Return memory hit statistics recorded for ``progress_tracker``."""
+
+        with self._usage_lock:
+            counts = dict(self._usage.get(progress_tracker) or dict.fromkeys(_MEMORY_COUNTERS, 0))
+        return _usage_payload(counts)
+
+    def _record_usage(self, progress_tracker, *, publish: bool = True, **deltas: int) -> None:
+        if progress_tracker is None or getattr(self._batch_scope, "active", False):
+            return
+        try:
+            with self._usage_lock:
+                counts = self._usage.setdefault(progress_tracker, dict.fromkeys(_MEMORY_COUNTERS, 0))
+                for name, value in deltas.items():
+                    counts[name] += value
+                snapshot = dict(counts)
+        except TypeError:  # pragma: no cover - tracker without weakref support
+            return
+        if publish:
+            progress_tracker.update_generated_files_metadata(
+                {_MEMORY_STATS_METADATA_KEY: _usage_payload(snapshot)}
+            )
+
+
+def _usage_payload(counts: Dict[str, int]) -> Dict[str, Any]:
+    requests = counts.get("requests", 0)
+    avoided = requests - counts.get("llm", 0)
+    return {
+        **counts,
+        "memory_hit_rate": round(counts.get("memory_hits", 0) / requests, 3) if requests else 0.0,
+        "llm_avoided_rate": round(avoided / requests, 3) if requests else 0.0,
+    }
+
+
+def _local_transliteration(text: str, lang: str) -> str:
+    """Return a usable local-module transliteration of ``text`` or ``""``."""
+
+    try:
+        local_text = _transliterate_with_python(text, lang)
+    except Exception as exc:  # pragma: no cover - best-effort helper
+        logger.debug("Non-LLM transliteration error for %s: %s", lang, exc)
+        return ""
+    local_text = text_norm.collapse_whitespace((local_text or "").strip())
+    if not local_text or is_failure_annotation(local_text) or text_norm.is_placeholder_value(local_text):
+        return ""
+    return local_text
+
 
-_default_transliterator = TransliterationService()
+_default_transliterator = TransliterationService(use_shared_memory=True)
 
 
 def get_transliterator() -> TransliterationService:
@@ -0,0 +1,325 @@
+"""Persistent memory of LLM transliterations.
+
+Subtitle and dubbing jobs repeat many short lines, and books repeat names
+and phrases across jobs.  :class:`TransliterationMemory` remembers every
+successful LLM transliteration keyed by the normalized source text, target
+language, mode and model, in a WAL-mode SQLite database fronted by a bounded
+in-process LRU, so repeats skip the LLM round trip.  Local-module
+conversions are cheap and deterministic and are not stored.
+
+``EBOOK_TRANSLITERATION_MEMORY`` selects the database file; ``off`` disables
+the shared memory.
+"""
+
+from __future__ import annotations
+
+import atexit
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from modules import config_manager as cfg
+from modules import logging_manager as log_mgr
+
+logger = log_mgr.get_logger().getChild("transliteration.memory")
+
+TRANSLITERATION_MEMORY_ENV_VAR = "EBOOK_TRANSLITERATION_MEMORY"
+DEFAULT_MEMORY_FILENAME = "transliteration_memory.sqlite3"
+DEFAULT_MAX_CACHED_ENTRIES = 20_000
+
+_DEFAULT_MEMORY_DIR = Path("storage/cache/transliteration")
+_DISABLED_VALUES = {"0", "off", "false", "no", "none", "disabled"}
+# SQLite limits the number of bound parameters per statement.
+_LOOKUP_CHUNK = 500
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS transliterations (
+        digest TEXT PRIMARY KEY,
+        language TEXT NOT NULL,
+        mode TEXT NOT NULL,
+        model TEXT NOT NULL,
+        source_text TEXT NOT NULL,
+        transliteration TEXT NOT NULL,
+        updated_at REAL NOT NULL
+    )
+    """,
+)
+
+
+def normalize_memory_text(text: str) -> str:
+    """Return ``text`` in the form used for memory keys (NFC, single spaces)."""
+
+    return " ".join(unicodedata.normalize("NFC", text or "").split())
+
+
+@dataclass(frozen=True)
+class TransliterationKey:
+    """Identity of one remembered transliteration."""
+
+    text: str
+    language: str
+    mode: str
+    model: str
+
+    @classmethod
+    def build(
+        cls,
+        text: str,
+        language: str,
+        *,
+        mode: Optional[str],
+        model: Optional[str],
+    ) -> "TransliterationKey":
+        return cls(
+            text=normalize_memory_text(text),
+            language=" ".join((language or "").strip().lower().split()),
+            mode=(mode or "").strip().lower() or "default",
+            model=(model or "").strip() or "unknown",
+        )
+
+    def digest(self) -> str:
+        payload = json.dumps([self.text, self.language, self.mode, self.model], ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class TransliterationMemory:
+    """SQLite-backed transliteration memory with an in-process LRU in front.
+
+    ``db_path=None`` keeps entries in memory only.  Database errors are logged
+    and degrade the memory to in-process caching rather than failing jobs.
+    """
+
+    def __init__(
+        self,
+        db_path: Optional[Path] = None,
+        *,
+        max_cached_entries: int = DEFAULT_MAX_CACHED_ENTRIES,
+    ) -> None:
+        self._db_path = Path(db_path) if db_path is not None else None
+        self._max_cached = max(0, int(max_cached_entries))
+        self._cache: "OrderedDict[str, str]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._db_lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        if self._db_path is not None:
+            self._conn = self._connect(self._db_path)
+            if self._conn is not None:
+                atexit.register(self.close)
+
+    @property
+    def db_path(self) -> Optional[Path]:
+        return self._db_path
+
+    @property
+    def persistent(self) -> bool:
+        return self._conn is not None
+
+    def get(self, key: TransliterationKey) -> Optional[str]:
+        """Return the remembered transliteration for ``key``."""
+
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: Iterable[TransliterationKey]) -> Dict[TransliterationKey, str]:
+        """Return remembered transliterations for every known key in ``keys``."""
+
+        by_digest: Dict[str, List[TransliterationKey]] = {}
+        for key in keys:
+            by_digest.setdefault(key.digest(), []).append(key)
+        found: Dict[str, str] = {}
+        with self._cache_lock:
+            for digest in by_digest:
+                value = self._cache.get(digest)
+                if value is not None:
+                    self._cache.move_to_end(digest)
+                    found[digest] = value
+        missing = [digest for digest in by_digest if digest not in found]
+        if missing and self._conn is not None:
+            loaded = self._load(missing)
+            if loaded:
+                found.update(loaded)
+                self._remember(loaded.items())
+        return {
+            key: found[digest]
+            for digest, key_list in by_digest.items()
+            if digest in found
+            for key in key_list
+        }
+
+    def put(self, key: TransliterationKey, transliteration: str) -> None:
+        """Remember ``transliteration`` for ``key``."""
+
+        self.put_many([(key, transliteration)])
+
+    def put_many(self, entries: Iterable[Tuple[TransliterationKey, str]]) -> int:
+        """Remember several transliterations; returns how many were stored."""
+
+        rows: Dict[str, Tuple[TransliterationKey, str]] = {}
+        for key, transliteration in entries:
+            value = (transliteration or "").strip()
+            if key.text and value:
+                rows[key.digest()] = (key, value)
+        if not rows:
+            return 0
+        self._remember((digest, value) for digest, (_key, value) in rows.items())
+        if self._conn is not None:
+            now = time.time()
+            self._execute_many(
+                "INSERT OR REPLACE INTO transliterations "
+                "(digest, language, mode, model, source_text, transliteration, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (digest, key.language, key.mode, key.model, key.text, value, now)
+                    for digest, (key, value) in rows.items()
+                ],
+            )
+        return len(rows)
+
+    def clear_cache(self) -> None:
+        """Drop the in-process LRU; the database is kept."""
+
+        with self._cache_lock:
+            self._cache.clear()
+
+    def close(self) -> None:
+        """Close the database connection."""
+
+        with self._db_lock:
+            conn, self._conn = self._conn, None
+        if conn is not None:
+            try:
+                conn.close()
+            except sqlite3.Error:  # pragma: no cover - best-effort shutdown
+                logger.debug("Failed to close transliteration memory", exc_info=True)
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+    def _connect(self, db_path: Path) -> Optional[sqlite3.Connection]:
+        try:
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                str(db_path),
+                timeout=30.0,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            for statement in _SCHEMA:
+                conn.execute(statement)
+        except (OSError, sqlite3.Error) as exc:
+            logger.warning(
+                "Transliteration memory unavailable at %s; using in-process cache only: %s",
+                db_path,
+                exc,
+            )
+            return None
+        return conn
+
+    def _load(self, digests: Sequence[str]) -> Dict[str, str]:
+        loaded: Dict[str, str] = {}
+        for start in range(0, len(digests), _LOOKUP_CHUNK):
+            chunk = digests[start : start + _LOOKUP_CHUNK]
+            placeholders = ", ".join("?" for _ in chunk)
+            rows = self._query(
+                f"SELECT digest, transliteration FROM transliterations WHERE digest IN ({placeholders})",
+                chunk,
+            )
+            loaded.update((digest, value) for digest, value in rows)
+        return loaded
+
+    def _query(self, sql: str, params: Sequence[str]) -> List[Tuple[str, str]]:
+        with self._db_lock:
+            if self._conn is None:
+                return []
+            try:
+                return self._conn.execute(sql, tuple(params)).fetchall()
+            except sqlite3.Error as exc:
+                logger.warning("Transliteration memory lookup failed: %s", exc)
+                return []
+
+    def _execute_many(self, sql: str, rows: Sequence[Tuple[object, ...]]) -> None:
+        with self._db_lock:
+            if self._conn is None:
+                return
+            try:
+                with self._conn:
+                    self._conn.execute("BEGIN")
+                    self._conn.executemany(sql, rows)
+            except sqlite3.Error as exc:
+                logger.warning("Transliteration memory write failed: %s", exc)
+
+    def _remember(self, items: Iterable[Tuple[str, str]]) -> None:
+        if self._max_cached <= 0:
+            return
+        with self._cache_lock:
+            for digest, value in items:
+                self._cache[digest] = value
+                self._cache.move_to_end(digest)
+            while len(self._cache) > self._max_cached:
+                self._cache.popitem(last=False)
+
+
+def resolve_memory_path() -> Optional[Path]:
+    """Return the shared memory database path, or ``None`` when disabled."""
+
+    raw = os.environ.get(TRANSLITERATION_MEMORY_ENV_VAR, "").strip()
+    if raw.lower() in _DISABLED_VALUES:
+        return None
+    if raw:
+        return Path(raw).expanduser()
+    return cfg.resolve_directory(None, _DEFAULT_MEMORY_DIR) / DEFAULT_MEMORY_FILENAME
+
+
+_shared_memory: Optional[TransliterationMemory] = None
+_shared_memory_resolved = False
+_shared_memory_lock = threading.Lock()
+
+
+def get_transliteration_memory() -> Optional[TransliterationMemory]:
+    """Return the process-wide transliteration memory, or ``None`` when disabled."""
+
+    global _shared_memory, _shared_memory_resolved
+    with _shared_memory_lock:
+        if not _shared_memory_resolved:
+            _shared_memory_resolved = True
+            try:
+                path = resolve_memory_path()
+            except Exception as exc:  # pragma: no cover - defensive path resolution
+                logger.warning("Could not resolve transliteration memory path: %s", exc)
+                path = None
+            if path is not None:
+                _shared_memory = TransliterationMemory(path)
+        return _shared_memory
+
+
+def close_transliteration_memory() -> None:
+    """Close and forget the process-wide transliteration memory."""
+
+    global _shared_memory, _shared_memory_resolved
+    with _shared_memory_lock:
+        memory, _shared_memory = _shared_memory, None
+        _shared_memory_resolved = False
+    if memory is not None:
+        memory.close()
+
+
+__all__ = [
+    "DEFAULT_MEMORY_FILENAME",
+    "TRANSLITERATION_MEMORY_ENV_VAR",
+    "TransliterationKey",
+    "TransliterationMemory",
+    "close_transliteration_memory",
+    "get_transliteration_memory",
+    "normalize_memory_text",
+    "resolve_memory_path",
+]
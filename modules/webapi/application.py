@@ -12,10 +12,12 @@ import shutil
 from pathlib import Path
 import socket
 import stat as stat_module
+import time
+from typing import Callable
 
 from fastapi import FastAPI
 from starlette.datastructures import Headers, MutableHeaders
-from starlette.responses import Response
+from starlette.responses import JSONResponse, Response
 from starlette.types import ASGIApp, Receive, Scope, Send
 from urllib.parse import urlparse
 from fastapi.staticfiles import StaticFiles
@@ -30,24 +32,18 @@ configure_hf_environment()
 from .admin_routes import router as admin_router
 from .config_routes import router as config_router
 from .system_routes import router as system_router
-from .routers.audio import router as audio_router
-from .routers.acquisition import router as acquisition_router
-from .routers.create_book import router as create_book_router
 from .routers.creation_templates import router as creation_templates_router
-from .routers.exports import router as exports_router
-from .routers.library import router as library_router
-from .routers.subtitles import router as subtitles_router
-from .routers.assistant import router as assistant_router
 from .routers.bookmarks import router as bookmarks_router
 from .routers.resume import router as resume_router
 from .auth_routes import router as auth_router
 from .runtime_descriptor import build_runtime_descriptor
-from .routers.reading_beds import admin_router as reading_beds_admin_router
-from .routers.reading_beds import router as reading_beds_router
 from .routes.notification_routes import router as notification_router
+from . import startup
+from .startup import LazyRouterSpec, StorageMaintenanceRunner
 from modules.audio.config import load_media_config
 
 from .dependencies import (
+    close_playback_state_store,
     configure_media_services,
     get_notification_service,
     get_pipeline_job_manager,
@@ -89,6 +85,25 @@ _STARTUP_RUNTIME_CONTEXT: cfg.RuntimeContext | None = None
 _RAMDISK_GUARD_TASK: asyncio.Task | None = None
 _RAMDISK_GUARD_INTERVAL_SECONDS = 30
 _EMPTY_JOB_PRUNE_LIMIT = 200
+_BACKGROUND_TASKS: set[asyncio.Task] = set()
+_MAINTENANCE_SHUTDOWN_TIMEOUT_SECONDS = 5.0
+
+# Routers whose modules pull in heavy subsystems (pydub, alignment adapters,
+# image prompting, acquisition providers). In ``fast`` startup mode they are
+# imported on the first request that targets one of their prefixes.
+_LAZY_ROUTERS = (
+    LazyRouterSpec(".routers.acquisition", ("/api/acquisition",)),
+    LazyRouterSpec(".routers.audio", ("/api/audio",)),
+    LazyRouterSpec(".routers.create_book", ("/api/books",)),
+    LazyRouterSpec(".routers.library", ("/api/library",)),
+    LazyRouterSpec(".routers.subtitles", ("/api/subtitles",)),
+    LazyRouterSpec(".routers.reading_beds", ("/api/reading-beds",)),
+    LazyRouterSpec(
+        ".routers.reading_beds", ("/api/admin/reading-beds",), attribute="admin_router"
+    ),
+    LazyRouterSpec(".routers.assistant", ("/api/assistant",)),
+    LazyRouterSpec(".routers.exports", ("/api/exports",)),
+)
 
 
 def _path_exists(path: Path) -> bool:
@@ -177,10 +192,28 @@ def _directory_contains_payload(path: Path) -> bool:
     return False
 
 
-def _cleanup_empty_job_folders(storage_root: Path | None = None) -> int:
+def _modified_since(path: Path, cutoff: float | None) -> bool:
+    """Return True when ``path`` changed at or after ``cutoff`` (epoch seconds)."""
+
+    if cutoff is None:
+        return False
+    path_stat = safe_stat(path)
+    return path_stat is None or path_stat.st_mtime >= cutoff
+
+
+def _cleanup_empty_job_folders(
+    storage_root: Path | None = None,
+    *,
+    on_entry: Callable[[Path], None] | None = None,
+    modified_before: float | None = None,
+) -> int:
     """
     Remove empty job directories under the storage root.
 
+    ``on_entry`` is invoked for every inspected entry (progress/throttling) and
+    folders touched at or after ``modified_before`` are left alone so
+    background runs never race freshly created jobs.
+
     Returns the number of directories removed.
     """
 
@@ -197,8 +230,12 @@ def _cleanup_empty_job_folders(storage_root: Path | None = None) -> int:
     for index, entry in enumerate(safe_iterdir(root)):
         if _EMPTY_JOB_PRUNE_LIMIT and index >= _EMPTY_JOB_PRUNE_LIMIT:
             break
+        if on_entry is not None:
+            on_entry(entry)
         if not _path_is_dir(entry):
             continue
+        if _modified_since(entry, modified_before):
+            continue
         try:
             if _directory_contains_payload(entry):
                 continue
@@ -226,6 +263,8 @@ _EXPORT_MAX_AGE_SECONDS = 24 * 60 * 60  # 1 day
 def _cleanup_stale_exports(
     exports_root: Path | None = None,
     max_age_seconds: float = _EXPORT_MAX_AGE_SECONDS,
+    *,
+    on_entry: Callable[[Path], None] | None = None,
 ) -> int:
     """Remove old or orphaned export artifacts.
 
@@ -236,8 +275,6 @@ def _cleanup_stale_exports(
 
     Returns the number of entries removed.
     """
-    import time
-
     try:
         root = exports_root or FileLocator().storage_root / "exports"
     except Exception:  # pragma: no cover - defensive logging
@@ -250,6 +287,8 @@ def _cleanup_stale_exports(
     now = time.time()
     removed = 0
     for entry in safe_iterdir(root):
+        if on_entry is not None:
+            on_entry(entry)
         try:
             entry_stat = safe_stat(entry)
             if entry_stat is None:
@@ -293,12 +332,18 @@ _NON_JOB_DIRS = frozenset({
 })
 
 
-def _cleanup_orphaned_job_folders(storage_root: Path | None = None) -> int:
+def _cleanup_orphaned_job_folders(
+    storage_root: Path | None = None,
+    *,
+    on_entry: Callable[[Path], None] | None = None,
+    modified_before: float | None = None,
+) -> int:
     """Remove storage folders for jobs that no longer exist in the job store.
 
     A folder is considered orphaned when it lives under the storage root,
     is not a known non-job directory, and has no ``metadata/job.json``
-    (i.e. it is not tracked by the job persistence layer).
+    (i.e. it is not tracked by the job persistence layer). Folders modified
+    at or after ``modified_before`` are skipped.
 
     Returns the number of directories removed.
     """
@@ -316,12 +361,16 @@ def _cleanup_orphaned_job_folders(storage_root: Path | None = None) -> int:
     known_ids = set(list_job_ids())
     removed = 0
     for entry in safe_iterdir(root):
+        if on_entry is not None:
+            on_entry(entry)
         if not _path_is_dir(entry):
             continue
         if entry.name in _NON_JOB_DIRS:
             continue
         if entry.name in known_ids:
             continue
+        if _modified_since(entry, modified_before):
+            continue
         try:
             shutil.rmtree(entry)
             removed += 1
@@ -638,17 +687,75 @@ def _configure_static_assets(app: FastAPI) -> bool:
     return True
 
 
+def _initialise_database() -> bool:
+    """Initialize the PostgreSQL connection pool; return True on success."""
+
+    try:
+        from modules.database.engine import get_engine
+        get_engine()
+        LOGGER.info("Database connection pool initialized")
+        return True
+    except Exception:  # pragma: no cover - defensive logging
+        LOGGER.exception("Failed to initialize database connection")
+        return False
+
+
+async def _warm_database(state: startup.StartupState) -> None:
+    state.complete("database", await asyncio.to_thread(_initialise_database))
+
+
+def _spawn_background(coro) -> None:
+    task = asyncio.create_task(coro)
+    _BACKGROUND_TASKS.add(task)
+    task.add_done_callback(_BACKGROUND_TASKS.discard)
+
+
+def _build_maintenance_runner(mode: str) -> StorageMaintenanceRunner:
+    """Return the startup storage maintenance runner for ``mode``."""
+
+    # In fast mode the API is already serving while maintenance runs, so only
+    # folders untouched since process start are eligible for removal.
+    cutoff = time.time() if mode == startup.STARTUP_MODE_FAST else None
+    return StorageMaintenanceRunner(
+        (
+            (
+                "empty_job_folders",
+                lambda on_entry: _cleanup_empty_job_folders(
+                    on_entry=on_entry, modified_before=cutoff
+                ),
+            ),
+            ("stale_exports", lambda on_entry: _cleanup_stale_exports(on_entry=on_entry)),
+            (
+                "orphaned_job_folders",
+                lambda on_entry: _cleanup_orphaned_job_folders(
+                    on_entry=on_entry, modified_before=cutoff
+                ),
+            ),
+        ),
+        throttle_seconds=startup.maintenance_throttle_seconds(mode),
+        start_delay_seconds=startup.maintenance_delay_seconds(mode),
+    )
+
+
 async def _prepare_runtime() -> None:
-    """Initialize runtime resources before the API starts serving requests."""
+    """Initialize runtime resources before the API starts serving requests.
+
+    In ``fast`` startup mode the database pool warms up and storage
+    maintenance runs in the background; readiness stays false until the
+    required checks complete.
+    """
+
+    mode = startup.resolve_startup_mode()
+    state = startup.begin_startup(mode)
+    state.register("runtime")
 
     # Initialize PostgreSQL connection pool (if DATABASE_URL is set)
     if os.environ.get("DATABASE_URL", "").strip():
-        try:
-            from modules.database.engine import get_engine
-            get_engine()
-            LOGGER.info("Database connection pool initialized")
-        except Exception:  # pragma: no cover - defensive logging
-            LOGGER.exception("Failed to initialize database connection")
+        state.register("database")
+        if mode == startup.STARTUP_MODE_FAST:
+            _spawn_background(_warm_database(state))
+        else:
+            state.complete("database", _initialise_database())
 
     try:
         _initialise_tmp_workspace()
@@ -667,18 +774,13 @@ async def _prepare_runtime() -> None:
         load_media_config()
     except Exception:  # pragma: no cover - defensive logging
         LOGGER.exception("Failed to parse supplemental media configuration")
-    try:
-        _cleanup_empty_job_folders()
-    except Exception:  # pragma: no cover - defensive logging
-        LOGGER.exception("Failed to prune empty job folders on startup")
-    try:
-        _cleanup_stale_exports()
-    except Exception:  # pragma: no cover - defensive logging
-        LOGGER.exception("Failed to clean stale exports on startup")
-    try:
-        _cleanup_orphaned_job_folders()
-    except Exception:  # pragma: no cover - defensive logging
-        LOGGER.exception("Failed to clean orphaned job folders on startup")
+
+    runner = _build_maintenance_runner(mode)
+    startup.set_maintenance_runner(runner)
+    if mode == startup.STARTUP_MODE_FAST:
+        runner.start()
+    else:
+        await asyncio.to_thread(runner.run)
 
     # Wire up push notification callback
     try:
@@ -701,10 +803,22 @@ async def _prepare_runtime() -> None:
         _RAMDISK_GUARD_TASK = asyncio.create_task(_ramdisk_guard_loop())
         LOGGER.debug("RAMDisk guard task started (interval=%ds)", _RAMDISK_GUARD_INTERVAL_SECONDS)
 
+    state.complete("runtime")
+
 
 async def _cleanup_runtime() -> None:
     """Release runtime resources during API shutdown."""
 
+    startup.get_startup_state().mark_stopping()
+    runner = startup.get_maintenance_runner()
+    if runner is not None:
+        runner.cancel()
+        await asyncio.to_thread(runner.join, _MAINTENANCE_SHUTDOWN_TIMEOUT_SECONDS)
+    for task in list(_BACKGROUND_TASKS):
+        task.cancel()
+    if _BACKGROUND_TASKS:
+        await asyncio.gather(*_BACKGROUND_TASKS, return_exceptions=True)
+
     global _RAMDISK_GUARD_TASK
     if _RAMDISK_GUARD_TASK is not None:
         _RAMDISK_GUARD_TASK.cancel()
@@ -722,6 +836,10 @@ async def _cleanup_runtime() -> None:
         _cleanup_empty_job_folders()
     except Exception:  # pragma: no cover - defensive logging
         LOGGER.exception("Failed to prune empty job folders on shutdown")
+    try:
+        close_playback_state_store()
+    except Exception:  # pragma: no cover - defensive logging
+        LOGGER.exception("Failed to flush playback state on shutdown")
 
     # Dispose database connection pool
     if os.environ.get("DATABASE_URL", "").strip():
@@ -760,11 +878,21 @@ def create_app() -> FastAPI:
     setup_metrics(app)
 
     @app.get("/_health", tags=["health"])
+    @app.get("/_health/live", tags=["health"])
     def healthcheck() -> dict[str, str]:
-        """Simple healthcheck endpoint for smoke-testing the server."""
+        """Liveness endpoint: the process is up and serving HTTP."""
 
         return {"status": "ok"}
 
+    @app.get("/_health/ready", tags=["health"])
+    def readiness() -> JSONResponse:
+        """Readiness endpoint: 200 once startup checks pass, 503 before."""
+
+        payload = startup.get_startup_state().snapshot()
+        runner = startup.get_maintenance_runner()
+        payload["maintenance"] = runner.status if runner is not None else None
+        return JSONResponse(payload, status_code=200 if payload["ready"] else 503)
+
     @app.get("/api/system/runtime", tags=["health"])
     def public_runtime_descriptor() -> dict[str, object]:
         """Public non-secret runtime contract for app pipeline preflights."""
@@ -775,24 +903,21 @@ def create_app() -> FastAPI:
     app.include_router(admin_router, prefix="/api/admin", tags=["admin"])
     app.include_router(config_router, prefix="/api/admin", tags=["config"])
     app.include_router(system_router, prefix="/api/admin", tags=["system"])
-    app.include_router(acquisition_router)
-    app.include_router(audio_router)
-    app.include_router(create_book_router)
     app.include_router(creation_templates_router)
-    app.include_router(library_router)
     app.include_router(media_router)
     app.include_router(jobs_timing_router)
-    app.include_router(subtitles_router)
-    app.include_router(reading_beds_router)
-    app.include_router(reading_beds_admin_router)
     app.include_router(bookmarks_router)
     app.include_router(resume_router)
-    app.include_router(assistant_router)
-    app.include_router(exports_router)
     app.include_router(notification_router)
     app.include_router(router, prefix="/api/pipelines", tags=["pipelines"])
     app.include_router(router, prefix="/pipelines", tags=["pipelines"], include_in_schema=False)
     app.include_router(storage_router, prefix="/storage", tags=["storage"])
+    startup.install_lazy_routers(
+        app,
+        _LAZY_ROUTERS,
+        package=__package__,
+        eager=startup.resolve_startup_mode() == startup.STARTUP_MODE_EAGER,
+    )
 
     static_enabled = _configure_static_assets(app)
     if not static_enabled:
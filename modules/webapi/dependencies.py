@@ -15,6 +15,10 @@ from fastapi import Depends, Header, Query
 from .. import config_manager as cfg
 from .. import logging_manager as log_mgr
 from ..audio.api import AudioService
+from ..audio.interactive_synthesis import (
+    InteractiveSynthesisService,
+    create_interactive_synthesis_service,
+)
 from ..library import (
     LibraryRepository,
     LibraryService,
@@ -33,6 +37,12 @@ from ..services.export_service import ExportService
 from ..services.bookmark_service import BookmarkService
 from ..services.creation_template_service import CreationTemplateService
 from ..services.resume_service import ResumeService
+from ..services.playback_store import (
+    IndexedBookmarkService,
+    IndexedResumeService,
+    PlaybackStateStore,
+    use_indexed_playback_store,
+)
 from ..user_management import AuthService, LocalUserStore, SessionManager
 from ..user_management import PgUserStore, PgSessionManager
 from modules.permissions import normalize_role
@@ -304,12 +314,40 @@ def get_export_service() -> ExportService:
     )
 
 
+@lru_cache
+def get_playback_state_store() -> Optional[PlaybackStateStore]:
+    """Return the shared SQLite resume/bookmark store, or ``None`` for JSON files."""
+    if _use_postgres() or not use_indexed_playback_store():
+        return None
+    locator = get_file_locator()
+    return PlaybackStateStore(
+        locator.storage_root / "playback" / "playback.sqlite3",
+        legacy_root=locator.storage_root,
+    )
+
+
+def close_playback_state_store() -> None:
+    """Flush pending resume positions if the playback store was opened."""
+    if get_playback_state_store.cache_info().currsize == 0:
+        return
+    store = get_playback_state_store()
+    if store is not None:
+        store.close()
+    # Services holding the closed store are rebuilt on next use.
+    get_playback_state_store.cache_clear()
+    get_resume_service.cache_clear()
+    get_bookmark_service.cache_clear()
+
+
 @lru_cache
 def get_bookmark_service():
-    """Return the shared bookmark service (PG or filesystem)."""
+    """Return the shared bookmark service (PG, SQLite index or filesystem)."""
     if _use_postgres():
         from ..services.pg_bookmark_service import PgBookmarkService
         return PgBookmarkService()
+    store = get_playback_state_store()
+    if store is not None:
+        return IndexedBookmarkService(store=store, file_locator=get_file_locator())
     return BookmarkService(file_locator=get_file_locator())
 
 
@@ -322,10 +360,13 @@ def get_creation_template_service() -> CreationTemplateService:
 
 @lru_cache
 def get_resume_service():
-    """Return the shared resume service (PG or filesystem)."""
+    """Return the shared resume service (PG, SQLite index or filesystem)."""
     if _use_postgres():
         from ..services.pg_resume_service import PgResumeService
         return PgResumeService()
+    store = get_playback_state_store()
+    if store is not None:
+        return IndexedResumeService(store=store, file_locator=get_file_locator())
     return ResumeService(file_locator=get_file_locator())
 
 
@@ -343,6 +384,18 @@ def get_audio_service() -> AudioService:
     )
 
 
+@lru_cache
+def get_interactive_synthesis_service() -> InteractiveSynthesisService:
+    """Return the shared cache and single-flight front for ``/api/audio``."""
+
+    def _warm_piper_voice(voice: str) -> None:
+        from ..audio.backends.piper import warm_voice
+
+        warm_voice(voice)
+
+    return create_interactive_synthesis_service(warm_voice=_warm_piper_voice)
+
+
 @lru_cache
 def get_subtitle_service() -> SubtitleService:
     """Return the shared :class:`SubtitleService` instance."""
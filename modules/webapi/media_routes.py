@@ -157,6 +157,7 @@ def _is_regular_file(path: Path) -> bool:
 async def stream_chunk_audio_track(
     job_id: str,
     chunk_id: str,
+    request: Request,
     track: str = Query(default="trans"),
     pipeline_service: PipelineService = Depends(get_pipeline_service),
     file_locator: FileLocator = Depends(get_file_locator),
@@ -206,7 +207,7 @@ async def stream_chunk_audio_track(
             except Exception:  # pragma: no cover - defensive
                 loader = None
             if loader is not None:
-                summaries = loader.load_chunks(include_sentences=False)
+                summaries = loader.load_chunks(include_sentences=False, include_timing=False)
                 track_path = _extract_track_path_from_chunks(summaries, chunk_id, normalized_track)
 
     if track_path is None:
@@ -285,7 +286,7 @@ async def stream_chunk_audio_track(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Audio track not found")
 
 
-    return _stream_local_file(resolved_path, range_header)
+    return _stream_local_file(resolved_path, range_header, request_headers=request.headers)
 
 
 def _prepare_audio_request(
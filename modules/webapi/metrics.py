@@ -96,6 +96,29 @@ BACKPRESSURE_DELAYS = Counter(
     "Total job delays due to backpressure",
 )
 
+JOB_ADMISSION_DECISIONS = Counter(
+    "ebook_tools_jobs_admission_decisions_total",
+    "Job admission decisions by outcome and reason",
+    ["decision", "reason"],
+)
+
+JOB_ADMISSION_WAIT = Histogram(
+    "ebook_tools_jobs_admission_wait_seconds",
+    "Time jobs waited for resource admission in seconds",
+    buckets=[0.1, 1, 5, 30, 60, 300, 900, 1800, 3600],
+)
+
+JOB_ADMISSION_RESERVED = Gauge(
+    "ebook_tools_jobs_admission_reserved",
+    "Resources reserved by admitted jobs (memory_mb, cpu_cores, llm_slots, image_slots)",
+    ["resource"],
+)
+
+JOB_ADMISSION_WAITING = Gauge(
+    "ebook_tools_jobs_admission_waiting",
+    "Number of jobs waiting for resource admission",
+)
+
 # ---------------------------------------------------------------------------
 # Library
 # ---------------------------------------------------------------------------
@@ -310,6 +333,46 @@ PIPELINE_STAGE_DURATION = Histogram(
     buckets=[0.1, 0.5, 1, 5, 10, 30, 60, 300],
 )
 
+PIPELINE_SPAN_DURATION = Histogram(
+    "ebook_tools_pipeline_span_duration_seconds",
+    "Per-sentence pipeline span duration (translate, tts, align, export) in seconds",
+    ["stage"],
+    buckets=[0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60],
+)
+
+PIPELINE_QUEUE_WAIT = Histogram(
+    "ebook_tools_pipeline_queue_wait_seconds",
+    "Time a sentence spent waiting in a pipeline hand-off queue in seconds",
+    ["queue"],
+    buckets=[0.001, 0.01, 0.05, 0.1, 0.5, 1, 5, 10, 30, 60],
+)
+
+PIPELINE_LLM_TOKENS = Counter(
+    "ebook_tools_pipeline_llm_tokens_total",
+    "LLM tokens consumed by pipeline stages",
+    ["stage", "kind"],
+)
+
+FS_LOCK_WAIT = Histogram(
+    "ebook_tools_fs_lock_wait_seconds",
+    "Time spent waiting for directory locks in seconds",
+    ["scope"],
+    buckets=[0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 30, 120],
+)
+
+FS_LOCK_HOLD = Histogram(
+    "ebook_tools_fs_lock_hold_seconds",
+    "Time directory locks were held in seconds",
+    ["scope"],
+    buckets=[0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 30, 120],
+)
+
+FS_LOCK_EVENTS = Counter(
+    "ebook_tools_fs_lock_events_total",
+    "Directory lock timeouts and stale lock recoveries",
+    ["scope", "event"],
+)
+
 WORKER_POOL_UTILIZATION = Gauge(
     "ebook_tools_worker_pool_utilization",
     "Worker pool utilisation ratio (active / max)",
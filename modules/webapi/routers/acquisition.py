@@ -2,18 +2,23 @@
 
 from __future__ import annotations
 
+import json
+import threading
 import time
-from collections.abc import Mapping, Sequence
+from collections.abc import Iterator, Mapping, Sequence
+from queue import Queue
 from typing import Any
 from urllib.parse import urlsplit
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 
 from modules import logging_manager as log_mgr
 from modules.permissions import normalize_role
 from modules.services.acquisition import (
     AcquisitionArtifact,
     AcquisitionCandidate,
+    AcquisitionDiscoveryResult,
     AcquisitionJobStatus,
     AcquisitionProviderDiscoveryError,
     DownloadStationError,
@@ -25,6 +30,10 @@ from modules.services.acquisition import (
     prepare_acquisition_artifact,
     resolve_download_station_candidate_source_uri,
 )
+from modules.services.acquisition.discovery_fanout import (
+    ProviderDiscoveryUpdate,
+    get_discovery_result_cache,
+)
 from modules.services.acquisition.discovery_normalization import (
     normalize_provider as _normalize_optional_provider_id,
     normalize_source_id_filters as _normalize_source_id_filters,
@@ -45,6 +54,7 @@ from ..schemas.acquisition import (
     AcquisitionAcquireRequest,
     AcquisitionArtifactResponse,
     AcquisitionCandidatePayload,
+    AcquisitionDiscoveryProviderUpdate,
     AcquisitionDiscoveryResponse,
     AcquisitionJobCreateRequest,
     AcquisitionJobStatusResponse,
@@ -393,6 +403,7 @@ def discover(
             limit=limit,
             source_ids=source_ids,
             config=runtime_provider.resolve_config(),
+            cache=get_discovery_result_cache(),
         )
     except ValueError as exc:
         _log_provider_route("bad_request", started_at, operation="discover")
@@ -441,6 +452,108 @@ def discover(
     return response_payload
 
 
+def _sse_event(event: str, data: str) -> bytes:
+    return f"event: {event}\ndata: {data}\n\n".encode("utf-8")
+
+
+def _provider_update_payload(update: ProviderDiscoveryUpdate) -> AcquisitionDiscoveryProviderUpdate:
+    return AcquisitionDiscoveryProviderUpdate(
+        provider=update.provider,
+        status=update.status,
+        candidates=[_candidate_payload(candidate) for candidate in update.candidates],
+        elapsed_seconds=round(update.elapsed_seconds, 3),
+        note=update.note,
+    )
+
+
+@router.get("/discover/stream")
+def discover_stream(
+    media_kind: str = Query(..., pattern="^(book|video)$"),
+    q: str = Query(default=""),
+    provider: str | None = Query(default=None),
+    language: str | None = Query(default=None),
+    source_id: list[str] | None = Query(default=None),
+    limit: int = Query(default=20, ge=1, le=50),
+    runtime_provider: RuntimeContextProvider = Depends(get_runtime_context_provider),
+    request_user: RequestUserContext = Depends(get_request_user),
+) -> StreamingResponse:
+    """Stream discovery as Server-Sent Events while providers answer.
+
+    A ``provider`` event is sent as each provider finishes, followed by one
+    ``result`` event with the same ordered payload as ``/discover``, or an
+    ``error`` event carrying the status code ``/discover`` would return.
+    """
+
+    started_at = time.perf_counter()
+    _ensure_discovery_user(request_user, operation="discover_stream", started_at=started_at)
+    source_ids = _normalize_source_id_filters(source_id)
+    provider_id = _normalize_optional_provider_id(provider)
+    config = runtime_provider.resolve_config()
+    updates: Queue = Queue()
+
+    def _run_discovery() -> None:
+        try:
+            result = discover_acquisition_candidates(
+                media_kind=media_kind,
+                query=q,
+                provider=provider_id,
+                language=language,
+                limit=limit,
+                source_ids=source_ids,
+                config=config,
+                cache=get_discovery_result_cache(),
+                on_provider_result=updates.put,
+            )
+        except Exception as exc:  # handed to the stream below
+            updates.put(exc)
+        else:
+            updates.put(result)
+
+    def _events() -> Iterator[bytes]:
+        while True:
+            item = updates.get()
+            if isinstance(item, ProviderDiscoveryUpdate):
+                yield _sse_event("provider", _provider_update_payload(item).model_dump_json())
+                continue
+            if isinstance(item, AcquisitionDiscoveryResult):
+                try:
+                    payload = AcquisitionDiscoveryResponse(
+                        candidates=[_candidate_payload(candidate) for candidate in item.candidates],
+                        policy_notes=list(item.policy_notes),
+                        providers_queried=list(item.providers_queried),
+                    )
+                except Exception:
+                    item = RuntimeError("discovery payload")
+                else:
+                    _log_provider_route(
+                        "success",
+                        started_at,
+                        operation="discover_stream",
+                        provider_count=len(item.providers_queried),
+                    )
+                    yield _sse_event("result", payload.model_dump_json())
+                    return
+            if isinstance(item, ValueError):
+                _log_provider_route("bad_request", started_at, operation="discover_stream")
+                code, detail = status.HTTP_400_BAD_REQUEST, str(item)
+            elif isinstance(item, AcquisitionProviderDiscoveryError):
+                _log_provider_route(item.reason or "provider_error", started_at, operation="discover_stream")
+                code, detail = status.HTTP_502_BAD_GATEWAY, item.public_message
+            else:
+                _log_provider_route("error", started_at, operation="discover_stream")
+                _log_unexpected_route_error("discover_stream")
+                code, detail = status.HTTP_502_BAD_GATEWAY, ACQUISITION_DISCOVERY_UNAVAILABLE_MESSAGE
+            yield _sse_event("error", json.dumps({"status": code, "detail": detail}))
+            return
+
+    threading.Thread(target=_run_discovery, name="AcquisitionDiscoveryStream", daemon=True).start()
+    return StreamingResponse(
+        _events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
+
+
 @router.post(
     "/acquire",
     response_model=AcquisitionArtifactResponse,
@@ -9,17 +9,22 @@ import time
 from pathlib import Path
 from typing import Dict, Optional, Tuple
 
-from fastapi import APIRouter, HTTPException, Query
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import Response, StreamingResponse
 from gtts import gTTS
 from gtts.lang import tts_langs
-from starlette.background import BackgroundTask
 
 from modules import config_manager as cfg
 from modules import logging_manager as log_mgr
+from modules.audio.interactive_synthesis import (
+    FALLBACK_INFO_KEY,
+    InteractiveSynthesisService,
+    SynthesisKey,
+)
 from modules.audio.tts import macos_voice_inventory, normalize_gtts_language_code, select_voice
 from modules.webapi.audio_utils import resolve_language, resolve_speed, resolve_voice
 from modules.webapi.audio import get_say_voices
+from modules.webapi.dependencies import get_interactive_synthesis_service
 from modules.webapi.route_telemetry import log_started_route_result
 from modules.webapi.schemas import (
     AudioSynthesisRequest,
@@ -63,15 +68,6 @@ def _log_audio_route_result(
     )
 
 
-def _cleanup_file(path: Path) -> None:
-    """Remove ``path`` while ignoring missing files."""
-
-    try:
-        os.remove(path)
-    except FileNotFoundError:  # pragma: no cover - defensive cleanup
-        return
-
-
 def _gtts_identifier(language: str) -> str:
     """Return canonical gTTS identifier for ``language``."""
 
@@ -442,9 +438,43 @@ def match_voice(
     return response_payload
 
 
-@router.post("", response_class=FileResponse)
-def synthesize_audio(payload: AudioSynthesisRequest):  # noqa: D401 - FastAPI signature
-    """Generate synthesized speech for the supplied ``payload``."""
+def _synthesis_headers(
+    engine: str,
+    voice: str,
+    fallback_from: Optional[str],
+    metadata: Optional[Dict[str, str]],
+) -> Dict[str, str]:
+    """Return the response headers describing how a clip was synthesized."""
+
+    headers = {
+        "X-Synthesis-Engine": engine,
+        "X-Selected-Voice": voice,
+    }
+    if fallback_from:
+        headers[FALLBACK_INFO_KEY] = fallback_from
+    if metadata:
+        headers["X-MacOS-Voice-Name"] = metadata["name"]
+        headers["X-MacOS-Voice-Lang"] = metadata["lang"]
+        quality = metadata.get("quality")
+        gender = metadata.get("gender")
+        if quality:
+            headers["X-MacOS-Voice-Quality"] = quality
+        if gender:
+            headers["X-MacOS-Voice-Gender"] = gender
+    return headers
+
+
+@router.post("", response_class=Response)
+def synthesize_audio(  # noqa: D401 - FastAPI signature
+    payload: AudioSynthesisRequest,
+    service: InteractiveSynthesisService = Depends(get_interactive_synthesis_service),
+):
+    """Generate synthesized speech for the supplied ``payload``.
+
+    Identical concurrent requests share one synthesis, repeats are served
+    from the interactive audio cache and long clips stream while the engine
+    is still encoding them.
+    """
 
     started_at = time.perf_counter()
     try:
@@ -466,7 +496,6 @@ def synthesize_audio(payload: AudioSynthesisRequest):  # noqa: D401 - FastAPI si
             status_code=503,
             detail=AUDIO_SYNTHESIS_UNAVAILABLE_MESSAGE,
         ) from exc
-    fallback_from: Optional[str] = None
 
     if engine == "piper":
         log_mgr.console_info(
@@ -497,38 +526,49 @@ def synthesize_audio(payload: AudioSynthesisRequest):  # noqa: D401 - FastAPI si
             logger_obj=logger,
         )
 
-    with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as handle:
-        mp3_path = Path(handle.name)
-
-    try:
-        if engine == "piper":
+    def _produce(destination: Path, info: Dict[str, str]) -> None:
+        # Runs once per distinct clip; identical concurrent requests share it.
+        voice, active_engine, voice_metadata = selected_voice, engine, metadata
+        fallback_from: Optional[str] = None
+        if active_engine == "piper":
             try:
-                _synthesize_with_piper(text, selected_voice, language, speed, mp3_path)
+                _synthesize_with_piper(text, voice, language, speed, destination)
             except HTTPException:
                 fallback_from = "piper"
-                selected_voice, engine = _gtts_identifier(language), "gtts"
-                metadata = None
+                voice, active_engine = _gtts_identifier(language), "gtts"
+                voice_metadata = None
                 log_mgr.console_warning(
                     "Piper synthesis failed; falling back to gTTS (%s).",
-                    selected_voice,
+                    voice,
                     logger_obj=logger,
                 )
-                _synthesize_with_gtts(text, selected_voice, mp3_path)
-        elif engine == "macos":
+                _synthesize_with_gtts(text, voice, destination)
+        elif active_engine == "macos":
             try:
-                _synthesize_with_say(text, selected_voice, speed, mp3_path)
+                _synthesize_with_say(text, voice, speed, destination)
             except HTTPException:
                 fallback_from = "macos"
-                selected_voice, engine = _gtts_identifier(language), "gtts"
-                metadata = None
+                voice, active_engine = _gtts_identifier(language), "gtts"
+                voice_metadata = None
                 log_mgr.console_warning(
                     "macOS synthesis failed; falling back to gTTS (%s).",
-                    selected_voice,
+                    voice,
                     logger_obj=logger,
                 )
-                _synthesize_with_gtts(text, selected_voice, mp3_path)
+                _synthesize_with_gtts(text, voice, destination)
         else:
-            _synthesize_with_gtts(text, selected_voice, mp3_path)
+            _synthesize_with_gtts(text, voice, destination)
+        info.update(_synthesis_headers(active_engine, voice, fallback_from, voice_metadata))
+
+    key = SynthesisKey(
+        engine=engine,
+        voice=selected_voice,
+        language=language,
+        speed=int(speed),
+        text=text,
+    )
+    try:
+        result = service.synthesize(key, _produce)
     except HTTPException:
         _log_audio_route_result(
             operation="synthesize",
@@ -536,7 +576,6 @@ def synthesize_audio(payload: AudioSynthesisRequest):  # noqa: D401 - FastAPI si
             started_at=started_at,
             engine=engine,
         )
-        _cleanup_file(mp3_path)
         raise
     except Exception as exc:  # pragma: no cover - defensive fallback
         _log_audio_route_result(
@@ -545,39 +584,20 @@ def synthesize_audio(payload: AudioSynthesisRequest):  # noqa: D401 - FastAPI si
             started_at=started_at,
             engine=engine,
         )
-        _cleanup_file(mp3_path)
         raise HTTPException(status_code=500, detail="Audio synthesis failed") from exc
 
+    headers = dict(result.info)
     _log_audio_route_result(
         operation="synthesize",
         result="success",
         started_at=started_at,
-        engine=engine,
-    )
-    background = BackgroundTask(_cleanup_file, mp3_path)
-    headers = {
-        "X-Synthesis-Engine": engine,
-        "X-Selected-Voice": selected_voice,
-    }
-    if fallback_from:
-        headers["X-Synthesis-Fallback-From"] = fallback_from
-    if metadata:
-        headers["X-MacOS-Voice-Name"] = metadata["name"]
-        headers["X-MacOS-Voice-Lang"] = metadata["lang"]
-        quality = metadata.get("quality")
-        gender = metadata.get("gender")
-        if quality:
-            headers["X-MacOS-Voice-Quality"] = quality
-        if gender:
-            headers["X-MacOS-Voice-Gender"] = gender
-
-    return FileResponse(
-        path=mp3_path,
-        media_type="audio/mpeg",
-        filename="synthesis.mp3",
-        background=background,
-        headers=headers,
+        engine=headers.get("X-Synthesis-Engine", engine),
     )
+    headers["X-Synthesis-Cache"] = result.source
+    headers["Content-Disposition"] = 'attachment; filename="synthesis.mp3"'
+    if result.data is not None:
+        return Response(content=result.data, media_type="audio/mpeg", headers=headers)
+    return StreamingResponse(result.chunks, media_type="audio/mpeg", headers=headers)
 
 
 __all__ = [
@@ -9,7 +9,7 @@ from pathlib import Path
 from typing import Any, Dict, Literal, Mapping, Optional
 from urllib.parse import quote
 
-from fastapi import APIRouter, Depends, File, Header, HTTPException, Query, Response, UploadFile, status
+from fastapi import APIRouter, Depends, File, Header, HTTPException, Query, Request, Response, UploadFile, status
 from fastapi.concurrency import run_in_threadpool
 
 from .library_telemetry import (
@@ -33,8 +33,11 @@ from ..dependencies import (
     get_request_user,
     RequestUserContext,
 )
+from ..routes.media.file_responses import CONTENT_VERSION_PARAM
 from ..routes.media_routes import _stream_local_file
 from ..schemas import (
+    LibraryGroupHeaderPayload,
+    LibraryGroupPageResponse,
     LibraryItemPayload,
     LibraryMediaRemovalResponse,
     LibraryMetadataEnrichRequest,
@@ -47,6 +50,7 @@ from ..schemas import (
     LibraryIsbnLookupResponse,
     LibraryIsbnUpdateRequest,
     LibraryReindexResponse,
+    LibraryReindexStatusResponse,
     LibrarySearchResponse,
     AccessPolicyPayload,
     AccessPolicyUpdateRequest,
@@ -369,6 +373,113 @@ async def list_library_items(
     return response_payload
 
 
+_GROUP_LEVEL_KEYS = {
+    "author": "author",
+    "book_title": "bookTitle",
+    "genre": "genre",
+    "language": "language",
+}
+
+
+@router.get("/items/groups", response_model=LibraryGroupPageResponse)
+async def list_library_groups(
+    view: Literal["by_author", "by_genre", "by_language"] = Query(default="by_author"),
+    path: list[str] = Query(default_factory=list),
+    query: str | None = Query(default=None, alias="q"),
+    author: str | None = Query(default=None),
+    book: str | None = Query(default=None, alias="book"),
+    genre: str | None = Query(default=None),
+    language: str | None = Query(default=None),
+    status_filter: Literal["finished", "paused"] | None = Query(default=None, alias="status"),
+    cursor: str | None = Query(default=None),
+    limit: int = Query(default=50, ge=1, le=200),
+    sort: Literal["updated_at_desc", "updated_at_asc"] = Query(default="updated_at_desc"),
+    sync: LibrarySync = Depends(get_library_sync),
+    request_user: RequestUserContext = Depends(get_request_user),
+):
+    """Return group headers for ``path`` in a grouped view, or its items once complete.
+
+    Repeat ``path`` to expand deeper levels (e.g. author, then book title, then
+    language); pass ``nextCursor`` back as ``cursor`` for the following page.
+    """
+
+    started_at = time.perf_counter()
+    try:
+        page = sync.browse_groups(
+            view=view,
+            path=path,
+            query=query,
+            author=author,
+            book_title=book,
+            genre=genre,
+            language=language,
+            status=status_filter,
+            cursor=cursor,
+            limit=limit,
+            sort=sort,
+            user_id=request_user.user_id,
+            user_role=request_user.user_role,
+        )
+        response_payload = LibraryGroupPageResponse(
+            view=page.view,
+            path=list(page.path),
+            level=_GROUP_LEVEL_KEYS.get(page.level) if page.level else None,
+            total=page.total,
+            groups=[
+                LibraryGroupHeaderPayload(
+                    label=group.label,
+                    count=group.count,
+                    latest_updated_at=group.latest_updated_at,
+                )
+                for group in page.groups
+            ],
+            items=[
+                LibraryItemPayload.model_validate(sync.serialize_item(entry))
+                for entry in page.items
+            ],
+            next_cursor=page.next_cursor,
+        )
+    except LibraryError as exc:
+        _log_library_route_result(
+            message="Library group list failed",
+            operation="list_groups",
+            result="bad_request",
+            started_at=started_at,
+            view=view,
+            depth=len(path),
+        )
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Unable to list library groups.",
+        ) from exc
+    except Exception as exc:
+        _log_library_route_result(
+            message="Library group list failed",
+            operation="list_groups",
+            result="error",
+            started_at=started_at,
+            view=view,
+            depth=len(path),
+        )
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail="Unable to list library groups.",
+        ) from exc
+
+    _log_library_route_result(
+        message="Library group list",
+        operation="list_groups",
+        result="success",
+        started_at=started_at,
+        view=view,
+        depth=len(path),
+        total=page.total,
+        groups=len(page.groups),
+        items=len(page.items),
+    )
+    return response_payload
+
+
 @router.post("/remove-media/{job_id}", response_model=LibraryMediaRemovalResponse)
 async def remove_library_media(
     job_id: str,
@@ -1067,6 +1178,7 @@ async def lookup_isbn_metadata(
 
 @router.post("/reindex", response_model=LibraryReindexResponse)
 async def reindex_library(
+    mode: Literal["incremental", "full"] = Query("incremental"),
     service: LibraryService = Depends(get_library_service),
     request_user: RequestUserContext = Depends(get_request_user),
 ):
@@ -1075,7 +1187,8 @@ async def reindex_library(
         _log_library_reindex(result="forbidden", started_at=started_at)
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Administrator role required")
     try:
-        indexed = service.rebuild_index()
+        # Off the event loop so the status endpoint stays responsive meanwhile.
+        indexed = await run_in_threadpool(service.rebuild_index, mode=mode)
         response_payload = LibraryReindexResponse(indexed=indexed)
     except LibraryError as exc:
         _log_library_reindex(result="bad_request", started_at=started_at)
@@ -1097,6 +1210,42 @@ async def reindex_library(
     return response_payload
 
 
+@router.get("/reindex/status", response_model=LibraryReindexStatusResponse)
+async def get_library_reindex_status(
+    service: LibraryService = Depends(get_library_service),
+    request_user: RequestUserContext = Depends(get_request_user),
+):
+    started_at = time.perf_counter()
+    if (request_user.user_role or "").strip().lower() != "admin":
+        _log_library_route_result(
+            message="Library reindex status",
+            operation="reindex_status",
+            result="forbidden",
+            started_at=started_at,
+        )
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Administrator role required")
+    try:
+        response_payload = LibraryReindexStatusResponse.model_validate(service.reindex_status())
+    except Exception as exc:
+        _log_library_route_result(
+            message="Library reindex status",
+            operation="reindex_status",
+            result="error",
+            started_at=started_at,
+        )
+        raise HTTPException(
+            status_code=status.HTTP_502_BAD_GATEWAY,
+            detail="Unable to load library reindex status.",
+        ) from exc
+    _log_library_route_result(
+        message="Library reindex status",
+        operation="reindex_status",
+        result="success",
+        started_at=started_at,
+    )
+    return response_payload
+
+
 @router.get("/media/{job_id}", response_model=PipelineMediaResponse)
 async def get_library_media(
     job_id: str,
@@ -1255,6 +1404,7 @@ async def get_library_media(
 async def download_library_media(
     job_id: str,
     file_path: str,
+    request: Request,
     sync: LibrarySync = Depends(get_library_sync),
     range_header: str | None = Header(default=None, alias="Range"),
     request_user: RequestUserContext = Depends(get_request_user),
@@ -1274,7 +1424,12 @@ async def download_library_media(
                 )
                 raise
         resolved = sync.resolve_media_file(job_id, file_path)
-        response = _stream_local_file(resolved, range_header)
+        response = _stream_local_file(
+            resolved,
+            range_header,
+            request_headers=request.headers,
+            content_version=request.query_params.get(CONTENT_VERSION_PARAM),
+        )
     except LibraryNotFoundError as exc:
         _log_library_media_file_resolve(
             result="not_found",
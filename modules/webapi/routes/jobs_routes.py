@@ -7,15 +7,18 @@ import logging
 import time
 from typing import AsyncIterator, Callable
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi.responses import StreamingResponse
 
 from ...services.media_metadata_service import MediaMetadataService
 from ... import config_manager as cfg
+from ... import pipeline_trace
+from ...services.file_locator import FileLocator
 from ...services.pipeline_service import PipelineService
 from ..dependencies import (
     RequestUserContext,
     RuntimeContextProvider,
+    get_file_locator,
     get_media_metadata_service,
     get_pipeline_service,
     get_request_user,
@@ -26,6 +29,9 @@ from modules.services.job_manager import PipelineJob, PipelineJobTransitionError
 from ..schemas import (
     PipelineJobActionResponse,
     PipelineJobListResponse,
+    PipelineJobTraceResponse,
+    PipelinePlayheadRequest,
+    PipelinePlayheadResponse,
     PipelineRequestPayload,
     PipelineStatusResponse,
     PipelineSubmissionResponse,
@@ -522,6 +528,76 @@ async def get_pipeline_status_legacy(
     )
 
 
+@router.get("/jobs/{job_id}/trace", response_model=PipelineJobTraceResponse)
+async def get_job_trace(
+    job_id: str,
+    include_spans: bool = False,
+    span_limit: int = Query(default=1000, ge=1, le=pipeline_trace.DEFAULT_MAX_SPANS),
+    pipeline_service: PipelineService = Depends(get_pipeline_service),
+    file_locator: FileLocator = Depends(get_file_locator),
+    request_user: RequestUserContext = Depends(get_request_user),
+):
+    """Return the span trace summary (and optionally raw spans) for a job."""
+
+    try:
+        pipeline_service.get_job(
+            job_id,
+            user_id=request_user.user_id,
+            user_role=request_user.user_role,
+        )
+    except KeyError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=JOB_NOT_FOUND_MESSAGE) from exc
+    except PermissionError as exc:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(exc)) from exc
+
+    trace_path = file_locator.metadata_root(job_id) / pipeline_trace.TRACE_FILENAME
+    payload = await asyncio.to_thread(pipeline_trace.load_trace, trace_path)
+    if payload is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No trace recorded for this job",
+        )
+
+    spans = None
+    if include_spans:
+        raw_spans = payload.get("spans") or []
+        spans = list(raw_spans[-span_limit:])
+    return PipelineJobTraceResponse(
+        job_id=job_id,
+        summary=pipeline_trace.summarize_trace(payload),
+        runs=list(payload.get("runs") or []),
+        spans=spans,
+    )
+
+
+@router.post("/jobs/{job_id}/playhead", response_model=PipelinePlayheadResponse)
+async def report_job_playhead(
+    job_id: str,
+    payload: PipelinePlayheadRequest,
+    pipeline_service: PipelineService = Depends(get_pipeline_service),
+    request_user: RequestUserContext = Depends(get_request_user),
+):
+    """Record where a player is so pending work around it renders first."""
+
+    try:
+        job = pipeline_service.get_job(
+            job_id,
+            user_id=request_user.user_id,
+            user_role=request_user.user_role,
+        )
+    except KeyError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=JOB_NOT_FOUND_MESSAGE) from exc
+    except PermissionError as exc:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=str(exc)) from exc
+
+    tracker = job.tracker
+    if tracker is None:
+        return PipelinePlayheadResponse(job_id=job_id, sentence_number=payload.sentence_number)
+    priority = tracker.render_priority
+    priority.report(payload.sentence_number, seek=payload.seek)
+    return PipelinePlayheadResponse(job_id=job_id, **priority.snapshot())
+
+
 @router.post("/jobs/{job_id}/pause", response_model=PipelineJobActionResponse)
 async def pause_job(
     job_id: str,
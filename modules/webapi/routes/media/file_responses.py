@@ -0,0 +1,309 @@
+"""Conditional, range-aware file responses for media routes.
+
+:class:`MediaFileResponse` streams one or more byte ranges of a file.  When
+the ASGI server offers the ``http.response.zerocopysend`` extension the
+server copies the bytes with ``os.sendfile``; ``http.response.pathsend`` is
+used for whole-file bodies.  Otherwise the file is read with ``os.pread`` in
+large chunks on a worker thread so the event loop only forwards buffers.
+
+Validators are strong ETags derived from ``(inode, size, mtime_ns)`` and the
+file's ``Last-Modified`` time; :func:`is_not_modified` and
+:func:`range_is_current` implement the ``If-None-Match`` /
+``If-Modified-Since`` / ``If-Range`` rules from RFC 9110.  URLs built with
+:func:`versioned_url` carry the ETag as ``?v=`` so responses to them can be
+cached as immutable: a rewritten file gets a new version and a new URL.
+"""
+
+from __future__ import annotations
+
+import os
+import secrets
+from dataclasses import dataclass
+from email.utils import formatdate, parsedate_to_datetime
+from pathlib import Path
+from typing import List, Mapping, Optional, Sequence, Tuple
+
+import anyio
+from starlette.background import BackgroundTask
+from starlette.responses import Response
+from starlette.types import Receive, Scope, Send
+
+READ_CHUNK_SIZE = 1 << 20
+MAX_RANGES = 16
+
+IMMUTABLE_CACHE_CONTROL = "private, max-age=31536000, immutable"
+REVALIDATE_CACHE_CONTROL = "private, no-cache"
+CONTENT_VERSION_PARAM = "v"
+
+ByteRange = Tuple[int, int]
+
+
+class RangeNotSatisfiable(Exception):
+    """Raised when the supplied Range header cannot be satisfied."""
+
+
+@dataclass(frozen=True)
+class FileValidators:
+    """Cache validators for one version of a file."""
+
+    etag: str
+    last_modified: str
+    mtime_seconds: int
+
+    @classmethod
+    def from_stat(cls, stat_result: os.stat_result) -> "FileValidators":
+        etag = (
+            f'"{stat_result.st_ino:x}-{stat_result.st_size:x}-{stat_result.st_mtime_ns:x}"'
+        )
+        mtime_seconds = int(stat_result.st_mtime)
+        return cls(
+            etag=etag,
+            last_modified=formatdate(mtime_seconds, usegmt=True),
+            mtime_seconds=mtime_seconds,
+        )
+
+    @property
+    def version(self) -> str:
+        """Return the ETag without quotes, as used in versioned URLs."""
+
+        return self.etag.strip('"')
+
+
+def versioned_url(url: str, stat_result: os.stat_result) -> str:
+    """Return ``url`` with the file's current version as a query parameter."""
+
+    separator = "&" if "?" in url else "?"
+    version = FileValidators.from_stat(stat_result).version
+    return f"{url}{separator}{CONTENT_VERSION_PARAM}={version}"
+
+
+def _parse_http_date(value: str) -> Optional[int]:
+    try:
+        parsed = parsedate_to_datetime(value.strip())
+    except (TypeError, ValueError, IndexError):
+        return None
+    if parsed is None:
+        return None
+    return int(parsed.timestamp())
+
+
+def _etag_list(value: str) -> List[str]:
+    return [token.strip() for token in value.split(",") if token.strip()]
+
+
+def _weak_match(candidate: str, etag: str) -> bool:
+    def _opaque(tag: str) -> str:
+        return tag[2:] if tag.startswith("W/") else tag
+
+    return candidate == "*" or _opaque(candidate) == _opaque(etag)
+
+
+def is_not_modified(headers: Mapping[str, str], validators: FileValidators) -> bool:
+    """Return ``True`` when a GET should be answered with ``304 Not Modified``."""
+
+    if_none_match = headers.get("if-none-match")
+    if if_none_match is not None:
+        return any(_weak_match(tag, validators.etag) for tag in _etag_list(if_none_match))
+    if_modified_since = headers.get("if-modified-since")
+    if if_modified_since:
+        since = _parse_http_date(if_modified_since)
+        return since is not None and validators.mtime_seconds <= since
+    return False
+
+
+def range_is_current(if_range: Optional[str], validators: FileValidators) -> bool:
+    """Return ``True`` when the Range header should be honoured.
+
+    ``If-Range`` requires a strong comparison: weak ETags never match and a
+    date only matches the exact ``Last-Modified`` value.
+    """
+
+    if not if_range:
+        return True
+    value = if_range.strip()
+    if value.startswith("W/"):
+        return False
+    if value.startswith('"'):
+        return value == validators.etag
+    since = _parse_http_date(value)
+    return since is not None and since == validators.mtime_seconds
+
+
+def parse_ranges(range_value: str, file_size: int) -> Optional[List[ByteRange]]:
+    """Return the inclusive byte ranges requested by ``range_value``.
+
+    Overlapping and adjacent ranges are coalesced and returned in ascending
+    order.  ``None`` means the header should be ignored (unknown unit or an
+    excessive number of ranges) and the full file served instead.
+    :class:`RangeNotSatisfiable` is raised when the header is malformed or no
+    range overlaps the file contents.
+    """
+
+    header = range_value.strip()
+    if not header.lower().startswith("bytes="):
+        if "=" in header:
+            return None
+        raise RangeNotSatisfiable
+    if file_size <= 0:
+        raise RangeNotSatisfiable
+
+    specs = [spec.strip() for spec in header[len("bytes=") :].split(",")]
+    if len(specs) > MAX_RANGES:
+        return None
+
+    ranges: List[ByteRange] = []
+    for spec in specs:
+        if "-" not in spec:
+            raise RangeNotSatisfiable
+        start_token, end_token = (token.strip() for token in spec.split("-", 1))
+        if not start_token:
+            # suffix-byte-range-spec: bytes=-N
+            if not end_token.isdigit() or int(end_token) <= 0:
+                raise RangeNotSatisfiable
+            ranges.append((max(file_size - int(end_token), 0), file_size - 1))
+            continue
+        if not start_token.isdigit():
+            raise RangeNotSatisfiable
+        start = int(start_token)
+        if end_token:
+            if not end_token.isdigit():
+                raise RangeNotSatisfiable
+            end = int(end_token)
+            if end < start:
+                raise RangeNotSatisfiable
+        else:
+            end = file_size - 1
+        if start >= file_size:
+            continue
+        ranges.append((start, min(end, file_size - 1)))
+
+    if not ranges:
+        raise RangeNotSatisfiable
+
+    ranges.sort()
+    merged: List[ByteRange] = [ranges[0]]
+    for start, end in ranges[1:]:
+        last_start, last_end = merged[-1]
+        if start <= last_end + 1:
+            merged[-1] = (last_start, max(last_end, end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+class MediaFileResponse(Response):
+    """Stream ``ranges`` of ``path``; several ranges become multipart/byteranges."""
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        file_size: int,
+        ranges: Optional[Sequence[ByteRange]] = None,
+        status_code: int = 200,
+        headers: Optional[Mapping[str, str]] = None,
+        media_type: Optional[str] = None,
+        background: Optional[BackgroundTask] = None,
+    ) -> None:
+        self.path = Path(path)
+        self.file_size = int(file_size)
+        self.status_code = status_code
+        self.media_type = media_type or "application/octet-stream"
+        self.background = background
+        self.ranges: List[ByteRange] = (
+            list(ranges) if ranges is not None else ([(0, file_size - 1)] if file_size > 0 else [])
+        )
+        self._parts: List[Tuple[bytes, int, int]] = []
+        self._trailer = b""
+        content_type = self.media_type
+        if len(self.ranges) > 1:
+            boundary = secrets.token_hex(12)
+            content_type = f"multipart/byteranges; boundary={boundary}"
+            for start, end in self.ranges:
+                part_header = (
+                    f"\r\n--{boundary}\r\n"
+                    f"Content-Type: {self.media_type}\r\n"
+                    f"Content-Range: bytes {start}-{end}/{self.file_size}\r\n\r\n"
+                ).encode("latin-1")
+                self._parts.append((part_header, start, end))
+            self._trailer = f"\r\n--{boundary}--\r\n".encode("latin-1")
+        else:
+            self._parts = [(b"", start, end) for start, end in self.ranges]
+
+        self.body = b""
+        self.init_headers(headers)
+        self.headers["content-type"] = content_type
+        self.headers["content-length"] = str(self.content_length)
+
+    @property
+    def content_length(self) -> int:
+        total = len(self._trailer)
+        for part_header, start, end in self._parts:
+            total += len(part_header) + (end - start + 1)
+        return total
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        extensions = scope.get("extensions") or {}
+        await send(
+            {
+                "type": "http.response.start",
+                "status": self.status_code,
+                "headers": self.raw_headers,
+            }
+        )
+        if scope.get("method", "GET").upper() == "HEAD" or not self._parts:
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+        elif (
+            "http.response.pathsend" in extensions
+            and len(self._parts) == 1
+            and self._parts[0][1:] == (0, self.file_size - 1)
+        ):
+            await send({"type": "http.response.pathsend", "path": str(self.path)})
+        else:
+            await self._send_parts(send, zerocopy="http.response.zerocopysend" in extensions)
+        if self.background is not None:
+            await self.background()
+
+    async def _send_parts(self, send: Send, *, zerocopy: bool) -> None:
+        with open(self.path, "rb") as handle:
+            descriptor = handle.fileno()
+            for part_header, start, end in self._parts:
+                if part_header:
+                    await send(
+                        {"type": "http.response.body", "body": part_header, "more_body": True}
+                    )
+                if zerocopy:
+                    await send(
+                        {
+                            "type": "http.response.zerocopysend",
+                            "file": handle,
+                            "offset": start,
+                            "count": end - start + 1,
+                            "more_body": True,
+                        }
+                    )
+                    continue
+                offset = start
+                while offset <= end:
+                    length = min(READ_CHUNK_SIZE, end - offset + 1)
+                    chunk = await anyio.to_thread.run_sync(os.pread, descriptor, length, offset)
+                    if not chunk:
+                        break
+                    offset += len(chunk)
+                    await send({"type": "http.response.body", "body": chunk, "more_body": True})
+        await send({"type": "http.response.body", "body": self._trailer, "more_body": False})
+
+
+__all__ = [
+    "CONTENT_VERSION_PARAM",
+    "IMMUTABLE_CACHE_CONTROL",
+    "MAX_RANGES",
+    "MediaFileResponse",
+    "REVALIDATE_CACHE_CONTROL",
+    "RangeNotSatisfiable",
+    "FileValidators",
+    "is_not_modified",
+    "parse_ranges",
+    "range_is_current",
+    "versioned_url",
+]
@@ -30,6 +30,7 @@ from ...schemas import (
     PipelineMediaResponse,
 )
 from .audio_roles import canonical_audio_track_key, canonical_timing_track_key
+from .file_responses import versioned_url
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -286,6 +287,8 @@ def _build_media_file(
         if stat_result is not None:
             size = int(stat_result.st_size)
             updated_at = datetime.fromtimestamp(stat_result.st_mtime, tz=timezone.utc)
+            if url:
+                url = versioned_url(url, stat_result)
     if size is None:
         for size_key in ("size", "size_bytes", "sizeBytes"):
             size_candidate = _coerce_int(entry.get(size_key))
@@ -8,10 +8,10 @@ import stat as stat_module
 import time
 import urllib.parse
 from pathlib import Path
-from typing import Iterator, Optional, Tuple
+from typing import Any, Mapping, Optional
 
-from fastapi import APIRouter, Depends, Header, HTTPException, status
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, status
+from fastapi.responses import Response
 
 from .... import config_manager as cfg
 from .... import logging_manager as log_mgr
@@ -25,95 +25,30 @@ from ...dependencies import (
     get_request_user,
 )
 from ...route_telemetry import log_labeled_route_result
+from .file_responses import (
+    CONTENT_VERSION_PARAM,
+    IMMUTABLE_CACHE_CONTROL,
+    REVALIDATE_CACHE_CONTROL,
+    FileValidators,
+    MediaFileResponse,
+    RangeNotSatisfiable,
+    is_not_modified,
+    parse_ranges,
+    range_is_current,
+)
 
 storage_router = APIRouter()
 logger = log_mgr.get_logger()
 
 STORAGE_JOB_NOT_FOUND_MESSAGE = "Job not found"
 STORAGE_JOB_FORBIDDEN_MESSAGE = "Not authorized to access job files"
-
-
-class _RangeParseError(Exception):
-    """Raised when the supplied Range header cannot be satisfied."""
+COVER_CACHE_CONTROL = "public, max-age=86400"
 
 
 def _normalize_route_id(value: str) -> str:
     return value.strip()
 
 
-def _parse_byte_range(range_value: str, file_size: int) -> Tuple[int, int]:
-    """Return the inclusive byte range requested by ``range_value``.
-
-    ``range_value`` must follow the ``bytes=start-end`` syntax. Only a single range is
-    supported and the resulting indices are clamped to the available file size. A
-    :class:`_RangeParseError` is raised when the header is malformed or does not
-    overlap the file contents.
-    """
-
-    if file_size <= 0:
-        raise _RangeParseError
-
-    header = range_value.strip()
-    if not header.lower().startswith("bytes="):
-        raise _RangeParseError
-
-    raw_spec = header[len("bytes=") :].strip()
-    if "," in raw_spec:
-        raise _RangeParseError
-
-    if "-" not in raw_spec:
-        raise _RangeParseError
-
-    start_token, end_token = raw_spec.split("-", 1)
-
-    if not start_token:
-        # suffix-byte-range-spec: bytes=-N
-        if not end_token.isdigit():
-            raise _RangeParseError
-        length = int(end_token)
-        if length <= 0:
-            raise _RangeParseError
-        start = max(file_size - length, 0)
-        end = file_size - 1
-    else:
-        if not start_token.isdigit():
-            raise _RangeParseError
-        start = int(start_token)
-        if start >= file_size:
-            raise _RangeParseError
-
-        if end_token:
-            if not end_token.isdigit():
-                raise _RangeParseError
-            end = int(end_token)
-            if end < start:
-                raise _RangeParseError
-            end = min(end, file_size - 1)
-        else:
-            end = file_size - 1
-
-    return start, end
-
-
-def _iter_file_chunks(path: Path, start: int, end: int) -> Iterator[bytes]:
-    """Yield chunks from ``path`` between ``start`` and ``end`` (inclusive)."""
-
-    chunk_size = 1 << 16
-    total = max(end - start + 1, 0)
-    if total <= 0:
-        return
-
-    with path.open("rb") as stream:
-        stream.seek(start)
-        remaining = total
-        while remaining > 0:
-            chunk = stream.read(min(chunk_size, remaining))
-            if not chunk:
-                break
-            remaining -= len(chunk)
-            yield chunk
-
-
 def _media_kind_for(path: Path, media_type: str | None = None) -> str:
     if media_type:
         if media_type.startswith("audio/"):
@@ -162,7 +97,7 @@ def _log_media_stream(
             "media_kind": media_kind,
         },
         started_at=started_at,
-        success_results=frozenset({"full", "partial"}),
+        success_results=frozenset({"full", "partial", "not_modified"}),
         duration_first=False,
         log_label_names=("result", "media_kind"),
         status=status_code,
@@ -170,7 +105,28 @@ def _log_media_stream(
     )
 
 
-def _stream_local_file(resolved_path: Path, range_header: str | None = None) -> StreamingResponse:
+def _cacheable_media(media_type: str | None) -> bool:
+    return bool(media_type) and media_type.startswith(("video/", "audio/", "image/"))
+
+
+def _stream_local_file(
+    resolved_path: Path,
+    range_header: str | None = None,
+    *,
+    request_headers: Mapping[str, str] | None = None,
+    content_version: str | None = None,
+    cache_control: str | None = None,
+) -> Response:
+    """Return ``resolved_path`` honouring Range and conditional request headers.
+
+    ``request_headers`` supplies ``If-None-Match``/``If-Modified-Since``/
+    ``If-Range``.  Finished media can still be rewritten in place (regenerated
+    images, restarted jobs), so audio/video/image files are only marked
+    immutable when ``content_version`` (the URL's ``?v=``) names the file's
+    current ETag; everything else revalidates unless ``cache_control`` is
+    given explicitly.
+    """
+
     started_at = time.perf_counter()
     media_kind = _media_kind_for(resolved_path)
     stat_result = _regular_file_stat(resolved_path)
@@ -206,15 +162,32 @@ def _stream_local_file(resolved_path: Path, range_header: str | None = None) ->
             return True
         return False
 
-    if range_header and "," in range_header:
-        # Some clients (notably iOS Safari) request multiple ranges. Honor the first range
-        # so the response stays 206 instead of reverting to a full-body 200.
-        range_header = range_header.split(",", 1)[0].strip()
+    conditional_headers = request_headers or {}
+    validators = FileValidators.from_stat(stat_result)
+    headers = {
+        "Accept-Ranges": "bytes",
+        "ETag": validators.etag,
+        "Last-Modified": validators.last_modified,
+    }
+    if cache_control is None:
+        cacheable = content_version == validators.version and _cacheable_media(media_type)
+        cache_control = IMMUTABLE_CACHE_CONTROL if cacheable else REVALIDATE_CACHE_CONTROL
+    headers["Cache-Control"] = cache_control
+
+    if is_not_modified(conditional_headers, validators):
+        _log_media_stream(
+            "not_modified",
+            media_kind,
+            started_at,
+            status_code=status.HTTP_304_NOT_MODIFIED,
+        )
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
 
-    if range_header:
+    ranges = None
+    if range_header and range_is_current(conditional_headers.get("if-range"), validators):
         try:
-            start, end = _parse_byte_range(range_header, file_size)
-        except _RangeParseError as exc:
+            ranges = parse_ranges(range_header, file_size)
+        except RangeNotSatisfiable as exc:
             _log_media_stream(
                 "range_unsatisfiable",
                 media_kind,
@@ -226,19 +199,15 @@ def _stream_local_file(resolved_path: Path, range_header: str | None = None) ->
                 detail="Requested range not satisfiable",
                 headers={"Content-Range": f"bytes */{file_size}"},
             ) from exc
+
+    if ranges:
         status_code = status.HTTP_206_PARTIAL_CONTENT
-        headers = {
-            "Content-Range": f"bytes {start}-{end}/{file_size}",
-            "Accept-Ranges": "bytes",
-        }
-    if not range_header:
-        start = 0
-        end = file_size - 1 if file_size > 0 else -1
+        if len(ranges) == 1:
+            start, end = ranges[0]
+            headers["Content-Range"] = f"bytes {start}-{end}/{file_size}"
+    else:
         status_code = status.HTTP_200_OK
-        headers = {"Accept-Ranges": "bytes"}
 
-    content_length = max(end - start + 1, 0)
-    headers["Content-Length"] = str(content_length)
     # Latin-1 header encoding will fail on filenames with accents; provide a
     # safe ASCII fallback while still advertising the UTF-8 name via RFC 5987.
     original_name = resolved_path.name
@@ -251,22 +220,24 @@ def _stream_local_file(resolved_path: Path, range_header: str | None = None) ->
     if media_type and media_type.startswith(("video/", "audio/")):
         headers["X-Accel-Buffering"] = "no"
 
+    response = MediaFileResponse(
+        resolved_path,
+        file_size=file_size,
+        ranges=ranges,
+        status_code=status_code,
+        headers=headers,
+        media_type=media_type or "application/octet-stream",
+    )
+
     result = "partial" if status_code == status.HTTP_206_PARTIAL_CONTENT else "full"
     _log_media_stream(
         result,
         media_kind,
         started_at,
         status_code=status_code,
-        content_length=content_length,
-    )
-
-    body_iterator = _iter_file_chunks(resolved_path, start, end)
-    return StreamingResponse(
-        body_iterator,
-        status_code=status_code,
-        media_type=media_type or "application/octet-stream",
-        headers=headers,
+        content_length=response.content_length,
     )
+    return response
 
 
 async def _download_job_file(
@@ -274,6 +245,9 @@ async def _download_job_file(
     filename: str,
     file_locator: FileLocator,
     range_header: str | None,
+    *,
+    request_headers: Mapping[str, str] | None = None,
+    content_version: str | None = None,
 ):
     """Return a streaming response for the requested job file."""
 
@@ -287,7 +261,12 @@ async def _download_job_file(
         if _regular_file_stat(resolved_path) is None:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="File not found")
 
-    return _stream_local_file(resolved_path, range_header)
+    return _stream_local_file(
+        resolved_path,
+        range_header,
+        request_headers=request_headers,
+        content_version=content_version,
+    )
 
 
 def _resolve_alternate_job_path(job_id: str, filename: str) -> Optional[Path]:
@@ -322,14 +301,14 @@ def _ensure_job_access(
     *,
     pipeline_service: PipelineService,
     request_user: RequestUserContext,
-) -> None:
+) -> Any:
     if not job_id:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=STORAGE_JOB_NOT_FOUND_MESSAGE,
         )
     try:
-        pipeline_service.get_job(
+        return pipeline_service.get_job(
             job_id,
             user_id=request_user.user_id,
             user_role=request_user.user_role,
@@ -350,6 +329,7 @@ def _ensure_job_access(
 async def download_job_file(
     job_id: str,
     filename: str,
+    request: Request,
     file_locator: FileLocator = Depends(get_file_locator),
     pipeline_service: PipelineService = Depends(get_pipeline_service),
     request_user: RequestUserContext = Depends(get_request_user),
@@ -363,13 +343,21 @@ async def download_job_file(
         pipeline_service=pipeline_service,
         request_user=request_user,
     )
-    return await _download_job_file(normalized_job_id, filename, file_locator, range_header)
+    return await _download_job_file(
+        normalized_job_id,
+        filename,
+        file_locator,
+        range_header,
+        request_headers=request.headers,
+        content_version=request.query_params.get(CONTENT_VERSION_PARAM),
+    )
 
 
 @storage_router.get("/jobs/{job_id}/{filename:path}")
 async def download_job_file_without_prefix(
     job_id: str,
     filename: str,
+    request: Request,
     file_locator: FileLocator = Depends(get_file_locator),
     pipeline_service: PipelineService = Depends(get_pipeline_service),
     request_user: RequestUserContext = Depends(get_request_user),
@@ -383,15 +371,28 @@ async def download_job_file_without_prefix(
         pipeline_service=pipeline_service,
         request_user=request_user,
     )
-    return await _download_job_file(normalized_job_id, filename, file_locator, range_header)
+    return await _download_job_file(
+        normalized_job_id,
+        filename,
+        file_locator,
+        range_header,
+        request_headers=request.headers,
+        content_version=request.query_params.get(CONTENT_VERSION_PARAM),
+    )
 
 
 @storage_router.get("/covers/{filename:path}")
 async def download_cover_file(
     filename: str,
+    request: Request,
     range_header: str | None = Header(default=None, alias="Range"),
 ):
     """Serve cover images stored in the shared covers directory."""
 
     resolved_path = _resolve_cover_download_path(filename)
-    return _stream_local_file(resolved_path, range_header)
+    return _stream_local_file(
+        resolved_path,
+        range_header,
+        request_headers=request.headers,
+        cache_control=COVER_CACHE_CONTROL,
+    )
@@ -2,15 +2,30 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import stat as stat_module
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
 from fastapi.concurrency import run_in_threadpool
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 
+from ....chunk_index import (
+    chunk_policy_summary,
+    combine_policy_summaries,
+    current_index_entries,
+    load_chunk_index,
+)
+from ....core.rendering.timing_columns import (
+    TIMING_COLUMNS_DIRNAME,
+    TIMING_COLUMNS_MEDIA_TYPE,
+    TimingColumnSlice,
+    TimingColumnStore,
+)
 from ....metadata_manager import MetadataLoader
 from ....library import LibraryRepository
 from ....permissions import can_access, resolve_access_policy
@@ -24,7 +39,11 @@ from ...dependencies import (
     get_request_user,
 )
 from modules.services.job_manager import PipelineJob
-from ...schemas.pipeline_timing import JobTimingResponse
+from ...schemas.pipeline_timing import (
+    JobTimingRangeChunk,
+    JobTimingRangeResponse,
+    JobTimingResponse,
+)
 from .audio_roles import canonical_audio_track_key, canonical_timing_track_key
 from .common import _resolve_job_path
 
@@ -33,6 +52,10 @@ jobs_timing_router = APIRouter(prefix="/api/jobs", tags=["jobs"])
 JOB_TIMING_NOT_FOUND_MESSAGE = "Job not found"
 JOB_TIMING_FORBIDDEN_MESSAGE = "Not authorized to access timing"
 
+_POLICY_CACHE_SIZE = 128
+_policy_cache: "OrderedDict[Path, tuple[tuple[Any, ...], tuple[Optional[str], bool]]]" = OrderedDict()
+_policy_cache_lock = threading.Lock()
+
 
 def _normalize_route_id(value: str) -> str:
     return value.strip()
@@ -99,140 +122,73 @@ def smooth_token_edges(
     return smoothed
 
 
-def _iter_sentence_payloads(payload: Any) -> Iterator[Mapping[str, Any]]:
-    """Yield flattened sentence entries from chunk payloads."""
-
-    if isinstance(payload, Mapping):
-        sentences = payload.get("sentences")
-        if isinstance(sentences, Sequence) and not isinstance(sentences, (str, bytes)):
-            for entry in sentences:
-                yield from _iter_sentence_payloads(entry)
-            return
-        yield payload
-        return
-    if isinstance(payload, Sequence) and not isinstance(payload, (str, bytes)):
-        for entry in payload:
-            yield from _iter_sentence_payloads(entry)
-
-
-def _extract_highlighting_policy(entry: Mapping[str, Any]) -> Optional[str]:
-    """Return the highlighting policy encoded on a sentence entry."""
-
-    summary = entry.get("highlighting_summary")
-    if isinstance(summary, Mapping):
-        policy = summary.get("policy")
-        if isinstance(policy, str) and policy.strip():
-            return policy.strip()
-    candidate = entry.get("highlighting_policy")
-    if isinstance(candidate, str) and candidate.strip():
-        return candidate.strip()
-    return None
-
-
-def _extract_policy_from_timing_tracks(
-    payload: Mapping[str, Any],
-) -> tuple[Optional[str], bool]:
-    tracks = payload.get("timingTracks")
-    if not isinstance(tracks, Mapping):
-        tracks = None
-    fallback: Optional[str] = None
-    estimated = False
-    top_level = payload.get("highlighting_policy")
-    if isinstance(top_level, str) and top_level.strip():
-        normalized = top_level.strip()
-        if _is_estimated_policy(normalized):
-            return normalized, True
-        fallback = normalized
-    if not isinstance(tracks, Mapping):
-        return fallback, estimated
-    for entries in tracks.values():
-        if not isinstance(entries, list):
-            continue
-        for entry in entries:
-            if not isinstance(entry, Mapping):
-                continue
-            policy = entry.get("policy")
-            if not isinstance(policy, str):
-                continue
-            normalized = policy.strip()
-            if not normalized:
-                continue
-            if _is_estimated_policy(normalized):
-                return normalized, True
-            if fallback is None:
-                fallback = normalized
-    return fallback, estimated
-
-
-def _is_estimated_policy(policy: Optional[str]) -> bool:
-    if not isinstance(policy, str):
-        return False
-    normalized = policy.strip().lower()
-    return normalized.startswith("estimated")
-
-
 def _probe_highlighting_policy(
     metadata_root: Path,
     default_policy: Optional[str],
 ) -> tuple[Optional[str], bool]:
-    """Resolve the highlighting policy and whether estimated timings exist."""
+    """Resolve the highlighting policy and whether estimated timings exist.
+
+    Results are cached per metadata directory and reused until a chunk file
+    changes, so repeated timing requests only stat the chunk files.  On a
+    cache miss the job's chunk summary index answers when it is current;
+    otherwise the chunk files are scanned.
+    """
+
+    chunk_paths = sorted(metadata_root.glob("chunk_*.json")) if _safe_is_dir(metadata_root) else []
+    chunk_stats = [(chunk_path.name, safe_stat(chunk_path)) for chunk_path in chunk_paths]
+    signature: List[Any] = [default_policy]
+    for name, stat_result in chunk_stats:
+        if stat_result is None:
+            signature.append((name, None))
+        else:
+            signature.append((name, stat_result.st_mtime_ns, stat_result.st_size))
+    cache_key = tuple(signature)
+    with _policy_cache_lock:
+        cached = _policy_cache.get(metadata_root)
+        if cached is not None and cached[0] == cache_key:
+            _policy_cache.move_to_end(metadata_root)
+            return cached[1]
+    indexed = current_index_entries(load_chunk_index(metadata_root), chunk_stats)
+    if indexed is not None:
+        result = combine_policy_summaries(
+            ((entry.get("highlighting_policy"), entry.get("estimated_policy")) for entry in indexed),
+            default_policy,
+        )
+    else:
+        result = _scan_highlighting_policy(chunk_paths, default_policy)
+    with _policy_cache_lock:
+        _policy_cache[metadata_root] = (cache_key, result)
+        _policy_cache.move_to_end(metadata_root)
+        while len(_policy_cache) > _POLICY_CACHE_SIZE:
+            _policy_cache.popitem(last=False)
+    return result
 
-    normalized_default = None
-    if isinstance(default_policy, str) and default_policy.strip():
-        normalized_default = default_policy.strip()
-    estimated_detected = _is_estimated_policy(normalized_default)
-    fallback_policy: Optional[str] = normalized_default
 
-    if _safe_is_dir(metadata_root):
-        for chunk_path in sorted(metadata_root.glob("chunk_*.json")):
+def _scan_highlighting_policy(
+    chunk_paths: Sequence[Path],
+    default_policy: Optional[str],
+) -> tuple[Optional[str], bool]:
+    def _summaries() -> Iterator[tuple[Optional[str], Optional[str]]]:
+        for chunk_path in chunk_paths:
             try:
                 with chunk_path.open("r", encoding="utf-8") as handle:
                     chunk_payload = json.load(handle)
             except (OSError, json.JSONDecodeError):
                 continue
-            if isinstance(chunk_payload, Mapping):
-                policy, estimated = _extract_policy_from_timing_tracks(chunk_payload)
-                if policy:
-                    if estimated:
-                        return policy, True
-                    if fallback_policy is None:
-                        fallback_policy = policy
-                estimated_detected = estimated_detected or estimated
-            for entry in _iter_sentence_payloads(chunk_payload):
-                if isinstance(entry, Mapping):
-                    policy = _extract_highlighting_policy(entry)
-                    if policy:
-                        normalized = policy.strip()
-                        if _is_estimated_policy(normalized):
-                            return normalized, True
-                        if fallback_policy is None:
-                            fallback_policy = normalized
-    if fallback_policy is not None:
-        estimated_detected = estimated_detected or _is_estimated_policy(fallback_policy)
-    return fallback_policy, estimated_detected
+            yield chunk_policy_summary(chunk_payload)
 
+    return combine_policy_summaries(_summaries(), default_policy)
 
-@jobs_timing_router.get(
-    "/{job_id}/timing",
-    response_class=JSONResponse,
-    response_model=JobTimingResponse,
-)
-async def get_job_timing(
-    job_id: str,
-    *,
-    job_manager = Depends(get_pipeline_job_manager),
-    locator: FileLocator = Depends(get_file_locator),
-    library_repository: LibraryRepository = Depends(get_library_repository),
-    request_user: RequestUserContext = Depends(get_request_user),
-) -> JSONResponse:
-    """Return flattened per-word timing data for ``job_id``."""
 
-    normalized_job_id = _normalize_route_id(job_id)
-    if not normalized_job_id:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=JOB_TIMING_NOT_FOUND_MESSAGE,
-        )
+async def _resolve_timing_job(
+    normalized_job_id: str,
+    *,
+    job_manager,
+    locator: FileLocator,
+    library_repository: LibraryRepository,
+    request_user: RequestUserContext,
+) -> tuple[Path, Mapping[str, Any]]:
+    """Return the storage root and result payload of a job or library entry."""
 
     job_root: Path
     result_payload: Mapping[str, Any] = {}
@@ -308,6 +264,39 @@ async def get_job_timing(
                     job_root = candidate_root
         result_payload = job.result_payload if isinstance(job.result_payload, Mapping) else {}
 
+    return job_root, result_payload
+
+
+@jobs_timing_router.get(
+    "/{job_id}/timing",
+    response_class=JSONResponse,
+    response_model=JobTimingResponse,
+)
+async def get_job_timing(
+    job_id: str,
+    *,
+    job_manager = Depends(get_pipeline_job_manager),
+    locator: FileLocator = Depends(get_file_locator),
+    library_repository: LibraryRepository = Depends(get_library_repository),
+    request_user: RequestUserContext = Depends(get_request_user),
+) -> JSONResponse:
+    """Return flattened per-word timing data for ``job_id``."""
+
+    normalized_job_id = _normalize_route_id(job_id)
+    if not normalized_job_id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=JOB_TIMING_NOT_FOUND_MESSAGE,
+        )
+
+    job_root, result_payload = await _resolve_timing_job(
+        normalized_job_id,
+        job_manager=job_manager,
+        locator=locator,
+        library_repository=library_repository,
+        request_user=request_user,
+    )
+
     timing_tracks = result_payload.get("timing_tracks") if isinstance(result_payload, Mapping) else None
     if not isinstance(timing_tracks, Mapping):
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No timing track available")
@@ -456,3 +445,125 @@ async def get_job_timing(
         content=response_payload.model_dump(mode="json", by_alias=True),
         headers=headers,
     )
+
+
+def _read_timing_range(
+    store: TimingColumnStore,
+    from_sentence: Optional[int],
+    to_sentence: Optional[int],
+    tracks: Optional[tuple[str, ...]],
+) -> Optional[tuple[List[TimingColumnSlice], str]]:
+    """Read a sentence range and its ETag digest; ``None`` without columns.
+
+    Lists and stats the chunk files, so callers run it on a worker thread.
+    """
+
+    chunk_files = store.chunks()
+    if not chunk_files:
+        return None
+    slices = store.read_range(from_sentence, to_sentence, tracks=tracks)
+
+    digest_parts = [f"{from_sentence or ''}-{to_sentence or ''}-{tracks[0] if tracks else ''}"]
+    for start, end, path in chunk_files:
+        if (from_sentence is not None and end < from_sentence) or (
+            to_sentence is not None and start > to_sentence
+        ):
+            continue
+        stat_result = safe_stat(path)
+        if stat_result is not None:
+            digest_parts.append(f"{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}")
+    # Wide ranges span thousands of chunks; keep the header a fixed size.
+    return slices, hashlib.sha1("|".join(digest_parts).encode("utf-8")).hexdigest()
+
+
+@jobs_timing_router.get(
+    "/{job_id}/timing/range",
+    response_model=JobTimingRangeResponse,
+    responses={200: {"content": {TIMING_COLUMNS_MEDIA_TYPE: {}}}},
+)
+async def get_job_timing_range(
+    job_id: str,
+    from_sentence: Optional[int] = Query(default=None, ge=1),
+    to_sentence: Optional[int] = Query(default=None, ge=1),
+    track: Optional[str] = Query(default=None),
+    accept: Optional[str] = Header(default=None),
+    *,
+    job_manager = Depends(get_pipeline_job_manager),
+    locator: FileLocator = Depends(get_file_locator),
+    library_repository: LibraryRepository = Depends(get_library_repository),
+    request_user: RequestUserContext = Depends(get_request_user),
+) -> Response:
+    """Return word timing for sentences ``from_sentence..to_sentence``.
+
+    Served from the columnar timing files written at export time; only the
+    chunks overlapping the range are opened and only the matching column
+    slices are read.  Clients sending ``Accept: application/vnd.ebook-tools.timing-columns`` receive the
+    packed blobs; everyone else gets the JSON form.
+    """
+
+    normalized_job_id = _normalize_route_id(job_id)
+    if not normalized_job_id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=JOB_TIMING_NOT_FOUND_MESSAGE,
+        )
+    if from_sentence is not None and to_sentence is not None and to_sentence < from_sentence:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="to_sentence must not be before from_sentence",
+        )
+    tracks: Optional[tuple[str, ...]] = None
+    if track is not None and track.strip():
+        track_key = canonical_timing_track_key(track.strip())
+        if track_key not in {"translation", "original"}:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Unsupported timing track",
+            )
+        tracks = (track_key,)
+
+    job_root, _result_payload = await _resolve_timing_job(
+        normalized_job_id,
+        job_manager=job_manager,
+        locator=locator,
+        library_repository=library_repository,
+        request_user=request_user,
+    )
+    store = TimingColumnStore(job_root / "metadata" / TIMING_COLUMNS_DIRNAME)
+    result = await run_in_threadpool(_read_timing_range, store, from_sentence, to_sentence, tracks)
+    if result is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No timing columns available")
+    slices, digest = result
+    headers = {
+        "Cache-Control": "public, max-age=60",
+        "ETag": f'W/"{digest}"',
+        "Vary": "Accept",
+    }
+
+    if accept and TIMING_COLUMNS_MEDIA_TYPE in accept:
+        return Response(
+            content=b"".join(timing_slice.encode() for timing_slice in slices),
+            media_type=TIMING_COLUMNS_MEDIA_TYPE,
+            headers=headers,
+        )
+
+    response_payload = JobTimingRangeResponse(
+        job_id=normalized_job_id,
+        from_sentence=from_sentence,
+        to_sentence=to_sentence,
+        chunks=[
+            JobTimingRangeChunk(
+                chunk_id=timing_slice.chunk_id,
+                start_sentence=timing_slice.chunk_start,
+                end_sentence=timing_slice.chunk_end,
+                from_sentence=timing_slice.start_sentence,
+                to_sentence=timing_slice.end_sentence,
+                tracks=timing_slice.to_timing_tracks(),
+            )
+            for timing_slice in slices
+        ],
+    )
+    return JSONResponse(
+        content=response_payload.model_dump(mode="json"),
+        headers=headers,
+    )
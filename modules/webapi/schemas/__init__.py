@@ -6,6 +6,7 @@ from .audio import GTTSLanguage, MacOSVoice, PiperVoice, VoiceInventoryResponse,
 from .acquisition import (
     AcquisitionArtifactResponse,
     AcquisitionCandidatePayload,
+    AcquisitionDiscoveryProviderUpdate,
     AcquisitionDiscoveryResponse,
     AcquisitionPreparedArtifactResponse,
     AcquisitionProviderListResponse,
@@ -31,6 +32,8 @@ from .assistant import (
 )
 from .audio_synthesis import AudioSynthesisError, AudioSynthesisRequest
 from .library import (
+    LibraryGroupHeaderPayload,
+    LibraryGroupPageResponse,
     LibraryIsbnLookupResponse,
     LibraryIsbnUpdateRequest,
     LibraryItemPayload,
@@ -43,6 +46,7 @@ from .library import (
     LibraryMoveRequest,
     LibraryMoveResponse,
     LibraryReindexResponse,
+    LibraryReindexStatusResponse,
     LibrarySearchResponse,
 )
 from .metadata_lookup import (
@@ -70,6 +74,9 @@ from .pipeline_jobs import (
     JobParameterSnapshot,
     PipelineJobActionResponse,
     PipelineJobListResponse,
+    PipelineJobTraceResponse,
+    PipelinePlayheadRequest,
+    PipelinePlayheadResponse,
     PipelineStatusResponse,
 )
 from .pipeline_media import (
@@ -85,7 +92,13 @@ from .pipeline_media import (
     PipelineMediaFile,
     PipelineMediaResponse,
 )
-from .pipeline_timing import JobTimingAudioBinding, JobTimingResponse, JobTimingTrackPayload
+from .pipeline_timing import (
+    JobTimingAudioBinding,
+    JobTimingRangeChunk,
+    JobTimingRangeResponse,
+    JobTimingResponse,
+    JobTimingTrackPayload,
+)
 from .pipeline_requests import (
     BookContentIndexResponse,
     BookContentIndexPayload,
@@ -160,6 +173,7 @@ __all__ = [
     "AudioSynthesisRequest",
     "AudioTrackMetadata",
     "AcquisitionCandidatePayload",
+    "AcquisitionDiscoveryProviderUpdate",
     "AcquisitionDiscoveryResponse",
     "AssistantChatMessage",
     "AssistantLookupRequest",
@@ -188,9 +202,13 @@ __all__ = [
     "ImageNodeAvailabilityResponse",
     "JobParameterSnapshot",
     "JobTimingAudioBinding",
+    "JobTimingRangeChunk",
+    "JobTimingRangeResponse",
     "JobTimingResponse",
     "JobTimingTrackPayload",
     "LibraryIsbnLookupResponse",
+    "LibraryGroupHeaderPayload",
+    "LibraryGroupPageResponse",
     "LibraryIsbnUpdateRequest",
     "LibraryItemPayload",
     "LibraryMediaRemovalResponse",
@@ -202,6 +220,7 @@ __all__ = [
     "LibraryMoveRequest",
     "LibraryMoveResponse",
     "LibraryReindexResponse",
+    "LibraryReindexStatusResponse",
     "LibrarySearchResponse",
     "LLMModelListResponse",
     "LoginRequestPayload",
@@ -226,6 +245,9 @@ __all__ = [
     "PipelineIntakeStatusResponse",
     "PipelineJobActionResponse",
     "PipelineJobListResponse",
+    "PipelineJobTraceResponse",
+    "PipelinePlayheadRequest",
+    "PipelinePlayheadResponse",
     "PipelineMediaChunk",
     "PipelineMediaDiagnostics",
     "PipelineMediaFile",
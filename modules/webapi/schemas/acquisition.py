@@ -100,6 +100,16 @@ class AcquisitionDiscoveryResponse(BaseModel):
     providers_queried: List[str]
 
 
+class AcquisitionDiscoveryProviderUpdate(BaseModel):
+    """Streamed outcome of one provider during a discovery search."""
+
+    provider: str
+    status: Literal["ok", "cached", "error", "timeout"]
+    candidates: List[AcquisitionCandidatePayload] = Field(default_factory=list)
+    elapsed_seconds: float
+    note: str | None = None
+
+
 class AcquisitionAcquireRequest(BaseModel):
     """Reviewed acquisition request for a discovery candidate."""
 
@@ -321,6 +321,35 @@ class HealthCheckResponse(CamelModel):
     checks: Dict[str, bool] = Field(default_factory=dict)
 
 
+class MaintenanceTaskStatus(CamelModel):
+    """Progress of a single startup storage maintenance task."""
+
+    name: str
+    status: str = Field(..., description="pending, running, completed, cancelled, failed, or skipped")
+    scanned: int = 0
+    removed: int = 0
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+    error: Optional[str] = None
+
+
+class StartupMaintenanceResponse(CamelModel):
+    """Startup readiness plus background storage maintenance progress."""
+
+    mode: str
+    ready: bool
+    readiness: Dict[str, Optional[bool]] = Field(default_factory=dict)
+    status: str = Field("idle", description="Overall maintenance status")
+    current_task: Optional[str] = None
+    started_at: Optional[str] = None
+    finished_at: Optional[str] = None
+    throttle_ms: float = 0.0
+    tasks: List[MaintenanceTaskStatus] = Field(default_factory=list)
+    pending_routers: List[str] = Field(
+        default_factory=list, description="Lazily mounted routers not imported yet"
+    )
+
+
 # -----------------------------------------------------------------------------
 # Secret Management Schemas
 # -----------------------------------------------------------------------------
@@ -60,6 +60,30 @@ class LibrarySearchResponse(BaseModel):
     groups: Optional[List[Dict[str, Any]]] = None
 
 
+class LibraryGroupHeaderPayload(BaseModel):
+    """Label and item count for one group of a grouped library view."""
+
+    label: str
+    count: int
+    latest_updated_at: Optional[str] = Field(alias="latestUpdatedAt", default=None)
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class LibraryGroupPageResponse(BaseModel):
+    """One level of a grouped library view, or the items below a full path."""
+
+    view: Literal["by_author", "by_genre", "by_language"]
+    path: List[str]
+    level: Optional[Literal["author", "bookTitle", "genre", "language"]] = None
+    total: int
+    groups: List[LibraryGroupHeaderPayload] = Field(default_factory=list)
+    items: List[LibraryItemPayload] = Field(default_factory=list)
+    next_cursor: Optional[str] = Field(alias="nextCursor", default=None)
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
 class LibraryMediaRemovalResponse(BaseModel):
     """Response payload after removing generated media."""
 
@@ -77,6 +101,35 @@ class LibraryReindexResponse(BaseModel):
     indexed: int
 
 
+class LibraryReindexStatusResponse(BaseModel):
+    """Progress and timings of the running or most recent library reindex."""
+
+    state: Literal["idle", "running", "completed", "failed"]
+    mode: Optional[Literal["incremental", "full"]] = None
+    requested_mode: Optional[Literal["incremental", "full"]] = Field(
+        alias="requestedMode", default=None
+    )
+    phase: Optional[str] = None
+    processed: int = 0
+    total: int = 0
+    workers: Optional[int] = None
+    indexed: Optional[int] = None
+    parsed: Optional[int] = None
+    unchanged: Optional[int] = None
+    upserted: Optional[int] = None
+    deleted: Optional[int] = None
+    failed: Optional[int] = None
+    fallback_reason: Optional[str] = Field(alias="fallbackReason", default=None)
+    error: Optional[str] = None
+    started_at: Optional[float] = Field(alias="startedAt", default=None)
+    finished_at: Optional[float] = Field(alias="finishedAt", default=None)
+    elapsed_seconds: Optional[float] = Field(alias="elapsedSeconds", default=None)
+    duration_seconds: Optional[float] = Field(alias="durationSeconds", default=None)
+    timings: Dict[str, float] = Field(default_factory=dict)
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
 class LibraryMetadataUpdateRequest(BaseModel):
     """Payload describing metadata edits for a library entry."""
 
@@ -857,3 +857,44 @@ class PipelineJobActionResponse(BaseModel):
 
     job: PipelineStatusResponse
     error: Optional[str] = None
+
+
+class PipelineJobTraceResponse(BaseModel):
+    """Response payload describing the span trace recorded for a job."""
+
+    job_id: str
+    summary: Dict[str, Any] = Field(
+        default_factory=dict,
+        description="Per-stage timings, queue waits, token usage and critical path.",
+    )
+    runs: List[Dict[str, Any]] = Field(default_factory=list)
+    spans: Optional[List[Dict[str, Any]]] = Field(
+        default=None,
+        description="Raw spans, only included when explicitly requested.",
+    )
+
+
+class PipelinePlayheadRequest(BaseModel):
+    """Playhead report sent by a player while a job is still rendering."""
+
+    sentence_number: int = Field(ge=1, description="Sentence currently playing or seeked to.")
+    seek: bool = Field(default=False, description="Whether the report follows a user seek.")
+
+
+class PipelinePlayheadResponse(BaseModel):
+    """Render priority state after a playhead report."""
+
+    job_id: str
+    active: bool = Field(
+        default=False,
+        description="Whether pending work is currently ordered around the playhead.",
+    )
+    sentence_number: Optional[int] = None
+    region_start: Optional[int] = Field(
+        default=None,
+        description="First sentence of the chunk being rendered ahead of the rest.",
+    )
+    reports: int = 0
+    seeks: int = 0
+    prioritized_picks: int = 0
+    fairness_picks: int = 0
@@ -33,3 +33,27 @@ class JobTimingResponse(BaseModel):
     audio: Dict[str, JobTimingAudioBinding]
     highlighting_policy: Optional[str]
     has_estimated_segments: bool = Field(serialization_alias="has_estimated_segments")
+
+
+class JobTimingRangeChunk(BaseModel):
+    """Timing tokens of one chunk restricted to the requested sentences.
+
+    ``sentenceIdx`` on each token is relative to ``start_sentence`` and token
+    times are relative to the chunk's audio, as in chunk ``timingTracks``.
+    """
+
+    chunk_id: str
+    start_sentence: int
+    end_sentence: int
+    from_sentence: int
+    to_sentence: int
+    tracks: Dict[str, List[Dict[str, Any]]]
+
+
+class JobTimingRangeResponse(BaseModel):
+    """JSON form of a sentence-range timing query."""
+
+    job_id: str
+    from_sentence: Optional[int] = None
+    to_sentence: Optional[int] = None
+    chunks: List[JobTimingRangeChunk]
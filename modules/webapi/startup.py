@@ -0,0 +1,511 @@
+"""Startup orchestration for the FastAPI backend.
+
+Keeps API cold start cheap on large (often network-mounted) storage trees:
+
+* storage maintenance runs as a throttled background task whose progress is
+  exposed through :func:`get_maintenance_runner`;
+* heavy routers are described by :class:`LazyRouterSpec` and imported the
+  first time a request targets their prefix;
+* readiness (:class:`StartupState`) is tracked separately from liveness.
+
+``EBOOK_API_STARTUP_MODE=eager`` restores the previous behaviour (blocking
+maintenance and eagerly imported routers).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from fastapi import FastAPI
+from starlette.routing import Mount
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+LOGGER = logging.getLogger(__name__)
+
+STARTUP_MODE_ENV = "EBOOK_API_STARTUP_MODE"
+MAINTENANCE_THROTTLE_ENV = "EBOOK_API_MAINTENANCE_THROTTLE_MS"
+MAINTENANCE_DELAY_ENV = "EBOOK_API_MAINTENANCE_DELAY_SECONDS"
+
+STARTUP_MODE_FAST = "fast"
+STARTUP_MODE_EAGER = "eager"
+_STARTUP_MODES = frozenset({STARTUP_MODE_FAST, STARTUP_MODE_EAGER})
+
+DEFAULT_MAINTENANCE_THROTTLE_MS = 5.0
+DEFAULT_MAINTENANCE_DELAY_SECONDS = 5.0
+
+
+def resolve_startup_mode(value: str | None = None) -> str:
+    """Return the configured startup mode (``fast`` unless overridden)."""
+
+    raw = value if value is not None else os.environ.get(STARTUP_MODE_ENV)
+    candidate = (raw or "").strip().lower()
+    if candidate in _STARTUP_MODES:
+        return candidate
+    if candidate:
+        LOGGER.warning(
+            "Unknown %s=%r; falling back to '%s'", STARTUP_MODE_ENV, raw, STARTUP_MODE_FAST
+        )
+    return STARTUP_MODE_FAST
+
+
+def _env_float(name: str, default: float) -> float:
+    raw = os.environ.get(name)
+    if raw is None or not raw.strip():
+        return default
+    try:
+        return max(0.0, float(raw))
+    except ValueError:
+        LOGGER.warning("Ignoring invalid %s=%r", name, raw)
+        return default
+
+
+def _isoformat(timestamp: float | None) -> str | None:
+    if timestamp is None:
+        return None
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat()
+
+
+# ---------------------------------------------------------------------------
+# Readiness
+# ---------------------------------------------------------------------------
+
+
+class StartupState:
+    """Track named readiness checks for the running API process."""
+
+    def __init__(self, mode: str = STARTUP_MODE_FAST) -> None:
+        self.mode = mode
+        self.started_at = time.time()
+        self._lock = threading.Lock()
+        self._checks: Dict[str, Optional[bool]] = {}
+        self._ready_at: Optional[float] = None
+        self._stopping = False
+
+    def register(self, name: str) -> None:
+        """Declare a check that must complete before the API reports ready."""
+
+        with self._lock:
+            self._checks.setdefault(name, None)
+
+    def complete(self, name: str, ok: bool = True) -> None:
+        with self._lock:
+            self._checks[name] = bool(ok)
+            if self._ready_at is None and self._all_passed():
+                self._ready_at = time.time()
+
+    def mark_stopping(self) -> None:
+        with self._lock:
+            self._stopping = True
+
+    def _all_passed(self) -> bool:
+        return bool(self._checks) and all(value is True for value in self._checks.values())
+
+    @property
+    def is_ready(self) -> bool:
+        with self._lock:
+            return not self._stopping and self._all_passed()
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            checks = {name: value for name, value in self._checks.items()}
+            ready = not self._stopping and self._all_passed()
+            ready_at = self._ready_at
+            stopping = self._stopping
+        if stopping:
+            status = "stopping"
+        elif ready:
+            status = "ready"
+        elif any(value is False for value in checks.values()):
+            status = "degraded"
+        else:
+            status = "starting"
+        return {
+            "status": status,
+            "ready": ready,
+            "mode": self.mode,
+            "checks": checks,
+            "started_at": _isoformat(self.started_at),
+            "ready_at": _isoformat(ready_at),
+            "startup_seconds": round(ready_at - self.started_at, 3) if ready_at else None,
+        }
+
+
+_STARTUP_STATE = StartupState()
+
+
+def begin_startup(mode: str) -> StartupState:
+    """Reset the process-wide readiness state for a new application lifespan."""
+
+    global _STARTUP_STATE
+    _STARTUP_STATE = StartupState(mode)
+    return _STARTUP_STATE
+
+
+def get_startup_state() -> StartupState:
+    return _STARTUP_STATE
+
+
+# ---------------------------------------------------------------------------
+# Background storage maintenance
+# ---------------------------------------------------------------------------
+
+
+class MaintenanceCancelled(Exception):
+    """Raised from the per-entry hook when maintenance has been cancelled."""
+
+
+EntryHook = Callable[[Path], None]
+MaintenanceTask = Callable[[EntryHook], int]
+
+
+@dataclass
+class MaintenanceTaskProgress:
+    name: str
+    status: str = "pending"
+    scanned: int = 0
+    removed: int = 0
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "status": self.status,
+            "scanned": self.scanned,
+            "removed": self.removed,
+            "started_at": _isoformat(self.started_at),
+            "finished_at": _isoformat(self.finished_at),
+            "error": self.error,
+        }
+
+
+class StorageMaintenanceRunner:
+    """Run storage cleanup tasks sequentially with per-entry throttling.
+
+    Each task receives an ``on_entry`` hook it must call once per inspected
+    directory entry; the hook records progress, sleeps ``throttle_seconds`` so
+    NAS-backed storage is not saturated, and aborts the task on cancellation.
+    """
+
+    def __init__(
+        self,
+        tasks: Sequence[Tuple[str, MaintenanceTask]],
+        *,
+        throttle_seconds: float = 0.0,
+        start_delay_seconds: float = 0.0,
+    ) -> None:
+        self._tasks = list(tasks)
+        self._throttle = max(0.0, float(throttle_seconds))
+        self._start_delay = max(0.0, float(start_delay_seconds))
+        self._lock = threading.Lock()
+        self._cancel = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._progress = [MaintenanceTaskProgress(name) for name, _task in self._tasks]
+        self._status = "pending"
+        self._current: Optional[MaintenanceTaskProgress] = None
+        self._started_at: Optional[float] = None
+        self._finished_at: Optional[float] = None
+
+    @property
+    def status(self) -> str:
+        with self._lock:
+            return self._status
+
+    def start(self) -> threading.Thread:
+        """Run the tasks on a daemon thread and return it."""
+
+        with self._lock:
+            if self._thread is not None:
+                return self._thread
+            self._status = "scheduled"
+            thread = threading.Thread(
+                target=self.run, name="StorageMaintenance", daemon=True
+            )
+            self._thread = thread
+        thread.start()
+        return thread
+
+    def cancel(self) -> None:
+        self._cancel.set()
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def run(self) -> None:
+        """Execute every task in order on the calling thread."""
+
+        if self._start_delay and self._cancel.wait(self._start_delay):
+            self._finish("cancelled")
+            return
+        with self._lock:
+            self._status = "running"
+            self._started_at = time.time()
+        for (name, task), progress in zip(self._tasks, self._progress):
+            if self._cancel.is_set():
+                break
+            with self._lock:
+                self._current = progress
+                progress.status = "running"
+                progress.started_at = time.time()
+            try:
+                removed = task(self._on_entry)
+            except MaintenanceCancelled:
+                with self._lock:
+                    progress.status = "cancelled"
+                    progress.finished_at = time.time()
+                break
+            except Exception as exc:  # pragma: no cover - defensive logging
+                LOGGER.exception("Storage maintenance task %s failed", name)
+                with self._lock:
+                    progress.status = "failed"
+                    progress.error = str(exc)
+                    progress.finished_at = time.time()
+                continue
+            with self._lock:
+                progress.status = "completed"
+                progress.removed = int(removed or 0)
+                progress.finished_at = time.time()
+        self._finish("cancelled" if self._cancel.is_set() else "completed")
+
+    def _finish(self, status: str) -> None:
+        with self._lock:
+            self._status = status
+            self._current = None
+            self._finished_at = time.time()
+            for progress in self._progress:
+                if progress.status == "pending":
+                    progress.status = "skipped"
+        LOGGER.info(
+            "Storage maintenance %s",
+            status,
+            extra={
+                "event": "webapi.startup.maintenance",
+                "attributes": {
+                    "status": status,
+                    "tasks": [progress.to_dict() for progress in self._progress],
+                },
+                "console_suppress": True,
+            },
+        )
+
+    def _on_entry(self, _entry: Path) -> None:
+        if self._cancel.is_set():
+            raise MaintenanceCancelled()
+        with self._lock:
+            if self._current is not None:
+                self._current.scanned += 1
+        if self._throttle and self._cancel.wait(self._throttle):
+            raise MaintenanceCancelled()
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "status": self._status,
+                "current_task": self._current.name if self._current else None,
+                "started_at": _isoformat(self._started_at),
+                "finished_at": _isoformat(self._finished_at),
+                "throttle_ms": round(self._throttle * 1000.0, 3),
+                "tasks": [progress.to_dict() for progress in self._progress],
+            }
+
+
+_MAINTENANCE_RUNNER: Optional[StorageMaintenanceRunner] = None
+
+
+def set_maintenance_runner(runner: Optional[StorageMaintenanceRunner]) -> None:
+    global _MAINTENANCE_RUNNER
+    _MAINTENANCE_RUNNER = runner
+
+
+def get_maintenance_runner() -> Optional[StorageMaintenanceRunner]:
+    return _MAINTENANCE_RUNNER
+
+
+def maintenance_throttle_seconds(mode: str) -> float:
+    default = DEFAULT_MAINTENANCE_THROTTLE_MS if mode == STARTUP_MODE_FAST else 0.0
+    return _env_float(MAINTENANCE_THROTTLE_ENV, default) / 1000.0
+
+
+def maintenance_delay_seconds(mode: str) -> float:
+    default = DEFAULT_MAINTENANCE_DELAY_SECONDS if mode == STARTUP_MODE_FAST else 0.0
+    return _env_float(MAINTENANCE_DELAY_ENV, default)
+
+
+# ---------------------------------------------------------------------------
+# Lazily mounted routers
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class LazyRouterSpec:
+    """Describe a router that is imported on first matching request."""
+
+    module: str
+    path_prefixes: Tuple[str, ...]
+    attribute: str = "router"
+    include_kwargs: Mapping[str, Any] = field(default_factory=dict)
+
+    def matches(self, path: str) -> bool:
+        for prefix in self.path_prefixes:
+            if path == prefix or path.startswith(prefix.rstrip("/") + "/"):
+                return True
+        return False
+
+
+class LazyRouterRegistry:
+    """Include heavy routers into ``app`` the first time they are needed."""
+
+    def __init__(
+        self,
+        app: FastAPI,
+        specs: Sequence[LazyRouterSpec],
+        *,
+        package: Optional[str] = None,
+    ) -> None:
+        self._app = app
+        self._package = package
+        self._pending: List[LazyRouterSpec] = list(specs)
+        self._loaded: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._async_lock: Optional[asyncio.Lock] = None
+
+    @property
+    def has_pending(self) -> bool:
+        return bool(self._pending)
+
+    def _key(self, spec: LazyRouterSpec) -> str:
+        return f"{spec.module}:{spec.attribute}"
+
+    def _include(self, spec: LazyRouterSpec, module: Any, elapsed: float) -> None:
+        with self._lock:
+            if spec not in self._pending:
+                return
+            router = getattr(module, spec.attribute)
+            routes = self._app.router.routes
+            before = len(routes)
+            self._app.include_router(router, **dict(spec.include_kwargs))
+            added = routes[before:]
+            del routes[before:]
+            # Catch-all mounts (the SPA) must stay last or they would shadow
+            # routes registered after startup.
+            insert_at = next(
+                (index for index, route in enumerate(routes) if isinstance(route, Mount)),
+                len(routes),
+            )
+            routes[insert_at:insert_at] = added
+            self._app.openapi_schema = None
+            self._pending.remove(spec)
+            self._loaded[self._key(spec)] = round(elapsed, 6)
+        LOGGER.debug(
+            "Mounted lazy router %s in %.3fs",
+            self._key(spec),
+            elapsed,
+            extra={"event": "webapi.startup.lazy_router", "console_suppress": True},
+        )
+
+    def _import(self, spec: LazyRouterSpec) -> Tuple[Any, float]:
+        started = time.perf_counter()
+        module = importlib.import_module(spec.module, self._package)
+        return module, time.perf_counter() - started
+
+    def load(self, spec: LazyRouterSpec) -> None:
+        module, elapsed = self._import(spec)
+        self._include(spec, module, elapsed)
+
+    def load_all(self) -> None:
+        """Import and mount every pending router synchronously."""
+
+        for spec in list(self._pending):
+            self.load(spec)
+
+    async def ensure_loaded_for_path(self, path: str) -> None:
+        """Mount the routers serving ``path``; imports run off the event loop."""
+
+        if not any(spec.matches(path) for spec in self._pending):
+            return
+        if self._async_lock is None:
+            self._async_lock = asyncio.Lock()
+        async with self._async_lock:
+            for spec in [spec for spec in self._pending if spec.matches(path)]:
+                module, elapsed = await asyncio.to_thread(self._import, spec)
+                self._include(spec, module, elapsed)
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "pending": [self._key(spec) for spec in self._pending],
+                "loaded": dict(self._loaded),
+            }
+
+
+class LazyRouterMiddleware:
+    """ASGI middleware that mounts lazy routers before routing a request."""
+
+    def __init__(self, app: ASGIApp, *, registry: LazyRouterRegistry) -> None:
+        self.app = app
+        self.registry = registry
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] in {"http", "websocket"} and self.registry.has_pending:
+            await self.registry.ensure_loaded_for_path(scope.get("path", ""))
+        await self.app(scope, receive, send)
+
+
+def install_lazy_routers(
+    app: FastAPI,
+    specs: Sequence[LazyRouterSpec],
+    *,
+    package: Optional[str] = None,
+    eager: bool = False,
+) -> LazyRouterRegistry:
+    """Register ``specs`` on ``app`` lazily (or immediately when ``eager``)."""
+
+    registry = LazyRouterRegistry(app, specs, package=package)
+    app.state.lazy_routers = registry
+    if eager:
+        registry.load_all()
+        return registry
+
+    app.add_middleware(LazyRouterMiddleware, registry=registry)
+    build_openapi = app.openapi
+
+    def openapi() -> Dict[str, Any]:
+        registry.load_all()
+        return build_openapi()
+
+    app.openapi = openapi  # type: ignore[method-assign]
+    return registry
+
+
+__all__ = [
+    "LazyRouterMiddleware",
+    "LazyRouterRegistry",
+    "LazyRouterSpec",
+    "MaintenanceCancelled",
+    "MaintenanceTaskProgress",
+    "STARTUP_MODE_EAGER",
+    "STARTUP_MODE_ENV",
+    "STARTUP_MODE_FAST",
+    "StartupState",
+    "StorageMaintenanceRunner",
+    "begin_startup",
+    "get_maintenance_runner",
+    "get_startup_state",
+    "install_lazy_routers",
+    "maintenance_delay_seconds",
+    "maintenance_throttle_seconds",
+    "resolve_startup_mode",
+    "set_maintenance_runner",
+]
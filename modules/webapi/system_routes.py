@@ -12,7 +12,7 @@ import time
 from datetime import datetime, timezone
 from typing import Tuple
 
-from fastapi import APIRouter, Depends, Header, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, status
 
 from ..config_manager.config_repository import ConfigRepository
 from ..config_manager.pg_config_repository import PgConfigRepository
@@ -25,6 +25,7 @@ from ..config_manager.loader import (
 from ..config_manager.groups import get_hot_reload_keys
 from ..user_management import AuthService
 from ..user_management.user_store_base import UserRecord
+from . import startup
 from .auth_utils import require_admin_user
 from .dependencies import get_auth_service, get_pipeline_job_manager
 from .schemas.config import (
@@ -33,6 +34,7 @@ from .schemas.config import (
     ReloadConfigResponse,
     RestartRequestPayload,
     RestartResponse,
+    StartupMaintenanceResponse,
     SystemStatusResponse,
 )
 from ..services.job_manager import PipelineJobManager, PipelineJobStatus
@@ -179,6 +181,30 @@ def deep_health_check() -> HealthCheckResponse:
     )
 
 
+@router.get("/system/maintenance", response_model=StartupMaintenanceResponse)
+def get_startup_maintenance(
+    request: Request,
+    authorization: str | None = Header(default=None, alias="Authorization"),
+    auth_service: AuthService = Depends(get_auth_service),
+) -> StartupMaintenanceResponse:
+    """Report startup readiness and background storage maintenance progress."""
+    _require_admin(authorization, auth_service)
+
+    state = startup.get_startup_state().snapshot()
+    runner = startup.get_maintenance_runner()
+    maintenance = runner.snapshot() if runner is not None else {"status": "idle"}
+    registry = getattr(request.app.state, "lazy_routers", None)
+    pending_routers = registry.snapshot()["pending"] if registry is not None else []
+
+    return StartupMaintenanceResponse(
+        mode=state["mode"],
+        ready=state["ready"],
+        readiness=state["checks"],
+        pending_routers=pending_routers,
+        **maintenance,
+    )
+
+
 # -----------------------------------------------------------------------------
 # Configuration Reload Endpoint
 # -----------------------------------------------------------------------------
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""Measure FastAPI cold-start time in ``fast`` and ``eager`` startup modes.
+
+Each sample runs in a fresh interpreter against a throwaway storage tree so
+module import caches and previous maintenance runs do not skew the numbers.
+Reported phases (seconds, measured inside the child process):
+
+* ``import``      - ``import modules.webapi.application``
+* ``create_app``  - building the FastAPI application
+* ``lifespan``    - running the startup lifespan (until traffic is accepted)
+* ``ready``       - process start until ``/_health/ready`` returns 200
+* ``first_lazy``  - first request against a lazily mounted router
+* ``process``     - wall time of the whole child process (parent side)
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+PHASES = ("import", "create_app", "lifespan", "ready", "first_lazy", "process")
+
+CHILD_SOURCE = r"""
+import json, sys, time
+started = time.perf_counter()
+import modules.webapi.application as application
+imported = time.perf_counter()
+app = application.create_app()
+created = time.perf_counter()
+from fastapi.testclient import TestClient
+result = {}
+with TestClient(app) as client:
+    lifespan_done = time.perf_counter()
+    deadline = lifespan_done + 60.0
+    while client.get("/_health/ready").status_code != 200 and time.perf_counter() < deadline:
+        time.sleep(0.01)
+    ready = time.perf_counter()
+    client.get(sys.argv[1])
+    first_lazy = time.perf_counter()
+result.update(
+    {
+        "import": imported - started,
+        "create_app": created - imported,
+        "lifespan": lifespan_done - created,
+        "ready": ready - started,
+        "first_lazy": first_lazy - ready,
+    }
+)
+print("BENCHMARK_RESULT " + json.dumps(result))
+"""
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5, help="Samples per startup mode.")
+    parser.add_argument(
+        "--modes",
+        default="eager,fast",
+        help="Comma-separated startup modes to measure (default: eager,fast).",
+    )
+    parser.add_argument(
+        "--job-dirs",
+        type=int,
+        default=2000,
+        help="Synthetic job folders to create in the throwaway storage tree.",
+    )
+    parser.add_argument(
+        "--probe-path",
+        default="/api/audio/voices",
+        help="Request path used to time the first lazily mounted router.",
+    )
+    parser.add_argument("--json", action="store_true", help="Print raw samples as JSON.")
+    return parser.parse_args()
+
+
+def build_storage_tree(root: Path, job_dirs: int) -> None:
+    """Create a mix of populated, empty and orphaned job folders under ``root``."""
+
+    for index in range(job_dirs):
+        job_root = root / f"bench-job-{index:06d}"
+        kind = index % 3
+        if kind == 0:
+            (job_root / "metadata").mkdir(parents=True)
+            (job_root / "metadata" / "job.json").write_text(
+                json.dumps({"job_id": job_root.name, "status": "completed"}), encoding="utf-8"
+            )
+        elif kind == 1:
+            (job_root / "media").mkdir(parents=True)
+            (job_root / "media" / "chunk.mp3").write_bytes(b"\x00" * 16)
+        else:
+            job_root.mkdir(parents=True)
+    (root / "exports").mkdir(exist_ok=True)
+
+
+def run_sample(mode: str, job_dirs: int, probe_path: str) -> dict[str, float]:
+    with tempfile.TemporaryDirectory(prefix="ebook-startup-bench-") as tmp:
+        storage_root = Path(tmp) / "storage"
+        storage_root.mkdir()
+        build_storage_tree(storage_root, job_dirs)
+        env = dict(os.environ)
+        env.update(
+            {
+                "EBOOK_API_STARTUP_MODE": mode,
+                "JOB_STORAGE_DIR": str(storage_root),
+                "EBOOK_API_STATIC_ROOT": "",
+                "PYTHONDONTWRITEBYTECODE": "1",
+            }
+        )
+        started = time.perf_counter()
+        completed = subprocess.run(
+            [sys.executable, "-c", CHILD_SOURCE, probe_path],
+            cwd=REPO_ROOT,
+            env=env,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        elapsed = time.perf_counter() - started
+    for line in completed.stdout.splitlines():
+        if line.startswith("BENCHMARK_RESULT "):
+            sample: dict[str, float] = json.loads(line[len("BENCHMARK_RESULT "):])
+            sample["process"] = elapsed
+            return sample
+    raise RuntimeError(
+        f"Startup sample failed for mode={mode} (exit {completed.returncode}):\n{completed.stderr[-2000:]}"
+    )
+
+
+def summarize(samples: list[dict[str, float]]) -> dict[str, dict[str, float]]:
+    summary: dict[str, dict[str, float]] = {}
+    for phase in PHASES:
+        values = [sample[phase] for sample in samples if phase in sample]
+        if not values:
+            continue
+        summary[phase] = {
+            "median": statistics.median(values),
+            "min": min(values),
+            "max": max(values),
+        }
+    return summary
+
+
+def main() -> int:
+    args = parse_args()
+    modes = [mode.strip() for mode in args.modes.split(",") if mode.strip()]
+    results: dict[str, Any] = {}
+    for mode in modes:
+        samples = [run_sample(mode, args.job_dirs, args.probe_path) for _ in range(max(1, args.runs))]
+        results[mode] = {"samples": samples, "summary": summarize(samples)}
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+
+    print(f"job folders: {args.job_dirs}  runs per mode: {args.runs}")
+    header = f"{'phase':<12}" + "".join(f"{mode:>22}" for mode in modes)
+    print(header)
+    print("-" * len(header))
+    for phase in PHASES:
+        cells = []
+        for mode in modes:
+            stats = results[mode]["summary"].get(phase)
+            if stats is None:
+                cells.append(f"{'-':>22}")
+                continue
+            cells.append(f"{stats['median']:>9.3f}s [{stats['min']:.2f}-{stats['max']:.2f}]")
+        print(f"{phase:<12}" + "".join(f"{cell:>22}" for cell in cells))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""Compare chunk-file scans with the chunk summary index on a synthetic job.
+
+A job of ``--chunks`` chunks (``--sentences`` sentences per chunk and
+``--words`` timing tokens per sentence) is written through
+``write_chunk_metadata``, which also writes ``metadata/chunks_index.json``.
+Each read is then timed ``--repeats`` times with the index removed
+(``scan``) and present (``index``), starting from cold in-process caches:
+
+* ``policy``  – the timing route's highlighting-policy probe;
+* ``summary`` – ``MetadataLoader.load_chunks(include_sentences=False,
+  include_timing=False)``, as used by the search service and chunk manifest.
+
+Both modes must return the same answer, or the run fails.  Example::
+
+    python scripts/benchmark_chunk_index.py --chunks 400 --sentences 10 --repeats 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from modules import chunk_index  # noqa: E402
+from modules.metadata_manager import MetadataLoader  # noqa: E402
+from modules.services.file_locator import FileLocator  # noqa: E402
+from modules.services.job_manager.chunk_persistence import write_chunk_metadata  # noqa: E402
+from modules.webapi.routes.media import timing as timing_routes  # noqa: E402
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--chunks", type=int, default=200, help="Chunks in the job.")
+    parser.add_argument("--sentences", type=int, default=10, help="Sentences per chunk.")
+    parser.add_argument("--words", type=int, default=14, help="Timing tokens per sentence.")
+    parser.add_argument("--repeats", type=int, default=15, help="Timed runs per read and mode.")
+    parser.add_argument("--json", action="store_true", help="Print raw results as JSON.")
+    return parser.parse_args()
+
+
+def _chunk(index: int, args: argparse.Namespace) -> Dict[str, Any]:
+    start = index * args.sentences + 1
+    sentences = [
+        {
+            "original": {"text": "lorem ipsum " * args.words},
+            "translation": {"text": "dolor sit " * args.words},
+            "highlighting_summary": {"policy": "forced", "source": "aligner"},
+        }
+        for _ in range(args.sentences)
+    ]
+    tokens = [
+        {
+            "lane": "trans",
+            "sentenceIdx": s,
+            "wordIdx": w,
+            "start": round(w * 0.2, 6),
+            "end": round(w * 0.2 + 0.18, 6),
+            "policy": "forced",
+        }
+        for s in range(args.sentences)
+        for w in range(args.words)
+    ]
+    return {
+        "chunk_id": f"chunk-{index}",
+        "range_fragment": f"{start:05d}-{start + args.sentences - 1:05d}",
+        "start_sentence": start,
+        "end_sentence": start + args.sentences - 1,
+        "sentences": sentences,
+        "audioTracks": {"translation": {"path": f"media/{index}.mp3", "duration": 12.5}},
+        "timingTracks": {"translation": tokens},
+    }
+
+
+def _cold(run: Callable[[], Any]) -> Callable[[], Any]:
+    def wrapped() -> Any:
+        timing_routes._policy_cache.clear()
+        chunk_index._index_cache.clear()
+        return run()
+
+    return wrapped
+
+
+def _summary(read: str, mode: str, timings: List[float]) -> Dict[str, Any]:
+    timings = sorted(timings)
+    return {
+        "read": read,
+        "mode": mode,
+        "runs": len(timings),
+        "p50_ms": statistics.median(timings) * 1000,
+        "p99_ms": timings[min(len(timings) - 1, int(len(timings) * 0.99))] * 1000,
+    }
+
+
+def run(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    with tempfile.TemporaryDirectory() as tmp:
+        locator = FileLocator(storage_dir=Path(tmp))
+        job_root = locator.resolve_path("bench")
+        metadata_root = job_root / "metadata"
+        metadata_root.mkdir(parents=True)
+        chunks = [_chunk(index, args) for index in range(args.chunks)]
+        generated = write_chunk_metadata("bench", metadata_root, {"chunks": chunks}, locator)
+        (metadata_root / "job.json").write_text(
+            json.dumps({"generated_files": generated}), encoding="utf-8"
+        )
+        index_path = metadata_root / chunk_index.CHUNK_INDEX_FILENAME
+        stashed = Path(tmp) / "stashed_index.json"
+
+        reads: Dict[str, Callable[[], Any]] = {
+            "policy": _cold(lambda: timing_routes._probe_highlighting_policy(metadata_root, None)),
+            "summary": _cold(
+                lambda: MetadataLoader(job_root).load_chunks(
+                    include_sentences=False, include_timing=False
+                )
+            ),
+        }
+        results: List[Dict[str, Any]] = []
+        for read, fetch in reads.items():
+            outputs: Dict[str, Any] = {}
+            for mode in ("scan", "index"):
+                if mode == "scan":
+                    shutil.move(index_path, stashed)
+                try:
+                    outputs[mode] = fetch()
+                    timings: List[float] = []
+                    for _ in range(args.repeats):
+                        started = time.perf_counter()
+                        fetch()
+                        timings.append(time.perf_counter() - started)
+                finally:
+                    if mode == "scan":
+                        shutil.move(stashed, index_path)
+                results.append(_summary(read, mode, timings))
+            if outputs["scan"] != outputs["index"]:
+                raise SystemExit(f"index answer differs from chunk scan for {read}")
+        return results
+
+
+def main() -> int:
+    args = parse_args()
+    results = run(args)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+    print(f"chunks: {args.chunks}  sentences/chunk: {args.sentences}  repeats: {args.repeats}")
+    print(f"{'read':>10}{'mode':>8}{'runs':>6}{'p50 ms':>10}{'p99 ms':>10}")
+    for result in results:
+        print(
+            f"{result['read']:>10}{result['mode']:>8}{result['runs']:>6}"
+            f"{result['p50_ms']:>10.3f}{result['p99_ms']:>10.3f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""Measure time-to-first-byte of the interactive synthesis service.
+
+Requests go through :class:`InteractiveSynthesisService` with a simulated
+engine that pays ``--load-ms`` to load a voice it has not used yet and then
+encodes ``--clip-kb`` of audio at ``--encode-ms-per-kb``.  Three request
+kinds are reported, each with p50/p99 time-to-first-byte:
+
+* ``cold``   – new clip on a voice the engine has not loaded;
+* ``warm``   – new clip on a voice kept loaded by warm-voice tracking;
+* ``cached`` – repeat of a clip already synthesized (memory or disk).
+
+A ``burst`` row sends ``--burst`` identical requests at once and reports how
+many engine runs they caused (1 with single-flight).  Example::
+
+    python scripts/benchmark_interactive_synthesis.py --requests 50 \\
+        --load-ms 400 --clip-kb 96 --encode-ms-per-kb 2
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Set
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from modules.audio.interactive_synthesis import (  # noqa: E402
+    InteractiveSynthesisService,
+    SynthesisKey,
+)
+
+
+class _SimulatedEngine:
+    """Engine that loads voices lazily and writes audio in 4 KiB frames."""
+
+    def __init__(self, args: argparse.Namespace) -> None:
+        self._load_seconds = args.load_ms / 1000.0
+        self._frame_seconds = args.encode_ms_per_kb * 4 / 1000.0
+        self._frames = max(1, args.clip_kb // 4)
+        self._loaded: Set[str] = set()
+        self._lock = threading.Lock()
+        self.runs = 0
+
+    def warm(self, voice: str) -> None:
+        with self._lock:
+            if voice in self._loaded:
+                return
+        time.sleep(self._load_seconds)
+        with self._lock:
+            self._loaded.add(voice)
+
+    def unload(self, voice: str) -> None:
+        with self._lock:
+            self._loaded.discard(voice)
+
+    def produce(self, voice: str):
+        def _produce(destination: Path, info: Dict[str, str]) -> None:
+            with self._lock:
+                self.runs += 1
+            self.warm(voice)
+            info["X-Synthesis-Engine"] = "piper"
+            with destination.open("wb") as handle:
+                for _ in range(self._frames):
+                    time.sleep(self._frame_seconds)
+                    handle.write(b"\xff" * 4096)
+                    handle.flush()
+
+        return _produce
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--requests", type=int, default=30, help="Requests per kind.")
+    parser.add_argument("--load-ms", type=float, default=300.0, help="Voice load time.")
+    parser.add_argument("--clip-kb", type=int, default=64, help="Encoded clip size.")
+    parser.add_argument("--encode-ms-per-kb", type=float, default=1.5, help="Encoding speed.")
+    parser.add_argument("--burst", type=int, default=16, help="Identical concurrent requests.")
+    parser.add_argument("--json", action="store_true", help="Print raw results as JSON.")
+    return parser.parse_args()
+
+
+def _ttfb(service: InteractiveSynthesisService, key: SynthesisKey, producer) -> float:
+    started = time.perf_counter()
+    result = service.synthesize(key, producer)
+    if result.data is None:
+        assert result.chunks is not None
+        next(result.chunks)
+        elapsed = time.perf_counter() - started
+        for _chunk in result.chunks:
+            pass
+        return elapsed
+    return time.perf_counter() - started
+
+
+def _summary(kind: str, latencies: List[float], **extra: Any) -> Dict[str, Any]:
+    latencies = sorted(latencies)
+    return {
+        "kind": kind,
+        "requests": len(latencies),
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000,
+        **extra,
+    }
+
+
+def run(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    engine = _SimulatedEngine(args)
+    results: List[Dict[str, Any]] = []
+    with tempfile.TemporaryDirectory(prefix="interactive-synthesis-") as tmp:
+        service = InteractiveSynthesisService(Path(tmp), warm_voice=engine.warm)
+        try:
+            voice = "en_US-bench-medium"
+            cold: List[float] = []
+            for index in range(args.requests):
+                engine.unload(voice)
+                key = SynthesisKey("piper", voice, "en", 170, f"cold sentence {index}")
+                cold.append(_ttfb(service, key, engine.produce(voice)))
+            results.append(_summary("cold", cold))
+
+            service.warm_recent_voices()
+            warm: List[float] = []
+            for index in range(args.requests):
+                key = SynthesisKey("piper", voice, "en", 170, f"warm sentence {index}")
+                warm.append(_ttfb(service, key, engine.produce(voice)))
+            results.append(_summary("warm", warm))
+
+            cached: List[float] = []
+            for index in range(args.requests):
+                key = SynthesisKey("piper", voice, "en", 170, f"warm sentence {index}")
+                cached.append(_ttfb(service, key, engine.produce(voice)))
+            results.append(_summary("cached", cached))
+
+            runs_before = engine.runs
+            key = SynthesisKey("piper", voice, "en", 170, "burst sentence")
+            with ThreadPoolExecutor(max_workers=args.burst) as pool:
+                burst = list(
+                    pool.map(lambda _i: _ttfb(service, key, engine.produce(voice)), range(args.burst))
+                )
+            results.append(_summary("burst", burst, engine_runs=engine.runs - runs_before))
+        finally:
+            service.close()
+    return results
+
+
+def main() -> int:
+    args = parse_args()
+    results = run(args)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+    print(
+        f"clip: {args.clip_kb} KiB  load: {args.load_ms:.0f} ms  "
+        f"encode: {args.encode_ms_per_kb} ms/KiB  requests: {args.requests}"
+    )
+    print(f"{'kind':>8}{'requests':>10}{'p50 ms':>9}{'p99 ms':>9}{'runs':>6}")
+    for result in results:
+        runs = result.get("engine_runs", "")
+        print(
+            f"{result['kind']:>8}{result['requests']:>10}"
+            f"{result['p50_ms']:>9.2f}{result['p99_ms']:>9.2f}{runs!s:>6}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
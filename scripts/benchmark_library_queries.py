@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""Measure library list/search latency, optionally during a bulk reindex write.
+
+A temporary library index is filled with ``--entries`` synthetic items.  Reader
+threads then issue ``list_entries``/``count_entries`` pages and full-text
+searches while, with ``--with-writer``, another thread loops
+``replace_entries`` over the whole catalogue (what a reindex does).  Example::
+
+    python scripts/benchmark_library_queries.py --entries 5000 --readers 4 \\
+        --queries 500 --with-writer
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from modules.library import LibraryEntry, LibraryRepository, MetadataSnapshot  # noqa: E402
+
+WORDS = ("river", "night", "garden", "winter", "harbor", "silver", "empire", "letters")
+
+
+def make_entries(root: Path, count: int) -> List[LibraryEntry]:
+    rng = random.Random(11)
+    entries = []
+    for index in range(count):
+        title = " ".join(rng.sample(WORDS, 3)).title()
+        entries.append(
+            LibraryEntry(
+                id=f"job-{index:06d}",
+                author=f"Author {index % 97}",
+                book_title=title,
+                item_type="book",
+                genre=rng.choice(["Fiction", "History", None]),
+                language=rng.choice(["en", "de", "fr"]),
+                status="finished",
+                created_at="2024-01-01T00:00:00+00:00",
+                updated_at=f"2024-01-{1 + index % 28:02d}T00:00:00+00:00",
+                library_path=str(root / f"job-{index:06d}"),
+                metadata=MetadataSnapshot(metadata={"job_id": f"job-{index:06d}"}),
+            )
+        )
+    return entries
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--entries", type=int, default=2000)
+    parser.add_argument("--readers", type=int, default=4, help="Concurrent reader threads.")
+    parser.add_argument("--queries", type=int, default=400, help="Queries per kind.")
+    parser.add_argument("--with-writer", action="store_true", help="Run replace_entries concurrently.")
+    parser.add_argument("--json", action="store_true", help="Print raw results as JSON.")
+    return parser.parse_args()
+
+
+def _percentiles(samples: List[float]) -> Dict[str, float]:
+    ordered = sorted(samples)
+    return {
+        "p50_ms": statistics.median(ordered) * 1000,
+        "p99_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))] * 1000,
+    }
+
+
+def run(args: argparse.Namespace) -> Dict[str, Any]:
+    with tempfile.TemporaryDirectory(prefix="library-bench-") as tmp:
+        root = Path(tmp)
+        repository = LibraryRepository(root)
+        entries = make_entries(root, args.entries)
+        repository.replace_entries(entries)
+
+        stop = threading.Event()
+        writes: List[float] = []
+
+        def writer() -> None:
+            while not stop.is_set():
+                started = time.perf_counter()
+                repository.replace_entries(entries)
+                writes.append(time.perf_counter() - started)
+
+        def list_page(offset: int) -> float:
+            started = time.perf_counter()
+            repository.list_entries(limit=25, offset=offset)
+            repository.count_entries()
+            return time.perf_counter() - started
+
+        def search(term: str) -> float:
+            started = time.perf_counter()
+            repository.list_entries(query=term, limit=25)
+            return time.perf_counter() - started
+
+        writer_thread = threading.Thread(target=writer, daemon=True)
+        if args.with_writer:
+            writer_thread.start()
+        rng = random.Random(5)
+        try:
+            with ThreadPoolExecutor(max_workers=args.readers) as pool:
+                offsets = [rng.randrange(0, max(1, args.entries - 25)) for _ in range(args.queries)]
+                list_samples = list(pool.map(list_page, offsets))
+                terms = [rng.choice(WORDS)[:4] for _ in range(args.queries)]
+                search_samples = list(pool.map(search, terms))
+        finally:
+            stop.set()
+            if args.with_writer:
+                writer_thread.join()
+        repository.close()
+
+    return {
+        "entries": args.entries,
+        "readers": args.readers,
+        "with_writer": args.with_writer,
+        "bulk_writes": len(writes),
+        "list": _percentiles(list_samples),
+        "search": _percentiles(search_samples),
+    }
+
+
+def main() -> int:
+    args = parse_args()
+    result = run(args)
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return 0
+    print(
+        f"entries: {result['entries']}  readers: {result['readers']}  "
+        f"concurrent writer: {result['with_writer']} ({result['bulk_writes']} bulk writes)"
+    )
+    for kind in ("list", "search"):
+        stats = result[kind]
+        print(f"{kind:>8}  p50 {stats['p50_ms']:8.2f} ms  p99 {stats['p99_ms']:8.2f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
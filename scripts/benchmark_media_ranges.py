@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""Measure media Range-request throughput of the storage file responder.
+
+Concurrent readers issue random ``Range`` requests against a temporary file
+served by :func:`_stream_local_file` and report requests/second, MiB/second
+and latency percentiles.  ``--legacy`` compares against the previous
+64 KiB ``StreamingResponse`` generator.  Example::
+
+    python scripts/benchmark_media_ranges.py --size-mb 256 --readers 1,8,32 \\
+        --range-kb 1024 --requests 400
+
+Requests go through the ASGI app in-process (``httpx.ASGITransport``), so the
+numbers exclude network and server overhead; production servers exposing
+``http.response.zerocopysend`` additionally avoid the user-space copy.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+import httpx  # noqa: E402
+from fastapi import FastAPI, Header, Request  # noqa: E402
+from fastapi.responses import StreamingResponse  # noqa: E402
+
+from modules.webapi.routes.media.storage import _stream_local_file  # noqa: E402
+
+
+def _legacy_chunks(path: Path, start: int, end: int) -> Iterator[bytes]:
+    remaining = end - start + 1
+    with path.open("rb") as stream:
+        stream.seek(start)
+        while remaining > 0:
+            chunk = stream.read(min(1 << 16, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+
+
+def build_app(path: Path, *, legacy: bool) -> FastAPI:
+    app = FastAPI()
+    size = path.stat().st_size
+
+    @app.get("/media")
+    async def media(request: Request, range_header: str | None = Header(default=None, alias="Range")):
+        if not legacy:
+            return _stream_local_file(path, range_header, request_headers=request.headers)
+        start_token, end_token = range_header[len("bytes=") :].split("-", 1)
+        start, end = int(start_token), min(int(end_token), size - 1)
+        return StreamingResponse(
+            _legacy_chunks(path, start, end),
+            status_code=206,
+            headers={"Content-Range": f"bytes {start}-{end}/{size}"},
+        )
+
+    return app
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--size-mb", type=int, default=64, help="Size of the test file.")
+    parser.add_argument("--readers", default="1,4,16", help="Comma-separated reader counts.")
+    parser.add_argument("--range-kb", type=int, default=512, help="Bytes per Range request.")
+    parser.add_argument("--requests", type=int, default=200, help="Requests per reader count.")
+    parser.add_argument("--legacy", action="store_true", help="Also benchmark the old responder.")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--json", action="store_true", help="Print raw results as JSON.")
+    return parser.parse_args()
+
+
+async def _measure(app: FastAPI, size: int, readers: int, args: argparse.Namespace) -> Dict[str, Any]:
+    span = args.range_kb * 1024
+    rng = random.Random(args.seed)
+    offsets = [rng.randrange(0, max(1, size - span)) for _ in range(args.requests)]
+    latencies: List[float] = []
+    received = 0
+    queue: asyncio.Queue[int] = asyncio.Queue()
+    for offset in offsets:
+        queue.put_nowait(offset)
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+
+        async def reader() -> None:
+            nonlocal received
+            while not queue.empty():
+                offset = queue.get_nowait()
+                started = time.perf_counter()
+                response = await client.get(
+                    "/media", headers={"Range": f"bytes={offset}-{offset + span - 1}"}
+                )
+                latencies.append(time.perf_counter() - started)
+                if response.status_code != 206:
+                    raise RuntimeError(f"unexpected status {response.status_code}")
+                received += len(response.content)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(reader() for _ in range(readers)))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "readers": readers,
+        "requests_per_second": len(offsets) / elapsed,
+        "mib_per_second": received / elapsed / (1 << 20),
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000,
+    }
+
+
+def main() -> int:
+    args = parse_args()
+    counts = [int(value) for value in args.readers.split(",") if value.strip()]
+    modes = ["current", "legacy"] if args.legacy else ["current"]
+    results: List[Dict[str, Any]] = []
+    with tempfile.TemporaryDirectory(prefix="media-ranges-") as tmp:
+        path = Path(tmp) / "sample.mp4"
+        with path.open("wb") as handle:
+            for _ in range(args.size_mb):
+                handle.write(os.urandom(1 << 20))
+        size = path.stat().st_size
+        for mode in modes:
+            app = build_app(path, legacy=mode == "legacy")
+            for readers in counts:
+                result = asyncio.run(_measure(app, size, readers, args))
+                result["mode"] = mode
+                results.append(result)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+    print(f"file: {args.size_mb} MiB  range: {args.range_kb} KiB  requests: {args.requests}")
+    print(f"{'mode':>8}{'readers':>9}{'req/s':>10}{'MiB/s':>10}{'p50 ms':>9}{'p99 ms':>9}")
+    for result in results:
+        print(
+            f"{result['mode']:>8}{result['readers']:>9}{result['requests_per_second']:>10.1f}"
+            f"{result['mib_per_second']:>10.1f}{result['p50_ms']:>9.2f}{result['p99_ms']:>9.2f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
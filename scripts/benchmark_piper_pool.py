@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""Measure Piper synthesis throughput (sentences/second) by worker count.
+
+``--workers 0`` runs synthesis in-process on ``--threads`` audio threads,
+which is how the backend behaves without a worker pool.  Any positive value
+starts a :class:`PiperWorkerPool` with that many processes and drives it from
+as many threads.  Example::
+
+    python scripts/benchmark_piper_pool.py --voice en_US-lessac-medium \\
+        --workers 0,1,2,4 --sentences 200
+
+``--synthetic`` replaces Piper with a CPU-bound stand-in so the pool's
+dispatch overhead and scaling can be checked on hosts without voice models.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from modules.audio.backends.piper_pool import PcmAudio, PiperWorkerPool  # noqa: E402
+
+SAMPLE_SENTENCES = (
+    "The quick brown fox jumps over the lazy dog near the riverbank.",
+    "She opened the letter slowly, afraid of what it might say.",
+    "By the time the train arrived, the platform was nearly empty.",
+    "Every morning he walked to the market to buy fresh bread.",
+    "The storm passed quickly, leaving the streets shining with rain.",
+)
+
+
+def _synthetic_loader(voice_name: str) -> str:
+    return voice_name
+
+
+def _synthetic_synthesizer(voice_name: str, text: str, length_scale: float) -> PcmAudio:
+    digest = text.encode("utf-8")
+    for _ in range(4000):
+        digest = hashlib.sha256(digest).digest()
+    frames = max(1, int(len(text) * 220 * length_scale))
+    return PcmAudio(pcm=b"\x00\x00" * frames, sample_rate=22050)
+
+
+def _piper_in_process(voice_name: str, text: str, length_scale: float) -> PcmAudio:
+    from modules.audio.backends.piper import _get_voice_model, _synthesize_pcm
+
+    return _synthesize_pcm(_get_voice_model(voice_name), text, length_scale)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--voice", default="en_US-lessac-medium", help="Piper voice model name.")
+    parser.add_argument("--workers", default="0,1,2,4", help="Comma-separated worker counts.")
+    parser.add_argument(
+        "--threads",
+        type=int,
+        default=None,
+        help="Caller threads (default: max(1, workers), mirroring audio_worker_body).",
+    )
+    parser.add_argument("--sentences", type=int, default=100, help="Sentences per run.")
+    parser.add_argument("--runs", type=int, default=3, help="Runs per worker count.")
+    parser.add_argument("--synthetic", action="store_true", help="Use a CPU-bound stand-in.")
+    parser.add_argument("--json", action="store_true", help="Print raw results as JSON.")
+    return parser.parse_args()
+
+
+def _run(
+    synthesize: Callable[[str, str, float], PcmAudio],
+    voice: str,
+    sentences: List[str],
+    threads: int,
+) -> float:
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        for audio in executor.map(lambda text: synthesize(voice, text, 1.0), sentences):
+            audio.to_segment()
+    return len(sentences) / (time.perf_counter() - started)
+
+
+def measure(args: argparse.Namespace, workers: int) -> Dict[str, Any]:
+    threads = args.threads or max(1, workers)
+    sentences = [SAMPLE_SENTENCES[i % len(SAMPLE_SENTENCES)] for i in range(args.sentences)]
+    loader = _synthetic_loader if args.synthetic else None
+    synthesizer = _synthetic_synthesizer if args.synthetic else None
+
+    pool = None
+    if workers > 0:
+        kwargs: Dict[str, Any] = {"preload_voices": [args.voice]}
+        if args.synthetic:
+            kwargs.update(loader=loader, synthesizer=synthesizer)
+        pool = PiperWorkerPool(workers, **kwargs).start()
+
+        def synthesize(voice: str, text: str, scale: float) -> PcmAudio:
+            return pool.synthesize(voice, text, scale)
+
+    else:
+        synthesize = _synthetic_synthesizer if args.synthetic else _piper_in_process
+
+    try:
+        # Warm-up: load the voice (and start worker processes).
+        _run(synthesize, args.voice, sentences[: max(1, threads)], threads)
+        samples = [
+            _run(synthesize, args.voice, sentences, threads) for _ in range(max(1, args.runs))
+        ]
+    finally:
+        if pool is not None:
+            pool.close()
+    return {
+        "workers": workers,
+        "threads": threads,
+        "sentences_per_second": statistics.median(samples),
+        "samples": samples,
+    }
+
+
+def main() -> int:
+    args = parse_args()
+    counts = [int(value) for value in args.workers.split(",") if value.strip()]
+    results = [measure(args, count) for count in counts]
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+    baseline = results[0]["sentences_per_second"] if results else 0.0
+    mode = "synthetic" if args.synthetic else args.voice
+    print(f"voice: {mode}  sentences per run: {args.sentences}  runs: {args.runs}")
+    print(f"{'workers':>8}{'threads':>9}{'sent/s':>10}{'speed-up':>10}")
+    for result in results:
+        rate = result["sentences_per_second"]
+        speedup = rate / baseline if baseline else 0.0
+        print(f"{result['workers']:>8}{result['threads']:>9}{rate:>10.2f}{speedup:>9.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""Measure time-to-playable after a seek with playhead-aware rendering.
+
+A simulated job of ``--sentences`` sentences is rendered on a
+:class:`ThreadWorkerPool` with ``--workers`` workers, each sentence taking
+``--render-ms``.  Once ``--seek-after`` sentences are done the player seeks
+to a random later sentence; time-to-playable is the time until every
+sentence of the chunk holding the seek target (``--chunk-size`` sentences)
+has rendered.  Two modes are compared over ``--trials`` seeks, each with
+p50/p99 time-to-playable and the mean time to finish the whole job:
+
+* ``ordered``     – work dispatched in sentence order (playhead ignored);
+* ``prioritized`` – work dispatched nearest the reported playhead first,
+  with the fairness interval keeping the start of the job moving.
+
+Example::
+
+    python scripts/benchmark_render_priority.py --sentences 400 --workers 4 \\
+        --render-ms 2 --chunk-size 10 --trials 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from modules.render_priority import RenderPriority  # noqa: E402
+from modules.translation_engine import ThreadWorkerPool, _iter_prioritized  # noqa: E402
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--sentences", type=int, default=300, help="Sentences in the job.")
+    parser.add_argument("--workers", type=int, default=4, help="Render workers.")
+    parser.add_argument("--render-ms", type=float, default=2.0, help="Render time per sentence.")
+    parser.add_argument("--chunk-size", type=int, default=10, help="Sentences per chunk.")
+    parser.add_argument("--seek-after", type=int, default=20, help="Sentences done before the seek.")
+    parser.add_argument("--trials", type=int, default=15, help="Seeks per mode.")
+    parser.add_argument("--seed", type=int, default=7, help="Random seed for seek targets.")
+    parser.add_argument("--json", action="store_true", help="Print raw results as JSON.")
+    return parser.parse_args()
+
+
+def _chunk(sentence: int, chunk_size: int) -> Tuple[int, int]:
+    start = ((sentence - 1) // chunk_size) * chunk_size + 1
+    return start, start + chunk_size - 1
+
+
+def _trial(
+    args: argparse.Namespace, pool: ThreadWorkerPool, target: int, *, prioritized: bool
+) -> Tuple[float, float]:
+    priority = RenderPriority()
+    priority.set_region_resolver(lambda number: _chunk(number, args.chunk_size)[0])
+    chunk_start, chunk_end = _chunk(target, args.chunk_size)
+    pending_chunk = set(range(chunk_start, min(chunk_end, args.sentences) + 1))
+    render_seconds = args.render_ms / 1000.0
+
+    def _render(number: int) -> int:
+        time.sleep(render_seconds)
+        return number
+
+    futures_map: Dict[Any, int] = {}
+    started = time.perf_counter()
+    seeked_at = None
+    playable_after = None
+    completed = 0
+    for future in _iter_prioritized(
+        pool,
+        [(number, number, (number,)) for number in range(1, args.sentences + 1)],
+        futures_map,
+        priority,
+        func=_render,
+        window=2 * args.workers,
+        stop_event=None,
+    ):
+        completed += 1
+        pending_chunk.discard(futures_map[future])
+        if seeked_at is None and completed >= args.seek_after:
+            seeked_at = time.perf_counter()
+            if prioritized:
+                priority.report(target, seek=True)
+        if seeked_at is not None and playable_after is None and not pending_chunk:
+            playable_after = time.perf_counter() - seeked_at
+    return playable_after or 0.0, time.perf_counter() - started
+
+
+def _summary(mode: str, playable: List[float], totals: List[float]) -> Dict[str, Any]:
+    playable = sorted(playable)
+    return {
+        "mode": mode,
+        "trials": len(playable),
+        "p50_ms": statistics.median(playable) * 1000,
+        "p99_ms": playable[min(len(playable) - 1, int(len(playable) * 0.99))] * 1000,
+        "job_ms": statistics.mean(totals) * 1000,
+    }
+
+
+def run(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    rng = random.Random(args.seed)
+    first_target = min(args.sentences, args.seek_after + 2 * args.workers + args.chunk_size)
+    targets = [rng.randint(first_target, args.sentences) for _ in range(args.trials)]
+    results: List[Dict[str, Any]] = []
+    with ThreadWorkerPool(max_workers=args.workers) as pool:
+        for mode, prioritized in (("ordered", False), ("prioritized", True)):
+            outcomes = [_trial(args, pool, target, prioritized=prioritized) for target in targets]
+            results.append(
+                _summary(mode, [playable for playable, _ in outcomes], [total for _, total in outcomes])
+            )
+    return results
+
+
+def main() -> int:
+    args = parse_args()
+    results = run(args)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+    print(
+        f"sentences: {args.sentences}  workers: {args.workers}  render: {args.render_ms} ms  "
+        f"chunk: {args.chunk_size}  trials: {args.trials}"
+    )
+    print(f"{'mode':>12}{'trials':>8}{'p50 ms':>9}{'p99 ms':>9}{'job ms':>9}")
+    for result in results:
+        print(
+            f"{result['mode']:>12}{result['trials']:>8}"
+            f"{result['p50_ms']:>9.2f}{result['p99_ms']:>9.2f}{result['job_ms']:>9.2f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
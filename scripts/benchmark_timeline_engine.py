@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""Compare the reference timeline loops with the numpy timeline engine.
+
+A synthetic chunk of ``--sentences`` sentences is built with ``--tokens``
+word tokens per sentence on the translation track (character-level aligner
+output produces a few hundred) and roughly half as many on the original
+track.  Each stage then runs ``--repeats`` times with
+``EBOOK_TIMELINE_ENGINE=python`` (the original per-token loops) and with
+``EBOOK_TIMELINE_ENGINE=numpy``:
+
+* ``separate_tracks`` – :func:`build_separate_track_timings`;
+* ``smoothing``       – :func:`smooth_token_boundaries` over the chunk's tokens;
+* ``validation``      – :func:`validate_export_timing_tracks` on the result;
+* ``offsets``         – :func:`compute_cumulative_offsets` over token durations.
+
+Outputs are compared with ``repr`` before timing, so any drift fails the run.
+Example::
+
+    python scripts/benchmark_timeline_engine.py --sentences 40 --tokens 200 --repeats 30
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from modules.core.rendering import timeline_engine  # noqa: E402
+from modules.core.rendering.timeline import (  # noqa: E402
+    SentenceTimingSpec,
+    build_separate_track_timings,
+    compute_cumulative_offsets,
+    smooth_token_boundaries,
+    validate_export_timing_tracks,
+)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--sentences", type=int, default=30, help="Sentences in the chunk.")
+    parser.add_argument("--tokens", type=int, default=160, help="Translation tokens per sentence.")
+    parser.add_argument("--repeats", type=int, default=25, help="Timed runs per stage and mode.")
+    parser.add_argument("--seed", type=int, default=17, help="Random seed for token jitter.")
+    parser.add_argument("--json", action="store_true", help="Print raw results as JSON.")
+    return parser.parse_args()
+
+
+def _tokens(rng: random.Random, count: int) -> List[Dict[str, Any]]:
+    tokens: List[Dict[str, Any]] = []
+    cursor = 0.0
+    for index in range(count):
+        length = rng.uniform(0.02, 0.09)
+        start = max(cursor + rng.uniform(-0.01, 0.01), 0.0)
+        tokens.append({"text": f"c{index}", "start": start, "end": start + length})
+        cursor += length
+    return tokens
+
+
+def _specs(args: argparse.Namespace) -> List[SentenceTimingSpec]:
+    rng = random.Random(args.seed)
+    specs: List[SentenceTimingSpec] = []
+    for offset in range(args.sentences):
+        translation = _tokens(rng, args.tokens)
+        original = _tokens(rng, max(args.tokens // 2, 1))
+        specs.append(
+            SentenceTimingSpec(
+                sentence_idx=offset + 1,
+                original_text="",
+                translation_text="",
+                original_words=[],
+                translation_words=[],
+                word_tokens=translation,
+                original_word_tokens=original,
+                translation_duration=translation[-1]["end"] * rng.uniform(0.95, 1.05),
+                original_duration=original[-1]["end"] * rng.uniform(0.95, 1.05),
+                gap_before_translation=0.0,
+                gap_after_translation=0.0,
+                char_weighted_enabled=False,
+                punctuation_boost=False,
+                policy="forced",
+                source="aligner",
+            )
+        )
+    return specs
+
+
+def _with_engine(mode: str, run: Callable[[], Any]) -> Any:
+    previous = os.environ.get(timeline_engine.TIMELINE_ENGINE_ENV_VAR)
+    os.environ[timeline_engine.TIMELINE_ENGINE_ENV_VAR] = mode
+    try:
+        return run()
+    finally:
+        if previous is None:
+            os.environ.pop(timeline_engine.TIMELINE_ENGINE_ENV_VAR, None)
+        else:
+            os.environ[timeline_engine.TIMELINE_ENGINE_ENV_VAR] = previous
+
+
+def _summary(stage: str, mode: str, timings: List[float], tokens: int) -> Dict[str, Any]:
+    timings = sorted(timings)
+    return {
+        "stage": stage,
+        "mode": mode,
+        "tokens": tokens,
+        "runs": len(timings),
+        "p50_ms": statistics.median(timings) * 1000,
+        "p99_ms": timings[min(len(timings) - 1, int(len(timings) * 0.99))] * 1000,
+    }
+
+
+def run(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    specs = _specs(args)
+    original_total = sum(spec.original_duration for spec in specs)
+    translation_total = sum(spec.translation_duration for spec in specs)
+
+    def separate(batch: List[SentenceTimingSpec]) -> Dict[str, Any]:
+        return build_separate_track_timings(
+            batch,
+            original_duration=original_total,
+            translation_duration=translation_total,
+            use_local_indices=True,
+        )
+
+    tracks = _with_engine("python", lambda: separate(copy.deepcopy(specs)))
+    flat_tokens = [token for spec in specs for token in spec.word_tokens or []]
+    durations = [token["end"] - token["start"] for token in flat_tokens]
+    track_durations = {"original": original_total, "translation": translation_total}
+    # (prepare, run): builders mutate their specs, so each run gets a fresh copy
+    # prepared outside the timed section.
+    stages: Dict[str, Tuple[Callable[[], Any], Callable[[Any], Any]]] = {
+        "separate_tracks": (lambda: copy.deepcopy(specs), separate),
+        "smoothing": (lambda: flat_tokens, smooth_token_boundaries),
+        "validation": (
+            lambda: tracks,
+            lambda prepared: validate_export_timing_tracks(prepared, track_durations),
+        ),
+        "offsets": (lambda: durations, compute_cumulative_offsets),
+    }
+
+    results: List[Dict[str, Any]] = []
+    for stage, (prepare, stage_run) in stages.items():
+        expected = repr(_with_engine("python", lambda: stage_run(prepare())))
+        if repr(_with_engine("numpy", lambda: stage_run(prepare()))) != expected:
+            raise SystemExit(f"numpy engine output differs for {stage}")
+        for mode in ("python", "numpy"):
+            timings: List[float] = []
+            for _ in range(args.repeats):
+                prepared = prepare()
+                started = time.perf_counter()
+                _with_engine(mode, lambda: stage_run(prepared))
+                timings.append(time.perf_counter() - started)
+            results.append(_summary(stage, mode, timings, len(flat_tokens)))
+    return results
+
+
+def main() -> int:
+    if timeline_engine.np is None:
+        print("numpy is not installed; nothing to compare.")
+        return 1
+    args = parse_args()
+    results = run(args)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+    print(f"sentences: {args.sentences}  tokens/sentence: {args.tokens}  repeats: {args.repeats}")
+    print(f"{'stage':>16}{'mode':>8}{'runs':>6}{'p50 ms':>9}{'p99 ms':>9}")
+    for result in results:
+        print(
+            f"{result['stage']:>16}{result['mode']:>8}{result['runs']:>6}"
+            f"{result['p50_ms']:>9.3f}{result['p99_ms']:>9.3f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""Compare chunk JSON timing with columnar timing files on a synthetic book.
+
+A book of ``--sentences`` sentences (``--words`` tokens per sentence on the
+translation track, a little fewer on the original track) is split into chunks
+of ``--chunk-size`` sentences.  Each chunk's timing tracks are written twice:
+
+* ``chunk_json`` – ``timingTracks`` as stored in ``metadata/chunk_*.json``
+  (written the way ``write_chunk_file`` does, without the sentence payloads,
+  so the JSON size is a lower bound);
+* ``columns``    – the packed files of :mod:`modules.core.rendering.timing_columns`.
+
+Then ``--queries`` random windows of ``--window`` sentences are fetched.  The
+JSON path opens and parses every overlapping chunk and filters its tokens;
+the columnar path reads only the matching slices, either as JSON-ready tokens
+(``columns_json``) or as the packed blobs the range API returns
+(``columns_binary``).  On-disk size and p50/p99 latency are reported.
+Example::
+
+    python scripts/benchmark_timing_columns.py --sentences 20000 --chunk-size 10 \\
+        --window 8 --queries 400
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from modules.core.rendering.timing_columns import TimingColumnStore  # noqa: E402
+from modules.services.job_manager.chunk_persistence import (  # noqa: E402
+    format_chunk_filename,
+    write_chunk_file,
+)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--sentences", type=int, default=10000, help="Sentences in the book.")
+    parser.add_argument("--words", type=int, default=16, help="Translation tokens per sentence.")
+    parser.add_argument("--chunk-size", type=int, default=10, help="Sentences per chunk.")
+    parser.add_argument("--window", type=int, default=6, help="Sentences per range query.")
+    parser.add_argument("--queries", type=int, default=300, help="Range queries to time.")
+    parser.add_argument("--seed", type=int, default=11, help="Random seed for query windows.")
+    parser.add_argument("--json", action="store_true", help="Print raw results as JSON.")
+    return parser.parse_args()
+
+
+def _chunk_tracks(sentences: int, words: int, rng: random.Random) -> Dict[str, List[Dict[str, Any]]]:
+    tracks: Dict[str, List[Dict[str, Any]]] = {"original": [], "translation": []}
+    for name, lane, count in (("translation", "trans", words), ("original", "orig", max(words - 3, 1))):
+        cursor = 0.0
+        for sentence_idx in range(sentences):
+            for word_idx in range(count):
+                duration = rng.randint(40, 160) * 0.003
+                tracks[name].append(
+                    {
+                        "lane": lane,
+                        "sentenceIdx": sentence_idx,
+                        "wordIdx": word_idx,
+                        "start": round(cursor, 6),
+                        "end": round(cursor + duration, 6),
+                    }
+                )
+                cursor += duration
+    return tracks
+
+
+def _build_book(args: argparse.Namespace, root: Path) -> List[Dict[str, Any]]:
+    rng = random.Random(args.seed)
+    metadata_root = root / "metadata"
+    store = TimingColumnStore(metadata_root / "timing")
+    chunks: List[Dict[str, Any]] = []
+    for index, start in enumerate(range(1, args.sentences + 1, args.chunk_size)):
+        end = min(start + args.chunk_size - 1, args.sentences)
+        tracks = _chunk_tracks(end - start + 1, args.words, rng)
+        path = metadata_root / format_chunk_filename(index)
+        write_chunk_file(
+            path,
+            {
+                "version": 3,
+                "chunk_id": f"chunk-{index}",
+                "start_sentence": start,
+                "end_sentence": end,
+                "timingTracks": tracks,
+            },
+        )
+        store.write_chunk(f"chunk-{index}", start, end, tracks)
+        chunks.append({"start": start, "end": end, "path": path})
+    return chunks
+
+
+def _size(paths: List[Path]) -> int:
+    return sum(path.stat().st_size for path in paths)
+
+
+def _json_range(chunks: List[Dict[str, Any]], first: int, last: int) -> List[Dict[str, Any]]:
+    result: List[Dict[str, Any]] = []
+    for chunk in chunks:
+        if chunk["end"] < first or chunk["start"] > last:
+            continue
+        with chunk["path"].open("r", encoding="utf-8") as handle:
+            payload = json.load(handle)
+        lo, hi = first - chunk["start"], last - chunk["start"]
+        result.append(
+            {
+                name: [token for token in tokens if lo <= token["sentenceIdx"] <= hi]
+                for name, tokens in payload["timingTracks"].items()
+            }
+        )
+    return result
+
+
+def _summary(mode: str, timings: List[float]) -> Dict[str, Any]:
+    timings = sorted(timings)
+    return {
+        "mode": mode,
+        "queries": len(timings),
+        "p50_ms": statistics.median(timings) * 1000,
+        "p99_ms": timings[min(len(timings) - 1, int(len(timings) * 0.99))] * 1000,
+    }
+
+
+def run(args: argparse.Namespace) -> Dict[str, Any]:
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        chunks = _build_book(args, root)
+        store = TimingColumnStore(root / "metadata" / "timing")
+        rng = random.Random(args.seed + 1)
+        windows = []
+        for _ in range(args.queries):
+            first = rng.randint(1, max(args.sentences - args.window + 1, 1))
+            windows.append((first, first + args.window - 1))
+
+        for first, last in windows[:20]:
+            expected = _json_range(chunks, first, last)
+            actual = [item.to_timing_tracks() for item in store.read_range(first, last)]
+            if actual != expected:
+                raise SystemExit(f"columnar range {first}-{last} differs from chunk JSON")
+
+        modes: Dict[str, Callable[[int, int], Any]] = {
+            "chunk_json": lambda first, last: _json_range(chunks, first, last),
+            "columns_json": lambda first, last: [
+                item.to_timing_tracks() for item in store.read_range(first, last)
+            ],
+            "columns_binary": lambda first, last: b"".join(
+                item.encode() for item in store.read_range(first, last)
+            ),
+        }
+        results: List[Dict[str, Any]] = []
+        for mode, fetch in modes.items():
+            timings: List[float] = []
+            for first, last in windows:
+                started = time.perf_counter()
+                fetch(first, last)
+                timings.append(time.perf_counter() - started)
+            results.append(_summary(mode, timings))
+        return {
+            "sentences": args.sentences,
+            "chunks": len(chunks),
+            "json_bytes": _size([chunk["path"] for chunk in chunks]),
+            "columns_bytes": _size([path for _, _, path in store.chunks()]),
+            "results": results,
+        }
+
+
+def main() -> int:
+    args = parse_args()
+    report = run(args)
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return 0
+    print(
+        f"sentences: {report['sentences']}  chunks: {report['chunks']}  "
+        f"window: {args.window}  queries: {args.queries}"
+    )
+    ratio = report["json_bytes"] / max(report["columns_bytes"], 1)
+    print(
+        f"on disk: chunk JSON {report['json_bytes'] / 1e6:.2f} MB  "
+        f"columns {report['columns_bytes'] / 1e6:.2f} MB  ({ratio:.1f}x smaller)"
+    )
+    print(f"{'mode':>16}{'queries':>9}{'p50 ms':>9}{'p99 ms':>9}")
+    for result in report["results"]:
+        print(
+            f"{result['mode']:>16}{result['queries']:>9}"
+            f"{result['p50_ms']:>9.3f}{result['p99_ms']:>9.3f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
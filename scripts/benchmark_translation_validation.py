@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""Compare per-call translation validation with precompiled profiles.
+
+A multilingual corpus of source/translation pairs (CJK, Indic, Arabic,
+Hebrew, Cyrillic, Thai and Latin targets) is replicated to ``--batch``
+numbered (distinct) items per language and validated ``--repeats`` times in
+two ways:
+
+* ``reference`` – the per-call checks of ``translation_validation``, in the
+  order ``validate_batch_translation`` used to run them;
+* ``profiled``  – :class:`BatchValidator` with the language's precompiled
+  profile, one validator per batch.
+
+Per-batch p50/p99 latency is reported for the script checks alone and for the
+full validation including sentence-boundary tokenization.  Results are
+checked for equality before timing.  Example::
+
+    python scripts/benchmark_translation_validation.py --batch 64 --repeats 30
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from modules import translation_validation as tv  # noqa: E402
+from modules.translation_validation_profiles import BatchValidator  # noqa: E402
+
+_SOURCE = (
+    "The old lighthouse keeper climbed the stairs every evening to light the lamp, "
+    "even after the ships had stopped coming."
+)
+
+CORPUS: Dict[str, Sequence[str]] = {
+    "japanese": (
+        "年老いた 灯台守 は 船 が 来なく なった 後 も 毎晩 階段 を 上って ランプ を 灯した",
+        "灯台守は毎晩階段を上ってランプを灯した",
+    ),
+    "chinese": (
+        "老 灯塔 看守 每天 晚上 都 爬 上 楼梯 点亮 灯 即使 船 已经 不再 来 了",
+        "老灯塔看守每天晚上都爬上楼梯点亮灯",
+    ),
+    "thai": (
+        "ผู้ดูแล ประภาคาร ชรา ปีน บันได ทุก เย็น เพื่อ จุด ตะเกียง แม้ เรือ จะ ไม่ มา แล้ว",
+        "ผู้ดูแลประภาคารชราปีนบันไดทุกเย็น",
+    ),
+    "hindi": (
+        "बूढ़ा प्रकाशस्तंभ रक्षक हर शाम दीपक जलाने के लिए सीढ़ियाँ चढ़ता था, भले ही जहाज़ आना बंद हो गए थे।",
+        "बूढ़ा रक्षक हर शाम सीढ़ियाँ चढ़ता था",
+    ),
+    "kannada": (
+        "ಹಡಗುಗಳು ಬರುವುದನ್ನು ನಿಲ್ಲಿಸಿದ ನಂತರವೂ ಹಳೆಯ ದೀಪಸ್ತಂಭದ ಕಾವಲುಗಾರ ಪ್ರತಿದಿನ ಸಂಜೆ ದೀಪ ಹಚ್ಚಲು ಮೆಟ್ಟಿಲು ಹತ್ತುತ್ತಿದ್ದ.",
+        "ಹಳೆಯ ಕಾವಲುಗಾರ ஹலோ ნახვამდის",
+    ),
+    "arabic": (
+        "كَانَ حَارِسُ المَنَارَةِ العَجُوزُ يَصْعَدُ الدَّرَجَ كُلَّ مَسَاءٍ لِيُشْعِلَ المِصْبَاحَ.",
+        "كان حارس المنارة العجوز يصعد الدرج كل مساء ليشعل المصباح.",
+    ),
+    "hebrew": (
+        "שׁוֹמֵר הַמִּגְדַּלּוֹר הַזָּקֵן עָלָה בַּמַּדְרֵגוֹת כָּל עֶרֶב כְּדֵי לְהַדְלִיק אֶת הַמְּנוֹרָה.",
+        "שומר המגדלור הזקן עלה במדרגות כל ערב.",
+    ),
+    "russian": (
+        "Старый смотритель маяка каждый вечер поднимался по лестнице, чтобы зажечь лампу.",
+        "Staryi smotritel mayaka kazhdyi vecher podnimalsya po lestnitse.",
+    ),
+    "spanish": (
+        "El viejo farero subía las escaleras cada tarde para encender la lámpara, "
+        "incluso después de que los barcos dejaran de venir.",
+        "Subía.",
+    ),
+}
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--batch", type=int, default=48, help="Items per language batch.")
+    parser.add_argument("--repeats", type=int, default=20, help="Timed batches per language.")
+    parser.add_argument("--json", action="store_true", help="Print raw results as JSON.")
+    return parser.parse_args()
+
+
+def _reference(
+    items: Sequence[Tuple[str, str]], language: str, *, boundaries: bool
+) -> List[Optional[str]]:
+    errors: List[Optional[str]] = []
+    for original, translation in items:
+        error: Optional[str] = None
+        if not tv.is_valid_translation(translation):
+            error = "Invalid or placeholder translation"
+        elif tv.is_probable_transliteration(original, translation, language):
+            error = "Transliteration returned instead of translation"
+        elif tv.is_translation_too_short(original, translation, language):
+            error = "Translation shorter than expected"
+        else:
+            missing, label = tv.missing_required_diacritics(translation, language)
+            if missing:
+                error = f"Missing {label or 'required diacritics'}"
+            else:
+                mismatch, script_label = tv.unexpected_script_used(translation, language)
+                if mismatch:
+                    error = f"Unexpected script used; expected {script_label or 'target script'}"
+                elif boundaries:
+                    error = tv.validate_batch_sentence_boundaries(original, translation)
+        errors.append(error)
+    return errors
+
+
+def _profiled(
+    items: Sequence[Tuple[str, str]], language: str, *, boundaries: bool
+) -> List[Optional[str]]:
+    return BatchValidator(language).validate_many(items, check_sentence_boundaries=boundaries)
+
+
+def _time(run: Callable[[], Any], repeats: int) -> List[float]:
+    timings: List[float] = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+def _summary(mode: str, checks: str, timings: List[float], items: int) -> Dict[str, Any]:
+    timings = sorted(timings)
+    return {
+        "mode": mode,
+        "checks": checks,
+        "batches": len(timings),
+        "items_per_batch": items,
+        "p50_ms": statistics.median(timings) * 1000,
+        "p99_ms": timings[min(len(timings) - 1, int(len(timings) * 0.99))] * 1000,
+    }
+
+
+def run(args: argparse.Namespace) -> List[Dict[str, Any]]:
+    batches = {
+        language: [
+            # Numbered so items do not repeat; batches rarely contain duplicates.
+            (f"{_SOURCE} {index}", f"{translations[index % len(translations)]} {index}")
+            for index in range(args.batch)
+        ]
+        for language, translations in CORPUS.items()
+    }
+    results: List[Dict[str, Any]] = []
+    for checks, boundaries in (("script", False), ("full", True)):
+        for language, items in batches.items():
+            expected = _reference(items, language, boundaries=boundaries)
+            actual = _profiled(items, language, boundaries=boundaries)
+            if actual != expected:
+                raise SystemExit(f"profiled validation differs for {language}: {actual} != {expected}")
+        for mode, validate in (("reference", _reference), ("profiled", _profiled)):
+            timings: List[float] = []
+            for language, items in batches.items():
+                timings.extend(
+                    _time(lambda: validate(items, language, boundaries=boundaries), args.repeats)
+                )
+            results.append(_summary(mode, checks, timings, args.batch))
+    return results
+
+
+def main() -> int:
+    args = parse_args()
+    results = run(args)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+    print(f"languages: {len(CORPUS)}  batch: {args.batch}  repeats: {args.repeats}")
+    print(f"{'mode':>10}{'checks':>8}{'batches':>9}{'p50 ms':>9}{'p99 ms':>9}")
+    for result in results:
+        print(
+            f"{result['mode']:>10}{result['checks']:>8}{result['batches']:>9}"
+            f"{result['p50_ms']:>9.3f}{result['p99_ms']:>9.3f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""Rebuild ``metadata/chunks_index.json`` for existing jobs.
+
+Jobs written before the chunk summary index existed have none, so the media,
+timing and search routes keep reading their chunk files.  This script scans
+each job's ``metadata/chunk_*.json`` once and writes the index atomically.
+
+Usage:
+    python scripts/rebuild_chunk_index.py <job_id_or_path> [<job_id_or_path> ...]
+    python scripts/rebuild_chunk_index.py --all [--storage-root storage]
+
+``--force`` re-reads every chunk file instead of keeping the entries of an
+existing index whose files are unchanged; ``--dry-run`` only reports.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Iterable, List
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from modules.chunk_index import (  # noqa: E402
+    build_chunk_index,
+    load_chunk_index,
+    write_chunk_index,
+)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("jobs", nargs="*", help="Job ids or job directories.")
+    parser.add_argument("--all", action="store_true", help="Rebuild every job under the storage root.")
+    parser.add_argument(
+        "--storage-root",
+        type=Path,
+        default=PROJECT_ROOT / "storage",
+        help="Directory holding job folders (default: %(default)s).",
+    )
+    parser.add_argument("--force", action="store_true", help="Re-read every chunk file.")
+    parser.add_argument("--dry-run", action="store_true", help="Report without writing.")
+    return parser.parse_args()
+
+
+def find_job_dir(job_id_or_path: str, storage_root: Path) -> Path:
+    """Resolve a job directory from an id or a path."""
+
+    candidate = Path(job_id_or_path)
+    if (candidate / "metadata").is_dir():
+        return candidate.resolve()
+    for root in (storage_root, storage_root / "jobs"):
+        if (root / job_id_or_path / "metadata").is_dir():
+            return (root / job_id_or_path).resolve()
+    raise FileNotFoundError(f"Cannot find job directory for: {job_id_or_path}")
+
+
+def iter_job_dirs(storage_root: Path) -> Iterable[Path]:
+    for root in (storage_root, storage_root / "jobs"):
+        if not root.is_dir():
+            continue
+        for candidate in sorted(root.iterdir()):
+            metadata_root = candidate / "metadata"
+            if metadata_root.is_dir() and any(metadata_root.glob("chunk_*.json")):
+                yield candidate
+
+
+def rebuild(job_dir: Path, *, force: bool, dry_run: bool) -> str:
+    metadata_root = job_dir / "metadata"
+    previous = None if force else load_chunk_index(metadata_root)
+    index = build_chunk_index(metadata_root, previous=previous)
+    chunks = index["chunks"]
+    estimated = sum(1 for entry in chunks.values() if entry.get("estimated_policy"))
+    unreadable = sum(1 for entry in chunks.values() if not entry.get("valid"))
+    if not dry_run:
+        write_chunk_index(metadata_root, index)
+    action = "would write" if dry_run else "wrote"
+    return (
+        f"{job_dir.name}: {action} {len(chunks)} chunk entries "
+        f"({estimated} estimated, {unreadable} unreadable)"
+    )
+
+
+def main() -> int:
+    args = parse_args()
+    job_dirs: List[Path] = []
+    if args.all:
+        job_dirs.extend(iter_job_dirs(args.storage_root))
+    try:
+        job_dirs.extend(find_job_dir(job, args.storage_root) for job in args.jobs)
+    except FileNotFoundError as exc:
+        print(exc, file=sys.stderr)
+        return 1
+    if not job_dirs:
+        print("No jobs selected; pass job ids or --all.", file=sys.stderr)
+        return 1
+    for job_dir in job_dirs:
+        print(rebuild(job_dir, force=args.force, dry_run=args.dry_run))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -52,6 +52,10 @@ def _prepare_hf_cache_for_tests() -> None:
 _prepare_hf_cache_for_tests()
 configure_hf_environment()
 
+# Keep LLM transliterations from leaking between tests through the shared
+# on-disk transliteration memory; tests that need it build their own.
+os.environ.setdefault("EBOOK_TRANSLITERATION_MEMORY", "off")
+
 APPLE_MARKER_FILE_NAMES = {
     "test_language_catalog_parity.py",
     "test_release_version_contract.py",
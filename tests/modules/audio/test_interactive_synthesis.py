@@ -0,0 +1,178 @@
+"""Tests for single-flight, cached and streamed interactive synthesis."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterator, List
+
+import pytest
+
+from modules.audio.interactive_synthesis import (
+    FALLBACK_INFO_KEY,
+    InteractiveSynthesisService,
+    SynthesisKey,
+)
+
+pytestmark = pytest.mark.audio
+
+
+def _key(text: str = "Hello there.", *, voice: str = "en_US-lessac-medium") -> SynthesisKey:
+    return SynthesisKey(engine="piper", voice=voice, language="en", speed=170, text=text)
+
+
+@pytest.fixture
+def service(tmp_path: Path) -> Iterator[InteractiveSynthesisService]:
+    instance = InteractiveSynthesisService(tmp_path / "cache", first_chunk_bytes=64)
+    yield instance
+    instance.close()
+
+
+def test_identical_concurrent_requests_share_one_synthesis(service) -> None:
+    calls: List[str] = []
+    release = threading.Event()
+
+    def producer(destination: Path, info: Dict[str, str]) -> None:
+        calls.append(destination.name)
+        assert release.wait(5)
+        destination.write_bytes(b"ID3-short")
+        info["X-Synthesis-Engine"] = "piper"
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [pool.submit(service.synthesize, _key(), producer) for _ in range(4)]
+        time.sleep(0.1)
+        release.set()
+        results = [future.result(5) for future in futures]
+
+    assert len(calls) == 1
+    assert sorted(result.source for result in results) == ["shared", "shared", "shared", "synthesized"]
+    assert all(result.data == b"ID3-short" for result in results)
+    assert all(result.info == {"X-Synthesis-Engine": "piper"} for result in results)
+    assert service.stats()["in_flight"] == 0
+
+
+def test_repeats_are_served_from_memory_then_disk(service, tmp_path: Path) -> None:
+    calls: List[int] = []
+
+    def producer(destination: Path, info: Dict[str, str]) -> None:
+        calls.append(1)
+        destination.write_bytes(b"clip-bytes")
+        info["X-Selected-Voice"] = "en_US-lessac-medium"
+
+    assert service.synthesize(_key(), producer).source == "synthesized"
+    assert service.synthesize(_key(), producer).source == "memory"
+    service.clear_memory()
+    from_disk = service.synthesize(_key(), producer)
+    assert (from_disk.source, from_disk.data) == ("disk", b"clip-bytes")
+    assert from_disk.info == {"X-Selected-Voice": "en_US-lessac-medium"}
+
+    restarted = InteractiveSynthesisService(tmp_path / "cache")
+    try:
+        assert restarted.synthesize(_key(), producer).source == "disk"
+    finally:
+        restarted.close()
+    assert calls == [1]
+
+
+def test_disk_cache_evicts_least_recently_used_clips(tmp_path: Path) -> None:
+    service = InteractiveSynthesisService(
+        tmp_path / "cache",
+        memory_cache_bytes=0,
+        disk_cache_bytes=250,
+    )
+
+    def producer(destination: Path, _info: Dict[str, str]) -> None:
+        destination.write_bytes(b"x" * 100)
+
+    try:
+        service.synthesize(_key("one"), producer)
+        time.sleep(0.02)
+        service.synthesize(_key("two"), producer)
+        time.sleep(0.02)
+        assert service.synthesize(_key("one"), producer).source == "disk"
+        time.sleep(0.02)
+        service.synthesize(_key("three"), producer)
+
+        assert service.stats()["disk_evictions"] == 1
+        assert service.synthesize(_key("one"), producer).source == "disk"
+        assert service.synthesize(_key("two"), producer).source == "synthesized"
+    finally:
+        service.close()
+
+
+def test_long_clips_stream_before_synthesis_finishes(service) -> None:
+    finish = threading.Event()
+
+    def producer(destination: Path, info: Dict[str, str]) -> None:
+        info["X-Synthesis-Engine"] = "piper"
+        with destination.open("wb") as handle:
+            handle.write(b"a" * 100)
+            handle.flush()
+            assert finish.wait(5)
+            handle.write(b"b" * 50)
+
+    result = service.synthesize(_key(), producer)
+    assert result.streaming
+    assert result.info == {"X-Synthesis-Engine": "piper"}
+    first = next(result.chunks)
+    assert first == b"a" * 100
+    finish.set()
+    assert first + b"".join(result.chunks) == b"a" * 100 + b"b" * 50
+    assert service.synthesize(_key(), producer).source == "memory"
+
+
+def test_producer_errors_reach_every_caller_and_are_not_cached(service) -> None:
+    def failing(_destination: Path, _info: Dict[str, str]) -> None:
+        raise ValueError("engine down")
+
+    with pytest.raises(ValueError, match="engine down"):
+        service.synthesize(_key(), failing)
+
+    def working(destination: Path, _info: Dict[str, str]) -> None:
+        destination.write_bytes(b"ok")
+
+    assert service.synthesize(_key(), working).source == "synthesized"
+    assert service.stats()["errors"] == 1
+
+
+def test_fallback_clips_are_served_but_not_cached(service) -> None:
+    calls: List[int] = []
+
+    def fallback(destination: Path, info: Dict[str, str]) -> None:
+        calls.append(1)
+        destination.write_bytes(b"gtts-bytes")
+        info[FALLBACK_INFO_KEY] = "piper"
+
+    first = service.synthesize(_key(), fallback)
+    assert (first.source, first.data) == ("synthesized", b"gtts-bytes")
+    assert first.info == {FALLBACK_INFO_KEY: "piper"}
+    assert service.synthesize(_key(), fallback).source == "synthesized"
+    assert calls == [1, 1]
+    assert service.stats()["memory_entries"] == 0
+    assert service.stats()["disk_bytes"] == 0
+
+
+def test_recent_piper_voices_are_remembered_and_warmed(tmp_path: Path) -> None:
+    cache_dir = tmp_path / "cache"
+    service = InteractiveSynthesisService(cache_dir, warm_voice_limit=2)
+
+    def producer(destination: Path, _info: Dict[str, str]) -> None:
+        destination.write_bytes(b"ok")
+
+    try:
+        for voice in ("en_US-a-low", "de_DE-b-low", "fr_FR-c-low"):
+            service.synthesize(_key(voice=voice), producer)
+        service.synthesize(SynthesisKey("gtts", "gTTS-en", "en", 170, "skip"), producer)
+        assert service.recent_voices() == ["fr_FR-c-low", "de_DE-b-low"]
+    finally:
+        service.close()
+    assert json.loads((cache_dir / "recent_voices.json").read_text()) == ["de_DE-b-low", "fr_FR-c-low"]
+
+    warmed: List[str] = []
+    restarted = InteractiveSynthesisService(cache_dir, warm_voice=warmed.append)
+    restarted.warm_recent_voices()
+    restarted.close()
+    assert sorted(warmed) == ["de_DE-b-low", "fr_FR-c-low"]
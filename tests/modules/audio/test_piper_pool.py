@@ -0,0 +1,177 @@
+"""Tests for the Piper synthesis worker pool."""
+
+from __future__ import annotations
+
+import os
+import struct
+import time
+
+import pytest
+from pydub import AudioSegment
+
+import modules.audio.backends.piper as piper_backend
+from modules.audio.backends import TTSBackendError
+from modules.audio.backends.piper_pool import (
+    PIPER_WORKERS_ENV,
+    PcmAudio,
+    PiperWorkerPool,
+    resolve_piper_worker_count,
+)
+
+pytestmark = [pytest.mark.audio]
+
+
+def fake_loader(voice_name: str) -> str:
+    if voice_name == "missing":
+        raise TTSBackendError("missing voice")
+    if voice_name == "slow":
+        time.sleep(30)
+    return voice_name
+
+
+def fake_synthesizer(voice_name: str, text: str, length_scale: float) -> PcmAudio:
+    if text == "fail":
+        raise TTSBackendError("synthesis exploded")
+    if text == "crash":
+        os._exit(3)
+    # Encode the worker pid so tests can see which process served the call.
+    return PcmAudio(pcm=struct.pack("<i", os.getpid()) * 2, sample_rate=16000)
+
+
+@pytest.fixture
+def pool():
+    worker_pool = PiperWorkerPool(
+        2,
+        preload_voices=["warm", "missing"],
+        loader=fake_loader,
+        synthesizer=fake_synthesizer,
+        start_method="spawn",
+    ).start()
+    yield worker_pool
+    worker_pool.close()
+
+
+def _served_by(audio: PcmAudio) -> int:
+    return struct.unpack("<i", audio.pcm[:4])[0]
+
+
+def test_pool_returns_raw_pcm_and_prefers_warm_workers(pool):
+    first = pool.synthesize("en_US-a-medium", "Hello.", 1.0)
+    second = pool.synthesize("en_US-a-medium", "Again.", 1.0)
+    other = pool.synthesize("de_DE-b-medium", "Hallo.", 1.0)
+
+    assert first.sample_rate == 16000
+    assert first.sample_width == 2
+    assert _served_by(first) == _served_by(second)
+    assert _served_by(other) != _served_by(first)
+
+    snapshot = pool.snapshot()
+    voices = sorted(tuple(worker["voices"]) for worker in snapshot["workers"])
+    assert voices == [("de_DE-b-medium", "warm"), ("en_US-a-medium", "warm")]
+    assert sum(worker["completed"] for worker in snapshot["workers"]) == 3
+
+
+def test_pool_reports_synthesis_errors_and_keeps_worker(pool):
+    with pytest.raises(TTSBackendError, match="synthesis exploded"):
+        pool.synthesize("warm", "fail", 1.0)
+
+    assert pool.synthesize("warm", "ok", 1.0).pcm
+    assert pool.snapshot()["restarts"] == 0
+
+
+def test_pool_replaces_crashed_worker(pool):
+    with pytest.raises(TTSBackendError, match="failed"):
+        pool.synthesize("warm", "crash", 1.0)
+
+    audio = pool.synthesize("warm", "after crash", 1.0)
+
+    assert audio.pcm
+    assert pool.snapshot()["restarts"] == 1
+
+
+def test_pool_returns_worker_after_unexpected_errors():
+    worker_pool = PiperWorkerPool(
+        1, loader=fake_loader, synthesizer=fake_synthesizer, start_method="spawn"
+    ).start()
+    try:
+        # A request that cannot be pickled fails before reaching the worker.
+        with pytest.raises(Exception) as exc_info:
+            worker_pool.synthesize("warm", lambda: "unpicklable", 1.0)
+        assert not isinstance(exc_info.value, TTSBackendError)
+
+        assert worker_pool.synthesize("warm", "still serving", 1.0).pcm
+        snapshot = worker_pool.snapshot()
+        assert snapshot["restarts"] == 1
+        assert not any(worker["busy"] for worker in snapshot["workers"])
+    finally:
+        worker_pool.close()
+
+
+def test_pool_times_out_waiting_for_worker_handshake():
+    worker_pool = PiperWorkerPool(
+        1,
+        preload_voices=["slow"],
+        loader=fake_loader,
+        synthesizer=fake_synthesizer,
+        start_method="spawn",
+        ready_timeout=0.5,
+    ).start()
+    try:
+        with pytest.raises(TTSBackendError, match="not ready"):
+            worker_pool.synthesize("warm", "Hello.", 1.0)
+        snapshot = worker_pool.snapshot()
+        assert snapshot["restarts"] == 1
+        assert not any(worker["busy"] for worker in snapshot["workers"])
+    finally:
+        worker_pool.close()
+
+
+def test_pool_rejects_requests_after_close(pool):
+    pool.close()
+
+    with pytest.raises(TTSBackendError, match="shut down"):
+        pool.synthesize("warm", "Hello.", 1.0)
+
+
+def test_backend_routes_through_pool_when_enabled(monkeypatch):
+    calls = []
+
+    class _FakePool:
+        def synthesize(self, voice_name, text, length_scale):
+            calls.append((voice_name, text, length_scale))
+            return PcmAudio(pcm=b"\x00\x00" * 22050, sample_rate=22050)
+
+    monkeypatch.setattr(piper_backend, "get_piper_pool", lambda: _FakePool())
+    monkeypatch.setattr(
+        piper_backend,
+        "_get_voice_model",
+        lambda name: pytest.fail("in-process voice load should be skipped"),
+    )
+
+    audio = piper_backend.PiperTTSBackend().synthesize(
+        text="Hello",
+        voice="en_US-lessac-medium",
+        speed=175,
+        lang_code="en",
+    )
+
+    assert isinstance(audio, AudioSegment)
+    assert audio.frame_rate == 22050
+    assert len(audio) == 1000
+    assert calls == [("en_US-lessac-medium", "Hello", 1.0)]
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [("3", 3), ("0", 0), ("-2", 0), ("bogus", 0)],
+)
+def test_resolve_piper_worker_count_from_env(monkeypatch, raw, expected):
+    monkeypatch.setenv(PIPER_WORKERS_ENV, raw)
+
+    assert resolve_piper_worker_count() == expected
+
+
+def test_resolve_piper_worker_count_auto(monkeypatch):
+    monkeypatch.setattr(os, "cpu_count", lambda: 16)
+
+    assert resolve_piper_worker_count("auto") == 4
@@ -53,3 +53,20 @@ def test_parse_legacy_args_matches_positional_layout():
     assert parsed.input_file == "input.epub"
     assert parsed.sentences_per_output_file == 10
     assert parsed.end_sentence == "+10"
+
+
+def test_parse_cli_args_worker_subcommand():
+    parsed = args.parse_cli_args([
+        "worker",
+        "--queue-url",
+        "sqlite:///queue.db",
+        "--concurrency",
+        "2",
+        "--lease-seconds",
+        "15",
+    ])
+    assert parsed.command == "worker"
+    assert parsed.queue_url == "sqlite:///queue.db"
+    assert parsed.concurrency == 2
+    assert parsed.lease_seconds == 15.0
+    assert parsed.max_attempts == 3
@@ -1,7 +1,7 @@
 import os
 from pathlib import Path
 
-from modules.core import ingestion
+from modules.core import ingestion, ingestion_cache
 
 
 class DummyPipelineConfig:
@@ -133,6 +133,14 @@ def test_get_refined_sentences_invalidates_cache_when_source_mtime_changes(tmp_p
     os.utime(path, (original_mtime + 20, original_mtime + 20))
     _, refreshed = ingestion.get_refined_sentences(str(path), config)
 
+    assert refreshed is True
+    # Same bytes, so the content-addressed ingestion cache still applies.
+    assert calls == [str(path)]
+
+    path.write_text("changed placeholder", encoding="utf-8")
+    os.utime(path, (original_mtime + 40, original_mtime + 40))
+    _, refreshed = ingestion.get_refined_sentences(str(path), config)
+
     assert refreshed is True
     assert calls == [str(path), str(path)]
 
@@ -478,3 +486,114 @@ def test_chapter_range_coverage_flags_out_of_order_but_complete_ranges():
         "first_sentence_number": 1,
         "last_sentence_number": 4,
     }
+
+
+def test_ingestion_cache_is_shared_across_paths_with_identical_content(tmp_path, monkeypatch):
+    config = DummyPipelineConfig(tmp_path)
+    first = config.books_dir / "first.epub"
+    second = config.books_dir / "copy" / "second.epub"
+    second.parent.mkdir()
+    first.write_bytes(b"same book")
+    second.write_bytes(b"same book")
+    calls: list[str] = []
+    _patch_sections(monkeypatch, calls)
+
+    first_refined, _ = ingestion.get_refined_sentences(str(first), config)
+    second_refined, second_updated = ingestion.get_refined_sentences(str(second), config)
+    content_index = ingestion.get_content_index(str(second), config, second_refined)
+
+    assert first_refined == second_refined == ["Alpha.", "Beta."]
+    assert second_updated is True
+    assert calls == [str(first)]
+    assert content_index["alignment"]["status"] == "exact"
+    assert content_index["chapters"][0]["title"] == "Chapter One"
+
+
+def test_ingestion_cache_is_used_when_force_refresh_is_requested(tmp_path, monkeypatch):
+    config = DummyPipelineConfig(tmp_path)
+    path = _book_path(config)
+    calls: list[str] = []
+    _patch_sections(monkeypatch, calls)
+
+    refined, _ = ingestion.get_refined_sentences(str(path), config, force_refresh=True)
+    ingestion.get_content_index(str(path), config, refined, force_refresh=True)
+    refined, refreshed = ingestion.get_refined_sentences(str(path), config, force_refresh=True)
+    ingestion.get_content_index(str(path), config, refined, force_refresh=True)
+
+    assert refreshed is True
+    assert calls == [str(path)]
+
+
+def test_ingestion_cache_key_includes_language_and_settings(tmp_path, monkeypatch):
+    config = DummyPipelineConfig(tmp_path)
+    path = _book_path(config)
+    calls: list[str] = []
+    _patch_sections(monkeypatch, calls)
+
+    ingestion.get_refined_sentences(str(path), config, force_refresh=True, language="English")
+    ingestion.get_refined_sentences(str(path), config, force_refresh=True, language="english")
+    ingestion.get_refined_sentences(str(path), config, force_refresh=True, language="French")
+    config.split_on_comma_semicolon = True
+    ingestion.get_refined_sentences(str(path), config, force_refresh=True, language="French")
+
+    assert calls == [str(path)] * 3
+
+
+def test_ingestion_cache_can_be_disabled(tmp_path, monkeypatch):
+    config = DummyPipelineConfig(tmp_path)
+    path = _book_path(config)
+    calls: list[str] = []
+    _patch_sections(monkeypatch, calls)
+    monkeypatch.setenv(ingestion_cache.INGESTION_CACHE_ENV, "0")
+
+    ingestion.get_refined_sentences(str(path), config, force_refresh=True)
+    ingestion.get_refined_sentences(str(path), config, force_refresh=True)
+
+    assert calls == [str(path), str(path)]
+    assert not (config.ensure_runtime_dir() / ingestion_cache.DEFAULT_CACHE_DIRNAME).exists()
+
+
+def test_ingestion_cache_honours_shared_directory_override(tmp_path, monkeypatch):
+    shared = tmp_path / "shared-cache"
+    monkeypatch.setenv(ingestion_cache.INGESTION_CACHE_DIR_ENV, str(shared))
+    first_config = DummyPipelineConfig(tmp_path / "one")
+    second_config = DummyPipelineConfig(tmp_path / "two")
+    first_path = _book_path(first_config)
+    second_path = _book_path(second_config)
+    calls: list[str] = []
+    _patch_sections(monkeypatch, calls)
+
+    ingestion.get_refined_sentences(str(first_path), first_config)
+    ingestion.get_refined_sentences(str(second_path), second_config)
+
+    assert calls == [str(first_path)]
+    assert list(shared.rglob("*.json"))
+
+
+def test_split_texts_parallel_matches_serial_split():
+    texts = [
+        "First chapter opens here. It continues for a while. Then it ends.",
+        "Second chapter is short.",
+        "Third chapter asks a question? It answers quickly! Done.",
+    ]
+    settings = ingestion_cache.IngestionSettings(
+        max_words=18,
+        split_on_comma_semicolon=False,
+        sentence_splitter_mode="regex",
+        sentence_splitter_version="regex",
+    )
+
+    parallel = ingestion_cache.split_texts_parallel(texts, settings, max_workers=2)
+
+    assert parallel == [
+        ingestion_cache._split_worker((text, 18, False, "regex")) for text in texts
+    ]
+
+
+def test_should_split_in_parallel_requires_large_multi_section_books():
+    large = "x" * ingestion_cache.PARALLEL_MIN_CHARACTERS
+
+    assert ingestion_cache.should_split_in_parallel([large, "y"], max_workers=4)
+    assert not ingestion_cache.should_split_in_parallel([large], max_workers=4)
+    assert not ingestion_cache.should_split_in_parallel(["a", "b"], max_workers=4)
+    assert not ingestion_cache.should_split_in_parallel([large, "y"], max_workers=1)
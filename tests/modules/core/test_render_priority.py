@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import threading
+from types import SimpleNamespace
+from typing import List, Tuple
+from unittest.mock import MagicMock
+
+import pytest
+
+from modules.core.config import PipelineConfig
+from modules.core.rendering import pipeline_processing
+from modules.core.rendering.exporters import BatchExportResult
+from modules.core.rendering.pipeline import RenderPipeline
+from modules.progress_tracker import ProgressTracker
+from modules.render_priority import PlayheadQueue, RenderPriority
+from modules.translation_engine import ThreadWorkerPool, _iter_prioritized
+
+pytestmark = pytest.mark.pipeline
+
+
+def _item(number: int) -> SimpleNamespace:
+    return SimpleNamespace(sentence_number=number)
+
+
+def test_select_prefers_playhead_region_with_fairness() -> None:
+    priority = RenderPriority(fairness_interval=3)
+    positions = [1, 2, 3, 7, 8, 9]
+    assert positions[priority.select(positions)] == 1
+
+    priority.report(8, seek=True)
+    picks = []
+    remaining = list(positions)
+    while remaining:
+        picks.append(remaining.pop(priority.select(remaining)))
+
+    # Every third pick keeps the start of the job moving.
+    assert picks == [8, 9, 1, 2, 3, 7]
+    snapshot = priority.snapshot()
+    assert snapshot["active"] and snapshot["region_start"] == 8
+    assert (snapshot["seeks"], snapshot["fairness_picks"]) == (1, 2)
+
+
+def test_region_resolver_and_stale_reports() -> None:
+    now = [0.0]
+    priority = RenderPriority(stale_after_seconds=30, clock=lambda: now[0])
+    priority.set_region_resolver(lambda number: number - number % 5)
+    priority.report(12)
+    assert priority.focus == 10
+    assert priority.prioritizes(14) and not priority.prioritizes(9)
+
+    now[0] = 31.0
+    assert priority.focus is None
+    assert priority.snapshot()["active"] is False
+    priority.report(3)
+    assert priority.focus == 0
+    priority.clear()
+    assert priority.focus is None
+
+
+def test_playhead_queue_serves_nearest_item_and_sentinels_last() -> None:
+    priority = RenderPriority(fairness_interval=100)
+    work = PlayheadQueue(priority)
+    for number in (1, 2, 5, 6):
+        work.put(_item(number))
+    work.put(None)
+
+    assert work.get().sentence_number == 1
+    priority.report(5)
+    assert [work.get().sentence_number for _ in range(3)] == [5, 6, 2]
+    assert work.get() is None
+    assert work.empty()
+
+
+def test_chunk_bounds_follow_first_flush_rule() -> None:
+    bounds = pipeline_processing._chunk_bounds
+    assert bounds(3, start_sentence=1, sentences_per_file=4, first_flush_size=None) == (1, 4)
+    assert bounds(2, start_sentence=1, sentences_per_file=4, first_flush_size=2) == (1, 2)
+    assert bounds(3, start_sentence=1, sentences_per_file=4, first_flush_size=2) == (3, 6)
+    assert bounds(11, start_sentence=5, sentences_per_file=3, first_flush_size=None) == (11, 13)
+
+
+def test_prioritized_dispatch_follows_playhead() -> None:
+    priority = RenderPriority(fairness_interval=100)
+    priority.report(40)
+    started: List[int] = []
+
+    def _work(number: int) -> int:
+        started.append(number)
+        return number
+
+    with ThreadWorkerPool(max_workers=1) as pool:
+        futures_map: dict = {}
+        completed = [
+            futures_map[future]
+            for future in _iter_prioritized(
+                pool,
+                [(number, number, (number,)) for number in range(1, 51)],
+                futures_map,
+                priority,
+                func=_work,
+                window=1,
+                stop_event=None,
+            )
+        ]
+
+    assert started[:11] == list(range(40, 51))
+    assert started[11:] == list(range(1, 40))
+    assert sorted(completed) == list(range(1, 51))
+
+
+class _RecordingExporter:
+    def __init__(self) -> None:
+        self.ranges: List[Tuple[int, int]] = []
+        self.playhead_chunk_exported = threading.Event()
+
+    def export(self, request) -> BatchExportResult:
+        self.ranges.append((request.start_sentence, request.end_sentence))
+        if request.start_sentence == 7:
+            self.playhead_chunk_exported.set()
+        return BatchExportResult(
+            chunk_id=f"chunk_{request.start_sentence:04d}",
+            start_sentence=request.start_sentence,
+            end_sentence=request.end_sentence,
+            range_fragment=f"{request.start_sentence:04d}-{request.end_sentence:04d}",
+            sentences=[
+                {"sentence_number": entry["sentence_number"]}
+                for entry in request.sentence_metadata
+            ],
+        )
+
+
+class _PassThroughOrchestrator:
+    def __init__(self, translation_queue, **_kwargs) -> None:
+        self._queue = translation_queue
+
+    def start(self):
+        return self._queue, []
+
+
+def test_pipeline_exports_playhead_chunk_first_and_commits_in_order(
+    monkeypatch, tmp_path
+) -> None:
+    tracker = ProgressTracker()
+    tracker.render_priority.report(8, seek=True)
+    exporter = _RecordingExporter()
+    sentences = [f"Sentence {number}." for number in range(1, 9)]
+
+    def _result(number: int) -> SimpleNamespace:
+        return SimpleNamespace(
+            index=number - 1,
+            sentence_number=number,
+            sentence=sentences[number - 1],
+            target_language="French",
+            translation=f"fr {number}",
+            transliteration="",
+            audio_segment=None,
+            metadata={},
+            voice_metadata={},
+        )
+
+    def _fake_translation(_sentences, _language, _targets, *, output_queue, render_priority, **_kwargs):
+        assert render_priority is tracker.render_priority
+
+        def _produce() -> None:
+            for number in (7, 8):
+                output_queue.put(_result(number))
+            exporter.playhead_chunk_exported.wait(timeout=5)
+            for number in range(1, 7):
+                output_queue.put(_result(number))
+            output_queue.put(None)
+
+        thread = threading.Thread(target=_produce, daemon=True)
+        thread.start()
+        return thread
+
+    monkeypatch.setattr(pipeline_processing, "start_translation_pipeline", _fake_translation)
+    config = PipelineConfig(
+        context=None,
+        working_dir=tmp_path,
+        output_dir=tmp_path,
+        tmp_dir=tmp_path,
+        books_dir=tmp_path,
+    )
+    pipeline = RenderPipeline(
+        pipeline_config=config, progress_tracker=tracker, transliterator=MagicMock()
+    )
+    state = pipeline._initial_state(
+        generate_audio=False, start_sentence=1, target_languages=["French"]
+    )
+    pipeline_processing.process_pipeline(
+        pipeline,
+        state=state,
+        exporter=exporter,
+        base_dir=str(tmp_path),
+        base_name="book",
+        media_metadata={},
+        full_sentences=sentences,
+        sentences=sentences,
+        start_sentence=1,
+        total_refined=len(sentences),
+        input_language="English",
+        target_languages=["French"],
+        generate_audio=False,
+        generate_images=False,
+        audio_mode="4",
+        written_mode="4",
+        sentences_per_file=2,
+        include_transliteration=False,
+        translation_provider=None,
+        translation_batch_size=None,
+        transliteration_mode="default",
+        transliteration_client=None,
+        output_html=False,
+        output_pdf=False,
+        translation_client=None,
+        worker_pool=MagicMock(),
+        worker_count=1,
+        total_fully=len(sentences),
+        media_orchestrator_cls=_PassThroughOrchestrator,
+    )
+
+    assert exporter.ranges[0] == (7, 8)
+    assert sorted(exporter.ranges) == [(1, 2), (3, 4), (5, 6), (7, 8)]
+    assert state.processed == 8
+    assert [entry["sentence_number"] for entry in state.all_sentence_metadata] == list(range(1, 9))
+    chunks = tracker.get_generated_files()["chunks"]
+    assert [chunk["start_sentence"] for chunk in chunks] == [1, 3, 5, 7]
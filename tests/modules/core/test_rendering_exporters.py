@@ -11,6 +11,7 @@ from modules.core.rendering.exporters import (
     BatchExportRequest,
     BatchExporter,
 )
+from modules.core.rendering.timing_columns import TimingColumnStore
 
 pytestmark = pytest.mark.pipeline
 
@@ -100,3 +101,49 @@ def test_exporter_handles_basic_batch_without_audio(tmp_path: Path) -> None:
     assert html_path.exists()
     assert result.timing_validation["post_export"]["valid"] is True
     assert result.timing_validation["post_export"]["tracks"]["translation"]["valid"] is True
+
+
+def test_exporter_writes_timing_columns_next_to_job_metadata(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    base_dir = tmp_path / "job" / "media" / "book"
+    base_dir.mkdir(parents=True)
+    context = _build_context(tmp_path)
+    exporter = BatchExporter(
+        BatchExportContext(**{**context.__dict__, "base_dir": str(base_dir)})
+    )
+    tracks = {
+        "original": [{"lane": "orig", "sentenceIdx": 1, "wordIdx": 0, "start": 0.0, "end": 0.6}],
+        "translation": [
+            {"lane": "trans", "sentenceIdx": 0, "wordIdx": 0, "start": 0.0, "end": 0.3},
+            {"lane": "trans", "sentenceIdx": 1, "wordIdx": 0, "start": 0.3, "end": 0.9},
+        ],
+    }
+    monkeypatch.setattr(
+        "modules.core.rendering.exporters.build_separate_track_timings",
+        lambda *_args, **_kwargs: tracks,
+    )
+    blocks = [f"Sentence {number}\nOriginal {number}\nTranslated {number}" for number in (5, 6)]
+    request = BatchExportRequest(
+        start_sentence=5,
+        end_sentence=6,
+        written_blocks=blocks,
+        target_language="Arabic",
+        output_html=False,
+        output_pdf=False,
+        generate_audio=False,
+        audio_segments=[],
+        sentence_blocks=blocks,
+        sentence_metadata=[{"sentence_number": 5}, {"sentence_number": 6}],
+    )
+
+    result = exporter.export(request)
+
+    store = TimingColumnStore(tmp_path / "job" / "metadata" / "timing")
+    assert [(start, end) for start, end, _ in store.chunks()] == [(5, 6)]
+    (sliced,) = store.read_range(6, 6)
+    assert sliced.chunk_id == result.chunk_id
+    assert sliced.to_timing_tracks() == {
+        "original": tracks["original"],
+        "translation": tracks["translation"][1:],
+    }
@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any, List
+from unittest.mock import MagicMock
+
+import pytest
+from pydub import AudioSegment
+
+from modules.core.config import PipelineConfig
+from modules.core.rendering import pipeline_processing
+from modules.core.rendering.checkpoints import SentenceCheckpointStore
+from modules.core.rendering.pipeline import RenderPipeline
+
+pytestmark = pytest.mark.pipeline
+
+
+def _tone(milliseconds: int) -> AudioSegment:
+    return AudioSegment.silent(duration=milliseconds, frame_rate=16000)
+
+
+def _record(store: SentenceCheckpointStore, number: int, sentence: str, **kwargs: Any) -> None:
+    store.record(
+        sentence_number=number,
+        sentence=sentence,
+        target_language="French",
+        translation=f"fr {sentence}",
+        transliteration="",
+        **kwargs,
+    )
+
+
+def test_store_round_trips_sentences_and_audio(tmp_path) -> None:
+    store = SentenceCheckpointStore.for_output(tmp_path, fingerprint="a")
+    _record(
+        store,
+        11,
+        "One.",
+        audio_tracks={"translation": _tone(250), "orig": None},
+        voice_metadata={"translation": {"French": "Amelie"}},
+        metadata={"word_tokens": [{"text": "fr", "start": 0.0, "end": 0.25}]},
+    )
+    _record(store, 12, "Two.")
+    _record(store, 14, "Four.")
+    store.record_image(11, "media/images/batches/batch_00011.png")
+    store.close()
+    with (tmp_path / ".checkpoints" / "sentences.jsonl").open("a", encoding="utf-8") as handle:
+        handle.write('{"sentence_number": 13, "source_h')
+
+    reopened = SentenceCheckpointStore.for_output(tmp_path, fingerprint="a")
+    replay = reopened.replayable_prefix(11, ["One.", "Two.", "Three.", "Four."])
+    assert [checkpoint.sentence_number for checkpoint in replay] == [11, 12]
+    assert replay[0].word_tokens[0]["text"] == "fr"
+    assert replay[0].voice_metadata == {"translation": {"French": "Amelie"}}
+    assert len(reopened.load_audio(replay[0])["translation"]) == 250
+    assert reopened.image_paths() == {11: "media/images/batches/batch_00011.png"}
+    # A changed source sentence invalidates its checkpoint.
+    assert reopened.get(12, "Two, edited.") is None
+
+
+def test_store_discards_journal_when_settings_change(tmp_path) -> None:
+    store = SentenceCheckpointStore.for_output(tmp_path, fingerprint="a")
+    _record(store, 1, "One.", audio_tracks={"translation": _tone(100)})
+    store.close()
+
+    reopened = SentenceCheckpointStore.for_output(tmp_path, fingerprint="b")
+    assert len(reopened) == 0
+    assert not (tmp_path / ".checkpoints" / "audio").exists()
+
+
+def test_prune_drops_records_and_audio_before_block(tmp_path) -> None:
+    store = SentenceCheckpointStore.for_output(tmp_path, fingerprint="a")
+    for number in range(1, 5):
+        _record(store, number, f"S{number}", audio_tracks={"translation": _tone(50)})
+    store.prune_before(3)
+
+    audio_dir = tmp_path / ".checkpoints" / "audio"
+    assert sorted(path.name for path in audio_dir.iterdir()) == [
+        "sentence_00003_translation.wav",
+        "sentence_00004_translation.wav",
+    ]
+    store.close()
+    reopened = SentenceCheckpointStore.for_output(tmp_path, fingerprint="a")
+    assert [c.sentence_number for c in reopened.replayable_prefix(3, ["S3", "S4"])] == [3, 4]
+    assert reopened.get(1, "S1") is None
+
+
+def test_append_after_torn_tail_starts_a_new_line(tmp_path) -> None:
+    store = SentenceCheckpointStore.for_output(tmp_path, fingerprint="a")
+    _record(store, 1, "One.")
+    store.close()
+    journal = tmp_path / ".checkpoints" / "sentences.jsonl"
+    with journal.open("a", encoding="utf-8") as handle:
+        handle.write('{"sentence_number": 2, "source_h')
+
+    reopened = SentenceCheckpointStore.for_output(tmp_path, fingerprint="a")
+    _record(reopened, 2, "Two.")
+    reopened.close()
+
+    assert journal.read_text(encoding="utf-8").endswith("\n")
+    again = SentenceCheckpointStore.for_output(tmp_path, fingerprint="a")
+    assert [c.sentence_number for c in again.replayable_prefix(1, ["One.", "Two."])] == [1, 2]
+
+
+@pytest.mark.parametrize(("end_sentence", "expected"), [(10, 1), (15, 11), (20, 11), (21, 21)])
+def test_prune_keeps_the_block_a_resume_restarts_at(
+    tmp_path, end_sentence: int, expected: int
+) -> None:
+    config = PipelineConfig(
+        context=None,
+        working_dir=tmp_path,
+        output_dir=tmp_path,
+        tmp_dir=tmp_path,
+        books_dir=tmp_path,
+    )
+    pipeline = RenderPipeline(pipeline_config=config, transliterator=MagicMock())
+    state = pipeline._initial_state(
+        generate_audio=True, start_sentence=1, target_languages=["French"]
+    )
+    state.checkpoint_store = MagicMock()
+    state.checkpoint_block_size = 10
+
+    pipeline._prune_checkpoints(state, end_sentence)
+
+    state.checkpoint_store.prune_before.assert_called_once_with(expected)
+
+
+def test_sequential_run_replays_checkpoints_and_translates_the_rest(
+    monkeypatch, tmp_path
+) -> None:
+    config = PipelineConfig(
+        context=None,
+        working_dir=tmp_path,
+        output_dir=tmp_path,
+        tmp_dir=tmp_path,
+        books_dir=tmp_path,
+    )
+    pipeline = RenderPipeline(pipeline_config=config, transliterator=MagicMock())
+    state = pipeline._initial_state(
+        generate_audio=True, start_sentence=5, target_languages=["French"]
+    )
+    state.checkpoint_store = SentenceCheckpointStore.for_output(tmp_path, fingerprint="a")
+    state.checkpoint_block_size = 10
+    _record(state.checkpoint_store, 5, "Five.", audio_tracks={"translation": _tone(300)})
+    _record(state.checkpoint_store, 6, "Six.", audio_tracks={"translation": _tone(300)})
+
+    translated: List[List[int]] = []
+
+    def _translate_batch(sentences, *_args, sentence_numbers, **_kwargs):
+        translated.append(list(sentence_numbers))
+        return [f"fr {sentence}" for sentence in sentences]
+
+    synthesized: List[int] = []
+
+    def _generate_audio(**kwargs):
+        synthesized.append(kwargs["sentence_number"])
+        return SimpleNamespace(audio=_tone(200), audio_tracks=None, voice_metadata={})
+
+    monkeypatch.setattr(pipeline_processing, "translate_batch", _translate_batch)
+    monkeypatch.setattr(pipeline, "_maybe_generate_audio", _generate_audio)
+
+    sentences = ["Five.", "Six.", "Seven.", "Eight."]
+    pipeline._process_sequential(
+        state=state,
+        exporter=MagicMock(),
+        sentences=sentences,
+        total_refined=len(sentences),
+        start_sentence=5,
+        input_language="English",
+        target_languages=["French"],
+        generate_audio=True,
+        audio_mode="4",
+        written_mode="4",
+        sentences_per_file=10,
+        include_transliteration=False,
+        translation_provider=None,
+        translation_batch_size=None,
+        transliteration_mode="default",
+        transliteration_client=None,
+        output_html=False,
+        output_pdf=False,
+        translation_client=None,
+        worker_pool=MagicMock(),
+        worker_count=4,
+        total_fully=20,
+    )
+
+    assert translated == [[7, 8]]
+    assert synthesized == [7, 8]
+    assert state.processed == 4
+    assert [len(segment) for segment in state.all_audio_segments] == [300, 300, 200, 200]
+    assert [entry["sentence_number"] for entry in state.all_sentence_metadata] == [5, 6, 7, 8]
+    assert [
+        c.sentence_number
+        for c in state.checkpoint_store.replayable_prefix(5, sentences)
+    ] == [5, 6, 7, 8]
@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import copy
+import random
+from typing import Any, Callable
+
+import pytest
+
+from modules.core.rendering import timeline_engine
+from modules.core.rendering.timeline import (
+    SentenceTimingSpec,
+    build_dual_track_timings,
+    build_separate_track_timings,
+    compute_cumulative_offsets,
+    smooth_token_boundaries,
+    validate_export_timing_tracks,
+)
+
+pytestmark = pytest.mark.pipeline
+
+pytest.importorskip("numpy")
+
+
+def _word_tokens(rng: random.Random, count: int, *, irregular: bool = True) -> list[dict[str, Any]]:
+    tokens: list[dict[str, Any]] = []
+    cursor = rng.uniform(-0.05, 0.2)
+    for index in range(count):
+        length = rng.choice([0.0, rng.uniform(0.01, 0.6), rng.uniform(0.1, 0.3)])
+        start = cursor + rng.uniform(-0.04, 0.04)
+        end = start + length * rng.choice([1, 1, 1, -0.5])
+        tokens.append({"text": f"w{index}", "start": round(start, rng.choice([3, 6, 9])), "end": end})
+        cursor += length
+    if irregular and tokens and rng.random() < 0.2:
+        tokens.insert(rng.randrange(len(tokens)), {"text": "bad", "start": "n/a"})
+    return tokens
+
+
+def _specs(seed: int, sentences: int, *, irregular: bool = True) -> list[SentenceTimingSpec]:
+    rng = random.Random(seed)
+    pauses = [0, 120.6, -5, "x"] if irregular else [0, 120.6, -5]
+    specs: list[SentenceTimingSpec] = []
+    for offset in range(sentences):
+        words = [f"word{i}" for i in range(rng.randint(1, 24))]
+        specs.append(
+            SentenceTimingSpec(
+                sentence_idx=40 + offset,
+                original_text=" ".join(words),
+                translation_text=" ".join(reversed(words)),
+                original_words=words,
+                translation_words=list(reversed(words)),
+                word_tokens=(
+                    _word_tokens(rng, rng.randint(0, 60), irregular=irregular)
+                    if rng.random() < 0.8
+                    else None
+                ),
+                original_word_tokens=(
+                    _word_tokens(rng, rng.randint(0, 40), irregular=irregular)
+                    if rng.random() < 0.5
+                    else None
+                ),
+                translation_duration=rng.choice([0.0, rng.uniform(0.5, 9.0)]),
+                original_duration=rng.uniform(0.0, 7.0),
+                gap_before_translation=rng.uniform(0.0, 0.4),
+                gap_after_translation=rng.uniform(0.0, 0.4),
+                char_weighted_enabled=True,
+                punctuation_boost=False,
+                policy=rng.choice([None, " forced ", "inferred", "  "]),
+                source=rng.choice([None, "aligner ", ""]),
+                original_policy=rng.choice([None, " forced", "  "]),
+                original_source=rng.choice([None, "aligner"]),
+                pause_before_ms=rng.choice(pauses),
+                pause_after_ms=rng.choice([0, 80]),
+            )
+        )
+    return specs
+
+
+def _reference_and_vectorized(
+    monkeypatch: pytest.MonkeyPatch, build: Callable[[], Any]
+) -> tuple[Any, Any]:
+    """Run ``build`` with the reference loops and then with the numpy engine."""
+
+    results = []
+    for mode in ("python", "numpy"):
+        monkeypatch.setenv(timeline_engine.TIMELINE_ENGINE_ENV_VAR, mode)
+        results.append(build())
+    return results[0], results[1]
+
+
+@pytest.mark.parametrize("seed", range(12))
+def test_separate_tracks_match_reference_loops(monkeypatch: pytest.MonkeyPatch, seed: int) -> None:
+    specs = _specs(seed, 14)
+    original_total = sum(spec.original_duration for spec in specs) * (0.85 + seed * 0.02)
+    translation_total = sum(spec.translation_duration for spec in specs) * 0.97
+    copies = iter([copy.deepcopy(specs), copy.deepcopy(specs)])
+    used: list[list[SentenceTimingSpec]] = []
+
+    def build() -> dict[str, Any]:
+        batch = next(copies)
+        used.append(batch)
+        return build_separate_track_timings(
+            batch,
+            original_duration=original_total,
+            translation_duration=translation_total,
+            use_local_indices=seed % 2 == 0,
+        )
+
+    reference, vectorized = _reference_and_vectorized(monkeypatch, build)
+
+    assert reference["translation"] or reference["original"]
+    # repr also distinguishes 0.0 from -0.0 and int from float.
+    assert repr(vectorized) == repr(reference)
+    labels = [
+        [(s.policy, s.source, s.original_policy, s.original_source) for s in batch] for batch in used
+    ]
+    assert labels[0] == labels[1]
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_dual_tracks_match_reference_loops(monkeypatch: pytest.MonkeyPatch, seed: int) -> None:
+    specs = _specs(100 + seed, 10, irregular=False)
+    copies = iter([copy.deepcopy(specs), copy.deepcopy(specs)])
+
+    def build() -> dict[str, Any]:
+        batch = next(copies)
+        return build_dual_track_timings(
+            batch,
+            mix_duration=sum(s.original_duration + s.translation_duration for s in batch),
+            translation_duration=sum(s.translation_duration for s in batch) * 0.9,
+        )
+
+    reference, vectorized = _reference_and_vectorized(monkeypatch, build)
+
+    assert repr(vectorized) == repr(reference)
+
+
+@pytest.mark.parametrize("factor", [0.0, 0.35, 1.0])
+def test_smoothing_matches_reference_loop(monkeypatch: pytest.MonkeyPatch, factor: float) -> None:
+    rng = random.Random(7)
+    tokens = [token for token in _word_tokens(rng, 400) if token["text"] != "bad"]
+    tokens[5]["text"] = None
+
+    reference, vectorized = _reference_and_vectorized(
+        monkeypatch, lambda: smooth_token_boundaries(tokens, factor)
+    )
+
+    assert repr(vectorized) == repr(reference)
+
+
+def test_smoothing_falls_back_for_irregular_tokens(monkeypatch: pytest.MonkeyPatch) -> None:
+    tokens = [{"text": "a", "start": 0.0, "end": 0.4}, "noise", {"text": "b", "start": "x", "end": 1}]
+    tokens += [{"text": "c", "start": float("inf"), "end": 2.0}]
+
+    reference, vectorized = _reference_and_vectorized(
+        monkeypatch, lambda: smooth_token_boundaries(tokens)
+    )
+
+    assert repr(vectorized) == repr(reference)
+
+
+def test_export_validation_matches_reference_loops(monkeypatch: pytest.MonkeyPatch) -> None:
+    rng = random.Random(3)
+    tracks: dict[str, list[dict[str, Any]]] = {"original": [], "translation": []}
+    for name, tokens in tracks.items():
+        for index in range(300):
+            start = index * 0.25 + rng.uniform(-0.2, 0.2)
+            tokens.append(
+                {
+                    "sentenceIdx": index // 12 if rng.random() > 0.02 else (index // 12) + 1,
+                    "start": start,
+                    "end": start + rng.uniform(-0.05, 0.4),
+                }
+            )
+        head = tokens[:40]
+        rng.shuffle(head)
+        tokens[:40] = head
+    durations = {"original": 75.0, "translation": 74.9}
+
+    reference, vectorized = _reference_and_vectorized(
+        monkeypatch, lambda: validate_export_timing_tracks(tracks, durations)
+    )
+
+    assert not reference["valid"]
+    assert repr(vectorized) == repr(reference)
+
+
+def test_cumulative_offsets_match_reference_loop(monkeypatch: pytest.MonkeyPatch) -> None:
+    rng = random.Random(5)
+    durations = [rng.choice([rng.uniform(0.0, 12.0), -1.0, 0.1, 0.2]) for _ in range(500)]
+
+    reference, vectorized = _reference_and_vectorized(
+        monkeypatch, lambda: compute_cumulative_offsets(durations)
+    )
+
+    assert repr(vectorized) == repr(reference)
+
+
+def test_round6_matches_python_round_on_ties() -> None:
+    np = pytest.importorskip("numpy")
+    values = [0.0000005, 0.0000015, 2.675, 1.0000005, 123.4567895, 0.1 + 0.2, -0.0000005, 1e-7]
+    rng = random.Random(9)
+    values += [round(rng.uniform(0, 500), 7) for _ in range(2000)]
+
+    rounded = timeline_engine.round6(np.array(values)).tolist()
+
+    assert rounded == [round(value, 6) for value in values]
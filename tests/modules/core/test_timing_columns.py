@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import io
+from pathlib import Path
+
+import pytest
+
+from modules.core.rendering.timing_columns import (
+    TimingColumnStore,
+    decode_timing_columns,
+    encode_timing_columns,
+    read_timing_columns,
+    resolve_timing_columns_root,
+)
+
+pytestmark = pytest.mark.pipeline
+
+
+def _tracks(sentences: int, words: int) -> dict:
+    translation = []
+    original = []
+    cursor = 0.0
+    for sentence in range(sentences):
+        for word in range(words):
+            translation.append(
+                {
+                    "lane": "trans",
+                    "sentenceIdx": sentence,
+                    "wordIdx": word,
+                    "start": round(cursor, 6),
+                    "end": round(cursor + 0.297, 6),
+                }
+            )
+            cursor += 0.3
+        original.append(
+            {"lane": "orig", "sentenceIdx": sentence, "wordIdx": 0, "start": float(sentence), "end": sentence + 0.9}
+        )
+    return {"original": original, "translation": translation}
+
+
+class _CountingReader(io.BytesIO):
+    def __init__(self, payload: bytes) -> None:
+        super().__init__(payload)
+        self.bytes_read = 0
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = super().read(size)
+        self.bytes_read += len(chunk)
+        return chunk
+
+
+def test_round_trip_matches_chunk_timing_tracks() -> None:
+    tracks = _tracks(3, 4)
+    blob = encode_timing_columns("chunk-a", 10, 12, tracks)
+
+    (decoded,) = decode_timing_columns(blob)
+
+    assert (decoded.chunk_id, decoded.start_sentence, decoded.end_sentence) == ("chunk-a", 10, 12)
+    assert decoded.to_timing_tracks() == tracks
+
+
+def test_range_read_only_touches_requested_columns() -> None:
+    tracks = _tracks(200, 12)
+    blob = encode_timing_columns("chunk-b", 1, 200, tracks)
+    reader = _CountingReader(blob)
+
+    sliced = read_timing_columns(reader, 50, 51, tracks=["translation"])
+
+    assert sliced is not None
+    assert list(sliced.tracks) == ["translation"]
+    assert sliced.to_timing_tracks()["translation"] == [
+        token for token in tracks["translation"] if token["sentenceIdx"] in (49, 50)
+    ]
+    assert reader.bytes_read < len(blob) // 20
+    assert read_timing_columns(io.BytesIO(blob), 201, 300) is None
+
+
+def test_encoded_slices_keep_chunk_local_sentence_indices() -> None:
+    tracks = _tracks(5, 2)
+    sliced = read_timing_columns(io.BytesIO(encode_timing_columns("c", 21, 25, tracks)), 23, 24)
+
+    (decoded,) = decode_timing_columns(sliced.encode())
+
+    assert (decoded.chunk_start, decoded.chunk_end) == (21, 25)
+    assert {token["sentenceIdx"] for token in decoded.to_timing_tracks()["translation"]} == {2, 3}
+    assert decoded.to_timing_tracks() == sliced.to_timing_tracks()
+
+
+def test_store_reads_across_chunks_and_replaces_stale_ranges(tmp_path: Path) -> None:
+    store = TimingColumnStore(tmp_path)
+    store.write_chunk("first", 1, 3, _tracks(3, 1))
+    store.write_chunk("second", 4, 6, _tracks(3, 1))
+
+    slices = store.read_range(3, 4)
+    assert [(item.chunk_id, item.start_sentence, item.end_sentence) for item in slices] == [
+        ("first", 3, 3),
+        ("second", 4, 4),
+    ]
+
+    store.write_chunk("resumed", 3, 5, _tracks(3, 1))
+    assert [(start, end) for start, end, _ in store.chunks()] == [(3, 5)]
+    assert TimingColumnStore(tmp_path / "missing").read_range(1, 2) == []
+
+
+def test_resolve_root_uses_job_metadata_directory(tmp_path: Path) -> None:
+    job_media = tmp_path / "job-1" / "media" / "Author_Title"
+    assert resolve_timing_columns_root(job_media) == tmp_path / "job-1" / "metadata" / "timing"
+    assert resolve_timing_columns_root(tmp_path / "out") == tmp_path / "out" / ".timing"
@@ -43,3 +43,181 @@ def test_atomic_move_cross_filesystem(monkeypatch, tmp_path):
     assert not source_file.exists()
     assert destination_file.exists()
     assert destination_file.read_text(encoding='utf-8') == 'cross device data'
+
+
+def _force_copy(monkeypatch) -> None:
+    monkeypatch.setattr(atomic_move_module, '_same_filesystem', lambda _src, _dst: False)
+    monkeypatch.setattr(atomic_move_module, '_try_hardlink', lambda *_args: False)
+    monkeypatch.setattr(atomic_move_module, '_try_reflink', lambda *_args: False)
+
+
+def test_atomic_move_copies_tree_and_reports_progress(monkeypatch, tmp_path):
+    source_dir = tmp_path / 'source'
+    write_file(source_dir / 'audio' / 'chunk-1.mp3', 'a' * 4096)
+    write_file(source_dir / 'metadata' / 'job.json', '{"job_id": "job-1"}')
+    (source_dir / 'empty').mkdir()
+    destination_dir = tmp_path / 'library' / 'job-1'
+    _force_copy(monkeypatch)
+    snapshots = []
+
+    result = atomic_move(source_dir, destination_dir, io_parallelism=2, progress=snapshots.append)
+
+    assert not source_dir.exists()
+    assert (destination_dir / 'audio' / 'chunk-1.mp3').read_text(encoding='utf-8') == 'a' * 4096
+    assert (destination_dir / 'empty').is_dir()
+    assert (result.method, result.files, result.copied) == ('transfer', 2, 2)
+    assert result.bytes == 4096 + len('{"job_id": "job-1"}')
+    assert snapshots[-1].bytes_done == snapshots[-1].bytes_total == result.bytes
+    assert snapshots[-1].files_done == 2
+    assert not list(destination_dir.parent.glob('.job-1*'))
+
+
+def test_atomic_move_hardlinks_when_rename_is_refused(monkeypatch, tmp_path):
+    source_dir = tmp_path / 'source'
+    write_file(source_dir / 'sample.txt', 'linked')
+    monkeypatch.setattr(atomic_move_module, '_same_filesystem', lambda _src, _dst: False)
+
+    result = atomic_move(source_dir, tmp_path / 'destination')
+
+    assert result.hardlinked == 1
+    assert result.copied == 0
+    assert (tmp_path / 'destination' / 'sample.txt').read_text(encoding='utf-8') == 'linked'
+
+
+def test_atomic_move_resumes_after_interruption(monkeypatch, tmp_path):
+    source_dir = tmp_path / 'source'
+    for index in range(4):
+        write_file(source_dir / f'part-{index}.bin', str(index) * (index + 1) * 100)
+    destination_dir = tmp_path / 'destination'
+    _force_copy(monkeypatch)
+    original_copy = atomic_move_module._copy_file
+    calls = {'count': 0}
+
+    def flaky_copy(planned, *args, **kwargs):
+        calls['count'] += 1
+        if calls['count'] == 3:
+            raise OSError('connection to NAS lost')
+        return original_copy(planned, *args, **kwargs)
+
+    monkeypatch.setattr(atomic_move_module, '_copy_file', flaky_copy)
+    with pytest.raises(OSError):
+        atomic_move(source_dir, destination_dir, io_parallelism=1)
+
+    assert source_dir.exists()
+    assert not destination_dir.exists()
+    assert (tmp_path / '.destination.move.jsonl').exists()
+
+    monkeypatch.setattr(atomic_move_module, '_copy_file', original_copy)
+    result = atomic_move(source_dir, destination_dir, io_parallelism=1)
+
+    assert result.resumed == 2
+    assert result.copied == 2
+    assert not source_dir.exists()
+    assert not (tmp_path / '.destination.move.jsonl').exists()
+    for index in range(4):
+        content = (destination_dir / f'part-{index}.bin').read_text(encoding='utf-8')
+        assert content == str(index) * (index + 1) * 100
+
+
+def test_atomic_move_rejects_source_changes_during_copy(monkeypatch, tmp_path):
+    source_file = tmp_path / 'source.txt'
+    write_file(source_file, 'original')
+    _force_copy(monkeypatch)
+    original_plan = atomic_move_module._plan
+
+    def plan_then_modify(src_path):
+        planned = original_plan(src_path)
+        write_file(source_file, 'modified after planning')
+        return planned
+
+    monkeypatch.setattr(atomic_move_module, '_plan', plan_then_modify)
+
+    with pytest.raises(atomic_move_module.ChecksumMismatchError):
+        atomic_move(source_file, tmp_path / 'target.txt')
+
+    assert source_file.exists()
+    assert not (tmp_path / 'target.txt').exists()
+    assert not list(tmp_path.glob('.target.txt*'))
+
+
+def test_atomic_move_keeps_source_when_manifest_was_never_committed(monkeypatch, tmp_path):
+    source_file = tmp_path / 'source.txt'
+    write_file(source_file, 'only copy')
+    destination_file = tmp_path / 'target.txt'
+    _force_copy(monkeypatch)
+
+    def crash_before_copy(*_args, **_kwargs):
+        raise OSError('killed before the first rename')
+
+    monkeypatch.setattr(atomic_move_module, '_copy_file', crash_before_copy)
+    with pytest.raises(OSError):
+        atomic_move(source_file, destination_file)
+    assert (tmp_path / '.target.txt.move.jsonl').exists()
+
+    # An unrelated file appears at the destination before the retry.
+    write_file(destination_file, 'unrelated')
+    with pytest.raises(atomic_move_module.AtomicMoveError):
+        atomic_move(source_file, destination_file)
+
+    assert source_file.read_text(encoding='utf-8') == 'only copy'
+    assert destination_file.read_text(encoding='utf-8') == 'unrelated'
+
+
+def test_atomic_move_finishes_committed_move_by_removing_source(monkeypatch, tmp_path):
+    source_file = tmp_path / 'source.txt'
+    write_file(source_file, 'payload')
+    destination_file = tmp_path / 'target.txt'
+    _force_copy(monkeypatch)
+
+    def crash_before_cleanup(_path):
+        raise OSError('killed after the final rename')
+
+    monkeypatch.setattr(atomic_move_module, '_remove_source', crash_before_cleanup)
+    with pytest.raises(OSError):
+        atomic_move(source_file, destination_file)
+    monkeypatch.undo()
+
+    result = atomic_move(source_file, destination_file)
+
+    assert result.method == 'transfer'
+    assert not source_file.exists()
+    assert destination_file.read_text(encoding='utf-8') == 'payload'
+    assert not (tmp_path / '.target.txt.move.jsonl').exists()
+
+
+def test_atomic_move_verifies_copied_bytes_against_digest(monkeypatch, tmp_path):
+    source_file = tmp_path / 'source.txt'
+    write_file(source_file, 'expected bytes')
+    _force_copy(monkeypatch)
+    original_copy = atomic_move_module._copy_file
+
+    def corrupting_copy(planned, target, *args, **kwargs):
+        digest = original_copy(planned, target, *args, **kwargs)
+        target.write_bytes(b'corrupt bytes!')
+        return digest
+
+    monkeypatch.setattr(atomic_move_module, '_copy_file', corrupting_copy)
+
+    with pytest.raises(atomic_move_module.ChecksumMismatchError):
+        atomic_move(source_file, tmp_path / 'target.txt')
+
+    assert source_file.read_text(encoding='utf-8') == 'expected bytes'
+    assert not (tmp_path / 'target.txt').exists()
+
+
+def test_atomic_move_stages_hardlinks_when_rename_is_unsupported(monkeypatch, tmp_path):
+    source_dir = tmp_path / 'source'
+    write_file(source_dir / 'sample.txt', 'linked')
+    original_replace = Path.replace
+
+    def refusing_replace(self, target):
+        if self == source_dir:
+            raise OSError(atomic_move_module.errno.ENOTSUP, 'rename not supported')
+        return original_replace(self, target)
+
+    monkeypatch.setattr(Path, 'replace', refusing_replace)
+
+    result = atomic_move(source_dir, tmp_path / 'destination')
+
+    assert (result.method, result.hardlinked, result.copied) == ('transfer', 1, 0)
+    assert not source_dir.exists()
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import os
+import shutil
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from modules.fsutils import locks as locks_module
+from modules.fsutils.locks import DirectoryLock, LockAcquisitionError, acquire_lock, lock_metrics
+
+pytestmark = [
+    pytest.mark.services,
+    pytest.mark.skipif(locks_module.fcntl is None, reason="flock is not available"),
+]
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+
+
+@pytest.fixture(autouse=True)
+def _reset_metrics():
+    locks_module.reset_lock_metrics()
+    yield
+    locks_module.reset_lock_metrics()
+
+
+def test_lock_file_is_removed_and_timings_recorded(tmp_path):
+    with acquire_lock(tmp_path) as lock:
+        assert lock.path.exists()
+        assert lock.path.read_text(encoding='utf-8').endswith(':flock\n')
+
+    assert not (tmp_path / '.lock').exists()
+    stats = lock_metrics(tmp_path / '.lock')[str(tmp_path / '.lock')]
+    assert stats['acquisitions'] == 1
+    assert stats['contended'] == 0
+    assert stats['wait_seconds']['count'] == 1
+    assert stats['hold_seconds']['count'] == 1
+
+
+def test_waiter_blocks_until_holder_releases(tmp_path):
+    holder = DirectoryLock(tmp_path)
+    holder.acquire()
+    acquired_at = {}
+
+    def wait_for_lock() -> None:
+        with DirectoryLock(tmp_path):
+            acquired_at['time'] = time.monotonic()
+
+    waiter = threading.Thread(target=wait_for_lock)
+    waiter.start()
+    time.sleep(0.2)
+    assert 'time' not in acquired_at
+    released_at = time.monotonic()
+    holder.release()
+    waiter.join(timeout=5)
+
+    assert acquired_at['time'] >= released_at
+    assert acquired_at['time'] - released_at < 0.5
+    stats = lock_metrics(tmp_path / '.lock')[str(tmp_path / '.lock')]
+    assert (stats['acquisitions'], stats['contended']) == (2, 1)
+    assert stats['wait_seconds']['max'] >= 0.15
+
+
+def test_timeouts_and_non_blocking_attempts_fail_while_held(tmp_path):
+    with DirectoryLock(tmp_path):
+        started = time.monotonic()
+        with pytest.raises(LockAcquisitionError, match='Timed out'):
+            DirectoryLock(tmp_path).acquire(timeout=0.2)
+        assert 0.15 <= time.monotonic() - started < 2
+        with pytest.raises(LockAcquisitionError, match='already held'):
+            DirectoryLock(tmp_path).acquire(blocking=False)
+
+    # The abandoned timed waiter must not keep the lock once it is free.
+    with acquire_lock(tmp_path, timeout=2):
+        pass
+    assert lock_metrics(tmp_path / '.lock')[str(tmp_path / '.lock')]['timeouts'] == 2
+
+
+def test_lock_is_released_when_holder_process_dies(tmp_path):
+    script = (
+        'import sys, time\n'
+        'from modules.fsutils import DirectoryLock\n'
+        'lock = DirectoryLock(sys.argv[1]); lock.acquire()\n'
+        'print("locked", flush=True); time.sleep(60)\n'
+    )
+    env = dict(os.environ, PYTHONPATH=str(REPO_ROOT))
+    process = subprocess.Popen(
+        [sys.executable, '-c', script, str(tmp_path)],
+        stdout=subprocess.PIPE,
+        cwd=REPO_ROOT,
+        env=env,
+        text=True,
+    )
+    try:
+        assert process.stdout.readline().strip() == 'locked'
+        with pytest.raises(LockAcquisitionError):
+            DirectoryLock(tmp_path).acquire(timeout=0.1)
+        process.kill()
+        process.wait(timeout=10)
+        with acquire_lock(tmp_path, timeout=5):
+            pass
+    finally:
+        if process.poll() is None:
+            process.kill()
+            process.wait(timeout=10)
+
+    stats = lock_metrics(tmp_path / '.lock')[str(tmp_path / '.lock')]
+    assert stats['stale_recovered'] == 1
+
+
+def test_legacy_lock_files_honour_live_pids_only(tmp_path):
+    lock_path = tmp_path / '.lock'
+    lock_path.write_text(f'{os.getppid()}:{time.time():.6f}\n', encoding='utf-8')
+    with pytest.raises(LockAcquisitionError):
+        DirectoryLock(tmp_path, poll_interval=0.02).acquire(timeout=0.1)
+
+    dead = subprocess.Popen([sys.executable, '-c', 'pass'])
+    dead.wait(timeout=10)
+    lock_path.write_text(f'{dead.pid}:{time.time():.6f}\n', encoding='utf-8')
+    with acquire_lock(tmp_path, timeout=1):
+        assert lock_path.read_text(encoding='utf-8').startswith(f'{os.getpid()}:')
+    assert not lock_path.exists()
+
+
+def test_relocated_lock_cleans_up_moved_lock_file(tmp_path):
+    source = tmp_path / 'queue' / 'job-1'
+    source.mkdir(parents=True)
+    target = tmp_path / 'library' / 'job-1'
+    target.parent.mkdir()
+
+    with DirectoryLock(source) as lock:
+        source.rename(target)
+        lock.relocate(target)
+
+    assert not (target / '.lock').exists()
+
+
+def test_lock_relocated_across_devices_still_refuses_other_acquirers(tmp_path):
+    source = tmp_path / 'queue' / 'job-1'
+    source.mkdir(parents=True)
+    target = tmp_path / 'library' / 'job-1'
+
+    with DirectoryLock(source) as lock:
+        # A cross-device move copies the lock file onto a new inode.
+        shutil.copytree(source, target)
+        shutil.rmtree(source)
+        lock.relocate(target)
+
+        with pytest.raises(LockAcquisitionError):
+            DirectoryLock(target, poll_interval=0.02).acquire(timeout=0.1)
+
+    assert not (target / '.lock').exists()
+    with acquire_lock(target, timeout=1):
+        pass
@@ -112,3 +112,142 @@ def test_sorted_migrations_treats_unavailable_dir_as_empty(
     monkeypatch.setattr(Path, "exists", guarded_exists)
 
     assert repository_module._sorted_migrations() == []
+
+
+def test_migrations_run_once_per_process(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    calls = []
+    original = repository_module._sorted_migrations
+
+    def counting_migrations():
+        calls.append(1)
+        return original()
+
+    monkeypatch.setattr(repository_module, "_sorted_migrations", counting_migrations)
+    repository = LibraryRepository(tmp_path)
+
+    repository.add_entry(make_entry(tmp_path, "job-1"))
+    repository.list_entries()
+    repository.count_entries(query="Title")
+    assert repository.get_entry_by_id("job-1") is not None
+    LibraryRepository(tmp_path).list_entries()
+    repository.connect().close()
+
+    assert len(calls) == 1
+
+
+def test_pooled_connections_use_wal_and_read_only_readers(tmp_path: Path) -> None:
+    import sqlite3
+
+    repository = LibraryRepository(tmp_path)
+    repository.add_entry(make_entry(tmp_path, "job-1"))
+
+    with repository.connections.reader() as connection:
+        journal_mode = connection.execute("PRAGMA journal_mode").fetchone()[0]
+        with pytest.raises(sqlite3.OperationalError):
+            connection.execute("DELETE FROM library_items")
+    repository.list_entries()
+    repository.list_entries()
+
+    assert journal_mode == "wal"
+    assert repository.connections.snapshot()["connections_opened"] == 2
+
+
+def test_readers_are_not_blocked_by_open_write_transaction(tmp_path: Path) -> None:
+    import threading
+
+    repository = LibraryRepository(tmp_path)
+    repository.add_entry(make_entry(tmp_path, "job-1"))
+    seen: list[list[str]] = []
+
+    with repository.connections.writer() as connection:
+        connection.execute("DELETE FROM library_items")
+        reader = threading.Thread(
+            target=lambda: seen.append([entry.id for entry in repository.list_entries()])
+        )
+        reader.start()
+        reader.join(timeout=5)
+        assert not reader.is_alive()
+
+    assert seen == [["job-1"]]
+    assert repository.list_entries() == []
+
+
+def _seed_grouped_library(repository: LibraryRepository, root: Path) -> None:
+    rows = [
+        ("job-1", "Ann", "Alpha", "en", "2024-01-01"),
+        ("job-2", "Ann", "Alpha", "en", "2024-01-03"),
+        ("job-3", "Ann", "Alpha", "de", "2024-01-02"),
+        ("job-4", "Ann", "Beta", "en", "2024-01-04"),
+        ("job-5", "Bob", "Gamma", "fr", "2024-01-05"),
+        ("job-6", "", "", "en", "2024-01-06"),
+    ]
+    for job_id, author, title, language, updated in rows:
+        repository.add_entry(
+            make_entry(
+                root,
+                job_id,
+                author=author,
+                book_title=title,
+                language=language,
+                updated_at=f"{updated}T00:00:00+00:00",
+            )
+        )
+
+
+def test_list_groups_pages_group_headers_with_counts(tmp_path: Path) -> None:
+    repository = LibraryRepository(tmp_path)
+    _seed_grouped_library(repository, tmp_path)
+
+    first = repository.list_groups(view="by_author", limit=2)
+    second = repository.list_groups(view="by_author", limit=2, cursor=first.next_cursor)
+
+    assert first.level == "author"
+    assert first.total == 3
+    assert [(group.label, group.count) for group in first.groups] == [("Ann", 4), ("Bob", 1)]
+    assert first.groups[0].latest_updated_at == "2024-01-04T00:00:00+00:00"
+    assert [(group.label, group.count) for group in second.groups] == [("Unknown Author", 1)]
+    assert second.next_cursor is None
+
+
+def test_list_groups_expands_path_and_pages_leaf_items(tmp_path: Path) -> None:
+    repository = LibraryRepository(tmp_path)
+    _seed_grouped_library(repository, tmp_path)
+
+    books = repository.list_groups(view="by_author", path=["Ann"])
+    languages = repository.list_groups(view="by_author", path=["Ann", "Alpha"])
+    untitled = repository.list_groups(view="by_author", path=["Unknown Author"])
+    first = repository.list_groups(view="by_author", path=["Ann", "Alpha", "en"], limit=1)
+    second = repository.list_groups(
+        view="by_author", path=["Ann", "Alpha", "en"], limit=1, cursor=first.next_cursor
+    )
+
+    assert [(group.label, group.count) for group in books.groups] == [("Alpha", 3), ("Beta", 1)]
+    assert [group.label for group in languages.groups] == ["de", "en"]
+    assert [group.label for group in untitled.groups] == ["Untitled Book"]
+    assert first.level is None and first.total == 2
+    assert [item.id for item in first.items] == ["job-2"]
+    assert [item.id for item in second.items] == ["job-1"]
+    assert second.next_cursor is None
+
+
+def test_list_groups_applies_access_filter_and_rejects_bad_input(tmp_path: Path) -> None:
+    from modules.library.library_groups import GroupQueryError
+
+    repository = LibraryRepository(tmp_path)
+    _seed_grouped_library(repository, tmp_path)
+    private = make_entry(tmp_path, "job-7", author="Cleo")
+    repository.add_entry(
+        LibraryEntry(**{**private.__dict__, "owner_id": "owner", "visibility": "private"})
+    )
+
+    anonymous = repository.list_groups(view="by_author")
+    owner = repository.list_groups(view="by_author", user_id="owner", user_role="viewer")
+
+    assert "Cleo" not in [group.label for group in anonymous.groups]
+    assert "Cleo" in [group.label for group in owner.groups]
+    with pytest.raises(GroupQueryError):
+        repository.list_groups(view="flat")
+    with pytest.raises(GroupQueryError):
+        repository.list_groups(view="by_genre", path=["a", "b", "c", "d"])
+    with pytest.raises(GroupQueryError):
+        repository.list_groups(view="by_genre", cursor="not-a-cursor")
@@ -8,6 +8,7 @@ from pathlib import Path
 import pytest
 
 from modules.library import (
+    LibraryConflictError,
     LibraryEntry,
     LibraryError,
     LibraryNotFoundError,
@@ -17,7 +18,7 @@ from modules.library import (
     MetadataSnapshot,
 )
 from modules.library import library_sync as library_sync_module
-from modules.library.sync import file_ops
+from modules.library.sync import file_ops, reindex
 from modules.services.file_locator import FileLocator
 
 pytestmark = pytest.mark.library
@@ -955,3 +956,84 @@ def test_reindex_from_filesystem(tmp_path):
     indexed = service.reindex_from_fs()
     assert indexed == 1
     assert service._repository.get_entry_by_id('job-900') is not None
+
+
+def test_incremental_reindex_applies_only_changed_folders(tmp_path):
+    service, _locator, library_root, _job_manager = create_service(tmp_path)
+    author_root = library_root / 'Jane Doe' / 'Sample Book' / 'en'
+    for job_id in ('job-1', 'job-2', 'job-3'):
+        write_metadata(author_root / job_id, build_job_metadata(job_id))
+
+    first = service.reindex_with_report()
+    assert first.mode == 'full'
+    assert first.fallback_reason == 'journal_unavailable'
+    assert first.indexed == 3
+    assert (library_root / '.library' / reindex.JOURNAL_FILENAME).exists()
+
+    changed = build_job_metadata('job-2')
+    changed['book_title'] = 'Changed Title'
+    write_metadata(author_root / 'job-2', changed)
+    shutil.rmtree(author_root / 'job-1')
+    write_metadata(author_root / 'job-4', build_job_metadata('job-4'))
+
+    second = service.reindex_with_report()
+    assert second.mode == 'incremental'
+    assert second.fallback_reason is None
+    assert (second.parsed, second.unchanged, second.deleted) == (2, 1, 1)
+    assert second.indexed == 3
+    repository = service._repository
+    assert repository.get_entry_by_id('job-1') is None
+    assert repository.get_entry_by_id('job-2').book_title == 'Changed Title'
+    assert repository.get_entry_by_id('job-4') is not None
+    assert reindex.reindex_progress()['state'] == 'completed'
+
+
+def test_incremental_reindex_keeps_moved_folders_and_recovers_lost_rows(tmp_path):
+    service, _locator, library_root, _job_manager = create_service(tmp_path)
+    job_root = library_root / 'Jane Doe' / 'Sample Book' / 'en' / 'job-5'
+    write_metadata(job_root, build_job_metadata('job-5'))
+    service.reindex_from_fs()
+
+    moved_root = library_root / 'Jane Doe' / 'Renamed Book' / 'en' / 'job-5'
+    moved_root.parent.mkdir(parents=True)
+    shutil.move(str(job_root), str(moved_root))
+    report = service.reindex_with_report()
+    assert (report.parsed, report.deleted) == (1, 0)
+    assert service._repository.get_entry_by_id('job-5').library_path == str(moved_root)
+
+    service._repository.delete_entry('job-5')
+    report = service.reindex_with_report()
+    assert report.mode == 'full'
+    assert report.fallback_reason == 'index_out_of_step'
+    assert service._repository.get_entry_by_id('job-5') is not None
+
+
+def test_full_reindex_keeps_rows_of_unparsable_folders(tmp_path):
+    service, _locator, library_root, _job_manager = create_service(tmp_path)
+    author_root = library_root / 'Jane Doe' / 'Sample Book' / 'en'
+    for job_id in ('job-6', 'job-7'):
+        write_metadata(author_root / job_id, build_job_metadata(job_id))
+    service.reindex_from_fs(mode='full')
+
+    (author_root / 'job-7' / 'metadata' / 'job.json').write_text('{"job_id": ', encoding='utf-8')
+    report = service.reindex_with_report(mode='full')
+    assert (report.parsed, report.failed, report.indexed) == (1, 1, 2)
+    assert service._repository.get_entry_by_id('job-7') is not None
+
+    # The automatic fallback when the journal is missing is a full run too.
+    (library_root / '.library' / reindex.JOURNAL_FILENAME).unlink()
+    report = service.reindex_with_report()
+    assert (report.mode, report.fallback_reason) == ('full', 'journal_unavailable')
+    assert report.failed == 1
+    assert service._repository.get_entry_by_id('job-6') is not None
+    assert service._repository.get_entry_by_id('job-7') is not None
+
+
+def test_reindex_rejects_concurrent_runs_and_unknown_modes(tmp_path):
+    service, _locator, _library_root, _job_manager = create_service(tmp_path)
+
+    with pytest.raises(LibraryError):
+        service.reindex_from_fs(mode='partial')
+    with reindex._RUN_LOCK:
+        with pytest.raises(LibraryConflictError):
+            service.reindex_from_fs()
@@ -0,0 +1,242 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Iterator, Optional
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from modules.services.metadata import registry as registry_module
+from modules.services.metadata.cache import MetadataCache
+from modules.services.metadata.clients.base import BaseMetadataClient
+from modules.services.metadata.pipeline import MetadataLookupPipeline
+from modules.services.metadata.registry import MetadataSourceRegistry
+from modules.services.metadata.sessions import ProviderSessionPool, RateLimiter
+from modules.services.metadata.types import (
+    LookupOptions,
+    LookupQuery,
+    MediaType,
+    MetadataSource,
+    UnifiedMetadataResult,
+)
+
+pytestmark = pytest.mark.services
+
+_BOOK_CHAIN = [MetadataSource.OPENLIBRARY, MetadataSource.GOOGLE_BOOKS, MetadataSource.WIKIPEDIA]
+_COMPLETE = {
+    "year": 1999,
+    "genres": ["Fiction"],
+    "summary": "A summary.",
+    "cover_url": "http://covers.invalid/1.jpg",
+}
+
+
+class _FakeProvider:
+    """Local HTTP server that answers lookups after a configurable delay."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.delay = 0.0
+        self.payload: Optional[dict] = {"title": f"{name} title"}
+        self.status = 200
+        self.requests = 0
+        self.connections: set[int] = set()
+        provider = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self) -> None:  # noqa: N802 - http.server API
+                provider.requests += 1
+                provider.connections.add(self.client_address[1])
+                time.sleep(provider.delay)
+                if provider.status != 200:
+                    body, status = b"{}", provider.status
+                elif provider.payload is None:
+                    body, status = b"{}", 404
+                else:
+                    query = parse_qs(urlparse(self.path).query)
+                    body = json.dumps({**provider.payload, "query": query.get("q", [""])[0]}).encode()
+                    status = 200
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args) -> None:
+                return None
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self._server.server_address[1]}"
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+class _FakeProviderClient(BaseMetadataClient):
+    supported_types = tuple(MediaType)
+
+    def __init__(self, *, base_url: str, source: MetadataSource, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.name = source
+        self._base_url = base_url
+
+    def lookup(self, query: LookupQuery, options: LookupOptions) -> Optional[UnifiedMetadataResult]:
+        payload = self._get(f"{self._base_url}/lookup", params={"q": query.title})
+        if not payload:
+            return None
+        return UnifiedMetadataResult(
+            title=payload["title"],
+            type=query.media_type,
+            year=payload.get("year"),
+            genres=list(payload.get("genres", [])),
+            summary=payload.get("summary"),
+            cover_url=payload.get("cover_url"),
+            primary_source=self.name,
+            contributing_sources=[self.name],
+        )
+
+
+@pytest.fixture
+def providers(monkeypatch: pytest.MonkeyPatch) -> Iterator[dict[MetadataSource, _FakeProvider]]:
+    servers = {source: _FakeProvider(source.value) for source in _BOOK_CHAIN}
+    for source in _BOOK_CHAIN:
+        monkeypatch.setitem(registry_module.CLIENT_CLASSES, source, _FakeProviderClient)
+    yield servers
+    for server in servers.values():
+        server.close()
+
+
+def _pipeline(
+    providers: dict[MetadataSource, _FakeProvider],
+    *,
+    cache: Optional[MetadataCache] = None,
+    pool: Optional[ProviderSessionPool] = None,
+) -> MetadataLookupPipeline:
+    registry = MetadataSourceRegistry(
+        custom_chains={MediaType.BOOK: list(_BOOK_CHAIN)},
+        session_pool=pool or ProviderSessionPool(rate_limits={source: 0 for source in _BOOK_CHAIN}),
+        client_options={
+            source: {"base_url": server.url, "source": source} for source, server in providers.items()
+        },
+    )
+    return MetadataLookupPipeline(registry=registry, cache=cache, cache_enabled=cache is not None)
+
+
+def _query(title: str = "Dune") -> LookupQuery:
+    return LookupQuery(media_type=MediaType.BOOK, title=title)
+
+
+def test_sources_are_queried_concurrently_and_merged_in_chain_order(providers) -> None:
+    for source, delay in zip(_BOOK_CHAIN, (0.4, 0.3, 0.3)):
+        providers[source].delay = delay
+    providers[MetadataSource.GOOGLE_BOOKS].payload = {"title": "GB title", "year": 2001, "genres": ["Sci-Fi"]}
+
+    started = time.monotonic()
+    with _pipeline(providers) as pipeline:
+        result = pipeline.lookup(_query())
+    elapsed = time.monotonic() - started
+
+    assert elapsed < 0.9
+    assert result is not None
+    # The slowest source is still the primary because it leads the chain.
+    assert result.title == "openlibrary title"
+    assert result.year == 2001
+    assert result.primary_source == MetadataSource.OPENLIBRARY
+    assert result.contributing_sources == _BOOK_CHAIN
+
+
+def test_lower_priority_sources_are_cancelled_once_required_fields_are_found(providers) -> None:
+    providers[MetadataSource.OPENLIBRARY].delay = 0.2
+    providers[MetadataSource.GOOGLE_BOOKS].payload = {"title": "GB title", **_COMPLETE}
+    providers[MetadataSource.WIKIPEDIA].delay = 3.0
+
+    started = time.monotonic()
+    with _pipeline(providers) as pipeline:
+        result = pipeline.lookup(_query())
+    elapsed = time.monotonic() - started
+
+    assert elapsed < 2.0
+    assert result is not None
+    assert result.title == "openlibrary title"
+    assert result.contributing_sources == [MetadataSource.OPENLIBRARY, MetadataSource.GOOGLE_BOOKS]
+
+
+def test_slow_sources_time_out_and_misses_are_cached(providers, tmp_path: Path) -> None:
+    providers[MetadataSource.OPENLIBRARY].delay = 3.0
+    providers[MetadataSource.GOOGLE_BOOKS].payload = None
+    providers[MetadataSource.WIKIPEDIA].payload = None
+    cache = MetadataCache(tmp_path, negative_ttl_minutes=5)
+
+    with _pipeline(providers, cache=cache) as pipeline:
+        started = time.monotonic()
+        assert pipeline.lookup(_query(), LookupOptions(timeout_seconds=0.3)) is None
+        assert time.monotonic() - started < 2.0
+        # A timed-out source may have the answer next time, so no miss is recorded.
+        assert cache.is_miss(_query()) is False
+
+        providers[MetadataSource.OPENLIBRARY].delay = 0.0
+        providers[MetadataSource.OPENLIBRARY].status = 503
+        assert pipeline.lookup(_query()) is None
+        assert cache.is_miss(_query()) is False
+
+        providers[MetadataSource.OPENLIBRARY].status = 200
+        providers[MetadataSource.OPENLIBRARY].payload = None
+        assert pipeline.lookup(_query()) is None
+        assert cache.is_miss(_query()) is True
+
+        counts = [server.requests for server in providers.values()]
+        assert pipeline.lookup(_query()) is None
+        assert [server.requests for server in providers.values()] == counts
+
+        providers[MetadataSource.OPENLIBRARY].payload = {"title": "Found later", **_COMPLETE}
+        refreshed = pipeline.lookup(_query(), LookupOptions(force_refresh=True))
+    assert refreshed is not None and refreshed.title == "Found later"
+    assert cache.is_miss(_query()) is False
+    assert cache.get(_query()).title == "Found later"
+
+
+def test_expired_misses_are_dropped(tmp_path: Path) -> None:
+    cache = MetadataCache(tmp_path, negative_ttl_minutes=0)
+    cache.set_miss(_query())
+    assert cache.is_miss(_query()) is False
+    assert cache.cleanup_expired() == 0
+    assert list(tmp_path.glob("*.json")) == []
+
+
+def test_provider_sessions_are_shared_and_kept_alive(providers) -> None:
+    for source in _BOOK_CHAIN[1:]:
+        providers[source].payload = None
+    pool = ProviderSessionPool(rate_limits={source: 0 for source in _BOOK_CHAIN})
+
+    for index in range(4):
+        with _pipeline(providers, pool=pool) as pipeline:
+            assert pipeline.lookup(_query(f"Book {index}"), LookupOptions(parallel_sources=False))
+
+    openlibrary = providers[MetadataSource.OPENLIBRARY]
+    assert openlibrary.requests == 4
+    assert len(openlibrary.connections) == 1
+    pool.close()
+
+
+def test_rate_limiter_spaces_requests() -> None:
+    now = [0.0]
+    sleeps: list[float] = []
+
+    def sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    limiter = RateLimiter(2.0, burst=1, clock=lambda: now[0], sleep=sleep)
+    assert limiter.acquire() and limiter.acquire() and limiter.acquire()
+    assert sleeps == [0.5, 0.5]
+    assert limiter.acquire(timeout=0.1) is False
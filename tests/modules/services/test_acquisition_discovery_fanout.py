@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections.abc import Callable, Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+import modules.services.acquisition.discovery as acquisition_discovery
+from modules.services.acquisition import AcquisitionCandidate, discover_acquisition_candidates
+from modules.services.acquisition.discovery_fanout import (
+    DiscoveryResultCache,
+    DiscoveryTimeouts,
+    ProviderDiscoveryUpdate,
+    resolve_discovery_timeouts,
+)
+from modules.services.acquisition.tokens import encode_acquisition_token
+
+pytestmark = pytest.mark.services
+
+_REMOTE_PROVIDERS = ("gutenberg", "internet_archive", "openlibrary")
+
+
+def _candidate(provider: str, index: int) -> AcquisitionCandidate:
+    return AcquisitionCandidate(
+        candidate_id=f"{provider}:{index}",
+        provider=provider,
+        media_kind="book",
+        title=f"{provider} {index}",
+        rights="public_domain",
+        capabilities=("metadata",),
+        candidate_token=encode_acquisition_token({"provider": provider, "index": index}),
+    )
+
+
+class _FakeProviderServer:
+    """Local HTTP server standing in for remote providers, each with its own delay."""
+
+    def __init__(self, delays: dict[str, float]) -> None:
+        self.delays = delays
+        self.calls: list[tuple[str, int]] = []
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:  # noqa: N802 - http.server API
+                provider_id = self.path.strip("/").split("?")[0]
+                time.sleep(server.delays[provider_id])
+                body = json.dumps([f"{provider_id} {index}" for index in range(2)]).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args) -> None:
+                return None
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self._server.server_address[1]}"
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def install(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(
+            acquisition_discovery,
+            "default_discovery_provider_ids",
+            lambda media_kind, config: tuple(self.delays),
+        )
+        for provider_id in self.delays:
+            monkeypatch.setitem(
+                acquisition_discovery._PROVIDER_DISCOVERY_HANDLERS,
+                provider_id,
+                self._handler(provider_id),
+            )
+
+    def _handler(self, provider_id: str):
+        def _discover(context, limit):
+            self.calls.append((provider_id, limit))
+            response = requests.get(f"{self.url}/{provider_id}", params={"q": context.query}, timeout=5)
+            return [_candidate(provider_id, index) for index, _title in enumerate(response.json())]
+
+        return _discover
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@pytest.fixture
+def provider_server(monkeypatch: pytest.MonkeyPatch) -> Iterator[Callable[..., _FakeProviderServer]]:
+    servers: list[_FakeProviderServer] = []
+
+    def _start(**delays: float) -> _FakeProviderServer:
+        server = _FakeProviderServer(delays)
+        server.install(monkeypatch)
+        servers.append(server)
+        return server
+
+    yield _start
+    for server in servers:
+        server.close()
+
+
+def test_remote_providers_are_queried_concurrently_in_stable_order(
+    provider_server,
+) -> None:
+    providers = provider_server(gutenberg=0.3, internet_archive=0.1, openlibrary=0.2)
+
+    started = time.monotonic()
+    result = discover_acquisition_candidates(media_kind="book", query="origin", limit=10, config={})
+    elapsed = time.monotonic() - started
+
+    assert elapsed < 0.55
+    assert sorted(providers.calls) == [(provider, 10) for provider in _REMOTE_PROVIDERS]
+    assert result.providers_queried == _REMOTE_PROVIDERS
+    assert [candidate.provider for candidate in result.candidates] == [
+        provider for provider in _REMOTE_PROVIDERS for _ in range(2)
+    ]
+
+
+def test_slow_provider_times_out_into_policy_note_without_blocking_others(
+    provider_server,
+) -> None:
+    providers = provider_server(gutenberg=0.05, internet_archive=1.0, openlibrary=0.05)
+    updates: list[ProviderDiscoveryUpdate] = []
+    cache = DiscoveryResultCache()
+
+    started = time.monotonic()
+    result = discover_acquisition_candidates(
+        media_kind="book",
+        query="origin",
+        limit=10,
+        config={"acquisition_discovery_provider_timeouts": {"internet_archive": 0.2}},
+        cache=cache,
+        on_provider_result=updates.append,
+    )
+
+    assert time.monotonic() - started < 0.8
+    assert result.providers_queried == _REMOTE_PROVIDERS
+    assert {candidate.provider for candidate in result.candidates} == {"gutenberg", "openlibrary"}
+    assert any(
+        note.startswith("internet_archive unavailable during Default sources")
+        for note in result.policy_notes
+    )
+    assert {update.provider: update.status for update in updates} == {
+        "gutenberg": "ok",
+        "internet_archive": "timeout",
+        "openlibrary": "ok",
+    }
+
+    # The abandoned request still finishes and fills the cache for next time.
+    time.sleep(1.0)
+    providers.calls.clear()
+    repeat = discover_acquisition_candidates(
+        media_kind="book", query="  ORIGIN ", limit=10, config={}, cache=cache
+    )
+    assert providers.calls == []
+    assert {candidate.provider for candidate in repeat.candidates} == set(_REMOTE_PROVIDERS)
+
+
+def test_global_deadline_bounds_the_whole_search(provider_server) -> None:
+    provider_server(gutenberg=1.0, internet_archive=1.0, openlibrary=0.0)
+
+    started = time.monotonic()
+    result = discover_acquisition_candidates(
+        media_kind="book",
+        query="origin",
+        limit=10,
+        config={"acquisition_discovery_deadline_seconds": 0.2},
+    )
+
+    assert time.monotonic() - started < 0.6
+    assert [candidate.provider for candidate in result.candidates] == ["openlibrary", "openlibrary"]
+    assert len(result.policy_notes) > len(acquisition_discovery.DEFAULT_DISCOVERY_POLICY_NOTES)
+
+
+def test_cache_serves_repeats_and_respects_ttl_and_limits() -> None:
+    now = [100.0]
+    cache = DiscoveryResultCache(ttl_seconds=10, clock=lambda: now[0])
+    key = cache.make_key("gutenberg", query="Origin  Story", language="EN", media_kind="book")
+    assert key == cache.make_key("gutenberg", query="origin story", language="en", media_kind="book")
+
+    full = [_candidate("gutenberg", index) for index in range(5)]
+    cache.put(key, full, 5)
+    assert cache.get(key, 3) == tuple(full[:3])
+    # Five results for five slots may be truncated, so a larger request misses.
+    assert cache.get(key, 10) is None
+
+    short = full[:2]
+    cache.put(key, short, 5)
+    assert cache.get(key, 10) == tuple(short)
+
+    now[0] += 11
+    assert cache.get(key, 3) is None
+
+
+def test_discovery_timeouts_read_runtime_config() -> None:
+    timeouts = resolve_discovery_timeouts(
+        {
+            "acquisition_discovery_deadline_seconds": "5",
+            "acquisition_discovery_provider_timeout_seconds": 0,
+        }
+    )
+
+    assert timeouts == DiscoveryTimeouts(deadline_seconds=5.0)
+    overrides = {"acquisition_discovery_provider_timeouts": {"openlibrary": 2}}
+    assert timeouts.provider_timeout("openlibrary", overrides) == 2.0
+    assert timeouts.provider_timeout("gutenberg", overrides) == timeouts.provider_timeout_seconds
@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+import modules.services.job_manager.manager as manager_module
+from modules.services.file_locator import FileLocator
+from modules.services.job_manager import (
+    AdmissionBudget,
+    AdmissionScheduler,
+    InMemoryJobStore,
+    PipelineJobManager,
+    PipelineJobStatus,
+    ResourceEstimate,
+    estimate_job_resources,
+)
+from modules.services.job_manager.job import PipelineJob
+from modules.services.pipeline_service import PipelineInput, PipelineRequest
+
+from .conftest import DummyExecutor, DummyWorkerPool
+
+pytestmark = pytest.mark.services
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _IdleSampler:
+    def reset_baseline(self) -> None:
+        return None
+
+    def sample(self) -> tuple[float, float]:
+        return 0.0, 0.0
+
+
+def _scheduler(budget: AdmissionBudget, clock: _Clock | None = None) -> AdmissionScheduler:
+    return AdmissionScheduler(budget, usage_sampler=_IdleSampler(), clock=clock or _Clock())
+
+
+def _estimate(memory: float, cpu: float = 0.5, *, llm: int = 0, images: int = 0) -> ResourceEstimate:
+    return ResourceEstimate(memory_mb=memory, cpu_cores=cpu, llm_slots=llm, image_slots=images)
+
+
+def _build_request(*, end_sentence: int | None, tracks: int = 1, audio: bool = False) -> PipelineRequest:
+    return PipelineRequest(
+        config={"auto_metadata": False},
+        context=None,
+        environment_overrides={},
+        pipeline_overrides={},
+        inputs=PipelineInput(
+            input_file="book.epub",
+            base_output_file="output",
+            input_language="en",
+            target_languages=["fr", "de"][:tracks],
+            sentences_per_output_file=10,
+            start_sentence=1,
+            end_sentence=end_sentence,
+            stitch_full=audio,
+            generate_audio=audio,
+            audio_mode="none",
+            written_mode="text",
+            selected_voice="",
+            output_html=False,
+            output_pdf=False,
+            add_images=False,
+            include_transliteration=False,
+            tempo=1.0,
+        ),
+    )
+
+
+def _job(job_type: str, **kwargs) -> PipelineJob:
+    return PipelineJob(
+        job_id=job_type,
+        job_type=job_type,
+        status=PipelineJobStatus.PENDING,
+        created_at=datetime.now(timezone.utc),
+        **kwargs,
+    )
+
+
+def test_estimates_scale_with_sentences_tracks_and_media() -> None:
+    small = _job("pipeline", request=_build_request(end_sentence=100))
+    large = _job("book", request=_build_request(end_sentence=20000, tracks=2, audio=True))
+    dub = _job("youtube_dub", request_payload={"start_time_offset": 0, "end_time_offset": 3600})
+    subtitle = _job("subtitle", request_payload={"options": {}})
+
+    small_estimate = estimate_job_resources(small)
+    large_estimate = estimate_job_resources(large)
+    assert small_estimate.basis["sentences"] == 100
+    assert large_estimate.basis == {
+        "sentences": 20000,
+        "sentence_source": "range",
+        "tracks": 2,
+        "audio": True,
+        "images": False,
+    }
+    assert large_estimate.memory_mb > 10 * small_estimate.memory_mb
+    assert large_estimate.cpu_cores > small_estimate.cpu_cores
+    assert estimate_job_resources(dub).basis["video_seconds"] == 3600
+    assert estimate_job_resources(subtitle).memory_mb < small_estimate.memory_mb
+
+
+def test_jobs_wait_for_memory_and_small_jobs_backfill() -> None:
+    scheduler = _scheduler(AdmissionBudget(memory_mb=1000, cpu_cores=4))
+
+    first, admitted = scheduler.submit("book-1", _estimate(600))
+    assert first.admitted and [item.job_id for item in admitted] == ["book-1"]
+    second, admitted = scheduler.submit("book-2", _estimate(600))
+    assert (second.decision, second.reason, second.position) == ("queued", "memory", 1)
+    assert admitted == []
+    # A small subtitle job is not stuck behind the blocked book.
+    small, _ = scheduler.submit("subtitle", _estimate(100))
+    assert (small.decision, small.reason) == ("admitted", "backfill")
+
+    assert scheduler.release("subtitle") == []
+    released = scheduler.release("book-1")
+    assert [item.job_id for item in released] == ["book-2"]
+    assert scheduler.snapshot()["reserved"]["memory_mb"] == 600
+
+
+def test_resume_during_unwind_keeps_the_reservation_until_both_runs_release() -> None:
+    scheduler = _scheduler(AdmissionBudget(memory_mb=1000, cpu_cores=4))
+
+    scheduler.submit("book-1", _estimate(600))
+    resumed, admitted = scheduler.submit("book-1", _estimate(600))
+    assert (resumed.decision, resumed.reason) == ("admitted", "already_running")
+    assert [item.job_id for item in admitted] == ["book-1"]
+    waiting, _ = scheduler.submit("book-2", _estimate(600))
+    assert waiting.decision == "queued"
+
+    # The first run finishes unwinding while the resumed run is executing.
+    assert scheduler.release("book-1") == []
+    assert scheduler.snapshot()["reserved"]["memory_mb"] == 600
+    assert [item.job_id for item in scheduler.release("book-1")] == ["book-2"]
+    assert scheduler.release("book-1") == []
+
+
+def test_oversized_job_runs_alone_and_backend_slots_are_budgeted() -> None:
+    scheduler = _scheduler(AdmissionBudget(memory_mb=500, cpu_cores=4, llm_slots=1, image_slots=1))
+
+    huge, _ = scheduler.submit("huge", _estimate(5000, llm=1))
+    assert (huge.decision, huge.reason) == ("admitted", "exceeds_budget_idle")
+    blocked, _ = scheduler.submit("translate", _estimate(10, llm=1))
+    assert blocked.reason in {"memory", "llm_slots"}
+
+    released = scheduler.release("huge")
+    assert [item.job_id for item in released] == ["translate"]
+    images, _ = scheduler.submit("images", _estimate(10, images=1))
+    assert images.admitted
+    second_images, _ = scheduler.submit("images-2", _estimate(10, images=1))
+    assert (second_images.decision, second_images.reason) == ("queued", "image_slots")
+
+
+def test_priority_fairness_and_starvation_protection() -> None:
+    clock = _Clock()
+    scheduler = _scheduler(
+        AdmissionBudget(memory_mb=1200, starvation_seconds=100, aging_seconds=1000),
+        clock,
+    )
+    for job_id, user_id in (("alice-1", "alice"), ("alice-2", "alice"), ("carol-1", "carol")):
+        assert scheduler.submit(job_id, _estimate(400), user_id=user_id)[0].admitted
+    scheduler.submit("alice-3", _estimate(400), user_id="alice")
+    scheduler.submit("bob-1", _estimate(400), user_id="bob")
+    scheduler.submit("urgent", _estimate(400), user_id="dave", priority=5)
+    # Priority first, then the user with fewer running jobs, then arrival.
+    assert [item.job_id for item in scheduler.queued_decisions()] == ["urgent", "bob-1", "alice-3"]
+
+    assert [item.job_id for item in scheduler.release("carol-1")] == ["urgent"]
+    assert [item.job_id for item in scheduler.release("alice-1")] == ["bob-1"]
+
+    scheduler.submit("big", _estimate(900), user_id="erin", priority=10)
+    backfilled = scheduler.release("urgent")
+    assert [(item.job_id, item.reason) for item in backfilled] == [("alice-3", "backfill")]
+
+    clock.now = 150.0
+    # "big" has now starved, so freed capacity is held for it.
+    assert scheduler.release("bob-1") == []
+    tiny, _ = scheduler.submit("tiny", _estimate(100))
+    assert (tiny.decision, tiny.reason) == ("queued", "priority")
+    assert scheduler.release("alice-2") == []
+    released = scheduler.release("alice-3")
+    assert [item.job_id for item in released] == ["big", "tiny"]
+    assert released[0].waited_seconds == 150.0
+
+
+def test_manager_queues_jobs_over_budget_and_reports_decisions(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(manager_module, "ThreadPoolExecutor", DummyExecutor)
+    store = InMemoryJobStore()
+    manager = PipelineJobManager(
+        max_workers=2,
+        store=store,
+        worker_pool_factory=lambda _: DummyWorkerPool(),
+        file_locator=FileLocator(storage_dir=tmp_path),
+        admission_budget=AdmissionBudget(memory_mb=1500, cpu_cores=8),
+    )
+    try:
+        executor = manager._executor
+        owner = {"user_id": "alice", "user_role": "editor"}
+        first = manager.submit(_build_request(end_sentence=20000, tracks=2, audio=True), **owner)
+        second = manager.submit(_build_request(end_sentence=20000, tracks=2, audio=True), **owner)
+        assert [args[0] for _, args, _ in executor.submitted] == [first.job_id]
+
+        queued = store.get(second.job_id).tuning_summary["admission"]
+        assert queued["decision"] == "queued"
+        assert queued["reason"] == "memory"
+        assert queued["estimate"]["basis"]["sentences"] == 20000
+        assert manager.admission_snapshot()["waiting"] == [second.job_id]
+
+        manager.cancel_job(first.job_id, **owner)
+        fn, args, _ = executor.submitted[0]
+        fn(*args)
+        assert [args[0] for _, args, _ in executor.submitted] == [first.job_id, second.job_id]
+        admitted = store.get(second.job_id).tuning_summary["admission"]
+        assert admitted["decision"] == "admitted"
+        assert manager.admission_snapshot()["running"] == [second.job_id]
+    finally:
+        manager._executor.shutdown()
@@ -0,0 +1,264 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+import modules.services.pipeline_service as pipeline_service
+from modules.services.job_manager import (
+    DistributedJobWorker,
+    InMemoryJobStore,
+    PipelineExecutionAdapter,
+    PipelineJobManager,
+    PipelineJobStatus,
+    SqliteJobQueue,
+    build_job_queue,
+)
+from modules.services.job_manager import job_queue as job_queue_module
+
+from .conftest import DummyWorkerPool
+
+pytestmark = pytest.mark.services
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+
+
+def _build_request() -> pipeline_service.PipelineRequest:
+    return pipeline_service.PipelineRequest(
+        config={"auto_metadata": False},
+        context=None,
+        environment_overrides={},
+        pipeline_overrides={},
+        inputs=pipeline_service.PipelineInput(
+            input_file="book.epub",
+            base_output_file="output",
+            input_language="en",
+            target_languages=["fr"],
+            sentences_per_output_file=10,
+            start_sentence=1,
+            end_sentence=None,
+            stitch_full=False,
+            generate_audio=False,
+            audio_mode="none",
+            written_mode="text",
+            selected_voice="",
+            output_html=False,
+            output_pdf=False,
+            add_images=False,
+            include_transliteration=False,
+            tempo=1.0,
+        ),
+    )
+
+
+class _BlockingRunner:
+    """Pipeline runner that blocks until the job's stop event is set."""
+
+    def __init__(self, *, block: bool) -> None:
+        self.block = block
+        self.started = threading.Event()
+        self.requests: list[pipeline_service.PipelineRequest] = []
+
+    def __call__(self, request: pipeline_service.PipelineRequest) -> pipeline_service.PipelineResponse:
+        self.requests.append(request)
+        self.started.set()
+        if self.block:
+            request.stop_event.wait(10)
+        return pipeline_service.PipelineResponse(success=True, generated_files={"chunks": []})
+
+
+@pytest.fixture(params=["sqlite", "redis"])
+def queue_backend(request, tmp_path, monkeypatch):
+    if request.param == "sqlite":
+        queue = SqliteJobQueue(tmp_path / "queue.db")
+    else:
+        fakeredis = pytest.importorskip("fakeredis")
+        pytest.importorskip("lupa")
+        monkeypatch.setattr(job_queue_module, "redis", SimpleNamespace(Redis=fakeredis.FakeRedis))
+        queue = job_queue_module.RedisJobQueue("redis://localhost:6379/0")
+    yield queue
+    queue.close()
+
+
+def _manager(store, queue, runner) -> PipelineJobManager:
+    return PipelineJobManager(
+        max_workers=1,
+        store=store,
+        job_queue=queue,
+        worker_pool_factory=lambda _: DummyWorkerPool(),
+        execution_adapter=PipelineExecutionAdapter(runner),
+        enable_backpressure=False,
+    )
+
+
+def test_sqlite_queue_leases_expire_and_are_reclaimed(tmp_path):
+    queue = build_job_queue(f"sqlite:///{tmp_path / 'queue.db'}")
+    assert isinstance(queue, SqliteJobQueue)
+    queue.enqueue("low")
+    queue.enqueue("high", priority=5)
+    queue.enqueue("low")
+    assert queue.depth() == 2
+
+    short = queue.claim("w1", lease_seconds=0.2)
+    assert (short.job_id, short.attempts, short.reclaimed) == ("high", 1, False)
+    held = queue.claim("w2", lease_seconds=30)
+    assert held.job_id == "low"
+    assert queue.claim("w3") is None
+    assert queue.renew(held, lease_seconds=30) is not None
+
+    time.sleep(0.3)
+    reclaimed = queue.claim("w3", lease_seconds=30)
+    assert (reclaimed.job_id, reclaimed.attempts, reclaimed.reclaimed) == ("high", 2, True)
+    # The expired holder can no longer touch the job.
+    assert queue.renew(short) is None
+    assert queue.complete(short) is False
+
+    queue.request_stop("high", "cancelled")
+    assert queue.stop_request("high") == "cancelled"
+    assert queue.release(reclaimed) is True
+    assert queue.stop_request("high") is None
+    again = queue.claim("w4")
+    assert (again.job_id, again.attempts) == ("high", 3)
+    assert queue.complete(again) is True
+    assert queue.depth() == 1
+
+
+def test_sqlite_queue_hands_each_job_to_exactly_one_process(tmp_path):
+    db_path = tmp_path / "queue.db"
+    queue = SqliteJobQueue(db_path)
+    job_ids = [f"job-{index:03d}" for index in range(60)]
+    for job_id in job_ids:
+        queue.enqueue(job_id)
+
+    script = (
+        "import json, sys\n"
+        "from modules.services.job_manager.job_queue import SqliteJobQueue\n"
+        "queue = SqliteJobQueue(sys.argv[1])\n"
+        "claimed = []\n"
+        "while True:\n"
+        "    lease = queue.claim(sys.argv[2], lease_seconds=30)\n"
+        "    if lease is None:\n"
+        "        break\n"
+        "    claimed.append(lease.job_id)\n"
+        "    assert queue.complete(lease)\n"
+        "print(json.dumps(claimed))\n"
+    )
+    env = dict(os.environ, PYTHONPATH=str(REPO_ROOT))
+    processes = [
+        subprocess.Popen(
+            [sys.executable, "-c", script, str(db_path), f"worker-{index}"],
+            stdout=subprocess.PIPE,
+            cwd=REPO_ROOT,
+            env=env,
+            text=True,
+        )
+        for index in range(4)
+    ]
+    claimed: list[str] = []
+    for process in processes:
+        output, _ = process.communicate(timeout=60)
+        assert process.returncode == 0
+        claimed.extend(json.loads(output.strip().splitlines()[-1]))
+
+    assert sorted(claimed) == job_ids
+    assert queue.depth() == 0
+
+
+def test_worker_runs_queued_jobs_and_applies_remote_cancellation(tmp_path):
+    store = InMemoryJobStore()
+    queue = SqliteJobQueue(tmp_path / "queue.db")
+    api_runner = _BlockingRunner(block=False)
+    api = _manager(store, queue, api_runner)
+    worker_runner = _BlockingRunner(block=True)
+    worker_manager = _manager(store, queue, worker_runner)
+    worker = DistributedJobWorker(
+        worker_manager, queue, worker_id="w1", lease_seconds=1.0, stop_poll_interval=0.05
+    )
+    try:
+        job = api.submit(_build_request(), user_id="alice", user_role="editor")
+        assert queue.depth() == 1
+        assert api.get(job.job_id, user_id="alice").status == PipelineJobStatus.PENDING
+
+        thread = threading.Thread(target=worker.run_once)
+        thread.start()
+        assert worker_runner.started.wait(5)
+        assert api.get(job.job_id, user_id="alice").status == PipelineJobStatus.RUNNING
+
+        api.cancel_job(job.job_id, user_id="alice", user_role="editor")
+        thread.join(5)
+        assert not thread.is_alive()
+        assert store.get(job.job_id).status == PipelineJobStatus.CANCELLED
+        assert queue.depth() == 0
+        assert not api_runner.requests
+
+        worker_runner.block = False
+        finished = api.submit(_build_request())
+        assert worker.run_once() == finished.job_id
+        stored = store.get(finished.job_id)
+        assert stored.status == PipelineJobStatus.COMPLETED
+        assert stored.result["success"] is True
+        assert worker.run_once() is None
+    finally:
+        api.shutdown()
+        worker_manager.shutdown()
+
+
+def test_expired_lease_fails_over_to_another_worker(tmp_path):
+    store = InMemoryJobStore()
+    queue = SqliteJobQueue(tmp_path / "queue.db")
+    runner = _BlockingRunner(block=False)
+    api = _manager(store, queue, runner)
+    worker_manager = _manager(store, queue, runner)
+    try:
+        job = api.submit(_build_request())
+        # A worker claims the job, marks it running and then dies.
+        assert queue.claim("dead-worker", lease_seconds=0.1) is not None
+        running = store.get(job.job_id)
+        running.status = PipelineJobStatus.RUNNING
+        store.update(running)
+        time.sleep(0.2)
+
+        worker = DistributedJobWorker(worker_manager, queue, worker_id="w2", lease_seconds=5)
+        assert worker.run_once() == job.job_id
+        assert store.get(job.job_id).status == PipelineJobStatus.COMPLETED
+        assert runner.requests[-1].job_id == job.job_id
+
+        exhausted = api.submit(_build_request())
+        for _ in range(3):
+            time.sleep(0.02)
+            lease = queue.claim("crashing-worker", lease_seconds=0.01)
+            assert lease.job_id == exhausted.job_id
+        time.sleep(0.02)
+        assert worker.run_once() == exhausted.job_id
+        failed = store.get(exhausted.job_id)
+        assert failed.status == PipelineJobStatus.FAILED
+        assert "3 interrupted execution attempts" in failed.error_message
+        assert queue.depth() == 0
+    finally:
+        api.shutdown()
+        worker_manager.shutdown()
+
+
+def test_resume_clears_a_stop_request_left_on_a_pending_job(queue_backend):
+    queue_backend.enqueue("job-1")
+    # Paused before any worker claimed it, then resumed.
+    queue_backend.request_stop("job-1", "paused")
+    queue_backend.enqueue("job-1")
+    assert queue_backend.stop_request("job-1") is None
+    assert queue_backend.depth() == 1
+
+    lease = queue_backend.claim("w1")
+    assert (lease.job_id, lease.attempts) == ("job-1", 1)
+    # A stop request for a leased job survives a duplicate enqueue.
+    queue_backend.request_stop("job-1", "cancelled")
+    queue_backend.enqueue("job-1")
+    assert queue_backend.stop_request("job-1") == "cancelled"
+    assert queue_backend.complete(lease) is True
+    assert queue_backend.depth() == 0
@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from modules import chunk_index
+from modules.metadata_manager import MetadataLoader
+from modules.services.file_locator import FileLocator
+from modules.services.job_manager.chunk_persistence import write_chunk_metadata
+from modules.webapi.routes.media import timing as timing_routes
+
+
+def _sentence(policy: str | None = None, source: str | None = None) -> dict[str, Any]:
+    entry: dict[str, Any] = {"original": {"text": "Bonjour"}, "translation": {"text": "Hello"}}
+    summary = {key: value for key, value in (("policy", policy), ("source", source)) if value}
+    if summary:
+        entry["highlighting_summary"] = summary
+    return entry
+
+
+def _chunk(index: int, *, policy: str | None = "forced", timing: bool = True) -> dict[str, Any]:
+    start = index * 2 + 1
+    chunk: dict[str, Any] = {
+        "chunk_id": f"chunk-{index}",
+        "range_fragment": f"{start:05d}-{start + 1:05d}",
+        "start_sentence": start,
+        "end_sentence": start + 1,
+        "sentences": [_sentence(policy, "aligner"), _sentence()],
+        "audioTracks": {"translation": {"path": f"media/{index}.mp3", "duration": 2.5}},
+    }
+    if timing:
+        chunk["timingTracks"] = {
+            "translation": [
+                {"sentenceIdx": 0, "start": 0.0, "end": 1.2},
+                {"sentenceIdx": 1, "start": 1.2, "end": 2.4},
+            ]
+        }
+    return chunk
+
+
+def _write_job(tmp_path: Path, chunks: list[dict[str, Any]]) -> tuple[Path, dict[str, Any]]:
+    locator = FileLocator(storage_dir=tmp_path)
+    job_root = locator.resolve_path("job-index")
+    metadata_root = job_root / "metadata"
+    metadata_root.mkdir(parents=True)
+    generated = write_chunk_metadata("job-index", metadata_root, {"chunks": chunks}, locator)
+    (metadata_root / "job.json").write_text(
+        json.dumps({"generated_files": generated}), encoding="utf-8"
+    )
+    return job_root, generated
+
+
+def test_write_chunk_metadata_records_chunk_summaries(tmp_path: Path) -> None:
+    job_root, _ = _write_job(tmp_path, [_chunk(0), _chunk(1, policy="estimated_char")])
+    metadata_root = job_root / "metadata"
+
+    index = json.loads((metadata_root / chunk_index.CHUNK_INDEX_FILENAME).read_text())
+
+    assert index["version"] == chunk_index.CHUNK_INDEX_VERSION
+    assert list(index["chunks"]) == ["chunk_0000.json", "chunk_0001.json"]
+    first = index["chunks"]["chunk_0000.json"]
+    raw = (metadata_root / "chunk_0000.json").read_bytes()
+    stat_result = (metadata_root / "chunk_0000.json").stat()
+    assert first["sha256"] == hashlib.sha256(raw).hexdigest()
+    assert (first["size"], first["mtime_ns"]) == (stat_result.st_size, stat_result.st_mtime_ns)
+    assert (first["start_sentence"], first["end_sentence"], first["sentence_count"]) == (1, 2, 2)
+    assert first["durations"] == {"translation": 2.5}
+    assert first["timingTracks"] == {"translation": {"tokens": 2, "duration": 2.4}}
+    assert (first["highlighting_policy"], first["estimated_policy"]) == ("forced", None)
+    assert first["timing_source"] == "aligner"
+    assert index["chunks"]["chunk_0001.json"]["estimated_policy"] == "estimated_char"
+
+
+def test_refresh_reuses_unchanged_entries_and_drops_removed_files(tmp_path: Path) -> None:
+    job_root, _ = _write_job(tmp_path, [_chunk(0), _chunk(1)])
+    metadata_root = job_root / "metadata"
+    index = chunk_index.load_chunk_index(metadata_root)
+    assert index is not None
+    # A marker on a reused entry survives; rewritten files are read again.
+    index["chunks"]["chunk_0000.json"]["marker"] = True
+    index["chunks"]["chunk_0001.json"]["marker"] = True
+    chunk_index.write_chunk_index(metadata_root, index)
+
+    refreshed = chunk_index.refresh_chunk_index(metadata_root, refresh={"chunk_0001.json"})
+    assert refreshed["chunks"]["chunk_0000.json"].get("marker") is True
+    assert "marker" not in refreshed["chunks"]["chunk_0001.json"]
+
+    (metadata_root / "chunk_0001.json").unlink()
+    assert list(chunk_index.refresh_chunk_index(metadata_root)["chunks"]) == ["chunk_0000.json"]
+
+
+@pytest.mark.parametrize(
+    ("chunk_policies", "default", "expected"),
+    [
+        (["forced", "estimated_char"], None, ("estimated_char", True)),
+        (["forced", "inferred"], None, ("forced", False)),
+        ([None, "inferred"], "aligned", ("aligned", False)),
+        ([None, None], "estimated", ("estimated", True)),
+    ],
+)
+def test_timing_policy_probe_answers_from_index(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    chunk_policies: list[str | None],
+    default: str | None,
+    expected: tuple[str | None, bool],
+) -> None:
+    chunks = [_chunk(i, policy=policy) for i, policy in enumerate(chunk_policies)]
+    job_root, _ = _write_job(tmp_path, chunks)
+    metadata_root = job_root / "metadata"
+    chunk_paths = sorted(metadata_root.glob("chunk_*.json"))
+    assert timing_routes._scan_highlighting_policy(chunk_paths, default) == expected
+
+    def _no_scan(*_args: Any) -> Any:
+        raise AssertionError("chunk files should not be scanned while the index is current")
+
+    monkeypatch.setattr(timing_routes, "_scan_highlighting_policy", _no_scan)
+    timing_routes._policy_cache.clear()
+    assert timing_routes._probe_highlighting_policy(metadata_root, default) == expected
+
+
+def test_timing_policy_probe_scans_when_index_is_stale(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    job_root, _ = _write_job(tmp_path, [_chunk(0), _chunk(1)])
+    metadata_root = job_root / "metadata"
+    chunk_path = metadata_root / "chunk_0001.json"
+    payload = json.loads(chunk_path.read_text())
+    payload["highlighting_policy"] = "estimated_uniform"
+    chunk_path.write_text(json.dumps(payload), encoding="utf-8")
+    timing_routes._policy_cache.clear()
+
+    assert timing_routes._probe_highlighting_policy(metadata_root, None) == (
+        "estimated_uniform",
+        True,
+    )
+
+
+def test_chunk_policy_summary_keeps_scan_order() -> None:
+    payload = {
+        "highlighting_policy": "forced",
+        "timingTracks": {"translation": [{"policy": " estimated_char "}]},
+        "sentences": [_sentence("estimated_punct")],
+    }
+
+    assert chunk_index.chunk_policy_summary(payload) == ("forced", "estimated_char")
+    assert chunk_index.chunk_policy_summary([_sentence("inferred")]) == ("inferred", None)
+    assert chunk_index.combine_policy_summaries([(None, None)], "  ") == (None, False)
+
+
+def test_metadata_loader_summaries_match_chunk_files(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    job_root, _ = _write_job(tmp_path, [_chunk(0), _chunk(1, timing=False)])
+    without_index = MetadataLoader(job_root)
+    monkeypatch.setattr(chunk_index, "load_chunk_index", lambda _root: None)
+    expected = without_index.load_chunks(include_sentences=False)
+    expected_manifest = without_index.build_chunk_manifest()
+    monkeypatch.undo()
+
+    loader = MetadataLoader(job_root)
+    reads: list[str] = []
+    original_read = loader._read_chunk_file
+
+    def _recording_read(path_value: str) -> Any:
+        reads.append(path_value)
+        return original_read(path_value)
+
+    monkeypatch.setattr(loader, "_read_chunk_file", _recording_read)
+
+    assert loader.load_chunks(include_sentences=False) == expected
+    # Only the chunk with timing tokens is opened.
+    assert reads == ["metadata/chunk_0000.json"]
+    reads.clear()
+    assert loader.build_chunk_manifest() == expected_manifest
+    summaries = loader.load_chunks(include_sentences=False, include_timing=False)
+    assert reads == []
+    assert [summary["audioTracks"] for summary in summaries] == [
+        summary["audioTracks"] for summary in expected
+    ]
+
+
+def test_metadata_loader_ignores_entries_for_changed_files(tmp_path: Path) -> None:
+    job_root, _ = _write_job(tmp_path, [_chunk(0, timing=False)])
+    chunk_path = job_root / "metadata" / "chunk_0000.json"
+    payload = json.loads(chunk_path.read_text())
+    payload["sentence_count"] = 7
+    payload["audioTracks"]["translation"]["duration"] = 9.0
+    chunk_path.write_text(json.dumps(payload), encoding="utf-8")
+    os.utime(chunk_path, ns=(1, 1))
+
+    loader = MetadataLoader(job_root)
+    chunk = next(loader.iter_chunks())
+    chunk.pop("sentence_count")
+
+    summary = loader.load_chunk(chunk, include_sentences=False)
+
+    assert summary["sentence_count"] == 7
+    assert summary["audioTracks"]["translation"]["duration"] == 9.0
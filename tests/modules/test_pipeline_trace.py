@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import json
+import threading
+from pathlib import Path
+
+from modules import pipeline_trace
+from modules.pipeline_trace import JobTraceRecorder, summarize_trace
+from modules.progress_tracker import ProgressTracker
+
+
+def _recorder(tmp_path: Path, **kwargs) -> JobTraceRecorder:
+    kwargs.setdefault("export_metrics", False)
+    return JobTraceRecorder.for_job("job-trace", tmp_path, **kwargs)
+
+
+def test_recorder_persists_spans_and_appends_runs_on_resume(tmp_path: Path) -> None:
+    recorder = _recorder(tmp_path)
+    recorder.record("translate", 10.0, 10.5, sentence_number=1)
+    recorder.close()
+
+    payload = json.loads((tmp_path / pipeline_trace.TRACE_FILENAME).read_text())
+    assert payload["job_id"] == "job-trace"
+    assert len(payload["spans"]) == 1
+    assert payload["spans"][0]["stage"] == "translate"
+    assert payload["runs"][0]["finished_at"] >= payload["runs"][0]["started_at"]
+
+    resumed = _recorder(tmp_path)
+    resumed.record("tts", 11.0, 11.25, sentence_number=2)
+    resumed.close()
+
+    payload = pipeline_trace.load_trace(tmp_path / pipeline_trace.TRACE_FILENAME)
+    assert payload is not None
+    assert [span["stage"] for span in payload["spans"]] == ["translate", "tts"]
+    assert len(payload["runs"]) == 2
+
+
+def test_recorder_bounds_span_count(tmp_path: Path) -> None:
+    recorder = _recorder(tmp_path, max_spans=3)
+    for index in range(5):
+        recorder.record("translate", float(index), float(index) + 0.1, sentence_number=index)
+
+    snapshot = recorder.snapshot()
+    assert [span["sentence"] for span in snapshot["spans"]] == [2, 3, 4]
+    assert snapshot["dropped_spans"] == 2
+
+
+def test_queue_marks_record_wait_spans(tmp_path: Path) -> None:
+    recorder = _recorder(tmp_path)
+    recorder.mark_enqueued("translation", 7)
+    wait = recorder.mark_dequeued("translation", 7, sentence_number=7)
+
+    assert wait is not None and wait >= 0.0
+    assert recorder.mark_dequeued("translation", 7) is None
+    (span,) = recorder.spans()
+    assert span.stage == "queue.translation"
+    assert span.sentence_number == 7
+
+
+def test_tracker_helpers_are_noops_without_recorder(tmp_path: Path) -> None:
+    tracker = ProgressTracker()
+    with pipeline_trace.trace_span(tracker, "tts", sentence_number=1) as attrs:
+        attrs["ignored"] = True
+    pipeline_trace.record_llm_usage(tracker, "translate", {"eval_count": 3}, elapsed=0.1)
+    assert pipeline_trace.get_recorder(tracker) is None
+
+    recorder = _recorder(tmp_path)
+    tracker.attach_trace_recorder(recorder)
+    with pipeline_trace.trace_span(tracker, "tts", sentence_number=1) as attrs:
+        attrs["backend"] = "piper"
+    pipeline_trace.record_llm_usage(
+        tracker,
+        "translate",
+        {"prompt_eval_count": 12, "eval_count": 4},
+        elapsed=0.2,
+        sentence_numbers=[1],
+    )
+
+    stages = [(span.stage, span.attributes) for span in recorder.spans()]
+    assert stages[0] == ("tts", {"backend": "piper"})
+    assert stages[1][0] == "llm.translate"
+    assert stages[1][1]["prompt_tokens"] == 12
+    assert stages[1][1]["completion_tokens"] == 4
+
+
+def test_recorder_is_thread_safe(tmp_path: Path) -> None:
+    recorder = _recorder(tmp_path, flush_interval=0.0)
+
+    def _worker(offset: int) -> None:
+        for index in range(200):
+            recorder.record("align", 0.0, 0.01, sentence_number=offset + index)
+
+    threads = [threading.Thread(target=_worker, args=(n * 1000,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(recorder.spans()) == 800
+
+
+def test_summarize_trace_reports_critical_path_and_tokens() -> None:
+    payload = {
+        "spans": [
+            {"stage": "translate", "start": 0.0, "duration": 1.0, "sentence": 1},
+            {"stage": "queue.translation", "start": 1.0, "duration": 0.5, "sentence": 1},
+            {"stage": "tts", "start": 1.5, "duration": 2.0, "sentence": 1},
+            {"stage": "translate", "start": 0.0, "duration": 1.0, "sentence": 2},
+            {"stage": "queue.translation", "start": 1.0, "duration": 3.0, "sentence": 2},
+            {"stage": "tts", "start": 4.0, "duration": 2.5, "sentence": 2},
+            {
+                "stage": "llm.translate",
+                "start": 0.0,
+                "duration": 1.0,
+                "attributes": {"prompt_tokens": 40, "completion_tokens": 10},
+            },
+        ],
+    }
+
+    summary = summarize_trace(payload)
+
+    assert summary["span_count"] == 7
+    assert summary["wall_seconds"] == 6.5
+    assert summary["stages"]["tts"]["count"] == 2
+    assert summary["queues"]["translation"]["max_seconds"] == 3.0
+    assert summary["llm_tokens"]["prompt"] == 40
+    assert summary["llm_tokens"]["by_stage"]["translate"]["completion"] == 10
+    assert summary["critical_path"]["sentence_number"] == 2
+    assert summary["bottleneck_stage"] == "queue.translation"
+
+
+def test_batch_spans_count_once_and_join_each_sentence_path(tmp_path: Path) -> None:
+    recorder = _recorder(tmp_path)
+    tracker = ProgressTracker()
+    tracker.attach_trace_recorder(recorder)
+    pipeline_trace.record_batch_span(
+        tracker, "translate", 0.0, 2.0, sentence_numbers=[1, 2, 3], attributes={"mode": "batch"}
+    )
+    pipeline_trace.record_batch_span(tracker, "translate", 2.0, 2.5, sentence_numbers=[])
+    recorder.record("tts", 2.0, 5.0, sentence_number=3)
+
+    (batch, _tts) = recorder.spans()
+    assert batch.sentence_number is None
+    assert batch.attributes == {"mode": "batch", "sentences": [1, 2, 3]}
+
+    summary = summarize_trace(recorder.snapshot())
+    assert summary["stages"]["translate"]["count"] == 1
+    assert summary["sentences"] == 3
+    assert summary["critical_path"]["sentence_number"] == 3
+    assert summary["critical_path"]["stage_totals"] == {"translate": 2.0, "tts": 3.0}
+
+
+def test_summarize_trace_handles_empty_payload() -> None:
+    summary = summarize_trace({})
+    assert summary["span_count"] == 0
+    assert summary["critical_path"] is None
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import sqlite3
+import time
+from pathlib import Path
+
+from modules.services.bookmark_service import BookmarkService
+from modules.services.file_locator import FileLocator
+from modules.services.playback_store import (
+    IndexedBookmarkService,
+    IndexedResumeService,
+    PlaybackStateStore,
+)
+from modules.services.resume_service import ResumeService
+
+
+def _store(tmp_path: Path, **kwargs) -> PlaybackStateStore:
+    kwargs.setdefault("flush_interval", 60.0)
+    return PlaybackStateStore(tmp_path / "playback" / "playback.sqlite3", legacy_root=tmp_path, **kwargs)
+
+
+def _stored_rows(store: PlaybackStateStore) -> list[tuple[str, str, float]]:
+    with sqlite3.connect(store.db_path) as conn:
+        return conn.execute(
+            "SELECT user_id, job_id, updated_at FROM resume_positions ORDER BY job_id"
+        ).fetchall()
+
+
+def test_rapid_resume_saves_are_coalesced_until_flush(tmp_path: Path) -> None:
+    store = _store(tmp_path)
+    service = IndexedResumeService(store=store)
+    for tick in range(50):
+        service.save("job-1", "alice", {"kind": "time", "position": tick, "updated_at": 1000.0 + tick})
+    service.save("job-2", "alice", {"kind": "sentence", "sentence": 7, "updated_at": 900.0})
+
+    assert _stored_rows(store) == []
+    assert service.get("job-1", "alice").position == 49.0
+    assert [entry.job_id for entry in service.list("alice")] == ["job-1", "job-2"]
+
+    assert service.flush() == 2
+    assert _stored_rows(store) == [("alice", "job-1", 1049.0), ("alice", "job-2", 900.0)]
+
+    service.save("job-2", "alice", {"kind": "sentence", "sentence": 9, "updated_at": 2000.0})
+    store.close()
+    reopened = IndexedResumeService(store=_store(tmp_path))
+    assert reopened.get("job-2", "alice").sentence == 9
+
+
+def test_pending_positions_flush_in_the_background(tmp_path: Path) -> None:
+    store = _store(tmp_path, flush_interval=0.05)
+    IndexedResumeService(store=store).save("job-1", "alice", {"kind": "time", "position": 3})
+    deadline = time.monotonic() + 5
+    while not _stored_rows(store) and time.monotonic() < deadline:
+        time.sleep(0.02)
+    assert [row[1] for row in _stored_rows(store)] == ["job-1"]
+    store.close()
+
+
+def test_list_is_served_from_the_index_with_filters_and_limit(tmp_path: Path) -> None:
+    store = _store(tmp_path)
+    service = IndexedResumeService(store=store)
+    for index in range(10):
+        service.save(f"job-{index}", "alice", {"kind": "time", "position": index, "updated_at": 100.0 + index})
+    service.save("job-x", "bob", {"kind": "time", "position": 1, "updated_at": 999.0})
+    service.flush()
+    # A pending save moves an old job to the top without being written yet.
+    service.save("job-0", "alice", {"kind": "time", "position": 5, "updated_at": 500.0})
+
+    assert [entry.job_id for entry in service.list("alice", limit=3)] == ["job-0", "job-9", "job-8"]
+    filtered = service.list("alice", job_ids=[" job-2 ", "job-0", "job-missing", "job-2"])
+    assert [entry.job_id for entry in filtered] == ["job-0", "job-2"]
+    assert service.list("alice", job_ids=["  "]) == []
+    assert [entry.job_id for entry in service.list("bob")] == ["job-x"]
+
+    assert service.clear("job-0", "alice") is True
+    assert service.clear("job-0", "alice") is False
+    assert service.get("job-0", "alice") is None
+    store.close()
+
+
+def test_legacy_json_state_is_imported_once(tmp_path: Path) -> None:
+    locator = FileLocator(storage_dir=tmp_path)
+    ResumeService(file_locator=locator).save(
+        "job-1", "alice", {"kind": "time", "position": 12.5, "updated_at": 50.0}
+    )
+    BookmarkService(file_locator=locator).add_bookmark(
+        "job-1", "alice", {"id": "bm-1", "label": "Intro", "kind": "time", "position": 4.0}
+    )
+
+    store = _store(tmp_path)
+    resume = IndexedResumeService(store=store, file_locator=locator)
+    bookmarks = IndexedBookmarkService(store=store, file_locator=locator)
+    assert resume.get("job-1", "alice").position == 12.5
+    assert [entry.id for entry in bookmarks.list_bookmarks("job-1", "alice")] == ["bm-1"]
+
+    assert resume.clear("job-1", "alice") is True
+    store.close()
+    # The legacy file is still on disk but is not imported a second time.
+    assert IndexedResumeService(store=_store(tmp_path)).get("job-1", "alice") is None
+
+
+def test_indexed_bookmarks_keep_file_service_semantics(tmp_path: Path) -> None:
+    store = _store(tmp_path)
+    service = IndexedBookmarkService(store=store, max_entries=2)
+    first = service.add_bookmark("job-1", "alice", {"kind": "time", "position": 10.0, "created_at": 1.0})
+    duplicate = service.add_bookmark("job-1", "alice", {"kind": "time", "position": 10.2, "created_at": 2.0})
+    assert duplicate.id == first.id
+    service.add_bookmark("job-1", "alice", {"kind": "sentence", "sentence": 3, "created_at": 3.0})
+    service.add_bookmark("job-1", "alice", {"kind": "sentence", "sentence": 4, "created_at": 4.0})
+
+    listed = service.list_bookmarks("job-1", "alice")
+    assert [entry.sentence for entry in listed] == [4, 3]
+    assert service.list_bookmarks("job-1", "bob") == []
+    assert service.remove_bookmark("job-1", "alice", listed[0].id) is True
+    store.close()
+
+    reopened = IndexedBookmarkService(store=_store(tmp_path))
+    assert [entry.sentence for entry in reopened.list_bookmarks("job-1", "alice")] == [3]
@@ -0,0 +1,312 @@
+"""Tests for streamed LLM batch responses and early hand-off to the media queue."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from queue import Queue
+from typing import Iterator, List
+from unittest.mock import MagicMock
+
+import pytest
+
+from modules import llm_batch, llm_client as llm_client_module
+from modules import pipeline_trace
+from modules import translation_batch as tb
+from modules import translation_engine as te
+from modules.llm_client import ClientSettings, LLMClient
+from modules.llm_endpoints import LLMSource, ResolvedEndpoint
+from modules.progress_tracker import ProgressTracker
+from modules.translation_logging import BatchStatsRecorder
+
+pytestmark = pytest.mark.translation
+
+_ITEMS = [
+    {"id": 0, "translation": "Bonjour {le} \"monde\"."},
+    {"id": 1, "translation": "Comment allez-vous aujourd'hui ?"},
+]
+
+
+class _FakeChatServer:
+    """Ollama-style chat endpoint that streams a JSON batch in slow chunks."""
+
+    def __init__(self, chunks: List[str], *, chunk_delay: float) -> None:
+        self.stream_flags: List[bool] = []
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self) -> None:  # noqa: N802 - http.server API
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                server.stream_flags.append(bool(body.get("stream")))
+                self.send_response(200)
+                self.send_header("Content-Type", "application/x-ndjson")
+                self.end_headers()
+                if not body.get("stream"):
+                    self.wfile.write(json.dumps({"message": {"content": "".join(chunks)}}).encode())
+                    return
+                for chunk in chunks:
+                    line = json.dumps({"message": {"content": chunk}, "done": False})
+                    self.wfile.write(line.encode() + b"\n")
+                    self.wfile.flush()
+                    time.sleep(chunk_delay)
+                self.wfile.write(json.dumps({"done": True, "eval_count": 42}).encode() + b"\n")
+
+            def log_message(self, *args) -> None:
+                return None
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self._server.server_address[1]}/api/chat"
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def _chunked(text: str, size: int) -> List[str]:
+    return [text[start : start + size] for start in range(0, len(text), size)]
+
+
+@pytest.fixture
+def chat_server(monkeypatch: pytest.MonkeyPatch) -> Iterator:
+    servers: List[_FakeChatServer] = []
+
+    def _start(*, supports_stream: bool, chunk_delay: float = 0.0) -> _FakeChatServer:
+        # First item complete in the first chunk, the rest after a delay.
+        first = json.dumps({"items": [_ITEMS[0]]}, ensure_ascii=False)[:-2] + ", "
+        rest = json.dumps(_ITEMS[1], ensure_ascii=False) + "]}"
+        server = _FakeChatServer([first, *_chunked(rest, 7)], chunk_delay=chunk_delay)
+        servers.append(server)
+        endpoint = ResolvedEndpoint(
+            source=LLMSource.LOCAL,
+            url=server.url,
+            headers={},
+            supports_stream=supports_stream,
+        )
+        monkeypatch.setattr(llm_client_module, "resolve_endpoints", lambda _settings: [endpoint])
+        return server
+
+    yield _start
+    for server in servers:
+        server.close()
+
+
+def test_item_parser_emits_objects_as_they_complete() -> None:
+    emitted: List[dict] = []
+    parser = llm_batch.JsonItemStreamParser(emitted.append)
+    text = (
+        "```json\n"
+        '{"notes": [{"id": 9}], "items": [\n'
+        '  {"id": 1, "translation": "a {b} \\" ] }", "extra": {"k": [1]}},\n'
+        '  {"id": 2, "translation": "c"}\n'
+        "]}\n```"
+    )
+    seen_after_first = None
+    for chunk in _chunked(text, 5):
+        parser.feed(chunk)
+        if emitted and seen_after_first is None:
+            seen_after_first = len(parser.text)
+
+    assert emitted == [
+        {"id": 1, "translation": 'a {b} " ] }', "extra": {"k": [1]}},
+        {"id": 2, "translation": "c"},
+    ]
+    assert seen_after_first is not None and seen_after_first < text.index('{"id": 2')
+    assert parser.items_emitted == 2
+
+    bare: List[dict] = []
+    bare_parser = llm_batch.JsonItemStreamParser(bare.append)
+    bare_parser.feed('[{"id": 3}, {"id"')
+    assert bare == [{"id": 3}]
+
+
+def test_streamed_batch_delivers_items_before_the_response_completes(chat_server) -> None:
+    server = chat_server(supports_stream=True, chunk_delay=0.05)
+    client = LLMClient(ClientSettings(model="test-model"))
+    arrivals: List[float] = []
+
+    response = llm_batch.request_json_batch(
+        client=client,
+        system_prompt="Translate.",
+        items=[{"id": 0, "text": "Hello"}, {"id": 1, "text": "How are you?"}],
+        timeout_seconds=10,
+        on_item=lambda _item: arrivals.append(time.perf_counter()),
+    )
+    finished = time.perf_counter()
+
+    assert server.stream_flags == [True]
+    assert response.error is None
+    assert response.payload == {"items": _ITEMS}
+    assert response.streamed_items == 2
+    assert response.token_usage.get("eval_count") == 42
+    assert response.first_item_elapsed is not None
+    assert response.first_item_elapsed < response.elapsed - 0.1
+    assert finished - arrivals[0] > 0.1
+
+
+def test_endpoints_without_streaming_fall_back_to_a_single_response(chat_server) -> None:
+    server = chat_server(supports_stream=False)
+    client = LLMClient(ClientSettings(model="test-model"))
+    emitted: List[dict] = []
+
+    response = llm_batch.request_json_batch(
+        client=client,
+        system_prompt="Translate.",
+        items=[{"id": 0, "text": "Hello"}, {"id": 1, "text": "How are you?"}],
+        timeout_seconds=10,
+        on_item=emitted.append,
+    )
+
+    assert server.stream_flags == [False]
+    assert response.payload == {"items": _ITEMS}
+    assert emitted == _ITEMS
+
+
+def test_streamed_items_are_validated_and_not_requested_again(monkeypatch) -> None:
+    sentences = {0: "Hello world.", 1: "How are you today?", 2: "See you tomorrow."}
+    translations = {0: "Bonjour le monde.", 1: "Comment allez-vous ?", 2: "À demain."}
+    calls: List[List[int]] = []
+
+    def fake_request(*, items, on_item=None, **_kwargs):
+        ids = [item["id"] for item in items]
+        calls.append(ids)
+        payload = []
+        for item_id in ids:
+            # Item 1 comes back as a placeholder on the first request only.
+            text = "..." if item_id == 1 and len(calls) == 1 else translations[item_id]
+            raw = {"id": item_id, "translation": text}
+            payload.append(raw)
+            if on_item is not None:
+                on_item(raw)
+        return llm_batch.JsonBatchResponse(
+            payload={"items": payload},
+            raw_text="",
+            error=None,
+            elapsed=0.2,
+            streamed_items=len(payload),
+            first_item_elapsed=0.05,
+        )
+
+    monkeypatch.setattr(tb.llm_batch, "request_json_batch", fake_request)
+    monkeypatch.setattr(tb, "write_llm_batch_artifact", lambda **_kwargs: None)
+    monkeypatch.setattr(tb.time, "sleep", lambda _seconds: None)
+    client = MagicMock()
+    client.model = "test-model"
+    client.llm_source = "local"
+    stats = BatchStatsRecorder(batch_size=3, progress_tracker=None, metadata_key="stats")
+    streamed: List[int] = []
+
+    result, error, _elapsed = tb.translate_llm_batch_items(
+        sorted(sentences.items()),
+        "english",
+        "french",
+        include_transliteration=False,
+        resolved_client=client,
+        progress_tracker=None,
+        timeout_seconds=30.0,
+        batch_stats=stats,
+        on_item=lambda item_id, _value: streamed.append(item_id),
+    )
+
+    assert error is None
+    assert calls == [[0, 1, 2], [1]]
+    assert streamed == [0, 2, 1]
+    assert {item_id: value[0] for item_id, value in result.items()} == translations
+    payload = stats._build_payload_locked()
+    assert payload["streamed_items"] == 3
+    assert payload["avg_first_item_seconds"] == 0.05
+
+
+def test_pipeline_enqueues_streamed_sentences_before_the_batch_finishes(monkeypatch) -> None:
+    release_batch = threading.Event()
+
+    def fake_batch(items, _input_language, _target, *, on_item=None, **_kwargs):
+        assert on_item is not None
+        on_item(0, ("Bonjour le monde.", ""))
+        assert release_batch.wait(5)
+        return {0: ("Bonjour le monde.", ""), 1: ("Comment allez-vous ?", "")}, None, 0.5
+
+    monkeypatch.setattr(te, "translate_llm_batch_items", fake_batch)
+    monkeypatch.setattr(te, "resolve_llm_batch_log_dir", lambda *_args: None)
+    monkeypatch.setattr(te.cfg, "get_translation_llm_batch_streaming", lambda: True)
+    client = MagicMock()
+    client.model = "test-model"
+    client.llm_source = "local"
+    client.debug_enabled = False
+    output: Queue = Queue()
+
+    thread = te.start_translation_pipeline(
+        ["Hello world.", "How are you?"],
+        "english",
+        ["french", "french"],
+        start_sentence=1,
+        output_queue=output,
+        consumer_count=1,
+        client=client,
+        translation_provider="llm",
+        llm_batch_size=2,
+    )
+    first = output.get(timeout=5)
+    assert not release_batch.is_set()
+    release_batch.set()
+    thread.join(5)
+    rest = []
+    while (task := output.get(timeout=5)) is not None:
+        rest.append(task)
+
+    assert (first.index, first.translation) == (0, "Bonjour le monde.")
+    assert [(task.index, task.translation) for task in rest] == [(1, "Comment allez-vous ?")]
+
+
+def test_batch_translate_spans_cover_the_batch_window_once(monkeypatch, tmp_path) -> None:
+    def fake_request(*, items, on_item=None, **_kwargs):
+        payload = [{"id": item["id"], "translation": f"Phrase {item['id']}."} for item in items]
+        if on_item is not None:
+            on_item(payload[0])
+        return llm_batch.JsonBatchResponse(
+            payload={"items": payload}, raw_text="", error=None, elapsed=0.2
+        )
+
+    monkeypatch.setattr(tb.llm_batch, "request_json_batch", fake_request)
+    monkeypatch.setattr(tb, "write_llm_batch_artifact", lambda **_kwargs: None)
+    monkeypatch.setattr(te, "resolve_llm_batch_log_dir", lambda *_args: None)
+    monkeypatch.setattr(te.cfg, "get_translation_llm_batch_streaming", lambda: True)
+    recorder = pipeline_trace.JobTraceRecorder.for_job("job", tmp_path, export_metrics=False)
+    tracker = ProgressTracker()
+    tracker.attach_trace_recorder(recorder)
+    client = MagicMock()
+    client.model = "test-model"
+    client.llm_source = "local"
+    client.debug_enabled = False
+    output: Queue = Queue()
+
+    thread = te.start_translation_pipeline(
+        ["Hello world.", "How are you?", "See you soon."],
+        "english",
+        ["french"] * 3,
+        start_sentence=11,
+        output_queue=output,
+        consumer_count=1,
+        client=client,
+        translation_provider="llm",
+        llm_batch_size=3,
+        progress_tracker=tracker,
+    )
+    thread.join(5)
+    while output.get(timeout=5) is not None:
+        pass
+
+    spans = recorder.spans()
+    translate = sorted(
+        (span for span in spans if span.stage == "translate"), key=lambda span: span.start
+    )
+    assert [span.sentence_number for span in translate] == [11, None]
+    assert translate[0].attributes["streamed"] is True
+    assert translate[1].attributes["sentences"] == [12, 13]
+    # ``end`` is rebuilt as start + duration, so allow for float rounding.
+    assert translate[0].end <= translate[1].start + 1e-6
+    (llm_span,) = [span for span in spans if span.stage == "llm.translate"]
+    assert (llm_span.attributes["first_sentence"], llm_span.attributes["last_sentence"]) == (11, 13)
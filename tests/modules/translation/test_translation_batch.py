@@ -507,3 +507,124 @@ class TestResolveBatchTransliterations:
 
         assert result == {0: "marhaba"}
         mock_transliterator.transliterate.assert_called_once()
+
+
+class TestAdaptiveBatchRetries:
+    """Partial-response salvage, bisection and adaptive group sizes."""
+
+    _SENTENCES = {
+        0: "Good morning to you",
+        1: "The weather is lovely",
+        2: "Where is the station",
+        3: "I would like some tea",
+    }
+    _TRANSLATIONS = {
+        0: "Bonjour à vous tous",
+        1: "Le temps est magnifique",
+        2: "Où se trouve la gare",
+        3: "Je voudrais du thé chaud",
+    }
+
+    def _run(self, monkeypatch, respond, **kwargs):
+        from modules import llm_batch
+
+        calls = []
+
+        def fake_request(*, items, **_kwargs):
+            ids = [item["id"] for item in items]
+            calls.append(ids)
+            payload, error = respond(ids)
+            return llm_batch.JsonBatchResponse(
+                payload=payload,
+                raw_text="",
+                error=error,
+                elapsed=0.1,
+                token_usage={"eval_count": 20 * len(ids)},
+            )
+
+        monkeypatch.setattr(tb.llm_batch, "request_json_batch", fake_request)
+        monkeypatch.setattr(tb, "write_llm_batch_artifact", lambda **_kwargs: None)
+        monkeypatch.setattr(tb.time, "sleep", lambda _seconds: None)
+        client = MagicMock()
+        client.model = "test-model"
+        client.llm_source = "local"
+        result, error, _elapsed = tb.translate_llm_batch_items(
+            sorted(self._SENTENCES.items()),
+            "english",
+            "french",
+            include_transliteration=False,
+            resolved_client=client,
+            progress_tracker=None,
+            timeout_seconds=30.0,
+            **kwargs,
+        )
+        return result, error, calls
+
+    def _items(self, ids, *, invalid=()):
+        return {
+            "items": [
+                {"id": item_id, "translation": "..." if item_id in invalid else self._TRANSLATIONS[item_id]}
+                for item_id in ids
+            ]
+        }
+
+    def test_partial_response_only_rerequests_missing_and_invalid_ids(self, monkeypatch):
+        responses = iter([self._items([0, 1, 3], invalid=(1,)), self._items([1, 2])])
+        result, error, calls = self._run(monkeypatch, lambda _ids: (next(responses), None))
+
+        assert error is None
+        assert calls == [[0, 1, 2, 3], [1, 2]]
+        assert {item_id: value[0] for item_id, value in result.items()} == self._TRANSLATIONS
+
+    def test_failing_batches_are_bisected_to_isolate_the_bad_sentence(self, monkeypatch):
+        from modules.translation_logging import BatchStatsRecorder
+
+        def respond(ids):
+            if 2 in ids:
+                return None, "Invalid JSON response"
+            return self._items(ids), None
+
+        stats = BatchStatsRecorder(batch_size=4, progress_tracker=None, metadata_key="stats")
+        result, error, calls = self._run(monkeypatch, respond, batch_stats=stats)
+
+        assert error is None
+        assert sorted(result) == [0, 1, 3]
+        assert calls == [
+            [0, 1, 2, 3],
+            [0, 1, 2, 3],
+            [0, 1],
+            [2, 3],
+            [2, 3],
+            [2],
+            [2],
+            [3],
+        ]
+        payload = stats._build_payload_locked()
+        assert payload["bisections"] == 2
+        assert payload["batch_requests"] == len(calls)
+
+    def test_transport_errors_retry_without_bisecting(self, monkeypatch):
+        result, error, calls = self._run(monkeypatch, lambda _ids: (None, "Connection refused"))
+
+        assert result == {}
+        assert error == "Connection refused"
+        assert calls == [[0, 1, 2, 3]] * tb._TRANSLATION_RESPONSE_ATTEMPTS
+
+    def test_batches_are_split_into_tuned_group_sizes(self, monkeypatch):
+        from modules.translation_batch_sizing import AdaptiveBatchSizer, make_batch_size_key
+
+        sizer = AdaptiveBatchSizer()
+        client = MagicMock(model="test-model", llm_source="local")
+        key = make_batch_size_key(client, "english", "french")
+        sizer.batch_size_for(key, 4)
+        sizer.observe(key, item_count=4, failed_items=4, elapsed_seconds=1.0)
+
+        result, _error, calls = self._run(
+            monkeypatch,
+            lambda ids: (self._items(ids), None),
+            batch_size=4,
+            batch_sizer=sizer,
+        )
+
+        assert calls == [[0, 1], [2, 3]]
+        assert sorted(result) == [0, 1, 2, 3]
@@ -0,0 +1,80 @@
+"""Unit tests for adaptive LLM batch sizing."""
+
+import pytest
+
+from modules.translation_batch_sizing import (
+    AdaptiveBatchSizer,
+    completion_token_count,
+    make_batch_size_key,
+)
+
+pytestmark = pytest.mark.translation
+
+_KEY = ("local", "model-a", "english", "french")
+
+
+def test_batch_size_starts_at_configured_value_per_key():
+    sizer = AdaptiveBatchSizer()
+    assert sizer.batch_size_for(_KEY, 10) == 10
+    assert sizer.batch_size_for(("local", "model-b", "english", "french"), 6) == 6
+
+
+def test_failures_and_slow_batches_halve_the_size():
+    sizer = AdaptiveBatchSizer()
+    sizer.batch_size_for(_KEY, 16)
+
+    assert sizer.observe(_KEY, item_count=16, failed_items=8, elapsed_seconds=5.0) == 8
+    # A bisected retry smaller than the current size does not shrink further.
+    assert sizer.observe(_KEY, item_count=2, failed_items=2, elapsed_seconds=1.0) == 8
+    assert sizer.observe(
+        _KEY, item_count=8, failed_items=0, elapsed_seconds=55.0, timeout_seconds=60.0
+    ) == 4
+
+
+def test_clean_fast_batches_grow_back_to_the_configured_ceiling():
+    sizer = AdaptiveBatchSizer()
+    sizer.batch_size_for(_KEY, 6)
+    sizer.observe(_KEY, item_count=6, failed_items=6, elapsed_seconds=1.0)
+    assert sizer.batch_size_for(_KEY, 6) == 3
+
+    size = 3
+    for _ in range(20):
+        size = sizer.observe(
+            _KEY, item_count=size, failed_items=0, elapsed_seconds=0.5 * size, timeout_seconds=60.0
+        )
+    assert size == 6
+
+
+def test_growth_stops_near_the_latency_and_token_budgets():
+    sizer = AdaptiveBatchSizer(max_output_tokens=1000)
+    sizer.batch_size_for(_KEY, 20)
+    sizer.observe(_KEY, item_count=20, failed_items=20, elapsed_seconds=1.0)
+    assert sizer.batch_size_for(_KEY, 20) == 10
+
+    # 100 tokens per item: 11 items would use more than 75% of 1000 tokens.
+    assert sizer.observe(
+        _KEY, item_count=10, failed_items=0, elapsed_seconds=1.0, completion_tokens=1000
+    ) == 10
+
+    slow_key = ("local", "model-b", "english", "french")
+    sizer.batch_size_for(slow_key, 20)
+    sizer.observe(slow_key, item_count=20, failed_items=20, elapsed_seconds=1.0)
+    # 2.5s per item: 11 items would take more than half of a 50s timeout.
+    assert sizer.observe(
+        slow_key, item_count=10, failed_items=0, elapsed_seconds=25.0, timeout_seconds=50.0
+    ) == 10
+
+    snapshot = sizer.snapshot()
+    assert snapshot["local/model-a/english/french"]["tokens_per_item"] == 100.0
+    assert snapshot["local/model-b/english/french"]["batch_size"] == 10
+
+
+def test_key_and_token_helpers():
+    class _Client:
+        llm_source = "cloud"
+        model = "gpt"
+
+    assert make_batch_size_key(_Client(), " English ", "FRENCH") == ("cloud", "gpt", "english", "french")
+    assert completion_token_count({"eval_count": 12}) == 12
+    assert completion_token_count({"completion_tokens": 7}) == 7
+    assert completion_token_count(None) == 0
@@ -0,0 +1,175 @@
+"""Equivalence tests for the precompiled translation validation profiles."""
+
+from __future__ import annotations
+
+import pytest
+
+from modules import translation_batch as tb
+from modules import translation_validation as tv
+from modules.translation_validation_profiles import (
+    BatchValidator,
+    TextStats,
+    validate_translation_batch,
+    validation_profile,
+)
+
+pytestmark = pytest.mark.translation
+
+_ORIGINALS = [
+    "",
+    "Hello",
+    "The quick brown fox jumps over the lazy dog near the river bank.",
+    "She said that the meeting would be postponed until the end of next week because of the storm, "
+    "and everyone agreed that it was the wisest decision.",
+    "Привет, как дела у тебя сегодня?",
+    "Это очень длинное предложение, которое нужно перевести на другой язык без потерь смысла.",
+    "One. Two. Three. Four. Five. Six. Seven. Eight. Nine. Ten. Eleven. Twelve. Thirteen.",
+]
+
+_TRANSLATIONS = [
+    "",
+    "   ",
+    "Hola",
+    "El rápido zorro marrón salta sobre el perro perezoso cerca de la orilla del río.",
+    "Privet kak dela u tebya segodnya",
+    "Привет, как дела?",
+    "Здраво, како си данас?",
+    "नमस्ते, आज आप कैसे हैं?",
+    "নমস্কার, আজ আপনি কেমন আছেন?",
+    "ಇಂದು ನೀವು ಹೇಗಿದ್ದೀರಿ? ஹலோ ნახვამდის",
+    "ಇಂದು ನೀವು ಹೇಗಿದ್ದೀರಿ ಎಂದು ಕೇಳಿದರು",
+    "مرحبا، كيف حالك اليوم؟",
+    "مَرْحَبًا، كَيْفَ حَالُكَ الْيَوْمَ؟",
+    "שלום, מה שלומך היום?",
+    "שָׁלוֹם, מַה שְּׁלוֹמְךָ הַיּוֹם?",
+    "今日はとても良い天気ですね",
+    "今日 は とても 良い 天気 です ね",
+    "今天 天气 很 好",
+    "今天天气很好我们去公园散步吧",
+    "สวัสดีครับวันนี้อากาศดีมาก",
+    "สวัสดี ครับ วันนี้ อากาศ ดี มาก",
+    "ជំរាប​សួរ​ថ្ងៃ​នេះ",
+    "안녕하세요 오늘 날씨가 좋네요",
+    "Chapter Ⅻ ends here ª º",
+    "ok",
+]
+
+_LANGUAGES = [
+    "english",
+    "Spanish",
+    "russian",
+    "Serbian",
+    "hindi",
+    "bengali",
+    "kannada",
+    "arabic",
+    "Hebrew",
+    "japanese",
+    "ja",
+    "chinese",
+    "zh-TW",
+    "thai",
+    "khmer",
+    "korean",
+    "",
+]
+
+
+def test_text_stats_match_reference_counts() -> None:
+    for text in _ORIGINALS + _TRANSLATIONS:
+        stats = TextStats.of(text)
+        assert stats.letters == tv.letter_count(text)
+        assert stats.latin_fraction == tv.latin_fraction(text)
+        assert bool(stats.non_latin) == tv.has_non_latin_letters(text)
+        assert stats.script_counts == tv.script_counts(text)
+        assert list(stats.script_counts) == list(tv.script_counts(text))
+
+
+@pytest.mark.parametrize("language", _LANGUAGES)
+def test_checks_match_reference_functions(language: str) -> None:
+    validator = BatchValidator(language)
+    for translation in _TRANSLATIONS:
+        assert validator.missing_required_diacritics(translation) == tv.missing_required_diacritics(
+            translation, language
+        )
+        assert validator.unexpected_script_used(translation) == tv.unexpected_script_used(
+            translation, language
+        )
+        for transliteration in ("", "kyou wa ii tenki", "sawatdi khrap wan ni"):
+            assert validator.token_alignment_error(
+                translation, transliteration
+            ) == tv.get_token_alignment_error(translation, transliteration, language)
+        for original in _ORIGINALS:
+            assert validator.is_probable_transliteration(
+                original, translation
+            ) == tv.is_probable_transliteration(original, translation, language)
+            assert validator.is_translation_too_short(
+                original, translation
+            ) == tv.is_translation_too_short(original, translation, language)
+            assert validator.is_segmentation_ok(
+                original, translation + " (romaji)", translation_text=translation
+            ) == tv.is_segmentation_ok(
+                original, translation + " (romaji)", language, translation_text=translation
+            )
+            for strict in (False, True):
+                assert validator.sentence_boundary_error(
+                    original, translation, strict=strict
+                ) == tv.validate_batch_sentence_boundaries(original, translation, strict=strict)
+
+
+@pytest.mark.parametrize("language", _LANGUAGES)
+def test_batch_validation_matches_item_by_item_reference(language: str) -> None:
+    items = [(original, translation) for original in _ORIGINALS for translation in _TRANSLATIONS]
+
+    def _reference(original: str, translation: str, check: bool) -> str | None:
+        if not tv.is_valid_translation(translation):
+            return "Invalid or placeholder translation"
+        if tv.is_probable_transliteration(original, translation, language):
+            return "Transliteration returned instead of translation"
+        if tv.is_translation_too_short(original, translation, language):
+            return "Translation shorter than expected"
+        missing, label = tv.missing_required_diacritics(translation, language)
+        if missing:
+            return f"Missing {label or 'required diacritics'}"
+        mismatch, script_label = tv.unexpected_script_used(translation, language)
+        if mismatch:
+            return f"Unexpected script used; expected {script_label or 'target script'}"
+        if check:
+            return tv.validate_batch_sentence_boundaries(original, translation)
+        return None
+
+    for check in (True, False):
+        expected = [_reference(original, translation, check) for original, translation in items]
+        assert validate_translation_batch(items, language, check_sentence_boundaries=check) == expected
+        assert [
+            tb.validate_batch_translation(original, translation, language, check_sentence_boundaries=check)
+            for original, translation in items
+        ] == expected
+
+
+def test_batch_shares_tokenization_between_checks(monkeypatch) -> None:
+    calls: list[str] = []
+
+    def _counting_split(text: str) -> list[str]:
+        calls.append(text)
+        return text.split()
+
+    monkeypatch.setattr("modules.translation_validation_profiles.split_highlight_tokens", _counting_split)
+    validator = BatchValidator("thai")
+    original = "hello there my good friend"
+    translation = "สวัสดี ครับ เพื่อน ที่ ดี"
+    validator.is_segmentation_ok(original, translation)
+    validator.token_alignment_error(translation, "sawatdi khrap phuean thi di")
+    validator.sentence_boundary_error(original, translation)
+    validator.validate_many([(original, translation)] * 3)
+
+    assert sorted(calls) == sorted([translation, "sawatdi khrap phuean thi di", original])
+
+
+def test_profiles_are_cached_per_language() -> None:
+    assert validation_profile("Arabic") is validation_profile("Arabic")
+    profile = validation_profile("Arabic")
+    assert profile.diacritic_label == "Arabic diacritics (tashkil)"
+    assert validation_profile("hindi").script_label == "Devanagari"
+    assert validation_profile("khmer").khmer_segmentation
+    assert not validation_profile("english").needs_segmentation
@@ -0,0 +1,126 @@
+"""Tests for the persistent transliteration memory and batch transliteration."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, List
+from unittest.mock import MagicMock
+
+import pytest
+
+from modules import translation_batch as tb
+from modules.retry_annotations import format_retry_failure
+from modules.transliteration import TransliterationService
+from modules.transliteration_memory import TransliterationKey, TransliterationMemory
+
+pytestmark = pytest.mark.translation
+
+
+class _Tracker:
+    def __init__(self) -> None:
+        self.metadata: Dict[str, Any] = {}
+
+    def update_generated_files_metadata(self, payload) -> None:
+        self.metadata.update(payload)
+
+    def record_retry(self, stage: str, reason: str) -> None:
+        return None
+
+
+def _client(model: str = "test-model") -> MagicMock:
+    client = MagicMock()
+    client.model = model
+    client.debug_enabled = False
+    return client
+
+
+def test_memory_persists_and_normalizes_keys(tmp_path: Path) -> None:
+    db_path = tmp_path / "memory.sqlite3"
+    memory = TransliterationMemory(db_path)
+    key = TransliterationKey.build("  Привет,\n мир ", "Russian", mode=None, model="m1")
+    memory.put(key, "Privet, mir")
+    memory.put(TransliterationKey.build("Пусто", "russian", mode=None, model="m1"), "  ")
+    memory.close()
+
+    reopened = TransliterationMemory(db_path)
+    try:
+        same = TransliterationKey.build("Привет, мир", "russian ", mode="", model="m1")
+        assert reopened.get(same) == "Privet, mir"
+        assert reopened.get(TransliterationKey.build("Привет, мир", "russian", mode=None, model="m2")) is None
+        assert reopened.get(TransliterationKey.build("Привет, мир", "russian", mode="llm", model="m1")) is None
+        assert reopened.get(TransliterationKey.build("Пусто", "russian", mode=None, model="m1")) is None
+    finally:
+        reopened.close()
+
+
+def test_batch_uses_memory_local_modules_and_sends_repeats_once(monkeypatch) -> None:
+    memory = TransliterationMemory()
+    service = TransliterationService(memory=memory)
+    memory.put(TransliterationKey.build("Привет", "russian", mode=None, model="test-model"), "Privet")
+    sent: List[List[tuple]] = []
+
+    def fake_resolve(batch_items, target_language, **kwargs):
+        sent.append(list(batch_items))
+        assert kwargs["transliterator"] is service
+        return {idx: f"llm:{text}" for idx, text in batch_items}
+
+    monkeypatch.setattr(tb, "resolve_batch_transliterations", fake_resolve)
+    tracker = _Tracker()
+    items = [(0, "Привет"), (1, "Как дела?"), (2, "Как  дела?"), (3, "Спасибо")]
+
+    result = service.transliterate_batch(
+        items, "russian", local_client=_client(), progress_tracker=tracker, batch_size=8
+    )
+
+    assert sent == [[(1, "Как дела?"), (3, "Спасибо")]]
+    assert result == {0: "Privet", 1: "llm:Как дела?", 2: "llm:Как дела?", 3: "llm:Спасибо"}
+    stats = tracker.metadata["transliteration_memory"]
+    assert stats["requests"] == 4
+    assert (stats["memory_hits"], stats["deduplicated"], stats["llm"]) == (1, 1, 2)
+    assert stats["llm_avoided_rate"] == 0.5
+
+    again = service.transliterate_batch(items, "russian", local_client=_client(), progress_tracker=tracker)
+    assert again == result
+    assert len(sent) == 1
+    assert tracker.metadata["transliteration_memory"]["memory_hits"] == 5
+
+
+def test_batch_resolves_local_modules_without_the_llm(monkeypatch) -> None:
+    service = TransliterationService(memory=TransliterationMemory())
+    monkeypatch.setattr(
+        tb,
+        "resolve_batch_transliterations",
+        lambda *_args, **_kwargs: pytest.fail("LLM batch should not run"),
+    )
+    tracker = _Tracker()
+
+    result = service.transliterate_batch([(0, "שלום")], "hebrew", local_client=_client(), progress_tracker=tracker)
+
+    assert result == {0: "shlvm"}
+    assert tracker.metadata["transliteration_memory"]["local"] == 1
+
+
+def test_failed_transliterations_are_not_remembered(monkeypatch) -> None:
+    memory = TransliterationMemory()
+    service = TransliterationService(memory=memory)
+    failure = format_retry_failure("transliteration", 3, reason="timeout")
+    monkeypatch.setattr(tb, "resolve_batch_transliterations", lambda items, *_a, **_k: {0: failure})
+
+    assert service.transliterate_batch([(0, "Спасибо")], "russian", local_client=_client()) == {0: failure}
+    assert memory.get(TransliterationKey.build("Спасибо", "russian", mode=None, model="test-model")) is None
+
+
+def test_single_transliterations_are_remembered(monkeypatch) -> None:
+    service = TransliterationService(memory=TransliterationMemory())
+    client = _client()
+    client.send_chat_request.return_value = SimpleNamespace(text="Spasibo", error=None)
+    monkeypatch.setattr("modules.transliteration.cfg.get_translation_llm_timeout_seconds", lambda: 30.0)
+    tracker = _Tracker()
+
+    first = service.transliterate("Спасибо", "russian", client=client, progress_tracker=tracker)
+    second = service.transliterate(" Спасибо ", "russian", client=client, progress_tracker=tracker)
+
+    assert (first.text, second.text) == ("Spasibo", "Spasibo")
+    assert client.send_chat_request.call_count == 1
+    assert service.memory_usage(tracker)["memory_hit_rate"] == 0.5
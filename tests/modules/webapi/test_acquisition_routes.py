@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 import os
 from datetime import datetime
 from pathlib import Path
@@ -890,6 +891,81 @@ def test_acquisition_discover_route_scrubs_provider_metadata_secrets(
     assert "secret-token" not in response.text
 
 
+def _sse_events(body: str) -> list[tuple[str, dict[str, Any]]]:
+    events = []
+    for block in body.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((fields["event"], json.loads(fields["data"])))
+    return events
+
+
+def test_acquisition_discover_stream_route_sends_provider_updates_before_result(
+    tmp_path: Path,
+) -> None:
+    books_root = tmp_path / "books"
+    manual_root = tmp_path / "manual"
+    books_root.mkdir()
+    manual_root.mkdir()
+    (books_root / "Library Origin.epub").write_text("old", encoding="utf-8")
+    (manual_root / "Manual Origin.epub").write_text("new", encoding="utf-8")
+    app = create_app()
+    app.dependency_overrides[get_runtime_context_provider] = lambda: _StubRuntimeContextProvider(
+        {
+            "ebooks_dir": str(books_root),
+            "manual_download_root": str(manual_root),
+        }
+    )
+    app.dependency_overrides[get_request_user] = lambda: RequestUserContext(
+        user_id="editor",
+        user_role="editor",
+    )
+
+    try:
+        with TestClient(app) as client:
+            response = client.get("/api/acquisition/discover/stream?media_kind=book&q=origin")
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = _sse_events(response.text)
+    assert [name for name, _payload in events] == ["provider", "provider", "result"]
+    assert [payload["provider"] for _name, payload in events[:2]] == ["local_epub", "manual_downloads"]
+    assert all(payload["status"] == "ok" for _name, payload in events[:2])
+    assert events[0][1]["candidates"][0]["title"] == "Library Origin"
+    result = events[-1][1]
+    assert result["providers_queried"] == ["local_epub", "manual_downloads"]
+    assert {candidate["title"] for candidate in result["candidates"]} == {
+        "Library Origin",
+        "Manual Origin",
+    }
+
+
+def test_acquisition_discover_stream_route_reports_errors_as_events(tmp_path: Path) -> None:
+    app = create_app()
+    app.dependency_overrides[get_runtime_context_provider] = lambda: _StubRuntimeContextProvider(
+        {"youtube_video_root": str(tmp_path)}
+    )
+    app.dependency_overrides[get_request_user] = lambda: RequestUserContext(
+        user_id="editor",
+        user_role="editor",
+    )
+
+    try:
+        with TestClient(app) as client:
+            response = client.get(
+                "/api/acquisition/discover/stream?media_kind=video&provider=download_station"
+            )
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    ((name, payload),) = _sse_events(response.text)
+    assert name == "error"
+    assert payload["status"] == 400
+    assert "download_station" in payload["detail"]
+
+
 def test_acquisition_discover_route_rejects_non_discovery_provider(tmp_path: Path) -> None:
     app = create_app()
     app.dependency_overrides[get_runtime_context_provider] = lambda: _StubRuntimeContextProvider(
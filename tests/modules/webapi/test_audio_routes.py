@@ -10,7 +10,9 @@ import pytest
 from fastapi import HTTPException
 from fastapi.testclient import TestClient
 
+from modules.audio.interactive_synthesis import InteractiveSynthesisService
 from modules.webapi.application import create_app
+from modules.webapi.dependencies import get_interactive_synthesis_service
 from modules.webapi.routers import audio as audio_router
 
 pytestmark = pytest.mark.webapi
@@ -239,7 +241,7 @@ class _FailingPiperBackend:
 
 
 @pytest.fixture()
-def audio_client(monkeypatch) -> Iterable[TestClient]:
+def audio_client(monkeypatch, tmp_path) -> Iterable[TestClient]:
     monkeypatch.setattr(
         "modules.webapi.routers.audio.cfg.load_configuration",
         lambda verbose=False: {"selected_voice": "macOS-auto", "macos_reading_speed": 180},
@@ -253,9 +255,12 @@ def audio_client(monkeypatch) -> Iterable[TestClient]:
     )
     monkeypatch.setattr("modules.webapi.routers.audio.log_mgr.console_info", lambda *_, **__: None)
 
+    service = InteractiveSynthesisService(tmp_path / "interactive-audio")
     app = create_app()
+    app.dependency_overrides[get_interactive_synthesis_service] = lambda: service
     with TestClient(app) as client:
         yield client
+    service.close()
 
 
 @pytest.mark.parametrize("case", _BRUNO_CASES, ids=lambda case: case["name"])
@@ -332,6 +337,58 @@ def test_synthesize_audio_records_token_safe_telemetry(
     )
 
 
+def test_repeated_synthesis_is_served_from_the_interactive_cache(
+    audio_client: TestClient,
+    monkeypatch,
+) -> None:
+    saves: list[str] = []
+
+    class _CountingGTTS(_StubGTTS):
+        def save(self, filename: str) -> None:
+            saves.append(self.text)
+            super().save(filename)
+
+    monkeypatch.setattr("modules.webapi.routers.audio.gTTS", _CountingGTTS)
+    payload = {"text": "Tap to hear this.", "language": "en", "voice": "gTTS-en"}
+
+    first = audio_client.post("/api/audio", json=payload)
+    second = audio_client.post("/api/audio", json=payload)
+
+    assert first.status_code == second.status_code == 200
+    assert saves == ["Tap to hear this."]
+    assert first.headers["x-synthesis-cache"] == "synthesized"
+    assert second.headers["x-synthesis-cache"] == "memory"
+    assert second.content == first.content
+    assert second.headers["x-synthesis-engine"] == "gtts"
+    assert 'filename="synthesis.mp3"' in second.headers["content-disposition"]
+
+
+def test_piper_fallback_to_gtts_is_not_cached_under_the_piper_key(
+    audio_client: TestClient,
+    monkeypatch,
+) -> None:
+    piper_attempts: list[str] = []
+
+    def _failing_piper(text, voice, language, speed, destination) -> None:
+        piper_attempts.append(text)
+        raise HTTPException(status_code=500, detail="Piper synthesis failed")
+
+    monkeypatch.setattr(
+        audio_router, "_resolve_voice", lambda _language, _voice: ("en_US-lessac-medium", "piper")
+    )
+    monkeypatch.setattr(audio_router, "_synthesize_with_piper", _failing_piper)
+    payload = {"text": "Piper is down.", "language": "en", "voice": "en_US-lessac-medium"}
+
+    first = audio_client.post("/api/audio", json=payload)
+    second = audio_client.post("/api/audio", json=payload)
+
+    assert first.status_code == second.status_code == 200
+    assert first.headers["x-synthesis-engine"] == "gtts"
+    assert first.headers["x-synthesis-fallback-from"] == "piper"
+    assert second.headers["x-synthesis-cache"] == "synthesized"
+    assert piper_attempts == ["Piper is down.", "Piper is down."]
+
+
 def test_synthesize_audio_setup_failure_uses_generic_detail_and_token_safe_telemetry(
     audio_client: TestClient,
     monkeypatch,
@@ -20,6 +20,7 @@ from modules.webapi.dependencies import (
 )
 from modules.webapi.media_routes import router as legacy_media_router
 from modules.webapi.routes.media import media_list
+from modules.webapi.routes.media.file_responses import FileValidators
 from modules.services.job_manager import PipelineJob, PipelineJobStatus
 
 pytestmark = pytest.mark.webapi
@@ -136,7 +137,9 @@ def test_get_job_media_returns_completed_entries(api_app) -> None:
     assert entry["name"] == "sample.mp3"
     assert entry["size"] == file_path.stat().st_size
     assert entry["source"] == "completed"
-    assert entry["url"].endswith("media/chunk-001/sample.mp3")
+    url_path, _, version = entry["url"].partition("?v=")
+    assert url_path.endswith("media/chunk-001/sample.mp3")
+    assert version == FileValidators.from_stat(file_path.stat()).version
     assert datetime.fromisoformat(entry["updated_at"]) == expected_mtime
 
 
@@ -816,5 +819,5 @@ def test_get_job_media_live_prefers_tracker_snapshot(api_app) -> None:
     entry = payload["media"]["html"][0]
     assert entry["name"] == "live.html"
     assert entry["source"] == "live"
-    assert entry["url"].endswith("media/chunk-002/live.html")
+    assert entry["url"].split("?")[0].endswith("media/chunk-002/live.html")
     assert entry["size"] == live_path.stat().st_size
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Optional
+
+from fastapi.testclient import TestClient
+
+from modules.progress_tracker import ProgressTracker
+from modules.services.job_manager import PipelineJob, PipelineJobStatus
+from modules.webapi.application import create_app
+from modules.webapi.dependencies import get_pipeline_service
+
+import pytest
+
+pytestmark = pytest.mark.webapi
+
+
+class _StubPipelineService:
+    def __init__(self, job: PipelineJob, *, forbidden: bool = False) -> None:
+        self._job = job
+        self._forbidden = forbidden
+
+    def get_job(
+        self,
+        job_id: str,
+        *,
+        user_id: Optional[str] = None,
+        user_role: Optional[str] = None,
+    ) -> PipelineJob:
+        if job_id != self._job.job_id:
+            raise KeyError(job_id)
+        if self._forbidden:
+            raise PermissionError("Not authorized to access job")
+        return self._job
+
+
+def _create_app(job: PipelineJob, *, forbidden: bool = False):
+    app = create_app()
+    app.dependency_overrides[get_pipeline_service] = lambda: _StubPipelineService(
+        job, forbidden=forbidden
+    )
+    return app
+
+
+def _job(job_id: str, tracker: Optional[ProgressTracker] = None) -> PipelineJob:
+    return PipelineJob(
+        job_id=job_id,
+        status=PipelineJobStatus.RUNNING,
+        created_at=datetime.now(timezone.utc),
+        tracker=tracker,
+    )
+
+
+def test_playhead_report_updates_render_priority() -> None:
+    tracker = ProgressTracker()
+    job = _job("job-playhead", tracker)
+    app = _create_app(job)
+
+    with TestClient(app) as client:
+        client.post(f"/api/pipelines/jobs/{job.job_id}/playhead", json={"sentence_number": 3})
+        response = client.post(
+            f"/api/pipelines/jobs/{job.job_id}/playhead",
+            json={"sentence_number": 42, "seek": True},
+        )
+        invalid = client.post(
+            f"/api/pipelines/jobs/{job.job_id}/playhead", json={"sentence_number": 0}
+        )
+
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["job_id"] == job.job_id
+    assert payload["active"] is True
+    assert (payload["sentence_number"], payload["region_start"]) == (42, 42)
+    assert (payload["reports"], payload["seeks"]) == (2, 1)
+    assert tracker.render_priority.focus == 42
+    assert invalid.status_code == 422
+    app.dependency_overrides.clear()
+
+
+def test_playhead_report_without_active_render_is_inactive() -> None:
+    job = _job("job-finished")
+    app = _create_app(job)
+
+    with TestClient(app) as client:
+        response = client.post(
+            f"/api/pipelines/jobs/{job.job_id}/playhead", json={"sentence_number": 5}
+        )
+
+    assert response.status_code == 200
+    assert response.json()["active"] is False
+    app.dependency_overrides.clear()
+
+
+def test_playhead_report_respects_job_access() -> None:
+    job = _job("job-private-playhead", ProgressTracker())
+    app = _create_app(job, forbidden=True)
+
+    with TestClient(app) as client:
+        forbidden = client.post(
+            f"/api/pipelines/jobs/{job.job_id}/playhead", json={"sentence_number": 5}
+        )
+        missing = client.post("/api/pipelines/jobs/unknown/playhead", json={"sentence_number": 5})
+
+    assert forbidden.status_code == 403
+    assert missing.status_code == 404
+    app.dependency_overrides.clear()
@@ -7,6 +7,11 @@ from pathlib import Path
 from fastapi.testclient import TestClient
 import pytest
 
+from modules.core.rendering.timing_columns import (
+    TIMING_COLUMNS_MEDIA_TYPE,
+    TimingColumnStore,
+    decode_timing_columns,
+)
 from modules.services.file_locator import FileLocator
 from modules.services.job_manager import PipelineJob, PipelineJobStatus
 from modules.webapi.application import create_app
@@ -295,3 +300,116 @@ def test_job_timing_route_permission_error_uses_generic_detail(tmp_path: Path) -
     assert "alice cannot read" not in rendered
     assert "/Volumes/Data/private" not in rendered
     assert manager.calls == [("timing-job", "alice", "editor")]
+
+
+def _columnar_timing_job(tmp_path: Path) -> tuple[FileLocator, PipelineJob]:
+    locator = FileLocator(storage_dir=tmp_path)
+    job_id = "range-job"
+    store = TimingColumnStore(locator.resolve_path(job_id) / "metadata" / "timing")
+    for chunk_id, start in (("chunk-1", 1), ("chunk-2", 3)):
+        store.write_chunk(
+            chunk_id,
+            start,
+            start + 1,
+            {
+                "translation": [
+                    {"lane": "trans", "sentenceIdx": index, "wordIdx": word, "start": index + word * 0.3, "end": index + word * 0.3 + 0.3}
+                    for index in range(2)
+                    for word in range(2)
+                ],
+            },
+        )
+    job = PipelineJob(
+        job_id=job_id,
+        status=PipelineJobStatus.COMPLETED,
+        created_at=datetime.now(timezone.utc),
+        result_payload={},
+    )
+    return locator, job
+
+
+def test_job_timing_range_route_returns_json_slices(tmp_path: Path) -> None:
+    locator, job = _columnar_timing_job(tmp_path)
+    app = _app_with_timing_dependencies(
+        job_manager=_RecordingJobManager(job), file_locator=locator
+    )
+
+    try:
+        with TestClient(app) as client:
+            response = client.get(
+                "/api/jobs/range-job/timing/range",
+                params={"from_sentence": 2, "to_sentence": 3},
+            )
+            repeated = client.get(
+                "/api/jobs/range-job/timing/range",
+                params={"from_sentence": 2, "to_sentence": 3},
+            )
+            whole = client.get("/api/jobs/range-job/timing/range")
+            inverted = client.get(
+                "/api/jobs/range-job/timing/range",
+                params={"from_sentence": 3, "to_sentence": 2},
+            )
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+    assert etag.startswith('W/"') and len(etag) == len('W/""') + 40
+    assert repeated.headers["ETag"] == etag
+    assert whole.headers["ETag"] != etag
+    payload = response.json()
+    assert payload["job_id"] == "range-job"
+    assert [
+        (chunk["chunk_id"], chunk["start_sentence"], chunk["from_sentence"], chunk["to_sentence"])
+        for chunk in payload["chunks"]
+    ] == [("chunk-1", 1, 2, 2), ("chunk-2", 3, 3, 3)]
+    assert payload["chunks"][0]["tracks"]["translation"] == [
+        {"lane": "trans", "sentenceIdx": 1, "wordIdx": 0, "start": 1.0, "end": 1.3},
+        {"lane": "trans", "sentenceIdx": 1, "wordIdx": 1, "start": 1.3, "end": 1.6},
+    ]
+    assert inverted.status_code == 400
+
+
+def test_job_timing_range_route_serves_packed_columns(tmp_path: Path) -> None:
+    locator, job = _columnar_timing_job(tmp_path)
+    app = _app_with_timing_dependencies(
+        job_manager=_RecordingJobManager(job), file_locator=locator
+    )
+
+    try:
+        with TestClient(app) as client:
+            response = client.get(
+                "/api/jobs/range-job/timing/range",
+                params={"from_sentence": 4, "track": "trans"},
+                headers={"Accept": TIMING_COLUMNS_MEDIA_TYPE},
+            )
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == TIMING_COLUMNS_MEDIA_TYPE
+    (decoded,) = decode_timing_columns(response.content)
+    assert (decoded.chunk_id, decoded.start_sentence, decoded.end_sentence) == ("chunk-2", 4, 4)
+    assert [token["sentenceIdx"] for token in decoded.to_timing_tracks()["translation"]] == [1, 1]
+
+
+def test_job_timing_range_route_404s_without_columns(tmp_path: Path) -> None:
+    locator = FileLocator(storage_dir=tmp_path)
+    job = PipelineJob(
+        job_id="legacy-job",
+        status=PipelineJobStatus.COMPLETED,
+        created_at=datetime.now(timezone.utc),
+        result_payload={"timing_tracks": {"translation": "metadata/timing_index.json"}},
+    )
+    app = _app_with_timing_dependencies(
+        job_manager=_RecordingJobManager(job), file_locator=locator
+    )
+
+    try:
+        with TestClient(app) as client:
+            response = client.get("/api/jobs/legacy-job/timing/range", params={"from_sentence": 1})
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 404
+    assert response.json()["detail"] == "No timing columns available"
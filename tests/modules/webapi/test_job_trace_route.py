@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+from fastapi.testclient import TestClient
+
+from modules.pipeline_trace import JobTraceRecorder
+from modules.services.file_locator import FileLocator
+from modules.services.job_manager import PipelineJob, PipelineJobStatus
+from modules.webapi.application import create_app
+from modules.webapi.dependencies import get_file_locator, get_pipeline_service
+
+import pytest
+
+pytestmark = pytest.mark.webapi
+
+
+class _StubPipelineService:
+    def __init__(self, job: PipelineJob, *, forbidden: bool = False) -> None:
+        self._job = job
+        self._forbidden = forbidden
+
+    def get_job(
+        self,
+        job_id: str,
+        *,
+        user_id: Optional[str] = None,
+        user_role: Optional[str] = None,
+    ) -> PipelineJob:
+        if job_id != self._job.job_id:
+            raise KeyError(job_id)
+        if self._forbidden:
+            raise PermissionError("Not authorized to access job")
+        return self._job
+
+
+def _create_app(tmp_path: Path, job: PipelineJob, *, forbidden: bool = False):
+    app = create_app()
+    locator = FileLocator(storage_dir=tmp_path)
+    app.dependency_overrides[get_file_locator] = lambda: locator
+    app.dependency_overrides[get_pipeline_service] = lambda: _StubPipelineService(
+        job, forbidden=forbidden
+    )
+    return app, locator
+
+
+def _job(job_id: str) -> PipelineJob:
+    return PipelineJob(
+        job_id=job_id,
+        status=PipelineJobStatus.COMPLETED,
+        created_at=datetime.now(timezone.utc),
+    )
+
+
+def test_job_trace_returns_summary_and_optional_spans(tmp_path: Path) -> None:
+    job = _job("job-trace")
+    app, locator = _create_app(tmp_path, job)
+    metadata_root = locator.metadata_root(job.job_id)
+    metadata_root.mkdir(parents=True, exist_ok=True)
+    recorder = JobTraceRecorder.for_job(job.job_id, metadata_root, export_metrics=False)
+    recorder.record("translate", 1.0, 2.0, sentence_number=1)
+    recorder.record("tts", 2.0, 4.0, sentence_number=1)
+    recorder.close()
+
+    with TestClient(app) as client:
+        summary_response = client.get(f"/api/pipelines/jobs/{job.job_id}/trace")
+        spans_response = client.get(
+            f"/api/pipelines/jobs/{job.job_id}/trace",
+            params={"include_spans": "true", "span_limit": 1},
+        )
+
+    assert summary_response.status_code == 200
+    payload = summary_response.json()
+    assert payload["job_id"] == job.job_id
+    assert payload["spans"] is None
+    assert payload["summary"]["span_count"] == 2
+    assert payload["summary"]["bottleneck_stage"] == "tts"
+    assert len(payload["runs"]) == 1
+
+    assert spans_response.status_code == 200
+    assert [span["stage"] for span in spans_response.json()["spans"]] == ["tts"]
+
+    app.dependency_overrides.clear()
+
+
+def test_job_trace_missing_file_returns_404(tmp_path: Path) -> None:
+    job = _job("job-without-trace")
+    app, _locator = _create_app(tmp_path, job)
+
+    with TestClient(app) as client:
+        response = client.get(f"/api/pipelines/jobs/{job.job_id}/trace")
+
+    assert response.status_code == 404
+    app.dependency_overrides.clear()
+
+
+def test_job_trace_respects_job_access(tmp_path: Path) -> None:
+    job = _job("job-private-trace")
+    app, _locator = _create_app(tmp_path, job, forbidden=True)
+
+    with TestClient(app) as client:
+        response = client.get(f"/api/pipelines/jobs/{job.job_id}/trace")
+
+    assert response.status_code == 403
+    app.dependency_overrides.clear()
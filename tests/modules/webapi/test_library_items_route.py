@@ -102,13 +102,33 @@ class _StubLibraryReindexService:
         self.error = error
         self.indexed = indexed
         self.calls = 0
+        self.modes: list[str] = []
 
-    def rebuild_index(self) -> object:
+    def rebuild_index(self, *, mode: str = "incremental") -> object:
         self.calls += 1
+        self.modes.append(mode)
         if self.error is not None:
             raise self.error
         return self.indexed
 
+    def reindex_status(self) -> dict:
+        return {
+            "state": "completed",
+            "mode": "incremental",
+            "requested_mode": "incremental",
+            "phase": "done",
+            "processed": 12,
+            "total": 12,
+            "indexed": 11,
+            "parsed": 2,
+            "unchanged": 10,
+            "upserted": 2,
+            "deleted": 1,
+            "failed": 0,
+            "duration_seconds": 0.25,
+            "timings": {"scan": 0.05, "load": 0.15, "apply": 0.04, "journal": 0.01},
+        }
+
 
 class _StubLibraryMetadataSync:
     def __init__(
@@ -1895,6 +1915,61 @@ def test_reindex_library_records_token_safe_success_telemetry(
     assert "office-ipad-user" not in rendered
 
 
+def test_reindex_library_passes_requested_mode(monkeypatch: pytest.MonkeyPatch) -> None:
+    app = create_app()
+    service = _StubLibraryReindexService(indexed=3)
+    _patch_library_logger(monkeypatch, _RecordingLogger())
+    app.dependency_overrides[get_library_service] = lambda: service
+    app.dependency_overrides[get_request_user] = lambda: RequestUserContext(
+        user_id="office-ipad-user",
+        user_role="admin",
+    )
+
+    try:
+        with TestClient(app) as client:
+            full_response = client.post("/api/library/reindex", params={"mode": "full"})
+            default_response = client.post("/api/library/reindex")
+            invalid_response = client.post("/api/library/reindex", params={"mode": "partial"})
+    finally:
+        app.dependency_overrides.clear()
+
+    assert full_response.status_code == 200
+    assert default_response.status_code == 200
+    assert invalid_response.status_code == 422
+    assert service.modes == ["full", "incremental"]
+
+
+def test_reindex_status_reports_progress_for_admins_only(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    app = create_app()
+    service = _StubLibraryReindexService()
+    _patch_library_logger(monkeypatch, _RecordingLogger())
+    app.dependency_overrides[get_library_service] = lambda: service
+    role = {"value": "admin"}
+    app.dependency_overrides[get_request_user] = lambda: RequestUserContext(
+        user_id="office-ipad-user",
+        user_role=role["value"],
+    )
+
+    try:
+        with TestClient(app) as client:
+            response = client.get("/api/library/reindex/status")
+            role["value"] = "editor"
+            forbidden = client.get("/api/library/reindex/status")
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["state"] == "completed"
+    assert payload["requestedMode"] == "incremental"
+    assert payload["durationSeconds"] == 0.25
+    assert (payload["processed"], payload["total"], payload["deleted"]) == (12, 12, 1)
+    assert payload["timings"]["load"] == 0.15
+    assert forbidden.status_code == 403
+
+
 def test_reindex_library_forbidden_records_token_safe_telemetry(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
@@ -2508,3 +2583,58 @@ def test_enrich_library_metadata_errors_use_generic_detail_and_token_safe_teleme
     assert "OpenLibrary enrich failed" not in rendered
     if expected_result == "forbidden":
         assert sync.enrich_calls == []
+
+
+def test_list_library_groups_returns_group_page(monkeypatch: pytest.MonkeyPatch) -> None:
+    from modules.library.library_groups import LibraryGroup, LibraryGroupPage
+
+    class _GroupSync:
+        def __init__(self) -> None:
+            self.calls: list[dict[str, Any]] = []
+
+        def browse_groups(self, **kwargs: Any) -> LibraryGroupPage:
+            self.calls.append(kwargs)
+            if kwargs["cursor"] == "bad":
+                raise LibraryError("Malformed group cursor")
+            return LibraryGroupPage(
+                view=kwargs["view"],
+                path=tuple(kwargs["path"]),
+                level="book_title",
+                total=3,
+                groups=[LibraryGroup(label="Alpha", count=2, latest_updated_at="2024-01-02")],
+                next_cursor="next-token",
+            )
+
+    app = create_app()
+    sync = _GroupSync()
+    app.dependency_overrides[get_library_sync] = lambda: sync
+    app.dependency_overrides[get_request_user] = lambda: RequestUserContext(
+        user_id="reader",
+        user_role="viewer",
+    )
+
+    try:
+        with TestClient(app) as client:
+            response = client.get(
+                "/api/library/items/groups",
+                params={"view": "by_author", "path": ["Ann"], "limit": 5},
+            )
+            bad_cursor = client.get("/api/library/items/groups", params={"cursor": "bad"})
+    finally:
+        app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "view": "by_author",
+        "path": ["Ann"],
+        "level": "bookTitle",
+        "total": 3,
+        "groups": [{"label": "Alpha", "count": 2, "latestUpdatedAt": "2024-01-02"}],
+        "items": [],
+        "nextCursor": "next-token",
+    }
+    assert sync.calls[0]["path"] == ["Ann"]
+    assert sync.calls[0]["limit"] == 5
+    assert sync.calls[0]["user_id"] == "reader"
+    assert bad_cursor.status_code == 400
+    assert bad_cursor.json() == {"detail": "Unable to list library groups."}
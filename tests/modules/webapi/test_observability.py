@@ -99,6 +99,9 @@ _EXPECTED_METRICS = [
     ("ebook_tools_auth_attempts_total", "counter"),
     ("ebook_tools_auth_duration_seconds", "histogram"),
     ("ebook_tools_pipeline_stage_duration_seconds", "histogram"),
+    ("ebook_tools_pipeline_span_duration_seconds", "histogram"),
+    ("ebook_tools_pipeline_queue_wait_seconds", "histogram"),
+    ("ebook_tools_pipeline_llm_tokens_total", "counter"),
     ("ebook_tools_worker_pool_utilization", "gauge"),
     ("ebook_tools_errors_total", "counter"),
     ("ebook_tools_job_failures_total", "counter"),
@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+from starlette.routing import Mount
+from starlette.staticfiles import StaticFiles
+
+from modules.webapi import application, startup
+from modules.webapi.application import (
+    _cleanup_empty_job_folders,
+    _cleanup_orphaned_job_folders,
+)
+from modules.webapi.startup import (
+    LazyRouterSpec,
+    MaintenanceCancelled,
+    StartupState,
+    StorageMaintenanceRunner,
+    install_lazy_routers,
+)
+
+pytestmark = pytest.mark.webapi
+
+
+def test_resolve_startup_mode_defaults_to_fast(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv(startup.STARTUP_MODE_ENV, raising=False)
+    assert startup.resolve_startup_mode() == "fast"
+    assert startup.resolve_startup_mode("EAGER") == "eager"
+    assert startup.resolve_startup_mode("bogus") == "fast"
+
+
+def test_startup_state_reports_ready_once_checks_complete() -> None:
+    state = StartupState("fast")
+    state.register("runtime")
+    state.register("database")
+
+    assert not state.is_ready
+    assert state.snapshot()["status"] == "starting"
+
+    state.complete("runtime")
+    state.complete("database", ok=False)
+    snapshot = state.snapshot()
+    assert snapshot["status"] == "degraded"
+    assert snapshot["ready"] is False
+
+    state.complete("database")
+    snapshot = state.snapshot()
+    assert snapshot["status"] == "ready"
+    assert snapshot["ready"] is True
+    assert snapshot["startup_seconds"] is not None
+
+    state.mark_stopping()
+    assert not state.is_ready
+
+
+def test_maintenance_runner_records_progress_per_task() -> None:
+    def first(on_entry) -> int:  # noqa: ANN001
+        for index in range(3):
+            on_entry(Path(f"entry-{index}"))
+        return 2
+
+    def second(on_entry) -> int:  # noqa: ANN001
+        on_entry(Path("entry"))
+        return 0
+
+    runner = StorageMaintenanceRunner((("first", first), ("second", second)))
+    runner.run()
+
+    snapshot = runner.snapshot()
+    assert snapshot["status"] == "completed"
+    assert snapshot["current_task"] is None
+    assert [task["status"] for task in snapshot["tasks"]] == ["completed", "completed"]
+    assert [task["scanned"] for task in snapshot["tasks"]] == [3, 1]
+    assert [task["removed"] for task in snapshot["tasks"]] == [2, 0]
+
+
+def test_maintenance_runner_cancel_stops_current_task_and_skips_rest() -> None:
+    def endless(on_entry) -> int:  # noqa: ANN001
+        while True:
+            on_entry(Path("entry"))
+
+    def never(_on_entry) -> int:  # noqa: ANN001
+        raise AssertionError("task after cancellation should not run")
+
+    runner = StorageMaintenanceRunner(
+        (("endless", endless), ("never", never)), throttle_seconds=0.001
+    )
+    runner.start()
+    deadline = time.monotonic() + 5.0
+    while runner.snapshot()["tasks"][0]["scanned"] < 3 and time.monotonic() < deadline:
+        time.sleep(0.005)
+    runner.cancel()
+    runner.join(timeout=5.0)
+
+    snapshot = runner.snapshot()
+    assert snapshot["status"] == "cancelled"
+    assert [task["status"] for task in snapshot["tasks"]] == ["cancelled", "skipped"]
+
+
+def test_maintenance_runner_cancel_during_start_delay_runs_nothing() -> None:
+    calls: list[str] = []
+    runner = StorageMaintenanceRunner(
+        (("task", lambda on_entry: calls.append("ran") or 0),),
+        start_delay_seconds=30.0,
+    )
+    runner.start()
+    runner.cancel()
+    runner.join(timeout=5.0)
+
+    assert calls == []
+    assert runner.status == "cancelled"
+    assert runner.snapshot()["tasks"][0]["status"] == "skipped"
+
+
+def test_maintenance_hook_raises_when_cancelled() -> None:
+    runner = StorageMaintenanceRunner(())
+    runner.cancel()
+    with pytest.raises(MaintenanceCancelled):
+        runner._on_entry(Path("entry"))
+
+
+def test_cleanup_skips_folders_modified_after_cutoff(tmp_path: Path) -> None:
+    old_job = tmp_path / "old-job"
+    old_job.mkdir()
+    past = time.time() - 3600
+    os.utime(old_job, (past, past))
+    fresh_job = tmp_path / "fresh-job"
+    fresh_job.mkdir()
+
+    seen: list[Path] = []
+    removed = _cleanup_empty_job_folders(
+        storage_root=tmp_path,
+        on_entry=seen.append,
+        modified_before=time.time() - 60,
+    )
+
+    assert removed == 1
+    assert not old_job.exists()
+    assert fresh_job.exists()
+    assert len(seen) == 2
+
+
+def test_orphan_cleanup_respects_modified_before(tmp_path: Path) -> None:
+    fresh_orphan = tmp_path / "fresh-orphan"
+    (fresh_orphan / "media").mkdir(parents=True)
+    (fresh_orphan / "media" / "chunk.mp3").write_bytes(b"\x00")
+
+    removed = _cleanup_orphaned_job_folders(
+        storage_root=tmp_path, modified_before=time.time() - 60
+    )
+
+    assert removed == 0
+    assert fresh_orphan.exists()
+
+
+def _lazy_app(tmp_path: Path, eager: bool = False) -> FastAPI:
+    app = FastAPI()
+    spa_root = tmp_path / "spa"
+    spa_root.mkdir()
+    (spa_root / "index.html").write_text("spa", encoding="utf-8")
+    app.mount("/", StaticFiles(directory=spa_root, html=True), name="spa")
+    install_lazy_routers(
+        app,
+        (LazyRouterSpec(__name__, ("/api/lazy",), attribute="lazy_router"),),
+        eager=eager,
+    )
+    return app
+
+
+lazy_router = APIRouter(prefix="/api/lazy")
+
+
+@lazy_router.get("/ping")
+def _lazy_ping() -> dict[str, str]:
+    return {"status": "pong"}
+
+
+def test_lazy_router_is_mounted_on_first_matching_request(tmp_path: Path) -> None:
+    app = _lazy_app(tmp_path)
+    registry = app.state.lazy_routers
+    assert registry.has_pending
+
+    with TestClient(app) as client:
+        assert client.get("/index.html").status_code == 200
+        assert registry.has_pending
+
+        response = client.get("/api/lazy/ping")
+
+    assert response.status_code == 200
+    assert response.json() == {"status": "pong"}
+    assert not registry.has_pending
+    assert list(registry.snapshot()["loaded"]) == [f"{__name__}:lazy_router"]
+    assert isinstance(app.router.routes[-1], Mount)
+
+
+def test_openapi_schema_includes_lazy_routes(tmp_path: Path) -> None:
+    app = _lazy_app(tmp_path)
+
+    schema = app.openapi()
+
+    assert "/api/lazy/ping" in schema["paths"]
+
+
+def test_eager_install_mounts_routers_immediately(tmp_path: Path) -> None:
+    app = _lazy_app(tmp_path, eager=True)
+
+    assert not app.state.lazy_routers.has_pending
+    assert any(getattr(route, "path", None) == "/api/lazy/ping" for route in app.routes)
+
+
+def test_readiness_probe_tracks_lifespan(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv(startup.STARTUP_MODE_ENV, "fast")
+    monkeypatch.setenv(startup.MAINTENANCE_DELAY_ENV, "60")
+    monkeypatch.delenv("DATABASE_URL", raising=False)
+    app = application.create_app()
+    startup.begin_startup("fast")
+
+    outside = TestClient(app)
+    assert outside.get("/_health/live").status_code == 200
+    assert outside.get("/_health/ready").status_code == 503
+
+    with TestClient(app) as client:
+        response = client.get("/_health/ready")
+        assert response.status_code == 200
+        payload = response.json()
+        assert payload["ready"] is True
+        assert payload["mode"] == "fast"
+        assert payload["maintenance"] == "scheduled"
+
+    assert startup.get_maintenance_runner() is None or (
+        startup.get_maintenance_runner().status == "cancelled"
+    )
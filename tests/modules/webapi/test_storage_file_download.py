@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 import pytest
@@ -16,6 +17,7 @@ from modules.webapi.dependencies import (
     get_request_user,
 )
 from modules.webapi.routes.media import storage as storage_routes
+from modules.webapi.routes.media.file_responses import FileValidators
 
 pytestmark = pytest.mark.webapi
 
@@ -292,7 +294,7 @@ def test_download_invalid_range_records_stream_metric(storage_app) -> None:
     assert _has_stream_count(metrics_response.text, result="range_unsatisfiable", media_kind="video")
 
 
-def test_download_multi_range_honors_first_range(storage_app) -> None:
+def test_download_multi_range_returns_multipart_byteranges(storage_app) -> None:
     app, locator = storage_app
     job_id = "download-multi-range"
     file_path = locator.resolve_path(job_id, "media/chunk.bin")
@@ -302,14 +304,113 @@ def test_download_multi_range_honors_first_range(storage_app) -> None:
     with TestClient(app) as client:
         response = client.get(
             f"/storage/jobs/{job_id}/files/media/chunk.bin",
-            headers={"Range": "bytes=0-1,4-5"},
+            headers={"Range": "bytes=4-5,0-1"},
         )
 
-    # Multi-range requests now honor the first range instead of falling back
-    # to a full-body response.
     assert response.status_code == 206
-    assert response.content == b"ab"
-    assert response.headers["Content-Range"] == "bytes 0-1/10"
+    content_type = response.headers["Content-Type"]
+    assert content_type.startswith("multipart/byteranges; boundary=")
+    boundary = content_type.split("boundary=", 1)[1]
+    assert "Content-Range" not in response.headers
+    assert response.headers["Content-Length"] == str(len(response.content))
+    parts = response.content.split(f"--{boundary}".encode())
+    assert parts[-1] == b"--\r\n"
+    assert b"Content-Range: bytes 0-1/10\r\n\r\nab\r\n" in parts[1]
+    assert b"Content-Range: bytes 4-5/10\r\n\r\nef\r\n" in parts[2]
+
+
+def test_download_overlapping_ranges_are_coalesced(storage_app) -> None:
+    app, locator = storage_app
+    job_id = "download-overlapping-range"
+    file_path = locator.resolve_path(job_id, "media/chunk.bin")
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    file_path.write_bytes(b"abcdefghij")
+
+    with TestClient(app) as client:
+        response = client.get(
+            f"/storage/jobs/{job_id}/files/media/chunk.bin",
+            headers={"Range": "bytes=0-3,2-5,6-6"},
+        )
+
+    assert response.status_code == 206
+    assert response.content == b"abcdefg"
+    assert response.headers["Content-Range"] == "bytes 0-6/10"
+
+
+def test_download_sets_validators_and_answers_if_none_match(storage_app) -> None:
+    app, locator = storage_app
+    job_id = "download-etag"
+    file_path = locator.resolve_path(job_id, "media/audio/chunk.mp3")
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    file_path.write_bytes(b"0123456789")
+    url = f"/storage/jobs/{job_id}/files/media/audio/chunk.mp3"
+
+    with TestClient(app) as client:
+        first = client.get(url)
+        etag = first.headers["ETag"]
+        cached = client.get(url, headers={"If-None-Match": f'"other", W/{etag}'})
+        since = client.get(
+            url, headers={"If-Modified-Since": first.headers["Last-Modified"]}
+        )
+        metrics_response = client.get("/metrics")
+
+    assert first.status_code == 200
+    assert etag.startswith('"') and etag.endswith('"')
+    assert first.headers["Cache-Control"] == "private, no-cache"
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert cached.headers["ETag"] == etag
+    assert since.status_code == 304
+    assert _has_stream_count(metrics_response.text, result="not_modified", media_kind="audio")
+
+
+def test_download_if_range_mismatch_returns_full_body(storage_app) -> None:
+    app, locator = storage_app
+    job_id = "download-if-range"
+    file_path = locator.resolve_path(job_id, "media/chunk.bin")
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    file_path.write_bytes(b"abcdefghij")
+    url = f"/storage/jobs/{job_id}/files/media/chunk.bin"
+
+    with TestClient(app) as client:
+        etag = client.get(url).headers["ETag"]
+        current = client.get(url, headers={"Range": "bytes=2-3", "If-Range": etag})
+        stale = client.get(url, headers={"Range": "bytes=2-3", "If-Range": '"stale"'})
+
+    assert current.status_code == 206
+    assert current.content == b"cd"
+    assert stale.status_code == 200
+    assert stale.content == b"abcdefghij"
+
+
+def test_download_versioned_media_is_immutable(storage_app) -> None:
+    app, locator = storage_app
+    job_id = "download-versioned"
+    audio_path = locator.resolve_path(job_id, "media/audio/chunk.mp3")
+    metadata_path = locator.resolve_path(job_id, "metadata/job.json")
+    for file_path in (audio_path, metadata_path):
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_bytes(b"{}")
+    audio_url = f"/storage/jobs/{job_id}/files/media/audio/chunk.mp3"
+    metadata_url = f"/storage/jobs/{job_id}/files/metadata/job.json"
+
+    with TestClient(app) as client:
+        version = FileValidators.from_stat(audio_path.stat()).version
+        versioned = client.get(f"{audio_url}?v={version}")
+        plain = client.get(audio_url)
+        metadata = client.get(
+            f"{metadata_url}?v={FileValidators.from_stat(metadata_path.stat()).version}"
+        )
+        # Rewriting the file in place invalidates URLs carrying the old version.
+        audio_path.write_bytes(b"rewritten")
+        os.utime(audio_path, ns=(1, 1))
+        stale = client.get(f"{audio_url}?v={version}")
+
+    assert versioned.headers["Cache-Control"] == "private, max-age=31536000, immutable"
+    assert plain.headers["Cache-Control"] == "private, no-cache"
+    assert metadata.headers["Cache-Control"] == "private, no-cache"
+    assert stale.headers["Cache-Control"] == "private, no-cache"
+    assert stale.content == b"rewritten"
 
 
 def test_download_missing_file_returns_404(storage_app) -> None:
@@ -378,3 +479,36 @@ def test_download_video_range_keeps_inline_disposition(storage_app) -> None:
     assert response.content == b"0123"
     assert response.headers["Content-Range"] == "bytes 0-3/10"
     assert response.headers["Content-Disposition"].startswith("inline;")
+
+
+def test_media_file_response_uses_server_send_extensions(tmp_path: Path) -> None:
+    import asyncio
+
+    from modules.webapi.routes.media.file_responses import MediaFileResponse
+
+    file_path = tmp_path / "chunk.bin"
+    file_path.write_bytes(b"abcdefghij")
+
+    def _run(response, extensions):
+        messages = []
+
+        async def _send(message):
+            messages.append(dict(message))
+
+        scope = {"type": "http", "method": "GET", "extensions": extensions}
+        asyncio.run(response(scope, None, _send))
+        return messages
+
+    zerocopy = _run(
+        MediaFileResponse(file_path, file_size=10, ranges=[(2, 5)], status_code=206),
+        {"http.response.zerocopysend": {}},
+    )
+    pathsend = _run(
+        MediaFileResponse(file_path, file_size=10),
+        {"http.response.pathsend": {}},
+    )
+
+    assert [(m["type"], m.get("offset"), m.get("count")) for m in zerocopy[1:2]] == [
+        ("http.response.zerocopysend", 2, 4)
+    ]
+    assert pathsend[1] == {"type": "http.response.pathsend", "path": str(file_path)}
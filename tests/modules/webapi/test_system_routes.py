@@ -226,9 +226,12 @@ def _normalized_fastapi_path(path: str) -> str:
 def test_runtime_descriptor_api_paths_match_fastapi_routes() -> None:
     payload = build_runtime_descriptor("test-version")
     api_paths = _runtime_descriptor_api_paths(payload)
+    app = create_app()
+    # Heavy routers mount on first use; the contract covers every router.
+    app.state.lazy_routers.load_all()
     fastapi_paths = {
         _normalized_fastapi_path(route.path)
-        for route in create_app().routes
+        for route in app.routes
         if getattr(route, "path", "").startswith("/api/")
     }
 